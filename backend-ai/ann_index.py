@@ -0,0 +1,112 @@
+# backend-ai/ann_index.py
+"""
+Chỉ mục tìm kiếm gần đúng (ANN) kiểu IVF-flat viết bằng NumPy cho gallery lớn.
+
+Các embedding được phân cụm bằng spherical k-means thành `nlist` danh sách. Khi tìm
+kiếm, chỉ `nprobe` cụm có tâm gần truy vấn nhất được quét; các ứng viên thu được sau
+đó được chấm điểm lại CHÍNH XÁC bằng float32 trong `FaceGallery`, nên các ngưỡng
+cosine/Euclid giữ nguyên ý nghĩa.
+
+Tâm cụm chỉ được huấn luyện khi xây chỉ mục; các hàng thêm/xóa sau đó (cập nhật một
+người dùng) được gán vào/bỏ khỏi danh sách của tâm gần nhất mà không huấn luyện lại.
+"""
+import math
+
+import numpy as np
+
+# Số hàng xử lý mỗi lần khi gán cụm, để bộ nhớ tạm không tăng theo N * nlist
+_ASSIGN_BLOCK_ROWS = 8192
+
+
+def _assign(matrix: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Gán mỗi hàng của `matrix` cho tâm cụm có cosine lớn nhất (theo từng khối)."""
+    labels = np.empty(matrix.shape[0], dtype=np.int32)
+    for start in range(0, matrix.shape[0], _ASSIGN_BLOCK_ROWS):
+        block = matrix[start:start + _ASSIGN_BLOCK_ROWS]
+        labels[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+class IVFFlatIndex:
+    """
+    Inverted file index: `lists[c]` chứa chỉ số hàng gallery thuộc cụm `c`,
+    `labels` ánh xạ chỉ số hàng -> cụm để có thể xóa hàng khi người dùng thay đổi.
+    """
+
+    def __init__(self, nlist: int = 0, nprobe: int = 16, train_iters: int = 10, seed: int = 0):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iters = train_iters
+        self.seed = seed
+        self.centroids = None
+        self.lists = []
+        self.labels = {}
+
+    def build(self, matrix: np.ndarray, rows: np.ndarray = None) -> "IVFFlatIndex":
+        """
+        Huấn luyện tâm cụm trên một mẫu của `matrix` rồi gán toàn bộ hàng vào danh sách.
+        `rows` là chỉ số hàng gallery tương ứng với từng hàng của `matrix` (mặc định 0..n-1).
+        """
+        n = matrix.shape[0]
+        rows = np.arange(n, dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+        nlist = self.nlist or max(1, int(4 * math.sqrt(n)))
+        nlist = min(nlist, n)
+        rng = np.random.default_rng(self.seed)
+
+        sample_size = min(n, nlist * 32)
+        sample = matrix[rng.choice(n, size=sample_size, replace=False)] if sample_size < n else matrix
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(self.train_iters):
+            labels = _assign(sample, centroids)
+            counts = np.bincount(labels, minlength=nlist)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            nonempty = counts > 0
+            sums = np.zeros_like(centroids)
+            sums[nonempty] = np.add.reduceat(sample[np.argsort(labels, kind="stable")], starts[nonempty], axis=0)
+            # Cụm rỗng được khởi tạo lại từ một điểm ngẫu nhiên của mẫu
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = (sums / np.where(norms > 0, norms, 1)).astype(matrix.dtype)
+
+        self.nlist = nlist
+        self.centroids = centroids
+        self.lists = [np.zeros(0, dtype=np.int64) for _ in range(nlist)]
+        self.labels = {}
+        self.add(rows, matrix)
+        return self
+
+    def add(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Gán các hàng mới vào danh sách của tâm cụm gần nhất."""
+        rows = np.asarray(rows, dtype=np.int64)
+        labels = _assign(vectors, self.centroids)
+        order = np.argsort(labels, kind="stable")
+        for c, members in zip(*_group(labels[order], rows[order])):
+            self.lists[c] = np.concatenate((self.lists[c], members))
+        self.labels.update(zip(rows.tolist(), labels.tolist()))
+
+    def remove(self, rows: np.ndarray) -> None:
+        """Bỏ các hàng khỏi danh sách của chúng (hàng không có trong chỉ mục được bỏ qua)."""
+        affected = {}
+        for row in np.asarray(rows, dtype=np.int64).tolist():
+            c = self.labels.pop(row, None)
+            if c is not None:
+                affected.setdefault(c, []).append(row)
+        for c, removed in affected.items():
+            self.lists[c] = self.lists[c][~np.isin(self.lists[c], removed)]
+
+    def candidates(self, query: np.ndarray) -> np.ndarray:
+        """Chỉ số hàng gallery nằm trong `nprobe` cụm gần `query` nhất."""
+        centroid_scores = self.centroids @ query
+        nprobe = min(self.nprobe, self.nlist)
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        return np.concatenate([self.lists[c] for c in probe])
+
+
+def _group(sorted_labels: np.ndarray, values: np.ndarray):
+    """Tách `values` (đã sắp theo nhãn) thành các nhóm liên tiếp có cùng nhãn."""
+    if len(sorted_labels) == 0:
+        return [], []
+    boundaries = np.flatnonzero(np.diff(sorted_labels)) + 1
+    return sorted_labels[np.concatenate(([0], boundaries))].tolist(), np.split(values, boundaries)
@@ -0,0 +1,139 @@
+# backend-ai/benchmarks/ann_recall.py
+"""
+Báo cáo recall và độ trễ của chỉ mục IVF-flat và của lượt chấm điểm trên bản nén int8
+(quantized.py, chấm điểm lại bằng float32) so với quét toàn bộ gallery.
+
+Gallery tổng hợp: mỗi người dùng có một "tâm" ngẫu nhiên trên mặt cầu đơn vị và vài
+embedding nhiễu quanh tâm đó (cosine giữa hai mẫu ~0.85, gần với ArcFace thực tế). Truy vấn là một
+mẫu nhiễu mới của một người dùng ngẫu nhiên.
+
+Ví dụ:
+    python benchmarks/ann_recall.py --users 30000 --per-user 3 --nprobe 4 8 16 32
+    python benchmarks/ann_recall.py --users 100000 --nprobe --quantization int8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ann_index import IVFFlatIndex  # noqa: E402
+from gallery import FaceGallery, l2_normalize  # noqa: E402
+from quantized import QUANTIZATION_MODES, QuantizedIndex  # noqa: E402
+
+COSINE_SIMILARITY_THRESHOLD = 0.75
+EUCLIDEAN_DISTANCE_THRESHOLD = 0.85
+
+
+def synthetic_gallery(num_users: int, per_user: int, dim: int, noise: float, rng):
+    centers = l2_normalize(rng.standard_normal((num_users, dim), dtype=np.float32))
+    entries = []
+    for uid in range(num_users):
+        samples = centers[uid] + noise * rng.standard_normal((per_user, dim), dtype=np.float32)
+        entries.append(({"user_id": uid, "member_code": f"M{uid}", "full_name": f"User {uid}"}, samples))
+    return FaceGallery.from_entries(entries), centers
+
+
+def accepted(match):
+    return match is not None and match[1] >= COSINE_SIMILARITY_THRESHOLD and match[2] <= EUCLIDEAN_DISTANCE_THRESHOLD
+
+
+def run_queries(gallery, queries):
+    latencies, results = [], []
+    for q in queries:
+        start = time.perf_counter()
+        match = gallery.search(q)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append(match)
+    lat = np.array(latencies)
+    return results, {"mean_ms": float(lat.mean()), "p95_ms": float(np.percentile(lat, 95))}
+
+
+def agreement(approx, exact) -> dict:
+    same_user = [a is not None and a[0]["user_id"] == e[0]["user_id"] for a, e in zip(approx, exact)]
+    same_decision = [
+        accepted(a) == accepted(e) and (not accepted(e) or a[0]["user_id"] == e[0]["user_id"])
+        for a, e in zip(approx, exact)
+    ]
+    return {"recall_at_1": float(np.mean(same_user)), "decision_agreement": float(np.mean(same_decision))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=30000)
+    parser.add_argument("--per-user", type=int, default=3)
+    parser.add_argument("--dim", type=int, default=512)
+    parser.add_argument("--noise", type=float, default=0.02)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--nlist", type=int, default=0)
+    parser.add_argument("--nprobe", type=int, nargs="*", default=[4, 8, 16, 32])
+    parser.add_argument("--quantization", nargs="*", default=list(QUANTIZATION_MODES),
+                        help="Các chế độ nén cần đo (bỏ trống = không đo)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="In kết quả dạng JSON")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    gallery, centers = synthetic_gallery(args.users, args.per_user, args.dim, args.noise, rng)
+    owners = rng.integers(0, args.users, size=args.queries)
+    queries = l2_normalize(centers[owners] + args.noise * rng.standard_normal((args.queries, args.dim), dtype=np.float32))
+
+    exact, brute_stats = run_queries(gallery, queries)
+    report = {
+        "gallery_embeddings": gallery.num_embeddings,
+        "queries": args.queries,
+        "brute": brute_stats,
+        "matrix_bytes": int(gallery.matrix[:gallery.size].nbytes),
+        "ivf": [],
+        "quantized": [],
+    }
+
+    if args.nprobe:
+        start = time.perf_counter()
+        gallery.build_index(IVFFlatIndex(nlist=args.nlist))
+        index = gallery.index
+        report["ivf_build_s"] = time.perf_counter() - start
+        report["ivf_nlist"] = index.nlist
+        for nprobe in args.nprobe:
+            index.nprobe = nprobe
+            approx, stats = run_queries(gallery, queries)
+            report["ivf"].append({"nprobe": nprobe, **agreement(approx, exact), **stats})
+
+    for mode in args.quantization:
+        gallery.build_index(QuantizedIndex(mode))
+        index = gallery.index
+        approx, stats = run_queries(gallery, queries)
+        max_score_error = max(abs(a[1] - e[1]) for a, e in zip(approx, exact))
+        report["quantized"].append({
+            "mode": mode,
+            **agreement(approx, exact),
+            "max_score_error": float(max_score_error),
+            "mean_candidates": float(np.mean([len(index.candidates(q)) for q in queries])),
+            "index_bytes": index.nbytes,
+            **stats,
+        })
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"Gallery: {report['gallery_embeddings']} embedding ({report['matrix_bytes'] / 2**20:.1f} MiB float32), "
+          f"{args.queries} truy vấn")
+    if report["ivf"]:
+        print(f"IVF nlist={report['ivf_nlist']} (xây trong {report['ivf_build_s']:.2f}s)")
+    print(f"{'chế độ':<12}{'recall@1':>10}{'quyết định':>12}{'mean ms':>10}{'p95 ms':>10}")
+    print(f"{'brute':<12}{1.0:>10.3f}{1.0:>12.3f}{brute_stats['mean_ms']:>10.3f}{brute_stats['p95_ms']:>10.3f}")
+    for row in report["ivf"]:
+        print(f"{'ivf/' + str(row['nprobe']):<12}{row['recall_at_1']:>10.3f}{row['decision_agreement']:>12.3f}"
+              f"{row['mean_ms']:>10.3f}{row['p95_ms']:>10.3f}")
+    for row in report["quantized"]:
+        print(f"{row['mode']:<12}{row['recall_at_1']:>10.3f}{row['decision_agreement']:>12.3f}"
+              f"{row['mean_ms']:>10.3f}{row['p95_ms']:>10.3f}  ứng viên {row['mean_candidates']:.1f}, "
+              f"bản nén {row['index_bytes'] / 2**20:.1f} MiB, lệch điểm tối đa {row['max_score_error']:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# backend-ai/benchmarks/bench_batching.py
+"""
+Đo thông lượng ArcFace khi nhiều kiosk gửi khung hình đồng thời: so sánh suy luận
+từng khuôn mặt một (max_batch=1) với bộ gom lô InferenceBatcher.
+
+Mỗi luồng mô phỏng một kiosk, liên tục gửi khuôn mặt đã tiền xử lý và chờ embedding.
+
+Ví dụ (trong container backend-ai, cần trọng số ArcFace đã có sẵn):
+    python benchmarks/bench_batching.py --clients 8 --seconds 10 --max-batch 16 --max-wait-ms 5
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def run_clients(batcher, faces: list, clients: int, seconds: float) -> dict:
+    latencies = [[] for _ in range(clients)]
+    stop_at = time.perf_counter() + seconds
+
+    def client(i):
+        n = 0
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            batcher.submit(faces[(i + n) % len(faces)]).result()
+            latencies[i].append((time.perf_counter() - start) * 1000)
+            n += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lat = np.concatenate([np.array(l) for l in latencies if l])
+    stats = batcher.stats()
+    return {
+        "faces_per_s": len(lat) / seconds,
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p95_ms": float(np.percentile(lat, 95)),
+        "mean_batch_size": stats["mean_batch_size"],
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="Số kiosk gửi đồng thời")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--max-batch", type=int, default=main.INFERENCE_MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=main.INFERENCE_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    main.load_arcface_model()
+    rng = np.random.default_rng(0)
+    faces = [rng.integers(0, 256, size=(224, 224, 3), dtype=np.uint8) for _ in range(32)]
+
+    print(f"{args.clients} kiosk đồng thời, {args.seconds:.0f}s mỗi cấu hình")
+    print(f"{'cấu hình':<22}{'faces/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'lô TB':>8}")
+    for name, max_batch, max_wait in (("từng khuôn mặt", 1, 0.0),
+                                      (f"lô {args.max_batch}/{args.max_wait_ms:g}ms", args.max_batch, args.max_wait_ms)):
+        batcher = main.InferenceBatcher(main.embed_faces, max_batch=max_batch, max_wait_ms=max_wait)
+        r = run_clients(batcher, faces, args.clients, args.seconds)
+        print(f"{name:<22}{r['faces_per_s']:>10.1f}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['mean_batch_size']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main_cli()
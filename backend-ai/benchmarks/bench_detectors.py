@@ -0,0 +1,115 @@
+# backend-ai/benchmarks/bench_detectors.py
+"""
+So sánh các bộ phát hiện khuôn mặt (detectors.py) trên cùng một tập ảnh:
+- độ trễ phát hiện mỗi ảnh (mean/p50/p95),
+- tỉ lệ trúng: ảnh phát hiện được ĐÚNG một khuôn mặt (điều kiện để preprocess_image chạy tiếp),
+- độ trùng khớp hộp (IoU) và độ lệch mắt so với bộ phát hiện tham chiếu (bộ đầu tiên).
+
+Ví dụ (trong container backend-ai):
+    python benchmarks/bench_detectors.py --images uploaded_photos --detectors mtcnn haar yunet \\
+        --yunet-model models/face_detection_yunet_2023mar.onnx
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2  # noqa: E402
+
+from detectors import create_detector, detect_downscaled  # noqa: E402
+
+
+def iou(a, b) -> float:
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = ix * iy
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+def eye_error(a, b) -> float:
+    """Sai lệch trung bình vị trí hai mắt, chuẩn hóa theo khoảng cách giữa hai mắt của tham chiếu."""
+    ref_l, ref_r = np.array(b["keypoints"]["left_eye"]), np.array(b["keypoints"]["right_eye"])
+    inter_ocular = np.linalg.norm(ref_r - ref_l) or 1.0
+    err_l = np.linalg.norm(np.array(a["keypoints"]["left_eye"]) - ref_l)
+    err_r = np.linalg.norm(np.array(a["keypoints"]["right_eye"]) - ref_r)
+    return float((err_l + err_r) / 2 / inter_ocular)
+
+
+def largest(faces):
+    return max(faces, key=lambda f: f["box"][2] * f["box"][3]) if faces else None
+
+
+def run_detector(detector, images, repeat: int, max_side: int = 0):
+    latencies, results = [], []
+    for img in images:
+        faces = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            faces = detect_downscaled(detector, img, max_side)
+            latencies.append((time.perf_counter() - start) * 1000)
+        results.append(faces)
+    lat = np.array(latencies)
+    return results, {
+        "mean_ms": float(lat.mean()),
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p95_ms": float(np.percentile(lat, 95)),
+        "hit_rate": float(np.mean([len(f) == 1 for f in results])),
+        "any_face_rate": float(np.mean([len(f) > 0 for f in results])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", required=True, help="Thư mục ảnh (jpg/png)")
+    parser.add_argument("--detectors", nargs="+", default=["mtcnn", "haar"])
+    parser.add_argument("--yunet-model", default=os.environ.get("FACE_DETECTOR_MODEL", ""))
+    parser.add_argument("--max-side", type=int, default=0,
+                        help="Phát hiện trên ảnh thu nhỏ có cạnh dài nhất <= N (0 = ảnh gốc, như DETECTION_MAX_SIDE)")
+    parser.add_argument("--repeat", type=int, default=3, help="Số lần chạy mỗi ảnh")
+    parser.add_argument("--limit", type=int, default=0, help="Chỉ dùng N ảnh đầu (0 = tất cả)")
+    parser.add_argument("--json", action="store_true", help="In kết quả dạng JSON")
+    args = parser.parse_args()
+
+    paths = sorted(p for p in glob.glob(os.path.join(args.images, "*")) if os.path.isfile(p))
+    images = [img for img in (cv2.imread(p) for p in paths) if img is not None]
+    if args.limit:
+        images = images[:args.limit]
+    if not images:
+        sys.exit(f"Không đọc được ảnh nào trong '{args.images}'")
+
+    report = {"images": len(images), "max_side": args.max_side, "reference": args.detectors[0], "detectors": {}}
+    reference = None
+    for name in args.detectors:
+        detector = create_detector(name, args.yunet_model)
+        detector.detect(images[0])  # warm-up
+        results, stats = run_detector(detector, images, args.repeat, args.max_side)
+        if reference is None:
+            reference = results
+        else:
+            pairs = [(largest(a), largest(b)) for a, b in zip(results, reference)]
+            pairs = [(a, b) for a, b in pairs if a is not None and b is not None]
+            stats["mean_iou_vs_ref"] = float(np.mean([iou(a["box"], b["box"]) for a, b in pairs])) if pairs else 0.0
+            stats["mean_eye_error_vs_ref"] = float(np.mean([eye_error(a, b) for a, b in pairs])) if pairs else 0.0
+        report["detectors"][name] = stats
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['images']} ảnh, max_side={report['max_side']}, tham chiếu: {report['reference']}")
+    print(f"{'bộ phát hiện':<14}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'trúng 1':>10}{'IoU ref':>10}{'lệch mắt':>10}")
+    for name, s in report["detectors"].items():
+        print(f"{name:<14}{s['mean_ms']:>10.1f}{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['hit_rate']:>10.3f}"
+              f"{s.get('mean_iou_vs_ref', 1.0):>10.3f}{s.get('mean_eye_error_vs_ref', 0.0):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
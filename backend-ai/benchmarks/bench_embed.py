@@ -0,0 +1,94 @@
+# backend-ai/benchmarks/bench_embed.py
+"""
+So sánh độ trễ trích xuất embedding cho mỗi khung hình:
+- "legacy": DeepFace.represent(..., detector_backend="skip") rồi tf.keras.backend.clear_session()
+  sau mỗi lần gọi (cách làm cũ của extract_embedding);
+- "resident": mô hình ArcFace tải một lần, warm-up, gọi trực tiếp trên tensor (embed_faces).
+
+Đồng thời in cosine giữa embedding của hai cách để kiểm tra tiền xử lý tương đương.
+
+Ví dụ (trong container backend-ai, cần trọng số ArcFace đã có sẵn):
+    python benchmarks/bench_embed.py --images uploaded_photos --repeat 20
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2  # noqa: E402
+import tensorflow as tf  # noqa: E402
+from deepface import DeepFace  # noqa: E402
+
+import main  # noqa: E402
+
+
+def load_faces(image_dir: str, count: int) -> list:
+    """Khuôn mặt đã tiền xử lý (224x224) từ thư mục ảnh; nếu không có thì dùng ảnh tổng hợp."""
+    faces = []
+    if image_dir:
+        for path in sorted(glob.glob(os.path.join(image_dir, "*"))):
+            img = cv2.imread(path)
+            if img is None:
+                continue
+            face, _, error = main.preprocess_image(img)
+            if not error:
+                faces.append(face)
+    if not faces:
+        rng = np.random.default_rng(0)
+        faces = [rng.integers(0, 256, size=(224, 224, 3), dtype=np.uint8) for _ in range(count)]
+    return faces[:count]
+
+
+def legacy_embed(face: np.ndarray) -> np.ndarray:
+    result = DeepFace.represent(face, model_name=main.EMBEDDING_MODEL_NAME, detector_backend="skip", enforce_detection=False)[0]
+    tf.keras.backend.clear_session()
+    embedding = np.array(result["embedding"], dtype=np.float32)
+    return embedding / (np.linalg.norm(embedding) or 1)
+
+
+def time_calls(fn, faces: list, repeat: int):
+    latencies, outputs = [], []
+    for _ in range(repeat):
+        for face in faces:
+            start = time.perf_counter()
+            outputs.append(fn(face))
+            latencies.append((time.perf_counter() - start) * 1000)
+    lat = np.array(latencies)
+    return outputs[:len(faces)], {
+        "mean_ms": float(lat.mean()),
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p95_ms": float(np.percentile(lat, 95)),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", default="", help="Thư mục ảnh khuôn mặt (mặc định: ảnh tổng hợp)")
+    parser.add_argument("--count", type=int, default=10, help="Số khuôn mặt dùng để đo")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    faces = load_faces(args.images, args.count)
+
+    start = time.perf_counter()
+    main.load_arcface_model()
+    load_ms = (time.perf_counter() - start) * 1000
+    resident_out, resident = time_calls(lambda f: main.embed_faces([f])[0], faces, args.repeat)
+    legacy_out, legacy = time_calls(legacy_embed, faces, args.repeat)
+    agreement = [float(np.dot(a, b)) for a, b in zip(legacy_out, resident_out)]
+
+    print(f"{len(faces)} khuôn mặt x {args.repeat} lần; tải + warm-up mô hình thường trú: {load_ms:.0f} ms")
+    print(f"{'cách làm':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, stats in (("legacy", legacy), ("resident", resident)):
+        print(f"{name:<10}{stats['mean_ms']:>10.1f}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}")
+    print(f"Cosine legacy/resident: min={min(agreement):.5f} mean={np.mean(agreement):.5f}")
+
+
+if __name__ == "__main__":
+    main_cli()
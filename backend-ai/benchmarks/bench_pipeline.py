@@ -0,0 +1,358 @@
+# backend-ai/benchmarks/bench_pipeline.py
+"""
+Đo hiệu năng pipeline nhận diện của main.py theo TỪNG bước, chạy được trên máy chỉ có CPU
+và không có mạng:
+
+- base64_decode:      tách data URL và base64.b64decode (như process_frame)
+- imdecode:           cv2.imdecode khung hình JPEG
+- preprocess_image:   phát hiện + căn chỉnh + CLAHE, không theo dõi (mỗi khung hình phát hiện lại)
+- preprocess_tracked: như trên nhưng trong một phiên kiosk (FACE_TRACKING, TRACK_REDETECT_EVERY)
+- embedding:          embed_faces trên một khuôn mặt (gọi thẳng mô hình, không qua batcher/cache)
+- search/<N>:         FaceGallery.search trên gallery tổng hợp N vector (dựng bằng main.build_gallery,
+                      nên theo đúng GALLERY_INDEX / GALLERY_QUANTIZATION của môi trường)
+- voting:             vote_frame (phiếu bầu trong phiên kiosk)
+- process_frame:      cả pipeline process_frame trên gallery --frame-gallery-size vector, trong đó
+                      các khung hình khớp một thành viên (đi hết tới bước bỏ phiếu)
+
+Mô hình embedding:
+- "stub" (mặc định): phép chiếu ngẫu nhiên cố định thay cho ArcFace (vẫn qua to_arcface_tensor),
+  không cần trọng số; thời gian "embedding" khi đó KHÔNG phản ánh ArcFace.
+- "arcface": ArcFace thật, cần trọng số đã có sẵn trong ~/.deepface/weights.
+
+Khung hình: mặc định là ảnh tổng hợp 640x480 (hình khuôn mặt vẽ tay + nhiễu) kèm bộ phát hiện
+"stub" trả về hộp cố định ở giữa ảnh; dùng --images để đo trên ảnh thật với bộ phát hiện của
+FACE_DETECTOR (hoặc --detector).
+
+Kết quả (mean/p50/p95/p99 ms của từng bước, kèm cấu hình và thông tin máy) được ghi ra JSON;
+lệnh `compare` so sánh hai lần chạy và trả mã thoát 1 khi có bước chậm đi quá ngưỡng.
+
+Ví dụ (trong container backend-ai):
+    python benchmarks/bench_pipeline.py run --output bench_base.json
+    GALLERY_QUANTIZATION=int8 python benchmarks/bench_pipeline.py run --output bench_int8.json
+    python benchmarks/bench_pipeline.py compare bench_base.json bench_int8.json --threshold 10
+    python benchmarks/bench_pipeline.py run --gallery-sizes 1000 10000 100000 1000000 --output bench_1m.json
+
+Gallery 1M vector (512 chiều) cần khoảng 4 GB RAM khi dựng.
+"""
+import argparse
+import base64
+import glob
+import json
+import os
+import platform
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2  # noqa: E402
+
+import main  # noqa: E402
+from detectors import DETECTOR_NAMES, FaceDetector, create_detector  # noqa: E402
+from sessions import RecognitionSession  # noqa: E402
+
+EMBEDDING_DIM = 512
+FRAME_SIZE = (640, 480)
+# Hộp khuôn mặt của ảnh tổng hợp / bộ phát hiện stub, theo tỉ lệ kích thước ảnh (x, y, w, h)
+STUB_FACE_BOX = (0.35, 0.25, 0.3, 0.5)
+
+
+class StubDetector(FaceDetector):
+    """Trả về một khuôn mặt cố định ở giữa ảnh (đúng vị trí khuôn mặt của ảnh tổng hợp)."""
+
+    name = "stub"
+
+    def detect(self, img_bgr) -> list:
+        height, width = img_bgr.shape[:2]
+        x, y, w, h = (int(r * s) for r, s in zip(STUB_FACE_BOX, (width, height, width, height)))
+        eye_y = y + int(0.38 * h)
+        return [{"box": [x, y, w, h], "confidence": 1.0,
+                 "keypoints": {"left_eye": (x + int(0.3 * w), eye_y), "right_eye": (x + int(0.7 * w), eye_y)}}]
+
+
+class StubEmbeddingModel:
+    """
+    Thay ArcFace: gộp trung bình ảnh (H, W, 3) xuống lưới 28x28 rồi nhân với ma trận chiếu
+    ngẫu nhiên cố định. Cùng cách gọi với mô hình Keras: model(batch, training=False).
+    """
+
+    input_shape = (None, 112, 112, 3)
+
+    def __init__(self, dim: int = EMBEDDING_DIM, seed: int = 0):
+        self.pool = 4
+        features = (112 // self.pool) ** 2 * 3
+        self.projection = np.random.default_rng(seed).standard_normal((features, dim)).astype(np.float32)
+
+    def __call__(self, batch, training=False):
+        batch = np.asarray(batch, dtype=np.float32)
+        n, height, width, channels = batch.shape
+        pooled = batch.reshape(n, height // self.pool, self.pool, width // self.pool, self.pool, channels).mean(axis=(2, 4))
+        return pooled.reshape(n, -1) @ self.projection
+
+
+def synthetic_frames(count: int, rng) -> list:
+    """Khung hình JPEG tổng hợp: nền nhiễu, hình bầu dục màu da, hai mắt và miệng trong STUB_FACE_BOX."""
+    width, height = FRAME_SIZE
+    x, y, w, h = (int(r * s) for r, s in zip(STUB_FACE_BOX, (width, height, width, height)))
+    frames = []
+    for _ in range(count):
+        img = rng.integers(40, 120, size=(height, width, 3), dtype=np.uint8)
+        skin = tuple(int(c) for c in rng.integers((120, 150, 180), (160, 190, 230)))
+        cv2.ellipse(img, (x + w // 2, y + h // 2), (w // 2, h // 2), 0, 0, 360, skin, -1)
+        for eye_x in (x + int(0.3 * w), x + int(0.7 * w)):
+            cv2.circle(img, (eye_x, y + int(0.38 * h)), max(3, w // 14), (40, 30, 30), -1)
+        cv2.ellipse(img, (x + w // 2, y + int(0.75 * h)), (w // 6, h // 20), 0, 0, 180, (60, 40, 120), 3)
+        img = cv2.GaussianBlur(img, (3, 3), 0)
+        ok, buffer = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        frames.append(buffer.tobytes())
+    return frames
+
+
+def load_frames(image_dir: str, count: int, rng) -> list:
+    """Bytes JPEG/PNG của ảnh trong thư mục (nguyên tệp, như kiosk gửi lên); nếu không có thì ảnh tổng hợp."""
+    if not image_dir:
+        return synthetic_frames(count, rng)
+    frames = []
+    for path in sorted(glob.glob(os.path.join(image_dir, "*"))):
+        if path.lower().endswith((".jpg", ".jpeg", ".png")):
+            with open(path, "rb") as f:
+                frames.append(f.read())
+        if len(frames) >= count:
+            break
+    if not frames:
+        sys.exit(f"Không có ảnh .jpg/.png trong '{image_dir}'")
+    return frames
+
+
+def synthetic_gallery(size: int, per_user: int, rng):
+    """Gallery `size` vector ngẫu nhiên đã chuẩn hóa, `per_user` vector mỗi người dùng."""
+    matrix = rng.standard_normal((size, EMBEDDING_DIM), dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    entries = [({"user_id": i, "member_code": f"BENCH{i:07d}", "full_name": f"Bench {i}"},
+                matrix[start:start + per_user])
+               for i, start in enumerate(range(0, size, per_user))]
+    return main.build_gallery(entries), matrix
+
+
+def noisy_queries(matrix: np.ndarray, count: int, rng) -> np.ndarray:
+    """Truy vấn gần với các vector trong gallery (như khung hình của một thành viên đã đăng ký)."""
+    rows = rng.integers(0, len(matrix), size=count)
+    queries = matrix[rows] + 0.05 * rng.standard_normal((count, matrix.shape[1]), dtype=np.float32)
+    return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def summarize(samples_ms: list) -> dict:
+    samples = np.asarray(samples_ms, dtype=np.float64)
+    return {
+        "n": int(len(samples)),
+        "mean_ms": float(samples.mean()),
+        "p50_ms": float(np.percentile(samples, 50)),
+        "p95_ms": float(np.percentile(samples, 95)),
+        "p99_ms": float(np.percentile(samples, 99)),
+        "min_ms": float(samples.min()),
+        "max_ms": float(samples.max()),
+    }
+
+
+def time_stage(fn, inputs: list, repeat: int, warmup: int) -> dict:
+    """Gọi fn(input) xoay vòng trên `inputs`: `warmup` lần không tính, rồi `repeat` lần đo."""
+    for i in range(warmup):
+        fn(inputs[i % len(inputs)])
+    samples = []
+    for i in range(repeat):
+        item = inputs[i % len(inputs)]
+        start = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def run_benchmark(args) -> dict:
+    rng = np.random.default_rng(args.seed)
+
+    if args.model == "stub":
+        main.arcface_model = StubEmbeddingModel(seed=args.seed)
+        main.arcface_input_size = (112, 112)
+    else:
+        main.load_arcface_model()
+    detector_name = args.detector
+    if detector_name == "auto":
+        detector_name = main.FACE_DETECTOR if args.images else "stub"
+    if detector_name == "stub":
+        main.detector = StubDetector()
+    elif detector_name != main.FACE_DETECTOR or args.detector_model:
+        main.detector = create_detector(detector_name, args.detector_model or main.FACE_DETECTOR_MODEL)
+    if not args.embed_cache:
+        # Khung hình lặp lại sẽ trúng cache dHash và bỏ qua mô hình; tắt để đo đúng chi phí mỗi khung hình
+        main.face_embedding_cache.max_entries = 0
+
+    frames = load_frames(args.images, args.frames, rng)
+    data_urls = [f"data:image/jpeg;base64,{base64.b64encode(frame).decode()}" for frame in frames]
+    images = [cv2.imdecode(np.frombuffer(frame, np.uint8), cv2.IMREAD_COLOR) for frame in frames]
+    faces = []
+    for img in images:
+        face, _, error = main.preprocess_image(img)
+        if not error:
+            faces.append(face)
+    if not faces:
+        sys.exit(f"Bộ phát hiện '{detector_name}' không tìm thấy khuôn mặt nào; dùng --images hoặc --detector stub")
+
+    results = {}
+
+    def record(name, stats):
+        results[name] = stats
+        print(f"{name:<22}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+              f"{stats['p99_ms']:>10.3f}", flush=True)
+
+    print(f"{len(frames)} khung hình ({len(faces)} có khuôn mặt), mô hình {args.model}, bộ phát hiện {detector_name}")
+    print(f"{'bước':<22}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    record("base64_decode", time_stage(lambda u: base64.b64decode(u.split(',')[1]), data_urls, args.repeat, args.warmup))
+    record("imdecode", time_stage(lambda b: cv2.imdecode(np.frombuffer(b, np.uint8), cv2.IMREAD_COLOR),
+                                  frames, args.repeat, args.warmup))
+    record("preprocess_image", time_stage(main.preprocess_image, images, args.repeat, args.warmup))
+    tracked_session = RecognitionSession("bench-tracked")
+    record("preprocess_tracked", time_stage(lambda img: main.preprocess_image(img, tracked_session),
+                                            images, args.repeat, args.warmup))
+    record("embedding", time_stage(lambda face: main.embed_faces([face]), faces, args.repeat, args.warmup))
+
+    frame_gallery = None
+    for size in sorted(set(args.gallery_sizes) | {args.frame_gallery_size}):
+        build_start = time.perf_counter()
+        gallery, matrix = synthetic_gallery(size, args.per_user, rng)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        queries = list(noisy_queries(matrix, min(args.repeat, 256), rng))
+        del matrix
+        if size in args.gallery_sizes:
+            stats = time_stage(gallery.search, queries, args.repeat, args.warmup)
+            stats["build_ms"] = build_ms
+            stats["memory"] = gallery.memory_stats()
+            record(f"search/{size}", stats)
+        if size == args.frame_gallery_size:
+            frame_gallery, frame_queries = gallery, queries
+        del gallery
+
+    match = frame_gallery.search(frame_queries[0])
+    best_match = {"sim": match[1], "dist": match[2], "user": match[0]}
+    vote_session = RecognitionSession("bench-vote")
+    record("voting", time_stage(lambda m: main.vote_frame(vote_session, m), [best_match], args.repeat, args.warmup))
+
+    # Khung hình phải khớp một thành viên để process_frame đi hết pipeline (cả bỏ phiếu)
+    frame_gallery.upsert_user({"user_id": -1, "member_code": "BENCH_KIOSK", "full_name": "Bench kiosk"},
+                              main.embed_faces(faces))
+    main.embedding_cache = frame_gallery
+    main.inference_batcher.start()
+    db = main.SessionLocal()
+    statuses = Counter()
+    frame_session = RecognitionSession("bench-frame")
+
+    def process(data_url):
+        statuses[main.process_frame(data_url, db, frame_session)["status"]] += 1
+
+    try:
+        stats = time_stage(process, data_urls, args.repeat, args.warmup)
+    finally:
+        db.close()
+    stats["gallery_size"] = args.frame_gallery_size
+    stats["statuses"] = dict(statuses)
+    record("process_frame", stats)
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "host": platform.node(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "cpu_count": os.cpu_count(),
+            "model": args.model,
+            "detector": detector_name,
+            "gallery_index": main.GALLERY_INDEX,
+            "gallery_quantization": main.GALLERY_QUANTIZATION,
+            "face_tracking": main.FACE_TRACKING,
+            "embed_cache": args.embed_cache,
+            "frames": len(frames),
+            "repeat": args.repeat,
+            "per_user": args.per_user,
+        },
+        "results": results,
+    }
+
+
+def compare(base: dict, new: dict, metric: str, threshold: float) -> int:
+    """In chênh lệch `metric` từng bước giữa hai lần chạy; trả về số bước chậm đi quá `threshold` %."""
+    for key in sorted(set(base["meta"]) | set(new["meta"])):
+        if key != "created_at" and base["meta"].get(key) != new["meta"].get(key):
+            print(f"Lưu ý: cấu hình khác nhau ở '{key}': {base['meta'].get(key)} -> {new['meta'].get(key)}")
+    print(f"{'bước':<22}{'trước':>12}{'sau':>12}{'thay đổi':>11}")
+    regressions = 0
+    names = list(base["results"]) + [n for n in new["results"] if n not in base["results"]]
+    for name in names:
+        before = base["results"].get(name, {}).get(metric)
+        after = new["results"].get(name, {}).get(metric)
+        if before is None or after is None:
+            print(f"{name:<22}{_fmt(before):>12}{_fmt(after):>12}{'-':>11}")
+            continue
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  CHẬM HƠN"
+            regressions += 1
+        elif change < -threshold:
+            flag = "  nhanh hơn"
+        print(f"{name:<22}{before:>12.3f}{after:>12.3f}{change:>10.1f}%{flag}")
+    return regressions
+
+
+def _fmt(value) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Chạy benchmark và ghi kết quả JSON")
+    run.add_argument("--output", default="", help="Tệp JSON kết quả (bỏ trống = chỉ in ra màn hình)")
+    run.add_argument("--model", choices=("stub", "arcface"), default="stub")
+    run.add_argument("--detector", choices=("auto", "stub") + DETECTOR_NAMES, default="auto",
+                     help="auto = stub với ảnh tổng hợp, FACE_DETECTOR với --images")
+    run.add_argument("--detector-model", default="", help="Tệp mô hình ONNX cho yunet")
+    run.add_argument("--images", default="", help="Thư mục ảnh khuôn mặt thật (mặc định: ảnh tổng hợp)")
+    run.add_argument("--frames", type=int, default=16, help="Số khung hình khác nhau dùng xoay vòng")
+    run.add_argument("--gallery-sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    run.add_argument("--frame-gallery-size", type=int, default=10000, help="Kích thước gallery cho process_frame")
+    run.add_argument("--per-user", type=int, default=3, help="Số embedding mỗi người dùng tổng hợp")
+    run.add_argument("--repeat", type=int, default=200, help="Số lần đo mỗi bước")
+    run.add_argument("--warmup", type=int, default=10)
+    run.add_argument("--embed-cache", action="store_true", help="Giữ cache embedding theo dHash khi đo process_frame")
+    run.add_argument("--seed", type=int, default=0)
+
+    cmp = commands.add_parser("compare", help="So sánh hai tệp kết quả")
+    cmp.add_argument("base")
+    cmp.add_argument("new")
+    cmp.add_argument("--metric", default="p50_ms", choices=("mean_ms", "p50_ms", "p95_ms", "p99_ms", "min_ms"))
+    cmp.add_argument("--threshold", type=float, default=10.0, help="Ngưỡng chậm đi (%%) để báo lỗi")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.base, encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        sys.exit(1 if compare(base, new, args.metric, args.threshold) else 0)
+
+    report = run_benchmark(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Đã ghi kết quả vào {args.output}")
+
+
+if __name__ == "__main__":
+    main_cli()
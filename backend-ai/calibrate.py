@@ -0,0 +1,54 @@
+# backend-ai/calibrate.py
+"""
+Hiệu chỉnh ngưỡng nhận diện từ dòng lệnh trên gallery trong DB (cùng DATABASE_URL với dịch
+vụ AI), không ảnh hưởng dịch vụ đang chạy. In báo cáo JSON: số cặp genuine/impostor, EER,
+đường cong FAR/FRR và ngưỡng khuyến nghị (xem calibration.py).
+
+Ví dụ:
+    nice -n 10 python calibrate.py --target-far 0.0001
+    nice -n 10 python calibrate.py --max-rows 0 --output calibration.json    # toàn bộ gallery, không lấy mẫu
+    nice -n 10 python calibrate.py --apply
+
+`nice` hạ ưu tiên cả tiến trình, kể cả các luồng BLAS tính tích ma trận, nên chạy cạnh dịch vụ
+mà không làm chậm khung hình kiosk.
+
+Áp dụng cho dịch vụ: `--apply` lưu ngưỡng khuyến nghị (nếu báo cáo đủ tin cậy) vào gallery_settings;
+mọi worker của dịch vụ đọc lại trong vòng CHANGE_LOG_POLL_S giây. Cũng có thể đặt
+THRESHOLD_CALIBRATION=apply (tự hiệu chỉnh lúc khởi động) hoặc gọi POST /calibration?apply=true.
+"""
+import argparse
+import json
+import sys
+
+import main
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-far", type=float, default=main.CALIBRATION_TARGET_FAR,
+                        help="FAR theo cặp mà ngưỡng khuyến nghị phải đạt")
+    parser.add_argument("--max-rows", type=int, default=main.CALIBRATION_MAX_ROWS,
+                        help="Số embedding tối đa (lấy mẫu theo người dùng); 0 = toàn bộ gallery")
+    parser.add_argument("--apply", action="store_true", help="Lưu ngưỡng khuyến nghị cho dịch vụ đang chạy")
+    parser.add_argument("--output", default="", help="Ghi báo cáo vào tệp JSON (mặc định in ra màn hình)")
+    args = parser.parse_args()
+
+    db = main.SessionLocal()
+    try:
+        gallery = main.load_embedding_cache(db)
+    finally:
+        db.close()
+    if not len(gallery):
+        sys.exit("Gallery trống")
+
+    report = main.run_calibration(gallery, args.apply, target_far=args.target_far, max_rows=args.max_rows)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,137 @@
+# backend-ai/calibration.py
+"""
+Hiệu chỉnh ngưỡng nhận diện từ chính gallery.
+
+Điểm "khớp đúng người" (genuine) là cosine giữa hai embedding của CÙNG một người dùng,
+điểm "khớp nhầm người" (impostor) là cosine giữa embedding của hai người KHÁC nhau. Với
+ngưỡng t:
+- FAR(t): tỉ lệ cặp impostor có điểm >= t (nhận nhầm người),
+- FRR(t): tỉ lệ cặp genuine có điểm < t (từ chối đúng người).
+
+So sánh mọi cặp là O(N^2): ma trận điểm đầy đủ không bao giờ được tạo ra. Các hàng được xử
+lý theo khối `block_rows`, mỗi lần một tích ma trận (block_rows x block_rows) rồi cộng dồn vào
+histogram cố định (bước 0.001 trên [-1, 1]), nên bộ nhớ chỉ phụ thuộc kích thước khối:
+- genuine: hàng được sắp theo người dùng, mỗi khối chỉ nhân với đoạn hàng của những người có
+  trong khối (O(N * block_rows) phép nhân vector),
+- impostor: mọi cặp khối trên tam giác trên; gallery lớn thì chỉ lấy mẫu một phần người dùng
+  (`sample_users`).
+
+FAR ở đây tính theo CẶP: một khung hình được so với cả gallery N người nên xác suất nhận nhầm
+một người lạ xấp xỉ N * FAR; chọn `target_far` theo kích thước gallery.
+Khoảng cách Euclid giữa hai vector đơn vị suy ra từ cosine nên ngưỡng Euclid khuyến nghị chỉ
+là ngưỡng cosine quy đổi.
+"""
+import numpy as np
+
+from gallery import euclidean_from_cosine
+
+BIN_WIDTH = 0.001
+NUM_BINS = int(round(2 / BIN_WIDTH)) + 1 # Thùng cuối chứa điểm đúng bằng 1
+CURVE_STEP = 0.01 # Bước ngưỡng của đường cong FAR/FRR trong báo cáo
+
+
+def _bin_index(scores: np.ndarray) -> np.ndarray:
+    return np.clip(((scores + 1.0) / BIN_WIDTH).astype(np.int64), 0, NUM_BINS - 1)
+
+
+def bin_thresholds() -> np.ndarray:
+    """Ngưỡng (cận dưới) của từng thùng histogram."""
+    return np.arange(NUM_BINS) * BIN_WIDTH - 1.0
+
+
+def sample_users(owners: np.ndarray, max_rows: int, rng) -> np.ndarray:
+    """
+    Chỉ số hàng của các người dùng chọn ngẫu nhiên, tổng cộng không quá `max_rows` hàng
+    (lấy trọn mọi hàng của một người để vẫn có cặp genuine). `max_rows` <= 0 = lấy tất cả.
+    """
+    rows = np.arange(len(owners))
+    if max_rows <= 0 or len(owners) <= max_rows:
+        return rows
+    order = np.argsort(owners, kind="stable")
+    users, starts, counts = np.unique(owners[order], return_index=True, return_counts=True)
+    chosen = rng.permutation(len(users))
+    chosen = chosen[np.cumsum(counts[chosen]) <= max_rows]
+    return np.sort(np.concatenate([order[starts[u]:starts[u] + counts[u]] for u in chosen]))
+
+
+def score_histograms(vectors: np.ndarray, owners: np.ndarray, block_rows: int = 1024,
+                     on_block=None) -> tuple:
+    """
+    Histogram điểm genuine và impostor (mỗi cặp tính một lần) của các vector đã chuẩn hóa.
+    `on_block()` (tùy chọn) được gọi sau mỗi khối, ví dụ để nhường CPU cho luồng khác.
+    """
+    order = np.argsort(owners, kind="stable")
+    vectors = np.ascontiguousarray(vectors[order], dtype=np.float32)
+    owners = np.asarray(owners)[order]
+    n = len(owners)
+    genuine = np.zeros(NUM_BINS, dtype=np.int64)
+    impostor = np.zeros(NUM_BINS, dtype=np.int64)
+    if n < 2:
+        return genuine, impostor
+
+    # Đoạn hàng [first, last) của người sở hữu từng hàng (hàng đã sắp theo người dùng)
+    _, starts, counts = np.unique(owners, return_index=True, return_counts=True)
+    group = np.repeat(np.arange(len(starts)), counts)
+    first, last = starts[group], (starts + counts)[group]
+
+    for a in range(0, n, block_rows):
+        b = min(n, a + block_rows)
+        lo, hi = first[a], last[b - 1]
+        scores = vectors[a:b] @ vectors[lo:hi].T
+        mask = (owners[a:b, None] == owners[None, lo:hi]) & (np.arange(lo, hi)[None, :] > np.arange(a, b)[:, None])
+        genuine += np.bincount(_bin_index(scores[mask]), minlength=NUM_BINS)
+
+        for c in range(a, n, block_rows):
+            d = min(n, c + block_rows)
+            scores = vectors[a:b] @ vectors[c:d].T
+            mask = owners[a:b, None] != owners[None, c:d]
+            if c == a:
+                mask &= np.arange(c, d)[None, :] > np.arange(a, b)[:, None]
+            impostor += np.bincount(_bin_index(scores[mask]), minlength=NUM_BINS)
+            if on_block is not None:
+                on_block()
+    return genuine, impostor
+
+
+def error_rates(genuine: np.ndarray, impostor: np.ndarray) -> tuple:
+    """(FAR, FRR) tại ngưỡng của từng thùng histogram."""
+    far = np.cumsum(impostor[::-1])[::-1] / max(1, impostor.sum())
+    frr = np.concatenate([[0], np.cumsum(genuine)[:-1]]) / max(1, genuine.sum())
+    return far, frr
+
+
+def calibrate(vectors: np.ndarray, owners: np.ndarray, target_far: float = 0.001, block_rows: int = 1024,
+              min_genuine_pairs: int = 100, on_block=None) -> dict:
+    """
+    Báo cáo hiệu chỉnh: số cặp, EER, đường cong FAR/FRR (bước CURVE_STEP trên [0, 1]) và ngưỡng
+    khuyến nghị = ngưỡng nhỏ nhất có FAR <= `target_far`. `reliable` là False khi quá ít cặp
+    genuine hoặc quá ít cặp impostor để ước lượng FAR ở mức `target_far` (cần >= 10 / target_far).
+    """
+    genuine, impostor = score_histograms(vectors, owners, block_rows, on_block)
+    genuine_pairs, impostor_pairs = int(genuine.sum()), int(impostor.sum())
+    thresholds = bin_thresholds()
+    far, frr = error_rates(genuine, impostor)
+
+    eer_bin = int(np.argmin(np.abs(far - frr)))
+    passing = np.flatnonzero(far <= target_far)
+    rec_bin = int(passing[0]) if len(passing) else NUM_BINS - 1
+    cosine = float(round(thresholds[rec_bin], 3))
+    curve_bins = np.rint((np.arange(0.0, 1.0 + CURVE_STEP / 2, CURVE_STEP) + 1.0) / BIN_WIDTH).astype(np.int64)
+    return {
+        "rows": int(len(owners)),
+        "users": int(len(np.unique(owners))),
+        "genuine_pairs": genuine_pairs,
+        "impostor_pairs": impostor_pairs,
+        "reliable": genuine_pairs >= min_genuine_pairs and impostor_pairs * target_far >= 10,
+        "eer": float((far[eer_bin] + frr[eer_bin]) / 2),
+        "eer_threshold": float(round(thresholds[eer_bin], 3)),
+        "recommended": {
+            "cosine": cosine,
+            "euclidean": float(round(float(euclidean_from_cosine(cosine)), 3)),
+            "target_far": target_far,
+            "far": float(far[rec_bin]),
+            "frr": float(frr[rec_bin]),
+        },
+        "curve": [{"threshold": float(round(thresholds[i], 3)), "far": float(far[i]), "frr": float(frr[i])}
+                  for i in curve_bins],
+    }
@@ -0,0 +1,53 @@
+# backend-ai/changelog.py
+"""
+Đồng bộ gallery giữa các bản sao dịch vụ AI qua bảng nhật ký thay đổi `embedding_changes`.
+
+Mỗi thay đổi người dùng/embedding (Backend Admin, /add-face, đăng ký hàng loạt, thu gọn,
+reembed.py) ghi thêm một hàng (seq tự tăng, user_id, loại thay đổi) TRONG CÙNG giao dịch với
+thay đổi đó. Mỗi bản sao đọc các hàng có seq lớn hơn seq đã áp dụng và chỉ bắt kịp những người
+dùng đó từ DB, nên bao nhiêu bản sao cũng hội tụ mà không cần ai gọi tới từng bản sao, và một
+lần đọc lỡ không làm cache lệch mãi (lần đọc sau vẫn thấy hàng đó).
+
+Seq tự tăng được cấp lúc INSERT nhưng chỉ hiện ra lúc COMMIT: giao dịch nhận seq nhỏ hơn có thể
+commit sau giao dịch nhận seq lớn hơn. Các seq bị hụt giữa hai seq đã đọc vì vậy được đọc lại
+trong GAP_TIMEOUT_S giây (quá thời gian đó coi như giao dịch đã rollback).
+"""
+import time
+
+GAP_TIMEOUT_S = 60.0
+MAX_GAPS = 10000 # Khoảng hụt lớn hơn (ví dụ hàng cũ đã bị dọn) không được theo dõi
+# Lúc khởi động, đọc lại các hàng cuối cùng của nhật ký: giao dịch đang chạy khi gallery được nạp
+# có thể commit sau đó với seq nhỏ hơn seq lớn nhất đã thấy. Áp dụng lại một thay đổi là vô hại.
+REPLAY_ON_START = 1000
+
+
+class ChangeCursor:
+    """Vị trí đã đọc trong nhật ký thay đổi và các seq hụt còn chờ."""
+
+    def __init__(self, last_seq: int = 0):
+        self.last_seq = last_seq
+        self.gaps = {} # seq -> thời điểm phát hiện (time.monotonic)
+
+    @classmethod
+    def at_startup(cls, latest_seq: int) -> "ChangeCursor":
+        return cls(max(0, latest_seq - REPLAY_ON_START))
+
+    def pending_gaps(self) -> list:
+        """Các seq hụt còn trong thời gian chờ (đã bỏ những seq quá GAP_TIMEOUT_S)."""
+        now = time.monotonic()
+        self.gaps = {seq: seen for seq, seen in self.gaps.items() if now - seen <= GAP_TIMEOUT_S}
+        return sorted(self.gaps)
+
+    def advance(self, seqs) -> None:
+        """Ghi nhận các seq đã áp dụng (kể cả seq hụt vừa xuất hiện)."""
+        now = time.monotonic()
+        for seq in sorted(set(seqs)):
+            if self.gaps.pop(seq, None) is not None or seq <= self.last_seq:
+                continue
+            missing = seq - self.last_seq - 1
+            if 0 < missing <= MAX_GAPS:
+                self.gaps.update(dict.fromkeys(range(self.last_seq + 1, seq), now))
+            self.last_seq = seq
+
+    def stats(self) -> dict:
+        return {"seq": self.last_seq, "pending_gaps": len(self.gaps)}
@@ -0,0 +1,107 @@
+# backend-ai/compaction.py
+"""
+Thu gọn embedding của MỘT người dùng thành một tập prototype có kích thước cố định.
+
+Mỗi lần /add-face hoặc Admin cập nhật ảnh đều thêm hàng mới, nên người đăng ký lại nhiều
+lần có số embedding tăng mãi: tốn bộ nhớ cache và tăng chi phí so khớp. Thu gọn giữ lại:
+
+- centroid: trung bình (đã chuẩn hóa L2) của các embedding không phải ngoại lai,
+- k medoid: các embedding THẬT đại diện cho k cụm (k-medoids theo cosine), giữ được các
+  biến thể như đeo kính/không đeo kính mà centroid làm mờ đi,
+
+và bỏ các ngoại lai: embedding có cosine với centroid thấp hơn `min_similarity` hoặc thấp
+bất thường so với phần còn lại (median - `mad_factor` * MAD).
+
+Báo cáo kèm "điểm khớp đúng người" trước/sau: với mỗi embedding gốc không phải ngoại lai,
+cosine cao nhất tới các vector CÒN LẠI của người đó (bỏ chính nó), tính trên tập gốc và trên
+tập prototype.
+"""
+import numpy as np
+
+from gallery import l2_normalize
+
+MAD_SCALE = 1.4826 # Đổi MAD thành độ lệch chuẩn ước lượng với phân phối chuẩn
+
+
+def find_outliers(vectors: np.ndarray, min_similarity: float, mad_factor: float) -> np.ndarray:
+    """Mặt nạ bool các vector ngoại lai; luôn giữ ít nhất một nửa số vector."""
+    centroid = l2_normalize(vectors.mean(axis=0))
+    sims = vectors @ centroid
+    median = np.median(sims)
+    mad = np.median(np.abs(sims - median)) * MAD_SCALE
+    outliers = (sims < min_similarity) | (sims < median - mad_factor * mad)
+    max_outliers = len(vectors) // 2
+    if outliers.sum() > max_outliers:
+        # Chỉ bỏ những vector xa centroid nhất
+        outliers = np.zeros(len(vectors), dtype=bool)
+        outliers[np.argsort(sims)[:max_outliers]] = True
+    return outliers
+
+
+def k_medoids(vectors: np.ndarray, k: int, iterations: int = 10) -> np.ndarray:
+    """Chỉ số k medoid theo độ tương đồng cosine (khởi tạo xa-nhất-trước, rồi tinh chỉnh luân phiên)."""
+    n = len(vectors)
+    if n <= k:
+        return np.arange(n)
+    sims = vectors @ vectors.T
+    medoids = [int(np.argmax(sims.sum(axis=1)))]
+    while len(medoids) < k:
+        medoids.append(int(np.argmin(sims[:, medoids].max(axis=1))))
+    medoids = np.array(medoids)
+    for _ in range(iterations):
+        assignment = np.argmax(sims[:, medoids], axis=1)
+        updated = medoids.copy()
+        for cluster in range(k):
+            members = np.flatnonzero(assignment == cluster)
+            if len(members):
+                updated[cluster] = members[np.argmax(sims[np.ix_(members, members)].sum(axis=1))]
+        if np.array_equal(updated, medoids):
+            break
+        medoids = updated
+    return np.unique(medoids)
+
+
+def genuine_scores(vectors: np.ndarray, references: np.ndarray, self_index: np.ndarray) -> np.ndarray:
+    """
+    Cosine cao nhất của từng vector tới `references`, bỏ tham chiếu chính là vector đó
+    (`self_index[i]` là chỉ số của vector i trong `references`, -1 nếu không có).
+    """
+    sims = vectors @ references.T
+    rows = np.flatnonzero(self_index >= 0)
+    sims[rows, self_index[rows]] = -np.inf
+    return sims.max(axis=1) if references.shape[0] else np.full(len(vectors), -np.inf)
+
+
+def compact_embeddings(embeddings: np.ndarray, medoids: int = 4, min_similarity: float = 0.3,
+                       mad_factor: float = 3.0) -> dict:
+    """
+    Thu gọn ma trận embedding (N, D) của một người dùng.
+
+    Trả về dict: `centroid` (D,), `keep` (chỉ số các medoid được giữ), `outliers` (chỉ số bị
+    bỏ) và `score_before` / `score_after` (điểm khớp đúng người trung bình trước/sau).
+    Với N <= medoids + 1 không có gì để thu gọn: `centroid` là None và mọi hàng được giữ.
+    """
+    vectors = l2_normalize(embeddings)
+    n = len(vectors)
+    if n <= medoids + 1:
+        return {"centroid": None, "keep": np.arange(n), "outliers": np.array([], dtype=np.int64),
+                "score_before": None, "score_after": None}
+
+    outlier_mask = find_outliers(vectors, min_similarity, mad_factor)
+    inliers = np.flatnonzero(~outlier_mask)
+    centroid = l2_normalize(vectors[inliers].mean(axis=0))
+    keep = inliers[k_medoids(vectors[inliers], medoids)]
+
+    # Tập prototype: centroid ở hàng 0, các medoid ở các hàng tiếp theo
+    prototypes = np.vstack([centroid[None, :], vectors[keep]])
+    self_in_prototypes = np.full(n, -1)
+    self_in_prototypes[keep] = np.arange(1, len(keep) + 1)
+    before = genuine_scores(vectors, vectors, np.arange(n))
+    after = genuine_scores(vectors, prototypes, self_in_prototypes)
+    return {
+        "centroid": centroid,
+        "keep": keep,
+        "outliers": np.flatnonzero(outlier_mask),
+        "score_before": float(before[inliers].mean()),
+        "score_after": float(after[inliers].mean()),
+    }
@@ -0,0 +1,182 @@
+# backend-ai/detectors.py
+"""
+Các bộ phát hiện khuôn mặt có thể thay thế cho nhau.
+
+Mọi bộ phát hiện nhận ảnh BGR (như cv2.imdecode trả về) và trả về danh sách khuôn mặt
+theo định dạng của MTCNN để bước căn chỉnh trong `preprocess_image` giữ nguyên:
+
+    {"box": [x, y, w, h], "confidence": float,
+     "keypoints": {"left_eye": (x, y), "right_eye": (x, y)}}
+
+trong đó `left_eye` là mắt nằm bên trái ẢNH (x nhỏ hơn).
+
+- "mtcnn": chính xác nhất nhưng chậm nhất trên CPU (mặc định, giữ hành vi cũ).
+- "haar": Haar cascade có sẵn trong opencv-python-headless; mắt được tìm bằng cascade
+  mắt trong nửa trên khuôn mặt, nếu không thấy thì ước lượng theo tỉ lệ khuôn mặt.
+- "yunet": cv2.FaceDetectorYN (OpenCV DNN), cần tệp mô hình ONNX
+  (face_detection_yunet_*.onnx) truyền qua `model_path`.
+
+Haar và YuNet giữ trạng thái bên trong đối tượng OpenCV nên mỗi luồng worker dùng
+một bản riêng (threading.local).
+"""
+import os
+import threading
+
+import cv2
+
+DETECTOR_NAMES = ("mtcnn", "haar", "yunet")
+
+
+def _face(x, y, w, h, confidence, eye_a, eye_b) -> dict:
+    left_eye, right_eye = sorted((eye_a, eye_b))
+    return {
+        "box": [int(x), int(y), int(w), int(h)],
+        "confidence": float(confidence),
+        "keypoints": {
+            "left_eye": (int(left_eye[0]), int(left_eye[1])),
+            "right_eye": (int(right_eye[0]), int(right_eye[1])),
+        },
+    }
+
+
+class FaceDetector:
+    """Giao diện chung: `detect(img_bgr)` trả về danh sách khuôn mặt định dạng MTCNN."""
+
+    name = "base"
+
+    def detect(self, img_bgr) -> list:
+        raise NotImplementedError
+
+
+class MTCNNDetector(FaceDetector):
+    name = "mtcnn"
+
+    def __init__(self):
+        from mtcnn import MTCNN
+        self._mtcnn = MTCNN()
+
+    def detect(self, img_bgr) -> list:
+        faces = self._mtcnn.detect_faces(cv2.cvtColor(img_bgr, cv2.COLOR_BGR2RGB))
+        return [
+            _face(*f["box"], f.get("confidence", 1.0), f["keypoints"]["left_eye"], f["keypoints"]["right_eye"])
+            for f in faces
+        ]
+
+
+class HaarDetector(FaceDetector):
+    """Haar cascade khuôn mặt chính diện + cascade mắt của OpenCV. Rất nhanh trên CPU."""
+
+    name = "haar"
+    FACE_CASCADE = "haarcascade_frontalface_default.xml"
+    EYE_CASCADE = "haarcascade_eye.xml"
+
+    def __init__(self, scale_factor: float = 1.1, min_neighbors: int = 5, min_face_ratio: float = 0.1):
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_face_ratio = min_face_ratio
+        self._local = threading.local()
+        self._cascades()  # Báo lỗi ngay khi khởi tạo nếu thiếu tệp cascade
+
+    def _cascades(self):
+        if not hasattr(self._local, "face"):
+            base = getattr(cv2, "data", None)
+            base = base.haarcascades if base is not None else ""
+            face = cv2.CascadeClassifier(os.path.join(base, self.FACE_CASCADE))
+            eye = cv2.CascadeClassifier(os.path.join(base, self.EYE_CASCADE))
+            if face.empty():
+                raise RuntimeError(f"Không tìm thấy Haar cascade {self.FACE_CASCADE} trong '{base}'")
+            self._local.face, self._local.eye = face, eye
+        return self._local.face, self._local.eye
+
+    def _eyes(self, gray, x, y, w, h, eye_cascade):
+        # Chỉ tìm mắt ở nửa trên khuôn mặt; giữ hai vùng lớn nhất
+        roi = gray[y:y + h // 2, x:x + w]
+        eyes = [] if eye_cascade.empty() else eye_cascade.detectMultiScale(
+            roi, scaleFactor=1.1, minNeighbors=5, minSize=(max(1, w // 10), max(1, w // 10)))
+        eyes = sorted(eyes, key=lambda e: e[2] * e[3], reverse=True)[:2]
+        if len(eyes) == 2:
+            (ax, ay, aw, ah), (bx, by, bw, bh) = eyes
+            a = (x + ax + aw / 2, y + ay + ah / 2)
+            b = (x + bx + bw / 2, y + by + bh / 2)
+            if abs(a[0] - b[0]) > w * 0.2:
+                return a, b
+        # Ước lượng vị trí mắt theo tỉ lệ khuôn mặt chính diện
+        return (x + 0.3 * w, y + 0.38 * h), (x + 0.7 * w, y + 0.38 * h)
+
+    def detect(self, img_bgr) -> list:
+        face_cascade, eye_cascade = self._cascades()
+        gray = cv2.equalizeHist(cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY))
+        min_side = max(1, int(min(gray.shape[:2]) * self.min_face_ratio))
+        boxes = face_cascade.detectMultiScale(
+            gray, scaleFactor=self.scale_factor, minNeighbors=self.min_neighbors, minSize=(min_side, min_side))
+        return [_face(x, y, w, h, 1.0, *self._eyes(gray, x, y, w, h, eye_cascade)) for (x, y, w, h) in boxes]
+
+
+class YuNetDetector(FaceDetector):
+    """cv2.FaceDetectorYN (YuNet, OpenCV DNN): gần chính xác như MTCNN, nhanh hơn nhiều trên CPU."""
+
+    name = "yunet"
+
+    def __init__(self, model_path: str, score_threshold: float = 0.8, nms_threshold: float = 0.3):
+        if not model_path or not os.path.exists(model_path):
+            raise RuntimeError(f"Không tìm thấy mô hình YuNet: '{model_path}' (đặt FACE_DETECTOR_MODEL)")
+        self.model_path = model_path
+        self.score_threshold = score_threshold
+        self.nms_threshold = nms_threshold
+        self._local = threading.local()
+        self._net((320, 320))
+
+    def _net(self, size):
+        net = getattr(self._local, "net", None)
+        if net is None:
+            net = cv2.FaceDetectorYN.create(self.model_path, "", size, self.score_threshold, self.nms_threshold)
+            self._local.net = net
+        return net
+
+    def detect(self, img_bgr) -> list:
+        height, width = img_bgr.shape[:2]
+        net = self._net((width, height))
+        net.setInputSize((width, height))
+        _, faces = net.detect(img_bgr)
+        if faces is None:
+            return []
+        # Mỗi hàng: x, y, w, h, mắt phải, mắt trái, mũi, hai khóe miệng (x, y), điểm tin cậy
+        return [_face(f[0], f[1], f[2], f[3], f[-1], (f[4], f[5]), (f[6], f[7])) for f in faces]
+
+
+def rescale_face(face: dict, factor: float) -> dict:
+    """Nhân tọa độ hộp và điểm mốc với `factor` (đưa kết quả từ ảnh thu nhỏ về ảnh gốc)."""
+    x, y, w, h = face["box"]
+    keypoints = {k: (int(round(px * factor)), int(round(py * factor))) for k, (px, py) in face["keypoints"].items()}
+    return {
+        **face,
+        "box": [int(round(x * factor)), int(round(y * factor)), int(round(w * factor)), int(round(h * factor))],
+        "keypoints": keypoints,
+    }
+
+
+def detect_downscaled(detector: FaceDetector, img_bgr, max_side: int) -> list:
+    """
+    Chạy `detector` trên bản thu nhỏ của ảnh (cạnh dài nhất <= `max_side`) rồi đưa hộp
+    và điểm mốc về tọa độ ảnh gốc. Ảnh đã đủ nhỏ (hoặc max_side <= 0) được dùng nguyên.
+    """
+    height, width = img_bgr.shape[:2]
+    longest = max(height, width)
+    if max_side <= 0 or longest <= max_side:
+        return detector.detect(img_bgr)
+    scale = max_side / longest
+    small = cv2.resize(img_bgr, (max(1, round(width * scale)), max(1, round(height * scale))),
+                       interpolation=cv2.INTER_AREA)
+    return [rescale_face(face, 1.0 / scale) for face in detector.detect(small)]
+
+
+def create_detector(name: str = "mtcnn", model_path: str | None = None) -> FaceDetector:
+    """Tạo bộ phát hiện theo tên ("mtcnn", "haar", "yunet")."""
+    name = (name or "mtcnn").lower()
+    if name == "mtcnn":
+        return MTCNNDetector()
+    if name == "haar":
+        return HaarDetector()
+    if name == "yunet":
+        return YuNetDetector(model_path)
+    raise ValueError(f"Bộ phát hiện khuôn mặt không hợp lệ: '{name}' (chọn một trong {', '.join(DETECTOR_NAMES)})")
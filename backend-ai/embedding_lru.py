@@ -0,0 +1,120 @@
+# backend-ai/embedding_lru.py
+"""
+Cache LRU các embedding đã tính để bỏ qua suy luận ArcFace lặp lại.
+
+- Khung hình kiosk liên tiếp thường gần như giống hệt nhau: khóa là kiosk + dHash (hash cảm
+  nhận) của ảnh khuôn mặt ĐÃ căn chỉnh, nên hai khung hình chỉ khác nhiễu nhỏ cho cùng khóa.
+  dHash chỉ giữ hướng chênh lệch giữa các pixel nên hai người khác nhau có thể trùng khóa: mỗi
+  mục lưu kèm ảnh thu nhỏ (`face_thumbnail`) và lượt trúng chỉ được dùng khi chênh lệch pixel
+  trung bình với khuôn mặt hiện tại nhỏ hơn ngưỡng (`thumbnail_difference`).
+- Ảnh tải lên (/add-face, /face-embeddings/extract) thường bị gửi lại nguyên vẹn: khóa là
+  SHA-1 của nội dung tệp, trúng cache thì bỏ qua cả giải mã lẫn phát hiện khuôn mặt.
+
+Mỗi mục có thời hạn (TTL) và cache có số mục tối đa; bộ đếm hit/miss cho biết số lượt
+suy luận đã tiết kiệm được.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+def dhash(face_img: np.ndarray, hash_size: int = 16) -> bytes:
+    """
+    Difference hash của ảnh khuôn mặt: thu nhỏ ảnh xám về (hash_size + 1) x hash_size rồi
+    so sánh từng cặp pixel liền kề theo chiều ngang. Trả về hash_size^2 bit dạng bytes.
+    """
+    gray = face_img if face_img.ndim == 2 else cv2.cvtColor(face_img, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    return np.packbits(small[:, 1:] > small[:, :-1]).tobytes()
+
+
+def face_thumbnail(face_img: np.ndarray, size: int = 32) -> np.ndarray:
+    """Ảnh xám size x size của khuôn mặt, lưu cùng embedding để kiểm tra lượt trúng cache."""
+    gray = face_img if face_img.ndim == 2 else cv2.cvtColor(face_img, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA)
+
+
+def thumbnail_difference(a: np.ndarray, b: np.ndarray) -> float:
+    """Chênh lệch trung bình (0..255) giữa hai ảnh thu nhỏ."""
+    return float(np.mean(cv2.absdiff(a, b)))
+
+
+def content_hash(data: bytes) -> bytes:
+    """Hash nội dung của một tệp tải lên."""
+    return hashlib.sha1(data).digest()
+
+
+class EmbeddingLRU:
+    """Cache LRU an toàn luồng: khóa -> giá trị, với TTL và số mục tối đa (max_entries <= 0 = tắt)."""
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+        self.rejected = 0 # Trùng khóa nhưng `validate` từ chối (tính là miss)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: bytes, validate=None):
+        """
+        Giá trị đã lưu cho `key`, hoặc None nếu không có/đã hết hạn hoặc `validate(giá trị)`
+        trả về False.
+        """
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < now:
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is not None and validate is not None and not validate(entry[1]):
+                self.rejected += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: bytes, value) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,63 @@
+# backend-ai/enroll.py
+"""
+Đăng ký khuôn mặt hàng loạt từ dòng lệnh, chạy ngay trong container backend-ai (cùng
+DATABASE_URL với dịch vụ AI). Mỗi sự kiện (tiến độ, lỗi từng ảnh, tổng kết) được in ra
+một dòng JSON, giống luồng NDJSON của POST /enroll/bulk.
+
+Ảnh đặt tên theo member_code, xem enrollment.py. Ví dụ:
+    python enroll.py /data/hk1_2025 --workers 4 --notify http://localhost:8000
+    python enroll.py /data/hk1_2025.zip > enroll_log.ndjson
+
+Tiến trình này không dùng chung bộ nhớ với dịch vụ đang chạy: dịch vụ tự bắt kịp những người
+vừa đăng ký qua nhật ký embedding_changes. Chỉ khi dịch vụ tắt đọc nhật ký (CHANGE_LOG_POLL_S=0)
+mới cần --notify (gọi POST /reload-embedding-cache) hoặc gọi tay.
+"""
+import argparse
+import json
+import sys
+import urllib.request
+
+import main
+from enrollment import iter_photo_sources
+
+
+def notify_reload(base_url: str) -> dict:
+    request = urllib.request.Request(base_url.rstrip("/") + "/reload-embedding-cache", data=b"", method="POST")
+    with urllib.request.urlopen(request, timeout=300) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Thư mục hoặc tệp .zip chứa ảnh")
+    parser.add_argument("--workers", type=int, default=main.BULK_ENROLL_WORKERS, help="Số luồng phát hiện khuôn mặt")
+    parser.add_argument("--commit-size", type=int, default=main.BULK_ENROLL_COMMIT_SIZE,
+                        help="Số embedding ghi vào DB mỗi giao dịch")
+    parser.add_argument("--notify", default="",
+                        help="URL dịch vụ AI cần tải lại gallery khi xong (mặc định không gọi)")
+    args = parser.parse_args()
+
+    try:
+        sources = iter_photo_sources(args.path)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    main.load_arcface_model()
+    main.inference_batcher.start()
+    db = main.SessionLocal()
+    try:
+        summary = {}
+        for event in main.bulk_enroll(sources, db, workers=args.workers, commit_size=args.commit_size,
+                                      refresh_gallery=False):
+            print(json.dumps(event, ensure_ascii=False), flush=True)
+            summary = event
+    finally:
+        db.close()
+
+    if args.notify and summary.get("enrolled"):
+        print(json.dumps({"type": "notify", "url": args.notify, **notify_reload(args.notify)}, ensure_ascii=False))
+    sys.exit(1 if summary.get("errors") else 0)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,74 @@
+# backend-ai/enrollment.py
+"""
+Nguồn ảnh cho việc đăng ký khuôn mặt hàng loạt (đầu học kỳ: hàng nghìn ảnh một lúc).
+
+Ảnh được lấy từ một thư mục hoặc một tệp .zip và được đặt tên theo `member_code`:
+
+    SV001.jpg, SV001_2.jpg, SV001-3.png    -> thành viên SV001
+    SV002/front.jpg, SV002/left.jpg        -> thành viên SV002 (thư mục con mang mã thành viên)
+
+Phần hậu tố "_<số>"/"-<số>" chỉ bị bỏ khi tên đầy đủ không phải là một mã thành viên có
+thật, nên mã chứa dấu gạch dưới vẫn được nhận đúng.
+"""
+import os
+import re
+import zipfile
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+_NUMBER_SUFFIX = re.compile(r"^(.+?)[_\-]\d+$")
+
+
+def _is_image(name: str) -> bool:
+    base = os.path.basename(name)
+    return not base.startswith(".") and base.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def iter_photo_sources(path: str):
+    """
+    Liệt kê ảnh trong thư mục hoặc tệp zip `path`. Trả về danh sách (tên tương đối, hàm đọc
+    bytes); nội dung chỉ được đọc khi gọi hàm, ngay trên luồng worker xử lý ảnh đó.
+    """
+    if os.path.isdir(path):
+        sources = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                full_path = os.path.join(root, name)
+                rel_name = os.path.relpath(full_path, path).replace(os.sep, "/")
+                if _is_image(rel_name):
+                    sources.append((rel_name, lambda p=full_path: read_file(p)))
+        return sources
+    if zipfile.is_zipfile(path):
+        archive = zipfile.ZipFile(path)
+        return [
+            (info.filename, lambda n=info.filename: archive.read(n))
+            for info in archive.infolist()
+            if not info.is_dir() and not info.filename.startswith("__MACOSX/") and _is_image(info.filename)
+        ]
+    raise ValueError(f"'{path}' không phải thư mục hoặc tệp zip")
+
+
+def read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def member_code_candidates(name: str) -> list:
+    """Các mã thành viên có thể có của một ảnh, theo thứ tự ưu tiên."""
+    parts = [p for p in name.replace("\\", "/").split("/") if p]
+    stem = os.path.splitext(parts[-1])[0]
+    candidates = [parts[-2]] if len(parts) > 1 else []
+    candidates.append(stem)
+    match = _NUMBER_SUFFIX.match(stem)
+    if match:
+        candidates.append(match.group(1))
+    return candidates
+
+
+def resolve_member_code(name: str, member_codes) -> str | None:
+    """Mã thành viên (có trong `member_codes`) ứng với tên ảnh, hoặc None nếu không khớp."""
+    for candidate in member_code_candidates(name):
+        if candidate in member_codes:
+            return candidate
+    return None
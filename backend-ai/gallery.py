@@ -0,0 +1,328 @@
+# backend-ai/gallery.py
+"""
+Gallery embedding khuôn mặt trong bộ nhớ của dịch vụ AI.
+
+Toàn bộ embedding được giữ trong MỘT ma trận float32 liên tục (mỗi hàng là một
+vector đã chuẩn hóa L2) kèm mảng `owners` cho biết hàng đó thuộc về người dùng nào.
+Một phép nhân ma trận-vector chấm điểm cả gallery và `np.maximum.at` theo `owners`
+lấy điểm cao nhất của từng người.
+Với gallery lớn có thể gắn thêm một chỉ mục ANN (xem `ann_index.py`) để chỉ chấm
+điểm lại chính xác một tập ứng viên nhỏ.
+
+Gallery hỗ trợ thêm/cập nhật/xóa MỘT người dùng tại chỗ: hàng của người bị xóa được
+đánh dấu trống (owner = -1) và tái sử dụng cho lần ghi sau, nên chi phí chỉ tỷ lệ với
+số embedding của người đó chứ không phải toàn bộ gallery.
+
+Ma trận float32 có thể đặt trên tệp ánh xạ bộ nhớ (`MemmapStorage`) khi lượt chấm điểm thứ
+nhất dùng bản nén (`quantized.py`): chỉ các hàng ứng viên được đọc lại nên phần lớn ma trận
+không chiếm bộ nhớ thường trú.
+"""
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+EMBEDDING_DTYPE = np.float32
+FREE_ROW = -1
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Chuẩn hóa L2 theo từng hàng (hoặc một vector), giữ nguyên vector 0."""
+    vectors = np.asarray(vectors, dtype=EMBEDDING_DTYPE)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1).astype(EMBEDDING_DTYPE)
+
+
+def euclidean_from_cosine(similarity):
+    """Khoảng cách Euclid giữa hai vector đơn vị suy ra từ cosine: d = sqrt(2 - 2*cos)."""
+    return np.sqrt(np.maximum(0.0, 2.0 - 2.0 * np.asarray(similarity, dtype=np.float64)))
+
+
+def _as_block(embeddings) -> np.ndarray:
+    """Chuyển list embedding (hoặc ma trận (N, D)) thành ma trận đã chuẩn hóa, bỏ các vector rỗng."""
+    if isinstance(embeddings, np.ndarray) and embeddings.ndim == 2:
+        return l2_normalize(embeddings) if embeddings.size else None
+    vectors = [np.asarray(e, dtype=EMBEDDING_DTYPE) for e in embeddings if len(e) > 0]
+    if not vectors:
+        return None
+    return l2_normalize(np.stack(vectors))
+
+
+class MemmapStorage:
+    """Cấp phát ma trận float32 trên tệp tạm ánh xạ bộ nhớ trong `directory` (mặc định thư mục tạm)."""
+
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or None
+
+    def allocate(self, capacity: int, dim: int) -> np.ndarray:
+        if capacity * dim == 0:
+            return np.zeros((capacity, dim), dtype=EMBEDDING_DTYPE)
+        fd, path = tempfile.mkstemp(prefix="gallery-", suffix=".f32", dir=self.directory)
+        os.close(fd)
+        matrix = np.memmap(path, dtype=EMBEDDING_DTYPE, mode="w+", shape=(capacity, dim))
+        os.unlink(path) # Vùng ánh xạ vẫn dùng được; tệp tự được giải phóng khi ma trận bị thu hồi
+        return matrix
+
+
+class FaceGallery:
+    """
+    Ma trận embedding của toàn bộ người dùng.
+
+    - `matrix`: (capacity, D) float32; chỉ `size` hàng đầu được dùng.
+    - `owners`: (capacity,) int32, slot người dùng sở hữu từng hàng, -1 nếu hàng trống.
+    - `users`: danh sách slot -> dict {user_id, member_code, full_name} (None nếu đã xóa).
+    - `index`: chỉ mục ANN hoặc bản nén tùy chọn (None = quét toàn bộ).
+    - `storage`: nơi cấp phát `matrix` (None = bộ nhớ thường, hoặc `MemmapStorage`).
+
+    Luồng ghi (upsert/remove) được tuần tự hóa bằng khóa. Luồng đọc không cần khóa:
+    khi mở rộng, ma trận mới được gán trước `size`, và `owners` của một hàng chỉ trỏ
+    tới người dùng sau khi vector của hàng đó đã được ghi xong.
+    """
+
+    def __init__(self, dim: int = 0, capacity: int = 0, storage: MemmapStorage | None = None):
+        self.storage = storage
+        self.matrix = self._new_matrix(capacity, dim)
+        self.owners = np.full(capacity, FREE_ROW, dtype=np.int32)
+        self.size = 0
+        self.users = []
+        self.index = None
+        self._slot_of = {}
+        self._rows_of = {}
+        self._free_rows = []
+        self._free_slots = []
+        self._lock = threading.Lock()
+
+    def _new_matrix(self, capacity: int, dim: int) -> np.ndarray:
+        if self.storage is not None:
+            return self.storage.allocate(capacity, dim)
+        return np.zeros((capacity, dim), dtype=EMBEDDING_DTYPE)
+
+    @classmethod
+    def from_entries(cls, entries, storage: MemmapStorage | None = None) -> "FaceGallery":
+        """
+        Tạo gallery từ các cặp (user_info, embeddings), trong đó embeddings là list
+        các vector. Người dùng không có embedding hợp lệ sẽ bị bỏ qua.
+        """
+        users, blocks = [], []
+        for user_info, embeddings in entries:
+            block = _as_block(embeddings)
+            if block is not None:
+                users.append(user_info)
+                blocks.append(block)
+        if not users:
+            return cls(storage=storage)
+        gallery = cls(dim=blocks[0].shape[1], capacity=sum(len(b) for b in blocks), storage=storage)
+        start = 0
+        for slot, (user_info, block) in enumerate(zip(users, blocks)):
+            rows = np.arange(start, start + len(block))
+            gallery.matrix[rows] = block
+            gallery.owners[rows] = slot
+            gallery._slot_of[user_info["user_id"]] = slot
+            gallery._rows_of[slot] = rows
+            start += len(block)
+        gallery.users = users
+        gallery.size = start
+        return gallery
+
+    @classmethod
+    def from_arrays(cls, matrix: np.ndarray, row_user_ids: np.ndarray, users: list,
+                    storage: MemmapStorage | None = None) -> "FaceGallery":
+        """
+        Tạo gallery dùng thẳng `matrix` (N, D) đã chuẩn hóa, không sao chép (ví dụ ma trận ánh xạ
+        từ snapshot, xem snapshot.py). `row_user_ids[i]` là user_id của hàng i; `users` là danh sách
+        user_info, mỗi người dùng một phần tử. Khi thêm hàng vượt quá N, ma trận được cấp phát lại
+        bằng `storage` như bình thường.
+        """
+        if not users:
+            return cls(storage=storage)
+        gallery = cls(storage=storage)
+        user_ids = np.array([u["user_id"] for u in users], dtype=np.int64)
+        sorter = np.argsort(user_ids)
+        slots = sorter[np.searchsorted(user_ids, np.asarray(row_user_ids, dtype=np.int64), sorter=sorter)]
+        order = np.argsort(slots, kind="stable")
+        boundaries = np.flatnonzero(np.diff(slots[order])) + 1
+        for rows in np.split(order, boundaries):
+            gallery._rows_of[int(slots[rows[0]])] = rows
+        gallery.matrix = matrix
+        gallery.owners = slots.astype(np.int32)
+        gallery.size = len(slots)
+        gallery.users = list(users)
+        gallery._slot_of = {u["user_id"]: slot for slot, u in enumerate(users)}
+        return gallery
+
+    def export(self, open_output, block_rows: int = 65536):
+        """
+        Sao chép các hàng đang dùng, gom theo người dùng, vào mảng `open_output(n, dim)` trả về
+        (ví dụ np.lib.format.open_memmap). Khóa ghi được giữ suốt lúc sao chép nên không người
+        dùng nào bị ghi dở; luồng đọc không bị chặn.
+        Trả về (user_id của từng hàng đã ghi, danh sách user_info).
+        """
+        with self._lock:
+            slots = sorted(self._rows_of)
+            rows = np.concatenate([self._rows_of[s] for s in slots]) if slots else np.zeros(0, dtype=np.int64)
+            users = [self.users[s] for s in slots]
+            row_user_ids = np.repeat([u["user_id"] for u in users], [len(self._rows_of[s]) for s in slots])
+            out = open_output(len(rows), self.matrix.shape[1])
+            for start in range(0, len(rows), block_rows):
+                out[start:start + block_rows] = self.matrix[rows[start:start + block_rows]]
+        return row_user_ids.astype(np.int64), users
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    @property
+    def num_embeddings(self) -> int:
+        return self.size - len(self._free_rows)
+
+    def __contains__(self, user_id) -> bool:
+        return user_id in self._slot_of
+
+    def get_user(self, user_id) -> dict | None:
+        """user_info của một người dùng trong gallery (None nếu không có)."""
+        slot = self._slot_of.get(user_id)
+        return None if slot is None else self.users[slot]
+
+    def embedding_count(self, user_id) -> int:
+        """Số embedding của một người dùng trong gallery (0 nếu không có)."""
+        slot = self._slot_of.get(user_id)
+        return 0 if slot is None else len(self._rows_of[slot])
+
+    # --- Cập nhật tại chỗ ---
+    def _allocate_rows(self, count: int) -> np.ndarray:
+        reused = [self._free_rows.pop() for _ in range(min(count, len(self._free_rows)))]
+        extra = count - len(reused)
+        if self.size + extra > self.matrix.shape[0]:
+            capacity = max(self.size + extra, 2 * self.matrix.shape[0], 64)
+            matrix = self._new_matrix(capacity, self.matrix.shape[1])
+            matrix[:self.size] = self.matrix[:self.size]
+            owners = np.full(capacity, FREE_ROW, dtype=np.int32)
+            owners[:self.size] = self.owners[:self.size]
+            self.matrix, self.owners = matrix, owners
+        appended = list(range(self.size, self.size + extra))
+        self.size += extra
+        return np.array(reused + appended, dtype=np.int64)
+
+    def _release_slot(self, slot: int) -> None:
+        rows = self._rows_of.pop(slot)
+        self.owners[rows] = FREE_ROW
+        self.matrix[rows] = 0
+        if self.index is not None:
+            self.index.remove(rows)
+        self._free_rows.extend(rows.tolist())
+
+    def upsert_user(self, user_info: dict, embeddings) -> int:
+        """
+        Thêm mới hoặc thay toàn bộ embedding của một người dùng.
+        Trả về số embedding hợp lệ đã ghi (0 nghĩa là người dùng bị xóa khỏi gallery).
+        """
+        block = _as_block(embeddings)
+        if block is None:
+            self.remove_user(user_info["user_id"])
+            return 0
+        with self._lock:
+            if self.matrix.shape[1] == 0:
+                self.matrix = self._new_matrix(0, block.shape[1])
+            slot = self._slot_of.get(user_info["user_id"])
+            if slot is not None:
+                self._release_slot(slot)
+            elif self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                slot = len(self.users)
+                self.users.append(None)
+            self.users[slot] = user_info
+            rows = self._allocate_rows(len(block))
+            self.matrix[rows] = block
+            self.owners[rows] = slot
+            if self.index is not None:
+                self.index.add(rows, block)
+            self._rows_of[slot] = rows
+            self._slot_of[user_info["user_id"]] = slot
+        return len(block)
+
+    def remove_user(self, user_id) -> bool:
+        """Xóa một người dùng khỏi gallery. Trả về False nếu người dùng không có trong gallery."""
+        with self._lock:
+            slot = self._slot_of.pop(user_id, None)
+            if slot is None:
+                return False
+            self._release_slot(slot)
+            self.users[slot] = None
+            self._free_slots.append(slot)
+        return True
+
+    # --- Tìm kiếm ---
+    def user_scores(self, query: np.ndarray) -> np.ndarray:
+        """
+        Điểm cosine cao nhất của từng slot người dùng với `query` (đã chuẩn hóa);
+        slot trống có điểm -inf.
+        """
+        size = self.size
+        matrix, owners = self.matrix, self.owners
+        scores = matrix[:size] @ np.asarray(query, dtype=EMBEDDING_DTYPE)
+        # Phần tử cuối là "thùng rác" cho các hàng trống (owner = -1 trỏ tới nó)
+        best = np.full(len(self.users) + 1, -np.inf, dtype=EMBEDDING_DTYPE)
+        np.maximum.at(best, owners[:size], scores)
+        return best[:-1]
+
+    def memory_stats(self) -> dict:
+        """Dung lượng ma trận float32 (thường trú hay trên tệp ánh xạ) và của chỉ mục/bản nén."""
+        index_bytes = getattr(self.index, "nbytes", None)
+        return {
+            "matrix_bytes": int(self.matrix.nbytes),
+            "matrix_memmap": isinstance(self.matrix, np.memmap),
+            "index_bytes": int(index_bytes) if index_bytes is not None else None,
+        }
+
+    def build_index(self, index) -> None:
+        """
+        Xây chỉ mục ANN trên ma trận hiện tại. `index` cần có `build(matrix, rows)`,
+        `candidates(query)`, `add(rows, vectors)` và `remove(rows)`.
+        """
+        with self._lock:
+            rows = np.flatnonzero(self.owners[:self.size] != FREE_ROW)
+            if len(rows) or getattr(index, "supports_empty", False):
+                self.index = index.build(self.matrix[rows], rows)
+            else:
+                self.index = None
+
+    def search_topk(self, query: np.ndarray, k: int = 1) -> list:
+        """
+        Top-k người dùng khớp nhất với `query`, mỗi phần tử là (user_info, similarity, distance).
+        Khi có chỉ mục ANN, các ứng viên của nó được chấm điểm lại chính xác bằng float32.
+        """
+        if not self._slot_of:
+            return []
+        query = np.asarray(query, dtype=EMBEDDING_DTYPE)
+        index = self.index
+        if index is not None:
+            rows = index.candidates(query)
+            owners = self.owners[rows]
+            live = owners != FREE_ROW
+            rows, owners = rows[live], owners[live]
+            if len(rows) == 0:
+                return []
+            scores = self.matrix[rows] @ query
+            # Giữ hàng có điểm cao nhất của mỗi người dùng trong tập ứng viên
+            order = np.argsort(-scores, kind="stable")
+            _, first = np.unique(owners[order], return_index=True)
+            top = order[np.sort(first)[:k]]
+            slots, sims = owners[top], scores[top]
+        else:
+            per_user = self.user_scores(query)
+            k = min(k, len(self._slot_of))
+            top = np.argpartition(-per_user, k - 1)[:k]
+            slots = top[np.argsort(-per_user[top], kind="stable")]
+            sims = per_user[slots]
+        users = self.users
+        dists = euclidean_from_cosine(sims)
+        return [(users[s], float(v), float(d)) for s, v, d in zip(slots, sims, dists) if users[s] is not None]
+
+    def search(self, query: np.ndarray):
+        """
+        Tìm người dùng khớp nhất với `query`.
+        Trả về (user_info, similarity, distance) hoặc None nếu không có ứng viên.
+        """
+        matches = self.search_topk(query, k=1)
+        return matches[0] if matches else None
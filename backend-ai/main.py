@@ -2,19 +2,46 @@ import cv2
 import numpy as np
 import tensorflow as tf
 from deepface import DeepFace
-from mtcnn import MTCNN
 from fastapi import FastAPI, Depends, HTTPException, Form, File, UploadFile, status 
+from fastapi import Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, Text, TIMESTAMP, ForeignKey
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy import create_engine, Column, Integer, String, Text, TIMESTAMP, ForeignKey, LargeBinary
+from sqlalchemy.sql import func
 from sqlalchemy.orm import sessionmaker, declarative_base, relationship, Session
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import deque
+from itertools import groupby
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import asyncio
 import json
 import base64
+import fcntl
 import math
 import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
 import uuid
+import zipfile
+
+from gallery import FREE_ROW, FaceGallery, MemmapStorage
+from ann_index import IVFFlatIndex
+from quantized import QUANTIZATION_MODES, QuantizedIndex
+from sessions import SessionStore, RecognitionSession, DEFAULT_KIOSK_ID
+from detectors import create_detector, detect_downscaled
+from tracking import TrackingStats
+from embedding_lru import EmbeddingLRU, content_hash, dhash, face_thumbnail, thumbnail_difference
+from enrollment import iter_photo_sources, resolve_member_code
+from compaction import compact_embeddings
+from calibration import calibrate, sample_users
+from changelog import ChangeCursor
+from snapshot import clear_current_snapshot, current_snapshot_name, load_snapshot, save_snapshot, snapshot_lock
+from metrics import (CACHE_VERSION, FRAME_SECONDS, GALLERY_EMBEDDINGS, GALLERY_USERS, INFERENCE_BATCH_SECONDS,
+                     record_cache_reload, record_status, render as render_metrics, stage_timer)
 
 # --- Cấu hình GPU TensorFlow ---
 gpus = tf.config.list_physical_devices('GPU')
@@ -41,16 +68,40 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     member_code = Column(String(50), unique=True, nullable=False)
     full_name = Column(String(255), nullable=False)
-    face_embeddings = relationship("FaceEmbedding", back_populates="user", uselist=False)
+    face_embeddings = relationship("FaceEmbedding", back_populates="user")
     attendance_sessions = relationship("AttendanceSession", back_populates="user")
 
 class FaceEmbedding(Base):
     __tablename__ = 'face_embeddings'
+    # Mỗi hàng là MỘT embedding float32 little-endian đóng gói nhị phân
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), unique=True)
-    embedding = Column(Text)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    embedding = Column(LargeBinary, nullable=False)
+    model_name = Column(String(50), nullable=False, default="ArcFace")
+    # Phiên bản mô hình + tiền xử lý đã tạo embedding; chỉ embedding cùng phiên bản mới so sánh được
+    pipeline_version = Column(String(50), nullable=False, default="arcface-v1", server_default="arcface-v1", index=True)
+    photo_path = Column(String(255), nullable=True) # Ảnh gốc trong UPLOAD_DIR, dùng để tính lại embedding (reembed.py)
+    # "sample": embedding của một ảnh; "centroid": hàng do thu gọn tạo ra (xem compact_user)
+    kind = Column(String(16), nullable=False, default="sample", server_default="sample")
+    created_at = Column(TIMESTAMP, server_default=func.now())
     user = relationship("User", back_populates="face_embeddings")
 
+class GallerySetting(Base):
+    __tablename__ = 'gallery_settings'
+    # Cặp khóa-giá trị dùng chung giữa các tiến trình: phiên bản gallery đang kích hoạt, ngưỡng đã hiệu chỉnh,
+    # checkpoint của reembed.py
+    key = Column(String(100), primary_key=True)
+    value = Column(Text, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+class EmbeddingChange(Base):
+    __tablename__ = 'embedding_changes'
+    # Nhật ký thay đổi gallery, ghi cùng giao dịch với thay đổi người dùng/embedding (xem changelog.py)
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=False) # Không dùng khóa ngoại: hàng "delete" giữ lại sau khi xóa người dùng
+    change_type = Column(String(20), nullable=False) # "upsert" hoặc "delete"
+    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+
 class AttendanceSession(Base):
     __tablename__ = 'attendance_sessions'
     id = Column(Integer, primary_key=True, index=True)
@@ -65,9 +116,12 @@ Base.metadata.create_all(bind=engine)
 # --- Pydantic Schema ---
 class FrameRequest(BaseModel):
     frame: str
+    kiosk_id: str = DEFAULT_KIOSK_ID
+    return_frame: bool = False # True: trả thêm ảnh đã vẽ hộp khuôn mặt (final_frame)
 
 class ConfirmAttendanceRequest(BaseModel):
     member_code: str
+    kiosk_id: str = DEFAULT_KIOSK_ID
 
 class UpdateExitTimeRequest(BaseModel):
     member_code: str
@@ -77,68 +131,228 @@ class FaceRecognitionResponse(BaseModel):
     full_name: str | None
     similarity: float | None
     distance: float | None
-    final_frame: str | None
+    final_frame: str | None = None
+    facial_area: dict[str, int] | None = None # Hộp khuôn mặt {x, y, w, h} trên khung hình gửi lên
 
 # --- Trạng thái toàn cục ---
-frame_queue = deque(maxlen=5)
-best_member_code = None
-recognition_time = None
 embedding_cache = None
 cache_version = 0
-detector = MTCNN()
+# user_id -> (số embedding, id embedding lớn nhất) trong DB ứng với dữ liệu đang có trong gallery
+gallery_versions = {}
+# Các gauge đọc trạng thái hiện tại mỗi lần Prometheus lấy số đo
+GALLERY_USERS.set_function(lambda: len(embedding_cache) if embedding_cache is not None else 0)
+GALLERY_EMBEDDINGS.set_function(lambda: embedding_cache.num_embeddings if embedding_cache is not None else 0)
+CACHE_VERSION.set_function(lambda: cache_version)
+# Bộ phát hiện khuôn mặt: "mtcnn" (mặc định), "haar" hoặc "yunet" (cần FACE_DETECTOR_MODEL, xem detectors.py)
+FACE_DETECTOR = os.environ.get("FACE_DETECTOR", "mtcnn").lower()
+FACE_DETECTOR_MODEL = os.environ.get("FACE_DETECTOR_MODEL", "")
+detector = create_detector(FACE_DETECTOR, FACE_DETECTOR_MODEL)
+# Phát hiện trên bản thu nhỏ có cạnh dài nhất <= DETECTION_MAX_SIDE (0 = dùng ảnh gốc);
+# vùng khuôn mặt vẫn được cắt và căn chỉnh từ ảnh gốc độ phân giải đầy đủ
+DETECTION_MAX_SIDE = int(os.environ.get("DETECTION_MAX_SIDE", "640"))
+
+# --- Cấu hình theo dõi khuôn mặt giữa các khung hình của cùng kiosk (xem tracking.py) ---
+FACE_TRACKING = os.environ.get("FACE_TRACKING", "1").lower() in ("1", "true", "yes")
+TRACK_REDETECT_EVERY = int(os.environ.get("TRACK_REDETECT_EVERY", "5")) # Chạy bộ phát hiện đầy đủ mỗi N khung hình
+TRACK_MIN_SCORE = float(os.environ.get("TRACK_MIN_SCORE", "0.7")) # Điểm khớp mẫu thấp hơn thì phát hiện lại
+tracking_stats = TrackingStats()
+print(f"DEBUG: Sử dụng bộ phát hiện khuôn mặt '{FACE_DETECTOR}'")
 UPLOAD_DIR = "uploaded_photos"
+EMBEDDING_MODEL_NAME = "ArcFace"
+# Phiên bản pipeline tạo embedding (mô hình + preprocess_image). PHẢI đổi khi thay mô hình hoặc
+# tiền xử lý (CLAHE, lề cắt, kích thước, căn chỉnh...), rồi chạy reembed.py để tính lại gallery.
+PIPELINE_VERSION = "arcface-v1"
+# Con trỏ phiên bản gallery đang kích hoạt (gallery_settings, do reembed.py --activate chuyển). Dịch
+# vụ chỉ nhận diện khi con trỏ trùng PIPELINE_VERSION của mã; ngược lại từ chối khung hình, nên
+# chuyển con trỏ là chuyển bản triển khai nào phục vụ (và chuyển về để quay lui)
+ACTIVE_PIPELINE_KEY = "active_pipeline_version"
+active_gallery_version = None # Giá trị con trỏ đọc gần nhất (None = chưa đọc, ví dụ benchmark)
+EMBEDDING_DTYPE = np.dtype("<f4")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
-# --- Ngưỡng cho nhận diện (SẼ ĐƯỢC CẬP NHẬT TỰ ĐỘNG KHI KHỞI ĐỘNG ỨNG DỤNG) ---
+# --- Ngưỡng cho nhận diện ---
+# Giá trị mặc định. Khi THRESHOLD_CALIBRATION=apply, lượt hiệu chỉnh chạy nền lúc khởi động
+# (calibration.py) thay bằng ngưỡng khuyến nghị nếu gallery đủ dữ liệu; xem GET /calibration.
 COSINE_SIMILARITY_THRESHOLD = 0.75
 EUCLIDEAN_DISTANCE_THRESHOLD = 0.85
+# Ngưỡng đã áp dụng được lưu trong gallery_settings (theo phiên bản pipeline, vì ngưỡng phụ thuộc
+# mô hình) và mọi worker/bản sao đọc lại khi khởi động và mỗi lượt đọc nhật ký thay đổi
+THRESHOLDS_KEY = f"recognition_thresholds:{PIPELINE_VERSION}"
+# "off": không hiệu chỉnh; "report": chỉ tính báo cáo FAR/FRR; "apply": tính và áp dụng ngưỡng khuyến nghị.
+# Mặc định "off": tích ma trận chạy trên các luồng BLAS, tranh CPU với khung hình kiosk mà không hạ
+# ưu tiên được từ trong tiến trình. Nên chạy `nice python calibrate.py --apply` ở tiến trình riêng.
+# Với GALLERY_SHARED chỉ một worker hiệu chỉnh lúc khởi động.
+THRESHOLD_CALIBRATION = os.environ.get("THRESHOLD_CALIBRATION", "off").lower()
+CALIBRATION_TARGET_FAR = float(os.environ.get("CALIBRATION_TARGET_FAR", "0.0001")) # FAR theo cặp embedding
+CALIBRATION_MAX_ROWS = int(os.environ.get("CALIBRATION_MAX_ROWS", "20000")) # Gallery lớn hơn thì lấy mẫu người dùng
+CALIBRATION_BLOCK_ROWS = 1024 # Khối tích ma trận: bộ nhớ tạm ~ 1024 x 1024 float32
+CALIBRATION_MIN_GENUINE_PAIRS = 100
+
+# --- Cấu hình chỉ mục tìm kiếm gallery ---
+# "brute": quét toàn bộ ma trận; "ivf": chỉ mục IVF-flat (xem ann_index.py), ứng viên được chấm điểm lại chính xác
+GALLERY_INDEX = os.environ.get("GALLERY_INDEX", "brute").lower()
+IVF_NLIST = int(os.environ.get("IVF_NLIST", "0"))  # 0 = tự chọn theo kích thước gallery (~4*sqrt(N))
+IVF_NPROBE = int(os.environ.get("IVF_NPROBE", "16"))
+# Gallery nhỏ hơn ngưỡng này vẫn quét toàn bộ vì nhanh hơn và chính xác tuyệt đối
+ANN_MIN_EMBEDDINGS = int(os.environ.get("ANN_MIN_EMBEDDINGS", "20000"))
+# Lượt chấm điểm thứ nhất trên bản nén "int8" (xem quantized.py), "none" = tắt. Khi bật, ma trận
+# float32 dùng để chấm điểm lại nằm trên tệp ánh xạ bộ nhớ trong GALLERY_MEMMAP_DIR
+GALLERY_QUANTIZATION = os.environ.get("GALLERY_QUANTIZATION", "none").lower()
+if GALLERY_QUANTIZATION not in ("none",) + QUANTIZATION_MODES:
+    raise ValueError(f"GALLERY_QUANTIZATION không hợp lệ: '{GALLERY_QUANTIZATION}' "
+                     f"(chọn một trong none, {', '.join(QUANTIZATION_MODES)})")
+GALLERY_MEMMAP_DIR = os.environ.get("GALLERY_MEMMAP_DIR", "") # Trống = thư mục tạm của hệ thống
+# Snapshot nhị phân của gallery (snapshot.py): khởi động bằng ánh xạ snapshot + bắt kịp DB thay vì
+# tải lại toàn bộ embedding từ MySQL. Trống (mặc định) = tắt; đặt một thư mục trên volume
+# riêng (ví dụ /data/gallery_snapshot) để bật.
+GALLERY_SNAPSHOT_DIR = os.environ.get("GALLERY_SNAPSHOT_DIR", "")
+# Nhiều worker uvicorn (`uvicorn main:app --workers N`) dùng chung một gallery: mỗi thay đổi được
+# công bố thành một snapshot mới ("thế hệ") trong GALLERY_SNAPSHOT_DIR, các worker ánh xạ chỉ đọc
+# và chuyển sang thế hệ mới trong vòng GALLERY_POLL_S giây. Chỉ mục IVF / bản nén vẫn của từng worker.
+# Cần GALLERY_SNAPSHOT_DIR.
+GALLERY_SHARED = os.environ.get("GALLERY_SHARED", "0").lower() in ("1", "true", "yes")
+if GALLERY_SHARED and not GALLERY_SNAPSHOT_DIR:
+    print("Cảnh báo: GALLERY_SHARED cần GALLERY_SNAPSHOT_DIR; mỗi worker sẽ giữ gallery riêng.")
+    GALLERY_SHARED = False
+GALLERY_POLL_S = float(os.environ.get("GALLERY_POLL_S", "1"))
+# Mỗi bản sao đọc nhật ký embedding_changes mỗi CHANGE_LOG_POLL_S giây và chỉ bắt kịp những người
+# dùng đã thay đổi (0 = tắt, khi đó chỉ cập nhật qua /gallery/users và /reload-embedding-cache)
+CHANGE_LOG_POLL_S = float(os.environ.get("CHANGE_LOG_POLL_S", "1"))
+CHANGE_LOG_BATCH = 1000 # Số hàng nhật ký tối đa mỗi lần đọc
+CHANGE_LOG_RETENTION_DAYS = float(os.environ.get("CHANGE_LOG_RETENTION_DAYS", "7"))
+
+# --- Cấu hình gom lô suy luận ArcFace ---
+# Khuôn mặt từ các request đồng thời được gom thành một lô; lô được chạy khi đủ
+# INFERENCE_MAX_BATCH khuôn mặt hoặc khi khuôn mặt đầu tiên đã chờ INFERENCE_MAX_WAIT_MS.
+INFERENCE_MAX_BATCH = int(os.environ.get("INFERENCE_MAX_BATCH", "16"))
+INFERENCE_MAX_WAIT_MS = float(os.environ.get("INFERENCE_MAX_WAIT_MS", "5"))
+
+# --- Cache embedding đã tính (xem embedding_lru.py) ---
+# Khóa theo dHash của khuôn mặt đã căn chỉnh và theo SHA-1 của ảnh tải lên; 0 mục = tắt cache
+EMBED_CACHE_SIZE = int(os.environ.get("EMBED_CACHE_SIZE", "2048"))
+EMBED_CACHE_TTL_S = float(os.environ.get("EMBED_CACHE_TTL_S", "600"))
+# Lượt trúng theo dHash chỉ được dùng khi ảnh thu nhỏ 32x32 của khuôn mặt chênh lệch trung bình
+# không quá ngưỡng này (0..255) so với ảnh của mục đã lưu; lớn hơn thì tính lại embedding
+EMBED_CACHE_MAX_PIXEL_DIFF = float(os.environ.get("EMBED_CACHE_MAX_PIXEL_DIFF", "6"))
+face_embedding_cache = EmbeddingLRU(max_entries=EMBED_CACHE_SIZE, ttl_seconds=EMBED_CACHE_TTL_S)
+upload_embedding_cache = EmbeddingLRU(max_entries=EMBED_CACHE_SIZE, ttl_seconds=EMBED_CACHE_TTL_S)
+
+# --- Thu gọn gallery theo người dùng (xem compaction.py) ---
+# Sau khi đăng ký thêm ảnh, người dùng có nhiều hơn COMPACT_MAX_EMBEDDINGS embedding được thu gọn
+# còn centroid + COMPACT_MEDOIDS medoid (0 = không tự động thu gọn, vẫn gọi được /gallery/compact)
+COMPACT_MAX_EMBEDDINGS = int(os.environ.get("COMPACT_MAX_EMBEDDINGS", "10"))
+COMPACT_MEDOIDS = int(os.environ.get("COMPACT_MEDOIDS", "4"))
+COMPACT_OUTLIER_MIN_SIMILARITY = float(os.environ.get("COMPACT_OUTLIER_MIN_SIMILARITY", "0.3"))
+EMBEDDING_KIND_SAMPLE = "sample" # Cột face_embeddings.kind: embedding của một ảnh thật
+EMBEDDING_KIND_CENTROID = "centroid" # Centroid do thu gọn tạo ra (không có ảnh gốc)
+
+# --- Cấu hình luồng xử lý khung hình ---
+# Phát hiện + ArcFace + OpenCV chạy trên FRAME_WORKERS luồng riêng, không chặn event loop.
+# Tối đa FRAME_QUEUE_SIZE việc được chờ; vượt quá thì trả 429 ngay kèm Retry-After.
+FRAME_WORKERS = int(os.environ.get("FRAME_WORKERS", "4"))
+FRAME_QUEUE_SIZE = int(os.environ.get("FRAME_QUEUE_SIZE", "8"))
+# Khung hình đã chờ lâu hơn ngưỡng này thì bị bỏ (kiosk đã gửi khung hình mới hơn)
+FRAME_MAX_WAIT_MS = float(os.environ.get("FRAME_MAX_WAIT_MS", "1000"))
+
+# --- Đăng ký khuôn mặt hàng loạt ---
+# Phát hiện khuôn mặt chạy trên BULK_ENROLL_WORKERS luồng riêng (không chiếm worker của kiosk).
+# Ảnh được xử lý theo từng cửa sổ BULK_ENROLL_COMMIT_SIZE ảnh (tối đa bấy nhiêu khuôn mặt chờ
+# suy luận trong bộ nhớ), embedding của mỗi cửa sổ được ghi vào DB trong một giao dịch
+BULK_ENROLL_WORKERS = int(os.environ.get("BULK_ENROLL_WORKERS", "2"))
+BULK_ENROLL_COMMIT_SIZE = int(os.environ.get("BULK_ENROLL_COMMIT_SIZE", "500"))
+BULK_ENROLL_PROGRESS_EVERY = 50 # Gửi sự kiện tiến độ mỗi N ảnh
+
+# --- Phiên nhận diện theo kiosk ---
+# Phiên không hoạt động quá KIOSK_SESSION_TTL_S giây bị loại; giữ tối đa KIOSK_SESSION_MAX phiên
+KIOSK_SESSION_TTL_S = float(os.environ.get("KIOSK_SESSION_TTL_S", "300"))
+KIOSK_SESSION_MAX = int(os.environ.get("KIOSK_SESSION_MAX", "1000"))
+# Thư mục trạng thái bỏ phiếu dùng chung giữa các worker (nên đặt trên tmpfs, ví dụ
+# /dev/shm/face-kiosk-sessions); trống = mỗi worker giữ phiên trong bộ nhớ của mình
+KIOSK_SESSION_DIR = os.environ.get("KIOSK_SESSION_DIR", "")
+CONFIRM_WINDOW_S = 30 # Thời gian tối đa từ lúc nhận diện đến lúc xác nhận điểm danh
+kiosk_sessions = SessionStore(ttl_seconds=max(KIOSK_SESSION_TTL_S, CONFIRM_WINDOW_S), max_sessions=KIOSK_SESSION_MAX,
+                              shared_dir=KIOSK_SESSION_DIR)
 
 # --- Hàm tiền xử lý ảnh ---
-def preprocess_image(img):
+def detect_face(img):
+    """Phát hiện đúng một khuôn mặt trong ảnh. Trả về (face, error)."""
+    with stage_timer("detect"):
+        faces = detect_downscaled(detector, img, DETECTION_MAX_SIDE)
+    if not faces:
+        return None, "Không phát hiện khuôn mặt"
+    if len(faces)>=2:
+        return None, "Có nhiều khuôn mặt"
+    # Luôn chọn khuôn mặt lớn nhất để đảm bảo chất lượng
+    return max(faces, key=lambda f: f['box'][2] * f['box'][3]), None
+
+def locate_face(img, session: RecognitionSession):
+    """
+    Tìm khuôn mặt trong khung hình của một kiosk: theo dõi bằng template matching từ
+    khung hình trước nếu có thể, chỉ chạy bộ phát hiện mỗi TRACK_REDETECT_EVERY khung
+    hình hoặc khi điểm theo dõi thấp hơn TRACK_MIN_SCORE. Trả về (face, error).
+    """
+    tracker = session.tracker
+    with session.lock:
+        if tracker.active and tracker.frames_since_detection < TRACK_REDETECT_EVERY - 1:
+            with stage_timer("track"):
+                face, score = tracker.track(img)
+            if face is not None and score >= TRACK_MIN_SCORE:
+                tracking_stats.record("tracked")
+                return face, None
+            tracking_stats.record("lost")
+
+    face, error = detect_face(img)
+    tracking_stats.record("detections")
+    with session.lock:
+        if error:
+            tracker.reset()
+        else:
+            tracker.start(img, face)
+    return face, error
+
+def preprocess_image(img, session: RecognitionSession | None = None):
     try:
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        faces = detector.detect_faces(img_rgb)
-        if not faces:
-            return None, None, "Không phát hiện khuôn mặt"
-        if len(faces)>=2:
-            return None, None, "Có nhiều khuôn mặt"
-        # Luôn chọn khuôn mặt lớn nhất để đảm bảo chất lượng
-        largest_face = max(faces, key=lambda f: f['box'][2] * f['box'][3])
-        face = largest_face
-
-        x, y, w, h = face['box']
-        landmarks = face['keypoints']
-        margin = int(max(w, h) * 0.1)
-        x_m, y_m = max(0, x - margin), max(0, y - margin)
-        w_m, h_m = w + 2 * margin, h + 2 * margin
-        face_img = img[y_m:y_m + h_m, x_m:x_m + w_m]
-
-        if face_img.size == 0:
-            return None, None, "Vùng khuôn mặt không hợp lệ"
-
-        left_eye = landmarks['left_eye']
-        right_eye = landmarks['right_eye']
-        dx = right_eye[0] - left_eye[0]
-        dy = right_eye[1] - left_eye[1]
-
-        if dx == 0:
-            angle = 0
+        if session is not None and FACE_TRACKING:
+            face, error = locate_face(img, session)
         else:
-            angle = math.degrees(math.atan2(dy, dx))
-            if angle > 90:
-                angle -= 180
-            elif angle < -90:
-                angle += 180
-
-        M = cv2.getRotationMatrix2D((w_m // 2, h_m // 2), angle, 1)
-        aligned_img = cv2.warpAffine(face_img, M, (w_m, h_m))
-        resized_img = cv2.resize(aligned_img, (224, 224), interpolation=cv2.INTER_AREA)
-
-        gray_img = cv2.cvtColor(resized_img, cv2.COLOR_BGR2GRAY)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        clahe_img = clahe.apply(gray_img)
-        final_img = cv2.cvtColor(clahe_img, cv2.COLOR_GRAY2BGR)
-
-        return final_img, {'x': x_m, 'y': y_m, 'w': w_m, 'h': h_m}, None
+            face, error = detect_face(img)
+        if error:
+            return None, None, error
+
+        with stage_timer("align"):
+            x, y, w, h = face['box']
+            landmarks = face['keypoints']
+            margin = int(max(w, h) * 0.1)
+            x_m, y_m = max(0, x - margin), max(0, y - margin)
+            w_m, h_m = w + 2 * margin, h + 2 * margin
+            face_img = img[y_m:y_m + h_m, x_m:x_m + w_m]
+
+            if face_img.size == 0:
+                return None, None, "Vùng khuôn mặt không hợp lệ"
+
+            left_eye = landmarks['left_eye']
+            right_eye = landmarks['right_eye']
+            dx = right_eye[0] - left_eye[0]
+            dy = right_eye[1] - left_eye[1]
+
+            if dx == 0:
+                angle = 0
+            else:
+                angle = math.degrees(math.atan2(dy, dx))
+                if angle > 90:
+                    angle -= 180
+                elif angle < -90:
+                    angle += 180
+
+            M = cv2.getRotationMatrix2D((w_m // 2, h_m // 2), angle, 1)
+            aligned_img = cv2.warpAffine(face_img, M, (w_m, h_m))
+            resized_img = cv2.resize(aligned_img, (224, 224), interpolation=cv2.INTER_AREA)
+
+            gray_img = cv2.cvtColor(resized_img, cv2.COLOR_BGR2GRAY)
+            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            clahe_img = clahe.apply(gray_img)
+            final_img = cv2.cvtColor(clahe_img, cv2.COLOR_GRAY2BGR)
+
+            return final_img, {'x': x_m, 'y': y_m, 'w': w_m, 'h': h_m}, None
     except Exception as e:
         return None, None, f"Lỗi tiền xử lý: {str(e)}"
 
@@ -150,207 +364,1188 @@ def get_db():
     finally:
         db.close()
 
-def extract_embedding(img):
-    preprocessed_img, facial_area, error = preprocess_image(img)
+# --- Mô hình ArcFace thường trú ---
+# Mô hình được tải MỘT lần khi khởi động và giữ trong bộ nhớ; mỗi khung hình gọi trực tiếp
+# mô hình Keras trên tensor đã tiền xử lý thay vì DeepFace.represent + clear_session.
+arcface_model = None
+arcface_input_size = (112, 112)
+
+def load_arcface_model():
+    """Tải ArcFace một lần và chạy một lượt suy luận giả để khởi tạo đồ thị (warm-up)."""
+    global arcface_model, arcface_input_size
+    if arcface_model is not None:
+        return arcface_model
+    client = DeepFace.build_model(model_name=EMBEDDING_MODEL_NAME)
+    # DeepFace mới trả về client bọc mô hình Keras (thuộc tính .model), bản cũ trả về mô hình Keras
+    model = getattr(client, "model", client)
+    arcface_input_size = tuple(int(v) for v in model.input_shape[1:3])
+    model(np.zeros((1, *arcface_input_size, 3), dtype=np.float32), training=False)
+    arcface_model = model
+    print(f"DEBUG: Đã tải và khởi động mô hình {EMBEDDING_MODEL_NAME}, đầu vào {arcface_input_size}")
+    return arcface_model
+
+def to_arcface_tensor(face_bgr: np.ndarray) -> np.ndarray:
+    """
+    Chuẩn bị ảnh khuôn mặt BGR uint8 (đầu ra của preprocess_image) cho ArcFace, giống
+    DeepFace.represent(detector_backend="skip"): BGR -> RGB, resize về kích thước đầu vào,
+    chia 255. Trả về mảng (H, W, 3) float32.
+    """
+    face_rgb = face_bgr[:, :, ::-1]
+    height, width = arcface_input_size
+    if face_rgb.shape[:2] != (height, width):
+        face_rgb = cv2.resize(face_rgb, (width, height))
+    return face_rgb.astype(np.float32) / 255.0
+
+def embed_faces(faces: list) -> np.ndarray:
+    """Chạy ArcFace trên một batch khuôn mặt đã tiền xử lý; trả về ma trận embedding đã chuẩn hóa L2."""
+    model = load_arcface_model()
+    batch = np.stack([to_arcface_tensor(face) for face in faces])
+    embeddings = np.asarray(model(batch, training=False), dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.where(norms > 0, norms, 1)
+
+# --- Bộ lập lịch suy luận theo lô ---
+class InferenceBatcher:
+    """
+    Gom khuôn mặt đã tiền xử lý từ nhiều request đồng thời thành một lô và chạy MỘT
+    lượt ArcFace cho cả lô. Mỗi request nhận lại embedding của mình qua một Future.
+
+    Một luồng nền duy nhất lấy khuôn mặt từ hàng đợi: lô được chạy khi đủ `max_batch`
+    khuôn mặt hoặc khi khuôn mặt đầu tiên của lô đã chờ `max_wait_ms`. Chỉ luồng này
+    gọi mô hình nên không có hai lượt suy luận TensorFlow chạy chồng lên nhau.
+    """
+
+    def __init__(self, infer_fn, max_batch: int = 16, max_wait_ms: float = 5.0):
+        self.infer_fn = infer_fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._faces = 0
+        self._batch_sizes = {}
+        self._recent_sizes = deque(maxlen=100)
+        self._infer_seconds = 0.0
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="inference-batcher", daemon=True)
+                self._thread.start()
+
+    def submit(self, face: np.ndarray) -> Future:
+        """Đưa một khuôn mặt vào hàng đợi; Future trả về embedding đã chuẩn hóa L2."""
+        if self._thread is None:
+            self.start()
+        future = Future()
+        self._queue.put((face, future))
+        return future
+
+    def embed(self, faces: list) -> list:
+        """Gửi nhiều khuôn mặt cùng lúc (có thể chung một lô) và chờ toàn bộ embedding."""
+        futures = [self.submit(face) for face in faces]
+        return [f.result() for f in futures]
+
+    def _collect(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = [(face, f) for face, f in self._collect() if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            start = time.perf_counter()
+            try:
+                embeddings = self.infer_fn([face for face, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            elapsed = time.perf_counter() - start
+            INFERENCE_BATCH_SECONDS.observe(elapsed)
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+            with self._stats_lock:
+                self._batches += 1
+                self._faces += len(batch)
+                self._batch_sizes[len(batch)] = self._batch_sizes.get(len(batch), 0) + 1
+                self._recent_sizes.append(len(batch))
+                self._infer_seconds += elapsed
+
+    def stats(self) -> dict:
+        """Thống kê độ lấp đầy lô (occupancy = số khuôn mặt trung bình / max_batch)."""
+        with self._stats_lock:
+            mean_size = self._faces / self._batches if self._batches else 0.0
+            recent = list(self._recent_sizes)
+            return {
+                "max_batch": self.max_batch,
+                "max_wait_ms": self.max_wait * 1000.0,
+                "pending": self._queue.qsize(),
+                "batches": self._batches,
+                "faces": self._faces,
+                "mean_batch_size": mean_size,
+                "mean_occupancy": mean_size / self.max_batch,
+                "recent_occupancy": (sum(recent) / len(recent) / self.max_batch) if recent else 0.0,
+                "batch_size_histogram": dict(sorted(self._batch_sizes.items())),
+                "mean_batch_ms": (self._infer_seconds / self._batches * 1000.0) if self._batches else 0.0,
+            }
+
+inference_batcher = InferenceBatcher(embed_faces, max_batch=INFERENCE_MAX_BATCH, max_wait_ms=INFERENCE_MAX_WAIT_MS)
+
+# --- Thực thi tác vụ CPU ngoài event loop ---
+class QueueFullError(Exception):
+    """Hàng đợi xử lý đã đầy hoặc khung hình đã quá hạn; `retry_after` tính bằng giây."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class BoundedExecutor:
+    """
+    ThreadPoolExecutor với giới hạn tiếp nhận: tối đa `workers` việc đang chạy và
+    `queue_size` việc đang chờ. Việc vượt giới hạn bị từ chối ngay (QueueFullError)
+    thay vì xếp hàng vô hạn; việc đã chờ quá `max_wait_ms` bị bỏ khi đến lượt.
+    """
+
+    def __init__(self, workers: int = 4, queue_size: int = 8):
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="frame-worker")
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._stale = 0
+        self._recent_waits = deque(maxlen=200)
+        self._recent_runs = deque(maxlen=200)
+
+    def retry_after(self) -> int:
+        """Ước lượng số giây đến khi hàng đợi vơi bớt (tối thiểu 1 giây)."""
+        with self._lock:
+            runs = list(self._recent_runs)
+            backlog = self._queued + self._running
+        mean_run = sum(runs) / len(runs) if runs else 0.5
+        return max(1, math.ceil(backlog * mean_run / self.workers))
+
+    async def run(self, fn, *args, max_wait_ms: float | None = None):
+        """Chạy `fn(*args)` trên luồng worker và chờ kết quả mà không chặn event loop."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise QueueFullError("Máy chủ đang bận, vui lòng thử lại sau", self.retry_after())
+        with self._lock:
+            self._queued += 1
+        try:
+            future = self._executor.submit(self._call, time.monotonic(), max_wait_ms, fn, args)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+        return await asyncio.wrap_future(future)
+
+    def _call(self, enqueued_at, max_wait_ms, fn, args):
+        waited = time.monotonic() - enqueued_at
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._recent_waits.append(waited)
+        try:
+            if max_wait_ms is not None and waited * 1000 > max_wait_ms:
+                with self._lock:
+                    self._stale += 1
+                raise QueueFullError("Khung hình đã quá hạn trong hàng đợi", self.retry_after())
+            start = time.perf_counter()
+            result = fn(*args)
+            with self._lock:
+                self._recent_runs.append(time.perf_counter() - start)
+                self._completed += 1
+            return result
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            runs = list(self._recent_runs)
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queue_depth": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "stale_dropped": self._stale,
+                "mean_wait_ms": (sum(waits) / len(waits) * 1000) if waits else 0.0,
+                "p95_wait_ms": (waits[math.ceil(0.95 * len(waits)) - 1] * 1000) if waits else 0.0,
+                "mean_run_ms": (sum(runs) / len(runs) * 1000) if runs else 0.0,
+            }
+
+frame_executor = BoundedExecutor(workers=FRAME_WORKERS, queue_size=FRAME_QUEUE_SIZE)
+
+def embed_cached(faces: list, scope: str = "") -> list:
+    """
+    Embedding của các khuôn mặt đã căn chỉnh: lấy từ cache theo `scope` (kiosk) + dHash nếu có
+    và ảnh thu nhỏ đủ giống, các khuôn mặt còn lại được gửi cùng lúc cho InferenceBatcher (chung
+    một lô) rồi lưu vào cache.
+    """
+    if not face_embedding_cache.enabled:
+        return list(inference_batcher.embed(faces))
+    prefix = scope.encode()
+    keys = [prefix + dhash(face) for face in faces]
+    thumbnails = [face_thumbnail(face) for face in faces]
+    embeddings = []
+    for key, thumbnail in zip(keys, thumbnails):
+        hit = face_embedding_cache.get(
+            key, validate=lambda entry: thumbnail_difference(entry[0], thumbnail) <= EMBED_CACHE_MAX_PIXEL_DIFF)
+        embeddings.append(hit[1] if hit is not None else None)
+    missing = [i for i, e in enumerate(embeddings) if e is None]
+    if missing:
+        for i, embedding in zip(missing, inference_batcher.embed([faces[i] for i in missing])):
+            embedding.setflags(write=False) # Embedding trong cache được dùng chung, không được sửa
+            face_embedding_cache.put(keys[i], (thumbnails[i], embedding))
+            embeddings[i] = embedding
+    return embeddings
+
+def extract_embedding(img, session: RecognitionSession | None = None):
+    preprocessed_img, facial_area, error = preprocess_image(img, session)
     if error:
-        tf.keras.backend.clear_session()
         return None, None, error
     try:
-        result = DeepFace.represent(preprocessed_img, model_name="ArcFace", detector_backend="skip", enforce_detection=False)[0]
-        tf.keras.backend.clear_session()
-        embedding = np.array(result["embedding"])
-
-        norm = np.linalg.norm(embedding)
-        norm_embedding = embedding / norm if norm > 0 else embedding
-
-        return norm_embedding, facial_area, None
+        with stage_timer("embedding"):
+            scope = session.kiosk_id if session is not None else ""
+            return embed_cached([preprocessed_img], scope)[0], facial_area, None
     except Exception as e:
-        tf.keras.backend.clear_session()
         return None, None, f"Lỗi trích xuất embedding (ArcFace): {str(e)}"
 
+def get_setting(db: Session, key: str, default: str | None = None) -> str | None:
+    row = db.query(GallerySetting.value).filter(GallerySetting.key == key).first()
+    return row[0] if row else default
+
+def set_setting(db: Session, key: str, value: str) -> None:
+    """Ghi một thiết lập. Không commit: người gọi commit cùng giao dịch với các thay đổi khác."""
+    db.merge(GallerySetting(key=key, value=value))
+
+def refresh_active_pipeline(db: Session) -> str:
+    """Đọc lại con trỏ phiên bản gallery đang kích hoạt; ghi log khi dịch vụ bắt đầu/ngừng phục vụ."""
+    global active_gallery_version
+    version = active_pipeline_version(db)
+    if version != active_gallery_version:
+        if version != PIPELINE_VERSION:
+            print(f"Cảnh báo: Gallery đang kích hoạt là phiên bản '{version}' nhưng mã này tạo embedding "
+                  f"phiên bản '{PIPELINE_VERSION}'. Từ chối nhận diện cho tới khi con trỏ trở lại '{PIPELINE_VERSION}'.")
+        elif active_gallery_version is not None:
+            print(f"DEBUG: Con trỏ gallery đã chuyển về '{version}'. Tiếp tục nhận diện.")
+        active_gallery_version = version
+    return version
+
+def refresh_thresholds(db: Session) -> None:
+    """Đọc lại ngưỡng đã hiệu chỉnh (THRESHOLDS_KEY); chưa có thì giữ ngưỡng hiện tại."""
+    global COSINE_SIMILARITY_THRESHOLD, EUCLIDEAN_DISTANCE_THRESHOLD
+    value = get_setting(db, THRESHOLDS_KEY)
+    if value is None:
+        return
+    thresholds = json.loads(value)
+    cosine, euclidean = float(thresholds["cosine"]), float(thresholds["euclidean"])
+    if (cosine, euclidean) != (COSINE_SIMILARITY_THRESHOLD, EUCLIDEAN_DISTANCE_THRESHOLD):
+        print(f"DEBUG: Áp dụng ngưỡng đã hiệu chỉnh: cosine {cosine}, euclidean {euclidean}")
+        COSINE_SIMILARITY_THRESHOLD, EUCLIDEAN_DISTANCE_THRESHOLD = cosine, euclidean
+
+def save_thresholds(cosine: float, euclidean: float) -> None:
+    """Lưu ngưỡng vào gallery_settings và áp dụng ngay cho tiến trình này; worker khác đọc ở lượt poll sau."""
+    db = SessionLocal()
+    try:
+        set_setting(db, THRESHOLDS_KEY, json.dumps({"cosine": cosine, "euclidean": euclidean}))
+        db.commit()
+        refresh_thresholds(db)
+    finally:
+        db.close()
+
+def active_pipeline_version(db: Session) -> str:
+    """Phiên bản gallery đang kích hoạt (do reembed.py chuyển); mặc định là phiên bản của mã hiện tại."""
+    return get_setting(db, ACTIVE_PIPELINE_KEY, PIPELINE_VERSION)
+
+def store_photo(data: bytes, filename: str) -> str:
+    """Lưu nguyên bytes ảnh gốc vào UPLOAD_DIR (để reembed.py tính lại embedding); trả về đường dẫn."""
+    path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4()}_{os.path.basename(filename or 'photo.jpg')}")
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+def _unpack_embeddings(blobs) -> np.ndarray:
+    """Ghép các blob float32 thành ma trận (N, D) bằng một lần np.frombuffer; bỏ blob sai kích thước."""
+    blobs = [b for b in blobs if b]
+    if not blobs:
+        return np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+    row_bytes = len(blobs[0])
+    valid = [b for b in blobs if len(b) == row_bytes]
+    if len(valid) != len(blobs):
+        print(f"Cảnh báo: Bỏ qua {len(blobs) - len(valid)} embedding có kích thước không hợp lệ.")
+    return np.frombuffer(b"".join(valid), dtype=EMBEDDING_DTYPE).reshape(len(valid), -1)
+
+def pack_embedding(vector) -> bytes:
+    return np.asarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+def record_embedding_changes(db: Session, user_ids, change_type: str = "upsert") -> None:
+    """Ghi nhật ký thay đổi cho các người dùng; không commit, người gọi commit cùng giao dịch với thay đổi."""
+    user_ids = sorted(set(user_ids))
+    if user_ids:
+        db.execute(EmbeddingChange.__table__.insert(),
+                   [{"user_id": user_id, "change_type": change_type} for user_id in user_ids])
+
+def build_gallery(entries: list) -> FaceGallery:
+    """
+    Dựng FaceGallery từ danh sách (user, ma trận embedding) theo cấu hình GALLERY_INDEX /
+    GALLERY_QUANTIZATION (dùng chung cho load_embedding_cache và benchmarks/bench_pipeline.py).
+    """
+    # Gộp toàn bộ embedding thành một ma trận float32 liên tục để tìm kiếm vector hóa
+    return attach_index(FaceGallery.from_entries(entries, storage=gallery_storage()))
+
+def gallery_storage() -> MemmapStorage | None:
+    return MemmapStorage(GALLERY_MEMMAP_DIR) if GALLERY_QUANTIZATION != "none" else None
+
+def attach_index(gallery: FaceGallery) -> FaceGallery:
+    """Xây chỉ mục IVF hoặc bản nén cho gallery theo GALLERY_INDEX / GALLERY_QUANTIZATION."""
+    quantized = GALLERY_QUANTIZATION != "none"
+    if GALLERY_INDEX == "ivf" and gallery.num_embeddings >= ANN_MIN_EMBEDDINGS:
+        gallery.build_index(IVFFlatIndex(nlist=IVF_NLIST, nprobe=IVF_NPROBE))
+        print(f"DEBUG: Đã xây chỉ mục IVF với {gallery.index.nlist} cụm, nprobe={IVF_NPROBE}")
+    elif quantized:
+        gallery.build_index(QuantizedIndex(GALLERY_QUANTIZATION))
+        print(f"DEBUG: Đã lượng tử hóa gallery ({GALLERY_QUANTIZATION}, "
+              f"{gallery.memory_stats()['index_bytes']} byte thường trú)")
+    return gallery
+
+def read_gallery_entries(db: Session) -> tuple:
+    """
+    Đọc toàn bộ gallery từ DB: (danh sách (user_info, ma trận embedding), versions) với versions:
+    user_id -> (số embedding, id embedding lớn nhất).
+    """
+    # Chỉ nạp embedding cùng phiên bản pipeline với mã đang chạy: vector của phiên bản khác
+    # không so sánh được với embedding khung hình do mã này tạo ra. Con trỏ khác phiên bản này thì
+    # gallery vẫn được nạp (sẵn sàng khi con trỏ chuyển sang) nhưng khung hình bị từ chối
+    refresh_active_pipeline(db)
+    rows = (db.query(User.id, User.member_code, User.full_name, FaceEmbedding.embedding, FaceEmbedding.id)
+            .join(FaceEmbedding, FaceEmbedding.user_id == User.id)
+            .filter(FaceEmbedding.pipeline_version == PIPELINE_VERSION)
+            .order_by(User.id, FaceEmbedding.id)
+            .yield_per(5000))
+    entries, versions = [], {}
+    for (user_id, member_code, full_name), group in groupby(rows, key=lambda r: (r[0], r[1], r[2])):
+        group = list(group)
+        versions[user_id] = (len(group), group[-1][4])
+        embeddings = _unpack_embeddings([r[3] for r in group])
+        if len(embeddings):
+            entries.append(({"user_id": user_id, "member_code": member_code, "full_name": full_name}, embeddings))
+    return entries, versions
+
 def load_embedding_cache(db: Session):
-    global embedding_cache, cache_version
-    users = db.query(User).all()
-    user_embeddings = []
-    for user in users:
-        if user.face_embeddings and user.face_embeddings.embedding:
-            try:
-                embeddings = json.loads(user.face_embeddings.embedding)
-                valid_embeddings = []
-                for emb in embeddings:
-                    if len(emb) > 0:
-                        np_emb = np.array(emb)
-                        norm = np.linalg.norm(np_emb)
-                        valid_embeddings.append(np_emb / norm if norm > 0 else np_emb)
-
-                if valid_embeddings:
-                    user_embeddings.append({
-                        "user_id": user.id,
-                        "member_code": user.member_code,
-                        "full_name": user.full_name,
-                        "embeddings": valid_embeddings
-                    })
-            except json.JSONDecodeError:
-                continue
-    embedding_cache = user_embeddings
+    global embedding_cache, cache_version, gallery_versions
+    if GALLERY_SHARED:
+        # Nạp lại toàn bộ cho mọi worker: công bố thế hệ mới dựng từ DB
+        publish_gallery(db, full_reload=True)
+        return embedding_cache
+    started = time.perf_counter()
+    entries, versions = read_gallery_entries(db)
+    embedding_cache = build_gallery(entries)
+    gallery_versions = versions
     cache_version += 1
+    record_cache_reload(time.perf_counter() - started)
     print(f"DEBUG: Cache đã được tải lại. Phiên bản mới: {cache_version}") # Debugging
     return embedding_cache
 
-def cosine_similarity(input_embedding: np.ndarray, known_embeddings: np.ndarray) -> np.ndarray:
-    if known_embeddings.ndim == 1:
-        known_embeddings = known_embeddings[np.newaxis, :]
-    input_norm = np.linalg.norm(input_embedding)
-    known_norms = np.linalg.norm(known_embeddings, axis=1)
-    safe_known_norms = np.where(known_norms == 0, 1e-10, known_norms)
-    similarities = np.dot(known_embeddings, input_embedding) / (input_norm * safe_known_norms)
-    return similarities
+# --- Snapshot gallery ---
+_snapshot_lock = threading.Lock()
+snapshot_state = {"name": None, "cache_version": None}
 
-def euclidean_distance(input_embedding: np.ndarray, known_embeddings: np.ndarray) -> np.ndarray:
-    if known_embeddings.ndim == 1:
-        known_embeddings = known_embeddings[np.newaxis, :]
-    distances = np.linalg.norm(known_embeddings - input_embedding, axis=1)
-    return distances
+def db_embedding_versions(db: Session, user_ids: list | None = None) -> dict:
+    """
+    user_id -> (số embedding, id lớn nhất) của phiên bản pipeline hiện tại (mọi người dùng hoặc chỉ
+    `user_ids`), tính bằng một truy vấn gộp.
+    """
+    query = (db.query(FaceEmbedding.user_id, func.count(FaceEmbedding.id), func.max(FaceEmbedding.id))
+             .filter(FaceEmbedding.pipeline_version == PIPELINE_VERSION))
+    if user_ids is not None:
+        query = query.filter(FaceEmbedding.user_id.in_(user_ids))
+    return {user_id: (count, max_id) for user_id, count, max_id in query.group_by(FaceEmbedding.user_id)}
+
+def _embeddings_by_user(db: Session, user_ids: list, chunk: int = 1000):
+    """(user_id, ma trận embedding) của các người dùng, mỗi truy vấn `chunk` người."""
+    for start in range(0, len(user_ids), chunk):
+        rows = (db.query(FaceEmbedding.user_id, FaceEmbedding.embedding)
+                .filter(FaceEmbedding.user_id.in_(user_ids[start:start + chunk]),
+                        FaceEmbedding.pipeline_version == PIPELINE_VERSION)
+                .order_by(FaceEmbedding.user_id, FaceEmbedding.id))
+        for user_id, group in groupby(rows, key=lambda r: r[0]):
+            yield user_id, _unpack_embeddings([r[1] for r in group])
+
+def catch_up_gallery(db: Session, gallery: FaceGallery, versions: dict, user_ids: list | None = None) -> dict:
+    """
+    Đưa `gallery` (nạp từ snapshot) về khớp DB: chỉ nạp lại embedding của người dùng có số
+    embedding hoặc id lớn nhất khác `versions`, hoặc đổi mã/họ tên; xóa người không còn
+    embedding. `user_ids` giới hạn việc so sánh ở những người dùng đó. Cập nhật `versions` tại chỗ.
+    """
+    current = db_embedding_versions(db, user_ids)
+    users = db.query(User.id, User.member_code, User.full_name)
+    if user_ids is not None:
+        users = users.filter(User.id.in_(user_ids))
+    infos = {user_id: {"user_id": user_id, "member_code": member_code, "full_name": full_name}
+             for user_id, member_code, full_name in users}
+    changed = sorted(user_id for user_id, version in current.items()
+                     if versions.get(user_id) != version or gallery.get_user(user_id) != infos.get(user_id))
+    removed = [user_id for user_id in (versions if user_ids is None else user_ids)
+               if (user_id in versions or user_id in gallery) and user_id not in current]
+    for user_id in removed:
+        gallery.remove_user(user_id)
+        versions.pop(user_id, None)
+    for user_id, embeddings in _embeddings_by_user(db, changed):
+        if user_id in infos:
+            gallery.upsert_user(infos[user_id], embeddings)
+    for user_id in changed:
+        versions[user_id] = current[user_id]
+    return {"changed": len(changed), "removed": len(removed)}
+
+def load_gallery(db: Session) -> FaceGallery:
+    """
+    Nạp gallery lúc khởi động: ánh xạ snapshot mới nhất rồi bắt kịp DB (thời gian gần như không
+    phụ thuộc kích thước gallery); không có snapshot hợp lệ thì nạp toàn bộ từ DB. Snapshot mới
+    được ghi nền khi gallery khác snapshot.
+    """
+    global embedding_cache, cache_version, gallery_versions
+    if GALLERY_SHARED:
+        # Worker đầu tiên bắt kịp DB và công bố; các worker sau chỉ gắn thế hệ đó
+        publish_gallery(db)
+        return embedding_cache
+    snapshot = load_snapshot(GALLERY_SNAPSHOT_DIR, PIPELINE_VERSION) if GALLERY_SNAPSHOT_DIR else None
+    if snapshot is None:
+        load_embedding_cache(db)
+        if GALLERY_SNAPSHOT_DIR:
+            save_snapshot_in_background()
+        return embedding_cache
+
+    started = time.perf_counter()
+    gallery = FaceGallery.from_arrays(snapshot["matrix"], snapshot["row_user_ids"], snapshot["users"],
+                                      storage=gallery_storage())
+    versions = snapshot["versions"]
+    report = catch_up_gallery(db, gallery, versions)
+    embedding_cache = attach_index(gallery)
+    gallery_versions = versions
+    cache_version += 1
+    record_cache_reload(time.perf_counter() - started)
+    print(f"DEBUG: Đã nạp snapshot '{snapshot['name']}' ({snapshot['meta']['rows']} embedding), bắt kịp DB: "
+          f"{report['changed']} người dùng thay đổi, {report['removed']} bị xóa, "
+          f"{time.perf_counter() - started:.2f}s. Phiên bản cache: {cache_version}")
+    snapshot_state.update(name=snapshot["name"], cache_version=None if report["changed"] or report["removed"] else cache_version)
+    if snapshot_state["cache_version"] is None:
+        save_snapshot_in_background()
+    return embedding_cache
 
+def write_gallery_snapshot(db: Session | None = None) -> str | None:
+    """
+    Ghi snapshot của gallery hiện tại (bắt kịp DB trước nếu có `db`). Bỏ qua khi gallery không
+    đổi kể từ snapshot trước. Trả về tên snapshot mới nhất.
+    """
+    global cache_version
+    if GALLERY_SHARED:
+        # Gallery đang gắn chính là snapshot; chỉ cần công bố phần DB đã thay đổi (nếu có)
+        return publish_gallery(db) if db is not None else snapshot_state["name"]
+    with _snapshot_lock:
+        gallery = embedding_cache
+        if gallery is None or not GALLERY_SNAPSHOT_DIR:
+            return None
+        if db is not None:
+            report = catch_up_gallery(db, gallery, gallery_versions)
+            if report["changed"] or report["removed"]:
+                cache_version += 1
+        if snapshot_state["cache_version"] == cache_version:
+            return snapshot_state["name"]
+        version = cache_version
+        started = time.perf_counter()
+        name = save_snapshot(GALLERY_SNAPSHOT_DIR, gallery, dict(gallery_versions), PIPELINE_VERSION)
+        if name is None: # Gallery trống: giữ snapshot cũ (nếu có)
+            return snapshot_state["name"]
+        snapshot_state.update(name=name, cache_version=version)
+        print(f"DEBUG: Đã ghi snapshot gallery '{name}' ({gallery.num_embeddings} embedding, "
+              f"{time.perf_counter() - started:.2f}s)")
+        return name
+
+def save_snapshot_in_background() -> None:
+    def run():
+        try:
+            write_gallery_snapshot()
+        except Exception as e:
+            print(f"Lỗi khi ghi snapshot gallery: {e}")
+    threading.Thread(target=run, name="gallery-snapshot", daemon=True).start()
 
-def process_frame(frame_data: str, db: Session):
-    global best_member_code, recognition_time, frame_queue, COSINE_SIMILARITY_THRESHOLD, EUCLIDEAN_DISTANCE_THRESHOLD
-    try:
-        img_data = base64.b64decode(frame_data.split(',')[1])
-        nparr = np.frombuffer(img_data, np.uint8)
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+# --- Gallery dùng chung giữa các worker (GALLERY_SHARED) ---
+def publish_gallery(db: Session, user_ids: list | None = None, full_reload: bool = False) -> str | None:
+    """
+    Công bố thế hệ gallery mới cho mọi worker. Dưới khóa tệp của GALLERY_SNAPSHOT_DIR: nạp thế
+    hệ hiện tại (copy-on-write) rồi bắt kịp DB (chỉ `user_ids` nếu có), hoặc dựng lại từ DB khi
+    `full_reload`/chưa có snapshot; ghi snapshot mới nếu có thay đổi. Sau đó gắn thế hệ mới nhất
+    vào tiến trình này; các worker khác gắn qua watch_gallery_generations.
 
-        input_embedding, facial_area, error = extract_embedding(frame)
-        if error:
-            return {"status": error, "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+    Mỗi lần công bố ghi lại toàn bộ ma trận. Các lần công bố đồng thời xếp hàng trên khóa và lần
+    sau thường không còn gì để bắt kịp nên không ghi thêm.
+    """
+    started = time.perf_counter()
+    with snapshot_lock(GALLERY_SNAPSHOT_DIR):
+        snapshot = None if full_reload else load_snapshot(GALLERY_SNAPSHOT_DIR, PIPELINE_VERSION)
+        if snapshot is None:
+            entries, versions = read_gallery_entries(db)
+            gallery = FaceGallery.from_entries(entries)
+            changed = True
+        else:
+            gallery = FaceGallery.from_arrays(snapshot["matrix"], snapshot["row_user_ids"], snapshot["users"])
+            versions = snapshot["versions"]
+            report = catch_up_gallery(db, gallery, versions, user_ids)
+            changed = bool(report["changed"] or report["removed"])
+        if changed:
+            name = save_snapshot(GALLERY_SNAPSHOT_DIR, gallery, versions, PIPELINE_VERSION)
+            if name is None:
+                # Gallery trống không có snapshot: bỏ CURRENT để mọi worker gắn gallery trống
+                clear_current_snapshot(GALLERY_SNAPSHOT_DIR)
+            print(f"DEBUG: Đã công bố thế hệ gallery '{name or 'trống'}' ({gallery.num_embeddings} embedding, "
+                  f"{time.perf_counter() - started:.2f}s)")
+        del snapshot, gallery
+    # CURRENT có thể đã trỏ tới thế hệ còn mới hơn của worker khác: luôn gắn theo CURRENT
+    attach_generation(current_snapshot_name(GALLERY_SNAPSHOT_DIR))
+    record_cache_reload(time.perf_counter() - started)
+    return snapshot_state["name"]
+
+def attach_generation(name: str | None) -> bool:
+    """
+    Gắn thế hệ `name` (None = gallery trống) làm gallery của tiến trình này: ánh xạ chỉ đọc ma
+    trận của snapshot (các worker dùng chung trang bộ nhớ) và xây chỉ mục riêng. Trả về False nếu
+    đã gắn thế hệ đó hoặc không đọc được (ví dụ đã bị dọn; lần kiểm tra sau sẽ gắn bản mới hơn).
+    """
+    global embedding_cache, cache_version, gallery_versions
+    with _snapshot_lock:
+        if embedding_cache is not None and snapshot_state["name"] == name:
+            return False
+        if name is None:
+            gallery, versions = FaceGallery(), {}
+        else:
+            snapshot = load_snapshot(GALLERY_SNAPSHOT_DIR, PIPELINE_VERSION, name=name, read_only=True)
+            if snapshot is None:
+                return False
+            gallery = FaceGallery.from_arrays(snapshot["matrix"], snapshot["row_user_ids"], snapshot["users"])
+            versions = snapshot["versions"]
+        embedding_cache = attach_index(gallery)
+        gallery_versions = versions
+        cache_version += 1
+        snapshot_state.update(name=name, cache_version=cache_version)
+    print(f"DEBUG: Đã gắn thế hệ gallery '{name or 'trống'}' ({gallery.num_embeddings} embedding). Phiên bản cache: {cache_version}")
+    return True
+
+def watch_gallery_generations() -> None:
+    """Luồng nền: kiểm tra CURRENT mỗi GALLERY_POLL_S giây và gắn thế hệ mới do worker khác công bố."""
+    while True:
+        time.sleep(GALLERY_POLL_S)
+        try:
+            name = current_snapshot_name(GALLERY_SNAPSHOT_DIR)
+            if name != snapshot_state["name"]:
+                attach_generation(name)
+        except Exception as e:
+            print(f"Lỗi khi gắn thế hệ gallery mới: {e}")
 
-        # Đảm bảo cache được load hoặc re-load nếu cần
-        global embedding_cache
+def refresh_user_in_cache(db: Session, user_id: int) -> int:
+    """
+    Cập nhật tại chỗ embedding của MỘT người dùng trong cache từ DB (thêm, thay thế
+    hoặc xóa nếu người dùng không còn/không có embedding). Trả về số embedding đã nạp.
+    """
+    global cache_version
+    if GALLERY_SHARED:
+        publish_gallery(db, user_ids=[user_id])
+        return embedding_cache.embedding_count(user_id)
+    if embedding_cache is None:
+        load_embedding_cache(db)
+        return embedding_cache.embedding_count(user_id)
+    # Cùng đường với nhật ký thay đổi: gallery_versions khớp gallery, và snapshot ghi nền (giữ
+    # _snapshot_lock) không chép phải gallery đang sửa dở
+    with _snapshot_lock:
+        catch_up_gallery(db, embedding_cache, gallery_versions, [user_id])
+        cache_version += 1
+        count = embedding_cache.embedding_count(user_id)
+    print(f"DEBUG: Đã cập nhật user {user_id} trong cache ({count} embedding). Phiên bản mới: {cache_version}")
+    return count
+
+def remove_user_from_cache(user_id: int) -> bool:
+    """
+    Xóa một người dùng khỏi cache mà không cần truy vấn DB. Với GALLERY_SHARED, thế hệ mới được
+    bắt kịp theo DB (người dùng phải đã bị xóa khỏi DB).
+    """
+    global cache_version
+    if GALLERY_SHARED:
+        db = SessionLocal()
+        try:
+            present = embedding_cache is not None and user_id in embedding_cache
+            publish_gallery(db, user_ids=[user_id])
+            return present and user_id not in embedding_cache
+        finally:
+            db.close()
+    if embedding_cache is None:
+        return False
+    with _snapshot_lock:
+        removed = embedding_cache.remove_user(user_id)
+        # Không còn trong versions: lần bắt kịp sau nạp lại người dùng nếu DB vẫn còn embedding
+        gallery_versions.pop(user_id, None)
+        cache_version += 1
+    print(f"DEBUG: Đã xóa user {user_id} khỏi cache. Phiên bản mới: {cache_version}")
+    return removed
+
+# --- Nhật ký thay đổi gallery (xem changelog.py) ---
+change_cursor: ChangeCursor | None = None
+
+def latest_change_seq(db: Session) -> int:
+    return db.query(func.max(EmbeddingChange.seq)).scalar() or 0
+
+def apply_user_changes(db: Session, user_ids: list) -> dict:
+    """
+    Bắt kịp DB cho các người dùng trong nhật ký (công bố thế hệ mới nếu GALLERY_SHARED). Người
+    dùng vượt COMPACT_MAX_EMBEDDINGS (ví dụ đăng ký lại qua Backend Admin) được thu gọn trước.
+    """
+    global cache_version
+    compact_users_if_needed(db, user_ids)
+    if GALLERY_SHARED:
+        publish_gallery(db, user_ids=user_ids)
+        return {"users": len(user_ids)}
+    with _snapshot_lock:
         if embedding_cache is None:
-            load_embedding_cache(db) # Force load if it's None (e.g., first run or explicitly set to None)
-        user_embeddings = embedding_cache # Always use the global cache
-
-        if not user_embeddings:
-            return {"status": "Không có người dùng", "full_name": None, "similarity": None, "distance": None, "final_frame": None}
-
-        matches = []
-        for user in user_embeddings:
-            if not user["embeddings"]:
-                continue
+            return {"users": 0}
+        report = catch_up_gallery(db, embedding_cache, gallery_versions, user_ids)
+        if report["changed"] or report["removed"]:
+            cache_version += 1
+            print(f"DEBUG: Nhật ký thay đổi: {report['changed']} người dùng cập nhật, {report['removed']} bị xóa. "
+                  f"Phiên bản mới: {cache_version}")
+    return report
+
+def poll_embedding_changes(db: Session, cursor: ChangeCursor) -> int:
+    """Đọc và áp dụng các hàng nhật ký mới (và seq hụt còn chờ). Trả về số hàng đã đọc."""
+    columns = (EmbeddingChange.seq, EmbeddingChange.user_id)
+    rows = (db.query(*columns).filter(EmbeddingChange.seq > cursor.last_seq)
+            .order_by(EmbeddingChange.seq).limit(CHANGE_LOG_BATCH).all())
+    gaps = cursor.pending_gaps()
+    if gaps:
+        rows += db.query(*columns).filter(EmbeddingChange.seq.in_(gaps[:CHANGE_LOG_BATCH])).all()
+    if not rows:
+        return 0
+    db.rollback() # Kết thúc giao dịch đọc để catch-up thấy dữ liệu mới nhất
+    apply_user_changes(db, sorted({user_id for _, user_id in rows}))
+    # Chỉ tiến con trỏ sau khi áp dụng xong: lỗi giữa chừng thì lần sau đọc lại
+    cursor.advance(seq for seq, _ in rows)
+    return len(rows)
+
+def prune_embedding_changes(db: Session) -> int:
+    """Xóa hàng nhật ký cũ hơn CHANGE_LOG_RETENTION_DAYS (bản sao khởi động lại thì bắt kịp bằng snapshot/DB)."""
+    cutoff = datetime.now() - timedelta(days=CHANGE_LOG_RETENTION_DAYS)
+    deleted = db.query(EmbeddingChange).filter(EmbeddingChange.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+    return deleted
 
-            sims = cosine_similarity(input_embedding, np.array(user["embeddings"]))
-            max_sim = np.max(sims) if len(sims) > 0 else 0
+def watch_embedding_changes(cursor: ChangeCursor) -> None:
+    """
+    Luồng nền: đọc nhật ký thay đổi, con trỏ phiên bản gallery và ngưỡng đã hiệu chỉnh mỗi
+    CHANGE_LOG_POLL_S giây; dọn
+    nhật ký cũ mỗi giờ.
+    """
+    last_prune = time.monotonic()
+    while True:
+        time.sleep(CHANGE_LOG_POLL_S)
+        db = SessionLocal()
+        try:
+            refresh_active_pipeline(db)
+            refresh_thresholds(db)
+            # Còn hàng thì đọc tiếp ngay (ví dụ sau một lượt đăng ký hàng loạt)
+            while poll_embedding_changes(db, cursor) >= CHANGE_LOG_BATCH:
+                pass
+            if time.monotonic() - last_prune > 3600:
+                last_prune = time.monotonic()
+                prune_embedding_changes(db)
+        except Exception as e:
+            db.rollback()
+            print(f"Lỗi khi đọc nhật ký thay đổi gallery: {e}")
+        finally:
+            db.close()
 
-            dists = euclidean_distance(input_embedding, np.array(user["embeddings"]))
-            min_dist = np.min(dists) if len(dists) > 0 else float('inf')
+# --- Thu gọn gallery ---
+def compact_user(db: Session, user_id: int, dry_run: bool = False, min_rows: int = 0) -> dict | None:
+    """
+    Thu gọn embedding (phiên bản pipeline hiện tại) của một người dùng trong DB: giữ các hàng
+    medoid, xóa các hàng còn lại (kể cả ngoại lai và centroid cũ) và thêm một hàng centroid mới,
+    trong một giao dịch. Medoid, ngoại lai và centroid chỉ tính trên các hàng "sample": centroid
+    cũ không phải ảnh thật nên không được chọn làm medoid hay kéo lệch điểm ngoại lai. Medoid không
+    có ảnh gốc nhận ảnh của một hàng bị xóa (xem _photos_for_kept_rows). Trả về báo cáo, hoặc None
+    nếu không có gì để thu gọn (hoặc chỉ còn <= `min_rows` hàng). Không cập nhật cache.
+    """
+    # Khóa các hàng của người dùng: nhiều bản sao cùng đọc nhật ký thay đổi có thể cùng thu gọn một
+    # người; bản sao sau chờ bản trước commit rồi thấy số hàng đã giảm và bỏ qua
+    query = (db.query(FaceEmbedding.id, FaceEmbedding.embedding, FaceEmbedding.kind, FaceEmbedding.photo_path)
+             .filter(FaceEmbedding.user_id == user_id, FaceEmbedding.pipeline_version == PIPELINE_VERSION)
+             .order_by(FaceEmbedding.id))
+    rows = (query if dry_run else query.with_for_update()).all()
+    if len(rows) <= min_rows:
+        db.rollback()
+        return None
+    samples = [row for row in rows if row.kind != EMBEDDING_KIND_CENTROID]
+    embeddings = _unpack_embeddings([row.embedding for row in samples])
+    if len(embeddings) != len(samples):
+        print(f"Cảnh báo: Bỏ qua thu gọn user {user_id} vì có embedding sai kích thước.")
+        db.rollback() # Nhả khóa hàng
+        return None
+    result = compact_embeddings(embeddings, medoids=COMPACT_MEDOIDS, min_similarity=COMPACT_OUTLIER_MIN_SIMILARITY)
+    if result["centroid"] is None:
+        db.rollback() # Nhả khóa hàng
+        return None
+    keep_ids = {samples[i].id for i in result["keep"]}
+    report = {
+        "user_id": user_id,
+        "before": len(rows),
+        "after": len(keep_ids) + 1,
+        "outliers": len(result["outliers"]),
+        "score_before": result["score_before"],
+        "score_after": result["score_after"],
+    }
+    if not dry_run:
+        for row_id, photo_path in _photos_for_kept_rows(samples, embeddings, result).items():
+            db.query(FaceEmbedding).filter(FaceEmbedding.id == row_id).update({"photo_path": photo_path})
+        (db.query(FaceEmbedding)
+         .filter(FaceEmbedding.id.in_([row.id for row in rows if row.id not in keep_ids]))
+         .delete(synchronize_session=False))
+        # Centroid không có ảnh gốc: reembed.py chỉ tính lại được các medoid
+        db.add(FaceEmbedding(user_id=user_id, embedding=pack_embedding(result["centroid"]),
+                             model_name=EMBEDDING_MODEL_NAME, pipeline_version=PIPELINE_VERSION,
+                             kind=EMBEDDING_KIND_CENTROID))
+        record_embedding_changes(db, [user_id])
+        db.commit()
+    return report
+
+def _photos_for_kept_rows(samples: list, embeddings: np.ndarray, result: dict) -> dict:
+    """
+    id hàng medoid không có ảnh gốc (hàng chuyển từ định dạng JSON cũ) -> photo_path của hàng bị xóa
+    (không phải ngoại lai) giống medoid đó nhất, để reembed.py vẫn tính lại được người dùng đã thu gọn.
+    """
+    keep, dropped = set(result["keep"].tolist()), set(result["outliers"].tolist())
+    donors = [i for i in range(len(samples)) if i not in keep and i not in dropped and samples[i].photo_path]
+    vectors = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    photos = {}
+    for i in sorted(keep):
+        if samples[i].photo_path or not donors:
+            continue
+        donor = max(donors, key=lambda j: float(vectors[i] @ vectors[j]))
+        donors.remove(donor)
+        photos[samples[i].id] = samples[donor].photo_path
+    return photos
+
+def compact_gallery(db: Session, min_embeddings: int = COMPACT_MAX_EMBEDDINGS, user_ids=None,
+                    dry_run: bool = False) -> dict:
+    """
+    Thu gọn mọi người dùng (hoặc chỉ `user_ids`) có nhiều hơn `min_embeddings` embedding.
+    Trả về báo cáo tổng hợp: kích thước gallery và điểm khớp đúng người trước/sau.
+    """
+    version_filter = FaceEmbedding.pipeline_version == PIPELINE_VERSION
+    total_before = db.query(func.count(FaceEmbedding.id)).filter(version_filter).scalar()
+    candidates = compaction_candidates(db, min_embeddings, user_ids)
+    limit = max(min_embeddings, COMPACT_MEDOIDS + 1)
+    reports = [r for r in (compact_user(db, user_id, dry_run, limit) for user_id in candidates) if r]
+    removed = sum(r["before"] - r["after"] for r in reports)
+    dim = embedding_cache.matrix.shape[1] if embedding_cache is not None else 0
+    row_bytes = dim * EMBEDDING_DTYPE.itemsize
+    return {
+        "dry_run": dry_run,
+        "users_scanned": len(candidates),
+        "users_compacted": len(reports),
+        "embeddings_before": total_before,
+        "embeddings_after": total_before - removed,
+        "gallery_bytes_before": total_before * row_bytes,
+        "gallery_bytes_after": (total_before - removed) * row_bytes,
+        "outliers_dropped": sum(r["outliers"] for r in reports),
+        "mean_score_before": float(np.mean([r["score_before"] for r in reports])) if reports else None,
+        "mean_score_after": float(np.mean([r["score_after"] for r in reports])) if reports else None,
+        "min_score_after": min((r["score_after"] for r in reports), default=None),
+        "users": reports,
+    }
 
-            if max_sim >= COSINE_SIMILARITY_THRESHOLD and min_dist <= EUCLIDEAN_DISTANCE_THRESHOLD:
-                matches.append({"sim": max_sim, "dist": min_dist, "user": user})
+def compaction_candidates(db: Session, min_embeddings: int, user_ids=None) -> list:
+    """Người dùng (trong `user_ids` nếu có) có nhiều hơn `min_embeddings` embedding, một truy vấn gộp."""
+    query = db.query(FaceEmbedding.user_id).filter(FaceEmbedding.pipeline_version == PIPELINE_VERSION)
+    if user_ids is not None:
+        query = query.filter(FaceEmbedding.user_id.in_(list(user_ids)))
+    return [user_id for (user_id,) in query.group_by(FaceEmbedding.user_id)
+            .having(func.count(FaceEmbedding.id) > max(min_embeddings, COMPACT_MEDOIDS + 1))]
+
+def compact_users_if_needed(db: Session, user_ids: list) -> list:
+    """Thu gọn những người dùng vượt COMPACT_MAX_EMBEDDINGS trong `user_ids` (0 = tắt). Trả về các báo cáo."""
+    if COMPACT_MAX_EMBEDDINGS <= 0 or not user_ids:
+        return []
+    limit = max(COMPACT_MAX_EMBEDDINGS, COMPACT_MEDOIDS + 1)
+    reports = []
+    for user_id in compaction_candidates(db, COMPACT_MAX_EMBEDDINGS, user_ids):
+        report = compact_user(db, user_id, min_rows=limit)
+        if report:
+            print(f"DEBUG: Đã thu gọn user {user_id}: {report['before']} -> {report['after']} embedding "
+                  f"(bỏ {report['outliers']} ngoại lai)")
+            reports.append(report)
+    return reports
+
+def compact_user_if_needed(db: Session, user_id: int) -> dict | None:
+    """Thu gọn người dùng vừa đăng ký thêm ảnh nếu vượt COMPACT_MAX_EMBEDDINGS (0 = tắt)."""
+    reports = compact_users_if_needed(db, [user_id])
+    return reports[0] if reports else None
+
+
+# --- Hiệu chỉnh ngưỡng ---
+calibration_state = {"status": "idle"}
+_calibration_lock = threading.Lock()
+
+def run_calibration(gallery: FaceGallery, apply: bool = False, target_far: float = CALIBRATION_TARGET_FAR,
+                    max_rows: int = CALIBRATION_MAX_ROWS, on_block=None) -> dict:
+    """
+    Tính phân phối điểm genuine/impostor của gallery (lấy mẫu tối đa `max_rows` hàng) và ngưỡng
+    khuyến nghị; với `apply`, lưu ngưỡng khuyến nghị cho mọi worker nếu báo cáo đủ tin cậy.
+    """
+    started = time.perf_counter()
+    rows = np.flatnonzero(gallery.owners[:gallery.size] != FREE_ROW)
+    rows = rows[sample_users(gallery.owners[rows], max_rows, np.random.default_rng(0))]
+    report = calibrate(gallery.matrix[rows], gallery.owners[rows], target_far, CALIBRATION_BLOCK_ROWS,
+                       CALIBRATION_MIN_GENUINE_PAIRS, on_block)
+    report["sampled"] = len(rows) < gallery.num_embeddings
+    report["applied"] = bool(apply and report["reliable"])
+    if report["applied"]:
+        save_thresholds(report["recommended"]["cosine"], report["recommended"]["euclidean"])
+    report["elapsed_s"] = round(time.perf_counter() - started, 3)
+    print(f"DEBUG: Hiệu chỉnh ngưỡng trên {report['rows']} embedding ({report['genuine_pairs']} cặp genuine, "
+          f"{report['impostor_pairs']} cặp impostor): khuyến nghị cosine {report['recommended']['cosine']}, "
+          f"EER {report['eer']:.4f}, {'đã áp dụng' if report['applied'] else 'chưa áp dụng'}")
+    return report
+
+def _calibration_worker(apply: bool) -> None:
+    try:
+        gallery = embedding_cache
+        if gallery is None or not len(gallery):
+            result = {"status": "skipped", "detail": "Gallery trống"}
+        else:
+            # time.sleep(0) giữa các khối nhường GIL cho các luồng xử lý khung hình
+            result = {"status": "done", **run_calibration(gallery, apply, on_block=lambda: time.sleep(0))}
+    except Exception as e:
+        result = {"status": "error", "detail": str(e)}
+    result["finished_at"] = datetime.now().isoformat(timespec="seconds")
+    with _calibration_lock:
+        calibration_state.clear()
+        calibration_state.update(result)
 
-        if not matches:
-            frame_queue.clear()
-            return {"status": "Không nhận diện được", "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+_startup_calibration_lock_file = None
 
-        best_match = sorted(matches, key=lambda x: (x["sim"], -x["dist"]), reverse=True)[0]
+def claim_startup_calibration() -> bool:
+    """
+    Với GALLERY_SHARED, chỉ worker giữ được khóa tệp trong GALLERY_SNAPSHOT_DIR hiệu chỉnh lúc khởi
+    động (giữ tới khi tiến trình thoát); worker khác nhận ngưỡng qua gallery_settings.
+    """
+    global _startup_calibration_lock_file
+    if not GALLERY_SHARED:
+        return True
+    os.makedirs(GALLERY_SNAPSHOT_DIR, exist_ok=True)
+    f = open(os.path.join(GALLERY_SNAPSHOT_DIR, "calibration.lock"), "a")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        f.close()
+        print("DEBUG: Worker khác đang giữ lượt hiệu chỉnh lúc khởi động, bỏ qua.")
+        return False
+    _startup_calibration_lock_file = f
+    return True
+
+def start_calibration(apply: bool) -> bool:
+    """Chạy hiệu chỉnh trên một luồng nền; trả về False nếu đang có lượt khác chạy."""
+    with _calibration_lock:
+        if calibration_state.get("status") == "running":
+            return False
+        calibration_state.clear()
+        calibration_state.update({"status": "running", "apply": apply,
+                                  "started_at": datetime.now().isoformat(timespec="seconds")})
+    threading.Thread(target=_calibration_worker, args=(apply,), name="calibration", daemon=True).start()
+    return True
+
+
+def process_frame(frame_data: str, db: Session, session: RecognitionSession, return_frame: bool = False):
+    """Khung hình dạng data URL base64 (`data:image/jpeg;base64,...`), giữ để tương thích."""
+    try:
+        with stage_timer("decode"):
+            img_data = base64.b64decode(frame_data.split(',')[1])
+    except Exception as e:
+        record_status("Lỗi")
+        return {"status": f"Lỗi: {str(e)}", "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+    return process_frame_bytes(img_data, db, session, return_frame)
 
-        frame_queue.append({
+def vote_frame(session: RecognitionSession, best_match: dict) -> bool:
+    """
+    Ghi phiếu bầu của một khung hình khớp vào phiên của kiosk gửi khung hình. Trả về True khi
+    một thành viên đủ phiếu (>= 4 khung hình trong hàng đợi, 3 khung hình gần nhất cùng người).
+    """
+    with session.lock:
+        session.frame_queue.append({
             "member_code": best_match["user"]["member_code"],
             "sim": best_match["sim"],
             "dist": best_match["dist"]
         })
 
         member_counts = {}
-        for item in frame_queue:
+        for item in session.frame_queue:
             mc = item["member_code"]
             member_counts[mc] = member_counts.get(mc, 0) + 1
 
         for mc, count in member_counts.items():
             if count >= 4:
-                recent_frames = list(frame_queue)[-3:]
+                recent_frames = list(session.frame_queue)[-3:]
                 if all(f["member_code"] == mc for f in recent_frames):
-                    best_member_code = mc
-                    recognition_time = datetime.now()
-
-                    if facial_area:
-                        cv2.rectangle(frame, (facial_area['x'], facial_area['y']),
-                                        (facial_area['x'] + facial_area['w'], facial_area['y'] + facial_area['h']),
-                                        (0, 255, 0), 2)
-                    _, buffer = cv2.imencode('.jpg', frame)
-                    final_frame_b64 = f"data:image/jpeg;base64,{base64.b64encode(buffer).decode()}"
-
-                    frame_queue.clear()
-
-                    return {
-                        "status": "Nhận diện thành công",
-                        "full_name": best_match["user"]["full_name"],
-                        "similarity": float(best_match["sim"]),
-                        "distance": float(best_match["dist"]),
-                        "final_frame": final_frame_b64
-                    }
-        return {"status": "Đang nhận diện", "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+                    session.best_member_code = mc
+                    session.recognition_time = datetime.now()
+                    session.frame_queue.clear()
+                    return True
+    return False
+
+def confirm_single_face(frame, session: RecognitionSession) -> str | None:
+    """
+    Khung hình hoàn tất phiếu bầu phải đi qua bộ phát hiện: khung hình theo dõi bằng template
+    matching bỏ qua kiểm tra "Có nhiều khuôn mặt". Nếu khuôn mặt của khung hình này là từ bộ
+    theo dõi, phát hiện lại; có lỗi thì hủy kết quả vừa bầu và trả về lỗi.
+    """
+    if not FACE_TRACKING:
+        return None
+    with session.lock:
+        tracked = session.tracker.frames_since_detection > 0
+    if not tracked:
+        return None
+    _, error = detect_face(frame)
+    tracking_stats.record("detections")
+    if error:
+        with session.lock:
+            session.reset()
+    return error
+
+def process_frame_bytes(img_data, db: Session, session: RecognitionSession, return_frame: bool = False):
+    """
+    Nhận diện trên khung hình JPEG/PNG dạng bytes, giải mã thẳng từ bộ đệm của request.
+    Kết quả kèm `facial_area` (hộp khuôn mặt trên khung hình gửi lên) để client tự vẽ;
+    ảnh đã vẽ hộp (`final_frame`) chỉ được mã hóa khi `return_frame` bật.
+    """
+    with FRAME_SECONDS.time():
+        result = _recognize_frame(img_data, db, session, return_frame)
+    record_status(result["status"])
+    return result
+
+def _recognize_frame(img_data, db: Session, session: RecognitionSession, return_frame: bool):
+    global COSINE_SIMILARITY_THRESHOLD, EUCLIDEAN_DISTANCE_THRESHOLD
+    if active_gallery_version not in (None, PIPELINE_VERSION):
+        return {"status": f"Lỗi: Gallery đang kích hoạt phiên bản '{active_gallery_version}', dịch vụ này "
+                          f"tạo embedding phiên bản '{PIPELINE_VERSION}'",
+                "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+    try:
+        nparr = np.frombuffer(img_data, np.uint8)
+        with stage_timer("imdecode"):
+            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        if frame is None:
+            return {"status": "Lỗi: Không thể giải mã khung hình", "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+
+        input_embedding, facial_area, error = extract_embedding(frame, session)
+        if error:
+            return {"status": error, "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+
+        # Đảm bảo cache được load hoặc re-load nếu cần
+        global embedding_cache
+        if embedding_cache is None:
+            with stage_timer("db_reload"):
+                load_embedding_cache(db) # Force load if it's None (e.g., first run or explicitly set to None)
+        gallery = embedding_cache # Always use the global cache
+
+        if not gallery:
+            return {"status": "Không có người dùng", "full_name": None, "similarity": None, "distance": None, "final_frame": None, "facial_area": facial_area}
+
+        # Một phép nhân ma trận-vector chấm điểm toàn bộ gallery; khoảng cách Euclid suy ra từ cosine
+        with stage_timer("search"):
+            match = gallery.search(input_embedding)
+        if match is None or match[1] < COSINE_SIMILARITY_THRESHOLD or match[2] > EUCLIDEAN_DISTANCE_THRESHOLD:
+            with session.lock:
+                session.frame_queue.clear()
+            return {"status": "Không nhận diện được", "full_name": None, "similarity": None, "distance": None, "final_frame": None, "facial_area": facial_area}
+
+        best_user, best_sim, best_dist = match
+        best_match = {"sim": best_sim, "dist": best_dist, "user": best_user}
+
+        with stage_timer("vote"):
+            recognized = vote_frame(session, best_match)
+        if not recognized:
+            return {"status": "Đang nhận diện", "full_name": None, "similarity": None, "distance": None, "final_frame": None, "facial_area": facial_area}
+
+        error = confirm_single_face(frame, session)
+        if error:
+            return {"status": error, "full_name": None, "similarity": None, "distance": None, "final_frame": None}
+
+        final_frame_b64 = None
+        if return_frame:
+            # Tùy chọn: client cũ cần ảnh đã vẽ hộp khuôn mặt
+            if facial_area:
+                cv2.rectangle(frame, (facial_area['x'], facial_area['y']),
+                                (facial_area['x'] + facial_area['w'], facial_area['y'] + facial_area['h']),
+                                (0, 255, 0), 2)
+            _, buffer = cv2.imencode('.jpg', frame)
+            final_frame_b64 = f"data:image/jpeg;base64,{base64.b64encode(buffer).decode()}"
+
+        return {
+            "status": "Nhận diện thành công",
+            "full_name": best_match["user"]["full_name"],
+            "similarity": float(best_match["sim"]),
+            "distance": float(best_match["dist"]),
+            "final_frame": final_frame_b64,
+            "facial_area": facial_area,
+        }
     except Exception as e:
-        tf.keras.backend.clear_session()
         return {"status": f"Lỗi: {str(e)}", "full_name": None, "similarity": None, "distance": None, "final_frame": None}
 
 # --- FastAPI ---
 app = FastAPI()
-app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"], expose_headers=["Retry-After"])
+
+@app.exception_handler(QueueFullError)
+async def queue_full_handler(request: Request, exc: QueueFullError):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 # Khởi tạo cache khi ứng dụng khởi động
 @app.on_event("startup")
 async def startup_event():
+    load_arcface_model()
+    inference_batcher.start()
     db = SessionLocal()
     try:
-        global embedding_cache
+        global embedding_cache, change_cursor
+        refresh_active_pipeline(db)
+        refresh_thresholds(db)
+        # Đọc vị trí nhật ký TRƯỚC khi nạp gallery: thay đổi xảy ra trong lúc nạp sẽ được áp dụng lại
+        change_cursor = ChangeCursor.at_startup(latest_change_seq(db))
         print("DEBUG: Khởi tạo cache khi ứng dụng bắt đầu...")
-        embedding_cache = load_embedding_cache(db)
+        embedding_cache = load_gallery(db)
         print(f"DEBUG: Đã tải {len(embedding_cache)} embedding ban đầu khi khởi động.")
     finally:
         db.close()
+    if GALLERY_SHARED:
+        threading.Thread(target=watch_gallery_generations, name="gallery-watch", daemon=True).start()
+    if CHANGE_LOG_POLL_S > 0:
+        threading.Thread(target=watch_embedding_changes, args=(change_cursor,), name="change-log", daemon=True).start()
+    if THRESHOLD_CALIBRATION != "off" and claim_startup_calibration():
+        # Chạy nền: dịch vụ nhận khung hình ngay với ngưỡng hiện tại trong lúc hiệu chỉnh
+        start_calibration(apply=THRESHOLD_CALIBRATION == "apply")
+
+@app.on_event("shutdown")
+def shutdown_event():
+    # Snapshot mới nhất giúp lần khởi động sau chỉ phải bắt kịp rất ít thay đổi. Với GALLERY_SHARED
+    # mọi thay đổi đã được công bố thành snapshot ngay khi xảy ra
+    if GALLERY_SHARED:
+        return
+    db = SessionLocal()
+    try:
+        write_gallery_snapshot(db)
+    except Exception as e:
+        print(f"Lỗi khi ghi snapshot gallery lúc tắt: {e}")
+    finally:
+        db.close()
 
 
 @app.post('/process-frame', response_model=FaceRecognitionResponse)
 async def process_frame_endpoint(req: FrameRequest, db: Session = Depends(get_db)):
-    return process_frame(req.frame, db)
+    session = kiosk_sessions.get_or_create(req.kiosk_id)
+    return await frame_executor.run(process_frame, req.frame, db, session, req.return_frame, max_wait_ms=FRAME_MAX_WAIT_MS)
 
-@app.post('/confirm-attendance')
-async def confirm_attendance(req: ConfirmAttendanceRequest, db: Session = Depends(get_db)):
-    global best_member_code, recognition_time
+@app.post('/process-frame/binary', response_model=FaceRecognitionResponse)
+async def process_frame_binary_endpoint(request: Request, kiosk_id: str = DEFAULT_KIOSK_ID, return_frame: bool = False,
+                                        db: Session = Depends(get_db)):
+    """
+    Giống /process-frame nhưng nhận thẳng bytes JPEG thay vì chuỗi base64 trong JSON:
+    - `Content-Type: application/octet-stream` (hoặc `image/*`): thân request là ảnh;
+    - `multipart/form-data`: ảnh nằm trong trường `frame`.
+    `kiosk_id` và `return_frame` truyền qua query string.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("frame")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail="Thiếu trường 'frame' chứa ảnh")
+        img_data = await upload.read()
+    elif content_type.startswith(("application/octet-stream", "image/")):
+        img_data = await request.body()
+    else:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="Chỉ hỗ trợ application/octet-stream, image/* hoặc multipart/form-data")
+    if not img_data:
+        raise HTTPException(status_code=400, detail="Khung hình rỗng")
+    session = kiosk_sessions.get_or_create(kiosk_id)
+    return await frame_executor.run(process_frame_bytes, img_data, db, session, return_frame, max_wait_ms=FRAME_MAX_WAIT_MS)
+
+def confirm_session_attendance(db: Session, session: RecognitionSession | None, member_code: str) -> dict:
+    """Ghi điểm danh cho kết quả nhận diện gần nhất của một phiên kiosk; lỗi trả về dạng HTTPException."""
+    if session is None:
+        raise HTTPException(status_code=400, detail="Chưa nhận diện được khuôn mặt")
+    with session.lock:
+        best_member_code, recognition_time = session.best_member_code, session.recognition_time
     if not recognition_time or not best_member_code:
         raise HTTPException(status_code=400, detail="Chưa nhận diện được khuôn mặt")
-    if (datetime.now() - recognition_time).total_seconds() > 30:
+    if (datetime.now() - recognition_time).total_seconds() > CONFIRM_WINDOW_S:
         raise HTTPException(status_code=400, detail="Thời gian xác nhận hết hạn")
-    if req.member_code != best_member_code:
+    if member_code != best_member_code:
         raise HTTPException(status_code=400, detail="Mã thành viên không khớp")
 
-    user = db.query(User).filter(User.member_code == req.member_code).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="Mã thành viên không tồn tại")
-
-    existing_session = db.query(AttendanceSession).filter(
-        AttendanceSession.user_id == user.id,
-        AttendanceSession.exit_time == None
-    ).first()
-    if existing_session:
-        raise HTTPException(status_code=400, detail="Người dùng chưa kết thúc phiên điểm danh trước đó")
-
-    entry_time = recognition_time
-    attendance_session = AttendanceSession(
-        user_id=user.id,
-        entry_time=entry_time,
-        exit_time=None,
-        duration_minutes=None
-    )
-    db.add(attendance_session)
-    db.commit()
+    with stage_timer("db_confirm"):
+        user = db.query(User).filter(User.member_code == member_code).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="Mã thành viên không tồn tại")
+
+        existing_session = db.query(AttendanceSession).filter(
+            AttendanceSession.user_id == user.id,
+            AttendanceSession.exit_time == None
+        ).first()
+        if existing_session:
+            raise HTTPException(status_code=400, detail="Người dùng chưa kết thúc phiên điểm danh trước đó")
+
+        entry_time = recognition_time
+        attendance_session = AttendanceSession(
+            user_id=user.id,
+            entry_time=entry_time,
+            exit_time=None,
+            duration_minutes=None
+        )
+        db.add(attendance_session)
+        db.commit()
 
-    frame_queue.clear()
-    best_member_code = None
-    recognition_time = None
+    with session.lock:
+        session.reset()
     return {
         "status": "Đã ghi điểm danh",
         "full_name": user.full_name,
     }
+
+@app.post('/confirm-attendance')
+async def confirm_attendance(req: ConfirmAttendanceRequest, db: Session = Depends(get_db)):
+    # Chỉ xác nhận kết quả nhận diện của chính kiosk gửi yêu cầu
+    return confirm_session_attendance(db, kiosk_sessions.get(req.kiosk_id), req.member_code)
+
 @app.post('/update-exit-time')
 async def update_exit_time(req: UpdateExitTimeRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.member_code == req.member_code).first()
@@ -375,82 +1570,82 @@ async def update_exit_time(req: UpdateExitTimeRequest, db: Session = Depends(get
         "duration_minutes": session.duration_minutes
     }
 
-@app.post('/add-face')
-async def add_face(
-    member_code: str = Form(...),
-    webcam_frame: str = Form(None),
-    files: list[UploadFile] = File([]),
-    db: Session = Depends(get_db)
-):
-    global embedding_cache, cache_version # Giữ nguyên tên biến
-    user = db.query(User).filter(User.member_code == member_code).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="Mã thành viên không tồn tại")
-
-    images = []
+def _save_face_images(db: Session, user: User, webcam_frame: str | None, contents: list) -> dict:
+    """
+    Giải mã ảnh, trích xuất embedding và lưu vào DB cùng ảnh gốc (chạy trên luồng worker).
+    `contents` là danh sách (tên tệp, bytes).
+    """
+    names, blobs = [], []
     if webcam_frame:
         try:
-            img_data = base64.b64decode(webcam_frame.split(',')[1])
-            nparr = np.frombuffer(img_data, np.uint8)
-            img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            images.append(img)
+            blobs.append(base64.b64decode(webcam_frame.split(',')[1]))
+            names.append("webcam.jpg")
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Lỗi xử lý ảnh webcam: {str(e)}")
+    for filename, content in contents:
+        names.append(filename)
+        blobs.append(content)
 
-    if len(files) > 3:
-        raise HTTPException(status_code=400, detail="Chỉ được tải lên tối đa 3 ảnh")
-    for file in files:
-        content = await file.read()
-        nparr = np.frombuffer(content, np.uint8)
-        img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        images.append(img)
-
-    if not images:
+    if not blobs:
         raise HTTPException(status_code=400, detail="Cần cung cấp ít nhất một ảnh")
 
-    embeddings = []
-    for img in images:
-        embedding, _, error = extract_embedding(img)
+    # Ảnh đã từng được xử lý (cùng nội dung) lấy embedding từ cache, bỏ qua giải mã và phát hiện
+    keys = [content_hash(blob) for blob in blobs]
+    embeddings = [upload_embedding_cache.get(key) for key in keys]
+    missing, faces = [], []
+    for i, blob in enumerate(blobs):
+        if embeddings[i] is not None:
+            continue
+        img = cv2.imdecode(np.frombuffer(blob, np.uint8), cv2.IMREAD_COLOR)
+        face, _, error = preprocess_image(img)
         if error:
             raise HTTPException(status_code=400, detail=error)
-        embeddings.append(embedding.tolist())
-
-    existing_embedding = db.query(FaceEmbedding).filter(FaceEmbedding.user_id == user.id).first()
-    if existing_embedding:
-        current_embeddings = json.loads(existing_embedding.embedding)
-        current_embeddings.extend(embeddings)
-        existing_embedding.embedding = json.dumps(current_embeddings)
-    else:
-        face_embedding = FaceEmbedding(user_id=user.id, embedding=json.dumps(embeddings))
-        db.add(face_embedding)
+        missing.append(i)
+        faces.append(face)
+    # Gửi tất cả khuôn mặt cùng lúc để chúng được suy luận chung một lô
+    try:
+        for i, embedding in zip(missing, embed_cached(faces)):
+            upload_embedding_cache.put(keys[i], embedding)
+            embeddings[i] = embedding
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Lỗi trích xuất embedding (ArcFace): {str(e)}")
+
+    # Mỗi embedding là một hàng mới, không cần đọc-sửa-ghi danh sách cũ
+    db.add_all([
+        FaceEmbedding(user_id=user.id, embedding=pack_embedding(e), model_name=EMBEDDING_MODEL_NAME,
+                      pipeline_version=PIPELINE_VERSION, photo_path=store_photo(blob, f"{user.member_code}_{name}"))
+        for e, blob, name in zip(embeddings, blobs, names)
+    ])
+    record_embedding_changes(db, [user.id])
     db.commit()
+    compact_user_if_needed(db, user.id)
 
-    # >>> ĐIỀU CHỈNH CHÍNH Ở ĐÂY <<<
-    # Sau khi database được cập nhật thành công, tải lại cache ngay lập tức.
-    print("DEBUG: Database đã thay đổi. Đang tải lại embedding cache...")
-    load_embedding_cache(db) # Gọi hàm tải lại cache
-    # Không cần setting embedding_cache = None nữa vì load_embedding_cache đã ghi đè nó
-    # và cũng không cần tăng cache_version ở đây vì load_embedding_cache đã làm việc đó.
-    # >>> KẾT THÚC ĐIỀU CHỈNH <<<
+    # Chỉ cập nhật embedding của người dùng này trong cache thay vì tải lại toàn bộ
+    print("DEBUG: Database đã thay đổi. Đang cập nhật embedding cache cho người dùng...")
+    refresh_user_in_cache(db, user.id)
 
     return {"status": "Đã lưu embedding", "full_name": user.full_name}
 
-# Endpoint này sẽ được Backend Chính gọi để trích xuất embedding từ một ảnh duy nhất.
-@app.post("/face-embeddings/extract")
-async def extract_face_embedding_from_upload(
-    image_file: UploadFile = File(...) # Nhận file ảnh từ request
+@app.post('/add-face')
+async def add_face(
+    member_code: str = Form(...),
+    webcam_frame: str = Form(None),
+    files: list[UploadFile] = File([]),
+    db: Session = Depends(get_db)
 ):
-    """
-    Nhận một file ảnh, phát hiện/trích xuất khuôn mặt, tính toán embedding,
-    và lưu ảnh vào thư mục UPLOAD_DIR.
-    """
-    if not image_file.content_type.startswith("image/"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Tệp tải lên không phải là ảnh."
-        )
+    user = db.query(User).filter(User.member_code == member_code).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="Mã thành viên không tồn tại")
 
-    content = await image_file.read()
+    if len(files) > 3:
+        raise HTTPException(status_code=400, detail="Chỉ được tải lên tối đa 3 ảnh")
+    contents = [(file.filename, await file.read()) for file in files]
+
+    # Giải mã, MTCNN và ArcFace chạy trên luồng worker để không chặn event loop
+    return await frame_executor.run(_save_face_images, db, user, webcam_frame, contents)
+
+def _extract_from_image_bytes(content: bytes, filename: str) -> dict:
+    """Giải mã ảnh tải lên, trích xuất embedding và lưu ảnh (chạy trên luồng worker)."""
     nparr = np.frombuffer(content, np.uint8)
     img_bgr = cv2.imdecode(nparr, cv2.IMREAD_COLOR) # Đọc ảnh ban đầu (BGR)
 
@@ -460,7 +1655,15 @@ async def extract_face_embedding_from_upload(
             detail="Không thể giải mã ảnh. Đảm bảo đây là tệp ảnh hợp lệ."
         )
 
-    embedding_result_np, facial_area_info, error = extract_embedding(img_bgr)
+    # Ảnh đã được tải lên trước đó (cùng nội dung) dùng lại embedding trong cache
+    key = content_hash(content)
+    cached = upload_embedding_cache.get(key)
+    if cached is not None:
+        embedding_result_np, facial_area_info, error = cached, None, None
+    else:
+        embedding_result_np, facial_area_info, error = extract_embedding(img_bgr)
+        if embedding_result_np is not None:
+            upload_embedding_cache.put(key, embedding_result_np)
     print(f"DEBUG AI: embedding_result_np after extract_embedding: {embedding_result_np}")
     if embedding_result_np is not None:
         print(f"DEBUG AI: type of embedding_result_np: {type(embedding_result_np)}")
@@ -474,24 +1677,382 @@ async def extract_face_embedding_from_upload(
         return {"embedding": None, "photo_path": None, "message": "Không thể trích xuất embedding. Vui lòng kiểm tra lại ảnh."}
 
 
-    unique_filename = f"{uuid.uuid4()}_{image_file.filename}"
+    unique_filename = f"{uuid.uuid4()}_{filename}"
     file_path_on_server = os.path.join(UPLOAD_DIR, unique_filename)
     cv2.imwrite(file_path_on_server, img_bgr)
     return {
         "embedding": embedding_result_np.tolist(),
         "photo_path": file_path_on_server,
+        "pipeline_version": PIPELINE_VERSION,
         "message": "Khuôn mặt đã được xử lý và embedding trích xuất thành công."
     }
 
+# Endpoint này sẽ được Backend Chính gọi để trích xuất embedding từ một ảnh duy nhất.
+@app.post("/face-embeddings/extract")
+async def extract_face_embedding_from_upload(
+    image_file: UploadFile = File(...) # Nhận file ảnh từ request
+):
+    """
+    Nhận một file ảnh, phát hiện/trích xuất khuôn mặt, tính toán embedding,
+    và lưu ảnh vào thư mục UPLOAD_DIR.
+    """
+    if not image_file.content_type.startswith("image/"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tệp tải lên không phải là ảnh."
+        )
+
+    content = await image_file.read()
+    return await frame_executor.run(_extract_from_image_bytes, content, image_file.filename)
+
+
+# --- Đăng ký khuôn mặt hàng loạt ---
+def submit_photo(read):
+    """
+    Giải mã + phát hiện + căn chỉnh một ảnh rồi đưa khuôn mặt vào InferenceBatcher (chạy trên
+    luồng worker). Trả về (Future embedding, bytes ảnh gốc); người gọi chỉ lưu ảnh khi có embedding.
+    """
+    data = read()
+    img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("Không thể giải mã ảnh")
+    face, _, error = preprocess_image(img)
+    if error:
+        raise ValueError(error)
+    # Không chờ embedding: luồng chuyển ngay sang ảnh kế tiếp nên các khuôn mặt dồn thành lô đầy
+    return inference_batcher.submit(face), data
+
+def bulk_enroll(sources: list, db: Session, workers: int = BULK_ENROLL_WORKERS,
+                commit_size: int = BULK_ENROLL_COMMIT_SIZE, refresh_gallery: bool = True):
+    """
+    Đăng ký khuôn mặt cho nhiều thành viên từ danh sách (tên ảnh, hàm đọc bytes) của
+    enrollment.iter_photo_sources. Là generator sinh các sự kiện dạng dict:
+
+    - {"type": "start", "files"}
+    - {"type": "error", "file", "member_code", "detail"} cho mỗi ảnh lỗi (không dừng cả lượt)
+    - {"type": "progress", "processed", "files", "enrolled", "errors"} định kỳ và sau mỗi lần ghi DB
+    - {"type": "done", ...} tổng kết
+
+    Ảnh được gửi cho các luồng theo từng cửa sổ `commit_size` ảnh (số khuôn mặt và ảnh chờ trong
+    bộ nhớ không vượt quá một cửa sổ); embedding của cửa sổ được ghi trong một giao dịch cùng các
+    hàng embedding_changes, nên gallery của mọi bản sao tự cập nhật qua nhật ký thay đổi. Khi tắt
+    đọc nhật ký (CHANGE_LOG_POLL_S <= 0), `refresh_gallery` bắt kịp cache của tiến trình này cho
+    những người vừa đăng ký.
+    """
+    started = time.perf_counter()
+    member_ids = dict(db.query(User.member_code, User.id))
+    counts = {"processed": 0, "files": len(sources), "enrolled": 0, "errors": 0}
+    members = set()
+    rows = []
+
+    def progress():
+        return {"type": "progress", **counts}
+
+    def flush():
+        if rows:
+            try:
+                db.execute(FaceEmbedding.__table__.insert(), rows)
+                record_embedding_changes(db, (row["user_id"] for row in rows))
+                db.commit()
+            except Exception:
+                # Không để lại ảnh gốc không có hàng embedding nào trỏ tới
+                db.rollback()
+                for row in rows:
+                    os.remove(row["photo_path"])
+                raise
+            counts["enrolled"] += len(rows)
+            rows.clear()
+
+    yield {"type": "start", "files": len(sources)}
+    window = max(1, commit_size)
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="bulk-enroll")
+    try:
+        for start in range(0, len(sources), window):
+            pending = {}
+            for name, read in sources[start:start + window]:
+                member_code = resolve_member_code(name, member_ids)
+                if member_code is None:
+                    counts["processed"] += 1
+                    counts["errors"] += 1
+                    yield {"type": "error", "file": name, "member_code": None, "detail": "Không tìm thấy mã thành viên ứng với tên ảnh"}
+                    continue
+                pending[pool.submit(submit_photo, read)] = (name, member_code)
+
+            for future in as_completed(pending):
+                name, member_code = pending[future]
+                counts["processed"] += 1
+                try:
+                    embedding_future, data = future.result()
+                    embedding = embedding_future.result()
+                    photo_path = store_photo(data, f"{member_code}_{os.path.basename(name)}")
+                except Exception as e:
+                    counts["errors"] += 1
+                    yield {"type": "error", "file": name, "member_code": member_code, "detail": str(e)}
+                else:
+                    rows.append({"user_id": member_ids[member_code], "embedding": pack_embedding(embedding),
+                                 "model_name": EMBEDDING_MODEL_NAME, "pipeline_version": PIPELINE_VERSION,
+                                 "photo_path": photo_path})
+                    members.add(member_code)
+                if counts["processed"] % BULK_ENROLL_PROGRESS_EVERY == 0:
+                    yield progress()
+            flush()
+            yield progress()
+    finally:
+        # Client ngắt stream giữa chừng: hủy các ảnh chưa xử lý thay vì chạy hết
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    # Thu gọn những người vừa được thêm ảnh mà vượt ngưỡng (một truy vấn đếm cho cả nhóm)
+    user_ids = [member_ids[m] for m in members]
+    compacted = 0
+    if COMPACT_MAX_EMBEDDINGS > 0 and user_ids:
+        compacted = compact_gallery(db, user_ids=user_ids)["users_compacted"]
+
+    if refresh_gallery and user_ids and CHANGE_LOG_POLL_S <= 0:
+        apply_user_changes(db, user_ids)
+    yield {"type": "done", **counts, "members": len(members), "compacted": compacted,
+           "elapsed_s": round(time.perf_counter() - started, 3), "cache_version": cache_version}
+
+def _stream_bulk_enroll(archive_path: str):
+    """Chạy bulk_enroll trên tệp zip tạm và trả từng sự kiện dạng một dòng JSON (NDJSON)."""
+    db = SessionLocal()
+    try:
+        for event in bulk_enroll(iter_photo_sources(archive_path), db):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    finally:
+        db.close()
+        os.remove(archive_path)
+
+@app.post("/enroll/bulk")
+async def bulk_enroll_endpoint(archive: UploadFile = File(...)):
+    """
+    Đăng ký khuôn mặt hàng loạt từ một tệp .zip ảnh đặt tên theo member_code (xem enrollment.py).
+    Kết quả được trả dần dạng NDJSON (application/x-ndjson): tiến độ, lỗi từng ảnh và tổng kết.
+    Với thư mục ảnh có sẵn trên máy chủ, dùng `python enroll.py <thư mục>`.
+    """
+    # Chép tệp tải lên ra tệp tạm vì tệp của request bị đóng trước khi phản hồi stream xong
+    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
+        await asyncio.to_thread(shutil.copyfileobj, archive.file, tmp)
+    if not zipfile.is_zipfile(tmp.name):
+        os.remove(tmp.name)
+        raise HTTPException(status_code=400, detail="Tệp tải lên không phải tệp zip hợp lệ.")
+    return StreamingResponse(_stream_bulk_enroll(tmp.name), media_type="application/x-ndjson")
+
 
 @app.post("/reload-embedding-cache")
-async def reload_embedding_cache_endpoint(db: Session = Depends(get_db)):
+def reload_embedding_cache_endpoint(db: Session = Depends(get_db)):
     """
     Endpoint để kích hoạt việc tải lại toàn bộ embedding cache.
-    Chỉ được gọi bởi Backend Admin sau khi DB đã được cập nhật.
+    Chỉ được gọi bởi Backend Admin sau khi DB đã được cập nhật. Hàm thường (không async):
+    FastAPI chạy trên threadpool nên việc nạp lại không chặn event loop.
     """
     print("DEBUG (AI Service): Nhận được yêu cầu tải lại embedding cache...")
     # Gọi hàm tải lại cache toàn cục
     load_embedding_cache(db) 
     print("DEBUG (AI Service): Đã tải lại embedding cache thành công.")
+    if GALLERY_SNAPSHOT_DIR and not GALLERY_SHARED:
+        save_snapshot_in_background()
     return {"status": "success", "message": "Embedding cache reloaded."}
+
+
+@app.post("/gallery/users/{user_id}")
+def upsert_gallery_user_endpoint(user_id: int, db: Session = Depends(get_db)):
+    """
+    Cập nhật tại chỗ embedding của một người dùng trong cache từ DB.
+    Backend Admin không còn gọi trực tiếp (cache tự cập nhật qua nhật ký embedding_changes); dùng khi cần ép cập nhật ngay.
+    """
+    compact_user_if_needed(db, user_id)
+    count = refresh_user_in_cache(db, user_id)
+    return {"status": "success", "user_id": user_id, "embeddings": count, "cache_version": cache_version}
+
+
+@app.post("/gallery/compact")
+def compact_gallery_endpoint(min_embeddings: int = COMPACT_MAX_EMBEDDINGS, user_id: int | None = None,
+                             dry_run: bool = False):
+    """
+    Thu gọn gallery theo yêu cầu: mỗi người dùng có nhiều hơn `min_embeddings` embedding (hoặc chỉ
+    `user_id`) còn centroid + COMPACT_MEDOIDS medoid, bỏ ngoại lai. `dry_run=true` chỉ trả báo cáo.
+    Chạy trọn trên một luồng của threadpool với session riêng; cache của mọi bản sao được cập nhật
+    theo các hàng embedding_changes mà compact_user ghi (chỉ những người đã thu gọn).
+    """
+    db = SessionLocal()
+    try:
+        report = compact_gallery(db, min_embeddings, [user_id] if user_id is not None else None, dry_run)
+        if report["users_compacted"] and not dry_run and CHANGE_LOG_POLL_S <= 0:
+            # Không đọc nhật ký thay đổi: tự bắt kịp những người vừa thu gọn
+            apply_user_changes(db, [r["user_id"] for r in report["users"]])
+    finally:
+        db.close()
+    return {"status": "success", **report, "cache_version": cache_version}
+
+
+@app.delete("/gallery/users/{user_id}")
+def remove_gallery_user_endpoint(user_id: int):
+    """Xóa một người dùng khỏi cache ngay, không chờ nhật ký embedding_changes."""
+    removed = remove_user_from_cache(user_id)
+    return {"status": "success", "user_id": user_id, "removed": removed, "cache_version": cache_version}
+
+
+@app.post("/gallery/snapshot")
+def gallery_snapshot_endpoint(db: Session = Depends(get_db)):
+    """Bắt kịp DB rồi ghi snapshot gallery ngay (khi bật, snapshot còn được ghi lúc khởi động, tải lại và tắt)."""
+    if not GALLERY_SNAPSHOT_DIR:
+        raise HTTPException(status_code=400, detail="Snapshot gallery đang tắt (GALLERY_SNAPSHOT_DIR trống)")
+    name = write_gallery_snapshot(db)
+    return {"status": "success", "snapshot": name, "cache_version": cache_version}
+
+
+@app.get("/stats")
+async def stats_endpoint():
+    """Thống kê vận hành: hàng đợi xử lý khung hình, phiên kiosk, độ lấp đầy lô ArcFace và kích thước gallery."""
+    return {
+        "frame_executor": frame_executor.stats(),
+        "kiosk_sessions": kiosk_sessions.stats(),
+        "websocket": dict(websocket_stats),
+        "tracking": tracking_stats.stats(),
+        "embedding_lru": {
+            "faces": face_embedding_cache.stats(),
+            "uploads": upload_embedding_cache.stats(),
+        },
+        "inference": inference_batcher.stats(),
+        "gallery": {
+            "users": len(embedding_cache) if embedding_cache is not None else 0,
+            "embeddings": embedding_cache.num_embeddings if embedding_cache is not None else 0,
+            "cache_version": cache_version,
+            "pipeline_version": PIPELINE_VERSION,
+            "active_pipeline_version": active_gallery_version,
+            "quantization": GALLERY_QUANTIZATION,
+            "snapshot": snapshot_state["name"],
+            "change_log": change_cursor.stats() if change_cursor is not None else None,
+            **(embedding_cache.memory_stats() if embedding_cache is not None else {}),
+        },
+    }
+
+
+@app.get("/calibration")
+async def calibration_endpoint():
+    """Ngưỡng đang dùng và báo cáo hiệu chỉnh gần nhất (FAR/FRR, EER, ngưỡng khuyến nghị)."""
+    with _calibration_lock:
+        state = dict(calibration_state)
+    return {
+        "mode": THRESHOLD_CALIBRATION,
+        "thresholds": {"cosine": COSINE_SIMILARITY_THRESHOLD, "euclidean": EUCLIDEAN_DISTANCE_THRESHOLD},
+        **state,
+    }
+
+@app.post("/calibration")
+async def start_calibration_endpoint(apply: bool = False):
+    """Chạy lại hiệu chỉnh trên gallery hiện tại (nền); `apply` để áp dụng ngưỡng khuyến nghị."""
+    if not start_calibration(apply):
+        raise HTTPException(status_code=409, detail="Đang hiệu chỉnh ngưỡng")
+    return {"status": "started", "apply": apply}
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Số đo dạng text của Prometheus: thời gian từng bước, trạng thái khung hình, kích thước gallery (xem metrics.py)."""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
+
+
+# --- Nhận diện qua WebSocket ---
+websocket_stats = {"connections": 0, "frames": 0, "dropped": 0, "busy": 0}
+
+def _process_frame_bytes_with_db(img_data, session: RecognitionSession, return_frame: bool = False):
+    """
+    process_frame_bytes với một Session DB riêng cho khung hình: Session SQLAlchemy không an toàn
+    luồng, còn các khung hình của một kết nối WebSocket chạy trên các luồng khác nhau của
+    frame_executor (và có thể còn chạy sau khi kết nối đóng).
+    """
+    db = SessionLocal()
+    try:
+        return process_frame_bytes(img_data, db, session, return_frame)
+    finally:
+        db.close()
+
+@app.websocket("/ws/recognize")
+async def recognize_websocket(websocket: WebSocket, kiosk_id: str | None = None, return_frame: bool = False):
+    """
+    Kênh nhận diện liên tục cho một kiosk.
+
+    - Kiosk gửi khung hình JPEG dạng tin nhắn nhị phân; server trả về tin nhắn JSON
+      {"type": "result", "seq", "dropped", "status", "full_name", "facial_area", ...} cho mỗi khung
+      hình được xử lý (`seq` là số thứ tự khung hình trên kết nối, bắt đầu từ 1; ảnh đã vẽ hộp chỉ
+      gửi kèm khi kết nối với `?return_frame=true`).
+    - Chỉ khung hình MỚI NHẤT được xử lý: khung hình đến khi khung trước còn đang chờ sẽ
+      thay thế nó (đếm trong "dropped") thay vì xếp hàng.
+    - Phiên bỏ phiếu gắn với kết nối: tạo mới khi kết nối và xóa khi ngắt kết nối. Mã phiên
+      được gửi trong tin nhắn {"type": "session"} và dùng được cho /confirm-attendance. Kiosk kết
+      nối lại trước khi kết nối cũ đóng hẳn thì kết nối cũ không xóa phiên của kết nối mới.
+    - Xác nhận điểm danh ngay trên kết nối: {"type": "confirm", "member_code": "..."}.
+    """
+    await websocket.accept()
+    session_id = kiosk_id or f"ws-{uuid.uuid4()}"
+    session = kiosk_sessions.create(session_id)
+    with session.lock:
+        session.reset()
+    latest = {"frame": None, "seq": 0, "dropped": 0}
+    frame_ready = asyncio.Event()
+    websocket_stats["connections"] += 1
+
+    async def process_frames():
+        try:
+            await _process_latest_frames()
+        except (WebSocketDisconnect, RuntimeError):
+            pass # Kết nối đã đóng trong lúc gửi kết quả
+
+    async def _process_latest_frames():
+        while True:
+            await frame_ready.wait()
+            frame_ready.clear()
+            img_data, seq = latest["frame"], latest["seq"]
+            latest["frame"] = None
+            if img_data is None:
+                continue
+            try:
+                result = await frame_executor.run(_process_frame_bytes_with_db, img_data, session, return_frame,
+                                                  max_wait_ms=FRAME_MAX_WAIT_MS)
+            except QueueFullError as e:
+                websocket_stats["busy"] += 1
+                await websocket.send_json({"type": "busy", "seq": seq, "detail": str(e), "retry_after": e.retry_after})
+                continue
+            await websocket.send_json({"type": "result", "seq": seq, "dropped": latest["dropped"], **result})
+
+    async def handle_command(message: dict):
+        if message.get("type") != "confirm":
+            await websocket.send_json({"type": "error", "detail": "Lệnh không hợp lệ"})
+            return
+        confirm_db = SessionLocal()
+        try:
+            result = await asyncio.to_thread(confirm_session_attendance, confirm_db, session, str(message.get("member_code", "")))
+            await websocket.send_json({"type": "confirmed", **result})
+        except HTTPException as e:
+            await websocket.send_json({"type": "error", "status_code": e.status_code, "detail": e.detail})
+        finally:
+            confirm_db.close()
+
+    worker = asyncio.create_task(process_frames())
+    try:
+        await websocket.send_json({"type": "session", "session_id": session_id})
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes") is not None:
+                websocket_stats["frames"] += 1
+                if latest["frame"] is not None:
+                    latest["dropped"] += 1 # Khung hình cũ chưa được xử lý bị thay bằng khung hình mới
+                    websocket_stats["dropped"] += 1
+                latest["frame"] = message["bytes"]
+                latest["seq"] += 1
+                frame_ready.set()
+            elif message.get("text"):
+                try:
+                    command = json.loads(message["text"])
+                except json.JSONDecodeError:
+                    command = {}
+                await handle_command(command if isinstance(command, dict) else {})
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        worker.cancel()
+        websocket_stats["connections"] -= 1
+        kiosk_sessions.discard(session_id, session)
@@ -0,0 +1,62 @@
+# backend-ai/metrics.py
+"""
+Số đo Prometheus của dịch vụ AI, xuất ở GET /metrics (định dạng text của Prometheus).
+
+- face_stage_seconds{stage}: thời gian từng bước của process_frame / extract_embedding:
+    decode     base64.b64decode data URL (process_frame)
+    imdecode   cv2.imdecode khung hình
+    detect     bộ phát hiện khuôn mặt (MTCNN/Haar/YuNet) trên khung hình
+    track      theo dõi bằng template matching thay cho phát hiện (FACE_TRACKING)
+    align      cắt, xoay theo mắt, resize, CLAHE
+    embedding  lấy embedding (cache dHash + chờ InferenceBatcher, gồm cả thời gian xếp hàng)
+    search     so khớp với gallery
+    vote       bỏ phiếu trong phiên kiosk
+    db_reload  nạp lại gallery từ DB khi cache trống
+    db_confirm ghi điểm danh (/confirm-attendance)
+- face_frame_seconds: toàn bộ process_frame_bytes của một khung hình.
+- face_inference_batch_seconds: một lượt ArcFace trên cả lô của InferenceBatcher.
+- face_frame_status_total{status}: kết quả khung hình theo trạng thái trả về; phần chi tiết sau
+  dấu ":" (nội dung ngoại lệ) bị bỏ để số nhãn không tăng vô hạn.
+- face_gallery_users / face_gallery_embeddings / face_cache_version: đọc lúc Prometheus lấy số đo.
+- face_cache_reload_seconds: thời gian lần nạp lại gallery gần nhất (và histogram mọi lần nạp).
+
+Mỗi tiến trình uvicorn có bộ đếm riêng; Prometheus lấy số đo của từng tiến trình.
+"""
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# Từ dưới 1 ms (giải mã, tìm kiếm gallery nhỏ) tới vài giây (MTCNN trên CPU khi quá tải)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+STAGE_SECONDS = Histogram("face_stage_seconds", "Thời gian từng bước của pipeline nhận diện",
+                          ["stage"], buckets=LATENCY_BUCKETS)
+FRAME_SECONDS = Histogram("face_frame_seconds", "Thời gian xử lý một khung hình (process_frame_bytes)",
+                          buckets=LATENCY_BUCKETS)
+INFERENCE_BATCH_SECONDS = Histogram("face_inference_batch_seconds", "Thời gian một lượt ArcFace trên cả lô",
+                                    buckets=LATENCY_BUCKETS)
+FRAME_STATUS = Counter("face_frame_status", "Số khung hình theo trạng thái kết quả", ["status"])
+
+GALLERY_USERS = Gauge("face_gallery_users", "Số người dùng trong gallery")
+GALLERY_EMBEDDINGS = Gauge("face_gallery_embeddings", "Số embedding trong gallery")
+CACHE_VERSION = Gauge("face_cache_version", "Phiên bản cache gallery (tăng mỗi lần thay đổi)")
+CACHE_RELOAD_SECONDS = Gauge("face_cache_reload_seconds", "Thời gian lần nạp lại gallery gần nhất")
+CACHE_RELOADS = Histogram("face_cache_reload_duration_seconds", "Thời gian nạp lại gallery từ DB",
+                          buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0))
+
+
+def stage_timer(stage: str):
+    """Context manager đo một bước: `with stage_timer("detect"): ...`."""
+    return STAGE_SECONDS.labels(stage=stage).time()
+
+
+def record_status(status: str) -> None:
+    FRAME_STATUS.labels(status=status.split(":", 1)[0].strip()).inc()
+
+
+def record_cache_reload(seconds: float) -> None:
+    CACHE_RELOAD_SECONDS.set(seconds)
+    CACHE_RELOADS.observe(seconds)
+
+
+def render() -> tuple:
+    """(nội dung, content type) cho GET /metrics."""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -0,0 +1,175 @@
+# backend-ai/reembed.py
+"""
+Tính lại embedding của mọi ảnh gốc đã lưu (cột photo_path, thư mục uploaded_photos) bằng
+pipeline của mã hiện tại (main.PIPELINE_VERSION).
+
+Quy trình khi đổi mô hình hoặc preprocess_image (CLAHE, lề cắt, ...):
+1. Sửa mã và tăng PIPELINE_VERSION trong main.py.
+2. Chạy job bằng mã MỚI trong container backend-ai, dịch vụ cũ vẫn phục vụ gallery cũ:
+       python reembed.py --workers 4
+   Embedding mới được ghi thành hàng mới (pipeline_version mới) bên cạnh hàng cũ nên gallery
+   cũ không bị ảnh hưởng. Checkpoint (id hàng nguồn cuối cùng đã xử lý) được ghi vào bảng
+   gallery_settings trong CÙNG giao dịch với các hàng mới: job bị dừng giữa chừng thì chạy lại
+   đúng lệnh đó để tiếp tục, không tính trùng ảnh nào.
+3. Triển khai các bản sao chạy mã mới bên cạnh bản cũ. Dịch vụ chỉ nhận diện khi con trỏ
+   `active_pipeline_version` trùng PIPELINE_VERSION của mã nó chạy, nên bản mới nạp gallery mới
+   nhưng từ chối khung hình cho tới bước 4.
+4. Khi xong (có thể gộp vào bước 2):
+       python reembed.py --activate
+   Xử lý nốt các ảnh mới thêm trong lúc chạy, kiểm tra mọi thành viên đều có embedding phiên
+   bản mới rồi chuyển con trỏ bằng một lệnh ghi duy nhất. Trong vòng CHANGE_LOG_POLL_S giây bản
+   cũ ngừng nhận diện và bản mới bắt đầu nhận diện; sau đó gỡ các bản cũ.
+
+Người dùng đã thu gọn (/gallery/compact) được tính lại từ ảnh gốc của các medoid còn giữ; hàng
+centroid không có ảnh gốc nên không được tính lại ("centroids" trong sự kiện start) và được tạo lại
+khi người dùng đó được thu gọn ở phiên bản mới.
+
+Hàng của phiên bản cũ được giữ lại: chuyển con trỏ về phiên bản cũ (khi bản cũ còn chạy, hoặc
+triển khai lại mã cũ) để quay lui.
+Mỗi sự kiện (tiến độ, lỗi từng ảnh, tổng kết) được in ra một dòng JSON như enroll.py.
+"""
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func
+
+import main
+from enroll import notify_reload
+from enrollment import read_file
+
+FaceEmbedding = main.FaceEmbedding
+
+
+def checkpoint_key(source_version: str, target_version: str) -> str:
+    return f"reembed:{source_version}->{target_version}"
+
+
+def load_checkpoint(db, key: str) -> dict:
+    value = main.get_setting(db, key)
+    return json.loads(value) if value else {"last_id": 0, "processed": 0, "reembedded": 0, "errors": 0}
+
+
+def source_rows(db, source_version: str, after_id: int, limit: int) -> list:
+    return (db.query(FaceEmbedding.id, FaceEmbedding.user_id, FaceEmbedding.photo_path)
+            .filter(FaceEmbedding.pipeline_version == source_version,
+                    FaceEmbedding.photo_path.isnot(None),
+                    FaceEmbedding.id > after_id)
+            .order_by(FaceEmbedding.id)
+            .limit(limit)
+            .all())
+
+
+def reembed_chunk(pool, rows: list, target_version: str):
+    """Tính lại embedding cho một nhóm hàng nguồn. Trả về (hàng mới, danh sách lỗi)."""
+    futures = [pool.submit(main.submit_photo, lambda p=row.photo_path: read_file(p)) for row in rows]
+    new_rows, errors = [], []
+    for row, future in zip(rows, futures):
+        try:
+            embedding_future, _ = future.result()
+            embedding = embedding_future.result()
+        except Exception as e:
+            errors.append({"type": "error", "embedding_id": row.id, "user_id": row.user_id,
+                           "photo_path": row.photo_path, "detail": str(e)})
+            continue
+        new_rows.append({"user_id": row.user_id, "embedding": main.pack_embedding(embedding),
+                         "model_name": main.EMBEDDING_MODEL_NAME, "pipeline_version": target_version,
+                         "photo_path": row.photo_path})
+    return new_rows, errors
+
+
+def run_reembed(db, source_version: str, target_version: str, workers: int, chunk_size: int):
+    """Generator sự kiện: xử lý mọi hàng nguồn sau checkpoint, mỗi nhóm một giao dịch (kèm checkpoint)."""
+    key = checkpoint_key(source_version, target_version)
+    checkpoint = load_checkpoint(db, key)
+    without_photo = dict(db.query(FaceEmbedding.kind, func.count(FaceEmbedding.id))
+                         .filter(FaceEmbedding.pipeline_version == source_version, FaceEmbedding.photo_path.is_(None))
+                         .group_by(FaceEmbedding.kind))
+    yield {"type": "start", "source_version": source_version, "target_version": target_version,
+           "resumed_from_id": checkpoint["last_id"],
+           "without_photo": without_photo.get(main.EMBEDDING_KIND_SAMPLE, 0),
+           "centroids": without_photo.get(main.EMBEDDING_KIND_CENTROID, 0)}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="reembed") as pool:
+        while True:
+            rows = source_rows(db, source_version, checkpoint["last_id"], chunk_size)
+            if not rows:
+                break
+            new_rows, errors = reembed_chunk(pool, rows, target_version)
+            for error in errors:
+                yield error
+            checkpoint["last_id"] = rows[-1].id
+            checkpoint["processed"] += len(rows)
+            checkpoint["reembedded"] += len(new_rows)
+            checkpoint["errors"] += len(errors)
+            if new_rows:
+                db.execute(FaceEmbedding.__table__.insert(), new_rows)
+                main.record_embedding_changes(db, (row["user_id"] for row in new_rows))
+            main.set_setting(db, key, json.dumps(checkpoint))
+            db.commit()
+            yield {"type": "progress", **checkpoint}
+    yield {"type": "done", **checkpoint}
+
+
+def users_missing_target(db, source_version: str, target_version: str) -> list:
+    """Id các thành viên có embedding phiên bản nguồn nhưng chưa có embedding phiên bản đích."""
+    has_target = db.query(FaceEmbedding.user_id).filter(FaceEmbedding.pipeline_version == target_version)
+    return [user_id for (user_id,) in db.query(FaceEmbedding.user_id)
+            .filter(FaceEmbedding.pipeline_version == source_version, FaceEmbedding.user_id.notin_(has_target))
+            .distinct()
+            .order_by(FaceEmbedding.user_id)]
+
+
+def emit(event: dict) -> None:
+    print(json.dumps(event, ensure_ascii=False), flush=True)
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source-version", default=None,
+                        help="Phiên bản cần tính lại (mặc định: phiên bản gallery đang kích hoạt)")
+    parser.add_argument("--workers", type=int, default=main.BULK_ENROLL_WORKERS, help="Số luồng phát hiện khuôn mặt")
+    parser.add_argument("--chunk-size", type=int, default=main.BULK_ENROLL_COMMIT_SIZE,
+                        help="Số ảnh mỗi giao dịch (và mỗi lần ghi checkpoint)")
+    parser.add_argument("--activate", action="store_true", help="Chuyển gallery sang phiên bản mới khi xong")
+    parser.add_argument("--force", action="store_true",
+                        help="Vẫn chuyển phiên bản dù có thành viên chưa có embedding mới")
+    parser.add_argument("--notify", default="", help="URL dịch vụ AI cần tải lại gallery sau khi chuyển")
+    args = parser.parse_args()
+
+    target_version = main.PIPELINE_VERSION
+    db = main.SessionLocal()
+    try:
+        source_version = args.source_version or main.active_pipeline_version(db)
+        if source_version == target_version:
+            emit({"type": "done", "detail": f"Gallery đang kích hoạt đã là phiên bản '{target_version}'"})
+            return
+
+        main.load_arcface_model()
+        main.inference_batcher.start()
+        for event in run_reembed(db, source_version, target_version, args.workers, args.chunk_size):
+            emit(event)
+
+        if not args.activate:
+            return
+        missing = users_missing_target(db, source_version, target_version)
+        if missing and not args.force:
+            emit({"type": "error", "detail": "Chưa chuyển phiên bản: có thành viên chưa có embedding mới "
+                                             "(thiếu ảnh gốc hoặc ảnh lỗi); dùng --force để vẫn chuyển",
+                  "user_ids": missing})
+            sys.exit(1)
+        # Một lệnh ghi duy nhất: mọi tiến trình đọc con trỏ sẽ thấy hoặc phiên bản cũ, hoặc phiên bản mới
+        main.set_setting(db, main.ACTIVE_PIPELINE_KEY, target_version)
+        db.commit()
+        emit({"type": "activated", "pipeline_version": target_version, "previous_version": source_version,
+              "users_without_embedding": missing})
+    finally:
+        db.close()
+
+    if args.notify:
+        emit({"type": "notify", "url": args.notify, **notify_reload(args.notify)})
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,218 @@
+# backend-ai/sessions.py
+"""
+Trạng thái nhận diện theo từng kiosk.
+
+Mỗi kiosk (định danh bằng `kiosk_id`) có phiên riêng: hàng đợi bỏ phiếu các khung
+hình gần nhất, người được nhận diện gần nhất và thời điểm nhận diện. Nhờ vậy nhiều
+kiosk cùng gửi khung hình tới một tiến trình mà không làm sai lệch phiếu của nhau, và
+`/confirm-attendance` chỉ xác nhận kết quả của đúng kiosk đó.
+
+Các phiên được giữ trong một OrderedDict theo thứ tự truy cập gần nhất: phiên không
+hoạt động quá `ttl_seconds` bị loại, và khi vượt `max_sessions` thì phiên cũ nhất bị loại.
+
+Khi chạy nhiều worker uvicorn, các khung hình của cùng một kiosk có thể tới các tiến trình
+khác nhau. Với `shared_dir` (ví dụ /dev/shm/face-kiosk-sessions), hàng đợi phiếu và kết quả
+nhận diện của mỗi kiosk nằm trong một tệp JSON nhỏ dùng chung: `session.lock` giữ khóa tệp
+(fcntl.flock), nạp trạng thái khi vào và ghi lại khi ra. Bộ theo dõi khuôn mặt vẫn là của
+từng tiến trình (tiến trình khác chỉ phải phát hiện lại).
+"""
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+
+from tracking import FaceTracker
+
+DEFAULT_KIOSK_ID = "default"
+
+
+class RecognitionSession:
+    """
+    Trạng thái bỏ phiếu và theo dõi khuôn mặt của một kiosk.
+    `lock` bảo vệ hàng đợi phiếu và `tracker` khi các khung hình của cùng kiosk chạy song song;
+    với `state_path`, đó là khóa dùng chung giữa các tiến trình (SharedStateLock).
+    """
+
+    def __init__(self, kiosk_id: str, window: int = 5, state_path: str | None = None, ttl_seconds: float = 300.0):
+        self.kiosk_id = kiosk_id
+        self.frame_queue = deque(maxlen=window)
+        self.best_member_code = None
+        self.recognition_time: datetime | None = None
+        self.tracker = FaceTracker()
+        self.last_seen = time.monotonic()
+        self.lock = SharedStateLock(self, state_path, ttl_seconds) if state_path else threading.Lock()
+
+    def reset(self) -> None:
+        self.frame_queue.clear()
+        self.best_member_code = None
+        self.recognition_time = None
+        self.tracker.reset()
+
+
+class SharedStateLock:
+    """
+    Khóa phiên dùng chung giữa các tiến trình. Khi vào: khóa luồng, khóa tệp trạng thái của kiosk
+    rồi nạp hàng đợi phiếu / kết quả nhận diện vào phiên; khi ra: ghi lại và mở khóa. Trạng thái
+    không được ghi quá `ttl_seconds` coi như phiên đã hết hạn.
+    """
+
+    def __init__(self, session: RecognitionSession, path: str, ttl_seconds: float):
+        self._session = session
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._local = threading.Lock()
+        self._fd = None
+
+    def _read(self) -> dict:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        chunks = []
+        while chunk := os.read(self._fd, 65536):
+            chunks.append(chunk)
+        try:
+            state = json.loads(b"".join(chunks)) if chunks else {}
+        except ValueError:
+            state = {}
+        return state if time.time() - state.get("updated_at", 0) <= self._ttl_seconds else {}
+
+    def __enter__(self):
+        self._local.acquire()
+        try:
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            state = self._read()
+        except BaseException:
+            self._close()
+            raise
+        session = self._session
+        session.frame_queue.clear()
+        session.frame_queue.extend(state.get("votes", []))
+        session.best_member_code = state.get("best_member_code")
+        recognized_at = state.get("recognition_time")
+        session.recognition_time = datetime.fromisoformat(recognized_at) if recognized_at else None
+        return self
+
+    def __exit__(self, *exc_info):
+        session = self._session
+        try:
+            data = json.dumps({
+                "votes": list(session.frame_queue),
+                "best_member_code": session.best_member_code,
+                "recognition_time": session.recognition_time.isoformat() if session.recognition_time else None,
+                "updated_at": time.time(),
+            }).encode("utf-8")
+            os.ftruncate(self._fd, 0)
+            os.pwrite(self._fd, data, 0)
+        finally:
+            self._close()
+        return False
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd) # Đóng tệp cũng nhả khóa flock
+            self._fd = None
+        self._local.release()
+
+
+class SessionStore:
+    """
+    Kho phiên theo kiosk_id, an toàn luồng, có TTL và giới hạn kích thước. Với `shared_dir`,
+    trạng thái bỏ phiếu của phiên được dùng chung giữa các tiến trình (xem SharedStateLock).
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_sessions: int = 1000, window: int = 5,
+                 shared_dir: str | None = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max(1, max_sessions)
+        self.window = window
+        self.shared_dir = shared_dir or None
+        if self.shared_dir:
+            os.makedirs(self.shared_dir, exist_ok=True)
+        self._sessions: OrderedDict[str, RecognitionSession] = OrderedDict()
+        self._lock = threading.Lock()
+        self._evicted = 0
+
+    def _evict_expired(self, now: float) -> None:
+        # Phiên đầu OrderedDict là phiên lâu không hoạt động nhất
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if now - oldest.last_seen <= self.ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self._evicted += 1
+
+    def get_or_create(self, kiosk_id: str) -> RecognitionSession:
+        """Lấy phiên của kiosk (tạo mới nếu chưa có hoặc đã hết hạn) và đánh dấu vừa hoạt động."""
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            session = self._sessions.get(kiosk_id)
+            if session is None:
+                session = self._insert(kiosk_id)
+            else:
+                self._sessions.move_to_end(kiosk_id)
+            session.last_seen = now
+            return session
+
+    def create(self, kiosk_id: str) -> RecognitionSession:
+        """
+        Tạo phiên mới cho kiosk, thay phiên đang lưu (nếu có). Người giữ phiên cũ vẫn dùng được
+        đối tượng cũ nhưng không còn xóa được phiên mới (xem `discard`).
+        """
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            self._sessions.pop(kiosk_id, None)
+            return self._insert(kiosk_id)
+
+    def _insert(self, kiosk_id: str) -> RecognitionSession:
+        session = self._new_session(kiosk_id)
+        self._sessions[kiosk_id] = session
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self._evicted += 1
+        return session
+
+    def _new_session(self, kiosk_id: str) -> RecognitionSession:
+        state_path = None
+        if self.shared_dir:
+            # Tên tệp băm từ kiosk_id (do client gửi) để không thể thoát khỏi thư mục
+            state_path = os.path.join(self.shared_dir, hashlib.sha1(kiosk_id.encode("utf-8")).hexdigest() + ".json")
+        return RecognitionSession(kiosk_id, window=self.window, state_path=state_path, ttl_seconds=self.ttl_seconds)
+
+    def get(self, kiosk_id: str) -> RecognitionSession | None:
+        """
+        Lấy phiên còn hiệu lực của kiosk mà không tạo mới. Với trạng thái dùng chung, phiên có
+        thể do tiến trình khác tạo nên luôn trả về một phiên (trạng thái đọc từ tệp khi khóa).
+        """
+        if self.shared_dir:
+            return self.get_or_create(kiosk_id)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            session = self._sessions.get(kiosk_id)
+            if session is not None:
+                self._sessions.move_to_end(kiosk_id)
+                session.last_seen = now
+            return session
+
+    def discard(self, kiosk_id: str, session: RecognitionSession | None = None) -> None:
+        """Xóa phiên của kiosk; với `session`, chỉ xóa khi phiên đang lưu vẫn là đối tượng đó."""
+        with self._lock:
+            if session is None or self._sessions.get(kiosk_id) is session:
+                self._sessions.pop(kiosk_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            return {
+                "active": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "ttl_seconds": self.ttl_seconds,
+                "evicted": self._evicted,
+            }
@@ -0,0 +1,176 @@
+# backend-ai/snapshot.py
+"""
+Snapshot nhị phân của gallery để khởi động lạnh nhanh.
+
+Mỗi snapshot là một thư mục phiên bản trong GALLERY_SNAPSHOT_DIR:
+
+    CURRENT                 tên phiên bản đang dùng (ghi đè nguyên tử bằng os.replace)
+    v<mili giây>/
+        matrix.npy          (N, D) float32, các hàng gom theo người dùng
+        row_users.npy       (N,) int64, user_id của từng hàng
+        versions.npy        (U, 3) int64: user_id, số embedding, id embedding lớn nhất trong DB
+        users.json          [[user_id, member_code, full_name], ...]
+        meta.json           định dạng, phiên bản pipeline, số hàng, thời điểm tạo
+
+Thư mục được ghi dưới tên tạm rồi đổi tên, sau đó mới trỏ CURRENT tới nó: tiến trình bị dừng
+giữa chừng không bao giờ để lại snapshot dở. Khi nạp, matrix.npy được ánh xạ bộ nhớ ở chế độ
+copy-on-write (mmap_mode="c"): không đọc cả tệp lúc khởi động, và các cập nhật gallery sau đó
+không ghi ngược vào snapshot.
+
+"versions" cho phép bắt kịp DB mà không tải lại blob embedding: một người dùng thay đổi
+(thêm, xóa, thu gọn embedding) khi số embedding hoặc id lớn nhất của họ trong DB khác snapshot.
+
+Với nhiều worker (GALLERY_SHARED), mỗi snapshot là một "thế hệ" gallery dùng chung: worker
+ánh xạ matrix.npy chỉ đọc (mmap_mode="r") nên các tiến trình dùng chung trang trong page cache
+của hệ điều hành. Snapshot không bao giờ bị sửa tại chỗ; thay đổi được công bố bằng một thế hệ
+mới, dưới `snapshot_lock` để chỉ một tiến trình ghi tại một thời điểm.
+"""
+import fcntl
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+
+SNAPSHOT_FORMAT = 1
+CURRENT_FILE = "CURRENT"
+LOCK_FILE = ".lock"
+KEEP_SNAPSHOTS = 2 # Giữ thêm bản trước để quay lui nếu bản mới có vấn đề
+
+
+def _write_json(path: str, value) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(value, f, ensure_ascii=False)
+
+
+def current_snapshot_name(directory: str) -> str | None:
+    """Tên phiên bản mà CURRENT đang trỏ tới (None nếu chưa có snapshot)."""
+    try:
+        with open(os.path.join(directory, CURRENT_FILE), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def clear_current_snapshot(directory: str) -> None:
+    """Bỏ CURRENT (gallery trống): lần nạp sau coi như chưa có snapshot."""
+    try:
+        os.remove(os.path.join(directory, CURRENT_FILE))
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def snapshot_lock(directory: str):
+    """Khóa độc quyền giữa các tiến trình (fcntl.flock) cho việc công bố snapshot mới."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, LOCK_FILE), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def save_snapshot(directory: str, gallery, versions: dict, pipeline_version: str) -> str | None:
+    """
+    Ghi snapshot của `gallery` (`versions`: user_id -> (số embedding, id lớn nhất)) và trỏ
+    CURRENT tới nó. Trả về tên phiên bản, hoặc None nếu gallery trống.
+    """
+    if not len(gallery):
+        return None
+    os.makedirs(directory, exist_ok=True)
+    name = f"v{int(time.time() * 1000)}"
+    while os.path.exists(os.path.join(directory, name)): # Hai lần công bố trong cùng mili giây
+        name = f"v{int(name[1:]) + 1}"
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    os.makedirs(tmp_path)
+    try:
+        outputs = []
+
+        def open_matrix(rows, dim):
+            outputs.append(np.lib.format.open_memmap(os.path.join(tmp_path, "matrix.npy"), mode="w+",
+                                                     dtype=np.float32, shape=(rows, dim)))
+            return outputs[0]
+
+        row_user_ids, users = gallery.export(open_matrix)
+        outputs[0].flush()
+        del outputs[:]
+        np.save(os.path.join(tmp_path, "row_users.npy"), row_user_ids)
+        user_ids = [u["user_id"] for u in users]
+        np.save(os.path.join(tmp_path, "versions.npy"),
+                np.array([(uid, *versions.get(uid, (0, 0))) for uid in user_ids], dtype=np.int64).reshape(-1, 3))
+        _write_json(os.path.join(tmp_path, "users.json"), [[u["user_id"], u["member_code"], u["full_name"]] for u in users])
+        _write_json(os.path.join(tmp_path, "meta.json"), {
+            "format": SNAPSHOT_FORMAT,
+            "pipeline_version": pipeline_version,
+            "rows": int(len(row_user_ids)),
+            "users": len(users),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        })
+        os.rename(tmp_path, os.path.join(directory, name))
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    current_tmp = os.path.join(directory, f".{CURRENT_FILE}.tmp")
+    with open(current_tmp, "w", encoding="utf-8") as f:
+        f.write(name)
+    os.replace(current_tmp, os.path.join(directory, CURRENT_FILE))
+    _prune(directory, keep=name)
+    return name
+
+
+def _prune(directory: str, keep: str) -> None:
+    """Xóa các phiên bản cũ (và thư mục tạm bị bỏ dở), giữ KEEP_SNAPSHOTS bản mới nhất."""
+    versions = sorted((n for n in os.listdir(directory) if n.startswith("v")), key=lambda n: int(n[1:]) if n[1:].isdigit() else 0)
+    for name in versions[:-KEEP_SNAPSHOTS]:
+        if name != keep:
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        # Thư mục tạm quá một giờ là của lần ghi bị dừng giữa chừng, không phải lần ghi đang chạy
+        if name.startswith(".v") and name.endswith(".tmp") and time.time() - os.path.getmtime(path) > 3600:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_snapshot(directory: str, pipeline_version: str, name: str | None = None,
+                  read_only: bool = False) -> dict | None:
+    """
+    Nạp snapshot `name` (mặc định bản mà CURRENT trỏ tới). Trả về dict (name, meta, matrix,
+    row_user_ids, users, versions) hoặc None nếu không có snapshot hợp lệ cho `pipeline_version`.
+    `read_only`: ánh xạ ma trận chỉ đọc (dùng chung trang giữa các tiến trình) thay vì copy-on-write.
+    """
+    name = name or current_snapshot_name(directory)
+    if name is None:
+        return None
+    path = os.path.join(directory, name)
+    try:
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != SNAPSHOT_FORMAT or meta.get("pipeline_version") != pipeline_version:
+            print(f"Cảnh báo: Bỏ qua snapshot '{name}' (định dạng {meta.get('format')}, "
+                  f"phiên bản pipeline '{meta.get('pipeline_version')}').")
+            return None
+        matrix = np.load(os.path.join(path, "matrix.npy"), mmap_mode="r" if read_only else "c")
+        row_user_ids = np.load(os.path.join(path, "row_users.npy"))
+        versions = np.load(os.path.join(path, "versions.npy"))
+        with open(os.path.join(path, "users.json"), encoding="utf-8") as f:
+            users = [{"user_id": uid, "member_code": code, "full_name": full_name} for uid, code, full_name in json.load(f)]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Cảnh báo: Snapshot '{name}' không đọc được: {e}")
+        return None
+    if matrix.shape[0] != len(row_user_ids) or matrix.shape[0] != meta.get("rows"):
+        print(f"Cảnh báo: Snapshot '{name}' không nhất quán ({matrix.shape[0]} hàng, {len(row_user_ids)} chủ sở hữu).")
+        return None
+    return {
+        "name": name,
+        "meta": meta,
+        "matrix": matrix,
+        "row_user_ids": row_user_ids,
+        "users": users,
+        "versions": {int(uid): (int(count), int(max_id)) for uid, count, max_id in versions},
+    }
@@ -0,0 +1,29 @@
+# backend-ai/tests/conftest.py
+"""
+Kiểm thử đơn vị của dịch vụ AI. Chạy từ thư mục backend-ai (trong container, sau `pip install pytest`):
+    python -m pytest -q tests
+
+Phần lớn kiểm thử chỉ dùng các module thuần NumPy (gallery, changelog, snapshot, calibration...);
+test_catch_up.py nạp main.py nên cần đủ thư viện của dịch vụ (tensorflow, deepface) và tự bỏ qua
+khi thiếu.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.fixture
+def make_user():
+    """Hàm tạo user_info như main.load_embedding_cache."""
+    def make(user_id: int, full_name: str | None = None) -> dict:
+        return {"user_id": user_id, "member_code": f"M{user_id}", "full_name": full_name or f"User {user_id}"}
+    return make
@@ -0,0 +1,65 @@
+# backend-ai/tests/test_calibration.py
+import numpy as np
+import pytest
+
+from calibration import (NUM_BINS, _bin_index, bin_thresholds, calibrate, error_rates, sample_users,
+                         score_histograms)
+from gallery import l2_normalize
+
+
+def brute_force_histograms(vectors, owners):
+    """Histogram của mọi cặp (i < j), tính trực tiếp trên ma trận điểm đầy đủ."""
+    scores = vectors @ vectors.T
+    i, j = np.triu_indices(len(owners), k=1)
+    same = owners[i] == owners[j]
+    genuine = np.bincount(_bin_index(scores[i[same], j[same]]), minlength=NUM_BINS)
+    impostor = np.bincount(_bin_index(scores[i[~same], j[~same]]), minlength=NUM_BINS)
+    return genuine, impostor
+
+
+@pytest.mark.parametrize("block_rows", [1, 7, 64, 1024])
+def test_histograms_match_brute_force(rng, block_rows):
+    # Thành phần là bội của 1/8 nên mọi tích vô hướng đều chính xác trong float32: hai cách tính
+    # cho cùng điểm, cùng thùng, bất kể thứ tự cộng trong phép nhân ma trận
+    owners = rng.integers(0, 25, size=150)
+    vectors = (rng.integers(-2, 3, size=(150, 16)) / 8).astype(np.float32)
+    genuine, impostor = score_histograms(vectors, owners, block_rows)
+    expected_genuine, expected_impostor = brute_force_histograms(vectors, owners)
+    np.testing.assert_array_equal(genuine, expected_genuine)
+    np.testing.assert_array_equal(impostor, expected_impostor)
+    n = len(owners)
+    assert genuine.sum() + impostor.sum() == n * (n - 1) // 2
+
+
+def test_error_rates_at_bin_thresholds():
+    genuine = np.zeros(NUM_BINS, dtype=np.int64)
+    impostor = np.zeros(NUM_BINS, dtype=np.int64)
+    genuine[[1500, 1800]] = 1
+    impostor[[1000, 1600]] = 1
+    far, frr = error_rates(genuine, impostor)
+    assert far[1000] == 1.0 and far[1001] == 0.5 and far[1601] == 0.0
+    assert frr[1500] == 0.0 and frr[1501] == 0.5 and frr[1801] == 1.0
+
+
+def test_calibrate_recommends_threshold_meeting_target(rng):
+    owners = np.repeat(np.arange(40), 5)
+    centers = l2_normalize(rng.standard_normal((40, 64)))
+    vectors = l2_normalize(centers[owners] + 0.2 * rng.standard_normal((200, 64)).astype(np.float32))
+    report = calibrate(vectors, owners, target_far=0.01, block_rows=32, min_genuine_pairs=10)
+    assert report["genuine_pairs"] == 40 * 10
+    assert report["recommended"]["far"] <= 0.01
+    assert report["reliable"]
+    # Ngưỡng khuyến nghị là ngưỡng nhỏ nhất đạt FAR mục tiêu trên histogram tính trực tiếp
+    far, frr = error_rates(*brute_force_histograms(vectors, owners))
+    first = int(np.flatnonzero(far <= 0.01)[0])
+    assert report["recommended"]["cosine"] == round(float(bin_thresholds()[first]), 3)
+    assert report["recommended"]["frr"] == frr[first]
+
+
+def test_sample_users_keeps_whole_users(rng):
+    owners = np.repeat(np.arange(50), rng.integers(1, 6, size=50))
+    rows = sample_users(owners, 40, rng)
+    assert len(rows) <= 40
+    chosen = np.unique(owners[rows])
+    assert len(rows) == np.isin(owners, chosen).sum()
+    assert len(sample_users(owners, 0, rng)) == len(owners)
@@ -0,0 +1,96 @@
+# backend-ai/tests/test_catch_up.py
+"""Bắt kịp DB từ snapshot (main.catch_up_gallery) so với nạp lại toàn bộ gallery từ DB."""
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+pytest.importorskip("deepface")
+
+from gallery import FaceGallery  # noqa: E402
+from snapshot import load_snapshot, save_snapshot  # noqa: E402
+
+DIM = 512
+
+
+@pytest.fixture(scope="module")
+def main(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("ai")
+    cwd = os.getcwd()
+    os.chdir(workdir) # main tạo thư mục uploaded_photos trong thư mục hiện tại
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir / 'test.db'}"
+    try:
+        import main as module
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+@pytest.fixture
+def db(main):
+    session = main.SessionLocal()
+    yield session
+    session.query(main.FaceEmbedding).delete()
+    session.query(main.User).delete()
+    session.commit()
+    session.close()
+
+
+def add_embeddings(main, db, rng, user_id, count):
+    for _ in range(count):
+        db.add(main.FaceEmbedding(user_id=user_id, embedding=main.pack_embedding(rng.standard_normal(DIM)),
+                                  model_name="ArcFace", pipeline_version=main.PIPELINE_VERSION))
+
+
+def gallery_state(gallery: FaceGallery, queries) -> tuple:
+    users = sorted((u["user_id"], u["member_code"], u["full_name"], gallery.embedding_count(u["user_id"]))
+                   for u in gallery.users if u is not None)
+    matches = [[(u["user_id"], round(sim, 4)) for u, sim, _ in gallery.search_topk(q, 3)] for q in queries]
+    return users, matches
+
+
+def test_catch_up_from_snapshot_matches_full_reload(main, db, rng, tmp_path):
+    for user_id in range(1, 7):
+        db.add(main.User(id=user_id, member_code=f"M{user_id}", full_name=f"User {user_id}"))
+        add_embeddings(main, db, rng, user_id, 2)
+    db.commit()
+
+    entries, versions = main.read_gallery_entries(db)
+    save_snapshot(str(tmp_path), FaceGallery.from_entries(entries), versions, main.PIPELINE_VERSION)
+
+    # Thay đổi sau snapshot: thêm ảnh, xóa hết embedding, đổi họ tên, người dùng mới
+    add_embeddings(main, db, rng, 1, 1)
+    db.query(main.FaceEmbedding).filter(main.FaceEmbedding.user_id == 2).delete()
+    db.query(main.User).filter(main.User.id == 3).update({"full_name": "Renamed"})
+    db.add(main.User(id=7, member_code="M7", full_name="User 7"))
+    add_embeddings(main, db, rng, 7, 3)
+    db.commit()
+
+    snapshot = load_snapshot(str(tmp_path), main.PIPELINE_VERSION)
+    gallery = FaceGallery.from_arrays(snapshot["matrix"], snapshot["row_user_ids"], snapshot["users"])
+    snapshot_versions = snapshot["versions"]
+    report = main.catch_up_gallery(db, gallery, snapshot_versions)
+    assert report == {"changed": 3, "removed": 1}
+
+    entries, expected_versions = main.read_gallery_entries(db)
+    queries = rng.standard_normal((10, DIM)).astype(np.float32)
+    assert snapshot_versions == expected_versions
+    assert gallery_state(gallery, queries) == gallery_state(FaceGallery.from_entries(entries), queries)
+    # Lần bắt kịp thứ hai không còn gì để làm
+    assert main.catch_up_gallery(db, gallery, snapshot_versions) == {"changed": 0, "removed": 0}
+
+
+def test_catch_up_limited_to_user_ids(main, db, rng):
+    for user_id in (1, 2):
+        db.add(main.User(id=user_id, member_code=f"M{user_id}", full_name=f"User {user_id}"))
+        add_embeddings(main, db, rng, user_id, 1)
+    db.commit()
+    entries, versions = main.read_gallery_entries(db)
+    gallery = FaceGallery.from_entries(entries)
+
+    add_embeddings(main, db, rng, 1, 1)
+    add_embeddings(main, db, rng, 2, 1)
+    db.commit()
+    assert main.catch_up_gallery(db, gallery, versions, [1]) == {"changed": 1, "removed": 0}
+    assert gallery.embedding_count(1) == 2 and gallery.embedding_count(2) == 1
@@ -0,0 +1,55 @@
+# backend-ai/tests/test_changelog.py
+import changelog
+from changelog import ChangeCursor
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_advance_records_gaps_and_fills_them(monkeypatch):
+    monkeypatch.setattr(changelog.time, "monotonic", FakeClock())
+    cursor = ChangeCursor(0)
+    cursor.advance([1, 2, 5])
+    assert cursor.last_seq == 5
+    assert cursor.pending_gaps() == [3, 4]
+    # Giao dịch nhận seq 4 commit muộn: hàng xuất hiện trong lần đọc lại các seq hụt
+    cursor.advance([4])
+    assert cursor.last_seq == 5
+    assert cursor.pending_gaps() == [3]
+    assert cursor.stats() == {"seq": 5, "pending_gaps": 1}
+
+
+def test_old_and_duplicate_seqs_are_ignored():
+    cursor = ChangeCursor(10)
+    cursor.advance([3, 10, 11, 11])
+    assert cursor.last_seq == 11
+    assert cursor.pending_gaps() == []
+
+
+def test_gaps_expire_after_timeout(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(changelog.time, "monotonic", clock)
+    cursor = ChangeCursor(0)
+    cursor.advance([3])
+    clock.now += changelog.GAP_TIMEOUT_S / 2
+    cursor.advance([6])
+    clock.now += changelog.GAP_TIMEOUT_S / 2 + 1
+    # Seq 1, 2 đã quá thời gian chờ (coi như rollback); 4, 5 vẫn còn chờ
+    assert cursor.pending_gaps() == [4, 5]
+
+
+def test_huge_gap_is_not_tracked():
+    cursor = ChangeCursor(0)
+    cursor.advance([changelog.MAX_GAPS + 2])
+    assert cursor.last_seq == changelog.MAX_GAPS + 2
+    assert cursor.pending_gaps() == []
+
+
+def test_at_startup_replays_recent_changes():
+    assert ChangeCursor.at_startup(5000).last_seq == 5000 - changelog.REPLAY_ON_START
+    assert ChangeCursor.at_startup(10).last_seq == 0
@@ -0,0 +1,44 @@
+# backend-ai/tests/test_embedding_lru.py
+import numpy as np
+
+import embedding_lru
+from embedding_lru import EmbeddingLRU, dhash, face_thumbnail, thumbnail_difference
+
+
+def ramp(offset: int) -> np.ndarray:
+    row = np.linspace(0, 150, 64).astype(np.uint8) + np.uint8(offset)
+    return np.tile(row, (64, 1))
+
+
+def test_dhash_collision_is_rejected_by_thumbnail():
+    # Hai khuôn mặt khác độ sáng có cùng dHash (chỉ giữ hướng chênh lệch giữa các pixel)
+    dark, bright = ramp(0), ramp(90)
+    assert dhash(dark) == dhash(bright)
+    assert thumbnail_difference(face_thumbnail(dark), face_thumbnail(bright)) > 50
+
+    cache = EmbeddingLRU()
+    cache.put(dhash(dark), (face_thumbnail(dark), "dark"))
+    thumbnail = face_thumbnail(bright)
+    hit = cache.get(dhash(bright), validate=lambda entry: thumbnail_difference(entry[0], thumbnail) <= 6)
+    assert hit is None
+    assert cache.stats()["rejected"] == 1 and cache.stats()["misses"] == 1
+    assert cache.get(dhash(dark), validate=lambda entry: True)[1] == "dark"
+
+
+def test_ttl_and_eviction(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(embedding_lru.time, "monotonic", lambda: now[0])
+    cache = EmbeddingLRU(max_entries=2, ttl_seconds=10)
+    cache.put(b"a", 1)
+    cache.put(b"b", 2)
+    assert cache.get(b"a") == 1 # "a" vừa dùng, "b" bị đẩy ra trước
+    cache.put(b"c", 3)
+    assert cache.get(b"b") is None and cache.stats()["evictions"] == 1
+    now[0] = 11
+    assert cache.get(b"a") is None and cache.stats()["expired"] == 1
+
+
+def test_disabled_cache_stores_nothing():
+    cache = EmbeddingLRU(max_entries=0)
+    cache.put(b"a", 1)
+    assert cache.get(b"a") is None and cache.stats()["entries"] == 0
@@ -0,0 +1,97 @@
+# backend-ai/tests/test_gallery.py
+import numpy as np
+
+from gallery import FaceGallery, MemmapStorage
+from quantized import QuantizedIndex
+
+DIM = 32
+
+
+def snapshot_of(gallery: FaceGallery, queries: np.ndarray, k: int = 3) -> list:
+    """Kết quả top-k (user_id, họ tên, điểm làm tròn) của mọi truy vấn: hai gallery tương đương thì giống hệt."""
+    return [[(user["user_id"], user["full_name"], round(sim, 5)) for user, sim, _ in gallery.search_topk(q, k)]
+            for q in queries]
+
+
+def assert_same_gallery(gallery: FaceGallery, state: dict, queries: np.ndarray, k: int = 3) -> None:
+    rebuilt = FaceGallery.from_entries(list(state.values()))
+    assert len(gallery) == len(rebuilt)
+    assert gallery.num_embeddings == rebuilt.num_embeddings
+    for user_info, embeddings in state.values():
+        assert gallery.embedding_count(user_info["user_id"]) == len(embeddings)
+    assert snapshot_of(gallery, queries, k) == snapshot_of(rebuilt, queries, k)
+
+
+def random_operations(gallery: FaceGallery, rng, make_user, steps: int = 200, k: int = 3):
+    """Chuỗi thêm/cập nhật/xóa ngẫu nhiên, kiểm tra gallery sau mỗi 20 bước so với dựng lại từ đầu."""
+    state = {}
+    queries = rng.standard_normal((20, DIM)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    for step in range(steps):
+        user_id = int(rng.integers(0, 30))
+        if user_id in state and rng.random() < 0.3:
+            assert gallery.remove_user(user_id)
+            del state[user_id]
+        else:
+            embeddings = rng.standard_normal((int(rng.integers(1, 6)), DIM)).astype(np.float32)
+            user_info = make_user(user_id, f"User {user_id} v{step}")
+            assert gallery.upsert_user(user_info, embeddings) == len(embeddings)
+            state[user_id] = (user_info, embeddings)
+        if step % 20 == 19:
+            assert_same_gallery(gallery, state, queries, k)
+    assert_same_gallery(gallery, state, queries, k)
+    return state
+
+
+def test_upsert_remove_matches_rebuild(rng, make_user):
+    random_operations(FaceGallery(), rng, make_user)
+
+
+def test_upsert_remove_matches_rebuild_with_quantized_index(rng, make_user):
+    gallery = FaceGallery(storage=MemmapStorage())
+    gallery.build_index(QuantizedIndex("int8"))
+    # Bản nén chỉ bảo đảm người khớp nhất (và điểm của họ) giống quét toàn bộ
+    random_operations(gallery, rng, make_user, k=1)
+
+
+def test_rows_are_reused_after_remove(rng, make_user):
+    gallery = FaceGallery()
+    gallery.upsert_user(make_user(1), rng.standard_normal((4, DIM)))
+    gallery.upsert_user(make_user(2), rng.standard_normal((4, DIM)))
+    gallery.remove_user(1)
+    gallery.upsert_user(make_user(3), rng.standard_normal((3, DIM)))
+    assert gallery.size == 8
+    assert gallery.num_embeddings == 7
+    assert 1 not in gallery and gallery.search(np.ones(DIM, dtype=np.float32))[0]["user_id"] in (2, 3)
+
+
+def test_upsert_without_embeddings_removes_user(rng, make_user):
+    gallery = FaceGallery.from_entries([(make_user(1), rng.standard_normal((2, DIM)))])
+    assert gallery.upsert_user(make_user(1), []) == 0
+    assert 1 not in gallery
+    assert gallery.search(np.ones(DIM, dtype=np.float32)) is None
+    assert not gallery.remove_user(1)
+
+
+def test_from_arrays_matches_from_entries(rng, make_user):
+    entries = [(make_user(user_id), rng.standard_normal((user_id % 3 + 1, DIM))) for user_id in range(10)]
+    source = FaceGallery.from_entries(entries)
+    outputs = []
+    row_user_ids, users = source.export(lambda rows, dim: outputs.append(np.zeros((rows, dim), np.float32)) or outputs[0])
+    restored = FaceGallery.from_arrays(outputs[0], row_user_ids, users)
+    queries = rng.standard_normal((10, DIM)).astype(np.float32)
+    assert snapshot_of(restored, queries) == snapshot_of(source, queries)
+    # Cập nhật sau khi nạp từ mảng vẫn đúng
+    restored.upsert_user(make_user(3), rng.standard_normal((5, DIM)))
+    restored.remove_user(4)
+    assert restored.embedding_count(3) == 5 and 4 not in restored
+
+
+def test_quantized_candidates_match_brute_force(rng, make_user):
+    entries = [(make_user(user_id), rng.standard_normal((3, DIM))) for user_id in range(200)]
+    brute = FaceGallery.from_entries(entries)
+    quantized = FaceGallery.from_entries(entries)
+    quantized.build_index(QuantizedIndex("int8"))
+    queries = rng.standard_normal((50, DIM)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    assert snapshot_of(quantized, queries, k=1) == snapshot_of(brute, queries, k=1)
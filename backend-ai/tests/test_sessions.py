@@ -0,0 +1,52 @@
+# backend-ai/tests/test_sessions.py
+import sessions
+from sessions import SessionStore
+
+
+def test_get_or_create_reuses_session():
+    store = SessionStore(max_sessions=2)
+    first = store.get_or_create("a")
+    assert store.get_or_create("a") is first
+    store.get_or_create("b")
+    store.get_or_create("c")
+    assert store.get("a") is None and store.stats()["evicted"] == 1
+
+
+def test_sessions_expire_and_discard(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(sessions.time, "monotonic", lambda: now[0])
+    store = SessionStore(ttl_seconds=10)
+    store.get_or_create("a")
+    store.get_or_create("b")
+    now[0] = 5
+    store.get("b") # Kiosk "b" vẫn hoạt động
+    now[0] = 12
+    assert store.get("a") is None and store.get("b") is not None
+    store.discard("b")
+    assert store.get("b") is None and len(store) == 0
+
+
+def test_shared_dir_shares_votes_between_stores(tmp_path):
+    # Hai kho cùng thư mục mô phỏng hai worker nhận khung hình của cùng kiosk
+    first, second = SessionStore(shared_dir=str(tmp_path)), SessionStore(shared_dir=str(tmp_path))
+    session = first.get_or_create("a")
+    with session.lock:
+        session.frame_queue.append("M1")
+        session.best_member_code = "M1"
+    other = second.get("a")
+    with other.lock:
+        assert list(other.frame_queue) == ["M1"] and other.best_member_code == "M1"
+        other.frame_queue.append("M2")
+    with session.lock:
+        assert list(session.frame_queue) == ["M1", "M2"]
+
+
+def test_create_replaces_and_discard_respects_owner():
+    store = SessionStore()
+    old = store.create("kiosk-1")
+    new = store.create("kiosk-1") # Kiosk kết nối lại trước khi kết nối cũ đóng
+    assert new is not old and store.get("kiosk-1") is new
+    store.discard("kiosk-1", old) # Kết nối cũ đóng: không được xóa phiên của kết nối mới
+    assert store.get("kiosk-1") is new
+    store.discard("kiosk-1", new)
+    assert store.get("kiosk-1") is None
@@ -0,0 +1,70 @@
+# backend-ai/tests/test_snapshot.py
+import os
+
+import numpy as np
+
+from gallery import FaceGallery
+from snapshot import (CURRENT_FILE, KEEP_SNAPSHOTS, clear_current_snapshot, current_snapshot_name,
+                      load_snapshot, save_snapshot)
+
+DIM = 16
+PIPELINE = "arcface-test"
+
+
+def build(rng, make_user, user_ids):
+    return FaceGallery.from_entries([(make_user(u), rng.standard_normal((u % 3 + 1, DIM))) for u in user_ids])
+
+
+def restore(snapshot) -> FaceGallery:
+    return FaceGallery.from_arrays(snapshot["matrix"], snapshot["row_user_ids"], snapshot["users"])
+
+
+def test_round_trip(tmp_path, rng, make_user):
+    gallery = build(rng, make_user, range(1, 8))
+    gallery.remove_user(3) # Hàng trống không được ghi vào snapshot
+    versions = {u: (u % 3 + 1, 100 + u) for u in range(1, 8) if u != 3}
+    name = save_snapshot(str(tmp_path), gallery, versions, PIPELINE)
+    assert current_snapshot_name(str(tmp_path)) == name
+
+    snapshot = load_snapshot(str(tmp_path), PIPELINE)
+    assert snapshot["name"] == name
+    assert snapshot["versions"] == versions
+    assert snapshot["matrix"].shape == (gallery.num_embeddings, DIM)
+    restored = restore(snapshot)
+    queries = rng.standard_normal((10, DIM)).astype(np.float32)
+    for q in queries:
+        expected = gallery.search_topk(q, 3)
+        actual = restored.search_topk(q, 3)
+        assert [user for user, _, _ in actual] == [user for user, _, _ in expected]
+        np.testing.assert_allclose([sim for _, sim, _ in actual], [sim for _, sim, _ in expected], rtol=1e-5)
+
+
+def test_copy_on_write_does_not_touch_snapshot(tmp_path, rng, make_user):
+    gallery = build(rng, make_user, range(1, 5))
+    save_snapshot(str(tmp_path), gallery, {}, PIPELINE)
+    restored = restore(load_snapshot(str(tmp_path), PIPELINE))
+    restored.upsert_user(make_user(1), rng.standard_normal((2, DIM)))
+    restored.remove_user(2)
+    reloaded = restore(load_snapshot(str(tmp_path), PIPELINE))
+    assert reloaded.embedding_count(1) == 2 and 2 in reloaded
+
+
+def test_other_pipeline_version_is_ignored(tmp_path, rng, make_user):
+    save_snapshot(str(tmp_path), build(rng, make_user, [1]), {}, PIPELINE)
+    assert load_snapshot(str(tmp_path), "arcface-other") is None
+
+
+def test_empty_gallery_and_cleared_pointer(tmp_path, rng, make_user):
+    assert save_snapshot(str(tmp_path), FaceGallery(), {}, PIPELINE) is None
+    assert load_snapshot(str(tmp_path), PIPELINE) is None
+    save_snapshot(str(tmp_path), build(rng, make_user, [1]), {}, PIPELINE)
+    clear_current_snapshot(str(tmp_path))
+    assert not os.path.exists(tmp_path / CURRENT_FILE)
+    assert load_snapshot(str(tmp_path), PIPELINE) is None
+
+
+def test_old_versions_are_pruned(tmp_path, rng, make_user):
+    names = [save_snapshot(str(tmp_path), build(rng, make_user, [1, 2]), {}, PIPELINE) for _ in range(4)]
+    kept = sorted(n for n in os.listdir(tmp_path) if n.startswith("v"))
+    assert kept == sorted(names[-KEEP_SNAPSHOTS:])
+    assert load_snapshot(str(tmp_path), PIPELINE, name=names[-2], read_only=True) is not None
@@ -0,0 +1,110 @@
+# backend-ai/tracking.py
+"""
+Theo dõi khuôn mặt giữa các khung hình của cùng một kiosk.
+
+Kiosk gửi một khung hình mỗi 500 ms và người đứng trước camera thường gần như đứng yên,
+nên sau khi đã phát hiện được khuôn mặt, vị trí ở khung hình tiếp theo được tìm bằng
+template matching (cv2.matchTemplate, TM_CCOEFF_NORMED) trong vùng lân cận hộp cũ thay vì
+chạy lại bộ phát hiện. Mẫu (template) luôn lấy từ lần phát hiện gần nhất để không bị trôi.
+
+Ảnh mẫu và vùng tìm kiếm được thu nhỏ sao cho mẫu rộng khoảng `template_width` pixel, nên
+chi phí theo dõi gần như không phụ thuộc kích thước khuôn mặt.
+"""
+import threading
+
+import cv2
+
+
+class FaceTracker:
+    """Trạng thái theo dõi của một kiosk: khuôn mặt gần nhất và mẫu xám của nó."""
+
+    def __init__(self, search_margin: float = 0.5, template_width: int = 64):
+        self.search_margin = search_margin
+        self.template_width = template_width
+        self.reset()
+
+    def reset(self) -> None:
+        self.face = None
+        self.template = None
+        self.scale = 1.0
+        self.frames_since_detection = 0
+        self._origin = (0, 0)
+
+    @property
+    def active(self) -> bool:
+        return self.face is not None
+
+    def _patch(self, img_bgr, x0, y0, x1, y1):
+        gray = cv2.cvtColor(img_bgr[y0:y1, x0:x1], cv2.COLOR_BGR2GRAY)
+        size = (max(1, round((x1 - x0) * self.scale)), max(1, round((y1 - y0) * self.scale)))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+    def start(self, img_bgr, face: dict) -> None:
+        """Bắt đầu theo dõi từ một khuôn mặt vừa được bộ phát hiện tìm thấy."""
+        height, width = img_bgr.shape[:2]
+        x, y, w, h = face["box"]
+        x0, y0, x1, y1 = max(0, x), max(0, y), min(width, x + w), min(height, y + h)
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            self.reset()
+            return
+        self.scale = min(1.0, self.template_width / (x1 - x0))
+        self.template = self._patch(img_bgr, x0, y0, x1, y1)
+        self._origin = (x0, y0)
+        self.face = face
+        self.frames_since_detection = 0
+
+    def track(self, img_bgr):
+        """
+        Tìm lại khuôn mặt trong khung hình mới. Trả về (face, score) với score là hệ số
+        tương quan chuẩn hóa của vị trí khớp nhất, hoặc (None, 0.0) nếu không theo dõi được.
+        """
+        if self.face is None:
+            return None, 0.0
+        height, width = img_bgr.shape[:2]
+        x, y, w, h = self.face["box"]
+        margin_x, margin_y = int(w * self.search_margin), int(h * self.search_margin)
+        x0, y0 = max(0, x - margin_x), max(0, y - margin_y)
+        x1, y1 = min(width, x + w + margin_x), min(height, y + h + margin_y)
+        if x1 <= x0 or y1 <= y0:
+            return None, 0.0
+        window = self._patch(img_bgr, x0, y0, x1, y1)
+        th, tw = self.template.shape[:2]
+        if window.shape[0] < th or window.shape[1] < tw:
+            return None, 0.0
+        result = cv2.matchTemplate(window, self.template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (loc_x, loc_y) = cv2.minMaxLoc(result)
+        # Độ dịch chuyển của mẫu (đổi về tọa độ ảnh gốc) áp dụng cho cả hộp và điểm mốc
+        dx = int(round(x0 + loc_x / self.scale)) - self._origin[0]
+        dy = int(round(y0 + loc_y / self.scale)) - self._origin[1]
+        self._origin = (self._origin[0] + dx, self._origin[1] + dy)
+        self.face = {
+            **self.face,
+            "box": [x + dx, y + dy, w, h],
+            "keypoints": {k: (px + dx, py + dy) for k, (px, py) in self.face["keypoints"].items()},
+        }
+        self.frames_since_detection += 1
+        return self.face, float(score)
+
+
+class TrackingStats:
+    """Bộ đếm số lần phát hiện đầy đủ và số khung hình được theo dõi thay cho phát hiện."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.detections = 0
+        self.tracked = 0
+        self.lost = 0
+
+    def record(self, kind: str) -> None:
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            located = self.detections + self.tracked
+            return {
+                "detections": self.detections,
+                "tracked": self.tracked,
+                "lost": self.lost,
+                "tracked_ratio": self.tracked / located if located else 0.0,
+            }
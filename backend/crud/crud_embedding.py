@@ -0,0 +1,76 @@
+# app/crud/crud_embedding.py
+from sqlalchemy.orm import Session
+from db import models
+from typing import List, Optional
+import json
+import numpy as np
+
+# Mỗi embedding được lưu thành một hàng riêng: mảng float32 little-endian đóng gói nhị phân
+EMBEDDING_DTYPE = np.dtype("<f4")
+DEFAULT_MODEL_NAME = "ArcFace"
+DEFAULT_PIPELINE_VERSION = "arcface-v1"
+
+def pack_embedding(vector) -> bytes:
+    """Đóng gói một vector embedding thành bytes float32 để lưu vào cột LargeBinary."""
+    return np.asarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+def add_face_embeddings(
+    db: Session,
+    user_id: int,
+    embeddings: List[List[float]],
+    model_name: str = DEFAULT_MODEL_NAME,
+    pipeline_version: Optional[str] = None,
+    photo_paths: Optional[List[Optional[str]]] = None,
+) -> List[models.FaceEmbedding]:
+    """
+    Thêm mỗi embedding thành một hàng mới (không đọc lại các embedding cũ).
+    `pipeline_version` và `photo_paths` (song song với `embeddings`) lấy từ phản hồi của AI Service.
+    Không commit: người gọi commit cùng transaction với các thay đổi khác.
+    """
+    photo_paths = photo_paths or [None] * len(embeddings)
+    rows = [
+        models.FaceEmbedding(user_id=user_id, embedding=pack_embedding(e), model_name=model_name,
+                             pipeline_version=pipeline_version or DEFAULT_PIPELINE_VERSION, photo_path=photo_path)
+        for e, photo_path in zip(embeddings, photo_paths) if len(e) > 0
+    ]
+    db.add_all(rows)
+    return rows
+
+def record_embedding_change(db: Session, user_id: int, change_type: str = "upsert") -> models.EmbeddingChange:
+    """
+    Ghi một hàng nhật ký thay đổi gallery cho người dùng (AI Service đọc để cập nhật cache).
+    Không commit: phải nằm cùng transaction với thay đổi người dùng/embedding.
+    """
+    change = models.EmbeddingChange(user_id=user_id, change_type=change_type)
+    db.add(change)
+    return change
+
+def parse_legacy_embedding_text(text: Optional[str]) -> List[List[float]]:
+    """
+    Đọc embedding ở định dạng JSON cũ (cột TEXT) thành list of lists.
+    Hỗ trợ các định dạng cũ mà router Admin từng phải sửa:
+    - list of lists (định dạng chuẩn)
+    - list phẳng các số (một embedding duy nhất)
+    - chuỗi số float thô không có ngoặc, ví dụ "0.1,0.2,..."
+    Số float đơn hoặc dữ liệu hỗn tạp bị bỏ qua (trả về list rỗng).
+    """
+    if not text:
+        return []
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        try:
+            parsed = json.loads(f"[{text}]")
+        except json.JSONDecodeError:
+            print(f"Cảnh báo (Embedding): Chuỗi embedding cũ không hợp lệ, bỏ qua: '{text[:100]}'")
+            return []
+
+    if isinstance(parsed, list):
+        if parsed and all(isinstance(x, (int, float)) for x in parsed):
+            return [parsed]
+        if all(isinstance(x, list) and all(isinstance(y, (int, float)) for y in x) for x in parsed):
+            return [x for x in parsed if len(x) > 0]
+        print("Cảnh báo (Embedding): Dữ liệu cũ có định dạng list hỗn tạp. Bỏ qua.")
+    elif isinstance(parsed, (int, float)):
+        print("Cảnh báo (Embedding): Dữ liệu cũ là số float đơn. Bỏ qua.")
+    return []
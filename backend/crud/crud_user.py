@@ -2,9 +2,8 @@
 from sqlalchemy.orm import Session
 from db import models
 from schemas import user as user_schemas
+from crud import crud_embedding
 from typing import List, Optional
-import json
-import numpy as np # THÊM DÒNG NÀY ĐỂ SỬ DỤNG NUMPY
 
 def get_user(db: Session, user_id: int) -> Optional[models.User]:
     return db.query(models.User).filter(models.User.id == user_id).first()
@@ -22,10 +21,12 @@ def create_user(
     db: Session,
     user: user_schemas.UserCreate,
     status: str = "Approved",
-    face_embedding_data: Optional[str] = None, # <-- Mong đợi một CHUỖI JSON
+    face_embeddings: Optional[List[List[float]]] = None, # <-- Danh sách embedding (list of lists)
+    face_photo_paths: Optional[List[Optional[str]]] = None, # Ảnh gốc tương ứng trên AI Service
+    pipeline_version: Optional[str] = None,
 ) -> models.User:
     """
-    Tạo một user mới, bao gồm cả thông tin embedding (dạng chuỗi JSON).
+    Tạo một user mới, mỗi embedding được lưu thành một hàng nhị phân riêng.
     """
     db_user = models.User(
         member_code=user.member_code,
@@ -35,70 +36,43 @@ def create_user(
         status=status,
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
-
-    if face_embedding_data is not None:
-        # Loại bỏ toàn bộ khối kiểm tra isinstance() và chuyển đổi
-        # Chỉ cần gán trực tiếp chuỗi JSON đã nhận
-        print(f"DEBUG CRUD: face_embedding_data received for saving (JSON): {face_embedding_data[:200]}...")
-
-        db_face_embedding = db.query(models.FaceEmbedding).filter(models.FaceEmbedding.user_id == db_user.id).first()
-
-        if db_face_embedding:
-            db_face_embedding.embedding = face_embedding_data # Gán trực tiếp chuỗi JSON
-            print(f"DEBUG CRUD: Updating existing embedding for user {db_user.id} (JSON): {db_face_embedding.embedding[:200]}...")
-        else:
-            db_face_embedding = models.FaceEmbedding(
-                user_id=db_user.id,
-                embedding=face_embedding_data # Gán trực tiếp chuỗi JSON
-            )
-            db.add(db_face_embedding)
-            print(f"DEBUG CRUD: Adding new embedding for user {db_user.id} (JSON): {db_face_embedding.embedding[:200]}...")
+    db.flush() # Lấy db_user.id để gắn embedding trong cùng transaction
 
-        db.commit()
-        db.refresh(db_face_embedding)
+    if face_embeddings:
+        crud_embedding.add_face_embeddings(db, user_id=db_user.id, embeddings=face_embeddings,
+                                           pipeline_version=pipeline_version, photo_paths=face_photo_paths)
+        crud_embedding.record_embedding_change(db, db_user.id)
 
+    db.commit()
+    db.refresh(db_user)
     return db_user
 
-# Làm tương tự cho update_user_profile
 def update_user_profile(
     db: Session,
     db_user: models.User,
     user_update: user_schemas.UserUpdate,
-    face_embedding_text: Optional[str] = None, # <-- Mong đợi một CHUỖI JSON
+    new_face_embedding: Optional[List[float]] = None, # <-- Một embedding mới (list phẳng)
+    new_photo_path: Optional[str] = None,
+    pipeline_version: Optional[str] = None,
 ) -> models.User:
     """
-    Cập nhật thông tin profile của người dùng, bao gồm cả embedding (dạng chuỗi JSON).
+    Cập nhật thông tin profile của người dùng. Embedding mới (nếu có) được thêm thành
+    một hàng mới, không cần đọc-sửa-ghi các embedding cũ.
     """
     update_data = user_update.model_dump(exclude_unset=True)
 
     for key, value in update_data.items():
         setattr(db_user, key, value)
 
-    if face_embedding_text is not None:
-        # Loại bỏ toàn bộ khối kiểm tra isinstance() và chuyển đổi
-        existing_face_embedding = db.query(models.FaceEmbedding).filter(
-            models.FaceEmbedding.user_id == db_user.id
-        ).first()
-
-        if existing_face_embedding:
-            existing_face_embedding.embedding = face_embedding_text # Gán trực tiếp chuỗi JSON
-        else:
-            new_face_embedding = models.FaceEmbedding(
-                user_id=db_user.id,
-                embedding=face_embedding_text # Gán trực tiếp chuỗi JSON
-            )
-            db.add(new_face_embedding)
+    if new_face_embedding:
+        crud_embedding.add_face_embeddings(db, user_id=db_user.id, embeddings=[new_face_embedding],
+                                           pipeline_version=pipeline_version, photo_paths=[new_photo_path])
+    # Họ tên hoặc embedding có thể đã đổi: AI Service nạp lại người dùng này từ DB
+    crud_embedding.record_embedding_change(db, db_user.id)
 
     try:
         db.commit()
         db.refresh(db_user)
-        if existing_face_embedding:
-            db.refresh(existing_face_embedding)
-        elif 'new_face_embedding' in locals():
-            db.refresh(new_face_embedding)
-
     except Exception as e:
         db.rollback()
         print(f"Lỗi khi cập nhật profile hoặc embedding: {e}")
@@ -119,5 +93,6 @@ def delete_user(db: Session, user_id: int) -> Optional[models.User]:
     db_user = get_user(db, user_id)
     if db_user:
         db.delete(db_user)
+        crud_embedding.record_embedding_change(db, user_id, "delete")
         db.commit()
     return db_user
\ No newline at end of file
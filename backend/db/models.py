@@ -46,14 +46,38 @@ class User(Base):
 class FaceEmbedding(Base):
     __tablename__ = "face_embeddings"
 
+    # Mỗi hàng là MỘT embedding: mảng float32 little-endian đóng gói nhị phân (xem crud_embedding)
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True)
-    embedding = Column(Text, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    embedding = Column(LargeBinary, nullable=False)
+    model_name = Column(String(50), nullable=False, default="ArcFace")
+    # Phiên bản mô hình + tiền xử lý của AI Service đã tạo embedding (PIPELINE_VERSION trong backend-ai/main.py)
+    pipeline_version = Column(String(50), nullable=False, default="arcface-v1", server_default="arcface-v1", index=True)
+    photo_path = Column(String(255), nullable=True) # Ảnh gốc trên AI Service, dùng để tính lại embedding
+    # "sample": embedding của một ảnh; "centroid": hàng do AI Service tạo khi thu gọn gallery
+    kind = Column(String(16), nullable=False, default="sample", server_default="sample")
     created_at = Column(TIMESTAMP, server_default=func.now())
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
     owner = relationship("User", back_populates="face_embeddings")
 
+class GallerySetting(Base):
+    __tablename__ = "gallery_settings"
+
+    # Thiết lập dùng chung với AI Service, ví dụ "active_pipeline_version"
+    key = Column(String(100), primary_key=True)
+    value = Column(Text, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+class EmbeddingChange(Base):
+    __tablename__ = "embedding_changes"
+
+    # Nhật ký thay đổi gallery: mỗi lần tạo/sửa/xóa người dùng hoặc embedding ghi thêm một hàng trong
+    # CÙNG transaction; mọi bản sao AI Service đọc theo seq để cập nhật cache (backend-ai/changelog.py)
+    seq = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, nullable=False) # Không có khóa ngoại: hàng "delete" còn lại sau khi xóa user
+    change_type = Column(String(20), nullable=False) # "upsert" hoặc "delete"
+    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+
 class AttendanceSession(Base):
     __tablename__ = "attendance_sessions"
 
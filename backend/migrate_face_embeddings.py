@@ -0,0 +1,136 @@
+# backend/migrate_face_embeddings.py
+"""
+Chuyển bảng `face_embeddings` từ định dạng cũ (một hàng JSON TEXT cho mỗi người dùng)
+sang định dạng mới (mỗi embedding một hàng, cột LargeBinary float32).
+
+Chạy một lần trong container backend:
+    python migrate_face_embeddings.py [--drop-legacy]
+
+Các bước:
+1. Nếu `face_embeddings` còn cột TEXT cũ, đổi tên thành `face_embeddings_legacy`
+   (bỏ khóa ngoại cũ để tên ràng buộc không trùng) và tạo bảng mới theo models.
+2. Đọc từng hàng cũ, sửa các định dạng cũ (list phẳng, chuỗi float thô) bằng
+   `crud_embedding.parse_legacy_embedding_text`, ghi mỗi embedding thành một hàng.
+   Người dùng đã có hàng trong bảng mới được bỏ qua nên có thể chạy lại an toàn.
+3. Với `--drop-legacy`, xóa bảng cũ sau khi chuyển xong.
+
+Đồng thời thêm các cột `pipeline_version` (hàng cũ nhận phiên bản mặc định), `photo_path` và
+`kind` (hàng cũ nhận 'sample') vào bảng đã ở định dạng mới, và tạo các bảng `gallery_settings`, `embedding_changes` nếu chưa
+có. Mỗi người dùng được chuyển ghi một hàng nhật ký thay đổi để AI Service nạp embedding mới.
+"""
+import argparse
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+from db import database, models
+from crud import crud_embedding
+
+LEGACY_TABLE = "face_embeddings_legacy"
+
+
+def rename_legacy_table(engine) -> bool:
+    """Đổi tên bảng cũ nếu `face_embeddings` vẫn là schema JSON. Trả về True nếu đã đổi tên."""
+    inspector = inspect(engine)
+    if "face_embeddings" not in inspector.get_table_names():
+        return False
+    columns = {c["name"] for c in inspector.get_columns("face_embeddings")}
+    if "model_name" in columns:
+        return False
+
+    print("Phát hiện bảng face_embeddings định dạng JSON cũ. Đang đổi tên thành face_embeddings_legacy...")
+    with engine.begin() as conn:
+        for fk in inspector.get_foreign_keys("face_embeddings"):
+            if fk.get("name"):
+                conn.execute(text(f"ALTER TABLE face_embeddings DROP FOREIGN KEY `{fk['name']}`"))
+        conn.execute(text(f"ALTER TABLE face_embeddings RENAME TO {LEGACY_TABLE}"))
+    return True
+
+
+def add_pipeline_columns(engine) -> list:
+    """Thêm các cột theo dõi phiên bản pipeline còn thiếu. Trả về tên các cột đã thêm."""
+    columns = {c["name"] for c in inspect(engine).get_columns("face_embeddings")}
+    added = []
+    with engine.begin() as conn:
+        if "pipeline_version" not in columns:
+            conn.execute(text(
+                "ALTER TABLE face_embeddings ADD COLUMN pipeline_version VARCHAR(50) NOT NULL "
+                f"DEFAULT '{crud_embedding.DEFAULT_PIPELINE_VERSION}'"
+            ))
+            conn.execute(text(
+                "CREATE INDEX ix_face_embeddings_pipeline_version ON face_embeddings (pipeline_version)"
+            ))
+            added.append("pipeline_version")
+        if "photo_path" not in columns:
+            conn.execute(text("ALTER TABLE face_embeddings ADD COLUMN photo_path VARCHAR(255) NULL"))
+            added.append("photo_path")
+        if "kind" not in columns:
+            conn.execute(text("ALTER TABLE face_embeddings ADD COLUMN kind VARCHAR(16) NOT NULL DEFAULT 'sample'"))
+            added.append("kind")
+    return added
+
+
+def migrate_rows(db, batch_size: int = 200) -> tuple[int, int]:
+    """Chuyển các hàng cũ sang bảng mới. Trả về (số người dùng, số embedding) đã chuyển."""
+    migrated_users = {
+        user_id for (user_id,) in db.query(models.FaceEmbedding.user_id).distinct()
+    }
+    legacy_rows = db.execute(
+        text(f"SELECT user_id, embedding, created_at FROM {LEGACY_TABLE} ORDER BY id")
+    ).fetchall()
+
+    users_done, embeddings_done = 0, 0
+    for user_id, embedding_text, created_at in legacy_rows:
+        if user_id in migrated_users:
+            continue
+        embeddings = crud_embedding.parse_legacy_embedding_text(embedding_text)
+        if not embeddings:
+            print(f"Cảnh báo: user {user_id} không có embedding hợp lệ trong dữ liệu cũ. Bỏ qua.")
+            continue
+        rows = crud_embedding.add_face_embeddings(db, user_id=user_id, embeddings=embeddings)
+        crud_embedding.record_embedding_change(db, user_id)
+        if isinstance(created_at, datetime):
+            for row in rows:
+                row.created_at = created_at # Giữ thời điểm tạo của dữ liệu cũ
+        migrated_users.add(user_id)
+        users_done += 1
+        embeddings_done += len(rows)
+        if users_done % batch_size == 0:
+            db.commit()
+            print(f"Đã chuyển {users_done} người dùng ({embeddings_done} embedding)...")
+    db.commit()
+    return users_done, embeddings_done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chuyển face_embeddings sang định dạng mỗi embedding một hàng nhị phân.")
+    parser.add_argument("--drop-legacy", action="store_true", help="Xóa bảng face_embeddings_legacy sau khi chuyển xong")
+    args = parser.parse_args()
+
+    engine = database.engine
+    rename_legacy_table(engine)
+    models.Base.metadata.create_all(bind=engine, tables=[models.FaceEmbedding.__table__, models.GallerySetting.__table__,
+                                                         models.EmbeddingChange.__table__])
+    added = add_pipeline_columns(engine)
+    if added:
+        print(f"Đã thêm cột {', '.join(added)} vào face_embeddings.")
+
+    if LEGACY_TABLE not in inspect(engine).get_table_names():
+        print("Không có dữ liệu cũ cần chuyển.")
+        return
+
+    db = database.SessionLocal()
+    try:
+        users_done, embeddings_done = migrate_rows(db)
+    finally:
+        db.close()
+    print(f"Hoàn tất: đã chuyển {users_done} người dùng, {embeddings_done} embedding.")
+
+    if args.drop_legacy:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+        print("Đã xóa bảng face_embeddings_legacy.")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,6 @@ from schemas import user as user_schemas
 from schemas import request as request_schemas
 from schemas import attendance as attendance_schemas
 from crud import crud_admin, crud_user, crud_request, crud_attendance
-import json
 from pytz import timezone, utc
 USER_PHOTOS_DIR = "user_photos" # Giữ lại nếu dùng cho lưu ảnh user do Admin thêm
 os.makedirs(USER_PHOTOS_DIR, exist_ok=True)
@@ -107,7 +106,7 @@ async def create_new_user_by_admin_endpoint(
     current_admin: models.AdminUser = Depends(get_current_admin_from_session),
     db: Session = Depends(database.get_db)
 ):
-    """Endpoint để Admin tạo người dùng mới và xử lý ảnh khuôn mặt, lưu embedding dạng TEXT."""
+    """Endpoint để Admin tạo người dùng mới và xử lý ảnh khuôn mặt, lưu embedding dạng nhị phân float32."""
     if crud_user.get_user_by_member_code(db, member_code):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Member code already registered.")
     if email and crud_user.get_user_by_email(db, email):
@@ -118,7 +117,7 @@ async def create_new_user_by_admin_endpoint(
     print(f"DEBUG CREATE: Content-Type của ảnh: {photo.content_type}")
 
     embedding_list = None
-    face_embedding_text = None
+    ai_result = {}
 
     try:
         async with httpx.AsyncClient(timeout = 30.0) as client:
@@ -138,8 +137,6 @@ async def create_new_user_by_admin_endpoint(
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                                     detail="AI service did not return embedding.")
 
-            face_embedding_text = json.dumps([embedding_list])
-            print(f"DEBUG CREATE: face_embedding_text cuối cùng trước khi lưu: {face_embedding_text[:200]}...") # In 200 ký tự đầu
 
     except httpx.HTTPStatusError as e:
         print(f"DEBUG CREATE: Lỗi HTTPStatusError từ AI service: {e.response.text}")
@@ -165,21 +162,11 @@ async def create_new_user_by_admin_endpoint(
         db=db, 
         user=user_data, 
         status="Approved",
-        face_embedding_data=face_embedding_text,
+        face_embeddings=[embedding_list],
+        face_photo_paths=[ai_result.get("photo_path")],
+        pipeline_version=ai_result.get("pipeline_version"),
     )
-    # --- BẮT ĐẦU PHẦN CẦN THÊM VÀO ---
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client: # Tăng timeout nếu AI Service quá chậm
-            ai_reload_response = await client.post(
-                f"{AI_SERVICE_URL}/reload-embedding-cache"
-            )
-            ai_reload_response.raise_for_status() # Kiểm tra lỗi HTTP status (4xx, 5xx)
-            print(f"DEBUG (Backend Admin): Yêu cầu AI Service tải lại cache thành công: {ai_reload_response.json()}")
-    except httpx.RequestError as e:
-        print(f"Cảnh báo (Backend Admin): Không thể yêu cầu AI Service tải lại cache: {e}. AI Service có thể cần khởi động lại để cập nhật thủ công.")
-    except httpx.HTTPStatusError as e:
-        print(f"Cảnh báo (Backend Admin): AI Service trả về lỗi khi tải lại cache: {e.response.text}")
-    # --- KẾT THÚC PHẦN CẦN THÊM VÀO ---
+    # create_user đã ghi nhật ký embedding_changes cùng transaction: mọi bản sao AI Service tự cập nhật cache
 
     return db_user
 
@@ -239,11 +226,11 @@ async def update_existing_user_by_admin_endpoint(
         update_data["email"] = email
     if phone_number is not None: update_data["phone_number"] = phone_number
     
-    final_face_embedding_json_string = None # Biến này sẽ chứa chuỗi JSON cuối cùng để cập nhật vào DB
+    new_embedding_from_ai = None # Embedding mới từ AI (dạng list phẳng), được thêm thành một hàng mới
+    ai_result = {}
 
     if photo:
         photo_content = await photo.read()
-        new_embedding_from_ai = None # Sẽ chứa embedding mới từ AI (dạng list phẳng)
         try:
             async with httpx.AsyncClient(timeout = 30.0) as client:
                 ai_response = await client.post(
@@ -258,65 +245,6 @@ async def update_existing_user_by_admin_endpoint(
                 if not new_embedding_from_ai:
                     raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
                                         detail="AI service did not return embedding.")
-                
-                # --- BẮT ĐẦU LOGIC CHUẨN HÓA VÀ CỘNG DỒN EMBEDDING (ĐÃ SỬA ĐỔI) ---
-                
-                # Lấy bản ghi FaceEmbedding hiện có của user
-                db_face_embedding_record = db.query(models.FaceEmbedding).filter(models.FaceEmbedding.user_id == user_id).first()
-                
-                processed_embeddings_for_db = [] 
-
-                if db_face_embedding_record and db_face_embedding_record.embedding:
-                    original_embedding_str_from_db = db_face_embedding_record.embedding
-                    try:
-                        parsed_db_data = json.loads(original_embedding_str_from_db)
-
-                        if isinstance(parsed_db_data, list):
-                            if all(isinstance(x, (int, float)) for x in parsed_db_data):
-                                # Đây là trường hợp cũ (list phẳng), chuyển về list of lists
-                                if len(parsed_db_data) > 0:
-                                    processed_embeddings_for_db.append(parsed_db_data)
-                                print(f"DEBUG (Admin Update): Dữ liệu cũ là list phẳng, đang chuẩn hóa.")
-                            elif all(isinstance(x, list) and all(isinstance(y, (int, float)) for y in x) for x in parsed_db_data):
-                                # Đây là trường hợp đã đúng định dạng list of lists
-                                processed_embeddings_for_db = parsed_db_data
-                                print(f"DEBUG (Admin Update): Dữ liệu cũ đã đúng định dạng.")
-                            else:
-                                print(f"Cảnh báo (Admin Update): Dữ liệu cũ có định dạng list hỗn tạp. Bỏ qua.")
-                        elif isinstance(parsed_db_data, (int, float)):
-                            print(f"Cảnh báo (Admin Update): Dữ liệu cũ là số float đơn. Bỏ qua.")
-                        else:
-                            print(f"Cảnh báo (Admin Update): Dữ liệu cũ có kiểu không mong muốn. Bỏ qua.")
-
-                    except json.JSONDecodeError:
-                        print(f"Lỗi (Admin Update): Chuỗi JSON embedding cũ không hợp lệ. Cố gắng sửa. Dữ liệu: '{original_embedding_str_from_db}'")
-                        try:
-                            # Cố gắng sửa lỗi chuỗi chỉ là float thô (ví dụ: "0.1,0.2,...")
-                            temp_fixed_str = f"[{original_embedding_str_from_db}]"
-                            temp_parsed_data = json.loads(temp_fixed_str)
-                            if isinstance(temp_parsed_data, list) and all(isinstance(x, (int, float)) for x in temp_parsed_data):
-                                if len(temp_parsed_data) > 0:
-                                    processed_embeddings_for_db.append(temp_parsed_data)
-                                print(f"DEBUG (Admin Update): Đã sửa chữa chuỗi float thô cũ thành list of list.")
-                            else:
-                                print(f"Cảnh báo (Admin Update): Không thể sửa chữa chuỗi float thô cũ. Bỏ qua.")
-                        except Exception as ex:
-                            print(f"Lỗi không xác định khi cố gắng sửa chuỗi float thô cũ: {ex}. Bỏ qua.")
-                    except Exception as e:
-                        print(f"Lỗi không xác định khi xử lý embedding cũ: {e}. Bỏ qua.")
-                
-                # Thêm embedding MỚI (list phẳng) vào list đã chuẩn hóa
-                if new_embedding_from_ai: # Đảm bảo có embedding mới để thêm
-                    processed_embeddings_for_db.append(new_embedding_from_ai)
-                
-                # Chuyển đổi list of lists cuối cùng thành chuỗi JSON để lưu vào DB
-                final_face_embedding_json_string = json.dumps(processed_embeddings_for_db)
-                print(f"DEBUG (Admin Update): final_face_embedding_json_string: {final_face_embedding_json_string[:200]}...")
-
-                # Gán kết quả cuối cùng vào biến mà crud_user.update_user_profile sẽ nhận
-                face_embedding_text_to_update = final_face_embedding_json_string
-
-                # --- KẾT THÚC LOGIC CHUẨN HÓA VÀ CỘNG DỒN EMBEDDING ---
 
         except httpx.HTTPStatusError as e:
             raise HTTPException(status_code=e.response.status_code, 
@@ -336,25 +264,15 @@ async def update_existing_user_by_admin_endpoint(
             db, 
             db_user=db_user, 
             user_update=user_update_schema,
-            face_embedding_text=face_embedding_text_to_update, # Đã được gán giá trị đúng ở trên
+            new_face_embedding=new_embedding_from_ai,
+            new_photo_path=ai_result.get("photo_path"),
+            pipeline_version=ai_result.get("pipeline_version"),
         )
 
     if status_update and status_update != updated_user.status:
         updated_user = crud_user.update_user_status_by_admin(db, db_user=updated_user, new_status=status_update)
     
-    # --- PHẦN GỌI TẢI LẠI CACHE (GIỮ NGUYÊN) ---
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            ai_reload_response = await client.post(
-                f"{AI_SERVICE_URL}/reload-embedding-cache"
-            )
-            ai_reload_response.raise_for_status()
-            print(f"DEBUG (Backend Admin): Yêu cầu AI Service tải lại cache thành công: {ai_reload_response.json()}")
-    except httpx.RequestError as e:
-        print(f"Cảnh báo (Backend Admin): Không thể yêu cầu AI Service tải lại cache: {e}. AI Service có thể cần khởi động lại để cập nhật thủ công.")
-    except httpx.HTTPStatusError as e:
-        print(f"Cảnh báo (Backend Admin): AI Service trả về lỗi khi tải lại cache: {e.response.text}")
-    # --- KẾT THÚC PHẦN GỌI TẢI LẠI CACHE ---
+    # Cache của AI Service được cập nhật qua nhật ký embedding_changes (ghi trong update_user_profile)
 
     return updated_user
 
@@ -368,20 +286,8 @@ async def delete_existing_user_by_admin_endpoint( # <--- XÁC NHẬN CÓ TỪ KH
     deleted_user = crud_user.delete_user(db, user_id=user_id)
     if deleted_user is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found to delete.")
-    
-    # Phần code này sẽ hoạt động ổn sau khi hàm được khai báo là async
-    try:
-        async with httpx.AsyncClient(timeout=5.0) as client: 
-            ai_reload_response = await client.post(
-                f"{AI_SERVICE_URL}/reload-embedding-cache"
-            )
-            ai_reload_response.raise_for_status() 
-            print(f"DEBUG (Backend Admin): Yêu cầu AI Service tải lại cache thành công sau khi xóa user: {ai_reload_response.json()}")
-    except httpx.RequestError as e:
-        print(f"Cảnh báo (Backend Admin): Không thể yêu cầu AI Service tải lại cache sau khi xóa user: {e}. AI Service có thể cần khởi động lại để cập nhật thủ công.")
-    except httpx.HTTPStatusError as e:
-        print(f"Cảnh báo (Backend Admin): AI Service trả về lỗi khi tải lại cache sau khi xóa user: {e.response.text}")
-    
+    # delete_user ghi hàng "delete" vào nhật ký embedding_changes; AI Service tự xóa khỏi cache
+
     return deleted_user
 
 @router.get("/registration-requests/pending", response_model=List[request_schemas.RegistrationRequest])
@@ -75,6 +75,23 @@ LOCK TABLES `attendance_sessions` WRITE;
 /*!40000 ALTER TABLE `attendance_sessions` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `embedding_changes`
+--
+
+DROP TABLE IF EXISTS `embedding_changes`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `embedding_changes` (
+  `seq` int NOT NULL AUTO_INCREMENT,
+  `user_id` int NOT NULL,
+  `change_type` varchar(20) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`seq`),
+  KEY `ix_embedding_changes_created_at` (`created_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `face_embeddings`
 --
@@ -85,13 +102,17 @@ DROP TABLE IF EXISTS `face_embeddings`;
 CREATE TABLE `face_embeddings` (
   `id` int NOT NULL AUTO_INCREMENT,
   `user_id` int NOT NULL,
-  `embedding` text COLLATE utf8mb4_unicode_ci NOT NULL,
+  `embedding` blob NOT NULL,
+  `model_name` varchar(50) COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'ArcFace',
+  `pipeline_version` varchar(50) COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'arcface-v1',
+  `photo_path` varchar(255) COLLATE utf8mb4_unicode_ci DEFAULT NULL,
+  `kind` varchar(16) COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT 'sample',
   `created_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP,
-  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   PRIMARY KEY (`id`),
   KEY `idx_face_embeddings_user_id` (`user_id`),
+  KEY `ix_face_embeddings_pipeline_version` (`pipeline_version`),
   CONSTRAINT `face_embeddings_ibfk_1` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
-) ENGINE=InnoDB AUTO_INCREMENT=110 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+) ENGINE=InnoDB AUTO_INCREMENT=44 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
 --
@@ -100,10 +121,35 @@ CREATE TABLE `face_embeddings` (
 
 LOCK TABLES `face_embeddings` WRITE;
 /*!40000 ALTER TABLE `face_embeddings` DISABLE KEYS */;
-INSERT INTO `face_embeddings` VALUES (90,83,'[[0.01719772652579576, 0.010619460939283622, -0.012068540422823014, -0.06910386926376026, 0.020801400698631737, -0.019573936593325066, -0.03707727162365594, 0.01728063044775196, 0.008656703823174872, -0.026334656735712978, 0.01940464733823333, 0.09349547252001682, -0.08855443733283744, 0.006860976698895877, 0.018273961488046428, 0.05285822084391372, -0.003710187629114225, -0.023715834757632868, 0.07001329658424756, -0.07362401287911624, -0.034931892022949954, 0.012299112776981851, -0.00540793378655071, -0.09067393414189928, 0.028275968732131944, 0.01716698624039357, 0.003315056789632804, -0.021176573676035274, -0.03806179107076001, -0.006445648154695028, 0.08804324986552209, 0.020856568393425354, 0.04256790330849994, 0.05574487202888519, -0.04541486422917316, -0.035773578763071454, 0.005673240952828899, -0.01797713658858147, -0.021642302216490817, 0.05253375767570703, 0.021620342426367643, 0.04739252035462555, 0.04510316986338037, -0.0380510591815417, -0.05469388079619975, 0.07388585107337965, -0.0326336630780049, -0.03144006926288113, -0.018874577219126158, -0.08136974381560808, -0.056448835448864365, 0.021783819481821877, -0.0374813889820793, 0.053610466881106295, 0.012789518287567669, -0.021124562419247043, 0.04071522657910508, 0.10204199333337023, -0.060728791235861855, -0.04125294678441249, 0.03942099370316333, 0.04914569620675906, -0.09317174326251877, -0.06291205742200587, 0.08448755199547238, 0.04601558880294273, -0.0034243958798840977, -0.01459500238154311, -0.11095533267023412, 0.019318476580686337, -0.014355256143526259, -0.08844211789650397, 0.10974421829183711, -0.018297162084833788, -0.061140253920953895, -0.04870463141982145, 0.001223451891652413, 0.03352038892318254, -0.034013558260642535, 0.045527942454544376, 0.03803007742073153, 0.023922963951295558, -0.0031797707682951304, -0.017534725262080973, 0.01798576781388585, 0.01464773355497986, 0.03507977192095, 0.060110726466705074, -0.045599246855554686, 0.009220410998129572, -0.018857369189862323, 0.03980634347206698, -0.023461481830639373, -0.004130491839136371, -0.01226433520523435, 0.02952963749246558, -0.017077278095426748, 0.005618130789171343, 0.027278568530132996, 0.007683736472701841, -0.044254330603640764, 0.021730598516280845, -0.10097987526799193, 0.006646032600102616, -0.0034146665095840033, -0.06620202985886929, -0.030472983304898428, 0.07110266263957975, -0.0017292732199966692, 0.0748981316259754, -0.005551617798857389, 0.047270793800098694, -0.06413062907955255, -0.025917182824350585, 0.011631100874904888, -0.013981128055945197, 0.0007768899657920023, -0.0624774330125157, 0.030577127100329282, -0.04391644557688113, 0.04690793715049844, 0.025970111469524618, -0.06698385000978718, 0.07764979299721513, 0.0019896700260674666, -0.011416340253788787, 0.0749170453756786, -0.019934750110147455, 0.06606755005088422, -0.006005741764956438, -0.0029798387974981663, -0.01730478730531435, 0.01069802359281074, 0.03476735297382198, 0.009562816883756521, -0.03320046605003779, 0.028019880541683275, -0.08568348437353215, 0.010137426986442136, 0.07165946452331183, -0.05686639332458749, -0.037419158951610576, 0.03410906927587344, -0.020821133878299883, -0.0014616772474406847, 0.08618015533581388, 0.09888364591622692, 0.02162191287089249, 0.019159880342423677, -0.036634714136971946, 0.003190717233101981, -0.013741566850501074, 0.02009905903473119, -0.024908517403953112, -0.06067110461024621, 0.007784136857049956, -0.030484231419445694, 0.07157178085237605, 0.11113838741579958, -0.03029109473100983, -0.03387038969621703, 0.022914847409033993, 0.001881102552742366, -0.026848055264527673, 0.05452862649510997, 0.010615477296835447, 0.07145842896538465, -0.061303791617335325, -0.045355921247937636, -0.014543718815881243, -0.04396465355910721, 0.017203639793645257, 0.01773595673684986, -0.0042860276541950406, -0.027970661877337245, 0.08834295909626783, -0.004731916504635953, -0.04166537350475741, 0.07325650398197307, -0.05537057756747823, 0.04405958615318639, -0.06371833919001772, 0.036891209710059734, 0.07083031957085113, 0.04219219700191618, -0.05261089915468394, -0.00013736491671363353, 0.0410879101687024, 0.01437817841400674, 0.009859978418112201, 0.041246469089471396, -0.0649609308743167, 0.028295212119695805, 0.0486291350203567, 0.030815663629593332, 0.07965028431899612, -0.020719463921719552, 0.035962476806185806, -0.04497068965109724, -0.10896963151510693, 0.01308935190995894, 0.041050838348542604, 0.0456853507525922, -0.019940671152474797, -0.0017708806705316845, -0.031201694442756275, -0.06878895937393047, -0.06527199084271727, -0.008029127757821566, 0.033429405763849014, 0.0019119367149645456, -0.011099518619856714, -0.038261607590560964, 0.015000777258643181, 0.014026579208327164, -0.012458736023767937, 0.04495547966263977, -0.008020876704483846, -0.03170653793614948, -0.034500902959300465, -0.008878315314168671, 0.006595961852984691, -0.003794749458471036, 0.053376125460087825, 0.03619898264183653, -0.08239146569409973, -0.029066107574344822, 0.009989080619771346, -0.03582572063108749, 0.06305000153731902, 0.019449646016004674, -0.005680100374632225, -0.02057307205877919, 0.021964941492194884, 0.056160047804596366, 0.004483771886926204, -0.03057319632433046, -0.034297957989614374, -0.0035198240969259477, 0.024140153319290678, 0.011927430540131071, -0.015881205776765744, -2.2057457001111815e-05, 0.06707222405435567, -0.04328738147646814, -0.020033517076700175, 0.0423429969937951, 0.017091803929833792, 0.01225371837828816, 0.037347814123315476, 0.053324353657217244, -0.00026873843207542104, -0.014474670568341784, -0.06107433878798628, -0.003294759960320841, -0.004089264171844122, -0.0011176168557471826, -0.005117350626624232, 0.0027440233354801384, -0.0959146785598244, -0.012355043925499921, 0.047184938686352235, 0.024555542115694832, 0.12257022842351728, -0.004198826778333482, -0.023026765682310622, -0.04553329440509341, -0.03631238739527728, -0.029281877322685307, 0.00981998494917797, -0.012413928598151602, -0.021561262614322032, -0.023424089701992338, -0.024148016426183895, -0.023373791940121316, -0.014887926048025059, -0.025263649332365808, 0.043976763085799786, 0.021845677892249567, -0.05490121679097314, -0.09348083162333766, -0.032680241529674504, -0.055866651449861394, 0.05618671115381624, 0.039688591230614884, -0.04345784778750573, 0.06424219594643055, 0.035940248019129165, -0.050807400662350316, 0.031931074185708855, -0.018296103200951194, -0.02226070128819497, 0.040370189032727335, -0.04764857122758056, 0.04880280752605788, -0.008009504975738832, 0.04008212286000343, 0.010683877930370355, 0.03710336277130636, -0.0010661364986148455, 0.03379494616320163, -0.030071310242309787, -0.034426174678246886, 0.0069951253141247146, 0.01522008750419463, 0.01940928559171612, 0.053498085248950056, 0.04377834908180221, -0.028151284766232552, -0.003305290490562942, -0.013219922710483152, -0.01875569767838642, -0.07364718704267893, 0.0037005857602508013, -0.03890488032668489, -0.07176860575310194, -0.022521541239502976, 0.01996559301865721, 0.02525442413695401, -0.004645189871922986, 0.020858501128617812, 0.05130390991549285, -0.003398351767824646, -0.02437278280028751, 0.04691729451203361, 0.0470530990910436, -0.03637935674744078, -0.08297703314586119, -0.00562550332651249, 0.04423100717010344, -0.08219502640747499, 0.018581997184564995, 0.038867370025974596, 0.04146961837218308, 0.013092083861473947, 0.10025151242674157, -0.015156714625482584, 0.013688216828627801, -0.09024785543845719, -0.014346054271548, 0.021461593808339206, -0.04660784541544268, 0.009158231501766855, -0.014307329597398197, -0.04129085202859735, 0.039080925603024605, -0.026835634758721263, -0.04189698763894758, -0.014835438993192666, 0.0013058552344163176, 0.01622581728175754, 0.05607743931279831, -0.004484549334710782, -0.027749222979751624, 0.040164995684048244, -0.03647296457049504, 0.04452102007207993, -0.06398232314016655, -0.0691297676043601, 0.07054861603079621, 0.03603425389544913, -0.025626249424197157, 0.050283758481526025, -0.018489322298852223, 0.030085350949299258, 0.02090722222638171, 0.06731220663649903, 0.037570325898843814, -0.044655070728887906, 0.0434351649709429, 0.02814030720351432, 0.02861818569794724, -0.04522338505941401, -0.00843590865235488, 0.038311407785849856, -0.03551930047106528, -0.0836221966349972, -0.007678520575515111, -0.08810568825199706, -0.013841571513926839, -0.05167821059648209, 0.02739787566715425, 0.03870928690324976, -0.02885313663802882, 0.03363751609661584, -0.11694440478851754, -0.03136829528340894, -0.04892974920032369, -0.008909497189912503, -0.010486271694620955, -0.014088840336707263, 0.03538313515628325, 0.02086693799197605, 0.0665036360622094, -0.04159807762452439, -0.015278789476616934, -0.02354542597773134, 0.025246058798791958, -0.07471716666005489, -0.1058820194071956, -0.019322822513802126, -0.10920066411835423, -0.022621671849469845, -0.02980228532072575, 0.02701174845046602, -0.012259530577925662, -0.07318819430982897, 0.056997862854750676, 0.0575609589557467, -0.01809818209884904, -0.025991864458537094, -0.024126045751791735, -0.0022146159906093177, -0.050600957177633625, -0.05581121009344761, 0.010684551977599583, 0.104467139074252, 0.032130511310990935, -0.01908319444784853, 0.043459800736340586, -0.0660061067975735, -0.0829314871448495, -0.12375560617045364, 0.002127973322257085, 0.05857785443839171, -0.011271270052082207, -0.0033961150505484165, -0.017637385687138855, 0.03635566635854914, -0.007104691030405213, -0.05747665251798712, 0.016984555007951336, 0.05083535457489258, 0.02243271161053273, 0.06661244143455658, -0.006412411484456557, -0.06074605057667948, 0.06064859594198713, 0.01759244454050357, -0.023182099749669196, 0.0388439190910006, 0.0043571338060202774, -0.022056419108319403, -0.011078269417008643, 0.006320910933622393, 0.018556055306889214, 0.09750142460981784, 0.01022591453838717, 0.011917921576277904, -0.009491467390774711, 0.07437342900637295, 0.0009756071744255642, -0.010872193665094055, -0.019242647433569793, 0.10005506070095227, 0.06344736442938996, 0.07562067293821484, -0.0016294481470091418, -0.03200346390382643, 0.039363095611750276, 0.04310214676731473, 0.021374799537668982, 0.011751763880862446, 0.052523930735709976, -0.019522981110628293, -0.014946480305368293, -0.03470321353159435, 0.01269222380711894, -0.03454616596931857, -0.01549532889826415, -0.023067399768219348, 0.10331956394839292, 0.004891880273551683, 0.016385047917412413, 0.019390219462247144, -0.08190032394046193, 0.033790321903778966, 0.03733009453340939, -0.035899553292293246, 0.014860321986985852, -0.015370926368462774, 0.03384106125599163, 0.00721992434103528, 0.04747289912617744, 0.01837732628079714, 0.007892045054653735, -0.0007994808977447939, -0.017056002459354, -0.03979617445504471, 0.012150617140336424, 0.14800960116884, -0.028701671150846302, 0.026529304782642062, -0.025888365944767438, 0.00026584030109646253, -0.03316768574164886, -0.03799605008609614, -0.09262963203212407, -0.0465364694892362, 0.007462285135951666, 0.06705950500859999, 0.053748355020178946, 0.012154089999590131, -0.03391016392487601, 0.03389633157389281, -0.036041695625643105, -0.05094449269489156, -0.061598606036829366, -0.019295168696104707, -0.04307375126443082, 0.004894603284417166, -0.054981586233151615], [0.04608717675108473, -0.0403810736897167, -0.015584578239120043, -0.04815244274390821, 0.0014291541931111765, -0.014312803652194162, -0.012384968851628566, 0.04195695232811865, 0.08414754783844723, -6.938902420406174e-05, 0.03776334678061585, 0.10875591648206775, -0.08524982927440206, -0.012028152618800254, 0.055289417344252884, 0.0633741260349507, -0.007382134699262511, 0.05318209070405328, 0.0633368181014544, -0.006589721938898998, -0.03713316825672469, 0.06061553831954682, -0.0004239249227572671, -0.07546179783556846, 0.06460594939024565, 0.03500991799395333, 0.01375358796307659, 0.0243890764521613, -0.015218146320212502, 0.03553348252590269, 0.03825035777809746, 0.06371850338841219, -0.0015542865050527255, 0.04594788277353329, -0.02352921534096007, -0.051398627566808186, 0.024397084688002783, -0.018793968700170083, -0.04976704236321761, 0.03162429411676566, 0.005071693011772051, -0.018017013140671254, 0.0771976177726262, -0.056620954841913186, 0.013574056952723791, 0.05023157226964857, -0.0425686770911577, 0.01214617254374672, 0.07966291835800945, -0.017952448189966674, -0.06702843492922425, 0.0029172363803396, -0.05917225111348116, -0.04821303839510875, 0.013385326626524828, -0.04228046474537141, 0.026313208894417576, 0.08690416831330744, 0.02496286945173815, -0.07981826652719529, 0.021670670640398997, 0.012976461213028976, -0.0011593139118398893, 0.017205152118428577, 0.08702439050311031, 0.05575917581625861, -0.004634249657384276, -0.01593396219074982, 0.001524819606459377, 0.019375896152348956, -0.05607960390209851, -0.06053820661605148, 0.13336917131016549, 0.008060506989555136, -0.1026096767167033, -0.03306441864998087, 0.026821610005893167, 0.01919629840669748, 0.02526684583568631, 0.0014474554420442934, 0.042710124007475224, 0.03148298937564967, 0.025799814241679955, -0.013202940506002458, -0.017253532308436136, 0.009184964130030785, 0.015423138297778706, 0.10031651258042573, -0.09540729572058375, 0.016907608436966128, -0.04007375183623041, -0.03047248638458683, -0.023903076639531416, -0.02455678225774165, -0.015715343155346836, -0.0024522168399237682, 0.005036172786358308, 0.029331376610939725, 0.02485376884453687, 0.0028908623364173667, -0.05220775534333975, 0.030306974139258713, -0.0352515868212131, 0.05595974150260156, 0.03601035846258926, -0.04942643700489885, 0.04197189523195329, 0.027559748833838615, -0.03505900615843383, 0.05445582962998811, -0.007187562858278091, -0.04664850475748223, -0.03672107198431236, -0.03947924478025054, 0.036839358850453544, -0.0539006093541871, -0.02064132073052879, 0.02283122649977422, -0.024488326348970614, -0.04940990986310426, 0.047149245817283365, -0.01644625861259396, -0.018061968068935744, 0.015087945752489756, 0.016837684351624152, 0.014829060668938165, 0.02594440932317429, -0.002301017865394935, 0.038833760660684086, -0.056005649585023264, 0.01214661502779231, 0.005745410877673655, -0.03285535146689316, 0.04994798206867948, 0.031103860340784762, 0.01073639080992001, 0.050893452961946986, -0.05292040128718981, -0.014933843792468385, 0.006889589024292633, -0.0877299392930226, -0.009604074137257545, 0.007382775213053094, -0.017432185604534568, -0.02384815203795123, 0.05255664748483361, 0.032711252547836835, 0.014698906525771022, -0.009975456799789914, 0.0011154304659456318, -0.018211170787573658, -0.011466004928842893, 0.04321512742178764, 0.013172322060815056, 0.0048377099873074285, 0.026105960973602547, 0.049058470174121696, 0.05236876730830912, 0.09568673672689583, 0.035391362453528925, -0.07867628049006117, 0.051201143310343374, -0.05618298558435647, -0.002787318168214796, 0.01596290354886607, 0.029164152460123754, 0.05034473212393037, -0.0594675461055316, -0.005482728410550492, 0.006250974288188028, -0.07618227792317649, 0.0370950188781581, 0.0680280948850191, -0.04993960243639318, -0.028532276538418368, 0.027900566004192315, -0.017021664865478004, -0.03603069531947801, 0.03299814469532317, -0.05659050613650721, 0.05590619077771374, -0.03641207884682437, 0.03815582287521656, 0.09394548511683257, 0.04361033966363418, -0.049877573427038406, -0.044915267186329905, 0.07299364214001562, -0.037074229381852224, 0.028437448580530218, 0.017901430504893935, -0.08287442403787414, 0.04882738034246991, 0.01957334704116443, 0.023525952565161608, 0.04934096939803412, -0.034864954417548895, 0.043754220967586126, -0.021430398902109397, -0.07047266110325627, -0.026441044711339304, -0.023327178576511454, 0.02506579269150953, -0.009626555228308195, 0.014513630476662378, -0.07549934369491221, -0.022855734312830406, -0.10266171864353403, 0.01106184362852023, 0.039614299615568505, 0.038783561208403844, -0.006187187674173478, -0.0014451605094226007, 0.11929932766818378, 0.05226158461556118, -0.03197187186302901, 0.07192446721527504, -0.022873168184226616, -0.011722929300303948, -0.010982924060146533, 0.007503193256449916, 0.011242958151449293, -0.024747561067456587, -0.012068722602711322, -0.0059582021805811266, -0.13479187502889076, -0.021796749578044634, -7.240481819315981e-05, 0.02128082188549194, 0.10359696452843002, 0.08029809912776681, -0.006055073544299478, 0.012655467327917667, -0.0360142697313988, 0.08634733478419925, -0.002821932208064683, 0.03489853968199279, -0.01616633450075013, 0.018349962799617644, 0.040807300436240625, 0.03572115669346169, 0.02760408138290455, -0.023999155158886114, 0.07179396198640615, -0.05141285669310044, 0.002748693844682877, 0.04373559021311578, 0.010833111293832652, -0.011078981543374474, 0.01051143192114252, 0.05553546748894767, -0.04336629738096922, 0.016414672505575715, 0.0042323174611142295, 0.02539920514524459, -0.010995642937614335, -0.0032498019486267454, 0.027553104319317966, -0.015336331632638305, 0.07516536544190575, 0.06534067021028485, 0.007898247364653938, -0.04369559545846398, 0.13207847581529672, -0.037218598143638, -0.046563817663458566, 0.0065817398168700435, -0.043926743320810265, -0.0132240375649892, 0.020527641501531187, 0.010987969829033613, -0.013091489655673787, -0.023784257341768165, -0.007747428491174101, 0.05080250145445167, -0.05261511921261532, -0.05899046996294899, 0.04288911098006705, -0.04163029174568907, -0.06324186247603836, -0.08399258847491457, -0.046162146605313786, -0.011025423564649844, 0.07595208176422007, 0.0625883440068179, -0.04347914096796597, 0.05718586624369627, 0.02051634292531136, -0.05820038205728402, 0.05735088232658639, -0.040908639438052063, -0.13067738272720456, 0.049189967727866594, 0.006963660128140564, 0.05978363349542264, -0.04576700109876592, 0.05190459138911463, 9.091016062548047e-05, 0.04876336668336311, -0.0756762850855228, -0.007687837496372152, -0.08920120309690839, 0.028192820187850774, -0.02974475246016586, 0.03436666225305581, -0.003875388793815317, 0.05365975875971983, -0.03419382943561608, -0.024630759787094697, 0.005445901406434898, -0.042183100846133456, -0.03713415768006598, -0.03540959569774192, 0.0521870151731242, -0.0430297657774046, -0.10377018615152292, -0.026997001976960505, 0.033170403008887316, 0.044617259259311426, -0.07836029755542025, -0.000658868536561843, -0.023968781893382987, 0.03640505713278945, 0.024899845215972636, 0.04301078974030196, 0.007281272274529683, -0.0058427871084341864, -0.04878664859799791, 0.014117057415029726, 0.02805732141771986, -0.07901377540315455, -0.04857677768979133, 0.047069810501112266, 0.049127700792664354, -0.09370350292382248, 0.11225131412251295, 0.00536907311921437, -0.024199458256336435, -0.038852281156834874, -0.0495687514800992, 0.03027998986631459, -0.027196148812822844, -0.04572862249895604, 0.05351511145060044, -0.06319134675647307, -0.05445494756343165, 0.028428088229506807, -0.041780829170300564, -0.05668182904044734, -0.03390601750162186, -0.0058830292189213105, 0.04485692892914555, 0.0597505037719306, -0.045493868028946366, 0.03189365519144249, -0.04907121951770411, -0.017458425633821682, -0.005812727934065062, 0.009656807354736544, 0.00510019007238351, -0.03223212792173825, -0.004106920746820849, 0.03509196759291181, -0.021342290898644756, -0.0007392293516373107, 0.0067001412936328695, 0.07123000228801292, 0.026876254609372378, 0.001322188934121705, 0.052701219354050144, 0.07419721035015683, 0.05561776661989251, -0.0331567774018179, 0.02558708242023435, 0.04079005951690364, -0.0435099871836293, -0.024716566873522278, -0.005324616529538931, -0.07834497164900187, -0.012285591287291345, 0.03448823945957534, 0.03610499491918555, 0.045274062265840784, 0.003647755778096738, -0.015372426724619472, -0.12360266345592322, 0.03795645552271511, -0.003072473203130354, 0.01189192556345332, -0.019683207850463708, 0.026819959032634545, 0.017481394182706163, 0.001209945602121221, 0.017882960785600838, -0.08143305764779654, 0.030157635048488715, -0.00530024581399851, 0.030142576083265062, -0.006634103088671584, -0.0965394455549995, -0.02991797118172404, -0.06769867204153117, -0.015453939539653794, -0.019282597303260974, 0.014582524517176917, -0.013644388703694655, -0.009610456062885566, 0.01739405943824578, 0.05827311772977469, 0.025727301987363123, -0.04647036793456488, 0.015197098587316089, 0.02487972017111883, -0.006075378121614407, -0.015757305150542307, -0.025916299254756803, 0.016403225951084902, 0.028411421814045407, -0.01983363356598828, 0.02139029388913804, -0.04290479957832607, -0.0389746882022858, -0.08006758960306007, 0.004085088874164956, -0.006736533067539688, -0.0824191732394943, 0.017859670166361863, 0.07647811840375526, -0.03528101418639582, 0.042401142476126134, -0.03384868897852187, -0.014843675699348868, 0.040341348777794335, -0.004506530264543394, 0.11673514858243603, 0.009649037044742528, -0.013878184216477664, 0.043962295825797824, -0.019218572038015278, -0.09647379543030772, 0.027125452919243974, 0.037855737449334854, -0.02242093062965886, 0.00806925148983313, 0.01133723119082125, -0.012428734150655733, 0.05736573238130983, 0.030633562183320157, 0.04397169679830739, 0.017381664081899832, -0.021543198966085277, 0.0014521945549801046, 0.04515181770633446, 0.011124362997243563, 0.06484039339603974, 0.04869446103670967, 0.03788145375160407, 0.01736730583731231, 0.03616570373024037, 0.01803603125002741, 0.016293234572722994, -3.967957544228075e-05, 0.10401094389687898, 0.04476508955202433, 0.00377446543685326, -0.006114942361051362, -0.04172386914211067, 0.09419401317218265, -0.02394492257333788, -0.04806938050933064, -0.02989191249835725, 0.03734737695934541, -0.0023638112478038746, 0.016322299246065063, 0.0570890072115005, -0.03261681919867131, 0.015158618433790827, 0.03312605885368248, 0.014662041076320319, -0.01638770419107258, 0.052840411777886204, -0.0016122700496169278, -0.02327069730155121, 0.01155792772508746, -0.0002480924624494643, -0.02612240397089011, -0.08373581425787555, 0.045223505924789346, -0.003390332342662954, 0.017611451124460015, 0.09704374389637371, -0.02546302730305952, 0.03593916060350293, 0.033383416279201265, -0.019105188765559642, 0.03336798301599806, 0.0055513798102236386, 0.028589445477108476, -0.03664584969656222, -0.03432653692934137, 0.07427125751634328, 0.01592894253567527, 0.006319311959419015, 0.017296380722490148, 0.08414800047786436, -0.04335828914512774, -0.021238331810976487, -0.02501766203348834, -0.02719976412509041, 0.005431474250397651, 0.035879029197858424, 0.03958830186443094], [-0.012780773411482798, 0.027144378341280154, -0.016846463733933524, -0.017204876363177652, 0.020569507928058457, 0.02729632166757694, 0.020717497073103122, 0.023634278494341503, 0.10712701073420003, -0.025168342421111798, 0.04677031083395771, 0.0018037959041671012, -0.08970833814599917, 0.03559399041160286, -0.014401898866847718, 0.0024008100260785527, 0.001012055680485058, -0.019239438801947294, 0.06009495512268359, -0.030970586679982957, -0.03223320871640231, 0.06293801337465607, 0.08898640162048936, -0.0734390090905601, -0.0001469317227041423, 0.007773961873133739, -0.0012897108099318916, 0.029196608069611066, -0.013563232863177708, 0.0529377981983346, 0.08304246554480114, 0.052084969967087676, -0.05042508696768631, 0.09951932826755977, 0.009693925494183377, -0.08093785981721763, -0.024971894755846928, -0.04021619069675473, 0.07144663488752391, 0.039966580832056696, 0.011793542617427072, -0.04381052020628135, -0.01617594798411541, 0.022498713747545217, -0.017654074830471263, 0.1252405606534897, -0.03934033278847419, 0.004811019683799916, 0.0004590868179675833, -0.04094964399247712, -0.031593699581322084, 0.013508174704341045, -0.027238160239477192, -0.02229981282864566, -0.0001697487321059933, 0.026483815653944486, -0.027588050226960512, 0.07077166947648729, -0.005581132701946732, -0.0738110846040232, -0.015369628226203488, 0.04424316983586762, -0.0034723098410236776, -0.008126326362905273, 0.04986749525535098, -0.00507284076334177, 0.03050311050726307, -0.02293175744306965, -0.04839565124950442, 0.05040488142987624, -0.07493063366114615, -0.015556409685808553, 0.028353003685691394, -0.02829823238367737, -0.10128612676473471, 0.007910282609847453, 0.015525137462901554, 0.07707327061515458, 0.004639508762222868, 0.050741205117929344, 0.02318051156653921, 0.013554025435264544, -0.05932149254406233, -0.026380025639935405, 0.013749972791323601, 0.021091745744313495, 0.006071937964545417, 0.05533749363595078, -0.042550038488781076, 0.003624414222455733, -0.06489823256981593, -0.07677031117653317, -0.004576996672313108, 0.010288905178250438, -0.005353388667577671, 0.04283145951950743, 0.05594646072912709, 0.005935243444699175, 0.10647539566169574, 0.04852619525000198, -0.04357330410167791, 0.025854612115825706, -0.014213031175805286, 0.05354770409565772, 0.05675135199801314, -0.019151577551301674, -0.09503651142277342, 0.01483495608424258, 0.028692481832945628, 0.07420118670246181, 0.02968784410036765, 0.005648404007322989, -0.014123507700944987, 0.0009883953651462847, 0.0407697915256182, 0.022781098694463466, 0.01514118202042009, 0.02118161982195702, -0.037147576055878755, -0.059227310784839796, 0.0570104155818357, -0.048914102942039794, -0.03701632505472742, 0.011691667879779242, -0.07161854035796307, -0.010450069454330814, -0.0288398277232971, -0.008602475849656444, 0.0708067954324661, 0.020827756336263818, -0.03826649924357048, 0.024063053142202435, -0.01481739214040529, 0.017535381783555425, 0.06579343447959074, -0.052224403631543355, 0.03452737368211583, -0.0528936087257779, 0.013431052716358437, 0.02045176720715986, 0.01447628750530822, -0.023469253724254107, -0.04665656099653097, 0.027472911500271303, -0.016162732287468416, 0.01764745490904917, 0.01867051962558536, -0.012587828876506507, 0.018212035496699686, -0.03543578066421087, -0.0018934945596880263, -0.015097365365148026, 0.00042609490289658754, -0.02222461191211163, -0.03727043963397356, -0.03624441942290109, 0.03470343616186352, 0.07752606010489455, 0.06726166235094586, 0.0299873458035512, -0.08845910276130292, -0.031166240418284162, 0.003192796601337445, -0.03170352034954178, -0.013738658849167428, -0.018960378303458404, 0.048775411048761846, -0.02978486352068416, -0.01691816828111419, -0.013513008773018836, 0.024321432905720516, -0.0016236600816841404, 0.02175116486775016, 0.012995844555717733, -0.03717414073618124, -0.08003415844603132, -0.01856059647748957, -0.02640905130065568, 0.08725382504567035, -0.06337041574718309, 0.004880322650207887, -0.05945513498458353, 0.030706322971133182, 0.039084178338489296, 0.05329482193831626, -0.011558418539348319, 0.00604555389779792, 0.044813309843959565, 0.031753995560151446, -0.03503280188173385, 0.01387017062924843, -0.005730126328794572, 0.037266885313746924, 0.08957505886428373, 0.034888195135991805, 0.0489308584711951, -0.05504352817285936, 0.05749629115681572, 0.009782624134947605, -0.02662884350936555, -0.02635690324150457, 0.06363156556244302, -0.14539150874094725, 0.03971833474457605, -0.014905406960865047, -0.012781710283933838, -0.021079435047137246, -0.07715563812301512, 0.01347353070645819, -0.017195940338520923, 0.010130053142013144, 0.07129977192111626, 0.04424801839226372, 0.047937692541869636, 0.035032701433553526, -0.013427982285923531, 0.09982962042334437, -0.026850756720036742, 0.040424017981832136, -0.008704988046910138, -0.012708799392741473, 0.028529618630430836, -0.056185902147263725, -0.015798149821917847, -0.006356770370011024, -0.10587186436043124, -0.050420837236980556, 0.054681060914182796, 0.06524745998564832, 0.09989300322512487, 0.03730198422598487, -0.0028102522626198678, 0.014186470358894344, 0.04753260434760594, 0.07683187045750174, 0.029361858848104175, -0.0021320947243145053, 0.08909039639425062, -0.007375392186263932, 0.058857746475884626, 0.02728632321024377, 0.008427474836737298, -0.0068541578859641844, 0.03763496608034664, -0.0210493025247377, 0.009631297985451042, 0.064278393892816, -0.006488594118959744, -0.08172092292384234, -0.028014607288071352, 0.02413479052821128, 0.037133331731231387, -0.030184044589266865, -0.021199538231969083, -0.05588195754379689, -0.009626506414080308, 0.023295039877363415, 0.05451346698871419, -0.008703085326571427, 0.047805247752729145, 0.001097157805543066, 0.03176960752540776, -0.02180784082179867, 0.09173454793223623, -0.06613396926443409, -0.0607959443392056, 0.032348324262742215, -0.031910860847283805, 0.016101047446274445, 0.03351078787321013, -0.016687348021222896, 0.00560552229280619, -0.019958813898858997, -0.01561260078421745, 0.07762045048726082, 0.027276108402983768, -0.061969704506567705, 0.07071504760992049, -0.014433130524143434, -0.046860872595297254, -0.056010867329668514, 0.05924405472382045, -0.03147349208491838, 0.05738173387055488, 0.03584251852666671, -0.07241501716005173, 0.018228848976728253, 0.021538523796800605, -0.05774347867501147, 0.07871885906581842, 0.008206458898753752, -0.11805010902075695, -0.015008587524857009, -0.06406186624996647, 0.12427575588153782, 0.021705988298652258, 0.10877184196011994, -0.0286376796237992, 0.010672548651864183, -0.05440804662347072, 0.007807233884092159, -0.0032806636470703887, -0.017884663286869516, 0.007330365323588616, 0.032999355963122354, -0.01451906007901371, 0.04222610856082257, -0.037408861089842954, -0.06445286851863638, -0.019198336179239585, 0.03350158141114485, -0.035080252056759326, 0.07319376872170588, 0.017197750337462417, -0.027506760605342608, -0.02482416059464461, 0.03783245492963442, -0.05080124222262695, 0.043060778851781285, -0.022772440833998386, 0.00607278453021896, 0.044904694507699405, 0.06163586111589014, 0.026184244409713026, 0.006621286648083423, -0.04127262352611416, -0.009692206284943324, -0.05185977673698995, -0.008760372662332833, -0.022684664577966883, -0.10429713051080691, 0.002919057441785679, 6.753160138198359e-05, 0.06446248063681448, -0.022197828950186526, 0.024705106320618783, -0.05430489020567596, 0.041374883637069176, -0.06187432895935601, -0.014193888070671654, -0.03408716725865643, 0.03489245645687221, -0.02873983928657389, 0.044195549671613904, -0.037612152753239855, 0.05685343052956528, 0.06661680048687217, -0.032741586615469276, -0.0823259068603299, 0.005369669965420134, -0.05171205223426651, 0.00799656228457701, 0.016323041788168204, -0.04461304321614684, 0.01126467715296684, -0.01745896776207448, 0.004666264680407118, 0.011144498631999764, -0.03920169498267795, 0.007794347058650914, 0.004140256193998615, -0.027365086173787533, 0.08289058789616072, -0.014458063887363651, 0.07401239821094617, -0.0011084065529668216, 0.07436800022283717, -0.032439063740093095, -0.006894512942406837, 0.028517607346099767, 0.06221008472885116, 0.07068777979235578, -0.0817796387486296, -0.03358028642381535, 0.039271096948494406, -0.0496419929539292, -0.0045605352438395945, -0.029125465645901023, -0.062494391713065874, -0.03563722562644655, -0.04086046918870427, 0.008531183719523817, 0.036444129722330514, 0.013602437594786144, 0.006548466063668556, -0.09067149711315048, 0.0023768422692840353, -9.781189850834416e-05, -0.017533440429301207, -0.01015735379840604, 0.08452156499997988, 0.030872920141581706, -0.027232606614123085, 0.004351044285775676, 0.01054141838169881, -0.01655312220857754, -0.027017686142158628, -0.03336994793423, -0.07060012716485389, -0.05910090834008457, -0.05520935266499775, -0.036938145463307814, 0.0029571794579120367, -0.01519853406798997, -0.009733989830411842, -0.024038937852143075, -0.04918898711426239, 0.031079551706974178, 0.04884533070904609, 0.0007976411317172596, -0.01568041779365024, 0.04016721834545828, 0.02520464671151356, -0.014204021746709095, -0.08981873842295146, -0.03452857133349654, 0.0684763821955283, 0.03128108939060707, 0.017057109363147152, 0.04667017172496402, -0.03441358134738203, 0.046116636573756906, -0.008335268236445051, -0.011167276222734699, 0.01542149715531506, -0.028411340898106697, -0.06244058625893952, 0.09354550499483548, -0.08030278778733337, -0.0054410567486457544, -0.06203504991125595, -0.03167838512411304, 0.023528724842089534, 0.0663917115683463, 0.04022963916274265, 0.021709189118552, -0.03743161260268492, 0.045951839743771, -0.029637513766941136, -0.04151108750618848, 0.04205021993369465, -0.025802377130364706, -0.007531007183305697, -0.07472251275831089, -0.006877054758913247, -0.050991873551912266, 0.08700421904436387, -0.010518935374569615, 0.006892437335296233, 0.02295992736256145, -0.022296212147720425, 0.006658313875629107, -0.017650959005185637, -0.02226905636851068, 0.10765699078712263, 0.07067156900140911, -0.021300956123566046, 0.02050664088904998, -0.03495189473587946, -0.00880269901431422, 0.05796957593873206, 0.0005841433536913393, -0.002408305730072792, 0.06880636219465519, -0.037304742687552066, 0.013588683920865714, 0.004223436462856637, 0.08030556170246676, -0.0221533902888748, -0.056627236681055924, 0.0009147324406423822, 0.020062453240597602, 0.001540160600099243, 0.03855640814553368, 0.0637486649603442, -0.027646661740175917, -0.03753539102651935, 0.03608463727514797, 0.038470899700342426, 0.01749347750710095, 0.08719836992335185, -0.026723967936126452, -0.07530440906689156, -0.011692621171644373, -0.03603051502291446, -0.03409025797189697, 0.011723033789931343, 0.017325618939311126, -0.00013250104977994903, 0.05011095460070033, 0.04208938699723547, 0.012843171048417867, 0.047601368853816536, 0.006907376104574834, 0.011939997030178225, 0.026371014279143436, 0.022910672983681803, -0.06336065682012607, -0.029537853718499735, -0.006139973255600821, 0.05665083041325594, 0.06588844300460513, 0.042384944177645774, -0.029680973058494764, 0.05394656450274172, -0.042915094219796605, -0.03930803869850203, -0.021288340218457293, -0.04636362705898358, 0.03692745932227863, 0.08586611025423145, 0.06504776900317664], [0.04099830892400946, 0.07584288826768916, -0.0612461777265903, -0.11024065239778019, -0.024552725382655693, -0.007543790903458445, -0.0042947012983292464, 0.011504694448600335, 0.035117630985146156, -0.009331901467935498, -0.018674240022389235, 0.03339281394443533, -0.09979128331542693, 0.014125637778880297, 0.0345871953602431, 0.06401418792258969, 0.0076855576056339865, 0.07715657276498546, 0.07721243196955163, -0.023109164969931664, -0.027684987148826744, 0.027388128159037902, -0.05679697524334158, -0.0605378717405004, -0.0021400778522122944, 0.004367487690793203, 0.04278054540546666, -0.022682861363482968, -0.03957850774659786, -0.055323260001623714, 0.04346329994662305, 0.032846002712927265, 0.06813589202031253, 0.028516546638187434, 0.006721081200867684, -0.056783362698165835, 0.013325634409928592, -0.03104578914896203, 0.05020246863217341, 0.044720733461986344, 0.06509022164382104, 0.051390138283091455, 0.021948290828919026, 0.014781024608977088, -0.057823748115658734, 0.05121903123644786, -0.01848361627691882, -0.002189984360536972, 0.032200223019926866, -0.05731080500652052, -0.07255863234808202, 0.03255352028872321, -0.09677992438832565, -0.017479657562932693, 0.03731064259908674, -0.03548872663098496, 0.1148842314412764, 0.16634072443839293, -0.026221178032195747, -0.02664545058229532, 0.028084734092098062, -0.005395351697443426, -0.032193480325245015, -0.02225393044302598, 0.05009677809586063, -0.011815031095304851, -0.004276733666591024, -0.030712022325566794, -0.10756942495796344, 0.031855438317250274, -0.08484620021576572, -0.06575326703411075, 0.08360245828838025, 0.014752624186525088, -0.015095604651328094, -0.03534727438169596, 0.03662822484900008, 0.0025160891870957213, -0.021733242857605632, -0.027618324855202266, 0.019950892966910664, 0.019419692688813567, 0.020181740907031304, 0.019518564924285983, 0.041376219434045056, -0.008079562776662847, 0.06046506300985324, 0.07064738426705464, -0.04109542503461826, 0.06043057285499745, -0.03152186394589489, -0.005027886865534989, 0.011141546900175117, -0.029613055881801294, -0.03699833074149109, -0.013464557289551008, 0.026731129543107374, 0.009445921569097992, -0.008039697711265559, 0.010849066194292841, -0.01701262801187274, 0.016421094019282986, 0.008793487674987633, 0.041666516152939405, 0.019344299602202727, -0.03505000127635708, 0.037666163376272044, 0.060533438470296734, 0.011314817313945225, 0.034345293456083635, -0.012607771977234932, 0.013235301374563583, -0.07791220133301681, -0.07862313978808037, 0.009183439324927175, -0.07309176573818653, -0.02567848218136124, -0.020027370314567437, 0.019871023652051553, -0.06147118852760945, 0.03389610695843254, 0.006292723770306225, -0.013896777077903275, -0.009237154923067346, 0.017787742348938797, 0.011133484534362872, 0.06375445327495206, -0.020586400532284128, 0.011556150453594066, -0.04793399519875062, 0.05283479326679212, 0.0067126197548210195, -0.003715651772663803, 0.01693063485128815, 0.013432747716678826, -0.020299700260884457, 0.05507114439277798, -0.07140910944077691, -0.05127488013108333, 0.03198666311527873, -0.06748540412562297, -0.057839068672688135, -0.007305460531127784, 0.027375553480219913, -0.05750481728254971, 0.0687223689918909, 0.007963271913262316, -0.021564271684940007, 0.02658049458220272, -0.08836074562091357, -0.023185152595879895, -0.0317234024713396, 0.015243923314467424, -0.04942126799934713, -0.01416658710532352, -0.04098192300747375, 0.03177457753072158, 0.06018844069571888, 0.09289565799476648, 0.04183552684700607, -0.04872286985666588, -0.00047555027920817637, -0.025650114407023146, -0.05612812879870785, 0.00240689778493752, 0.03980483134546026, 0.03857364347703138, 0.014676150275511881, -0.042491626780643374, 0.022403311029028046, -0.014234453083357945, -0.019409372448176664, 0.05975349221237304, -0.010561468958921731, 0.006783427499750278, 0.0285960911902293, -0.0634388250563126, -0.04448581138091497, 0.04355748460026771, -0.09303201713828663, 0.007848539567720202, -0.06330756589184845, 0.024532944062274072, 0.07385938131898562, 0.0811164040773339, -0.004085326366386935, 0.00141196691881623, 0.042539701987526365, -0.023506102457085544, 0.04813708021380126, 0.035614119444877274, -0.046311414867566, -0.00952738290909032, -0.0222019082510043, 0.022060344310799312, 0.007598748848248712, -0.03315022127491855, 0.02357999373045685, -0.021862376458022515, -0.025813124721418803, 0.005611669938135914, 0.03165857019041547, 0.01481739976283033, -0.03933872968816387, 0.0453939513172395, -0.06316805878281935, -0.010271813174052952, -0.05738831162892613, 0.004123144910539045, -0.0005572334975009101, 0.011389054829156078, 0.04338657000566397, 0.016017812488101225, 0.06337862193427556, 0.045822332374725494, -0.01441969934080419, 0.061637955093425734, 0.0045887723110229536, -0.05918669346186923, -0.018300640781710613, 0.039524896106925646, -0.014722813021888123, 0.015358842957084033, -0.015003342799760136, -0.0028537778651735505, -0.11075309719360094, -0.021213173868027655, 0.025932202702753576, 0.010159790621964785, 0.06054731563702727, 0.0417068864049413, -0.044851683328529304, 0.05381149424231285, -0.042461738291526115, 0.049954611024709335, 0.059092034551412084, 0.04888342984419703, 0.020809316699048133, 0.04754986780049918, -0.02771303531531295, 0.02769427467807124, -0.028618089145712754, -0.021074663385633487, 0.045327383531313166, -0.03810751088994286, 0.004718440309514775, 0.027281396319723795, 0.013712379671418508, -0.018402683320875184, 0.02266176724525809, 0.021830312573526245, -0.012862196151397965, -0.01154658026041604, -0.002920272837214274, -0.03721709028785872, 0.059808506002621296, 0.04256395781783447, 0.02140721707384896, -0.04301232295767264, 0.0423445659290502, -0.01612010418392453, 0.016814957428764637, -0.02332666154978778, 0.12718154563012102, -0.03433794591213368, 0.022250423348264086, -0.05249770664570949, -0.022731682322020372, -0.0120537695690593, -0.010412895124997424, -0.002950611526639039, -0.0009585142577549996, 0.002380203011646726, -0.02409976545036613, 0.02949228535350892, 0.0008409831956066008, -0.02479373891445264, 0.005943586558549835, -0.00336775905545974, -0.05057688063905604, -0.08780684115707965, -0.036703518272947426, -0.05185087533977706, 0.041436501598884186, 0.037136202008181476, -0.010086741326267822, 0.02224394183849346, -0.013846441418712952, 0.012877294185756297, 0.031208400812703718, -0.03768143582029149, -0.04766476166828903, 0.012754181584871831, -0.014896358367143729, 0.12562151564853088, -0.05075048268893053, 0.025131432103125153, 0.04917446200481509, 0.06108826395460708, 0.006295816749518084, 0.010603033444563759, -0.07295738610136199, -0.004327391081535469, 0.013688182264051066, 0.008526977684554262, -0.0047183715766434, 0.10989183307555392, 0.051234980699250345, -0.008995691190962893, 0.043399959169007754, -0.02021274115034305, -0.025735599197473567, -0.02614670768438311, 0.03431636379052205, 0.015399013883758939, -0.04988713940152442, 0.00034363901162686534, -0.001587201374385867, 0.016859487737806482, 0.017985454171769725, -0.004869394878271322, 0.02175018207375591, 0.059648159086991406, 0.04025376696813084, -0.007662724545763332, 0.012334615518139636, -0.012964078027475697, -0.12131885164705287, 0.010912341675680332, 0.031880639224539785, -0.04463306124790443, -0.012426154815397269, 0.038019532814583326, 0.01701424151602826, -0.0898446539474563, 0.0723160671717138, 0.026983356842869097, 0.0027005746575719386, -0.0924753427397363, -0.059004681945182054, -0.024003207794337254, -0.07003542802005769, 0.014518898057415635, 0.05139528637515741, -0.05854634366570743, 0.009344428892904419, -0.022901012623938927, -0.011218190925044976, -0.016038124769914217, -0.015338408674424353, -0.015044034377935705, 0.020577477287257912, 0.02261282256755221, -0.053278216513178454, 0.054066427898884946, -0.005970309039779402, 0.07852345650472572, -0.05572985617552752, -0.0053501314822051605, 0.033103775037087134, -0.007818422541805621, -0.017482456709119423, 0.08595888230401404, 0.01655747721930811, 0.02696642621832774, -0.0072229381274336105, 0.035071817089731394, 0.007162396925585492, -0.006143704891039767, 0.03226875656597451, 0.04677895304187412, 0.03698513059354359, 0.00967927568154113, 0.08889918518868821, 0.02540554394913256, -0.0743944186096272, -0.06628795378710832, -0.046049686966658517, -0.12030959191036199, 0.05143039856249915, -0.019367591453989808, 0.02862658452861466, 0.013394474676414752, 0.00837177026938141, 0.024264452846823326, -0.0927574018239964, -0.03248737520995582, -0.0015094061813155958, -0.011981175628635193, -0.03049041723832426, 0.03625624942240768, 0.008027562922824366, -0.01576131687702714, 0.022959456184468784, -0.01344859837597871, 0.028611916933863314, 0.03922846841590468, -0.03084219894730679, -0.014788385899501311, -0.09015519593361405, 0.003297020043401856, -0.07920843455427108, -0.09131882969941238, -0.056853250281779566, 0.008052679632346443, 0.016356254865071723, -0.023350534194337975, -0.03126425314398275, -0.00396635835764636, -0.020675749828427584, -0.07396857035845136, -0.060699785765597626, -0.017341985621569293, 0.011478219405707717, -0.09981904452217515, 0.014036762739549322, 0.11023555929201134, 0.05555183116538007, -0.022769205314825573, 0.051411586375603904, -0.020490425387340153, -0.04359865559022112, -0.12344731622148554, -0.009580741955460234, 0.007794482882705835, -0.05825633218822929, -0.001497533973922077, 0.0012304283702002008, -0.037119149382793426, 0.09107324714999081, 0.026652406348878437, 0.005871977646088615, 0.037582508598521976, 0.003106558249759614, 0.0003865486210407166, -0.04632296198995694, 0.0043761763848958486, 0.03943999726420369, -0.03528840467736358, -0.11365667610509965, -0.024616124583211656, 0.09519264869652261, -0.013484820599193143, -0.02726533516600533, 5.223644526916647e-05, -0.03199850235237301, 0.1015682686055111, 0.01065470252145875, 0.0709989529041359, -0.00910033011434364, 0.0037962715645622376, 0.029984948828948043, 0.06293243562645996, -0.015548059397013056, 0.05222631490308673, 0.026107036789347456, 0.07631975005599925, -0.017284798154263814, -0.016142143379130808, 0.06790272950074835, -0.013019956133581492, 0.02684064334539037, 0.03568746772856472, 0.05915975704957751, -0.06095976097828505, 0.04676102063573248, -0.00381288730663661, 0.04960643091818684, -0.008853175300489367, -0.02755885201992358, -0.06479567379683217, 0.01863471518470525, -0.006536039853294225, 0.0023363269536242804, 0.030445709942138625, -0.07016259757867505, 0.039213120365726724, 0.027052337152580683, -0.08721534668589094, -0.004206298367908526, 0.03984049683241656, 0.008762423853769866, -0.044509046528083164, -0.003798075802435822, -0.02028156165612869, 0.027885453441478008, -0.0522051829817826, 0.004194790766918628, 0.005180880223088685, -0.035530330638028025, 0.0705262906942668, 0.013604980264091177, 0.027070096008222102, -0.020902487542840024, 0.018329137430182538, 0.057849048685611734, -0.048071041670984506, -0.0859107899139132, -0.009699923895262962, -0.08366151357146534, 0.05795935807088089, 0.026430390582729436, -0.02224807955735021, 0.046734950257620075, 0.0249673993872678, -0.0674036188819743, 0.053265848032974586, -0.03280466332743899, -0.01750887246991048, 0.053660598096496974, 0.0769466763223816, -0.027439605643053935]]','2025-05-27 11:35:35','2025-05-27 11:44:24'),(91,120,'[[0.0020922341258911847, 0.0009796821981711522, -0.038964287119409816, -0.08444613161378428, 0.022478047131936095, 0.024877700964644124, -0.005300108883192691, 0.021008378223655002, -0.025198708227173298, -0.04863546626793477, 0.09114812169520113, -0.03789924648405803, -0.03275597982476217, -0.05524675355833796, 0.10084557026118286, 0.09374451748376797, 0.05176145034266649, -0.00502094415368527, 0.02887679383542879, -0.010644177767659399, 0.04483512551154935, -0.012958259864498037, 0.004518267162145794, -0.0009408429337998865, -0.03957368477501051, -0.007651428770772382, 0.08121574080256219, -0.016435639991415195, 0.033484748143438714, -0.0904580324192415, 0.0773846639032379, 0.019328106246583533, 0.04989975825548363, -0.0236005872825417, 0.022047263024752694, -0.004570208364510373, -0.047783343949679126, 0.06523025217512206, 0.04642339377371601, 0.036628358746344306, 0.003211337228972705, 0.03559817230539595, -0.037005996480553305, 0.014981279721532369, -0.059039703482139765, -0.023616932697848144, -0.00766527469525243, -0.011270453094737228, -0.014792290479623849, 0.03342235398459039, -0.0504406784472181, -0.10462685545421653, 0.06250599339797676, -0.057531461189934956, 0.031502990686614774, 0.10754140043495676, 0.0424929685526253, 0.050319482528489896, 0.017705133033058814, 0.05671366213064697, -0.01784559847419498, 0.008690791677909258, -0.07477369248415054, 0.056228503367018345, -0.0262256218870026, -0.050848843648249424, -0.058337077790368175, 0.0009161297548024854, -0.05170504439592219, -0.02736102335420922, -0.04932902643525069, -0.055658273426053055, 0.03222815604044355, -0.005636992369949796, -0.07807447318339558, 0.04261274600205493, -0.038057486375678524, -0.08885331836591487, -0.04757325728824046, -0.06331060095693501, -0.027203583827947134, 0.029006556040814844, -0.03133144306999204, 0.007506046893915609, -0.05612213665991431, 0.05038997807530604, -0.07225867509809838, -0.00785649069622742, 0.07546707303151803, 0.040690778214827195, -0.035145844370281176, -0.05106966524307616, 0.060950780489259476, 0.049374760843882835, -0.031630235571253086, -0.05829130111821875, -0.06242669119074825, -0.009179470860453476, 0.022766413751779152, -0.005320897250752758, 0.013161065314351019, 0.03705709307293983, 0.001535050239323127, 0.011219545367443533, 0.037255345949541246, -0.003762561794513001, 0.01427528483499294, 0.17042966206375404, -0.010685004985715342, -0.009722186591304718, -0.042215101775355465, 0.03757870940315855, -0.0479219630034043, 0.0016080426354958327, -0.06501675801760304, -0.04137536530913148, 0.00866490527357779, -0.12093499433841993, 0.06814250964298973, -0.026823286133619582, -0.011023308592689662, -0.002632306240718448, 0.028872747103649628, 0.02629330162698024, 0.022962809675090266, 0.043672997652605405, -0.058886846906032284, 0.03296492537123438, 0.031935861554963675, -0.007545192156057464, -0.09062938985003649, 0.019637777641338366, 0.07484678195433948, 0.06680188446030101, -0.03729446611771972, -0.029521444547377217, 0.02284887779839385, -0.032231497499778175, 0.0003104197561759744, 0.041544773335192124, -0.024677089255484744, 0.05552523843954795, 0.002019626393762435, 0.04923890476759957, -0.00539002550674828, 0.06116539462998632, -0.013295291603749336, 0.06908942903049514, -0.0355626418947161, 0.050599774175063436, -0.009331394997711061, 0.04573456183739533, -0.012054556244142114, -0.017274935332177613, 0.01015532358773896, -0.010087383662983092, -0.14902681466013493, 0.019922765821269183, 0.04469380159271851, 0.04440411687943042, -0.07078316061708406, -0.07890490375140939, -0.0032472651808619344, -0.0010218051397245156, 0.020037825605582895, 0.028125366988552725, 0.07298787925929683, 0.05975874326743337, 0.004358224797550226, 0.06045344454971574, -0.02242169401458839, 0.03288931329735803, -0.037992775647789516, 0.03941203210436999, 0.03250526735734208, -0.0719789751407667, -0.04827425055165727, -0.040993823482514125, 0.04147042652536422, 0.027643446666935356, 0.11098389070762778, -0.053062617249038546, -0.0348673964696488, -0.01614761808338492, -0.01137794506798873, -0.05178175267977789, -0.016129834387756184, 0.028338493981765422, -0.03495317027796017, -0.012883220989574739, 0.06118940030779901, -0.014598204521678844, 0.023295317897258132, 0.056619689199984086, -0.0034893628246160505, 0.03707549883471346, 0.04772418030843257, 0.0023809832635839595, -0.04701387322239609, -0.050748721375822904, -0.016042959086525817, 0.022165188803831677, 0.05853952003811957, -0.047305665828608325, -0.006684251290775226, -0.08995634333741834, -0.031377605396736605, -0.030336990432900432, 0.02757125529648852, 0.05759326101807159, 0.027658468705857097, 0.059944755572843775, 0.032789920070604515, 0.02601029454942173, 0.034551484602421204, 0.024301282059867754, 0.049344125076797495, 0.08735005788580895, -0.054469670115005614, -0.005335718868151166, -0.0025180596989285674, -0.05417432737334221, 0.020131056283223623, 0.05017190360910224, -0.05206979968177154, -0.0844786481073884, -0.01347609360992057, 0.046529654822026846, 0.009972986887596645, 0.025337998214235227, 0.025775758443238976, -0.032469731663722565, 0.05452785641241516, 0.03917093194566033, -0.056011897558039876, 0.026868000934897447, 0.06549626931873567, 0.0008055254697240898, -0.020830431646369718, 0.024589513964749492, -0.007573587956727186, -0.012819697602374199, -0.018986569480537608, -0.0025715430243981236, -0.03482430881378606, 0.01699376275541586, 0.0333819976085316, 0.0035270674951495104, -0.018821574029827547, -0.02890860505658837, 0.04315563408881257, 0.0008283815303393181, 0.008198986976188998, -0.03240469867651433, -0.08433111673445767, 0.07911347949210544, 0.04116227793796623, 0.02427433906760439, -0.0195886040389879, -0.0980372968946328, -0.02669679670935258, 0.026475386066753814, -0.03342506677410553, -0.08576234433230653, -0.03762636151888708, 0.016501016369701298, -0.004954802739699727, 0.018811134941060407, 0.040805034992312667, -0.06059470507327066, 0.014448505822752816, 0.0047022296869683134, -0.004691216738880664, 0.021261835178228192, -0.07290712952660164, 0.027329898915205375, -0.0540192572455174, -0.0054950642148954105, 0.03380161622274468, 0.00212595909194241, -0.10501159081785805, 0.0016095717163435244, 0.013603050574347438, 0.034580633221992396, -0.0027497093389548697, -0.01852072910650879, -0.012626682760445155, -0.002846877787744285, -0.05784029127654902, 0.022273230202807765, -0.015350451544937048, 0.030485781786939944, -0.030484233885619716, 0.006851587083754438, 0.04991260636473549, 0.015915597977214997, 0.008457115370156086, 0.03003489081141255, 0.03223247484361518, -0.04410619870468302, 0.017468104700091698, 0.009758739911176139, 0.01761737548090531, 0.043165307151329074, -0.02792752353977491, 0.005745094522731969, 0.016168550411050708, 0.03442203673194489, 0.0776833718774644, 0.004387443085888183, -0.04276434787999329, -0.04429650339856675, -0.0697973270960469, -0.0005806757984988641, -0.009275999413176637, 0.010740920279438768, -0.03493688297498998, 0.08003511473040056, 0.004689459170892699, -0.0052537705685207214, 0.0858726838100345, 0.01781300801943563, 0.029547431327562212, -0.006017406949317313, -0.028157067267979452, 0.05633681947885672, -0.004125693236784519, -0.0296761395864862, 0.019400449501545576, -0.013152536008270783, 0.020170456447204048, 0.0759710813238517, 0.07387607348954743, 0.016720747037488347, -0.10098421572960634, -0.003598965002077788, -0.05790205940704769, 0.03257537196662342, -0.07554968764191304, 0.029620066464940448, -0.03079569223471437, -0.031358763792441055, 0.043125756423568355, 0.029123198065556574, -0.02113381634292977, 0.04270433104399173, -0.009806543251052428, 0.012962560177380856, 0.01803097682684624, 0.08784516442481638, 0.08453357483102804, -0.019924742961436745, -0.06061948734321329, 0.01224695562360083, 0.09407773361985021, 0.008470599413269459, -0.04230651512175333, -0.049612783690240844, 0.03745529464977336, 0.007383369110612922, -0.0572330226456311, -0.013341789397162277, 0.06293876653194194, -0.00941611287845799, 0.0584175897907787, -0.017239077379238875, 0.022757641430474578, 0.0377884394661702, -0.036253365123434876, -0.030810172772321013, -0.002229807487747513, -0.03691177261025659, 0.10162543781371576, 0.03781887712301831, -0.03139056180625149, -0.007575563776159832, -0.04690996836517338, -0.04508259953695817, -0.06646355443862839, 0.12012893397105531, 0.019353836804195043, 0.00028070965917409196, -0.014902604863388432, 0.00180351718111196, 0.07789727810427687, -0.10191967642099033, -0.032319329013086914, 0.054480172599048665, -0.06944180110578267, -0.035415807869820425, 0.04987845215983693, -0.02130924295799748, -0.019332624480727305, -0.023819969276311227, -0.03903607434497271, 0.0035035993564471717, -0.01027789241041117, -0.027445405107920314, 0.020012904658474197, -0.056925323108104164, -0.06750252904970029, -0.013523847422237553, -0.09446127503912868, -0.02360499325421771, 0.006192289421600096, 0.03995340662891518, 0.022825970972030332, -0.029620592117436565, -0.03217270630577762, -0.012163923660972733, -0.015843370946925457, 0.0051842484033368386, -0.018670747423284218, -0.04674224559686411, -0.04365372548872761, -0.07015499795981289, 0.04663562002571676, 0.009895556161742517, -0.0313293431014774, 0.02908277036981238, 0.037755738069677997, -0.029912308121023735, -0.0324625495072555, -0.06600448811397795, 0.032000957937447824, -0.043617077736309774, 0.018593827821842147, -0.06902438019446794, -0.057808868351454414, 0.005522905637084615, 0.016077197818458924, -0.025761885443693174, -0.006530416050095823, -0.0015310259600375157, -0.06078488561807239, 0.006707696316616555, -0.00868334933666396, -0.022776665296188377, 0.013554949408747845, -0.0076623294563922684, -0.06188303443627016, 0.04914709784219707, -0.0001305759431854784, -0.017449148191858558, 0.009896179548622337, 0.0462026989694411, -0.01863368099789837, -0.0061411749992922255, -0.039322985514939575, -0.01695906308699746, -0.05281177270812697, 0.012479784019538653, 0.024442035421215362, -0.010675088907974492, 0.020729458820658016, 0.05561711404316602, -0.010819529100836962, -0.04961484931964771, 0.029208911120061857, 0.02253512137054732, -0.07678356574584225, 0.008045335978030218, -0.008596170926770627, 0.05658005130371899, -0.051224148964598766, 0.00715376396823484, -0.0465150580597477, -0.021132850885707, 0.002603393702513283, 0.008332027906001217, 0.028845093556002063, 0.11086583813799697, 0.013456725032393991, 0.0393136532020311, 0.022453896173282768, -0.025815520488586076, 0.07859026771410955, -0.010579019971001706, 0.008143619127087784, 0.027482713227795583, 0.01687627149812387, 0.03972988545192245, 0.023551524621924082, -0.04948642105652567, -0.03611157102297435, 0.0887509455611934, -0.049276434770940535, -0.02407374320726399, -0.04478869375488215, -0.019445387507024056, -0.02712105374458669, -0.019277819264699826, 0.009589796783805529, -0.007536304930815299, 0.026338816793616514, 0.03861391199531358, 0.001538399953250968, 0.034271623515429915, -0.023404289093614288, -0.08964853814109822, 0.010690361226162601, 0.05695844185682946, 0.08602601056777168, -0.04563873459491196, -0.006220028817017127, 0.03682450901296125, 0.045195189546981075, 0.02555566325261542, 0.01800998110390454, 0.09809534583561119, 0.004172493148309236, -0.02935940358067172], [-0.003917049044027007, 0.05231630393916944, -0.018311122498386494, 0.01623684157989539, 0.022950140742594067, 0.065161532991385, -0.004515466819956266, -0.02613208481005403, 0.005342886160417635, -0.0007361716050421834, 0.043216208150810356, 0.02902735409308051, -0.05973920183013038, -0.054341285519677, 0.06759153460385119, 0.04554479951003799, 0.024856163895849687, 0.004337951679112626, 0.005264396424943831, -0.011569659195106715, 0.006225143739702553, 0.0011158999235877268, -0.02708800860032068, -0.009660525675985026, -0.05890544590909536, -0.06187914602801629, 0.04601312527796347, -0.04594976337286134, -0.02076113592554955, -0.10112336001859368, 0.027046505850364597, 0.03737738597197014, -0.022663859142107536, 0.024407564416183414, -0.008972735394621675, 0.0035970074528572133, -0.08012400454931125, 0.06489073534919035, 0.007815118381217895, -0.003305871122803449, 0.03074723117176807, 0.021584915584057535, -0.030383642118092666, -0.006239470379769629, -0.05958572278848828, 0.06714065247293734, -0.0015343956722203014, -0.06515552289391016, -0.02497884040780634, 0.045350750750186936, -0.06824958722871875, -0.08188746575646773, -0.013526181521485589, -0.03769073173413857, 0.011310341900061574, 0.07162620727804038, 0.10508576173872401, 0.09924910207159204, 0.03132881263946092, 0.03583374267572768, -0.12400596049652238, -0.0014264521489187603, -0.05313529049813362, 0.028553526870405216, -0.02272208001107788, -0.10344316402865768, 0.020962761277648224, -0.018521912781058174, -0.03726430502062364, 0.0019333435866172172, -0.08210604482589809, -0.07720746588705915, 0.0007315252668674715, 0.020743657962955263, -0.06380705174022432, 0.0015642681931502742, -0.05811593254361503, -0.05026197086497113, 0.010277222214749736, 0.0004414913536094156, -0.00818467774589732, 0.005794939261776683, -0.0633008554930908, -0.05068718370106253, -0.004815683436816681, 0.026765457340981548, 0.0024946661344243115, 0.01458834923113229, 0.08894157270772494, 0.0008985313185258035, -0.06065980771633666, -0.014096604054303026, -0.01155118345023435, 0.030619933188180973, -0.017691433392914423, -0.10383172338347207, -0.028416614603162877, -0.017053498679999255, 0.021185166089292575, -0.03851799699954136, 0.005027473842147078, 0.06448554993033341, 0.09355851336126039, 0.006154563320590211, 0.031201293099840217, 0.011369197792311323, 0.05530451753854493, 0.11115352619245353, -0.06768835771104197, 0.004313493141206178, -0.018512016091472783, 0.04443047251726979, -0.01573734350214388, -0.00848308251808155, -0.03200338835162302, 0.004052746653718939, 0.02023355171990483, -0.022154082112599983, 0.04641408552964443, -0.014277548242842756, 0.0081753950161656, -0.006546660940863736, 0.004536940592424144, 0.045052854620727736, -0.025543087456250613, 0.01044311229490784, -0.010810718221882565, 0.06989593578881871, 0.038747997126478424, -0.01589151529645442, 0.01446819408924816, 0.020682555305294358, -0.016814392912131975, 0.046059552188778996, -0.023130147218625392, -0.01209345354437387, -0.008833196440178168, 0.004812564879618383, -0.0030565917203087753, -0.03972778031720854, -0.042499524310234155, 0.036112004571899385, -0.009014236584323999, 0.08630444428841026, 0.013986211420181121, 0.05706485823818591, 0.007245606256468104, 0.033609117265393784, -0.03337756624622151, 0.06291300761398994, 0.04291483577597889, 0.016087979329122464, -0.016076230618326623, -0.02083703759010269, 0.009426198185250846, -0.025665278729288605, -0.10876587610798764, -0.0030880197167193627, 0.03308170780816993, 0.06914967265750313, -0.06255529135545869, -0.016453826069985328, 0.06454975749297223, 0.059719143207820784, 0.008385883389735158, 0.04528697069707774, -0.010359337589893106, 0.06782325100992179, 0.02935181198251161, 0.06895542106466358, 0.024583395653159007, 0.0038237006219547344, 0.009874860855194309, -0.01864255784262224, 0.027515798975619874, -0.05786032553200581, -0.032956909351102744, -0.030548988449816194, 0.027027576851775603, -0.047519737511519555, 0.0439312911710311, -0.0422027858890632, -0.041981217373433, -0.04850324034720815, -0.03340244293213504, -0.01950372118116585, -0.046624582484609656, 0.027266233266560653, -0.04065729525237156, -0.061592427556477584, 0.05976864069803156, -0.0064096082507832, -0.037054959532931635, 0.07221933462354056, -0.03622178090578698, -0.04981020563043039, -0.010987921702038094, 0.018000954973122606, -0.009077328565526031, 0.020940427805359825, 0.033317674345476625, -0.014987360725869835, 0.0015928693022994025, 0.010339520026789078, 0.02809362647277158, -0.11414590566936221, 0.05815756011387173, -0.10366511324620477, 0.06816241273076588, 0.049620066866496254, 0.005417985074412414, 0.0012348411880483304, 0.024744432564003636, 0.04525876755015269, 0.00769497962199822, -0.004625363683446648, 0.0448272918554777, 0.0334435993057569, -0.09017320581901563, -0.014130906233167104, -0.015921845069251272, -0.08556620710242455, -0.007857598630153206, 0.02181313702171077, -0.03685831139032018, -0.09521841740600766, -0.05568681091426821, 0.04403429288310256, 0.027327460744522178, -0.028431717859537874, -0.007376548212706421, 0.023650014409184295, 0.07789775335456178, 0.02148516856132474, 0.003859560714195923, 0.05469008960874398, 0.029782960023897475, 0.004260289658257308, 0.02731808673994563, 0.015941131365950788, -0.04631164238841825, 0.01289587410906517, -0.027778274224270694, -0.04005879751343721, -0.024481754482364306, -0.0276173652542342, 0.04170490579445847, 0.004371756917154862, -0.02199714086786944, -0.017490185622225127, 0.06044701406784003, 0.026458368196381695, 0.010271780049642713, -0.020625690296839496, -4.4017586465991475e-05, 0.04320440327087924, 0.036264953127263855, 0.060083936777397165, -0.05582552995536202, -0.07019947379586593, -0.003782020003070269, -0.0190739055964891, -0.03633952389536164, -0.05064673568264669, -0.010929917708340075, 0.047679338988907055, -0.04979059636120302, 0.032065442764076156, 0.0532264155586011, -0.02392995825890686, 0.0076981204128125655, -0.01055057789298021, 0.053755934478905434, 0.012084079539797322, 0.009144233806912, 0.06533879654131021, -0.07186213012824186, -0.0862749679744189, 0.023340617649276734, 0.015262923383040642, -0.01845856647849363, -0.04767708598248087, 0.00199467677177083, 0.03714300777298884, 0.06380412470417478, -0.017484723173819255, 0.08194175010520728, -0.029766621046546343, -0.07652386878766976, 0.026585706746566493, -0.025360570531923074, -0.0042675382071523625, 0.006684964954457986, 0.04543284506190458, 0.11557001792522366, 0.09875561877207664, -0.008230629559443618, 0.054927291867026815, 0.1276901814536764, -0.05611246062141178, -0.029162521996621688, -0.0008630645077474272, -0.019050982348280274, 0.003206173053032304, -0.001027548019142921, 0.037380088331478566, 0.02238717310223115, -0.021942425889092752, 0.08971839184863224, 0.006028088760923762, -0.017145193233088316, -0.025974784706959207, -0.04970706661602825, 0.015874964124592234, 0.0015619581399460693, 0.039777165469148765, -0.0007720802601815819, 0.07560825571348827, 0.01828532994351717, 0.040276630781571364, 0.04120779646521007, -0.08912080841839994, -0.011819889572266736, 8.492402693903454e-05, -0.02940098181943326, 0.08306676795672356, -0.050762416016753596, -0.03749816833586489, -0.04271311056763972, 0.0358067003575984, -0.040637451945080526, 0.0998397891802151, 0.037973733681226314, 0.0071258942266511725, 0.02966539802375872, -0.07185602641554155, -0.0340991617656271, -0.011156689670252363, -0.03632140934923419, -0.0441486095554252, -0.014000411289630381, -0.009495152039820737, 0.04620156336530165, -0.013593199101142116, 0.00488828204416467, 0.01673175407185288, -0.005123933410212299, -0.009476964161766676, 0.06361666333568894, 0.04826499895992266, 0.05572692815888741, -0.03543458295688315, -0.020262202659658345, -0.010780494546341238, 0.1188418201270998, -0.0026859924464998123, 0.008677812328697857, -0.02317187464512259, 0.04485120742507645, -0.004044373161864548, -0.025812053360533663, -0.02307526373244287, 0.06454410313335415, -0.02321806751787446, 0.07848462720300091, -0.005553899559376674, 0.03456583366456936, 0.04972568980488073, -0.0369041516457228, -0.05700241064178583, -0.002273162564356778, 0.0008833778414829807, 0.11129064129268439, -0.006763937978533251, -0.014160123545034682, -0.02097341000954485, -0.02658091676753021, -0.06263281100315862, 0.014592579079069544, 0.049964524088594156, 0.03014815613894336, -0.04770435297715127, -0.020292310876421596, -0.033112429204659975, 0.002034734726747238, -0.09185401102310167, 0.011094569727141406, 0.0897972470735488, -0.09591001548666679, -0.025673626086892554, 0.0046540411475140455, -0.008340103984229089, -0.03943900855172464, 0.031099864123556573, -0.04773503380704361, 0.029551995660138122, -0.05446790947364075, -0.00830953627273418, 0.030460571989872162, 0.024462553999621467, -0.11563378861681031, -0.013963615825261422, -0.04254256859090289, -0.025545356065214377, -0.0023277156668060992, 0.009758821662723115, 0.019382473861651296, -0.034203689405873636, 0.023802370068120818, 0.04511904994665392, 0.02162365356435489, 0.004805473916352861, -0.022584980513384614, -0.021060274016999923, -0.08188977493202919, 0.05307390387428881, 0.026884145844333397, -0.031764288824770774, -0.0009892313073601594, 0.04022731428079648, 0.020418736678158116, -0.003573129329348646, -0.049687270116349956, -0.044998872961217184, 0.05831107660160402, -0.06823740476737826, 0.03523953875513465, -0.023536880409210027, -0.04562722459555227, 0.0765801877073094, -0.00018589136314210725, -0.02392573153147712, -0.013270966133569565, -0.06488430086269341, -0.02863277839977624, 0.03518582545927044, -0.007060371370094569, 0.017192584380726135, 0.011437404285331253, -0.03980375219318078, -0.08006221225948942, -0.011554332042317483, 0.035944573741155506, -0.04320152616294995, 0.007860462475925551, 0.06332413447915639, -0.0554706970457751, 0.04314569716299023, -0.11154767125572067, -0.019087837102292025, -0.08526018517139498, 0.020614660863025977, -0.021947009914633015, 0.0013197973952211186, 0.010368036004592547, 0.07773725317100982, -0.003068189086490112, -0.06253891493201738, -0.08213173908478066, 0.041354778610204916, -0.03582669032874266, -0.015819874684913686, 0.03606391131007058, -0.0033069008902835624, -0.04538726380862575, -0.018579411252538685, 0.021372192146980006, 0.039440178742042954, 0.01878407441870369, 0.02629389248625499, 0.01952241614169118, 0.03289035204630475, -0.018679804220327185, 0.012696922251780398, -0.03120895706629827, -0.08539931611948084, 0.002796019981242405, -0.03278724735748528, -0.02998264442032151, 0.015953178085214355, -0.006529192339791995, 0.029163997996676516, -0.01883122996802409, -0.01903717254227045, 0.010486200262681794, 0.08831164833760205, -0.07173539383600755, 0.021994029721876494, -0.046003267594722015, -0.00865252139541165, 0.010809582357146925, 0.009872208423806138, -0.010845969815158231, -0.032088912101100195, 0.04243929227417007, 0.03747226812348629, 0.07016421206094084, 0.036200992084718754, -0.04013168632798414, -0.017236021845341825, 0.10497168846598758, 0.03745762358171607, 0.11405468699366926, -0.0011917085580105612, 0.01940538930859133, 0.05432846023378831, 0.05458095297889706, -0.014385996800782508, 0.02993680416491889, 0.0549393931951719, -0.05101836628418952, 0.039071958855214556], [0.013857741414775308, -0.01605292198722823, 0.00259781857663971, -0.0871021648357926, 0.019164009363449433, 0.05087252086836853, -0.01649302528128311, 0.04920108438985675, -0.03993231936754251, -0.015704880976630125, 0.0402910722760863, -0.03021678261112164, -0.016237300917319016, -0.041902983188005505, 0.10115419503255003, 0.08060480349898763, 0.06886185930953966, 0.026021501982231562, 0.03150798051307409, 0.024866628993914473, 0.005634040109699111, -0.005170550298479906, 0.0013052826900016223, -0.03054312369282968, -0.03866125052999372, -0.04203567827035496, 0.07581905885645646, -0.01663726295213452, -0.03606231195332813, -0.0943458689826787, 0.017355177812709798, 0.050278566808611, 0.008462933310603014, -0.007372358062901789, 0.011974885596340886, -0.036793053821872375, -0.0533607472992539, 0.08480606739144304, 0.016009813157587816, 0.030573903928834894, 0.003866350657096655, 0.047948806345580935, -0.06753660424056, 0.02306046023607523, -0.09813004142815818, 0.001924152023992042, -0.02430672522650369, -0.03021436959827817, -0.04137074542634896, 0.011455112776148777, -0.04358668867958845, -0.09295568943138073, 0.04772825742999981, -0.052229967774409025, 0.025023846061485173, 0.11387318802204062, 0.07876206831575118, 0.08009916616761313, 0.0036738154915233238, 0.029209751917780157, -0.04384768821502991, 0.028612135944894552, -0.08869849313865616, 0.036250345921866524, -0.014031403863800104, -0.045553181860568906, -0.003949979426292102, 0.04733070840802778, -0.05251738441532012, -0.006089074063945472, -0.06270163230277391, -0.07679656050563749, -0.015599353485701146, -0.012405383816005068, -0.08856144867513206, 0.07201312117262249, -0.007295531217137139, -0.08298331461276032, -0.025842609047152427, -0.04395114298979848, -0.016126891257479292, 0.0361043070847331, -0.042742418337833196, -0.037384413835534175, -0.010746688411956435, 0.05193968668330388, -0.04452043527916529, -0.01935557348040698, 0.04348795910186, 0.012928705117097568, -0.041772868402390854, -0.059962461702408286, 0.037517720764445074, 0.03090653076004876, -0.04230168715629578, -0.02458094248092059, -0.016556873876108547, -0.03052318941103923, -0.0013877711215748165, -0.030292598878857827, 0.027958447786570324, 0.0984819059068753, 0.03387161481831894, -0.00487222525833982, 0.03039125741822147, 0.0024927877813743786, 0.014092249369042093, 0.18131883565691875, -0.040091504885286566, 0.013793001403049484, -0.036279166873939006, 0.015645332494436004, -0.06280671408525271, -0.007479372203481481, -0.03765306030721368, -0.014949053399066443, 0.045834292127932774, -0.08325407619446311, 0.059466723910904434, -0.04447261041872539, 0.010929413981395212, 0.029974145347204134, 0.03395853827812759, 0.06387962713305739, -0.009168178135079958, 0.03661219014505973, -0.04846536983577563, 0.04691085792262492, 0.05134420186136265, -0.004069719459748913, -0.0349602067207058, 0.004964486334640064, 0.005409240922920048, 0.03805409708374199, -0.024720493911254526, 0.0026343122450019803, 0.01602576699938861, -0.05828466385290555, -0.012013830661179226, -0.006013376957337357, 0.001613679423469017, 0.07024040690148962, 0.02214310516628884, 0.06017577845413947, -0.011420108048997376, 0.03242102057508816, 0.028619294778819526, 0.06599893529455032, -0.022918484335097047, 0.039033899459318885, 0.03735963061245523, 0.037991784980000644, -0.02772085653811466, -0.014867059085151724, -0.0025007469426835734, 0.002977541265719095, -0.14065344161259394, 0.05358989873165781, 0.03832409557591309, 0.023677329897385184, -0.07002549064077009, -0.022686209506201545, 0.03141787865933012, 0.046250077385620224, 0.043925170446998965, 0.032695258453546455, 0.04148170735218609, 0.09047897121559498, 0.057505441737717, 0.053951053195244285, 0.03419402358280058, 0.036056922203843, 0.03284363926515854, -0.003563613790767689, 0.035184976690092885, -0.08825426961944215, -0.05985526710146637, -0.049082381573815205, 0.006541890933741636, 0.02803831094954067, 0.08461007483448549, -0.09290768582924872, -0.031049171213471963, -0.027601250847371948, -0.0932932362422479, -0.02428423127201983, -0.05244433864381162, -0.004382357871063661, -0.02236102337081175, -0.03413740829760517, 0.05695910629798541, -0.020598584455414994, -0.016154564137913996, 0.05766994367502122, 0.010498709521317057, -0.00739276440608422, 0.031751758973948906, 0.01680197800453317, -0.03147033705440393, -0.04265436743042817, 0.033973955894852054, 0.026747333037363125, 0.063575555432938, -0.03657861878878543, 0.008975720309661867, -0.13113259580696246, 0.024885981219425497, -0.05268862353948075, 0.03605242387125826, 0.04412571862554514, 0.012077187716351362, 0.0389887053099372, 0.016166448168879084, 0.028705695762912778, 0.007507007846063663, 0.01303797357997998, 0.04664504611085745, 0.01783587265757456, -0.0673300109263243, -0.02293606747616822, -0.004694106011258098, -0.06798554379057349, 0.03306651182273709, 0.04226983905325823, -0.01877629342610354, -0.049022031045566745, -0.026520683988648742, 0.03626335740042799, -0.0028157940701665006, -0.035727714380380755, -0.01638001355488711, 0.00248972396544682, 0.12070271558646825, 0.02603791871918372, 0.011397886790171992, 0.017301805085134053, 0.06775351874173492, 0.023832555599180977, 0.009940397242434087, 0.03498949973417027, -0.03269523782950506, 0.0015934088552257836, -0.011703797467315969, -0.02035652237309645, 0.006019001591738399, -0.00572216148257891, 0.040311008849436905, 0.011805045469655034, -0.043285893910491056, -0.0032384568727698722, 0.0729503967748384, -0.01712488976646889, -0.009502294480394732, -0.04427801113034222, -0.04410821110595909, 0.04517073880314022, 0.013090826123400486, 0.04126929805827639, -0.034860251158294296, -0.0674458997064952, -0.0028197561776749144, -0.035959558395967074, -0.03406048749787415, -0.0980572248126652, -0.016284236652418686, 0.017080888374148007, -0.021051907760005466, 0.028335219232614776, 0.055713450862558245, -0.030719294254444387, 0.0011792946461702885, 0.01791430703278811, -0.029191850249847405, 0.02839124558685029, -0.026066444059996172, 0.08414948040952243, -0.0765683806947394, -0.028873167562178188, 0.0013678150699628902, 0.03145567106941037, -0.03795950148053359, -0.04673344991852638, 0.008858380399022652, 0.06675755170082294, -0.0015895259497652355, -0.051920987552437105, 0.0027203408505700045, 4.76401034023878e-06, -0.07701967596859248, 0.013332448226169222, -0.025675549728714962, -0.01861044519720812, -0.004494477607669234, 0.0031309643690077722, 0.06483695388663167, 0.05610280068229482, -0.0031763269480608687, 0.04290676903216717, 0.04298062601597062, -0.09371183095268568, 0.0018994011692002907, 0.02749030037933559, -0.026968828367288367, -0.0023706010777843176, -0.00011194844248396836, 0.009486125804829383, 0.014143392408586789, 0.003960611692522387, 0.0974038276824807, -0.011786187075357469, -0.026014084202009045, -0.04099591493175599, -0.0788424654122377, -0.0019645725671253392, 0.016481334887151144, 0.0266417310707291, -0.02026036392586218, 0.09553872687212908, 0.03025773737421613, 0.009306472071778708, 0.09194322315735101, -0.031017884542672444, 0.02834155539644402, -0.00037888154327990166, -0.04538461011242898, 0.033406865794794426, 0.012519099051368728, 0.018767964750719315, 0.0009553755617133478, -0.012943084657071714, 0.001037868433184343, 0.07240776907943798, -0.00719561461124827, 0.014605643631542084, -0.022560249319148348, -0.02240239061473418, -0.07111341799071193, -0.021874651185662373, -0.010789817865638249, 0.00417828727811386, -0.0005089509273589766, -0.028040570427853736, 0.047026604626066205, 0.011182878867046239, 0.016917492114618696, 0.04507575821782575, -0.005351971397300312, -0.006926400978430342, 0.02688094245221452, 0.06850850989984193, 0.06028185477372563, -0.03611196089565161, -0.042713645508523974, -0.008870896327700547, 0.07025129639534733, -0.026189425218847553, -0.013519705355814992, -0.019457861851056524, 0.042468049840446054, -0.012180217406711127, -0.031129529353435843, -0.01736114847269428, 0.03774143203304044, -0.04284557520978158, 0.05051778735633704, -0.009465945753212282, 0.05033724908106644, 0.07449883605357771, -0.022540425032245348, -0.030054776182826485, -0.0022950259967544693, -0.04300803765854763, 0.1483246408895608, 0.03570959501423326, -0.010296143624054193, 0.023972416390135875, -0.0783319699733341, -0.04129148036057913, -0.024619967750364364, 0.10243825701617906, -0.015268722603382495, -0.009875703061911368, 0.004539138396424788, 0.001123078736943181, 0.02130166948444562, -0.06844589989328041, 0.007937271753701973, 0.07968787695095027, -0.08156167652365118, -0.03322128837874245, -0.026032570217781385, -0.02854001138056846, -0.037387615145071044, -0.03303305046135024, -0.03206601207583804, -0.005038336443763053, -0.029090132477676514, -0.047318691466573685, 0.009294870475602755, 0.013150089306355282, -0.07750006030705621, -0.0037360574162349147, -0.08160081637110271, 0.0007268409170474751, 0.01979555532177363, 0.004708983106230949, 0.0034753119575256647, -0.04711594797339879, 0.030544613206930585, 0.013728012757046815, 0.04441499143018198, 0.016376968071440793, -0.028307862587481494, -0.014028692948136452, -0.07162046692314206, -0.012794275323710597, 0.02621140586385664, 0.01738572201801902, -0.014897795781513987, 0.019250725437064027, 0.018757157753027193, -0.018274191972048586, -0.05162280516191668, -0.07476799354317183, 0.038436198698707534, -0.11396396130291007, -0.000216011340028729, -0.05257860573642757, 0.010610812644111506, -0.003204030764557669, 0.014454168067940344, -0.0428811677221128, -0.007907962126426388, 0.005011144218070911, -0.09558417309312785, -0.010752168678067697, -0.0019574672984189914, -0.007923187252097817, -0.035956533536562155, -0.05559455555546366, -0.07772883134047436, 0.0508395040696518, 0.024689110994928484, -0.03514573372243437, 0.006536505767376817, 0.030049079364280553, -0.04130661840696466, 0.02740739860759939, -0.03492088813156216, -0.007914206627849422, -0.05101384596626262, -0.0011618702672511205, 0.008438070455808676, 0.0012342870054970062, 0.01680550356983201, 0.07839285214353857, 0.027538448349757383, -0.01773057661422126, -0.009813277525942339, 0.03389951914632932, -0.047881773627919795, 0.005088568015256, -0.037562676591570615, 0.01947952167764387, -0.043723086923148774, -0.0001319051206943748, -0.035276224323914473, 0.03651411595353568, 0.0006926289264872773, 0.049286609997970694, 0.015339971791729284, 0.13796374579598, 0.00622545626658471, 0.03746770975561707, -0.040205936233198736, -0.06345596807467653, 0.06158138937152285, -0.035826166679330425, -0.003040774003752809, -0.004107763368556205, 0.006277768574698617, 0.07209229915910641, -0.0026991888910020607, -0.013184578432471755, -0.03420452809455221, 0.09087684105598876, -0.005552574573290212, -0.010864569703682325, -0.01822126266136288, -0.018474663383329558, 0.031955801781731824, 0.0009319418527320767, 0.007923636397888243, -0.0031523884513441507, 0.04638538942966696, 0.05165808143894648, 0.07030004704608996, 0.06379898254807412, -0.009102718573465387, -0.11355007804015146, 0.07434219875072628, 0.0025581233122955464, 0.0566980884300627, -0.06809546076497984, 0.009218835363871742, 0.01785934854558494, 0.03421788789025727, 0.04240259829929203, 0.01008787861668524, 0.05457286804336925, -0.051324948172938305, -0.03343821892083845]]','2025-05-27 11:45:21','2025-05-27 11:45:21'),(93,121,'[[-0.01719170271062629, -0.008345415355009652, -0.030547432883689333, 0.06406925945631789, -0.08654022766280678, 0.010447215096407543, -0.014696624315222229, -0.060177165385997496, 0.11412614818366487, -0.01677416310314144, 0.054065663600874975, -0.030059087586401446, -0.03871754175075016, -0.025344700532840193, 0.015154537430051681, 0.0537333721420254, -0.04436916711834052, 0.03658984067783338, -0.04073920070412587, 0.023509232411559302, -0.05739525064497388, 0.008300404015548964, -0.02826685174723812, 0.0021591656732570953, -0.007086000256145777, -0.017888718755011662, 0.05714132487906915, 0.019930900264086025, -0.05544574058950658, -0.005997900157722879, -0.02588853934375631, 0.025452531615388865, 0.006527720967530324, 0.05308645300525193, -0.007588426950795094, -0.020824571484537674, -0.006387222984613374, -0.046792587936795055, -0.014258219416047239, 0.049021790372648845, -0.005245734821550445, -0.0617581490618962, 0.05082156640362499, 0.06089760832691116, -0.08385740126484943, -0.0067350638603023896, 0.0179263979216139, -0.034210658557009, -0.05297815635647204, -0.08510930291719462, -0.018063850903265396, -0.03880403801311167, -0.03289807084170784, -0.08007037063441809, -0.010514216020478438, 0.012498180948755178, -0.003874337176148468, -0.01803136032372511, 0.025012020771942454, -0.1017036207569161, -0.032768259089647, -0.0012787299064190925, -0.013112390590803043, -0.04093918022119633, 0.049013746973079725, 0.0341333587135637, -0.032133206938937335, -0.004000955837259665, 0.04926809670142479, 0.06627437527838809, -0.1118514272383283, -0.01401041237910045, 0.022505869824767013, 0.02969551403907985, -0.04586533849484169, 0.05666011166021694, 0.08586530323137591, -0.01016296016695512, 0.05468494989597601, 0.013860712033868584, 0.019332827940065318, -0.004943796299843353, 0.03736509364152518, -0.003954383365074724, -0.045608036878477407, 0.05029827392200231, 0.04071713088363326, -0.015506638236756336, -0.04140057814879477, -0.001590965861650912, -0.0814445398847455, -0.009155472861467532, 0.02381104612189377, 0.01177334187393909, -0.00545418219591359, -0.10900988832158247, 0.04006035362955538, -0.03055910175646325, 0.06441212224031545, -0.03323353805659418, -0.03557516780332185, 0.012336591824997625, -0.09169183093580374, 0.04843537899687046, 0.00603088453463819, 0.08190329894332272, -0.011751470166736359, -0.0780893645281257, 0.0018805187119371389, -0.024001963937085126, -0.05863965569043001, 0.06369571684824954, -0.013868921848601203, 0.020794915906175566, 0.030634180749928998, 0.0005022934634618734, -0.054862598083011214, -0.022599228731489965, -0.025857645557332453, -0.03883339047814026, 0.07092764834428722, 0.006817601323848884, -0.03994009886259834, -0.0026273011862027323, -0.00716292021735773, -0.03562602348483399, -0.029113211532933576, 0.03466708780329725, 0.10632466871508338, -0.01780898806149954, -8.584991775328383e-05, -0.02610276914976782, 0.014453157940456707, -0.055577327436644744, 0.009513722114123609, 0.027296201626870784, 0.02586327593703084, -0.053626501908932644, 0.013817428242295648, 0.002643621263739805, 0.01373409981143931, 0.0352339414350987, -0.0391197592763957, 0.08628872680357018, -0.009294704900462152, 0.07389293674642358, 0.06131349170729261, -0.017431946772731917, -0.03396107939668423, 0.1107355184726882, -0.06659193899526801, 0.03573139994372106, 0.003243009555288539, 0.056592578801962716, -0.02410918284956807, 0.004920718082705256, 0.03414993287139504, 0.025559475150398876, 0.00486769207010248, 0.04783979893803644, -0.061233699598660624, 0.0636536019250869, 0.016113460234224584, 0.021186322389592373, 0.0321670446888488, -0.0013157036658885516, -0.06509520101475778, 0.04615606182320868, 0.05872686912290089, -0.012223911919679146, -0.019424387978116162, -0.00671542637572628, 0.08890489996628037, -0.025390300268771825, 0.00025129482141512184, -0.06114472692017561, -0.0599874600241402, -0.01210257446359292, -0.018167824720060108, -0.06375833649691474, -0.07595640552849553, -0.03863191322459831, -0.009050119185608808, -0.07167941695859667, -0.011823268404121694, 0.03917133212801721, -0.029824515507785077, 0.024802440684844423, -0.049412873931403145, 0.029865887506110675, -0.01686251766816203, -0.00948634483859512, -0.03491282752806414, 0.09757865640113939, 0.02100443457815374, 0.013295265996991731, -0.036236806757533394, 0.005660065984305691, -0.010070149043478685, 0.027406318936784666, 0.07111168766605395, 0.028442213706908116, -0.10301327639552703, 0.01214580377401114, 0.003768143004657429, 0.032859708184255515, -0.038177552281056404, 0.014979624196983262, 0.03743112083877632, -0.07037721830421681, -0.033184738791030996, -0.02224880594435059, 0.07174060226704315, 0.06905643662324622, 0.006511840206213561, 0.06517582916147306, -0.013534529398312452, 0.023731230239667, 0.02884380915682344, -0.08593656854401147, 0.013216424832151168, -0.022615101568275134, 0.02139749728867394, -0.021654834565430395, 0.05478354691808338, -0.09797932071859228, -0.018691836352925054, -0.022944873026077436, 0.013247829750862913, 0.02448634498744252, -0.01608454460900018, -0.002250694260823171, 0.026796670853236282, 0.05356369999604075, 0.04348841882778773, 0.04341421747619615, 0.06601056365931837, -0.03350287505531866, 0.05676265113679292, -0.02643856919498117, 0.020427041319330683, -0.05472652991325598, -0.03573876183357299, 0.005652737773713038, 0.04482524372297279, 0.026591189730105862, 0.08003200005243417, -0.017810400609256382, -0.0018826166078561597, 0.06692022064113042, 0.07815583549914618, -0.028531626196896663, -0.036074706501487946, -0.000597379422789353, 0.02098377928655087, -0.0015050084674378683, -0.03652843348250224, 0.05069009446219497, -0.019596700974254908, -0.05617029636231814, -0.05024771937269079, 0.002624997623924655, 0.019338777282160408, 0.07136001078812088, -0.0713421647429685, 0.031581673407842285, 0.103726294050336, -0.005031581784438762, 0.004834586844080342, 0.011040754588355801, -0.014727207063780971, 0.03415893910155298, 0.030678712655228174, 0.05509525044384865, 0.03442230694685337, 0.04440151505631209, -0.02716945468740439, -0.038309907807759294, -0.07115583523157076, -0.0031379094644408603, -0.02538040450994233, 0.026716686574713114, 0.011562581031633372, -0.004834289674145523, 0.0221517244889108, -0.028678251823869596, 0.06865257079502887, -0.05697356650746475, -0.03887758559084664, 0.02568396557949354, -0.06844258655681949, -0.03407544227440024, 0.05059705649900162, -0.012646248840478434, 0.016038190061434105, 0.08945566283667779, 0.023367771598053536, 0.049501311704005485, -4.560581862873479e-05, 0.06577161922039435, 0.07884232182217443, 0.05874605441389285, -0.014538656702403679, 0.029342741628322504, -0.033966262040347486, 0.020049568143591122, -0.01791385536923161, 0.03295514331825641, 0.0001430360618019225, 0.026794864060032578, 0.007963755054888482, 0.039219227996978544, -0.02886009208811866, 0.009879499671795116, -0.01715643458276189, -0.06208919636928533, -0.02213464514219026, 0.002497967134812121, 0.036689428266390156, 0.008634674626164438, -0.03436983466089581, 0.05912732344026651, -0.017586861459753418, -0.028493715237745267, 0.0031125207510595406, 0.09091727136862653, -0.031228084770330632, 0.0424643514210701, 0.046479117240484064, -0.07208456656093244, -0.019429007980036158, 0.045687484269985, -0.08057311876788024, -0.003981807444867946, 0.015525409470972446, -0.03293907236818136, -0.023105330922949776, -0.07341369277367277, -0.04702581086390734, -0.01670486703660729, -0.04349560637794457, 0.0112292128270533, -0.040850754335391384, -0.0875990877254931, 0.0011368230903694848, -0.08638699099535056, 0.0055336895166913725, -0.05721212660660639, 0.05794059313576018, 0.021259331099178873, 0.01261682109239969, -0.019571090869272147, -0.06127932112705414, -0.04238679403034796, 0.006140336183898078, 0.037766827770743416, 0.06022170125356247, 0.09057396481085962, 0.018870366144100228, -0.052650385842897524, -0.07547308042197319, 0.04170233638740807, 0.03492284413600046, 0.00493342556440137, -0.04677417924989943, -0.0053576108821952375, 0.04118750334326326, -0.10007433706094469, -0.004529367071009616, 0.006199067859249391, 0.015039360306714267, 0.029936556497743693, 0.08762147452724951, -0.025180763766597565, 0.0055640325481693615, 0.02527886748661314, 0.009645790376556173, 0.0393719099472231, -0.03228366209580364, -0.016163165868088976, 0.08235955384991589, -0.009775180147309563, -0.021521961963040917, 0.047722004738139714, -0.06327820497662529, -0.06618483203362822, 0.03430635520055253, 0.0019422672812309028, -0.02255803305399236, -0.02694473478269374, -0.017579632305805705, -0.04330781082820172, 0.050584456493765265, 0.05113278257069716, 0.007148132050834652, 0.02267372923414926, 0.006953650672841583, -0.0642004342278131, -0.006977475281799302, -0.04730106154433473, -0.0699751196465452, -0.02679789321223484, 0.08806717395775787, -0.0355859610153545, -0.0017678012889143886, 0.04463283609584153, 0.030698890493802432, -0.01855650516460817, 0.048477220523693076, 0.032794935044129316, 0.01599736089352278, 0.03052014277800839, -0.008781418130544848, 0.012419876670930191, -0.04113784426602199, 0.04385718294330417, -0.05930837917588765, -0.049431413373070096, 0.040322172228928914, -0.004594583984905144, -0.03440958807364309, 0.03040797697667715, -0.1362814505985909, 0.0015018914024632222, 0.059274236331509765, 0.017018724053833548, 0.023405387368403013, 0.03282833694480305, -0.007332100051817026, -0.061383049283369406, -0.04786011743704651, -0.01757875070166574, -0.05132022547878402, -0.07775935533437556, 0.13436073432867474, 0.01672078742058203, -0.003167352318657958, 0.014762598021885098, 0.0225131386013727, -0.063837027095655, -0.04863920587403039, -0.015659779809833414, -0.013791347618249423, -0.02618288418306231, 0.03644886326075492, -0.05213722487491929, -0.07026568052201448, 0.060225473330601784, -0.046051561025062894, -0.0336420694527882, 0.006959021028847, -0.029711113479524986, -0.03940810920754994, -0.023282238166280833, 0.04177762339982819, 0.05502226550785694, -0.05388973503719592, 0.04529258108700182, 0.03658045407015888, -0.037470636515575736, 0.02073543437202206, -0.0003111567330851994, 0.027214911781767305, 0.045757786752031744, -0.0674932910679683, 0.023542776953801747, 0.058557985467809964, 0.050826119047026434, -0.037037101241065996, -0.022630722801182154, 0.07565683446060249, -0.04085509697870555, 0.0021063610522557607, 0.03439079504696509, -0.0207020740751392, -0.005243531801766982, 0.052385464789404465, 0.047485794262616045, 0.03730291776662931, -0.05568842936960933, 0.09468393595285822, -0.017899616967087948, -0.0604993530670632, 0.04735356949068447, -0.0726296554667077, 0.017942029060185414, 0.006334100887065007, 0.05139556400065951, -0.041697807517601417, 0.017002102348812633, 0.08047587684067564, -8.365779420076395e-05, 0.049791111824441646, 0.08850872885824196, -0.00897455184288351, -0.024846952778814612, 0.03651551649600208, 0.0043210737297293515, 0.03791681538024561, -0.046656198823510214, 0.015849030501690432, 0.032013645568494876, -0.018051344011275283, 0.018296392320660496, -0.03877071139548809, -0.05766064320809685, -0.018507870333075577, 0.0028335024511418655, 0.004000649504585188, 0.020987180891738108, -0.056200203544558396, 0.06660347711327061]]','2025-05-27 12:21:05','2025-05-27 12:21:05'),(94,87,'[[-0.0112718343212314, -0.018609603927630083, -0.0451081471386578, 0.030431830734115463, -0.08136498097288902, 0.02704264461964512, -0.012808357835924308, -0.007605625200359668, 0.04206827058031266, -0.0354922115314522, 0.05004161869799368, -0.0215046177554918, 0.0021109621854255318, -0.021827767909098145, 0.07714215683916498, 0.040717772812623974, 0.041806821824609146, 0.01766353640629705, -0.025449149136721763, -0.005078480921205767, 0.0276900108417043, 0.015738270841698696, 0.01748087092406869, -0.02060381983743484, -0.04888711851952304, -0.03844926269290091, -0.000838813641879549, 0.042756230544098134, 0.019685093849055188, -0.09706152315500953, 0.028180291721982373, 0.008015220230875685, 0.054812268586757876, -0.035869981195565594, 0.005817661089548327, -0.019379446852527786, -0.043160079712513615, -0.03193358853723509, -0.05884298835346298, 0.03724675094962404, 0.030820275889510855, 0.02667160093268914, -0.06493380374143919, -0.03633682647616934, -0.02442883619745256, 0.11858332810645031, -0.04685269927973304, -0.06023195711252779, -0.04150835840411705, 0.022448773167227976, 0.03791510679640316, -0.005950818277307388, -0.06425535166544967, 0.057126560384691785, -0.049504546516583724, 0.04740308540944705, 0.01981861829623112, 0.15129163154393768, -0.06728127872149371, 0.022525816838619758, 0.006587935737196888, 0.008509366187390144, 0.05310541750878804, -0.09372848188063918, -0.0058752604403672975, 0.0011433507454936976, -0.0018179944911394124, 0.02574190528232029, 0.04387739863922598, 0.0395084261400759, -0.034556167604587025, -0.0351119323369847, -0.024854252436791024, -0.010710704605164285, -0.022564596527651595, 0.03697776997112112, 0.061046254315716766, -0.04852017506378237, 0.02495247095149617, 0.0037935913926332517, 0.005770117110897075, 0.01520007826938536, 0.015902937434730407, -0.05224383508821804, 0.018534663032034278, 0.013763421170118539, 0.03133169347986247, 0.04094691726659137, -0.034077406594472746, -0.05306744043366105, -0.05064602328572039, 0.06552030023339739, -0.0367416344231861, -0.016970423007529725, 0.01626004796220234, -0.042413823104380965, 0.017201065553061615, -0.007496003031078758, 0.0013649225735861666, -0.06080730780324619, 0.0329013556878962, -0.0011090203884083962, -0.0764253536191245, 0.006339712406204985, 0.014152742482095587, -0.004719254452890779, 0.038097118565948836, 0.07741393425525495, 0.03504437839470326, 0.004226792714468518, -0.0629947611820532, 0.07672394778215313, -0.09911050566067495, 0.03972850940991384, -0.0031147248446442353, -0.10882774131153715, -0.009493865658925198, -0.0635280309346922, -0.0519404288734974, -0.024945915665983674, 0.0018197141186685917, -0.026612120342038883, -0.125196045909861, -0.008842655243118107, 0.050395684013885424, 0.003922999265776819, -0.0016480028635466463, -0.05561520934795373, -0.026643484023859354, 0.03931040930501578, 0.08987443886164159, 0.005713852877439064, 0.0146187987678087, 0.03138412850048822, 0.04119479058891776, -0.033956912820105045, 0.00563461245905317, -0.039827862842470876, 0.005645746911114464, -0.005431808540493787, -0.057102721662196466, -0.06414640681514278, 0.008832467312545287, 0.07349700407618287, -0.05739246165011182, -0.001224974491368554, -0.025887764924644813, -0.033572573343530636, -0.08459538935607752, -0.12425035608918908, 0.03934852801789068, -0.02433933203598134, 0.019105610241487356, -0.04094801768294056, 0.005214552578008474, 0.00031930482494058044, -0.022829818658229063, 0.032258658063912544, 0.04292594161999791, 0.035368489142779444, -0.13256452094572607, 0.06283062119090477, -0.03939116461175037, -0.01246989264685746, -0.04791100926868342, -0.022476635854458943, -0.0032442189715445463, 0.11864413064941445, -0.015008689354580256, -0.06409989152603247, -0.003873641234431111, 0.01432359846312435, -0.012171530915004891, -0.01652055609799021, 0.0010280773662611016, -0.02183058976884508, -0.029602456374247736, -0.020244230649374386, -0.06127084820306524, -0.06801191159651013, -0.0591632131428143, -0.019156514484914473, -0.050061150180257516, 0.03932311675321979, -0.02202999574335591, 0.10620938958619991, -0.017877930559927042, 0.04088052911192739, -0.055379124644338466, -0.0048876608272280285, -0.016032002108715564, -0.03655633593154136, -0.008534573166847696, -0.06227271373360273, 0.043486529299298964, -0.021669878137543622, -0.0029718468585001913, 0.0008824340392791495, -0.011021975346631357, -0.04458284541727334, -0.001906842670092241, -0.03348742000313641, 0.02146751411314363, 0.03563834900166686, -0.04796160663032339, 0.07103467904125452, 0.04556372313895945, 0.03399389843099662, 0.07268653835566187, 0.0009205028157685666, -0.010041575198377319, -0.05382833657414876, -0.03479846984216207, 0.0017209276910703588, 0.016498188229030937, 0.04570776872858952, -0.06108593467555586, -0.07090254918113498, -0.04177341347478671, 0.011285043857093084, 0.001231095330327351, -0.050265257438478005, -0.0076710750049437115, -0.02116389362593256, 0.04332396548206323, 0.018490127039657668, 0.01418150493219953, 0.03158243587451842, 0.015394717588918267, 0.01656971892346539, -0.033131462552202, -0.010449774279935514, 0.034077294010621845, 0.02542576982897289, 0.025214395464763197, 0.0778215023224875, 0.09105774597899596, 0.021840408170165325, 0.050480942674656304, -0.057461366598604145, -0.0019551624785870427, -0.02820468791612654, 0.0072266793073845715, -0.05928558089353904, 0.007078110843131166, 0.014385485079620609, -0.011835382774224456, 0.0007188857942986866, 0.012547098838485631, 0.017272389238479884, 0.02685182407170024, 0.0019331893340566579, -0.008561041267022266, -0.03796599832875034, -0.014654858285733138, -0.0696853216390234, 0.026786204029438414, 0.057590365901321036, 0.047617238052558165, 0.05514869455542845, -0.034852466509752, 0.011446575353050744, 0.0056095802569448095, 0.02416979528346361, -0.031356400187530914, -0.0297964546921779, 0.0190815917480043, 0.032602267608618424, 0.027665236946899027, -0.04735727104560208, -0.02453750140400076, -0.024721655898450795, -0.06391014778814547, -0.007117034893713765, -0.05366842755675216, -0.01503267697829774, 0.022584700008512783, -0.03374039228438775, 0.07092455750811877, -0.07165534291609449, 0.015205820045781627, -0.04335558701721964, 0.008864362135920439, 0.01816158738815628, -0.028278061717152456, -0.044991383158318535, -0.055581978953250476, 0.02369233806697758, 0.05408425782594645, 0.013150010782253538, -0.0536046651480303, -0.02855508154578386, 0.04411255361813698, 0.01073694753763704, 0.08621379310807982, 0.01746120506753119, -0.03497962089000887, -0.012062359989061893, -0.036324271560924624, 0.12468080410031566, 0.016568872728715024, -0.017118946529036196, 0.06789774430821599, 0.08080940509082189, 0.017195972041742346, 0.02400203808213764, 0.09007887660794056, 0.018505836118596346, -0.014790603540161642, 0.05348606350870526, -0.017786470708013452, -0.03170298412494302, -0.07639154940995534, -0.04858689370652482, 0.038788034763754906, 0.02719231577008342, 0.0320446688489721, -0.042277044620740105, -0.03624830651545928, 0.04418376108796722, 0.012428865820478885, -0.004696739498577902, 0.04063572460747251, -0.03184914338558044, -0.1076560993338316, 0.0647887376336767, 0.015454426979007467, -0.009979331763708427, -0.058214944788782884, -0.021227481711272367, -0.04385126465886701, -0.031035449050754383, 0.0070306562960066425, 0.0003970369375013162, -0.05359574560164875, -0.05995054469784244, -0.00046725612086613013, 0.001757654540691705, -0.007993046659852655, 0.015955824606628345, -0.02842109586799292, -0.019523595946665945, -0.037738996599687304, 0.030398776478662824, 0.002164363021143232, -0.08023928773330212, -0.06417732742503386, 0.007323238118223121, 0.06082455129112062, 0.0007976695217409808, 0.07277407048387365, 0.035079275756747366, -0.00797707427997234, 0.0226183298942999, 0.08366234524407846, -0.009923271361496615, 0.04917206461443203, 0.008916523868327449, -0.012858513941503464, -0.007606864530653928, 0.031633534415881785, 0.05795553343760708, -0.059230193270629825, 0.02497577580863396, 0.08346277402552839, -0.020280326484670083, 0.025823924433574744, -0.04872461281008132, -0.027095439182246342, -0.06193934205585515, 0.01651704602405789, -0.008572216122159085, -0.018128337018898835, 0.04072871523658473, 0.00857244764540087, -0.0074602839885098875, -0.059438840200257866, 0.020043477300389793, 0.07624845170371516, -0.030989453100053105, 0.013285052387613872, 0.09176727119783586, -0.025080331704624047, 0.02332303579797354, 0.011805082283447635, 0.07017448031252953, -0.008688245583664609, -0.0570060702420612, 0.02958967810716977, 0.008262460723007852, -0.022419002002137277, -0.08036770595807884, 0.011636141135818576, 0.013508636652041307, -0.030530822808828458, -0.03047193782306687, -0.003417072634976201, 0.04147805518953738, 0.04167828738424439, -0.00897675804443136, 0.07384290524701528, -0.02773365161087934, -0.06705034382112317, -0.046636767085430166, 0.04127565484776613, 0.05914111402240235, 0.044589364385414575, -0.08514967233972777, 0.03443096346716685, 0.010324549260026862, -0.06454032681425567, -0.05599970862096168, 0.017195254773659952, 0.04187279596124076, -0.01772622563669816, 0.05667529888809587, 0.04148821315827891, -0.03348413691277447, 0.07803344323768885, 0.018872447270389992, 0.010271426025215734, -0.027002423130974243, -0.015551561420180493, 0.12340979779484172, -0.0021411398780907787, 0.04737950817202481, 0.06277955896691266, -0.015656222636547232, 0.0055035253614559515, -0.044524181967476435, 0.08249741471658184, -0.0066731789630849825, -0.029143408433253595, -0.01977040698588296, -0.017687151776959113, -0.029027252768882943, 0.039471367894441806, -0.028207349979439925, 0.04472029214054539, -0.07243127808002113, -0.008938941673672202, 0.013799694960533413, -0.00658290305747448, -0.03980258958381077, -0.024911381477652175, -0.01347827805347047, -0.017389096926893697, 0.0317255771616041, -0.01963562232592429, 0.010511266852953598, -0.015980039213916206, -0.026069030372211085, 0.03549193188769349, -0.007077294156244948, 0.022439842725635047, 0.04202297192313958, -0.05922566449443366, -0.004223580896947679, 0.010874381549829152, -0.00881066781044624, 0.019592052375623205, 0.002612805835762201, 0.019197376975188096, -0.02866927607210645, -0.012512367628415044, 0.08937198803025416, 0.006852104664007804, -0.06258294398238319, -0.029849445368583926, -0.1001867201136567, -0.036004213831481106, 0.012090600376953968, 0.05669619953525622, -0.01945862235361255, -0.03815148567072563, -0.005117230194439175, 0.11582970870011665, 0.07543829104911275, -0.04696778176578295, 0.07650074848186106, 0.011654554950981872, 0.026367760725381946, 0.0004254816106067313, -0.017758885848672627, -0.014419051410008021, -0.03009620737934974, -0.08099470358246663, 0.008274063215191264, -0.006248213059150149, -0.03863478272051033, 0.066770867122326, -0.004614654068120899, -0.012130009264442894, -0.06968508920784734, 0.0035784981296064946, -0.02636527298545061, -0.07498406242328486, -0.04678725537672183, 0.09820932641021975, 0.011450977926381783, -0.05903179510317147, -0.0033031652428701366, -0.09407575584810524, 0.07640381741796709, -0.10433827503801936, -0.027800408386861618, 0.05794216501324614, -0.07412684171900323, -0.014829663780886468, 0.03266936395202199, -0.016130832571126453, 0.008308129817367787], [-0.01347713864371177, -0.01685226311395645, 0.023341648339238866, 0.017775796127903795, 0.02149126095408793, -0.021662065774661135, 0.0068072716698590096, -0.0053464441923003325, 0.001207981840661967, -0.055746757553587704, 0.09157728163491859, -0.032186998829109977, -0.0023430364791016834, 0.009617778209130186, 0.06659984107074203, 0.09421135204359894, -0.018288056958560898, 0.042927434198617394, 0.019960409718494387, -0.09925459161696944, -0.02919235814565132, -0.03743007217810388, 0.06823217842571438, -0.005761475307033805, -0.07146099125620946, -0.03517452310228006, 0.027557838863803034, 0.032018066844346466, -0.04303911666529993, 0.0476103101675675, 0.06479112062447426, -0.010739321544304193, 0.05145021615438768, -0.013660846644594899, 0.03485878200575499, -0.006067892918452573, -0.11292630765923718, 0.022762570798976874, -0.027833407266422, 0.07086793877608238, 0.04148711372449246, 0.031651766496724645, -0.0457342590792119, -0.0025773464825825927, -0.01710007550461462, 0.0029582319505841457, 0.014117306478617581, -0.05777991103489327, -0.17422596486243708, -0.025435517182238066, 0.022730374117732943, -0.0816974435830233, -0.03937877978538111, -0.00012361459351325672, -0.018374584167698046, 0.048445291334446715, 0.07649557627972503, 0.11377413165136605, -0.0640638165430049, 0.0021627010458289716, -0.03571322310721927, 0.04219452258336629, -0.0786407414371328, -0.039956772763499404, -0.0073803265066822235, -0.004721060603749629, 0.020120688982344186, 0.07648904330168575, 0.011293608700794266, 0.03593916684770511, -0.05418790705685105, -0.04940873733264686, 0.05916782136940641, 0.008094487816541778, -0.04117292357012229, 0.09241255177451062, 0.06337598832883667, -0.016540062847634082, 0.021993076701435323, -0.029696021123631317, 0.011567936166795191, -0.012260912850498847, 0.013377963391564942, -0.05935536466002872, 0.035918964362984564, 0.02928405394267732, -0.01229677198653663, 0.015906340201588962, 0.005077690424668577, 0.06776668362206292, -0.04638209932253729, -0.014766164527732124, -0.0133177674491779, -0.04931744024480691, -0.017891310226443073, -0.03469133512126244, -0.06628574602131533, -0.02029431951710291, 0.0002364331756201417, -0.057562029267306955, 0.03440450226966703, 0.015495750213373927, -0.08663057357916082, 0.00471218612371294, 0.033073548822639603, 0.025435888457305805, 0.08189742733182678, -0.0058380635923439925, -0.04552000227312442, 0.03241496903646802, -0.07544624685969732, 0.027085953739527494, -0.04003131309187805, 0.043373758040396615, -0.02675806664435775, 0.009797498203682233, 0.030361174124549018, -0.07967162781389399, -0.06219178546745175, 0.006567000003852553, -0.030619523045577916, -0.044669251975042915, -0.05049111937840965, 0.05712946272138759, 0.027922573637740186, 0.05155213207495328, -0.03507646990557194, 0.052399839014844046, 0.00927901988734638, 0.011648009042365548, -0.018866878447052034, 0.015364377365512558, 0.05478650122887594, -0.07922350795183634, -0.02210224986076347, -0.03442221739432783, 0.02339673421985611, -0.03558651405946992, 0.024670972199638916, -0.01709857211493145, -0.048218363623584296, -0.06562811728457836, 0.01805665199959094, 0.06847004320507478, -0.02835553523496316, 0.05855774510439985, 0.07770891783263338, 0.006944935161047947, -0.025651791310491646, 0.015752290311535848, -0.00283651134001344, 0.017963624733356488, 0.005486063736124488, -0.022736394992230503, -0.023429828911239257, 0.00981731020945222, 0.029209866599954212, -0.005704204298893488, 0.045801794562716415, -0.02132226861426414, -0.09118425679818427, 0.029198315007206162, -0.082105582790003, 0.029246368608830967, -0.05239549345050437, 0.06038930902651042, -0.023616439441839162, 0.022500284167500457, 0.020123968273952363, -0.013989875913556785, 0.06270642757957781, 0.02596596866227327, 0.04340306865239475, 0.01834984956663335, 0.023686036142099066, -0.0051063106113560155, -0.05737809264877128, -0.058610030876008655, -0.07059643610979636, -0.03647773882675889, -0.041560154321070374, -0.031522628615034604, -0.0795766326069064, 0.017086890667356754, -0.039480893231598514, 0.11005027564286272, 0.010257764978855177, 0.00894823300587169, -0.05302724632685512, -0.0018040084078310638, 0.03068896062795164, -0.10861308631610711, 0.05070336434915469, -0.004968151019861045, -0.01534059747176491, 0.03232764075107634, 0.03710340498672814, 0.06190892873406949, -0.023248311981938167, -0.05192833431034235, 0.01062711782937384, 0.0001112348333188444, 0.04430669364115804, 0.02770317384894094, -0.00578800364220041, -0.04636370383174251, 0.052151611454528846, -0.04123893737453143, -0.006207464452569693, 0.03826093091147231, -0.010429349842858883, -0.022577653867947058, 0.01889065468291724, 0.036408026903202106, 0.024043649018923977, -0.021287641270138297, 0.04266093917339284, -0.0382891880533275, -0.03321269101280523, -0.022853955675995408, 0.05822341099142819, -0.000236038467243014, 0.021854307615278654, 0.0713905111773401, 0.06404622212846466, 0.026555712587732636, 0.04011558704543167, 0.008107751298272124, -0.006336410752666896, 0.026049276934862513, 0.021728092381658813, -0.03902198627422294, 0.034209577372279185, 0.06048991908304466, -0.03671944804056458, -0.009875365376140784, -0.008936664952652657, -0.04352855230952643, 0.02317189333092617, 0.009790497931161149, -0.01826547136343017, 0.008311427679399587, -0.0895731205298388, 0.04142757437200354, -0.040841021948973766, -0.004582926617431744, 0.06529115315413177, -0.0022452349904290283, -0.02703739169224342, 0.07529522020948153, 0.03896381862764932, -0.02404726117783427, 0.0007795700776512174, -0.015083573618650195, -0.031498157381505645, 0.023188463538383, 0.1219723167772221, 0.041830102387319046, 0.010268986447712944, -0.03754421274178664, 0.012188587369938109, 0.037766637599364425, -0.013645575899875166, 0.020965711036523397, -0.015984582306997695, -0.025871922675779053, -0.012240718596013795, 0.03286984500739384, 0.09375345831965946, -0.030521155270979893, -0.09872923922505672, -0.004520733471232024, -0.023876739843150228, -0.03190361536065624, -0.07925855778138409, -0.008688193228684535, -0.040346794478749816, 0.00012888823121345533, -0.010974822417137235, 0.005370948346771258, -0.03751481068272748, -0.0019574961270765585, 0.024307744473267372, 0.04679632158801605, 0.03961126016178866, -0.05723988321862805, 0.006965409243539721, -0.06738551764020169, 0.006535865937457675, 0.007861665428126012, -0.062423695214198535, -0.04432571097196776, 0.061121774380103744, 0.08836417575162431, 0.14792533653565493, -0.04362623240222559, -0.04598198185175027, -0.030341289875600825, 0.03036953970169113, 0.030022571262768947, 0.0036191578111061974, -0.021515000611128727, -0.005106769675602336, 0.0345642676010339, -0.04157140596745828, 0.04248509744869865, 0.14445846871591253, 0.05306605645955202, -0.024275469147550965, 0.001566054010350854, -0.03068078891857889, -0.04880777651068278, -0.09497280611553562, -0.025814640236756108, -0.010434171846386469, -0.006397081762535937, -0.010147878532451072, 0.015233464496368119, -0.06780171882008092, 0.032625871564357284, 0.02339453766145041, 0.03353680866011973, 0.01974697959383853, -0.009538716738054712, -0.06647746295580259, 0.04352078662510461, 0.01834459867638958, -0.019505303300974802, -0.05538354445874593, -0.03906267655849441, -0.07661147262697937, -0.10558694212012705, -0.00915536334249388, -0.011773066556192873, -0.03540906286650178, 0.03552785259876679, 0.02519013911234425, -0.047514268806201826, -0.032069233303928385, 0.06521863929262532, 0.059982226947556117, -0.016425492482764533, -0.07551247647917046, -0.012609118568156632, -0.02092425076799814, -0.10146890538403812, -0.02250975991196335, 0.031003922595516813, -0.010892047280913739, 0.03975412973416147, -0.03575912587396888, -0.0728707318331293, -0.04210097223994281, 0.036966501420616284, 0.017963183958522373, -0.017630245327701882, -0.0028794932876340727, 0.01255038760768713, -0.025929836099523037, 0.017286634824860356, 0.028756073362230877, 0.06730102787158407, -0.030732255324520962, -0.024869979293830696, 0.045782865021085264, -0.01114982740122309, 0.08304893603995583, 0.015572101193560768, -0.0036086244813826056, -0.04355430014402723, 0.03654091777227641, -0.019143507635578833, 0.07388397990076095, 0.005727999738641509, 0.04839264343247626, 0.015569670530678854, -0.1347438645296331, -0.004804897440351568, -0.05320519864971765, 0.051533465900857875, -0.015305582392100342, 0.046135239810254955, 0.020289681322167973, -0.02419406297383094, 0.013711739677464375, -0.049507975683265794, -0.010605164133434763, 0.002097527868528262, -0.044765556703944324, -0.027076728560011795, 0.009413394027750427, -0.05591070384458441, 0.043844684799472664, -0.06917774103666145, -0.014855765272590157, 0.003742775719575416, -0.008100492230568353, -0.07245639617329488, 0.016719249705820383, -0.02540034298468732, 0.04027732763331657, -0.040588445166436456, 0.029699037047703755, -0.041064994090824015, 0.043304927666508064, 0.004944094498753811, 0.041625634074643154, -0.048629571793931826, 0.0725458167674427, 0.013946902196171644, -0.021282847615199628, -0.05382147502546137, -0.058785009340446816, -0.018969476562692843, -0.05803686630271222, 0.0644440826857857, 0.02887732484937855, -0.01200835801525618, 0.04160010205520636, 0.022391820637365823, -0.008435289065668771, -0.014799004996285637, -0.03886320491323265, -0.049634157995943666, 0.05695001432460677, -0.004644524443264223, 0.05460605788807123, 0.004481483020936314, 0.04087002164096444, 0.00046458793457820614, -0.04810852472965192, -0.04360073330373076, -0.025947911525604255, 0.03359157813390585, -0.035691689153290275, -0.10961260269305599, -0.013837209617536901, -0.008122223710149153, 0.00827030759394132, -0.005278916024560704, -0.042406379818572607, 0.006762704487435595, 0.020920439254494824, 0.0574983894286019, -0.029291309352498646, 0.01889142100928859, 4.143409180404243e-05, 0.02557892629227089, -0.018869914489477897, -0.03250303987199519, -0.037321407464435005, -0.04454790172506934, 0.006025470626845383, 0.006746554936459459, -0.010977392079551899, 0.05419234772613419, 0.0002867172853720497, -0.05619589796484634, 0.056105306848317466, -0.024015598547426697, -0.018424384408188332, -0.008505028423343863, 0.1252402031079498, 0.04439510100186976, 0.01569028920416427, 0.057427964217969155, 0.009020076560420854, -0.004654284588086891, -0.05501487014542003, -0.10026273328071374, -0.008661941520877516, 0.007604317852415286, 0.053676560696804154, 0.05546931814410027, -0.00663767303602066, -0.014127137952147843, 0.10133813608677948, 0.08500468141304916, -0.02678065955525336, -0.0362675422701807, -0.001060624503769602, 0.034908306076121, -0.01777499688059048, 0.014843675971123309, -0.015712476090108948, 0.032320474959374804, -0.03434924629751629, -0.02016390503444103, 0.010099857851768236, -0.03331143554929466, 0.005533611178266545, -0.04962812248991634, 0.011266157207546664, -0.04276551437449289, 0.025916007474955587, 0.015716519879147253, -0.01042632751749217, -0.01136066042934598, -0.008114833873148123, -0.044711899226420215, -0.03686243832305793, -0.00266102442991601, -0.04912019990783403, 0.04042777268022427, -0.00036494315892745296, 0.02206868147360424, 0.060982032297217825, -0.050941708311114844, -0.0228057045487188, 0.017176150314677178, -0.09468165330477761, 0.014859950804573042], [0.004206756538726921, 0.07746517156937012, 0.04533812485647499, -0.03196390617395352, -0.03659760510123011, 0.01847284649722475, 0.005240188474905424, 0.032524442553758755, 0.029614998930026448, 0.017571037787120124, 0.020160547092656588, 0.05379346891791406, 0.0037748521516307817, 0.024248462011916008, 0.012113909869820881, -0.02633284479233507, 0.017494779625616318, 0.04489398903471902, 0.03316457097283349, -0.04131081843157207, -0.08470797846471348, -0.0013191021875346373, 0.05056172456476395, -0.02649307397362192, -0.021027474752049278, -0.04746343983251612, -0.014855875778207937, -0.04268731430276058, -0.06971480305950684, 0.04335936613177079, 0.013260462234424291, -0.010439808300644643, 0.02478779325696708, -0.05443155490761868, 0.04955192538772251, 0.00747216514438966, -0.047256781215153434, -0.00016834850988481332, 0.018012525019912216, 0.015597862897097374, 0.06378025578394, 0.019377450110677943, 0.06735629878634652, 0.04837032326296359, 0.03311326239992905, -0.006696231595245664, 0.04238278330606433, -0.03841415193543436, 0.05989975942104136, -0.009033269457964847, -0.061830661397916924, -0.008193928032103998, -0.11381449608980189, 0.008933768211348538, -0.04986003063581646, -0.008928382946189186, 0.12264520821218745, 0.07728153208653112, -0.05616518328980738, -0.03987077135528985, 0.059183320585325425, 0.024356809306791023, -0.01535025566106944, -0.0036226366689141604, -0.058962684465212016, -0.016833204205151484, 0.005354727257059574, 0.042872079510559435, 0.005899647562305832, 0.04210627002103439, -0.02438267112078889, -0.09298909195405217, 0.04217804170574201, -0.02406054208682253, 0.028065126484982952, -0.0009526137674351761, 0.08857138291867277, -0.012875925636371176, 0.0013806702168515218, 0.005167697908807668, -5.8846189847915436e-05, 0.0058435509258122536, 0.026965839638653667, 0.023353403172558664, 0.004323600518942074, 0.04100274005754878, -0.004049615636060007, 0.04635323614148343, 0.021683838095810117, 0.055270121464442185, -0.05836784781322187, 0.06923067563460188, -0.05016860468714302, -0.06475069639149687, 0.03312394335001223, -0.01504293125402854, 0.032920043803903905, -0.010442970482958896, 0.024075231752445723, -0.041953046014166086, 0.0008293493104638123, 0.06877909569527327, 0.006795649233642144, 0.01746245310462095, 0.02541441446952763, 0.002903029305617292, 0.06487358255859861, 0.08808186873560454, -0.03536722653822443, 0.008023341136083849, -0.018574742522137592, -0.022596971240689816, -0.01495939171237997, 0.023966411175326316, -0.011653389822986256, -0.06979840530732027, -0.006744819168495838, -0.10070030792897261, 0.020701410159735242, -0.025813142069892814, -0.019644079709720937, 0.015241862083072733, 0.005775418438173092, 0.03661730976703913, 0.039341358135316015, -0.0031748198459798254, 0.016573714150880332, 0.012697548992369623, -0.017405412889646442, 0.09567787855561612, -0.09529600995557791, 0.022482575786912515, 0.04881446505673525, -0.08118616136488187, -0.019930437862635753, 0.03697815388579816, 0.006503537043598371, 0.018569842483254034, -0.04479079260338705, 0.018644980891813698, -0.0850508677182642, 0.006899895246733756, 0.04431264615220773, 0.020052134105608847, -0.024040119286125334, 0.03964800023956295, 0.0839116460029351, -0.02388192805519682, -0.034058315968736375, 0.006193423331973616, -0.03253570876138073, -0.025719238094993283, 0.005469960286039091, -0.032624187160014924, -0.014327400164699324, -0.020771787378776427, -0.01171681486924825, -0.031024926145115213, 0.015318268051965166, 0.05111893154581528, -0.05728024222960586, 0.0007814421737526943, -0.01964105189775998, -0.06066706788650762, -0.010421007648712528, 0.03509309907346748, 0.00907361639604811, 0.05275283323779492, 0.01158139418768981, -0.027540192276785672, -0.0032758424635962393, 0.05028016791247361, 0.05098481201717793, -0.08538932573616398, 0.04383535967128951, -0.0034919323867564377, -0.056937717269012963, -0.021264405517005817, -0.04495301942392625, 0.03324812843052917, -0.01684948989197106, -0.06465763447081134, -0.0535672370190878, 0.04016257897253282, -0.04018844078653069, 0.04434199562337561, -0.01041481765443732, 0.021565781796407443, 0.0030979766135627055, 0.06276749150110247, -0.02218865407611101, -0.07097067615754471, 0.08828221791837798, -0.08739831779035998, 0.053060445794593444, -0.002578242538038014, 0.021909963991357667, 0.029090661923399378, -0.05033729024266402, -0.05547493174294507, -0.012293288319456457, 0.04417202608447866, 0.014857616620785094, 0.01193167978268756, 0.041057948356706675, 0.012847713834194542, 0.04560576074016378, 0.006720896766597224, -0.03391712557350776, 0.07324646204121549, 0.010535621081062953, -0.057805033109426286, 0.001006444023969815, 0.04023053752521466, 0.027441227018578627, -0.004209681333417014, -0.005373948936098686, -0.0477752447443375, 0.01256510312113278, -0.002793415196911471, 0.07300233201133009, -0.016645370874285685, -0.020537753041435396, 0.014700439139522006, 0.05469409068989789, -0.06001997012510856, 0.029852607518765173, 0.013201812561218072, -0.02003937489406135, 0.01584289022234201, 0.0508042720104883, 0.045107751364759335, 0.051738056385665795, -0.0399456455021547, -0.0111869768896576, 0.0454095919683818, 0.0034671283660398042, 0.02503692485000297, 0.056007098062157576, -0.04170761408485763, -0.02961893448837412, -0.025531591389618174, -0.08377369841223271, 0.06731911104456965, -0.041384441441147335, 0.005113647807444996, -0.0002365129104828831, -0.06138704812753489, 0.02332972711630776, 0.08421747889905441, -0.026986141506032894, -0.03447363382872195, -0.0516488583591395, -0.01261992622527789, 0.0036502296209636664, 0.027145928758157793, 0.08503971199293271, 0.03042645552157035, 0.0463260485399997, -0.033805204027235046, -0.005646900660264294, -0.03895083907053334, -0.053070705717569625, 0.022903102737594223, -0.026262258552744316, -0.05478515198532324, -0.11736304393191602, 0.013936274940322887, 0.10600190514833861, -0.04222190317506595, -0.03817029363226341, -0.00976331478495601, 0.017904998877196234, 0.001316123084826752, -0.11175081828782193, -0.029757198595908717, -0.015529531093434155, -0.009385622863399444, -0.02441465723688924, -0.03250658324080168, -0.04891403946054391, 0.08194969551642442, -0.0022269476723866116, 0.08072024261585256, 0.07135509480828771, -0.05330080748257083, 0.008306355706707463, -0.012508766111007192, -0.061328582093811514, 0.04253664034659706, -0.09005969881186705, -0.055262184655574115, 0.05555649156138841, 0.10280063001930052, 0.04749502880957228, -0.05300296514346091, -0.022356443829276696, -0.01387405549473075, -0.0424710496981411, -0.05177571591668312, 0.023471511727098732, -0.06375982551822318, -0.04498233306299992, -0.011985118872193713, -0.04993775044816335, 0.02743093723552394, 0.08541726879763402, -0.044152079552033714, 0.022968927787666495, 0.0030883142654077184, -0.049830549780303136, -0.04199135649489494, -0.05179882761745017, 0.02902576701477271, 0.07573948596806519, -0.05078310121482442, 0.010363140309563281, -0.02814115024487045, -0.048780830664301125, 0.0012276301294042867, 0.052551140351488515, 0.03970290396592004, 0.028068957533055838, 0.05194816384209643, 0.047810539357136805, -0.05151248140856676, 0.022412404602413054, -0.07031854995892449, 0.08477653720497338, 0.026681052125868496, -0.0590770963420325, 0.010172064920673215, -0.016912227409925356, 0.03193962993012456, -0.06799515516607671, 0.049887236153347295, -0.01937055840455774, 0.03331348617037275, -0.01363624535046208, 0.02823463916467869, 0.08119379957296483, 0.01173125371021196, -0.027108839554640014, -0.036486740601736664, 0.04238289378835482, 0.01767418644232648, -0.002673978615379651, -0.04254199425867398, -0.00012075942966620388, 0.029133430513849836, -0.12831056090796725, -0.027710803807370593, -0.0062123684320355265, -0.01066273170277195, -0.001199573599635907, 0.0020167183495105527, -0.04598305776218205, 0.025316903397144038, -0.042255477847343056, 0.01419833744035771, -0.0010462500280683138, 0.06835390012131647, -0.004271131135485547, -0.006011557164547141, 0.039369943188474026, -0.05118366222401014, 0.008881653416324322, -0.05575200341144315, -0.027955115983734905, -0.02938400136266993, 0.039021717938893495, -0.009033809925385885, 0.13687972263066445, 0.05530921427922801, 0.11087007735611033, 0.01571783621354042, -0.10638999061672269, -0.04900586218797127, -0.03882652260567095, -0.004472243243264925, 0.024387925001602796, -0.009001573731128011, 0.028968358027828597, -0.014995831459190147, -0.01285353356349622, -0.03185670849210115, 0.010486877488902563, -0.01026335688520505, -0.02833296243119776, -0.0027304010999799747, -0.01256131387716981, -0.009125247457800459, 0.07037790582298747, -0.050815170939144595, -0.03384586748215052, 0.03556639923390456, 0.03786663753586751, -0.045000066963627246, -0.022931696748775793, 0.015833199133861456, 0.03666625043571769, -0.02334321192776306, -0.05050263146939186, -0.01841774868035734, 0.010746119704522078, -0.05340330518806566, -0.024548127308818987, -0.01385152158648287, 0.06744648219546366, -0.00783779583373391, -0.07509187461331575, -0.06406326960806165, -0.043568100024589954, 0.03556400146960017, -0.016456347619291246, 0.0688554837481186, 0.03186842857291649, 0.033784397524529, 0.01829367109612304, 0.06332844890801471, -0.02708746272443441, -0.03539542341036181, -0.08650707208302841, -0.017382735653021713, 0.08874234381217626, -0.04482179632290441, 0.022144198391224713, 0.007514522412258637, -0.002454402528053362, 0.04294166543752009, 0.012264362861403425, 0.008039175189215956, 0.025851303250229118, 0.03984838824043845, -0.05527574113121784, -0.017889214839695633, -0.048879888488751556, 0.03223891451102653, -0.06477720019718271, -0.06766048340613205, -0.023711258297458803, -0.007261485120953585, -0.03214397439140269, -0.03183612593998393, -0.0014051152634368131, -0.03976916945215034, -0.004097994935262571, 0.040774788218200325, -0.0542333795385608, -0.0043608644039191385, 0.02042142265457062, -0.03281438093008697, 0.05328750183158659, 0.04952282972722197, 0.03670331575117266, 0.020189508382803832, -0.04315732388254581, -0.012123447178897106, 0.02735821002830399, 0.04195785647281411, -0.028602145066953393, -0.02499554027419147, 0.11659348998854578, 0.00690230868757936, 0.015079962230393222, 0.05879822709680809, 0.011517219653457202, -0.03436697064227492, 0.035642321469525125, -0.06726742324866815, -0.068710023361663, -0.033825708943148146, 0.03371842765307595, -0.005258472174228328, -0.047565788237618395, -0.05339602530092482, 0.020969069931486842, 0.06875999121704231, -0.03534386699880574, 0.031821082432430384, -0.08460662141421775, 0.09214392034786217, 0.01061246599310949, -0.03402346328509903, 0.015792852195778192, -0.034273204023736535, -0.012780465951381251, -0.02051987730543514, 0.11048219493626013, -0.01884381915461451, 0.024490846720212473, 0.032046964968338074, 0.024029595101454342, 0.01831934479162629, 0.018208174226328113, -0.05651317861678338, 0.016228330087770065, -0.05420604562269237, 0.015538168121143291, -0.08432761481263219, -0.10608617028989499, -0.03472378365043504, 0.028926410589537172, 0.03244427122896616, -0.024417101284315314, -0.040565734822541104, 0.024042648434775167, -0.02933520999438392, -0.037387511674113055, 0.10752748044749819, 0.03883422949193449, -0.023706680747423155]]','2025-05-27 14:13:03','2025-05-27 14:13:03'),(95,127,'[[-0.0041314137854501914, 0.01556091697309368, -0.01187486685281051, 0.0024554111438194193, -0.059190636899210065, 0.010831835460081573, 0.02767992126943458, -0.042279407125901274, -0.06728188967229594, -0.04310156593968843, 0.03253486721025606, -0.02560130379346571, 0.04883378296400697, 0.02293413173957, 0.04350272024162279, 0.04540846280407879, 0.04610928933217591, 0.01701152723340991, 0.024238411362009764, -0.07311416328486259, 0.03332083404095043, -0.017777531315697148, 0.00720807045739309, -0.07268533241214678, 0.006017962118915282, -0.05745122622304696, 0.008499662846001954, 0.0322380084463107, -0.022456992239811787, -0.04419697610146762, 0.041315840739528244, 0.032732563770784505, 0.040148496765518266, -0.00609207266244059, 0.05267994573831298, 0.05116926460452614, 0.018429891267995796, 0.04794095392803754, 0.0685845878328156, 0.14844436341218928, 0.07356440411146298, 0.010386609506486245, 0.010326997671587956, 0.023284689131858466, -0.04837786782834496, 0.004010562749876284, 0.019617831759796617, -0.004089751345909074, -0.1152509663763508, -0.045192353367312095, 0.036829910477500845, -0.049756476161029344, 0.008800926405882063, 0.04099281578978131, 0.021865677507372713, 0.04019173918620989, 0.11422061135847579, 0.003917433942146123, 0.0029277963860200825, 0.022107645129866665, -0.040170578001616115, 0.043660467613023564, -0.1133910960813749, 0.009916628046916941, 0.005150390076220329, -0.0499585834405709, -0.0955129079721566, -0.0360234043854397, -0.03302431684119007, 0.053461788132114614, -0.07078543790238408, 0.00012917987091714734, 0.011349661572222341, -0.019314295712188626, -0.026082384114687735, 0.0018179294707522085, -0.020703224021722394, -0.06124422344606157, -0.03068707604640022, -0.032704474558877844, -0.0449103832479853, -0.04155098300140074, -0.012382179500875718, -0.0222556727296911, -0.05181301634961927, 0.08913115432955407, -0.02351883236784886, 0.020694254506737366, 0.028267553821497888, 0.006225828111384988, -0.02315436758758889, -0.0014208346986436429, -0.018148154123084192, 0.006161823326708648, -0.026028426845256566, -0.0013658528600549676, 0.03777661978288287, -0.0002532935354835177, 0.008234986141104794, -0.03627337013806888, 0.03398420302154679, 0.02441739889238234, -0.00207715620318034, 0.031183337217439523, 0.02233467277439634, 0.011063776298104587, 0.02727820822377564, 0.207640271851133, 0.004974320649116046, -0.028845103319845918, -0.04842653184008851, 0.050890500844947464, -0.07802221554619194, -0.07113649480761361, -0.06498664942610316, -0.024767496258918772, 0.02523254873011913, -0.05766692104432899, -0.06373605856020925, -0.04448302129870089, -0.03723567293439339, 0.04164189040795381, -0.009032905743914367, 0.09404291838665094, 0.0653862834712604, -0.07307405219825995, -0.05355808948868729, -0.04856447243747876, 0.061797040143569314, -0.05990349517380041, 0.014789444902307424, -0.04547465912774553, 0.014184850628202208, 0.026913546007570587, 0.004628065879660754, -0.04793527172153811, 0.0015634458901097154, 0.014652319715370357, -0.06580009341727444, -0.02887513925017108, -0.03167729036228083, 0.09304386091479017, 0.008909319726911226, 0.011909192079042558, 0.028412305958993432, 0.025255350607416526, 0.04472767602440739, 0.04129758976076496, -0.078963384798955, 0.008183546673563268, 0.017453801519626277, 0.05140518081530336, -0.01293132388980495, -0.011116786862179096, -0.12219373030818192, -0.05293846046736416, 0.06797826994290983, 0.057654103502774334, 0.022862241363247125, -0.0005276368276493057, -0.057059935820928845, -0.044221379184279624, -0.049969008058471175, -0.030249137453537828, 0.017886796316423845, -0.003545544336376453, -0.03014189617124821, 0.015445036881027047, -0.025022348551188702, 0.0562890353272036, 0.027043500320982315, -0.00703392306921417, -0.03209655743781691, 0.04133947777087333, 0.011119185708911829, -0.0577864685090755, -0.019753847356722327, -0.0059157515045063285, 0.019261369058390775, -0.003162092141278049, 0.003234029408637879, -0.0025840845915374336, -0.018521993162016605, -0.0035746755164832835, 0.005448361391716213, -0.06001722617560484, -0.01786544164460389, 0.037452291755898405, -0.04348337546772377, -0.017389976401659964, 0.028005629373675157, 0.018380249948324094, 0.003996435220826017, 0.04663489540773259, -0.03411646536115651, -0.013154331738492777, -0.01586097913524797, 0.0010224556057123258, -0.0024223564178939678, 0.01631694362989625, 0.026785167233000607, 0.019872064103198993, 0.09751932312300936, -0.014833324053921938, 0.024700103473424842, -0.00021649838557850776, 0.003786128673280179, -0.019823852219769678, -0.02686122745648359, 0.02632441689104356, 0.0012592333775948911, 0.018128280220852343, 0.09638069423285196, 0.00046010571359635436, 0.010603691315282467, -0.020143068630135996, 0.09268423528954413, -0.017189796096942395, -0.023420406600507107, -0.0322170289027864, -0.00144828668603756, -0.08636051991735759, -0.00457859583567141, -0.06562170609217491, 0.0239215286445143, -0.047752868549315625, 0.014732218093625713, -0.016842644474706573, -0.03946722034470306, 0.08854220290537762, 0.016206198846761173, 0.029184462145329396, 0.00337184389381821, 0.030850094957534654, -0.05498673993601189, 0.05246750861012479, -0.006334885310779486, -0.04468535760393874, 0.0012826347197805413, 0.06500707220026233, 0.0038961357863654474, 0.02631211465730557, 0.00018559854959614914, -0.03566106204158935, 0.05243765234650965, 0.025462879478010007, 0.04179866639450479, 0.00626818898058183, 0.0073220650361842, 0.0188338294167558, 0.062486214002187755, -0.025187337873055046, -0.02422016433196538, 0.017068882375455924, -0.17438273972289442, 0.019854119150150586, 0.002778491128836041, -0.006992081456552892, -0.006602842413904165, -0.08690947081906064, -0.024948543046198545, 0.05477553480812101, 0.0025672139368251986, 0.027659646572234214, 0.03134956248832207, 0.055438141685969354, -0.014417215953507145, -0.0020940905309848636, -0.028113190502195805, 0.03699605677400536, 0.029443336207800624, -0.03748768017469471, -0.025577246223557594, 0.025507873155534506, -0.11998086033827692, -0.04348205264689172, 0.00910034492685539, 0.011231679774520322, -0.01314090017114892, 0.011187078007346812, -0.08117866348738999, 0.013360598006217465, -0.014574772799220915, -0.008668473540585336, 0.014107280019739358, 0.04699819729027604, -0.02468702926514158, -0.014826969578029507, -0.02094804459362276, -0.07888670067788556, 0.024715742374634704, -0.0336944578747027, 0.08228185657412426, -0.01869896684574936, 0.021049751746371758, 0.010662680239774026, 0.01445665674507624, 0.025817873255984444, -0.008043052735813258, -0.07570360678153938, -0.04970279727628074, -0.004474814618319338, -0.015710789611824896, -0.029201125739094225, -0.034026434570199604, -0.004852354594042293, 0.13281040599839264, 0.036091247324888415, -0.0011236442423105538, -0.01742504497422524, 0.0034629610760629277, -0.057314316241290034, -0.02891620987546682, 0.00660456948483376, -0.06509805858119343, -0.020535215904255767, -0.010465755653790843, 0.005607826949429052, 0.014276283214369193, 0.018712974926052853, -0.004844381143400199, 0.0909364928164986, -0.0017028186384865978, 0.07143012944257579, -0.0032640470761381227, -0.03594570149489365, -0.015817714009422657, -0.02240997484385021, -0.08126322925138706, -0.06454956178216406, -0.00619300043679638, -0.04171604734892621, -0.018243191889608355, 0.05373083014575751, -0.016039105844899995, 0.03557216058423831, -0.02381888564538562, 0.03482567107076287, -0.1648326840849512, -0.04181421250082046, 0.05239917602953227, 0.030820055078490588, 0.029028677287222727, 0.022532681283718017, -0.016760811224189424, 0.05936427391547095, -0.0049269602081998915, 0.01853636847317795, -0.03418794901943252, 0.08074649989592121, -0.0011840845677933887, 0.011175871543104019, -0.014782750836589455, -0.011822333096543373, 0.05797158839990229, 0.07151840700234037, 0.053746786918838954, 0.039408779304959105, -0.0017256354468773425, -0.02034463098646913, -0.028330184451996466, 0.04843360399564131, 0.006332693771789087, -0.05177778587957902, 0.047062225767265785, -0.07839843368826258, 0.01872409254412036, 0.024999615776472084, -0.05206700584680919, -0.05849886873227326, -0.1129042190408053, 0.05809617048124837, 0.10335714073691389, 0.06095845860787032, 0.003198915919395096, -0.024873369310108976, -0.09872816023523755, -0.07604998050615158, -0.049793278221192436, 0.147401175057884, 0.0157582393925062, -0.022529245898273608, -0.005310864038022668, -0.015506451306103924, 0.014797850737669245, -0.01020304935962559, -0.006658648670961019, 0.00986241509793689, 0.015720243832055097, -0.03281378299551246, 0.026930412960358852, 0.004724357364436181, 0.08689343902032007, -0.03883621506422437, -0.019131791847634153, 0.02687047930487008, 0.05783459944376733, 0.02678303295043428, -0.0205946934827114, -0.013979005886220268, 0.0314150085553975, -0.06916740294781894, -0.01897593393822781, 0.014988507719575833, 0.040282212233683785, 0.03656495933664002, 0.07806786273669465, -0.043558191844752736, -0.01099053545991736, -0.02716896296664345, -0.022779703266406038, 0.055991530947717826, -0.04135670208272219, -0.09210341032886721, -0.06480563620293404, 0.01316510877955502, -0.04947543399064443, 0.04944207521336355, -0.003505456695292287, 0.005509660316765219, -0.008520859569065843, -0.011584484975043538, -0.013673093697013229, 0.008918851934339734, -0.009495915740262862, 0.009447037510518898, -0.003926316091725452, 0.029916037347513417, -0.030191367696007144, -0.01081512941758855, 0.05054576978739833, 0.05091082095241519, 0.03105047467255675, -0.051787357574196544, -0.07111341849435254, 0.015609951177234257, -0.028300207752454825, 0.017564989546458062, -0.005794328891871411, -0.018641301729269567, -0.042736325236164295, 0.028231752761576363, -0.0051913822207278965, 0.07520531004590629, 0.049021836752977666, 0.009563965000274186, 0.026073803548514518, -0.016456875368792645, -0.008878668783617134, -0.034446451902327, -0.032275495609203224, -0.00700209787563671, 0.015576062284440837, 0.08387536208687256, -0.03346130971587552, -0.012199841482515114, 0.027454731753553608, -0.0354228792661626, 0.09096411805393433, -0.014809101624999682, -0.011577671460578793, 0.02010248567162461, 0.03711857367536589, 0.07022908710145939, -0.011070760594661826, 0.09332819236802013, -0.029182900427003805, 0.0020713836697360357, -0.05058524118153891, 0.022920180915690577, 0.045234134762010124, 0.0103177784001324, -0.021689169772470353, -0.03629873275957398, -0.02641446150251663, -0.010917278826854528, 0.013455198452123273, 0.008103012057974888, -0.027639444926333533, -0.018312728829465864, 0.014815661434274997, 0.020541291008285906, 0.02113153761226209, -0.04848980216304915, -0.0015473825016179298, 0.08932433355565907, -0.06596404422606966, 0.018716864414170947, -0.012777599275785203, -0.038380734287641535, 0.021041720052125866, -0.008925807602684936, 0.0282097722178105, -0.05240020664516559, -0.010800524093551186, 0.04137927690868275, -0.014980505640721703, -0.03834912874155298, 0.010930046022243187, -0.05110381458873181, 0.01742756425688447, 0.07771217003547463, 0.02343951642563149, -0.032609041920463516, -0.003948774183683478, 0.00019595517549283567, 0.05724819889200133, 0.07316422514309731, 0.0061698653863416575, 0.036759650922084344, 0.011585355667561345, -0.062157494999784686], [0.030289876218849356, 0.0495893872441491, -0.043664944254681703, -0.03935766336164257, -0.04445758081716028, -0.005588347298825838, 0.010010942330360912, -0.031854879748831104, -0.06133159791414929, -0.03739049702548217, 0.03976136166199375, -0.02717586991927695, 0.059500618924134524, 0.02342219764944921, 0.10071744147948851, 0.0803010554049776, 0.015701041575698217, 0.045428573201000404, 0.005856479284051417, -0.04789154872964444, 0.024784998302849134, 0.0002070269209372952, -0.011008706041700124, -0.05438615848977869, 0.04121250548535064, -0.017761680114705983, 0.016679996823296857, 0.031226551781793763, -0.03976689265670941, -0.05763490507292576, 0.013989754758392908, 0.023533672382577486, 0.05239221881631006, 0.0002630416411608667, 0.03421046983598257, 0.022940430323394868, 0.020878033871337937, 0.006994227540912274, 0.022009161147000286, 0.12424846895325575, 0.03668997403488155, -0.02831835797599407, -0.01991790651563476, 0.051642527855242905, -0.10228780450047381, -0.008166543174873257, 0.010380548908438524, 0.013142188772618973, -0.1329792084258179, -0.005737687505830549, -0.015658136170469322, -0.03449236566404163, 0.018140420605326387, 0.03586947079893003, 0.04422199903060837, -0.02419955966256768, 0.10421192608463922, 0.03978643336090834, -0.020621255297866996, 0.05202061850757913, -0.018029827508468196, 0.012136216330871454, -0.08907774715340416, 0.022301896545614024, 0.027484729346574862, -0.01864658701417438, -0.10090196875474064, 0.019058717133746884, -0.08070713331933435, 0.04957524354739074, -0.0024200014549366606, 0.0406681928992849, 0.005906297092802138, 0.02444668311299573, -0.004315904314063839, 0.017888839398256137, 0.012648442984171705, 0.010931902525810168, -0.011063563781803305, -0.031749421044354305, -0.00750400088720565, -0.020000564605509714, -0.019928819779190733, 0.01597708751932691, -0.06864959699614047, 0.10412216532931182, -0.03417564118369602, 0.05467047412802585, 0.05589370827620241, 0.025486630708087484, -0.04831666891553679, -0.030251526380973476, -0.009344379084567894, 0.05348743080288489, -0.04894976414982179, -0.07170311340050134, 0.02069888082568962, 0.014666598177867104, -0.006930259336039439, -0.049564738945023785, 0.028096386616845666, 0.0628055919273998, -0.023688776052220136, 0.019902914679425086, -0.020218781641210132, -0.045434532954996346, 0.03776872166509348, 0.10592913915912171, 0.021290543174898945, -0.008126184197807421, -0.015416456623028122, 0.11898463414514006, -0.07215945262148936, -0.05480221041689303, -0.05633918916841723, -0.004645576654737646, 0.0007881012607009226, -0.010289850912121873, -0.053405709284062804, -0.03291071823474837, -0.020568990881473157, 0.06244259896122057, -0.02169480690155099, 0.12429937339880744, 0.015399413441636844, -0.02782424774215856, -0.07941725390052869, -0.019402217631146218, 0.07155188464285425, -0.0687677898512417, 0.005175786410163924, -0.02119716074352589, -0.07253942981465883, -0.015450782823033091, -0.002083859873653384, -0.038997888769810966, 0.023404950807399794, 0.013007287704314195, -0.06864233488583066, -0.03630503127329729, 0.03565138775050469, 0.04336618210843447, 0.033995144245678566, 0.05880888013928871, -0.014633552896211984, 0.04757039195023889, 0.05083685165115269, 0.013042183350238289, -0.0729592869803857, -0.053788098248183876, 0.01206623745683814, 0.08473241655398535, 0.02702908685941731, 0.00940879413700315, -0.011642805510611906, -0.03808612948054205, 0.05419856022618153, 0.012639251457100622, -0.013199220456260468, -0.04017459449684023, -0.04762194489420201, -0.06201944034903552, -0.05168274547573352, -0.04186134422445855, 0.04096274248560334, -0.03271105039741123, -0.02469775114880239, -0.03279127929798883, 0.002063891582562825, 0.0528561470765591, -0.0322518197310268, 0.00014821890099631253, -0.022054519859236055, 0.05811313245517226, 0.035855948803128077, -0.07417619692917807, -0.032900492325913605, -0.018232680223334196, 0.04367906919322155, -0.007634083103161866, 0.029816745712547228, -0.025890824761356488, -0.026762736235014035, -0.00980269528779984, 0.01717460950941395, -0.05003027505257389, -0.035144980164561544, 0.02709205551921798, -0.006885833175238287, -0.014178580345429875, 0.008182966665117251, 0.01238256399497674, -0.051874427671475376, 0.09173493455754374, 0.024839549882028737, 0.008386515443877338, -0.013585020736405298, 0.039944634816351035, -0.050236384998097294, -0.041522401974157734, 0.0644752288002438, 0.019697839115665364, 0.03460530621795938, -0.016113671467806803, 0.03643838076895654, -0.034881255690750006, -0.09018724218350345, -0.03729336429027938, 0.015906263185587785, 0.04503735715519649, 0.022479599848945882, -0.02245724809171559, 0.06730218344141173, -0.023120206409872345, 0.01993606983064578, -0.023718874953696054, 0.07719041218600993, 0.08407287759108886, -0.05353400477970571, -0.10745215643658167, -0.005619401194604952, -0.092294379666458, -0.0430792858752691, -0.06335535779556166, 0.01708863523448055, -0.07778345594402541, -0.03157415764930181, 0.02010791922992901, -0.06322890596482396, 0.055717032655270476, 0.010657207843850746, 0.06144350944579436, 0.021449742835541054, 0.021333440540891334, -0.09050765399365951, 0.04664768590059523, 0.028478035971208248, -0.05951185241727795, 0.040864441381361784, 0.005675312409658518, 0.009192115275220748, 0.038699391918368416, 0.02533486064184904, -0.05347376410082585, 0.030415818897941704, 0.03090621500451176, 0.02247797860291731, 0.02726858107440181, -0.008116636264584602, 0.06073723036185593, 0.06761137247740635, -0.031203647996990106, -0.03093300710003849, 0.002647700602611012, -0.11550061126642827, 0.07005241696886388, -0.04135050433945547, -0.005658879540305268, -0.06626342297357726, -0.11476399210391876, -0.036239768751347094, 0.043844865047416276, -0.013727007051816767, 0.05300364026897671, 0.0023135254520737555, 0.02139023372718317, 0.0005063862317211819, -0.016697947098540486, 0.01554053285937849, 0.020267593205524938, 0.02756650178056148, 0.0035080146401891637, -0.0019254450434751048, 0.04884473956411628, -0.08724078697142944, -0.032626121223223524, 0.033014507457777564, 0.026638342448821708, 0.04559792775722148, 0.013718849906509368, -0.0909168296938163, 0.04365776253673695, -0.016844266562428323, -0.0008337921776368647, 0.009423627198291842, 0.04320527143028948, 0.0419158154112731, -0.00892483276931923, -0.05634627441552392, 0.01133837838237393, 0.0195599420918896, -0.04519704318964717, 0.04073189580935306, -0.040353456790101605, 0.08032911234038118, 0.009625466299421797, -0.00953621603561248, 0.03692540575568536, -0.00566398244567702, -0.06665082842127765, -0.025669140134976773, 0.004760687802511829, -0.022465905009559067, -0.03660032046937421, -0.029056199102452385, -0.04542272063682453, 0.12542650651379939, 0.048995561000447094, 0.023931075960744994, -0.03143253041978758, -0.010340782825064955, -0.05705827207636313, -0.05242640700942169, 0.004123537778314465, -0.062310937705227436, -0.020323420343563384, 0.02521008097230446, -0.02228691542838636, -0.009169466736176133, -0.02275210048927573, 0.007946130087734133, 0.0710160052158826, 0.0023651688374475587, 0.07930947989593837, 0.0038929865440057573, -0.012759626964913038, -0.03751184126129348, -0.01947728936150565, -0.05483349912537174, -0.029415981733520495, -0.019772697806257407, -0.07553074932592353, 0.008441554736738265, 0.019343879571572607, -0.02797067439586647, 0.01901747585047459, -0.003118561866925417, -0.0008602696542932786, -0.09420661389957753, -0.05584661978824524, 0.06608747088393081, -0.011919829561348745, 0.05279159736691238, 0.03407149019502409, -0.04905387762205669, 0.03500202646102393, 0.0059595449757951285, -0.0007151604304676803, -0.011368930160839652, 0.027724949772590345, 0.008729210007817014, 0.0808752283951696, -0.0342472359442669, -0.05069138434633442, 0.039158228662164084, 0.05197468231018773, 0.0003963792454494555, 0.017523647700892698, 0.027539476547176093, 0.03646902365876932, -0.03859807074094636, -0.018650634769754808, 0.08374922328887566, -0.04281982487655089, 0.01418870978342658, -0.06513772084268325, -0.03276775381222875, 0.02147834241940873, -0.03600267826807768, 0.00462773758893234, -0.08376312580853885, 0.09250255301601776, 0.09895467273147589, 0.05713313344670068, -0.006917402587058304, -0.022015765379789408, -0.06317060542168738, -0.08851548295222206, -0.04699913988264383, 0.14382166238665162, -0.0015665442161611719, -0.024229141373161758, 0.03290604743833878, -0.031753459420825476, 0.003460641429272436, -0.050979381954901024, -0.030080036067587478, -0.0006930582245372402, 0.012913936090014412, -0.05621352518285706, -0.003162894236634007, 0.011139872214711806, 0.005090121645835979, -0.014754008796389453, -0.029564554863375326, 0.03835345285256247, 0.018309363820612948, 0.009564639426213417, -0.016167632163103265, -0.018757970635955593, -0.026687293359902605, -0.09021412539037724, -0.03568624320024626, 0.022017479077037792, 0.014269116887080043, 0.06835420328998898, 0.04805715164216304, -0.03702234018972101, -0.016449829462531276, -0.008869575747136286, -0.0004548266302653323, 0.03292593918919844, -0.06400356143498565, -0.08216571343645866, -0.04186840803360122, 0.03542033741359628, -0.009519108540329158, 0.02126013342294482, -0.037688299822839756, -0.0036383447326042936, -0.007692773549268958, -0.040122870049164996, -0.03709276926099862, -0.0027819734380797197, 0.00586007952213305, -0.03580557762693124, 0.047107744608339705, -0.00198518628478708, -0.026667806250613706, -0.00090601324497674, 0.002034575669225704, 0.017050838764050783, 0.03767580416956499, -0.08928944704804427, -0.027228422408312233, -0.003290888260907966, -0.0291098636858709, 0.014535823917635055, 0.02223704000510735, -0.07553195521139933, -0.07950501556571177, 0.04430165982513959, -0.010138133770857089, 0.0022079913797547236, 0.052370357452506594, 0.0040810055276466915, 0.044108964685598065, 0.018384875029234672, 0.042025918114704464, -0.03227956581595216, -0.03478652400751681, -0.007578712191795096, 0.04324022067112361, 0.057116899548450936, -0.05710210199379014, -0.00042000409114820804, 0.03140598486084702, -0.02515017258186681, 0.046963965543187554, -0.019772342739978424, -0.013205805930831076, 0.009540482860387679, 0.03589343308320688, 0.07431501310566094, -0.0559536863400231, 0.07274558263611026, -0.033102169972377075, -0.009792514264702228, -0.012934243201426852, 0.07429306599000142, -0.013822715502285358, 0.059478929064043166, -0.05023010367464113, -0.030775901660506016, -0.047694410572060975, 0.012950599028096926, 0.025719232617641426, 0.01226085129415894, -0.02337583001303202, -0.006150214227737316, 0.04142235903534002, 0.03578612535433386, -0.016969201657212007, 0.02802292943315105, -0.04335688875103433, 0.0764203712376023, 6.598998911187642e-05, -0.010271062546472564, -0.03452954713287874, -0.01792188467991126, 0.04634037804594285, 0.0061900754420761974, -0.0010294773269640444, -0.08450427374094636, 0.019966580073056222, 0.025240155756070862, -0.06228146050470793, 0.0465190581165101, -0.004256773049821705, -0.06755414383247048, -0.0015129665569873696, 0.018835037436841097, 0.032851359192138586, 0.007274833741448609, -0.012549954297745023, -0.05490699382550338, 0.04441138736420071, 0.03919277326142744, -0.040548193895715484, 0.019379991821954507, 0.08056813492015737, -0.022310791960807163], [0.03615617014133777, 0.05375368963674299, 0.004362238252761516, -0.012128952751737457, -0.025553699218883424, 0.0032932901920011224, -0.015443133357562326, -0.016653341636425917, 0.004243621149181865, -0.0498943631760233, 0.01651153782293383, 0.020594730920827427, 0.021746136234641517, 0.04587770672744543, 0.0708171345511501, 0.051840842006223145, 0.046643416052810686, 0.015666978480406855, 0.007715937813072183, -0.03154299018502742, 0.007784436569226969, -0.006869618598402282, -0.04578379524543214, -0.07326805842793194, 0.01457528403634191, -0.011878680143832207, 0.00015044827103522114, -0.05018275272128337, -0.01919462282800819, -0.12444726882857741, -0.019246231401314474, 0.027500975513558797, 0.07853004458093482, -0.034822155502649124, -0.00975175131028281, 0.1023362065390663, 0.007846899838847576, 0.015012142534334643, 0.02202196571441209, 0.07676634001880141, 0.041723395862367715, -0.023084459476359794, -0.025652989283240626, -0.00024179775499202967, -0.01881160752499956, 0.01708987024803489, 0.012659999549448115, 0.00015460699090353225, -0.0746262723843023, -0.014886174701551649, -0.035292906240851615, -0.03939094135743715, -0.03286690743179577, 0.029165163393732253, 8.487842189581155e-05, -0.039640220720469556, 0.0951723135091754, 0.04701942055302011, 0.013959784890100118, 0.048801997484881836, -0.06684565245710657, 0.024651023935558347, -0.05679199486556129, 0.04708462905106905, 0.04485643585487008, -0.004621216634048618, -0.03528350304462583, -0.0006484393773766771, -0.09189304205419545, -0.01636811039471819, 0.02026634336868079, 0.06074426896633824, 0.012790924283719255, 0.002309423773906102, 0.050478990693899675, 0.02921685802435604, -0.036504894471898884, -0.05793142817222215, -0.008160780278696217, -0.0305042410712673, -0.018298723124147816, -0.043015471901660114, 0.0188298803620826, 0.015229681090094857, -0.052321649976264435, 0.08273123086685617, -0.02296307993288831, 0.02855187305197303, 0.01261576321967455, 0.009951004120362357, -0.012246894305374713, -0.005776096153484721, 0.00030623837076833543, 0.06766879643617303, 0.0163962210174804, -0.03536245489627993, -0.009643090321193893, 0.02272562341099213, -0.02607473324770266, -0.09006541411662114, -0.006738401269251632, 0.08303901199432683, -0.05955312668616734, -0.01834548236761283, -0.002539544088771269, -0.021749822356407877, 0.06664673383627666, 0.0131171532314852, 0.021436714280983822, 0.013989600882037503, -0.01605450318685262, 0.1135177714938816, -0.05639400845788446, -0.04429774027533447, -0.0760935037504849, -0.019587995129178255, 0.016630783144931247, -0.023362033051098414, -0.03854350626621696, -0.039805161043772214, -0.07923488843420777, 0.06605186549761748, -0.056645519574017436, 0.06398571536169857, -0.013345979638724501, -0.03721219669587515, -0.06216041097169683, -0.06131176534087711, 0.07293608371993407, -0.08298302310355965, -0.00871759335441145, -0.022928292696576525, -0.05359978473012142, 0.05382609826368965, -0.01965225269386879, -0.023758489072812323, 0.061850369405353114, 0.053151076139508584, -0.05018112336940532, -0.016544764553221566, -0.03787747139456042, 0.03578764115344207, 0.08050532966388002, 0.00047246274096255666, 0.020491558237162234, 0.013033733570764096, 0.048937646765883865, 0.024731071583721977, -0.0898624622761776, -0.012855358265910671, 0.047901241279737064, 0.05113791436255326, -0.0024326551632785926, -0.018134141373001424, 0.005158723826298624, -0.030069278702836873, 0.020278239358536895, 0.03496509957559812, 0.04013815983384836, -0.020767694654698566, -0.036816335903940636, -0.04414857425833004, -0.048746846218671695, -0.01198604883886996, 0.06048971715832018, -0.025297016057968545, -0.044004302034114255, -0.030284995712043284, -0.03579325782769773, 0.025409369623122634, -0.07890394641401993, -0.013018266202231637, -0.02521603325362139, 0.11580375217878355, -0.01089319477245167, -0.059261753820567184, -0.005891648899416967, -0.017208204796755406, 0.04090370851888761, -0.042304388892868236, -0.006726064952787641, -0.039853556810558396, -0.0020339033833342264, 0.028487203846447106, 0.036787696028675786, -0.08773275594270581, 0.012136132800594421, 0.010571095141637222, -0.01010908424117143, 0.01001910127570213, -0.022529543247351177, 0.06107671412100513, -0.04585151087999765, 0.06701978657049575, 0.004224192275467038, -0.0167402021555585, 0.013906188392759524, 0.026915214907668638, -0.05082420675448393, -0.03431262446860273, 0.03692781455303345, 0.014173384889295966, 0.09712972735585258, -0.009345144827969476, 0.009814165096945852, 0.009184528884871328, -0.07130802270164818, -0.008387922113945404, 0.03616056193310765, 0.06622287859895856, 0.056319500032390744, -0.010544074578230044, 0.08130954677025042, -0.016413251760614155, 0.011900636951248673, -0.026750211475666485, 0.04569965413753264, 0.0473454917290373, -0.06851996067781833, -0.08106462764463815, -0.04458156878276691, -0.10539922742947133, -0.04567847256311801, -0.031756489784019515, 0.056831225528033456, -0.05814432823856898, 0.004050694269083069, 0.010686749004917534, -0.07675625410119011, -0.010476956324876862, 0.010897799556082369, 0.033533214818291066, -0.02583080951839616, 0.0061942242763230225, -0.09884439072131854, 0.08405704711176408, 0.02640350375491218, -0.039347691818237614, 0.026248101450966062, -0.021745057649595487, 0.03143761299974554, 0.06668400239190976, 0.03895130607666634, -0.040513364001005005, 0.04118132081941911, -0.004060317628612793, -0.026125699259704923, 0.07075562651775377, 0.027147707356633546, 0.03253359309822211, 0.044199534533177806, -0.0027672578466096925, -0.0037427388755444796, 0.02304131033736401, -0.07729828898405722, 0.08483362260775265, -0.012314810740347732, -0.0012359804733087475, -0.0783577004597497, -0.1279090793282893, -0.03258590734153191, 0.07141006373158822, -0.013462402280707835, 0.027131192957404807, -0.00865127471696673, 0.06625178812048492, -0.009173352190760684, -0.03221048516250426, -0.026502357795527367, -0.020529707446011118, -0.014102879563354745, -0.04329010088185153, 0.034390222351794786, 0.005931719337879096, -0.08826450984470861, -0.022710197636829795, 0.010830524248124746, 0.025474767447270077, 0.039789444109018995, 0.0329621843565801, -0.051256524294689784, 0.03908822613739015, -0.040429438036399264, -0.03610771987158383, -0.0136580421177409, 0.03634416521999936, 0.040403965070418504, 0.012584606167872749, -0.0703189430029733, 0.047086863672746865, -0.005725012529815203, -0.03807715592551611, 0.07139806734152837, 0.007150475259803628, 0.09927179725727224, -0.07421575603119711, 0.018215193023202583, 0.01304276241765874, 0.025931683037395407, -0.04041025872890519, -0.051263707212124, 0.005589992184375253, -0.030907258963440775, -0.0406259814752661, -0.009833178026959417, -0.005516727645691607, 0.12531162852557312, 0.022147814501239205, 0.018078835203619782, 0.03387454395670146, -0.016884064173227523, 0.034711999267668596, -0.07315474962655356, -0.011857213863125507, -0.064521491009006, 0.02124448805087836, -0.023144478718163327, 0.0619711135589637, -0.022435294707511, -0.0315423246751054, -0.005840950382243274, 0.035754288205755325, -0.008018648013108993, 0.039233333117585714, 0.00671224988475123, -0.01326634936855076, -0.004026949620895489, -0.060469717437732586, -0.08633151332758417, 0.008831640814431716, -0.008122253134794633, -0.09924810280918653, 0.03788264343934233, 0.014247531874056168, -0.011139219017449544, 0.01573300882583794, 0.036694355393535265, 0.015585026096949168, -0.06699627571135405, -0.06757419075846523, 0.05165523932098813, -0.040370454350983014, 0.02290921092070896, 0.04478913903258308, 0.04096564110171695, 0.052653768113124805, 0.0331997398443914, 0.008364789907000717, -0.02388504352964296, -0.041944918871928305, -0.020890038040126076, 0.06566130870501838, -0.015065685962996109, -0.05799861598857365, 0.005985793453331828, 0.05855378895524615, 0.005947164474937867, 0.0018905148601975432, 0.002444673426239981, 0.020826645351476443, -0.0009363607170437103, 0.007804523781420691, 0.022686177605226204, -0.05393470833553237, -0.027787575066614813, -0.048960796184292055, -0.0460281004955129, -0.0015897404119463077, -0.010283429912132798, 0.009926846397050763, -0.04906133407975304, 0.08356727770639352, 0.10081099548950498, -0.018441097784512674, 0.03958139193822481, -0.03047369072355389, -0.10507118840946059, 0.0233682004921861, -0.016306435983841357, 0.08825688516637789, 0.05233425450470131, -0.023316776942112448, 0.007493651044818765, -0.024382783276902877, 0.031867710261159816, -0.05643291783970462, -0.032063645561649645, -0.007743643249297819, 0.055908478809689535, -0.0502275312121572, 0.009227744001143862, 0.014219001004726822, 0.012522765379515412, 0.03789560653993546, -0.04796599080542599, 0.01710239015344289, 0.0011019578548935925, 0.017671107107601662, -0.013973328877586396, -0.01752738995308377, -0.001065798004367643, -0.07941897077350024, -0.06687133196064933, 0.04357063339402362, 0.07303253676139093, 0.039379722351812065, 0.07967406187404132, -0.03539043499877726, -0.033158053679793166, 0.015636171395029562, 0.02370100708758649, 0.02809397353985092, -0.06005842656876986, -0.1627019380514833, -0.04805311236508833, 0.0592688908407654, -0.019049736728260883, -0.03617215098519799, -0.015685661524036658, 0.001724560315550908, -0.018009540417278095, 0.005075511420283838, -0.026618672865863825, 0.02913608749472539, -0.02342188734971007, -0.02625975074317866, 0.05250961636915352, -0.022368456857584013, -0.01061089234811628, -0.0034914619070295434, -0.0018249079884829996, 0.027659906167522518, 0.031391776003866424, -0.08719585007596185, 0.006598753191562982, 0.019273636354073163, -0.046813006339835726, -0.0387986805554983, 0.032020877943428123, -0.06423714615766855, -0.025363805142082283, 0.014941271464794036, -0.02904491550398593, -0.0038697523047351292, 0.06761022582588079, 0.016256462499567623, 0.02792307805017709, 0.04664425080879046, 0.028401703032931064, -0.042542678736455564, -0.033766952229782515, 0.03457947673586916, 0.004206399925073384, 0.040181779419513154, -0.027808923018509946, -0.005110122597666898, -0.013331609500990198, 0.010670687123749995, 0.030378620336331565, -0.02939186992238374, 0.014036362994079768, 0.015776342988066353, -0.0013405331219173077, 0.0263772218501469, -0.04180546012033816, 0.05087493467457444, -0.0019556346116378067, 0.03156188263479648, -0.0181610701419366, 0.083499057202232, -0.052758178587873406, 0.08628865104631339, -0.024550270896803603, -0.04616250481398839, -0.08586293123378275, 0.0059588302614696515, 0.04128271355090062, -0.01929020095340378, -0.12741522506891462, -0.015220515985780836, 0.06449890956889333, 0.030946535523148945, -0.004927061113303302, -0.015952224065000832, 0.021556483118329382, 0.09015133374241568, -0.028781270306085096, -0.050990538337752876, -0.019718410690987506, -0.06369990753596358, 0.003966886274716735, -0.019301098678376854, 0.004966104959682055, -0.07277699242564434, -0.001932092377432435, 0.03645245974834457, -0.012416402837948126, 0.04175168003405356, 0.04199656760531609, -0.02833839066444443, -0.013867557262932626, 0.051044622493225986, 0.02057414170761494, 0.03572686747582176, -0.02366870117059603, 0.023528929744085627, 0.04433288321522527, 0.04075383683187966, -0.016487863454888875, 0.008577446861425598, 0.11989340244406708, -0.05631388335813508]]','2025-05-27 14:15:14','2025-05-27 14:15:14'),(96,122,'[[0.01343032607857763, 0.029409429491659003, 0.07023480208441263, -0.04008999867323717, 0.015754556058549102, -0.0203038089449274, 0.018532780310995808, 0.059969169428417415, 0.07735400317672808, 0.006589482051998386, 0.056104514069068065, 0.059529345235152215, 0.031474319600390155, 0.01715971483311079, 0.0043420819672867275, 0.08583645905674103, 0.012074453674185035, 0.004475111886715839, 0.02567703426193789, -0.014250355401367161, -0.04820626587535755, -0.0033008917043249853, -0.08811650376290628, 0.020565539129133083, -0.024568064502582265, -0.06046266085569701, -0.02693551669315416, 0.026221830692727054, -0.021958888403080117, 0.06573564830764984, -0.002052010170796835, -0.009484915474152325, -0.027651365043043368, 0.05518451944627912, -0.003253936384869961, 0.04807483004854183, -0.002601634719913246, 0.024165449569541583, 0.036844558265126025, -0.008644352091020024, -0.0055204282064911575, 0.010425388818317666, 0.004575929984965681, -0.01081201409389583, 0.061798434477885314, 0.045251571440834706, -0.02041717783815486, -0.04231944208931595, 0.009930180231171109, 0.005563439385660119, 0.0066244397596508285, -0.1095710410860224, -0.033472138881878874, -0.000660676019882717, -0.017656818986344257, 0.04054164393048313, 0.06744595605424146, 0.046962916586557116, -0.022573705971378578, 0.09056030555606716, -0.028587967963381585, -0.019912557496951512, -0.02588466441185487, -0.040345512722205344, -0.017266874198738517, 0.06120870280640237, 0.07085278801502455, 0.0018987592278645784, -0.09115509207044853, 0.026543328612523565, 5.1950177391767016e-05, 0.05799624772606761, -0.03576344300281394, 0.011770725344276879, 0.0948682739414273, -0.0029983754629713134, 0.031221627012752214, 0.025779609578858713, 0.011987798634530086, -0.013027288256719302, -0.009419990477277552, -0.03535713274834719, 0.0038976266458954694, -0.07234902151295843, -0.04868041344304872, 0.02595680825299962, -0.04217622814816501, -0.05185774562478664, 0.10039301239263503, 0.0302413740372676, -0.050444553614599125, -0.05080388356448052, -0.005594027792833367, 0.008999001355492038, -0.036372234405460946, -0.02503628171536973, -0.015833581754437262, 0.031437135118807295, -0.015702585335533627, -0.054093162345414676, 0.007171977121184834, 0.004329996597794937, 0.08296727736649268, -0.03775921722041107, 0.01496320223179675, -0.03885564898708727, 0.07990280033414514, 0.012471110995816184, -0.06211118058144788, 0.019837156090383338, -0.03815180010739877, -0.03836454952468249, 0.09890635996947596, -0.008819865817528123, 0.03195259363787227, -0.0368967586035542, -0.016389705328283453, -0.08732685801051894, 0.03428363609239051, 0.03729183256998335, -0.018020405906862654, 0.0896212941517597, 0.09432848279625324, -0.022411792415322353, 0.012605940670584457, 0.0049513297099176195, -0.018603460560373233, -0.018836748167773334, 0.0582889330413431, 0.06494239478503697, 0.005383363911222608, 0.00847406913576613, -0.0005449828900676486, 0.020762828325931067, 0.01517304263654971, -0.06592594166795278, 0.038815200332443206, 0.0010678579663141636, 0.013221178649836398, 0.006502479698382852, 0.013700603242246208, -0.03298643125189908, 0.023577052640889332, 0.07744032535663008, 0.039345278250086956, 0.0023954522621351874, 0.011213139830572809, 0.006204678419559516, 0.014072908940809665, -0.018864622487730204, -0.10947077679041364, -0.015359397844738321, -0.07207666129148105, -0.019741272658619875, 0.0014567495584050583, 0.0014475963281762431, 0.05773919740131658, 0.08241680827867305, 0.010262215681310445, -0.030383220197398964, -0.034679023921614, 0.06862765938641331, 0.009687579158326133, 0.02156476593649068, 0.17054783562941037, -0.05703636279402665, -0.057535735018926636, 0.06779733040824089, 0.07171082281839057, 0.014135065337456412, 0.02725955855349432, 0.016671170874615768, 0.05524313249716864, 0.03551219418402999, -0.026501424625659395, -0.029289352194179743, 0.03507981679853803, -0.023876188662543364, -0.007381410330259866, 0.03645562609800941, 0.07422099172537079, 0.04161887059796421, -0.03940480645880841, -0.06437134290554598, 0.043557521786990246, 0.013731377489231898, 0.019532251600951102, -0.007546224639299631, -0.06515863633888515, 0.010483131312930234, -0.09377477596592351, 0.02569666885758844, 0.019574945200529468, -0.013220780539660412, 0.0008127103315095194, -0.004696877425744529, 0.01687488765106008, 0.013401617544351574, -0.0012988073991407215, 0.029049134826662357, -0.07535713539507906, 0.03999680785386731, -0.050572583204141465, 0.026577772576338945, 0.006589598924591544, -0.04458758313602823, -0.015305989960506626, 0.08807743280073844, -0.010168682916685696, 0.045715414397414646, 0.04193583898206546, 0.04148472563966044, 0.06623794110844669, -0.110876254383498, 0.03243602493663833, -0.012210727943762024, 0.06666032774562176, 0.03103578720031011, 0.009133551857564287, -0.02003733117297986, 0.037814318311822796, -0.06860849062922596, 0.020988049659516457, 0.017165230558744072, 0.024577011244130587, -0.06291511204670631, -0.02236837197558866, -0.015313744023436432, -0.06114778038611024, -0.04738829648364459, -0.013707543739774878, 0.03294777657091112, 0.010126209847018095, -0.07699680749384824, 0.002610567420231296, -0.041937606525170465, -0.04988475784605908, 0.027063508288779285, 0.016752786764512008, -0.024713961144670143, 0.015438405369622597, -0.006883591726191899, -0.03116035438765797, 0.049522969854925124, -0.05954644580171578, -0.013913379090081031, 0.026818402921217312, 0.03020008290880713, 0.046720009910465016, 0.007651018470603651, 0.06807485780245887, 0.026777746125983312, -0.05169738486360771, -0.005262822427189606, -0.07765003856435584, 0.09918883648438795, 0.015314956524968277, -0.006515754442674272, -0.04220879719476153, -0.0976738505104466, 0.03716116983678738, -0.02605154030388066, -0.044731626335720025, -0.05825615915797553, -0.073408232456044, 0.012198697087281883, -0.05564378991751826, 0.013499071116041492, 0.06205644291011382, 0.02848926307028789, -0.04524138907102233, -0.06613691032685594, 0.035120014362946615, 0.058303119639647565, -0.04011389519525306, -0.0071639389298306716, -0.004290424281110876, 0.01527368356751169, 0.07173079770738658, 0.023215654500384143, -0.029079635682635076, -0.028524508210183576, 0.015915414044470656, 0.03917968423978965, 0.03883439882400056, -0.01662471918105246, -0.003774632902292953, -0.031032030758234613, -0.010944547614537042, -0.04365756803055241, -0.0717421364138097, -0.040521669041487136, 0.07894958911625766, -0.05422096397145375, 0.0275300801997606, -0.08373884462192563, -0.016104124875526312, -0.062933269835314, 0.06219614819560586, -0.019991702130319634, -0.05535873642387373, -0.04859966810942943, -0.04361244447218202, -0.01582889859116372, 0.013175597512550043, -0.08490317647438513, 0.11736437320713006, 0.03462581261460613, 0.02979004594663487, 0.022893996345371575, 0.03778264460014488, 0.017588497663652763, -0.011846438961729959, -0.015161560214004955, -0.010125449968673886, -0.0027035907772812746, -0.004852678090903491, 0.014423916570912536, -0.08477646841239793, -0.0630992999497045, 0.0640313072579697, -0.02542901327420738, -0.03220199892571679, 0.024200698013256156, 0.016636784727630922, -0.038688009912898384, 0.06746694851945492, 0.03957044011493237, 0.04591768079736719, -0.0023351916380640303, -0.024994194366557285, -0.019389382908873945, 0.03606962772206522, -0.013014933625988151, 0.04266923721788698, -0.030389959987930197, 0.008517219488305743, 0.005720920042723558, -0.005462006364119774, -0.03074403686577989, 0.03394676550330879, 0.02699703875657444, -0.00020129156689194312, -0.12384665087896836, -0.009268753211957446, 0.055004467924528545, 0.020028063960999418, -0.06000404454059766, 0.1066478485645953, -0.08013290471204679, 0.009785665411333076, 0.009916621358455334, -0.0038722074763496385, 0.002095810136725273, 0.010312131428977673, -0.026805263633500293, 0.05093239220776159, -0.005274429568897379, -0.0029063674107633105, -0.029698979482809907, 0.007009145929432506, 0.00786618380544912, -0.004847811565681675, -0.04923153338318925, 0.0028608661845963054, 0.026718184879072977, -0.03783128011799307, -0.008783932657349041, -0.031135169376275817, -0.025597033939477813, -0.008673063103110248, 0.004774129383867268, -0.00693770414980143, 0.029886794978946953, 0.02239666588054429, 0.04609054981685556, 0.04603478796166626, -0.010230455244386729, -0.06109336648902719, 0.035101222241112465, 0.06003136051516249, 0.06776392879928463, 0.05746365229843131, 0.002731379610924423, 0.0679775074751092, 0.04806244733535013, 0.0156208571157952, 0.02738606838634824, -0.01775122230724596, 0.0402623324740657, 0.009020722312770272, 0.012194608611408158, 0.019948154493558756, -0.05867101969572406, -0.04725255908463688, 0.0210928781809188, 0.07244292265338917, -0.006197710665525021, 0.06024047903548845, -0.028358022168786554, 0.034311999377542785, 0.07691951134714788, -0.030065891697038934, 0.03612191726360337, -0.0272384471508009, 0.033587600744371796, 0.05445527411079964, -0.0027939859464059602, 0.07431639940721439, 0.0011265597040919523, 0.02979722514507819, -0.055561471966108354, -0.00649626604100951, -0.0486061270753552, 0.023120795252475918, -0.04639552864221277, 0.008124651468503042, -0.07390401673363176, 0.006537421712895577, -0.08296925965782538, 0.06252205010597987, 0.05465063222545767, -0.04166583768727402, 0.043083760766108946, 0.09084258384184589, -0.019144627746114085, 0.02590163282566292, -0.002905581514845361, -0.09843830133999511, 0.022645767217051128, -0.10764959288194545, -0.004548701148624025, 0.0007998007624495482, -0.051398412380988634, -0.05133670365180119, -0.009856412563042979, 0.028815069169914168, -0.03286363491147511, -0.04818838560753645, 0.04799088661823909, -0.005686806460796964, 0.059177131711155274, -0.0047348127001696555, -0.021159308067296993, 0.04891937205556983, 0.009460596889273512, -0.038137570559448754, 0.007782038842194222, 0.029116331199022533, 0.009205963308038951, 0.014489297494793834, 0.008766386075235617, 0.022499756593211618, 0.0461286098104437, -0.056986838548897634, 0.025194592456928743, -0.003925276719145328, -0.091994229029776, -0.031189071181431244, 0.013005139454895091, -0.027132840580050464, -0.03943170945601225, 0.11594242277307082, -0.034844158701085884, 0.02642045793617462, 0.033317430954817075, -0.02963068624257896, -0.020109027346665306, 0.01757952614346278, -0.0018163760260316328, -0.04871513657956013, 0.10600120530895009, -0.01918254237167116, -0.02214084457641954, -0.049075087647392435, -0.08264703820169243, 0.0519020068864273, 0.008769433848159668, -0.00928393012997355, 0.033308692353858686, 0.03116149420517428, 0.028437948155321652, 0.033069786602439775, 0.022931592152405974, -0.05155994599787275, 0.03128935529995334, -0.02213312189976917, -0.02217886492418103, 0.01961273097714992, -0.02035851688189147, -0.038845113108653885, -0.005424932560469658, -0.06382360277212773, 0.00048484264889721773, -0.015838141024502508, -0.003146845573484157, 0.04650623300550717, 0.05807637854937376, 0.05318352849865806, -0.0038910751730408437, 0.04174301820031331, 0.13839555917795585, -0.07066871904950633, -0.00977544835142237, -0.016046289873984886, 0.11328828004659545, -0.02411346728316, 0.011368387106068056, -0.015884288766728132, 0.04683501584595141, 0.004843989047228421, -0.003320689013055762], [0.032490671301545544, -0.03205307208796849, 0.03329371354613922, 0.0031379912114659642, -0.002054224413053316, 0.03657598950805527, 0.014614725524998293, 0.10796802270714226, 0.10306902775109224, -0.020671338907585275, 0.0550296170575185, 0.10094389410069944, -0.03448189093871728, 0.01154753928168381, 0.030089863249284376, 0.03857161987471417, -0.007129073877768642, -0.03614237823383319, 0.064605859258665, -0.08627193383767093, -0.04856577298139006, 0.00018654162432095144, 0.047801002766059864, 0.0029739007906173357, 0.03310544624295101, -0.022326175669718267, -0.03943828251190218, -0.004960937043220952, -0.027211923201626322, -0.009491996506157483, -0.02130013067499488, 0.033996969701695814, 0.0031806130274948555, 0.04733360637046368, -0.01570662484396042, -0.029842965238845703, -0.044317181605452775, 0.06188827855655049, -0.02755865300814339, 0.04326456367958322, 0.05396369838262546, -0.024219932659119914, 0.011359321494457031, -0.03690968138103642, 0.015408397826121809, 0.040043794159600556, -0.04091372485024279, 0.003368416118544678, -0.04410359260137448, 0.06945294625145837, -0.02032553276419484, -0.05121376090417803, -0.021540361170781314, -0.06869390465197334, 0.04437773200843859, 0.006843127294479103, 0.06542216416308105, 0.05312269644021731, -0.025048727012576086, 0.07517407375969247, 0.06243292366089394, 0.06719922345815803, -0.0233872417803914, 0.039494966860976526, -0.002727948582653432, -0.03212398656257313, 0.08487818902676586, 0.001867692072975132, 0.05304964516143106, -0.022317068541735686, 0.0200148848578781, 0.022383564669012933, -0.032715428059385834, -0.0030090380786304298, -0.05992620858497921, -0.0426066374822536, 0.06409355188605391, -0.04729395170320034, -0.00398076763453027, -0.03852352083156736, 0.02583022790948867, -0.02267472614004783, 0.010951627064892203, -0.02862171499295407, -0.04297415256580996, 0.016802687312602586, -0.0701506337658144, -0.020304524665329123, 0.004235812448968836, 0.045400133771076934, -0.016996136651600203, -0.037734141183407614, 0.053612931120791976, 0.0016307034443171701, 0.03485136380721009, 0.0017551106310016336, -8.998383313445407e-05, 0.024888984712090324, 0.009080354130898825, -0.0008613644293152439, 0.015608631804065043, -0.000452268138606872, 0.03337970753545864, -0.030938555401394247, 0.07206441805715348, 0.019090261883378958, 0.05434207650633502, -0.03882535489674997, -0.029081068853738366, -0.004419683306120283, -0.04013707842201017, -0.0999366175598172, -0.03643731053577681, 0.013092383953345462, 0.013683047478225737, -0.020349189966996934, -0.020537680092011564, -0.005474456128541964, 0.08053196741057365, 0.011253433515404022, -0.0135353480308972, 0.08684254815932313, 0.1325429695740181, 0.015441944889989052, 0.0009192787024988042, 0.0675054606349876, -0.005003807867402023, -0.020904581939430244, 0.018158375298230386, 0.01712719968811907, 0.008002518297212182, -0.009561838769751207, -0.004214844819879288, -0.012474396187827362, -0.02622306659839517, -0.08760673180095642, 0.061293233821313894, 0.017862155581289646, 0.04970625126743284, 0.022440138559404098, -0.039656838347803675, 0.030974814416379684, -0.001108165788406131, 0.04948761544420903, -0.0077523189052683215, 0.03372672681990405, 0.03513964573464196, 0.0666621504869929, -0.03501921148968955, 0.018628024670071526, -0.03952351852611974, 0.0018073511605953558, -0.062073559666372596, -0.02148177426611211, -0.012200369143906492, 0.03344622651625654, 0.08399525849178881, 0.03864931422711429, 0.04720671981484523, -0.06593415920424313, -0.03870912189067869, 0.03118762830521563, -0.037811755548485426, 0.026037941654297563, 0.11548443900209893, -0.049232863440503906, 0.09207229450202951, 0.0950445319848464, 0.030392215327601925, 0.04345069417858982, 0.03781808978262806, 0.008127200440317074, 0.08173765821781667, 0.022900808402086335, 0.000734264812228151, -0.005126896929670982, 0.016478561542477246, -0.016397774346947953, -0.02534198529413144, -0.04795614769997307, 0.07942703777591582, -0.03955473643533983, -0.0593300706896711, 0.061473986125125425, -0.059992312393485146, 0.007556807036031236, -0.0011778385550549673, -0.014537133061211113, -0.03142630476159725, -0.0365047550841614, 0.008602533673192093, 0.03244772953622743, -0.01638197494633242, 0.06540560297844356, 0.007656354591446435, 0.0010898467871379494, 0.01657421495319517, 0.03375307312030368, -0.013702700553762383, 0.028522317413768195, -0.02508059624713495, 0.048306103661823155, 0.00768726921540278, 0.011195915965055649, -0.009405452127882196, -0.11774618338115055, 0.0473927246194882, 0.07555813479220588, -0.023683172019403793, 0.04205921186622998, 0.07686312414671193, 0.06098831072192221, 0.0340973804536309, -0.04545393857654826, 0.007327988064893825, -0.07250247434114372, 0.01747141751182371, 0.008722616545264376, -0.02481544970045013, -0.04612232787741956, 0.01586677374666791, -0.08837386354675471, 0.028450052676984625, 0.07939911839151084, 0.004040119179911521, -0.04299787832917403, 0.03344522096134755, 0.014713796489284753, -0.025127282180921022, -0.013219571413652587, 0.051916959925932975, -0.009408577346832304, 0.10453748833887155, -0.08590558428366818, -0.039276365318033704, 0.0319687959216186, -0.029048877765430216, -0.021741552139902143, -0.016505363008829998, -0.04183343431780026, 0.012404892918123413, -0.04021036585384323, -0.03595301396165335, 0.01700575036595739, -0.047460873818093115, -0.022462283620922594, 0.013258730921301651, 0.09242658501496458, 0.01033162342840598, -0.017796398384513707, 0.05460213052683301, 0.01115890278388847, 0.0073086525580713345, 0.08271448625134101, -0.04976090927100876, 0.06574663083155623, 0.021423330195947023, 0.0011296428605603675, 0.005654333332958264, -0.039187933619844004, 0.012553715996884346, 0.03707213182372026, -0.046485131326800065, 0.03037971635626155, -0.04536979953132232, -0.04206823519797015, -0.09877741843143464, -0.03199612111448646, 0.07260827852395432, -0.008077774940742015, -0.006138407085255294, -0.049875447307631174, 0.02306036977886688, 0.000624581958458226, 0.01295957452695624, -0.02640264004143271, -0.06663867992127619, -0.0021848056211782917, 0.030924494772808845, -0.06360321436463628, -0.0704871366218366, -0.04929607246972638, -0.009407525132651966, 0.05429838057483516, 0.02872792482575636, -0.07247776206747121, -0.022007906114261778, 0.018888754773889013, -0.152328938333296, -0.06421092756815815, 0.007078176230571139, -0.05409312548795715, 0.012930165854788317, 0.0068894356690592864, 0.038832786099884234, -0.085473911749782, 0.027228097780872675, -0.01882352701700834, 0.0648998164770605, -0.03193939296283084, -0.11130711252141638, -0.05234126981724687, 0.006547407498302777, -0.04733863795392875, -0.03551167819744857, -0.005229343073289755, 0.06568086601694006, 0.073026650308817, 0.042935187313086494, 0.047915479859960516, 0.009745235416348981, -0.06828954207527457, -0.031868634653950706, 0.027963322202910996, 0.03100917658915043, 0.022945108047423602, 0.07613990163193965, 0.06596930791901655, 0.02795690988590611, -0.12046667409822895, 0.03774445954798512, 0.054692619041882024, -0.039840797762347675, 0.07385429817732012, 0.02400721208882666, -0.016225595922303628, 0.031590669186636285, -0.008969639297836646, 0.08833935473055973, -0.02254457343543521, 0.0033407747853077107, -0.01528672282544362, 0.030756127172734394, -0.007936457339057483, 0.015095285548494016, 0.012372814192958504, 0.021390975324074156, 0.005437536265917474, -0.0888110513969599, -0.011834188134618598, 0.016103181038894108, 0.01849611605328828, 0.01653411464227898, -0.058756352098129384, -0.0020140526848850667, -0.03680531316110723, 0.04066293793237199, -0.023823157451279917, -0.0039014859146743845, -0.021781660068658552, 0.004195238879729001, 0.028837503648395785, -0.005544107946130196, -0.022281975056303856, 0.04462966160234234, 0.018433935432495458, -0.036733987323130726, -0.0009851724252549314, -0.007298592723946285, -0.035908895240021305, -0.022097263380038167, 0.0200649569216418, 0.007769269075872036, -0.03656656623970357, -0.010175066337362057, 0.016353156656781515, -0.07460276621458027, 0.004149915110997206, -0.05741425243499337, -0.005744993249412212, -0.0026455863986587285, 0.028833671874765307, 0.04066323502814055, 0.015215670277485, -0.042882407107124716, -0.006682567980629784, 0.008490460007880734, 0.009484302487535646, -0.06165004203044155, 0.1022051037274632, 0.054564803109756775, 0.03055764053689154, 0.05328332621908866, 0.041560098592879326, 0.001232458469429793, 0.024831948037905817, 0.02368345007057181, 0.05870953666105958, -0.0025835290916544646, -0.021738253615087036, 0.043668914829521656, 0.016741853145068587, 0.03684255678194105, -0.04794690725978665, 0.029588586509311343, 0.02621289678170195, 0.06134112718277478, -0.032629140783217964, 0.04332916296464578, -0.07267000588325406, -0.0526327550464911, 0.005929536857078055, 0.04769025079602661, 0.0009395917924732302, -0.04966447122274822, 0.004796971126448414, 0.11909937081072626, 0.03625985294786028, 0.04310342350541716, 0.026257952497681016, 0.00572541111501261, -0.02884410260248605, -0.04546468734909817, -0.01173301464643152, 0.008621819187938142, -0.005647242075943806, 0.1065146302073174, -0.02424481823865743, -0.041663895474792045, -0.02481399469296818, 0.04665589664208365, 0.0667786272639512, -0.012180994119537863, -0.0848327486098557, 0.07951461246708082, -0.007614990671283812, 0.007138721872406818, 0.06892019259569777, -0.03264898144807001, 0.10400851313185991, -0.028702681207728523, -0.021733458184668774, 0.03592622201760088, -0.04560923586726586, 0.010434690902117669, -0.047254087545330954, 0.04124793092743877, -0.0592518430884556, -0.02705876652401044, -0.04644405212341565, -0.04283677243528895, 0.051630133005983056, -0.018268576879307767, -0.01834794715655621, 0.03181036388965062, 0.011860762017994788, 0.04308050142419626, 0.00150779399643714, 0.08943217199926833, -0.006544398927531033, -0.03570902596617859, 0.008455022767408994, 0.0623375749637848, -0.04178682075349628, 0.004561501780799257, 0.005233939011517267, 0.0012114485851327766, 0.016982361692023037, -0.05904347230492776, -0.024917578275354745, 0.0018479463930683158, -0.0174381732571052, 0.014091522736413077, -0.015282758691839324, 0.05277697218860924, 0.03779133592777668, 0.028009429180840373, -0.0020150503838963327, 0.013166197016153673, 0.04676456132389672, -0.039584522190598624, 0.03315744181137017, 0.00853482059593976, -0.010595554929575772, -0.052455278413974016, -0.06847500601326195, -0.033045520502863204, 0.02333483103968027, -0.06216789899965263, -0.0029969768950451766, 0.04787215720263142, 0.04390645813217061, 0.015695992243473858, -0.016239049028131513, -0.06022688854736855, 0.04988085216526701, -0.06749910735624441, -0.06787338708191581, -0.037303161872981425, -0.0041215153265433705, 0.06148786963892572, 0.05067466539643459, 0.016741875998589246, -0.0711386143174203, -0.02820122925743044, 0.022246830150450543, 0.0938249233835221, -0.02735256567222139, 0.04587336162336125, -0.026137986749902108, -0.012752806346564609, 0.03246128548289828, -0.014074215003434053, -0.0038711945252710095, -0.02468314114705535, 0.07097159317060467, -0.01298948311988858, 0.05058591755787577, 0.021419947874889503, 0.09350274968495303, 0.07348196861874494, 0.05680372063059024], [0.04567074005717873, 0.014890568475763411, 0.08839476943497329, -0.052822489665339, -0.015375184814244778, -0.023004218698451925, -0.003123381743918315, 0.09398500637166204, 0.0774521071460224, 0.03310739444505378, 0.08662666824156437, 0.08810626891284833, -0.017619543776982393, -0.002783080384961527, 0.01689074018669086, 0.04992272144379212, 0.04724298520694715, -0.02786826235615351, 0.012849287957262237, -0.005496629321646894, 0.06565817416141655, 0.012852942752635368, -0.05329029628215954, -0.02330931411289828, 0.0016739841451949731, 0.00218842198697086, -0.01955170986726425, 0.006253939147321063, -0.056138616921813524, -0.017837529939188187, -0.04644203311556862, -0.011435114055683027, -0.0383298615299654, 0.015276908031823256, -0.07995695612094461, 0.009711359390687487, 0.010849672645335274, 0.08821606018831701, 0.04638810106382542, 0.0016462926208689846, 0.05729228822706272, -0.03846095237040254, 0.001270898911785747, -0.08517423494247854, 0.028170673752158114, 0.09408929657785293, -0.02547898797038191, -0.02429495651547141, 0.003148074084375176, 0.08422636115574117, 0.06664034873306258, -0.0927531767370266, -0.04863270631626599, 0.04914480193397805, 0.011588258610945496, -0.04293280394556261, 0.04385174498427481, 0.006311831609397275, -0.04492535955191639, 0.05015224906507096, 0.013740254440735233, 0.016282012714135447, 0.011915651333317548, -0.00431306303068268, -0.021800235979866557, 0.03126920675266951, 0.08139247632860379, -0.03032030466147891, -0.05521008676430139, -0.061922574192893744, 0.029436829339993045, 0.022006121587396232, 0.015936930278791627, -0.0012531426826168266, 0.08999962909416588, -0.0386977140775552, -0.006434767474177082, -0.018872707133552387, -0.042903152103514204, 0.0061412512712399935, 0.06526930968646759, -0.02824849051188332, 0.017354381451381764, -0.074411676942589, -0.07295213180361329, 0.012752674079769464, -0.09047688460645184, 0.07082042790829193, 0.04267173686042435, 0.005132016742065564, -0.027705534974163806, 0.0336697547349905, 0.005745006644443746, 0.017825734999471946, -0.020145715687428824, 0.0657492833741614, 0.013113474112726314, 0.020709483603916043, 0.039525678935916846, -0.05211070882831268, 0.016755728486091984, -0.005003488572953752, 0.09662376503559253, -0.05505994712318855, 0.015357869030165092, 0.021244599219047155, -0.05545979575934253, -0.03711859079345446, -0.0682272526144948, 0.02205538671892859, -0.020522824772832817, -0.018953574649671203, -0.0036147193643481772, 0.018763893825955304, 0.005782687171261664, -0.003396184218799016, -0.015953492811881964, -0.12137508917970974, -0.0025207373573657736, -0.0054957093307309085, -0.017102450455808802, 0.09830356867388747, 0.0830328664234848, -0.022563579453829495, -0.0689067173661166, 0.042441562054524595, 0.00507344383726986, 0.013604969484407526, 0.02463171363976114, 0.013295889390204877, -0.026758394663330146, 0.04180148567802592, -0.03367362705630566, 0.036514372040424785, -0.001031042179013675, -0.024205760092828387, 0.020044796234471886, 0.020842936668219538, 0.019899922159344236, -0.013258675375634538, -0.012853571061038177, 0.06751575222413755, 0.07150396273208529, 0.015993445675813327, 0.055122130778848456, -0.0022126556802710214, 0.018256337489264966, 0.02335235908112959, 0.0034687999062842393, -0.03488379757896103, -0.01828355699577976, 0.010053549270322816, -0.031068248736934107, -0.016232886008202566, 0.018167973417953846, 0.005300752154619464, 0.1200247959956853, 0.04661465163584803, 0.022171495235391473, -0.005582433418235271, 0.01036312643826903, 0.08670876001525776, 0.01888733889919032, -0.0006243477677584175, 0.11251120546596953, -0.006892059588076519, 0.009086893646565881, 0.029637143766577646, -0.009113976525216259, 0.017210605792374618, -0.03970640883677843, 0.007689345198804043, 0.12779258626261736, 0.01831975439117474, -0.023798459844858545, 0.03141428037638861, 0.07400823643178892, -0.023536060638042228, -0.019107324142780727, 0.042545499904644096, 0.060928498615163036, 0.04167396154394406, -0.05217703806101659, -0.012258658283536788, -0.0010943186328720342, -0.08348379590357984, 0.0029696765200345992, 0.04202518504224638, -0.0040244923968904426, -0.004637899823235869, -0.03129091620123121, -0.010196318197697422, 0.05887329194203424, -0.02421640987531261, -0.023365680297910158, -0.010187463453668718, 0.020506179543929807, 0.04629911317844913, -0.01987005638682391, 0.002918604889485727, -0.08206740359693893, 0.006919273251952374, 0.0009269301733104212, 0.013656818860085912, 0.015591896382294372, -0.07572359207859299, -0.04951106528377649, 0.07071490086038107, 0.01955508241823326, 0.047522561772243684, 0.045670553092732685, -0.01170015053982959, 0.0343066203566754, -0.045404646504818, 0.03597639982428634, -0.055501478044399796, 0.03414679092359936, 0.07970418738083458, -0.02482005694859381, -0.019401904604872216, 0.01984655279867422, -0.0867923906501609, -0.02591253155472999, 0.058078315521988846, 0.027227641265932228, -0.05550297375996814, -0.021983200465405372, -0.011528712232615826, -0.0662549790550666, -0.06979791935288221, -0.06036131320433035, 0.024638536044306655, 0.021159341633916442, -0.03362407069169389, -0.039638763662011994, -0.06384832236901816, -0.032840571012259456, 0.005968728929786192, 0.009025938742818184, 0.014595970935188872, -0.033619216807037, -0.02993247927739354, -0.022731865432618868, 0.05106969079274469, -0.05347660275717137, 0.02385712892847986, -0.05426904437078483, 0.04268905264450404, 0.08449404390589327, -0.004132129086891997, 0.04509244464368695, -0.03036488489544984, -0.024855990076935248, 0.06942752840339037, -0.04920035913821378, 0.0384443341075254, 0.03141122422678983, -0.02342120873838496, -0.01951961670100693, -0.12279465269099316, 0.015383457990982185, 0.004421685778363606, -0.056453152243049996, 0.00033530854308744056, -0.05255306670765066, 0.044270218155630786, -0.014174060494401798, -0.01305840409469133, 0.012949040680166465, -0.034051802198599115, -0.04520674104321126, 0.01971853428745138, 0.0675997208332316, 0.024070676482827187, 0.039976381901394555, -0.01248366100567437, -0.03291186199372374, 0.0004267697186491356, 0.04580953958554504, -0.04894638591561481, -0.06860741605176253, 0.01421901016292717, -0.010714182747210943, 0.030130352379769233, 0.028752546658415524, -0.01955854665369023, -0.005765575430111075, 0.004472167976530302, -0.028577145244266165, 0.013890934301233037, 0.01480011543631477, -0.06221931553252508, 0.05461839822462672, -0.06891874061818522, -0.009457839197323157, -0.031054956283914466, -0.005329910068960662, -0.0020985329868967, 0.1309061195644536, -0.06210633867053341, -0.06749617848482489, -0.1265648338910937, -0.061678794128074234, -0.0791591356840373, -0.02903353085026255, -0.0341219857752676, 0.08099296926211084, 0.008407438782486907, 0.03605698869147115, -0.04490669546654313, -0.002571783145473186, 0.02939151922558852, -0.042003612221549094, -0.030223874152962064, 0.024267168924678253, -0.04480371760694466, 0.005762048273927069, 0.018132453768675772, -0.012242562262694028, -0.059114627087174715, 0.036563015155627036, -0.07552964522958419, -0.04220055769263481, 0.032319824693447796, 0.007843447946852482, -0.012411754299952688, 0.025125425618768998, 0.016133987209450938, 0.10566112299149981, 0.02063922811784523, -0.0044542472546035645, -0.033937951637369214, 0.08254930445661501, -0.05185384484774027, 0.017092931448676126, 0.030516016886314758, 0.024080844472315836, -0.04463748823706176, 0.014707196803233936, -0.02469553323432393, 0.08111922059977156, 0.0017633007913700083, 0.007955177180713816, -0.12525559378485618, -0.02309436612294069, 0.007714255514636699, 0.03533577334085988, -0.030749197505231668, 0.0054435920925288645, -0.04342462470728935, -0.06378379806231259, 0.05090479174680479, 0.003762341277512142, 0.0005356189809473831, 0.018853737433219248, -0.011426731217107076, 0.03485692503531245, 0.041769018582876516, -0.04518044017931116, 0.027961785927081397, 0.0076965496220494055, -0.022536748258087252, 0.05706622663897591, -0.052791417612594684, -0.023232182290230212, 0.009783536655535415, -0.06966903613109643, 0.0034611977341572706, -0.05277662584853658, -0.023744401951661276, 0.012826607731769163, -0.00916538365807035, 0.0030076453586124607, -0.01158382989062985, 0.033803596110066544, 0.015936595900070818, -0.02086115851076851, -0.0005490997467143611, -0.049419093158203746, 0.052998444781886256, 0.0010300180318227599, 0.017616800433283723, 0.046405611003291374, -0.029766767655207377, 0.12329183429866315, 0.06352701677755285, 0.06837341566565912, 0.013017523599469984, -0.021590603892475788, -0.0037230711034690936, 0.017316513960117803, 0.04253415260095733, -0.050256445789038824, 0.015211560362461076, -0.002059698314171478, 0.03635267296288831, 0.04289053200340629, 0.045649551951783884, 0.03891744763823747, -0.04429786732082447, 0.027571734946994095, 0.011279938059804899, -0.02183653404842479, 0.0012293368502604948, 0.006158581437200142, -0.009482419628772651, 0.010075079844246233, 0.010170284297453449, 0.017805350481648073, -0.03359259235082644, -0.016266917132852526, -0.01012962402477672, -0.020078609833179814, -0.04272644193824254, -0.012879832374767, -0.07146582917603272, 0.01476625509649533, -0.05550358139441778, -0.0383517938976743, 0.0006670352114300445, 0.0011473470980316559, 0.04710099290111765, -0.024267044880959245, 0.014000363333087525, 0.09207591960405616, -0.016660243586215703, 0.042970861996742736, -0.0004016009784018766, -0.06302767069687289, 0.06305019991262109, -0.07022355110523956, -0.025915526581336796, 0.03677138703074208, -0.05524362530954543, -0.025437544784087374, 0.04067217008734396, 0.018430084987160866, -0.034892832995363075, -0.05869063846466047, -0.013773233890376201, 0.03931933131047723, -0.00713631155834878, -0.019931742069872724, 0.038742682622298685, 0.03864000318671986, 0.03686163333065903, -0.015729726931464356, 0.030108281586460856, 0.05690469295306479, 0.02085470104643979, -0.03774676975933859, 0.010689229285736892, 0.06878150152384935, -0.055070215785840454, 0.006910027051114767, 0.04348198683752341, 0.029489405899502434, -0.1101655782896737, -0.052747160970934216, 0.03344809040685582, -0.06164440705188277, -0.017391700633453, 0.0605267551662578, -0.0358466177349715, 0.1410774887950146, -0.03381353758493788, -0.03043509723587926, -0.055587082592396725, 0.026874452843211404, 0.013812609681353914, -0.06705992571374424, 0.050385562716382164, -0.043578755320231186, -0.04234265067162756, -0.03751069119150801, -0.0680977653537295, 0.07659503336159988, 0.08406626925334665, -0.019043855106554267, 0.007243769823145817, -0.005805013242948291, 0.03819385568187939, 0.039180118303047566, 0.031783668189718034, 0.034378342794553624, 0.031044486274936053, -0.043720132800670816, -0.04914382756157656, -0.03921150675716211, -0.05048526150723465, -0.056160934004824865, -0.02716663153126526, -0.02660091666771011, -0.05075891273777966, -0.04614440369481858, 0.012452769625303393, 0.040669642471852264, 0.03145229168645722, 0.013394779200281214, -0.0024512232122895486, 0.014084110820769427, 0.1065925510979256, 0.005340539177491718, 0.01898162830525296, 0.05558473115494072, 0.08225788441275568, 0.04848985828854883, 0.012535508583617698, -0.007054253042753968, -0.026630009414155453, -0.04446995371152668, 0.027403824694831866]]','2025-05-27 14:19:03','2025-05-27 14:19:03'),(97,125,'[[0.024290800348536198, 0.022729503296661003, -0.020297523385526598, -0.011046054495965298, 0.012491250373122941, 0.0060857912514936125, 0.012778268624441454, 0.032043379038645535, -0.0005562035952559092, -0.01545435856441452, 0.07457468002757545, 0.04754365890020593, -0.08151915958332574, -0.029438555181337832, -0.0081004135021981, 0.07050898522994768, -0.012617085776630328, -0.0062793110700082875, 0.02343514540725907, -0.014187663431413318, 0.021960711469236543, 0.045609302419964165, -0.015622185574800664, -0.021387661290765053, -0.03851406508827899, -0.03327565166635477, 0.01798385867635053, 0.025003176098374096, -0.014061293248769764, -0.09844120284012794, 0.038133090096356084, 0.011232795416694577, -0.02437283172248934, 0.02894299595629374, 0.03599185940537734, 0.024992280753794453, -0.011659192301122579, 4.721038537488802e-05, 0.007208364967937438, 0.04227224731664231, 0.054170071801950014, 0.04305493923990175, -0.00791009715636875, -0.017715079098683768, 0.005282649228407469, 0.014673023357095851, 0.004089670382090451, 0.03687092810089628, 0.042597159975932525, 0.006163800337235819, 0.005370497625999338, 0.024453647878483253, 0.02043257072380367, -0.04843276979070985, 0.07818868829785147, 0.012447862514102676, 0.09577935113454873, 0.015359641272159281, 0.10385583951296139, 0.043641315198871336, -0.1148567582336637, 0.03191648656198183, -0.04850546645958578, 0.015568985455015444, 0.004539509632484476, -0.13865348924766746, 0.0430726597812387, -0.051871041729601414, 0.04709919293161878, -0.005144493096241552, -0.08123762021708711, 0.01927104708687133, -0.04907030559342181, -0.0328560747765524, 0.013719513197737265, 0.000543222195874684, -2.56703089090365e-05, -0.03052434202364351, 0.010750501627421154, -0.04660343394471838, -0.0467755704009839, -0.0728464070340561, -0.008761404155992102, -0.023913893423582973, -0.07794606087654013, 0.001242973542617535, -0.022713722110012415, -0.01901717473773179, 0.041312936780466346, 0.02850057962758645, -0.04726574854102361, -0.04153746910696017, 0.04245885818407971, -0.011024101500297761, -0.01800257594611636, 0.006444134369565418, 0.019072402648443836, 0.005372076993175799, 0.07479568322794111, 0.018461412283241902, -0.05031031483135777, -0.012666137716618085, -0.033508228569270465, -0.024575017772161017, 0.07175191182332685, 0.0011408061475375645, 0.04181216662962016, 0.013402280965651677, -0.022912374871850587, 0.005433611968330338, -0.03183102802368135, 0.0136516076921338, 0.005718966057726092, -0.01424995895821871, -0.019933886058049376, -0.022922822833106198, -0.026586983814432363, 0.009705274765357338, 0.06234699877703382, -0.04044365641590666, 0.07750671796722629, 0.013021104131019796, 0.007425710029309399, -0.02719502561140104, 0.016104376361866925, 0.0040218236605749115, -0.03125220972160887, -0.013693271564717046, 0.04738586784224676, 0.008665618345890866, 0.041542051144539315, 0.04864247396107791, 0.013576221521182014, -0.008587862083748054, -0.017516719737072053, -0.05975540081929606, 0.008945397310770768, 0.04717433668323452, -0.001803714307066888, 0.03868361712552849, -0.05043300606648092, 0.012397686913673166, -0.010973353665384029, 0.018008346150570016, 0.007148043129889455, -0.010909255079740162, -0.03951981193263662, 0.07312417589525687, 0.004013929425758445, 0.06069845989612003, -0.08193843474949099, 0.015471268613636534, -0.03835952016048487, -0.01929695370261169, 0.005492645758575648, 0.01818210567191807, -0.01751817425308832, 0.007297607536818146, 0.06413939532642908, 0.043865423031420506, -0.08100673712824472, -0.05341649100754258, -0.05634493323377982, -0.008246134054032302, 0.0783519936153859, 0.021893874481479076, 0.02701474053608015, 0.08597553030802352, -0.013118603523294702, 0.08694857863352622, -0.0031723498921537485, 0.018726773019972005, 0.028817699493627863, 0.04335599700418414, -0.08114228387116257, -0.01404022461548694, 0.019056638108616606, 0.02023978388564197, -0.07579286944441474, -0.051369264916779636, 0.04811646769976771, 0.017395730639432883, -0.04638692122441438, 0.001466463752083612, -0.006414647646806477, -0.013486116438869628, 0.0067565743979522055, 0.02679687526154071, -0.10641606237414226, -0.028504535328511944, 0.015482635271345909, 0.008565438815377118, -0.027934198581922018, -0.02432912965471592, 0.00934191731256422, 0.0491234422472006, 0.01970825504134584, 0.00021231668089512679, 0.017914418541903007, 0.051491777198573174, -0.0025707613395276286, -0.020998013304913975, -0.02047788753324894, -0.01293672347440233, -0.014936025447324613, -0.02961750434924464, 0.04930445978266129, -0.019848446247422928, 0.02571709167918772, 0.04792218680938902, 0.005797020402013869, 0.05638375778289498, 0.07620784140725861, -0.029335544650766675, -0.001684951331624645, -0.008820103969383892, -0.02168577256766685, 0.08030414138595539, -0.028401784904524524, 0.03131333268793477, 0.020510873209772334, -0.07232997269502749, 0.0770534583152561, 0.02594590848132889, -0.005840767728332861, -0.013318235326314065, -0.009886201783726891, -0.032114806387392815, -0.0431883010875162, 0.03356270529216867, 0.03382927500429999, -0.0723187277671993, 0.009098301486234662, -0.012942869272762905, -0.09236679437295191, 0.014444556138203229, 0.01181555277287119, 0.07300778132031285, 0.055114346096733206, 0.038274600563025896, -0.023514559068553466, -0.01704888475257549, -0.008705362631886121, 0.11326768596035056, -0.01734874810742535, 0.029327196269855, 0.04428492292967409, -0.004079903900084235, -0.0034068926806293375, -0.005320451558648532, 0.05234001598093475, 0.02273570423761733, -0.021773126762749617, 0.04755397576774334, -0.06541135397625882, 0.112564940396669, 0.05892425832247046, 0.061795244044786174, -0.09163981936078193, -0.006741809707832868, -0.02536741479227292, 0.014535539340342315, -0.02566544491592059, -0.0872386411723008, -0.04644039913803103, 0.10786166401757054, -0.0417332898283146, 0.036785833711813036, 0.06476343888042935, -0.00011195611619909644, 0.052935193946698045, -0.05356386115533086, 0.061471854569650326, 0.014223100352381862, -0.01480487762695095, 0.0221335304451778, -0.054189498642476276, -0.011211289804351071, 0.011748323544385446, -0.039983221983930624, -0.09608783338115735, -0.00978474460967382, 0.01569340691913363, 0.003154450657593778, 0.00011202224829801197, -0.03344152475608387, -0.004638776709102469, -0.004356782676555451, -0.07488198867327824, -0.04723700364224149, -0.030126597440053818, -0.007288572994738569, 0.07436183376967583, 0.05084427827327769, 0.009041768880898582, -0.07151228915327085, 0.010052453588641916, 0.024986953770959486, 0.06646449848273163, 0.0025815081632479557, 0.0158078715032263, 0.02119703021596938, 0.07754248366291668, 0.004824671243008264, -0.0063321241511969046, 0.07510741992812546, 0.07465486776606305, -0.01862706480258799, 0.07889862528836024, 0.04544679614985498, -0.006345357333751188, 0.04298669143403409, 0.03229973384502027, 0.024464795006235954, -0.03285098293006913, -0.006423838773049464, -0.0026675722296753785, 0.02261492114439248, 0.037769053245166245, 0.03392620112166434, 0.017439252713450357, -0.044486187161613, 0.0835960586331616, 0.03551955162806681, 0.03466913211210717, 0.061678117009702355, 0.07128330380206342, -0.015785610541363616, 0.038155197075121196, -0.005646987283021281, 0.01653399856793329, 0.00409773732767852, 0.07812930908606296, 0.002902661502083402, 0.038160915258258106, -0.007304372388848019, 0.03550981323757164, 0.006874518167708964, -0.10919170342712277, -0.07740493930143572, -0.037265911392993005, 0.04742486302128084, -0.03564132312630987, -0.01064384856425132, 0.014617920297544, 0.02953865876072913, 0.048999997743410934, 0.02367403561717527, -0.012398114528896834, 0.03826719688922636, 0.020950546974660686, -0.0765809549377946, 0.045581964177586906, 0.055789145809057895, 0.05260564514765927, 0.08138431200690499, 0.01685038597383489, 0.03134755647179676, -0.07884333287121542, -0.030937104120951936, 0.02525757282238645, 0.04764307787906883, 0.07509004064662639, 0.056583648652071744, -0.022102823302327955, 0.009578073282072155, -0.0009956645929587646, 0.005712091960931049, 0.004687686630895506, -0.058533823774310156, -0.011764260794984277, 0.03351777344046734, 0.13710947991977387, 0.027323586931906004, 0.01045848516798952, -0.02448127119767629, -0.008216638487649513, -0.0034541228341045897, -0.0330803178645251, 0.13298032743912458, 0.11831124833826452, 0.029184066899808004, 0.0033253170134109077, 0.013898551842308877, 0.04670916206887644, 0.008301368727515525, -0.008716659581031056, 0.031735317124276234, -0.011711799377896875, 0.00950917833102415, 0.07416948807228015, 0.029150092818266405, 0.00843333900490697, -0.025678491862160917, -0.0035714995715087983, 0.079459872870488, 0.030505372970704624, -0.01309519184990556, 0.008368558940013709, -0.027520845522455338, -0.041227313854804944, 0.001465708532617727, -0.0041028450406633945, -0.02471664476658034, -0.05539830757547962, 0.015458278890844628, 0.07242875493297339, 0.020209191189688974, -0.04577007742065199, 0.006120189826979873, -0.036795010272087335, 0.024930387871980687, -0.04818613880886159, 0.031066576854926323, 0.01832678319635148, -0.04056187381778951, -0.020664113442942417, -0.0214729491991466, -0.03592124358917132, 0.013500379643495517, 0.05333150898450351, 0.030867193713801012, 0.010824479061115413, -0.03573101619979361, 0.002032919058177702, -0.025431465518305378, 0.04792195375388999, -0.04747536947728487, -0.043134523531115083, 0.08475165600169003, 0.08643449149630926, -0.023646624544954562, 0.03515855282177503, -0.020604438750074776, -0.04844352363730794, 0.048729969654142224, -0.015206354219804125, -0.026346851335472234, -0.026592718644390632, -0.09268850251913047, -0.005220612767759481, 0.0263485201793135, -0.000875639190212346, 0.024683750647574422, 0.0009219623520301017, 0.06934784863161195, -0.0521952926777426, 0.0020214650046561896, -0.04898577719626478, -0.016826970138740408, 0.0027327611821182777, 0.04053796482061226, -0.0005777778757375223, 0.04364111543701503, -0.0068179876432255555, 0.011417089254684045, -0.04944116764136895, -0.016882676645566533, -0.03359157712296366, 0.011852191386256608, -0.05929822084089577, -0.010253723022712498, -0.02265523350316662, -0.03868032521660469, -0.006210145087900025, 0.10067793634524483, 0.00998901255244174, -0.012340900444311359, -0.009214960329467751, 0.044223321367234114, -0.0273282272333599, -0.03137579156167475, -0.025301120907062297, 0.012360560340336656, -0.017884633216785933, -0.0906474107820384, 0.0032600396247295374, 0.01949933743328701, -0.13952481717125434, 0.00739861680733402, 0.12946523458136533, 0.023962304460948398, -0.02847009305511962, -0.08204233588500487, -0.051780412272416206, 0.0705944416873955, -0.14523198011242355, -0.011912492415777892, 0.052672357284256545, -0.06158049588754626, -0.02455756566081849, -0.01356809371065335, -0.002895240921355924, 0.004695813921211002, -0.016450809199469344, 0.04128155336049878, 0.07079597643018148, -0.021898523106343652, 0.009079577973910824, -0.03593834403641263, -0.052118417656705496, 0.040612305363097415, -0.0019780087376044006, 0.00034562624708624234, -0.10773481523881291, 0.0485884258938297, -0.025813430996099153, 0.010994887369238579, 0.03786708221444564, 0.09639263668024557, 0.10546612816009691, -0.06352795757790311], [0.009226374510345798, 0.007543133898459349, 0.041672978338803304, -0.049231143112340704, 0.005628854636884246, -0.008624488445990418, 0.01064281497209491, 0.008925161849600176, -0.0013482264103974668, -0.03340713880286594, 0.07173992343276857, 0.009580024422049329, -0.0005186044345604098, 0.009913307918699127, -0.03844123008692547, 0.035086045594314955, -0.015384540800439918, -0.018035255581439123, 0.01676868568875598, -0.005368090213998472, -0.008327922431287747, -0.014704585548824806, 0.0047765161012819765, -0.039595070957525395, 0.0073263395424976955, -0.05528610066863503, -0.008801259758462176, 0.05741119163763307, -0.027095806546171924, -0.058567620942485146, 0.021940501551313503, -0.01264939585664643, -0.03931967600857657, 0.0006438470455314355, 0.04203194854446925, -0.011736083996659189, -0.011100784882565133, 0.010759021214536911, -0.024943308891994552, 0.030468497979348197, -0.007020695938563468, -0.017575273197217887, -0.06605190014773624, -0.026120350806781233, 0.06655185193206735, -0.0031100079889541323, 0.054433511985481776, -0.004428186483540857, 0.0112100118389346, -0.03515123980570577, 0.021160219627072877, -0.013512975221362447, 0.03113197285529074, 0.005550640894832074, 0.047925470018968006, 0.023996246875975326, 0.06935507653642889, -0.04242231424411843, 0.04830440685533984, 0.08487030503324416, -0.06437509165944624, 0.043622963763445606, -0.046215540413860015, 0.01888698145317499, 0.0018752275867637092, -0.20221791597765906, -0.004280144306732397, 0.015722928888197783, 0.06250551935543641, 0.026845534768415585, -0.037120640745907776, -0.022295706556370087, -0.04529876488552577, -0.04775035543993774, 0.00857635508811057, 0.005013342024672686, 0.0012053284925649208, 0.05934213196837129, -0.07588627889109403, 0.0011922275086660235, -0.033055423440845624, -0.0840108093414146, 0.0048765389829765, 0.010185417634122873, -0.006215239458418979, -0.019804227913918983, 0.07259611695105832, -0.02575642734080556, 0.02028585963697686, 0.03716478868298666, -0.023085924363922386, -0.028717873941499477, -0.004131994560830343, -0.036483075057841624, 0.024745535349249184, 0.03660437459804853, 0.003657630386429143, -0.01550570820853186, 0.0007269056317990071, 0.01502749610978266, -0.0039058004730235093, 0.02298575241009816, -0.040737139647215925, 0.006591281246271889, -0.018887128266636063, 0.05174330212478538, -0.04913626999512689, 0.083210328143599, -0.012113263588835412, -0.04340833151803183, -0.024651859326410265, 0.06700094301614562, -0.015191063245432401, -0.055008989131525965, -0.014169888664929353, -0.021847613803827114, -0.039200865521202, -0.010769063255274285, 0.040822499252152235, -0.05166994056762166, 0.020511012760877974, 0.006750488022127771, 0.01035329882685952, -0.037171722795686556, 0.02499917931927293, -0.07620466985611948, -0.027074091705944953, 0.049457832130911504, -0.0014371050210622554, -0.01831839889312964, 0.035243766166211055, 0.03056377313957849, -0.06230575366695772, -0.0069178898124473, -0.014324549870163562, -0.08410362255283613, 0.02995631098703814, 0.07586087338632257, -0.01693132451159802, 0.012622198098315551, -0.012188647783758985, -0.06461516103099234, -0.012010048079029714, -0.006910060702302019, -0.039469750987153725, -0.06397113780930762, 0.06471836863545782, 0.07172382364276048, -0.003365986857676093, 0.06521675742109569, -0.07072675696189988, 0.02243502801359083, -0.03426837592821069, 0.011487916168733453, 0.053150511407835964, 0.010240451224673137, 0.0795769615049479, 0.008562097807038937, 0.05455367315669821, -0.0072616840235755886, -0.07266184420824626, -0.00035718021077517186, -0.06499038913347062, -0.0332939682110652, 0.02392182600322325, 0.00803347165975884, 0.018493789029732997, 0.0280480499480327, -0.05411321018679375, 0.03764540626382882, -0.02963990313307149, 0.005718334618072274, -0.022238512549273424, 0.057093803521480184, -0.1039116043740213, -0.0055679400378837035, 0.04824954831160855, -0.04477488476570843, -0.014985213832993718, -0.027679830494319175, 0.04492955387628285, 0.01317326242445198, -0.0015870465970233437, 0.034323026674427846, 0.004731569160174565, 0.08624033211327661, 0.024658271686656193, 0.0723739949604612, -0.09521284808007863, -0.041661160984521266, -0.006036117436568584, 0.0029401998695409055, 0.008693807550970215, -0.10862304258534702, -0.027270975333249355, 0.06553400098245613, 0.02684101065514591, -0.04702134303497234, 0.012111985182389763, 0.01200525744286148, 0.015415054284322407, -0.00993885346092578, 0.06580955403820919, 0.034082446843770944, -0.022390218286602804, -0.042223357159009954, 0.0862907275277913, 0.010449789150813772, -0.0067498928629432684, 0.02399937739069912, -0.029018642773858933, 0.02133504961385553, -0.0066168753498741266, -0.013578904629392938, -0.031411507943841815, -0.02517379247386692, -0.029511669480164687, 0.032102694425228985, 0.026375293511268317, 0.0033688929172045958, 0.012287836087394026, -0.05375259115302653, 0.030590113733163567, -0.04957629930065402, -0.0017235555882970158, 0.055391440456289014, -0.042639462646388133, -0.056418163456286294, -0.08518155860539284, 0.08042529033906141, 0.04436096566956592, -0.008813619757883024, 0.03681786395713457, 0.036298033630174205, -0.10524946801273567, -0.03118456143704698, -0.021596587630747725, 0.020828574794515515, 0.0668841111224926, 0.030971374739557612, 0.04664519791302952, -0.012363177367613595, 0.007271207699861944, 0.0505879705328884, -0.02449518451809073, 0.019996921710911233, 0.009884714303153743, -0.026508121296172377, 0.005702437543573889, 0.01657080711791923, 0.022366364487181437, -0.002973474293492299, -0.004465541474709335, 0.057359070600283626, 0.0424041861696789, 0.07708742983485749, 0.05032837722968826, 0.041838574888218794, -0.045141123367031785, -0.01841820042529824, -0.00660629969867247, 0.09203874105168657, 0.005871628199449874, -0.06096194069506696, -0.030068002150884992, 0.0008858070638892157, 0.012794924135267598, -0.01975347562976046, 0.05322154201897158, 0.006021858461495475, -0.017582441082121186, -0.049157094919912894, 0.08745734794551044, 0.02329884002117593, -0.036604623051598034, 0.009076213702360628, -0.059245067942584544, 0.023045092152395117, 0.041290305664514325, 0.012758311116744695, -0.11344473996460697, -0.01329175443954945, -0.001858439608656834, 0.01491909695546678, 0.08328007583095169, -0.05140114544841521, -0.03343784992025372, 0.07188846251667605, -0.08577529934599447, -0.05037185208351484, -0.048380135497229776, -0.011508250962426341, 0.11122172215840478, 0.02470461279097664, -0.030261687503406645, -0.10648870010963277, 0.035183827876726644, 0.002991639353630678, -0.02355495271601433, 0.052779389564930466, -0.02548136215747699, 0.04061239789601402, 0.08024250080402, -0.07902183496327703, -0.007256148026758832, 0.06068015823122715, 0.03986063166325098, -0.03439343841035832, -0.006134167935880311, 0.034998244368587575, 0.013144308551259809, 0.03734372718801071, 0.030156512598562783, -0.010202462676953416, 0.030689278320777974, 0.04562845822838518, -0.01256227449017725, 0.02790289209106716, -0.00221112478652097, 0.006976358837986666, -0.0680540788871242, 0.020778683063105742, 0.06561514139438807, 0.0038692642492340907, 0.03712085757809644, -0.008871775957816875, 0.05049981017884855, -0.009031318145964591, -0.06797307399531018, 0.006935608503197303, -0.006576826896362123, -0.0706204549814087, 0.11071291639303667, -0.000480400183986342, 0.042045590903005844, 0.03768662470769214, 0.056845562286823914, -0.013614127437372914, -0.07764284548611325, -0.03818530486158351, 0.0007537061467842519, 0.054463461931540606, -0.06626308566481776, 0.0018187944686624113, 0.002955542440890162, -0.030720949372334307, 0.026874068529242224, 0.028668269061005953, -0.04526161430386848, 0.049422226478598424, 0.002890026933886464, -0.005494499991985026, 0.03381066124729587, -0.005478451586688305, 0.017412557579642367, 0.07646786799445611, 0.051736322838712843, 0.03377523177113608, -0.09632532369335417, -0.03621012624702113, 0.04240427651642417, 0.03202568511822477, 0.0673202781046592, 0.04073627683579854, -0.0552117046412379, 0.009551132662244536, 0.028570500330606055, -0.02544445551203194, 0.011531429419926773, -0.03917721726062613, -0.0018881619938510047, -0.007758310483013413, 0.059827153953045636, 0.069477424098881, 0.015506272875689833, -0.05076239847665458, -0.02289816575789081, 0.012462204176441456, -0.0290394225252723, 0.11344626682460211, 0.0574789516965897, 0.0399220719673756, 0.01622208562117048, 0.017668679309155295, 0.050487346845337795, -0.0520732936119042, -0.01661340673765095, -0.01485486267824452, 0.010720224063446972, 0.026632964687462717, 0.01178516260736148, 0.02402033557693441, 0.05502232431112863, -0.03583492524856644, 0.021499756247830057, 0.039914654499588476, 0.025605882559152967, -0.019599929077496088, 0.015315243717479282, 0.02349569428578812, -0.006879467035683097, -0.018283702354940895, -0.05322773077102295, -0.011736318898196905, -0.0033030208228906383, 0.037970966243091875, 0.09682298970502981, 0.00830255362988154, -0.021987922299239987, 0.018303969388574825, -0.06677707733336469, -0.013151738441724405, -0.011723678259198544, 0.006731618539709822, 0.047620256126741, -0.041698126355350744, -0.06593028439392086, 0.006028192333006447, -0.020213557395401496, 0.035483873935123894, 0.03461795233103661, -0.004064756536661252, 0.007877039093650074, 0.015585506971296459, -0.019203272985707096, 0.009907875820639437, 0.04341755592072446, 0.022684676398804768, -0.053027648868935795, 0.06052894036632226, 0.01786302645158609, 0.02831629395209297, 0.049492055478021865, -0.018023932875587467, -0.08286551979025499, 0.04843722560556937, -0.0066201069400192, -0.016334079446614008, 0.00155447108984673, -0.007321145169311511, 0.06947743313355552, -0.05892017201189926, -0.053517025566732414, 0.08606207798484801, 0.018092659644718553, 0.01682451771866762, -0.016301806459867278, -0.04105546736951968, -0.038306649575163054, -0.030067301963609107, 0.033689110994870826, 0.014177998414652147, -0.025944400520357166, 0.10326309543643365, 0.023445567652840633, 0.005448398871206721, -0.08765508083222044, 0.033849846889390495, 0.01977713970101675, -0.03217729373280298, -0.031349128033566334, 0.02321168025734001, -0.014993313418707669, -0.025802131500571812, -0.056342041806054406, 0.06807737931273075, 0.004948925924625559, -0.01936654762376901, -0.03312373461494844, -0.06843788993040364, -0.01514288923151718, -0.08299635091208847, -0.002918407669913293, 0.027285726698084215, -0.015273277654298804, -0.08240662156697706, -0.03821487535131219, 0.02181375636103511, -0.14548516515432344, -0.028103019166526955, 0.12484401468288198, -0.006247954014883244, -0.031214177100148295, -0.1090405077912416, -0.016738934505536755, 0.07216425950864135, -0.06701786044419847, -0.014386117789065877, 0.10380186921720967, -0.03942469958262209, -0.04979684022320882, -0.0283194764161953, -0.04550509426504873, -0.03473884531088978, -0.08576754759524984, -0.03553076389592189, 0.034135548143306625, -0.00752820692213836, -0.014172605843293514, -0.04175353601422822, -0.08766594954567708, -0.013221963837492747, -0.047342132706084845, -0.028634384514190373, -0.08108017775686552, 0.013346215457601531, -0.008930355658119202, 0.05863585983919174, -0.020540181207590172, 0.11374245055963884, 0.0634257054734048, -0.048059707213098365], [0.01730666310981588, -0.04407937598929875, 0.0002687902063740106, -0.006711832862222078, 0.007526373084827906, 0.01002570010183388, -0.018044445128476354, 0.0556590686379445, 0.11903190852944248, 0.012994817541027067, 0.017146203161180415, 0.058503322441387166, 0.00814012662051064, 0.007599983466023245, -0.03698259695753553, 0.018317709960148813, -0.0040092863906606565, 0.03576090040035269, 0.023124291498279305, 0.039821876189684496, -0.03466286966283377, 0.025475278948423212, -0.058803541295472765, -0.011508817649569023, 0.02097584400280003, -0.06530133643278468, -0.007285487213068989, 0.05087210884433555, -0.034504043674400874, -0.05844584623201795, 0.06104003775471107, -0.024196823607337273, -0.05797917834886388, -0.011034220160712361, 0.027135733325802925, -0.04264199984584167, 0.006240581515269609, 0.028250789486167546, -0.07252022317515987, 0.0542760113997128, 0.032856341771716244, 0.02351363545432311, -0.009201259723842092, -0.01620147866065574, 0.07404892094347804, -0.025945047247358168, 0.031663544502913046, -0.05230588205813901, -0.04018718481238106, -0.019574732610492567, -0.020701909152630583, -0.04170426155233396, -0.05284768366642969, 0.05904714358656264, 0.0540484895525507, -0.04981403586086123, 0.09304457742608789, -0.09465173056784615, 0.03593858172063958, 0.10842562949880458, 0.004158693404444228, 0.03491835530085141, -0.045657493942699204, 0.041661355084809684, 0.006909487528718201, -0.16629832547408066, 0.037535899496536344, 0.07632265399673306, 0.0763903890742213, 0.028642870404562263, 0.04031239925970312, 0.053789824487136956, -0.03688780830299898, -0.026872109491418533, -0.041451911095207905, -0.0013811190833105797, 0.04569975251497875, -0.03808706556146185, -0.01875869274743003, 0.021990460597908205, -0.012954638554459882, -0.08944083237258933, 0.03008736707478218, 0.023567295402677626, 0.01690971507592415, -0.00992126254884775, 0.028301647682646675, -0.008141744778390166, -0.03262672137605414, 0.060928214195935, -0.04397765959634049, -0.046665227045890184, -0.013570420318305087, 0.0038386805605159268, 0.04025212603915543, 0.016137406561648696, 0.053475042212135636, 0.012349935009183435, -0.022553555836498297, 0.031935063177889335, -0.028876776390233425, -0.01767607559580651, -0.05364315364558815, 0.06415413202642294, -0.008189512040482233, 0.00867377581034383, -0.036623046701355556, 0.08319495786921673, -0.03486846736700707, -0.035099468885703075, -0.012662741203688325, -0.014814703135812193, 0.001183746093222684, -0.03796680040171661, 0.024302996255393443, -0.0007293965159381148, -0.028449712289087808, 0.008966460906919042, 0.129393200985492, -0.026547457085445033, 0.01579622966646993, 0.07314696226980255, 0.02350175684809226, 0.05268964147321969, 0.008064448505345226, -0.04127555400959195, -0.08703410064768163, 0.05413153392060225, -0.015574469346289027, 0.0028542027485010165, -0.03420542401540715, 0.03003691657823754, -0.06639803661470345, 0.011625423781413827, -0.01587225780309073, -0.03061832196853667, 0.03780569571830103, 0.07694869778916189, -0.007442689512809295, 0.01436371747804524, 0.027201644815212086, -0.04822609202299312, -0.011599957547715114, 0.02503645475846956, -0.013934308312160153, -0.11180976650852059, 0.058454031835353824, 0.04564996887646649, -0.013570946535662393, 0.06728986915977345, -0.056498374261222124, 0.005553105796956012, -0.08378852472732916, -0.011625026352989315, 0.05657690548581282, 0.009201449351718597, 0.046515133421170425, 0.038648822343290264, 0.054230298439616215, -0.004275640076350592, -0.07389443743341714, -0.040579230965665083, -0.04122889607057745, -0.01864597951786668, 0.04276176565217876, 0.01983908651220151, 0.08382572339577057, 0.11705003174091909, -0.027249241412215297, 0.027320231768250235, -0.0046618132962759715, -0.018355243637838727, 0.016842770114588027, 0.034851065848872965, -0.05871389155638956, 0.002593253259762487, 0.013017765674549002, 0.018659008533215005, -0.03088900628085633, 0.00613718454525581, 0.0384276372276681, 0.013620335116098595, -0.00784902807716887, 0.029622734530835956, -0.02920551211648104, 0.06276671966796078, -0.003090577254560414, 0.04329179136933837, -0.07023587728174967, -0.08418911361644982, 0.05439057192083978, -0.04362834924549189, 0.003999945637510391, -0.05010397372357555, 0.016227748442481153, 0.07032804907159042, -0.009653051300084198, 0.02841905262192126, 0.038253179581281826, -0.0473036503781903, 0.02149095390724007, -0.022117634533287505, 0.010767584403556121, 0.04583124048454858, -0.010491383500262417, -0.016254429084705663, 0.08383194951104922, -0.014920479145560002, 0.048200255224819064, 0.048056665836263494, -0.0007854433064236428, 0.0003083675194913642, 0.02575019512285358, 0.020584994085370303, -0.016141022133160758, 0.023408260823580572, -0.07456906388780703, 0.003953122169162021, 0.009159321148604151, 0.002580160245005843, 0.07032655101136602, -0.061173181807735726, 0.0702947757001927, -0.03831779844066613, -0.03896289667421929, -0.004106359270992954, -0.010167826195275743, -0.06447075369182638, -0.07460104146871528, 0.05016754962963907, -0.04323643899218603, -0.004472563095289861, 0.018657189685832843, 0.005128532932038002, -0.03604367665026426, -0.0391571609523067, 0.05285150782860591, -0.014821939019533232, 0.002042946446152402, -0.007684650732651237, 0.025566622696536548, 0.012301573579744979, 0.030362637221248698, 0.03187307066459465, -0.04619136594528729, 0.0630659714198762, -0.041618391728922455, 0.034811727545891624, 0.01764185566525855, -0.007187211775953177, 0.09155054363359517, -0.024774619747053552, -0.015244267164463093, 0.02317357262291882, 0.00811656219639006, 0.0947805321424988, -0.03130703777415101, -0.019918404692479703, -0.028188970798426322, -0.031066804538333735, -0.012895593964528723, 0.029987290962955708, -0.01846213529159332, -0.012679791910250897, -0.022166038628998175, -0.001957707135430282, -0.058826498910388526, -0.02810605916988832, 0.07720357029704548, -0.03705525287841911, 0.03066466386109033, -0.06634178666560231, 0.037251068944629276, -0.0102682325756538, 0.035347113411027156, 0.008693940364661874, -0.09042524756789919, 0.021575360435537864, 0.052675463628986195, -0.005058286470360279, -0.09923020715309429, 0.030619168973051735, 0.00016685025992696408, 0.023919788341386937, 0.07688488800871734, -0.05445340827818492, -0.07441113547132293, 0.03750772395455204, -0.12980871358849375, -0.037968548138645086, 0.004313876957415888, 0.009197204847749454, 0.013920105184209794, 0.024172230451986642, -0.03966231065253322, -0.09206535803459433, 0.05106594645970083, -0.0071546858544353446, 0.06995801555430423, 0.06436172398376418, -0.013667147917878911, 0.001140474987094208, 0.05388361443485723, -0.046704353597742755, -0.015486744330152364, 0.01080757692271141, -0.015578789701408774, 0.0524575590756276, -0.03584646681916178, 0.01799154211139556, 0.012182546532010103, -0.025794929919153844, -0.016623176292896218, -0.004491205490840861, 0.04130539827688952, 0.03168525689477308, -0.033103139292525265, 0.05935545323004587, 0.006951284673164912, -0.06824026511403798, -0.031776521631271204, 0.028702701160064775, 0.07221698923783781, 0.06736345109678732, 0.04559099776733748, -0.0010235429323366576, 0.016045882667052678, 0.014880685735675045, 0.024925026257769548, -0.014916094000915781, -0.00648425373163895, 0.027636180254692073, 0.08562859146887153, -0.016277372477530683, 0.005204312577128964, -0.024465967193160316, -0.013535018373993568, 0.02040562033628559, -0.05490644191701815, -0.0459462624335084, 0.02857091926728636, 0.05509515325878852, -0.08562464720904019, 0.0020353593558017488, 0.04374456268960909, -0.04824493471298868, 0.055491450236970906, -0.05445305430614878, -0.020529690695419392, 0.03175098191677034, 0.06993091773075141, 0.029735199663927542, 0.0091869515104435, -0.0025916382623475706, 0.06127962625574822, 0.06071060356578499, -0.015272134561148074, 0.04114870560206732, 0.00759112547384192, -0.030544136382782593, -0.023446900663883448, 0.02832249094673938, 0.010917294031825953, 0.003635263576922452, -0.011041021480549739, -0.012495377220115709, -0.009641232742680911, -0.02446028941849124, 0.002325231836404481, -0.01730215154658732, 0.024358734209228013, 0.014549160899410475, 0.04468186799946544, 0.06340465944917581, 0.04121797034442605, -0.03499133991005428, 0.0802576663086306, 0.022344385227085144, -0.034629469872851704, 0.06674521997287056, 0.08795598289024877, 0.06397109687908933, 0.0338980751531649, -0.0029573055977771927, 0.018512285544000157, -0.017736922440680637, -0.0015580813978990486, 0.0022113045933734115, 0.008437665400608276, 0.0019536751727060554, -0.07405655030504282, 0.030310246199434475, 0.01266787300809629, -0.04053605269818448, -0.005884857001498161, 0.0353128192095609, 0.01724608806489808, -0.009151133174919817, 0.12744560891704104, 0.013665580327433122, -0.030858988188005303, 0.02477741359776742, 0.050253681771613073, 0.019973665416158397, 0.023084983219711745, 0.011091499631159702, 0.009522732702419495, 0.08091485964024028, -0.05295553452119294, 0.06312035669485835, -0.07901207031807869, -0.029238333541439763, -0.018554234390748072, -0.01419563764923881, 0.03485851506395507, 0.04798709768930236, -0.02644200186285498, -0.018474073946651726, -0.010270678775260738, 0.0247306371413301, 1.1115255263389095e-05, 6.433955332453591e-05, -0.029735471463883868, 0.027002943244814413, 0.04708775588032268, -0.03280326176861738, 0.04743261313653798, 0.005621037218308048, -0.011212612585536153, 0.07085597940071463, 0.021749494134301772, 0.024449349470249102, 0.06744648914390965, -0.02555966809416566, -0.016762848285569617, 0.03069588293049257, -0.011581287893156865, -0.023624267517941798, 0.0009329482143355242, -0.06592165978427222, 0.04410297833899463, -0.0786784769577279, -0.04812844314798593, 0.0027475913884513876, 0.008353013936303328, 0.01702118624289638, -0.045803162916967136, -0.027047022244708424, -0.06488012867255852, 0.018948647732023826, -0.04671591773774506, 0.027543480667261713, -0.03512988203663016, 0.05600762363775169, 0.04758501706088651, 0.0017188757631958925, -0.08220948075779844, 0.007581229269036721, -0.018083320423392557, -0.07804006942775081, -0.09831580256979075, -0.023207674036043964, -0.006090476828923723, -0.06876900452210195, -0.009084763418142431, 0.07397568033664188, -0.0008843537006321952, -0.014454452836721449, 0.007586530948417391, -0.04768144915701945, -0.0013005460998183128, 0.005034741799143501, -0.023029385906552253, -0.014530762254692402, -0.020934494064095414, -0.08214820566996986, -0.007570362011480576, 0.0009307646295846444, -0.06490145548773632, -0.05438987029769671, 0.0497128915119971, 0.042260907862890516, 0.010897616979173762, -0.06285203957053043, -0.056974049468510264, 0.049566293361134287, -0.033357107907530846, -0.028346421984754542, 0.06656635031789089, -0.011120718126464795, 0.02861139533752674, -0.012830738860414933, -0.07231510270114244, -0.031384971670930704, -0.09557933957228378, -0.012172640055694926, 0.08035387085131172, 0.019582608488296818, -0.05512534201672841, 0.03230569718345113, -0.060069806724563926, -0.07033553937271245, -0.11638230142030484, -0.01863870570857034, -0.03178174587926896, -0.015227886476397511, -0.02457081402631324, 0.07805395650924032, 0.004662522030464415, 0.04122319775288842, 0.08476661899342212, 0.1076725792756207]]','2025-05-27 14:21:14','2025-05-27 14:21:14'),(98,124,'[[0.02562265777390778, 0.11186495301174108, 0.025940887282964058, -0.029104827609792005, -0.04022361465507854, 0.0188543783808369, -0.007695940679141532, 0.05420580905978362, -0.05029907795008783, -0.006381736866516003, -0.024973032708616963, 0.05010471299462161, -0.01214365087683688, -0.024458672282395153, -0.07253699238964295, 0.007080462891436587, -0.002329749587404923, 0.027705389655748966, 0.009457829428611455, 0.07438667993854371, -0.03765287852266798, -0.0008604891199652993, -0.01383979046411166, -0.014215546978233032, -0.08475537314662586, -0.09135471422186123, 0.015886581814532303, 0.02649730649518468, -0.043454242511931855, -0.045753582439552014, -0.02692313926141976, 0.0042829836985127006, -0.0004398833996827312, -0.0011425471178378597, -0.011970889251922343, -0.01578734439954908, -0.03483112217263767, 0.053085932475260736, -0.022826828952462894, 0.05250336097569297, -0.0268123460352441, 0.06713113960423689, -0.016527882778540434, -0.05202845855551279, -0.011816585940314978, 0.017680965864689376, 0.004564295778244765, -0.01677042638000346, 0.0010227763845507658, 0.01996479422691063, -0.013813256086869568, -0.043813978542600975, 0.004741494783283767, -0.003148596728467943, 0.05671763592074444, -0.015263280816499388, 0.07384902487208818, -0.0074234551970665955, 0.031039043718140404, 0.08539797128977313, -0.02707613897220908, 0.03909108094143073, -0.0940637636854017, -0.014462693318052368, -0.004362167815690323, -0.0748773540021185, 0.01997256606380735, -0.005830340209910209, -0.005889503539031694, -0.0031031928497911886, -0.0358792461278976, -0.06527377814904274, -0.0591402463966558, -0.00613959461998464, -0.06639132366412252, 0.0474594597001788, -0.02068004082352832, -0.05101937519716557, 0.03435988332027371, -0.00964211154548444, 0.0012483876241568004, -0.03635525628768917, -0.013215461997453687, -0.03173755863036693, -0.04553509765811259, 0.03873378193790668, -0.007818411728408853, -0.023899091998732754, 0.0759005072589501, -0.005305519270104468, 0.02139501931505166, -0.006693338400230798, -0.07568936887817983, -0.03578072151927301, 0.011442831384592742, 0.005329778366238965, 0.02767933690442487, -0.0031859833417072674, 0.055700307126681135, -0.05644018728358457, -0.011210092081400376, -0.03622664611338713, -0.011757730450426078, 0.01730239183894773, 0.10319880100209373, 0.01797393409434679, 0.10421721505989226, 0.06726712507676316, -0.030487305909842697, -0.03560762837518492, -0.05666271772273516, 0.10128152528270096, -0.02593378972235253, -0.002271062064554924, 0.00882696449553642, -0.10970269666374023, -0.01089045060569451, 0.034011060932906366, 0.0557121294375482, -0.015834407278835862, 0.07229743807971095, 0.013255428921548672, -0.013800260214182325, 0.12695916065514792, -0.0005148155627143176, 0.05749624522313361, -0.0033314811267914145, 0.021642475500878236, -0.00873046753202659, 0.021247242034633133, -0.005776382052897458, 0.08217414720172135, -0.055216170332233264, 0.03952283289019798, 0.033625159771532284, -0.013507638755185866, -0.001691097766623233, 0.06659408817559859, -0.041780961693435, -0.018780569208904106, -0.005334427661767347, 0.017473430045785707, 0.03609883864894842, 0.030465359822179374, 0.0186546111879905, -0.043322508190841755, 0.07770868507539856, 0.01073302956897799, -0.02186798238820204, -0.0015114195921713503, -0.14113350132525698, 0.030845571376042203, -0.0003917035496211305, -0.005210430259694912, 0.041968426554916075, 0.01161578164632516, -0.02639748631284068, 0.011500836002026516, 0.0285861486045055, 0.0488670274997176, -0.07117960358908036, 0.03874727709612891, -0.009457586207522866, 0.006773875886237987, 0.011355677963892022, 0.014162808940212537, -0.015177103490992471, 0.04005171273242762, 0.004813817336549681, 0.04941741033376601, -0.05805383960259414, -0.0028780224985775855, 0.017226956376831838, -0.006499540559283017, -0.014036765832053415, -0.06460445297828618, 0.02626008646553523, 0.009458940379062296, -0.01869173651916931, 0.013820894673928975, 0.043607804119625504, 0.003131565432620297, -0.09310823070745666, -0.01062529225925201, 0.009376110353685449, -0.03436028146436592, -0.05994344430757835, -0.01617276072416571, -0.05926647091724403, -0.09360392652393643, 0.02748188954308348, -0.04414734073800066, -0.0057523404911359235, -0.013392608023641709, -0.021224780607237554, 0.04287627856697957, 0.006769668081134435, 0.02355593192674131, 0.00943312442714788, -0.026111772974928, 0.0023920151894706965, -0.05037752196877147, 0.038067388263570985, -0.026260486215047167, 0.0024689011483096175, -0.06668301558509726, 0.05925896397460221, -0.11188656838294073, 0.09258422813035658, 0.06297933796242831, -0.046042230484725014, 0.024435856057239982, -0.014246684093831435, -0.04041234779814367, -0.022842467346020204, 0.029913631646400027, 0.0020511962207956425, -0.0028020851421196495, 0.02926162253281513, 0.05204177390672564, -0.01212441152683269, -0.04110766471427471, 0.07793479238970014, -0.006957836919165644, -0.018742034319205295, -0.08025206164482754, -0.004969066641730974, -0.011597636389864684, 0.01813793895736231, 0.034732616829049795, -0.08931850900911811, 0.03178682896177786, 0.053705714393252835, 0.021351359925585376, -0.0055849044448096205, 0.05571500634969836, -0.04377235321992836, -0.013951903345302628, 0.011318427409974532, 0.0013493307975995913, 7.03109623484206e-05, -0.0013938338351322287, 0.07423846758937926, 0.09196058678334161, 0.008883604506202541, 0.015078832538684693, 0.015358533579721062, -0.020235291396654108, -0.007609931119996052, -0.03837803376983856, 0.0010214329492557574, -0.020870125730003287, -0.03144587313107111, -0.01053019281361423, -0.013541347753186363, 0.07274442546168411, -0.012781302721806331, 0.07953673798806296, 0.0002518042644787482, -0.05879922955999944, 0.051089946237509704, 0.008122467789408387, 0.013154103658210937, -0.05394212850219951, -0.036886637373852935, 0.024430635232288913, -0.08861170692026261, 0.004510496557784954, 0.01971099663316378, -0.008151952125398203, -0.011727078974294989, -0.004911632751010024, -0.047903637597630326, -0.052849380300217574, -0.0026013835949923367, -0.03501815999247145, -0.07723735953036936, -0.009198561367146038, 0.004812955226156469, 0.011049895273976474, -0.030849543184445938, -0.02706345936720799, -0.031388161502737454, 0.05064765310281727, 0.03897244684531011, -0.03877375688910029, -0.027241169698429928, 0.12373749425120877, -0.07838459246703439, -0.15248488479138023, -0.06664652118387102, 0.013703387582456459, 0.05680565145183838, -0.014741524221596893, -0.007595121925727556, 0.03663164534782946, 0.008721463535489667, 0.02295029375654101, 0.09589050015389025, -0.05062807019299158, -0.013863663055446965, 0.01293240643189848, 0.06302145133269783, 0.003016236093006984, 0.019220632415596222, -0.020963968934704962, 0.04913546973221097, 0.01993293627785496, 0.0699822622919071, 0.02748612142948293, 0.04248582764610016, -0.008279006647985114, -0.05703630531480582, -0.0031348922636488504, -0.08319630509832243, 0.06545668682933957, -0.04528356049534086, 0.05059272527228962, -0.048344604655628544, -0.0054170317243176684, 0.026940676866513698, -0.00024354177117807147, 0.008041448677483203, -0.0021299025249271204, -0.03242561904933351, 0.01923738015418465, -0.02458149973484179, -0.011894871022445677, 0.03644922471512952, 0.007602893762624276, -0.04065960491192414, -0.01884213063374228, 0.06141297488688698, 0.015610632639397118, 0.07715909210785565, -0.03654338258209762, -0.019134503252681106, 0.0046250095414672645, -0.03905168394133871, -0.01118576836712188, 0.014243336793701366, 0.02981502355594965, 0.03192099067749466, -0.06867828901648966, -0.03585524189214471, -0.0035111829811842648, 0.02966206558607322, -0.02823073757457998, -0.0736142547129416, 0.03460507907512517, 0.04449067258990286, -0.10410813000030576, -0.02859190563964527, -0.00036231293000785924, 0.011933965400919226, 0.03677735966389924, 0.028118560476599948, -0.0401842529742205, -0.03410794159173087, -0.03982981161780988, 0.00024735617319454525, 0.03761047296600821, 0.08117403492880666, 0.006588193442008429, 0.07714244069445084, -0.0717244573575902, 0.003914330765326829, 0.09218205764547262, 0.026895867996523132, -0.04697479311722113, -0.004547206486609494, -0.0030865498648399263, 0.03608507699105156, 0.09294771442150715, 0.04556583823503851, -0.03369730733404799, -0.03873342874556681, 0.00040028451806008175, -0.033331091829362114, 0.027648862827173576, 0.06660996898753462, 0.08105240833031556, -0.008017515882908149, 0.009951911798265933, -0.0006692850352633896, -0.04823271974403876, -0.06982616412104534, 0.009708068609534184, 0.0011839899243553012, 0.00014246093299372027, -0.008964548163400574, 0.05789634792740965, 0.10278486600145287, -0.03863704897769703, -0.01931877172348642, 0.024458775029257657, -0.020425268740007392, 0.0696480267481761, 0.07435709526382098, 0.03426713180098616, -0.12073438326717702, -0.014936022426900425, -0.04095502461750415, -0.027166909403553947, -0.0004501482527374738, 0.05240521845696332, 0.040310175675900124, 0.09755562222933627, 0.019874945306488864, 0.05697784235004009, -0.02912254502189533, -0.009450091305528995, -0.009432744745382528, -0.08996838933614547, 0.000888931739229983, 0.030192762763433436, 0.04823141293238127, 0.010070797945283642, -0.01745015788142817, -0.010398952159090076, 0.043315614518535515, -0.03943294865054223, 0.013557997561171464, -0.08795860291042415, 0.04501505083521898, -0.06213911907260918, 0.06603412419662152, -0.06266166392859747, -0.03698704995607607, 0.07575144724816998, -0.06020736888896092, -0.004098295811803802, 0.005678862035666819, -0.011201950997966526, 0.03709381678957729, -0.026635745049053274, -0.033428370632278825, 0.032171737973760876, -0.004397240216393679, 0.03363364602020737, -0.005880335789682652, 0.051059680864822876, -0.024991694107519558, 0.03804064518176443, 0.00408061733112885, 0.07323038601294146, -0.08493378665168808, 0.018204528556784352, -0.0683572050711594, -0.019073311074380067, -0.017118961397239733, 0.003947828249278341, -0.0702552607055847, 0.06734839142332624, 0.029743103963035124, -0.01865494190445419, 0.04997341213685771, -0.06893584971407578, 0.009361347716589027, -0.02550052707362251, -0.02301656869369663, -0.026174907711098292, -0.02091804750884383, -0.04106324596127772, -0.0066558811485235014, 0.03158684182642891, 0.025304889020313054, 0.05170400322875656, -0.04458157787650476, 0.04521315320780884, 0.00954884388375477, -0.01837374942849176, -0.046717999810264345, -0.04669870266515, 0.01037535650265762, -0.11176672701118566, 0.04786006650624901, 0.02565530719488869, -0.06925653551531383, -0.03287696996212371, 0.01705023337874179, 0.02522983404267238, 0.020066348262559413, -0.04496020969735657, 0.00791701500260005, 0.054112547017023, -0.06801930274877274, 0.058667341118615574, 0.0485697230313785, -0.07345433564313042, -0.039789563745262733, -0.02589690359871299, 0.008815342059425328, -0.03241256698695583, -0.07292246008769084, -2.4046779375646587e-05, -0.012454340532146937, 0.007454128346363996, 0.01035913213090008, -0.03410231620100868, 0.05973665982510676, 0.04350995057644665, 0.004867781513886406, 0.006669094154228773, -0.01365381543213692, -0.005701128805920542, -0.0012186877605686829, -0.027787034881367547, 0.03947810589661347, 0.12911165605121075, 0.06312532198901218, 0.03449373037372409], [0.026242701937642776, 0.0678989187427403, 0.05181134687537226, -0.06899437459716659, -0.012810427198957208, -0.0014164196206881872, 0.025645659529872543, 0.018780121061491597, 0.0014340085630056422, 0.006348919093806676, -0.00929082798671432, 0.008923825540598103, -0.07641148987372184, 0.03872419770610053, -0.06099032530914064, 0.008848178022168189, 0.04701538608462166, 0.014947331639394911, 0.05178156888568814, 0.044747552215925766, 0.042365057928048844, -0.02196228229868999, 0.05205918744931013, -0.021641673472459093, -0.09116492720227592, -0.020959053544297914, -0.025230760514677243, -0.04125300123258932, -0.08715021530080068, -0.1024729320715752, -0.09422242499681548, -0.025969631043167973, -0.026748332498262504, 0.0012521133511555098, -0.026458335401059376, -0.006049060856705825, -0.11252598730460145, 0.05147524824435099, 0.04789785203940391, -0.029025441023914276, 0.006047546353474592, 0.02580710178459779, -0.02893315106991624, -0.05276789916704181, -0.042878837320213616, 0.12722764775613338, 0.038609651902971186, -0.026556328427951345, 0.0369906262271917, 0.023589063044417626, 0.05311875369039352, -0.011270181572245817, -0.0240406798663615, 0.03467501595140639, 0.022785354954951535, -0.0025576336229390815, 0.06298752479878286, -0.0016852127483310427, -0.0621389001575813, 0.045652490311420706, -0.040459954284575196, 0.059919197636005825, -0.03889209543263959, -0.009093806691173295, -0.003064249511874031, -0.10749913432639324, 0.05168589036358165, -0.07759499303958811, 0.005073257689969497, 0.0014033893238535162, -0.04452745981836973, -0.027229032218996453, -0.013301498748044944, -0.0051020240081329675, -0.019958446169926456, 0.06024826771495489, -0.004645749984766714, 0.0812073952050926, -0.014577408332606923, -0.003976822977488967, -0.040219670975464035, -0.009596698482751735, -0.04452577755051447, 0.0011090001903878853, 0.0055817120573462674, 0.03098350652649274, -0.024334962124980555, 0.00756621874358825, 0.03998794320001677, 0.06443620514072618, 0.010148888117073311, 0.08404746265230861, 0.013652639811525839, 0.0027946700164411405, 0.029445083664732214, 0.03524019879410236, 0.081496227655319, -0.022978181672730375, 0.06649271289117335, -0.1026897338792605, 0.04553041312450858, 0.0009684256827326098, 0.09410335001099888, -0.048261957657246286, 0.02777374500459209, 0.06196127485581764, 0.06034680054647734, 0.045313592830363326, -0.03673396021727469, -0.040529892259850195, -0.031698422300182945, 0.040192943251671324, -0.028952665377037272, -0.03686859710507544, 0.02664816361503466, -0.028858953814269242, -0.014149285952610871, -0.015877266201708446, -0.02212639214958572, -0.014345866346082137, -0.013966463182632852, -0.030851901418123447, -0.02130126195033197, 0.04543972594658803, -0.0698052868600744, -0.04001089229139613, 0.003415594850737351, 0.0081898456050866, -0.013925917754352061, -0.004710045892465603, 0.04108331771401929, 0.05209230409366085, -0.06405675945841902, 0.005010411582892024, 0.01484542318028597, 0.00725226319429261, -0.001224187242596673, 0.059988181709947505, 0.008425311342735333, -0.00875664971032001, 0.06348003367013155, -0.012392174739927354, 0.010182641619969233, 0.07154626031754636, 0.039573547016532054, 0.022146708769068494, 0.05393581085258801, 0.08277509877076464, -0.05536618590189088, 0.0312157667119865, 0.004832117071278249, 8.447064360156058e-05, -0.00657083749144407, 0.0035716247321513415, 0.02380007859013923, -0.03818997228923335, -0.04943542267536083, -0.03624268624145052, 0.051802746974204485, 0.02380152792859915, -0.08779982210878685, 0.03882129229103903, 0.04201154505175663, -0.006533567401704553, -0.030316868142956546, -0.0024068220070068923, -0.01983133327132451, -0.01136382843240403, 0.03122904738481309, 0.018336471903785283, -0.01718005140174272, -0.021598496496604714, 0.013296193134039888, -0.004788720106550491, -0.00708339215563729, -0.09390168491671895, 0.08003432579722093, -0.004801193845400354, -0.06625693658099749, 0.049914850527650365, 0.0009474897668415827, -0.05319228913077438, -0.054723888640168125, -0.004807015231637957, 0.007349230684818969, -0.023071294274196092, -0.017619842435257903, 0.00941583065591321, 0.041174685193665926, -0.04556368875241485, 0.03856563933912716, -0.011921890290728066, 0.032642947301010375, -0.09319925120078558, -0.06827475586806564, 0.04505177279541283, 0.039403785854830245, -0.007748115804084377, 0.012075368578507743, -0.03449357504430947, -0.012397448926950497, 0.017566605127899863, -0.0038269532466911243, -0.0008826681504379241, 0.010337898305195901, 0.02854697261889604, 0.0013066463282751498, -0.006450729112516394, 0.007184270918927132, 0.06472437947297845, -0.028927560764427988, 0.03001994786650292, -0.00022182827614514752, -0.07407220583732721, 0.024220823023970064, -0.02858265518388753, -0.022457296085361622, 0.02151637409557804, 0.03283356488682544, 0.04226750857619563, 0.040999304148139945, -0.046319966131592546, 0.013081984052362279, 0.005763914606593034, -0.01358701565167969, 0.018694654459860342, -0.022487353220590957, 0.024210269103985795, -0.015221050484290892, -0.033185491624854124, -0.12885775421600565, 0.011326401669916455, 0.055397110052091775, 0.025997222084640254, 0.020933926747936694, 0.08480769983120715, -0.08319626469588229, 0.031868738055683195, -0.06850395099850004, -0.009695405086997694, -0.013164451225866982, -0.028612788113602648, 0.024513914754568475, 0.06369530479893318, -0.02434001632313032, 0.03861045421533293, 0.046112078494894126, -0.03706541874684903, 0.05983083975203871, -0.010909100339250922, 0.001539324538844485, -0.0052997907701713915, -0.045861198746940814, 0.016287852325797894, 0.02587202438328891, 0.020757022418111004, 0.08568947439238735, 0.013754694313668369, 0.06400037575557783, -0.07871446650277875, 0.015469942937799805, 0.055949315399904304, 0.013710045815602135, -0.0151745422483539, -0.056443957608730985, 0.027389487296760478, -0.04483427589683348, 0.00712851760437018, 0.04495814257306857, -0.0250436146860404, 0.001649290668142854, -0.03945153268358375, 0.059345085833155, 0.006207832742291593, 0.01683532698850975, 0.028890722795689754, -0.07125559401049313, -0.01972259036797282, 0.00857049290729038, -0.03245488824125211, -0.008785879576466673, 0.04659973282186049, -0.02954384942565001, 0.04549837978671081, -0.01571938443916917, -0.03673197107418429, 0.0013496744881269468, 0.0444255809375967, -0.061630278487742, -0.04941788272216224, -0.03855831500369579, 0.02665135622666767, 0.0626105267237728, 0.03464911642101934, 0.06603458144074383, 0.05377913810452933, 0.04499531884402385, 0.056648299542411386, 0.15582726611566913, -0.005816567741816719, -0.0665394170835858, -0.002018342453884673, -0.019169558675400617, 0.06330202385000099, -0.0007526819360283857, 0.021951957610809075, 0.060585789803392145, -0.06544493731424475, 0.02238425977939935, -0.020202134684960026, 0.020132106126031286, -0.04908466058430887, -0.02498700544838786, 0.003347900900619283, -0.03748929848428703, 0.08243095483237403, 0.02517155392940202, 0.006166257618191702, -0.07987566020877987, 0.010787569427230253, -0.032992674150305254, -0.042942867022889256, -0.04585882138819151, -0.011787686910413092, -0.06342602362874769, -0.019297690177945692, 0.02329986825957624, -0.08791312192451571, 0.0879534150126182, -0.002656910765555185, -0.004201355822724496, 0.01779849188690268, 0.04191071620190865, 0.0061638922756413654, 0.09760643804153929, 0.002796942926691738, 0.010422303784026145, -0.02596934820033077, 0.006330719636149441, 0.0325619248443506, 0.017631437142937245, 0.026734195902340323, 0.044466598694929166, -0.1299642945518167, -0.07206693515927172, -0.0020234604303212564, -0.0008789440530814143, -0.01657464017355406, -0.1303258749192302, 0.008218905395801742, -0.10313223317915807, 0.005312687848954063, -0.04823178775461127, -0.014629718543998574, -0.02158699237257912, 0.050977241499813794, -0.0008819520311956913, -0.021722387205237736, -0.055129263431198255, -0.025958736972320658, 0.037202107631704, 0.005846170110131334, 0.03540400361840895, 0.012969497640871134, 0.028249928483160762, -0.0029046695369077907, 0.026408129873132794, 0.00154034695561998, -0.004015174525135437, -0.01857089130780096, 0.005375189183553507, -0.014410299053584642, 0.056468792319025025, 0.010107581046642665, 0.023115781940060778, -0.060781021609610214, -0.03718057460315665, -0.04523939187742434, 0.02800223580090247, -0.015848506815967455, 0.007962826330988075, 0.059937366128842644, 0.0027696710077343084, -0.0384851455952219, 0.08645934671421074, -0.08091848141444241, 0.003352031931175397, -0.02687882102445094, -0.020145063285808788, -0.019771594276002787, 0.005766965796807439, 0.008792873928587972, 0.025001264054945696, -0.006294172829155387, 0.1044127384976631, 0.0501516288039554, 0.006248435478598221, 0.014284036532140302, 0.029133531355229805, 0.07067054192064512, -0.04780510177255317, -0.05164665100369618, -0.03054806165971131, -0.03505492379521225, 0.01842840506910632, -0.0039281878743349635, 0.005290840550587603, 0.01153750225335382, 0.002635527477333418, 0.033638084531883244, 0.05047744896324562, -0.04097221039244026, 0.00648740671121458, -0.09352308961156938, -0.08342612533887481, -0.01709931178792015, 0.07371163113333488, 0.01756642950653036, -0.0009480512930625009, 0.044432003133782615, 0.05076207389518788, 0.028832240879644488, -0.0218620598047283, -0.045024690131589114, 0.017199562011571762, -0.003477176021792887, 0.008722212208406013, -0.016064184646887927, -0.04630020410590821, 0.11071272439414911, 0.009102973202338474, -0.02110896579395364, -0.028035332110147245, -0.05436234524567453, -0.10765472376789897, 0.0298756795330693, 0.006558123428614883, 0.005197102644614147, 0.01025003031241741, 0.006992579269789095, -0.042909365860171626, -0.0038280217640761145, 0.003659846740637835, 0.02390107936406473, 0.03004926369468834, -0.006018875240579854, -0.12264952771211717, 0.03869308129671618, -0.07473938217684789, 0.04360338823682868, -0.022024226728683503, -0.006511399825419495, -0.02185979521338468, -0.031520412480052364, 0.05994508977180889, 0.04946495294648165, 0.02451173335229462, -0.023552160373069574, -0.03072522295133028, 0.007856394235129875, -0.07060202370549412, -0.042631344291722766, 0.0544276061465827, -0.08169738991788836, 0.019459230410908662, -0.03344239795875046, -0.00715152215512938, 0.014799428867935529, 0.01137845861680682, 0.030103286676594166, -0.035516490029900094, -0.0277598967974451, -0.02340381392657144, -0.06341850333684088, -0.06135456033220265, -0.09051018855300821, 0.1447296223714093, 0.04091138624191959, -0.028680311757208445, -0.03279471004530689, 0.07388624683941902, -0.0010395664333079683, 0.00429810147573148, -0.04943301573827561, 0.07974555250366636, 0.07997684769595084, -0.03587233589743774, -0.03602076368435964, 0.04844878551877202, -0.08804268982499873, -0.027347144060249753, 0.012615216652168084, 0.008968303038909817, -0.03430307946913007, -0.07366769251533066, -0.03584192936811539, -0.012669549282278036, -0.020090104889029594, 0.002672648288908855, -0.04825891108864686, 0.05305986692087539, 0.018022571813869483, 0.024394965476679537, -0.01160146448045065, -0.039653027702432175, 0.028543853953102823, 0.06445511309196092, 0.003220584419877162, -0.013189081660778602, 0.000926500471297456, 0.056427963123584036, -0.035966443070448655], [-0.008185559135388173, 0.10344758051257763, -0.013091600151063549, -0.0813512468257594, -0.02677287963904223, 0.028682146332017988, -0.0009495237155141429, 0.0723791373493657, -0.02390896400583569, 0.02926046172879602, -0.05624042432430913, 0.012442341995578863, -0.051060175136639505, 0.013432785398023641, -0.047159829178572324, 0.053324421691386716, 0.03912539875170039, 0.023792410523760594, 0.0040844578693355425, 0.034833587471915575, -0.0033113683395824696, 0.025330959369944842, 0.0021076727061326945, 0.002303000173328389, -0.08756476860535277, -0.07522056680531297, 0.006449088169381302, 0.010015904920946965, -0.027561090713666414, -0.07400884721653311, 0.02966492638443721, -0.010493090996594132, -0.005279138370172268, 0.04457080004517611, -0.041185667454031336, -0.027053062163784374, -0.04459953151646613, 0.10458784957139772, 0.03907468010292384, 0.004677658468318886, 0.02753311164047123, -0.017419438824596904, 0.011355119926271832, -0.03966086059377617, -0.05460054343833634, 0.0210260337523826, -0.008216522461130507, 0.021012580250697136, 0.04538735859517145, 0.055582843983161434, 0.031129387408894014, -0.04561562760058746, -0.056722847948352244, -0.04066395149632036, 0.031038955395391345, -0.05008682150180228, 0.108375998549312, 0.04650236579049637, 0.021526417469808774, 0.003899603306061652, -0.06452698608166713, 0.04580350491346128, -0.0756556790134028, -0.014764891605804768, 0.005599089325045136, -0.11769056221349412, 0.08474488190521944, 0.06919985385978498, 0.006657895696355834, -0.01518230881414081, -0.08299246487518572, -0.10618698790561311, 0.00555573920709247, 0.027588695537032037, -0.049107729369578496, -0.010809188835057736, -0.024586775279176, -0.004524473334957941, 0.06213333095304307, -0.03112787091739716, 0.0037554074781770814, -0.032067142477912404, 0.008111716915111379, 0.01647987683062018, -0.052340047178756156, -0.030788529630534783, -0.07747760515240547, 0.03496554562275628, -0.01988853258292696, 0.04708493632986776, 0.03402867744786523, -0.05861517983654051, -0.04764436965321388, -0.017338635947333904, 0.048600102358576085, -0.014701041076290026, 0.00578981347060682, -0.0005817579591750549, 0.03977466372944759, -0.03791024853948292, 0.010264549100677402, -0.005308451195689717, -0.012723737908440277, -0.018316985427552158, 0.09904572418915988, 0.045189357044720935, 0.03145530833077458, 0.1101077304793912, -0.046876670198154474, -0.019407847661216997, -0.008729699869995763, 0.01436513333669206, -0.045947255832368784, 0.003828556264199369, 0.015804599540500838, 0.0033219618513595016, 0.008531580391864585, -0.0015333444344919568, 0.061586661108259166, -0.04669633635840768, 0.061592469777488765, 0.001033608832004991, 0.024543524084029846, 0.06365561162694872, -0.01940268808153554, 0.07018647776982863, -0.0004718525282715005, 0.010423467858380246, -0.03168560062433164, 0.03996619387659533, -0.055614896921688785, 0.07011318717820686, -0.02228718160771418, -0.04745776323038626, 0.001648588773120299, 0.048023192347876754, -0.00450999308276352, 0.07153860341966431, -0.03451649650695114, -0.04115674495939081, -0.08572437167788713, 0.011241326536689725, 0.04338805752913692, 0.01987626810413749, 0.025938193362927676, -0.04206591085002312, 0.051793927013409416, 0.010281073595104889, -0.010937521440674598, -0.033786931550149404, 0.009733956404821595, 0.032686779344152934, -0.04319932645883942, -0.06168220007256101, 0.0463306552905723, 0.022958418169205016, -0.0019327774278738957, 0.03416594136972706, 0.06416603381636564, 0.016709761737644022, 0.004694958751455562, 0.003942465875896514, -0.02139714923961802, 0.024235300111120926, 0.009764905111429963, 0.01024083491616489, 0.03245726283930506, -0.01765347166723168, -0.026291748346441806, 0.03875582314657617, -0.026633931592947385, -0.013743968283647502, 0.014647728018538777, -0.013315742662265111, -0.017544216056832963, 0.003181512907510701, 0.024828532872198997, 0.022825738807755267, -0.04714573633342803, -0.05281026090210994, -0.008336058246534894, -0.01984857556596806, -0.07909749096154697, 0.006932477143570713, 0.029353527135630633, 0.05200738586150781, -0.03876383443199015, 0.0023668343781435334, -0.03960471532247103, -0.0713552833781525, 0.04500561597215087, 0.017088145858287888, 0.0018081286003645129, -0.032208920788343275, -0.03354360678596514, 0.061972536073147774, -0.002266663097591978, 0.01999433807770944, 0.022095132968615074, -0.018210832971990193, -0.006832537819944769, -0.02865364291921785, 0.04051080534731666, -0.005380073744125837, -0.0032348396097869867, -0.0001663272474929095, 0.04906749751290101, -0.04777962198224183, 0.09238990928287204, 0.03658947800817989, -0.024437817999358343, -0.02286321447037548, -0.01238540241799484, 0.010832366010049188, 0.03403760096723875, 0.030519217893810582, 0.03384641388243478, -0.08714138289192243, -0.0051355000185963106, 0.062203194819662945, -0.029434166278593202, -0.005620731978274508, 0.03433849783020335, -0.06753643032047156, -0.05155415372417022, -0.0419686136912095, -0.011606800987431701, -0.028368944056688803, 0.01904376495202869, 0.07125212297200914, 0.002091255662339865, -0.0038315738971024128, 0.08272039304596852, 0.029759820157626637, -0.00831024865282043, -0.011457967482948299, -0.05266124709497428, -0.07463718149287514, 0.0019662072451687145, 0.03867645879209553, 0.05529190762347309, -0.033160441233905096, 0.041353015604379616, 0.1460154422511882, 0.001606054402842998, 0.03872560247283936, 0.0582021795558804, -0.024626053968318826, 0.05547542648520685, -0.04055876390360022, 0.027866250516095828, -0.015092525890186281, -0.07366680626293148, 0.037150536979223145, -0.038568058888338363, 0.03287947317436445, 0.020266476180333948, 0.10218364527570299, 0.015183911071223606, -0.019625224437218584, 0.06310302785517065, 0.09600094452894802, 0.017402106379365498, -4.201070071598741e-05, 9.6979679954303e-05, -0.042053198051125326, -0.03289608051055109, 0.00634185730903703, 0.010119561403036279, 0.015873333835369523, -0.010617650891038548, -0.030413790547293387, -0.015798239242616214, -0.0511999730417223, -0.05355480364896544, -0.09777969939073687, -0.09326395416606177, -0.0017416532053459775, 0.06501167079843048, 0.020637348015336583, -0.048997298380808824, -0.022352985253526927, -0.0005941905580051491, 0.049782076882777526, 0.037198557910478304, -0.03182779996582077, -0.04495962222747249, 0.05735285465362011, -0.027834597167230243, -0.07660829297018536, -0.08020760172160185, 0.029202006634324075, 0.01190785573704315, 0.09204867140702966, -0.040122345719542665, 0.03887814826274148, 0.0009056401209977943, 0.0008804285716887017, 0.012313795950606082, -0.07947146010373278, 0.00868283579954187, -0.009939697324794293, 0.028639271335919255, -0.061095902628636935, -0.012517858593999356, -0.019700320004580826, 0.06614844685884136, 0.059347337253099076, 0.06968156017165478, -0.034474155596546666, 0.010777777189207076, 0.022876872639936485, -0.01047266611722422, 0.015672540030331295, -0.030117018229325367, 0.02643194389196851, 0.0007369278836242676, -0.061979444101251696, -0.003986274303699048, -0.009482340642460112, 0.04044834461013772, -0.022077956460812655, 0.04043313291394048, 0.023888604425264165, 0.012143160444333067, 0.01303086252247487, -0.019153470831753595, 0.01634384676366517, -0.00012106653055685939, 0.03849298671159047, 0.0013456213534814862, -0.008849076794144374, 0.08130005256782445, -0.02137902541193453, 0.0792313398537141, -0.07994199349881598, 0.044615452727965244, 0.0035964599695107683, -0.144716654998936, 0.024424031181418428, 0.053704569854195944, 0.017782248694521142, 0.01658957101503791, -0.012645638596352262, -0.0820412387615211, -0.004156227583720267, 0.002995159639352949, -0.051338511752066066, -0.0865330631845903, 0.04941770179090988, -0.08106778376735503, -0.058088828638753025, -0.036233414381277, 0.015525467644186462, 0.013161280791204372, 0.02200846294558661, -0.019815604545827575, 0.08136337875773424, -0.02039248531825897, -0.011282739619391748, 0.04906523252174504, 0.02090124872327509, 0.00044126588888105154, -0.0038495815026708636, 0.040125577522758325, -0.029937360768176782, -0.07071004548450877, 0.01820679809101527, 0.005118722125846725, -0.06520375062501539, -0.030535807687036457, -0.018730426231449146, 0.017778773239072693, 0.014670901295094506, 0.08398934946805639, -0.030428468157796363, -0.0318280981961537, -0.0051234835777798126, 0.006091861834023568, -0.10376240258795037, 0.03466814955507233, 0.11627839285662873, -0.028728089397031954, -0.000660414138441101, 0.010558600310509675, -0.011491606110206614, -0.04596302110643892, 0.009463008299702008, -0.07043600104681495, 0.0011176564260519902, -0.009279655121486539, -0.04631558783649687, 0.06368272914584877, 0.04730229361369072, -0.0012245980711959462, 0.07557175348912443, -0.006339674185031275, 0.03355019124390392, 0.04887894577064684, 0.06158439221866747, -0.10017690989274174, -0.03154857450704901, 0.041942069242360956, -0.04731630849012052, -0.0022895915036537577, 0.05310073724638279, -0.04285620563854208, 0.053412000049939005, 0.008927733582541002, 0.044395865538907835, -0.02312968424745648, -0.050114157333102906, 0.017634394672013536, -0.035707870159684504, -0.03888121633165671, 0.05150589498833587, 0.058175338825916786, 3.0116390581173714e-05, 0.009942701069520068, 0.03250822319109654, 0.0011805584174244988, -0.046246788242829795, 0.06639861727615796, -0.053590310601544754, 0.05853344523313934, -0.04784602013950258, 0.03355647552229191, 0.015347619057214075, -0.09772796714867193, 0.0432148929126876, 0.03641152221422507, 0.014541652557082372, 0.02919806141737082, -0.041199771994482805, -0.022426899594864626, 0.0031064626594637587, 0.03475294832895301, 0.024488712077742503, 0.00982734245799455, 0.012629173553069573, 0.03156375111732473, 0.015193873523717724, 0.00994582176731758, 0.043015285206718566, -0.06052183847601653, 0.08101534200998822, 0.020265600981513785, -0.05694878958764069, -0.014622988545430706, -0.036768346036094246, -0.05231462937783201, -0.0205393354935675, -0.09572870116855893, 0.019770550324158812, 0.03904737935754472, 0.0009526528193136859, 0.00820224638950716, -0.021236360207376317, 0.004412092641021523, 0.006409426458928538, -0.02470628767396604, -0.04641007422315308, 0.02092785749631309, -0.13944960324142325, -0.03338486638169669, 0.02162939075103736, 0.04825707120230041, 0.012038988394119179, -0.028766344746797082, -0.05124303516273582, -0.03583943456851703, -0.0629605400294379, -0.04488175487231008, -0.0316817684620144, 0.002522079103828211, -0.12603691817799545, 0.03905170272276327, 0.012628989351981588, -0.016821625401542473, 0.09998452208973459, 0.047979837844183894, -0.008038671924940257, 0.008063215988957635, -0.04670321709746153, -0.02985347812669138, 0.039965745556487006, -0.10752375371869402, -0.018583611142062136, 0.006196227344110287, -0.038051983967120825, -0.0769916963268246, -0.020703943043601413, -0.04674402592262625, -0.017735492805658604, -0.0682101579823904, 0.004387990074849951, -0.04719168329687772, 0.010546721776856933, 0.06948585869828176, -0.023617468220620868, -0.037761421857262036, 0.022276084710424214, -0.012857598495914568, 0.04210345668448638, 0.020852457850964335, 0.02657449604189071, 0.020799830917900608, -0.005958057286562818, -0.013539884198857743, 0.0512135590902224, 0.030796542865166622, 0.013298569078289484]]','2025-05-27 14:21:50','2025-05-27 14:21:50'),(99,86,'[[-0.012613128117586336, -0.08008462724639323, -0.07050773816794757, -0.03379808266413806, -0.10554754226467486, -0.004431431258909839, 0.00594296895627635, -0.004720995736411433, 0.050692261545757865, 0.024432275684159302, 0.04804664424134977, -0.01618881600184568, -0.005500018515968867, 0.014471288414568184, 0.020689973201349462, -0.004001106224895526, -0.019628989930713943, 0.026855814233838572, 0.030480238908092486, -0.09358822821733118, -0.09441563567419377, -0.026017524847205577, -0.04801492114594912, -0.023536525412197643, 0.009165944888283867, -0.054421848915922125, 0.10187934089044284, -0.012237109600631105, -0.049669472432842726, 0.060255608016225475, 0.04345332749530463, -0.023635963988477754, 0.0439356083737964, 0.005895534434010025, 0.06435479532229264, -0.045681540531682524, 0.003831465715131116, -0.022483516853217554, -0.035899911044663065, 0.058821893020567395, 0.043711549976841506, 0.0016750139466389256, 0.052657292010582404, -0.030744432049166912, -0.008145561980454227, 0.04727225018752745, -0.006383527227186122, 0.03248056607647915, -0.07110141114674046, -0.07893390589048424, 0.07718674835602908, 0.039191982836932086, -0.10654065383112331, -0.026074834391205, -0.010141973802194029, 0.00088639060406947, 0.05699853756782764, 0.08871878677509323, -0.06168171688959451, -0.006106255876325388, -0.031753056101862756, -0.03082286347255244, -0.01219851145920122, -0.08060669136656243, 0.027159231630067896, 0.045725468572989855, -0.023603615999846683, 0.060593328633420124, 0.012824522662668453, -0.00018675554354980763, -0.0620235383686138, 0.03209403299862531, 0.06986188660441443, -0.016418295835772322, -0.06434432836068307, -0.010789089187875803, 0.04343497125666098, -0.08577140950610994, -0.02232108611012387, 0.00997653026820328, 0.0038792081071579365, -0.007227562702351981, 0.003496292880394486, 0.01853455534433739, 0.0903636912727422, 0.05518712343416298, 0.019276042423006116, -0.05129231527027077, -0.03059891247912153, 0.03427234733415832, -0.03865508482550791, -0.019566608011195703, 0.039240060559847696, -0.02818035598836137, -0.04167944112931384, -0.04632065496507517, 0.03619406000497086, -0.017310443207702326, -0.0051765288657014095, -0.005576868178364889, 0.006246400388193469, -0.01772094191733853, -0.009811352191786001, 0.007054488025933079, 0.017660832558748115, 0.02233041557077494, 0.026821874720261266, 0.08366286352335789, 0.0301463677308368, 0.026299197911807556, -0.007807127984171332, 0.07772957064819637, -0.05136511044963659, 0.033669701279134844, -0.016097469304701705, 0.0011428336044931539, -0.04379169253364315, -0.06669046070243297, -0.024640145440863567, 0.028559634446368276, 0.046474354289867216, -0.007311238590993611, -0.09426825851138139, -0.011562907168251334, 0.019699479595797993, -0.0293145274376209, -0.032400111073062295, -0.04400403418252763, -0.01777467053020893, -0.09028402714982009, 0.02859335671190844, -0.04483322844347096, 0.02029397884942876, -0.025858845904483608, -0.0008092739584817397, -0.041579648609602435, -0.0274681583388795, -0.070274247788796, 0.03348819664657819, -0.017426861304727814, -0.08053619071702706, 0.00819782416907394, -0.03663253733260354, 0.08111532028227754, -0.03380584012775635, 0.09205623411525413, 0.07246841879005096, 0.04851316121170847, -0.021195050477805732, 0.02705738867944417, 0.01628088767277652, -0.035609467505932545, 0.018069651867827555, -0.006147072266673813, -0.08201903306094872, 0.0031308292006593545, -0.0039620116472908855, 0.12093296037924557, 0.028713934254498925, 0.05962719976138217, -0.05549535202006872, -0.023463713145907554, 0.003447633591806426, -0.02803867853528741, -0.06085871297721505, -0.007777205728539212, -0.0016615099368022998, 0.07496320737294426, 0.011394297061045095, 0.017611055907362297, 0.03267854006304228, -0.016029890519216397, -0.07538925274267641, 0.007380860484423695, 0.009608191103212534, -0.03013967453850158, -0.054569274898518136, -0.00039820222663521885, -0.007005843993527402, 0.020344336456239735, -0.035494369984054155, -0.03690471494929012, 0.009662327361276217, 0.034102805989579404, -0.05470968547820698, 0.056900932174422714, -0.02820700914923238, 0.012521510470643229, -0.023097391458475183, 0.019575988732619582, 0.000932049306706372, -0.09327064576088255, 0.02678740063005325, 0.019259148336882085, 0.01618221678759394, -0.03750696068208786, 0.006019456131778943, 0.07865723929469318, -0.0022232480643830533, 0.0045778161596200075, -0.04700950211204837, -0.012114187487931945, 0.03357432450885248, -0.02193662787307417, -0.018749795667874703, -0.043853171287164296, -0.015326718427232523, -0.010174540869604128, -0.008755444347905778, -0.05924289530665089, 0.015817735606004295, -0.06003655852907069, 0.06892939944527365, 0.021949938587079998, 0.014167847828941635, 0.057976998317209705, 0.060401979491495145, -0.04606772454808343, -0.000981271395862554, -0.047444710955167245, 0.04185620291989115, -0.0016598511320917578, 0.03201551369962925, 0.05571980585727099, 0.013521268850632458, -0.04702540759755396, -0.008784554974635103, 0.004866522934548008, -0.05803257964086874, 0.075267774475078, 0.008258431489457348, -0.01856516290768217, 0.027100931044460853, 0.03414491549394664, -0.01629469268709157, -0.00723890903031413, 0.023235556328117198, -0.07331662347473855, -0.004131150228654883, -0.009070763397136007, -0.02410651347296402, -0.02593805112143962, -0.04598190913242436, -0.03685088625586328, 0.04609924748237121, 0.011103962146333142, 0.004034289336950264, 0.03383828087397631, -0.03226756047853735, 0.02458425167058932, -0.03638963694015791, -0.0226138046507714, -0.03400702401509293, -0.0625679814775975, -0.04513021871518583, -0.009670798814230046, 0.03803566917480865, -0.01824557761961026, 0.05352175856519605, 0.041639106224081436, -0.057615849085852586, -0.006429862083826254, 0.016233803432457717, 0.11371857779797821, -0.02746585892707068, 0.03893691655440668, 0.0018546747169927223, 0.022316982807310044, 0.04957940969600813, -0.018096363612438923, -0.08649810174935058, 0.057432418512831866, -0.041929325191807275, 0.06580445485928321, -0.07437259539458478, -0.027906164555600185, -0.028926703076490135, 0.06188233202645184, -0.040889727427389444, -0.07588102418710521, 0.002857017646839517, 0.013568033321368507, 0.03438075898666902, -0.016627145649632896, 0.042319741883448614, -0.033864201738092924, 0.06604630318539169, -0.09012168184134775, 0.03273591063177123, -0.07271595462095196, -0.008075352418878736, 0.03311217446813919, 0.026403486733590983, 0.005802236776262862, 0.016944542590903736, -0.03833888152794675, 0.01372675498140115, 0.043160633364548916, 0.041178423217866134, 0.06950138179420119, 0.059593660570030606, -0.09623644761620657, 0.02404376540506858, 0.05720127636527274, -0.02298280898531406, 0.09682507751135082, 0.08256281710285344, 0.044367321720407596, -0.1246709740440638, -0.04458570725850506, -0.013798986292266082, -0.07571174646935788, -0.02542735224689873, -0.047534485655278444, -0.034940133626474947, -0.08115022154559229, 0.050407534803690035, 0.014669064681007623, -0.03405957607117793, 0.026147656421451816, 0.02067578373123835, 0.0418026378532959, 0.057616576500628625, -0.07174721877246833, -0.048725620028073645, 0.04435171403558213, -0.054875526283186996, -0.05414445490535503, -0.0386121746766892, -0.010237177872491817, -0.013496941952451259, -0.018179218108221033, -0.09010064051460463, 0.005187069667233717, -0.04234675875170765, 0.09553850046156535, -0.034844415117707195, -0.03188761318949476, -0.1141676221677769, 0.04371451821968601, 0.00047722375915533466, -0.032312367275949966, -0.04885308360114469, -0.040431797856970694, 0.009711005567530432, -0.0103934353539459, -0.03378091030524736, -0.009452728163736974, -0.028245220393877026, 0.07876656631814688, -0.08092220874616364, 0.025575461706465512, -0.052542785208085904, 0.02228138342108943, -0.024749406557609377, 0.025678263965837504, 0.008132182918751322, -0.012172413623368959, 0.0070893850175167625, -0.05660814040409974, -0.08895898011053675, 0.019246496689955216, 0.01445477268176726, -0.04470581369018355, 0.07086621207516194, -0.051581015942725815, 0.09688743013899888, 0.021104768051944816, 7.142151270402422e-05, -0.015636534876600723, -0.053000104531209326, -0.029582640807320554, 0.03826128248187205, -0.02482058092015879, 0.05807098128266953, 0.00846806364035054, -0.056451882922645656, -0.011441873160683937, -0.11811395961328713, 0.04392148481039319, 0.027343216307632784, -0.012129641390438987, 0.04850915310747272, -0.030657493778484427, -0.06758920850910931, -0.06809933619218177, 0.02082993219803976, -0.024777763528928964, 0.03321325583013834, -0.04191668086784795, 0.021500706261114343, -0.028022099336767768, 0.026348225179514705, -0.02826431137026426, 0.020635197404120266, -0.043421233369548416, 0.03165444013893676, -0.0145960473716263, -0.0028209498958197345, -0.04216390913411209, 0.014920066716546106, -0.07096247004253878, 0.025281583695956848, -0.004543293554752011, 0.0475107006566955, -0.03271207681340466, 0.07371436801590227, -0.04764463773307544, 0.056979761479044794, -0.011194495994079737, -0.014532894099526758, 0.01732692110517094, -0.013999877260900908, 0.012445045264043266, -0.0454840889168042, 0.022061425885959184, 0.020574548586920777, 0.013394831713512174, 0.01271427172480961, 0.025373496702590898, -0.04464921203304672, 0.028730938185136116, -0.07627830494032448, 0.018499914046370452, 0.05176748310628812, 0.032968488080968986, -0.04118427182794461, 0.0368419766453514, 0.09099120124356677, -0.057138733340468525, 0.10891070786685031, -0.03611121283215629, -0.054886857354966755, -0.016898644671327064, 0.05287255308252776, 0.009240573250524872, -0.03884262358332083, 0.05989728056836198, 0.016790666294396045, -0.035079428674107925, -0.025172576442085898, -0.06491855641965742, -0.03827845239977357, 0.10756128022762379, 0.021925533577244992, -0.0005372583243116152, -0.015189016125040368, 0.013403542383405773, -0.00621089314931445, 0.01949985183906451, -0.023558694475942544, -0.02010631316017842, 0.03498148154221761, -0.03719299088962762, -0.0003635508595879068, 0.020168994100871373, -0.0074309105265978215, -0.030018101072325106, 0.031866950216074746, -0.026508317454972667, -0.005772368222392732, -0.020518120240015817, 0.04177565515888541, 0.08846882948292437, -0.04535977421977709, 0.09946933274379573, 0.010067579774914431, -0.004405386514592273, -0.029385870228423826, 0.0009834807199143993, 0.08924316983498469, 0.027667899601609914, 0.01450575884329243, -0.009801866507827326, 0.07209610935615678, 0.030003638211425685, 0.012528173150613687, 0.07442853798464265, -0.01833191784794332, 0.013615257918565236, 0.042040287678012475, -0.007266867510149864, -0.013541192204330529, -0.013260989835710304, -0.02673820493409259, 0.0036186520399637003, -0.02565144725869134, 0.020742354388191764, 0.07184862234503941, -0.006556655605367014, 0.04941976412157035, 0.009731952916190074, 0.024387039272650773, -0.035207334066220786, 0.08098848160243692, 0.015744870858446804, -0.006311453360123386, -0.0035307382889796226, 0.03639823898603294, -0.07055180778662742, 0.005278024585614092, -0.022366268819870413, 0.000830554120760073, 0.09151196187551312, -0.005327435698870004, -0.02657748044243666, 0.037483810340692064, -0.04341332456460088, -0.021066395702014202, 0.011721665443121696, 0.012318700884511874, -0.00482762302583058]]','2025-05-27 14:24:36','2025-05-27 14:24:36'),(100,85,'[[-0.00680488576889187, 0.07878532126608573, 0.03678997468026683, -0.03174251922038486, -0.042014365818525086, 0.04785685045628549, -0.02098459550376952, 0.0012082323041170974, 0.08483519880772884, -0.013590253301975089, -0.0018494888663057613, -0.002222350522602711, -0.006652340370169436, 0.008875493130440627, 0.0007628361505408332, 0.010116694208811748, -0.017491456550920416, 0.02029333492285931, 0.038245978557987836, -0.05303029217536604, -0.037852451484804074, -0.0006947450541932195, 0.024290917915605184, -0.046876606958198494, -0.003782118112472407, -0.006826709639517284, -0.0007070531085022884, 0.02242388127453691, -0.059876837188205884, 0.04017247923442479, 0.031778766084296875, 0.032454290031223056, 0.11196545038838485, -0.032358219909829455, -0.025739635145613244, -0.08677421063424058, -0.0309123944929814, 0.05096526102318508, -0.00556105290006172, -0.015504391627455155, 0.0642833111388141, 0.002861762501786896, -0.04215903162759506, 0.01915676517573595, -0.11358509421724024, 0.08322489775985194, 0.0028118264947833787, 0.011142692684142468, -0.05144621584475306, -0.00408169169413916, -0.026202027652978487, 0.020017868677069183, -0.02500509356067208, 0.09254429172546053, -0.010313568968986705, -0.03309271339808604, 0.10600181020218276, 0.04810796925853146, -0.02658241531314521, -0.05912997383388544, 0.004957849833499379, 0.036281385307368345, 0.020917114352290926, 0.03794580714956204, 0.04862126008234705, -0.029329743026648928, 0.018697108167305847, 0.0639134476344407, 0.008190478354928756, -0.031329804576098894, -0.06670296515844411, -0.01865516034325043, 0.06809535816477333, 0.008158291903309753, -0.009535956803009603, -0.05147648669560677, 0.020858863255186346, -0.007691967491980591, -0.013717736570481033, -0.003251211502176274, 0.014140745408287208, 0.0023010385773423745, 0.011385601232029535, 0.01042348417194133, 0.03552713610592302, 0.052000187445589825, -0.04762133001005539, -0.06127520019550784, 0.0007105080849904602, 0.020140736166877424, -0.06670826781791837, 0.022371014000061824, -0.006290070881383846, 0.0032374081294589095, -0.0030834032969639354, -0.01618686704832366, -0.027359684790244723, 0.058258780549941436, 0.0011578142030017962, -0.052690320760455336, -0.015421875752983035, 0.07090193197554374, 0.035504659924013075, -0.04150122229080601, 0.04488806155866119, -0.030435362557248973, 0.04164827489784796, -0.007528352340699192, 0.014805181566397712, 0.034279108304385186, 0.02797106579620602, -0.010575810129540395, -0.08085965912673174, -0.021474893106315993, -0.047471163142687275, -0.06471102293055876, 0.05139763819333341, -0.029602956243371042, 0.006556532526008897, -0.017866350667895964, -0.0052437891323554725, -0.027132500100659842, -0.02260916623675095, -0.04635585213014559, 0.020838291401381246, 0.013028524607729393, -0.028604547228729033, -0.07639457335388464, 0.0828115187801103, -0.03944909908634756, -0.042784129206788285, -0.010614538481772146, -0.013812940951552308, -0.03293946533686241, -0.025459243498718472, -0.07848988738109046, -0.017644713630272407, 0.01370447090366699, -0.06512915145790209, -0.034820304223382004, -0.04631037671488095, 0.1085927305034949, 0.07058085053349944, 0.009318988149832503, -0.01659382812671747, 0.030175499176538906, 0.018438702717346923, 0.02415026517365435, -0.05470066598227576, 0.018655922375096647, 0.023338708772539206, -0.03922904473025077, 0.018809296690117282, -0.0387609557718063, -0.08529666244787325, -0.034184673470267095, 0.10059788917062401, 0.0029312541322562137, 0.07320650265315952, 0.06323596374761814, -0.053981025351424156, 0.023797139315512677, -0.0032801330155744737, -0.029215053476239643, 0.03826130937619577, -0.025931207246313925, -0.03389215244073134, 0.028351838229849335, 0.04062783158958553, -0.01648907354771549, 0.05208771739942877, 0.004306762008379528, -0.03695734212445569, 0.008757720883154435, 0.006747442545785992, 0.034758109198142366, -0.02757929425200921, 0.012319112037456706, 0.025652535055892673, 0.023285474760844242, 0.0043746204182277485, 0.012026275373428435, -0.0376053547678056, 0.08770365501528916, -0.03301202519762773, -0.06803755797408662, 0.06643772396719011, 0.02992133224690806, 0.001767350625958616, 0.016944881318358286, -0.001771098409801899, -0.008240228363034898, -0.010962707375359919, -0.013435052815962037, -0.022216656709050205, -0.05995939514727701, -0.002391793827212889, 0.0638934514378291, -0.012278765682695461, -0.025337321409366387, 0.01859515972924447, 0.014377017365213771, -0.016137927168748314, 0.0017618424283088582, 0.03828386672126094, -0.04756264904883243, -0.05195734532380561, -0.008707777736799302, 0.004415138117427788, 0.0005865999407452866, 0.019857989285459926, 0.007345194905266855, -0.011811516161698949, 0.05124404744323219, 0.03026740893471687, 0.038520751910915814, 0.04247572424717199, -0.07306283785633723, 0.0012157154718771715, -0.04892462691425422, 0.0034587765020084793, -0.029590616437735046, -0.004549766373880395, -0.023265675460035114, -0.03546324266650936, -0.08952238304576712, -0.051338340993339344, 0.010107738455841947, -0.021008770099853483, -0.00921176560970332, 0.017191247566959802, 0.02692778558089934, 0.017254381980570027, -0.06251571589612379, 0.07181911771411155, -0.0006584242134470206, -0.032276067766534425, -0.0393447863956351, -0.04698666119063196, -0.02334238215682354, -0.044981525440959444, -0.010050719084768876, -0.02319731804708444, -0.045061447100507364, -0.03391540117563725, 0.04055382882828299, -0.002160274987563808, 0.049863913079383745, 0.04841161264637493, -0.0017256126612651876, 0.04014283664651333, -0.04080502879368418, -0.032032178497188465, -0.0026638856020982002, -0.018137449133518217, 0.10372021170353661, 0.07039267225510401, 0.00038800105063966907, -0.021832041049705157, 0.013190001711079341, 0.0138080501199397, 0.0680359467351534, -0.03872212671714122, 0.11522596070816386, 0.01846741643803755, 0.019637473501795497, -0.11012952779317171, -0.009094206039944229, 0.020126851255249493, -0.03022566702459228, 0.026498053728402565, 0.02865414092261031, 0.04179793975607084, -0.02728456678706863, -0.07798746941403135, -0.012246032131289431, 0.008920412427789876, 0.07021199104741653, -0.04570895472866924, -0.03314895645860966, -0.09611095547880921, 0.05096210467825991, 0.010647978453232856, -0.041959628785437186, 0.03789527256428879, 0.009795265568825678, 0.10633229454606126, -0.008077744235351682, -0.026501116886001368, 0.08830182746924936, -0.04476215946866061, -0.09871494605415432, -0.014603975098568317, 0.02260331347144686, 0.11394335439646017, -0.021562876972615608, -0.015317777994329764, -0.014588560111162378, -0.00039764023213378035, -0.025692013415799495, -0.03677996455778989, -0.08379362301868175, -0.05480590754020906, -0.049106760040607274, -0.009456288402566399, -0.0065220201487843285, 0.051003612117047195, 0.03021339635794036, 0.027079115786825585, -0.07443277572305601, -0.012221957486128098, 0.027710523049826345, -0.04051993569587231, 0.002074580034967957, -0.044357431880056704, -0.07630027379169191, -0.06886305339559984, 0.0349438195154106, -0.04249698298175366, 0.01275173870915627, 0.06971927057438465, 0.038700907061115765, -0.03446253402913616, 0.018433318894717433, 0.050351871980642816, -0.0018879474261974801, -0.015560380677363369, -0.0614167006415243, -0.023209202437238376, -0.05144395530057809, -0.004042214461498379, -0.04289068139937621, 0.011605943416723078, -0.023890993983373097, -0.056103682343810246, 0.0626822206060331, 0.002473380646586501, -0.04414950390055811, -0.018518746121627665, -0.009127566351271113, 0.03961794550358707, -0.01356244440016301, -0.019787297680286024, -0.039620954552415724, -0.013450836043609244, -0.017521317076933853, 0.04360737610829767, -0.021495059144344998, 0.020872848869247604, 0.08821923944975038, -0.13270070065515205, 0.09084652084460039, 0.007006177908940662, 0.03306565901301321, 0.08166401605537472, -0.02300157806806115, -0.009255377278440715, 0.021702949548308773, 0.014418037825069747, 0.012960804475849321, 0.027806052083518495, -0.028731570572688738, -0.012732617270995355, -0.0348550871444573, 0.0159580831439767, -0.01971683603738524, 0.023500794599553294, -0.010079380951221446, 0.016923472281637323, -0.022862281051406738, -0.01862615503640957, -0.007394462443505865, 0.07943373070708336, 0.05768621356843129, 0.03559143235506999, -0.003125773470030767, -0.05494511136953711, -0.11379359334486815, -0.09136665041575383, 0.035236899668904524, 0.015098599899705049, -0.022125361686621953, 0.019763973794310462, -0.03865542563376556, -0.08195442383683202, -0.08321239262186271, -0.034939680194494456, 0.029310462268220358, -0.027171536572277145, -0.08548907323451119, 0.012713539420454834, -0.04433713507916651, -0.005679843444341625, -0.030550584177231353, -0.06561466945241902, 0.02515423386442882, 0.047594176425570636, -0.032677073874169425, -0.08327642734528731, 0.009500470467922413, -0.0006683070018303337, -0.11536396212037757, -0.09849232453751838, -0.0005875953166627578, 0.12366215525494169, -0.0031732208493629325, 0.04833994558031702, -0.014064503145109198, -0.010762492901649861, -0.02493985642013314, -0.09656623869498587, 0.05166837443079997, -0.004778344740051873, -0.0650490344055731, -0.029156625022610697, 0.07098901102296482, -0.0038411225990501964, 0.021908711673980154, -0.006187032001301898, 0.08179733405292804, -0.022541110931100252, -0.006024679763745913, 0.014546549160208458, -0.02812703733219365, -0.030959514213649907, -0.013610801107437901, -0.011961235880202665, 0.10782737998604136, 0.01520311249226277, 0.01584469971915788, 0.0605088937564484, 0.05045537604584587, -0.01918245030831981, -0.026500215073165606, 0.05258306515385551, 0.061445678893980074, 0.004498883463399329, -0.025103932247471473, 0.049967874063090265, -0.0633682296301964, -0.011081886450669898, -0.02840175958239427, 0.023679720278253824, 0.040053993051976954, -0.014213757678491801, -0.04467706140343543, 0.0395452263225541, 0.018659053168658127, -0.027034993090814592, 0.0844243930006119, -0.01740865961144782, -0.0031395693276411673, 0.016439134158913838, 0.03568626098079303, 0.016995653381011624, 0.0422887063012919, 0.05136299054418348, -0.05983979071691283, 0.004416676084068109, 0.03646782308699076, -0.035138463791838444, -0.017949630077235695, 0.0791351464892485, 0.06181107541877367, -0.018404681828117844, 0.06710689915175254, -0.026441245531835203, -0.06221094524223561, -0.04010762085527687, -0.022886877996502117, -0.007484251438498396, 0.09578767361344566, -0.07026226410696741, 0.0011570818558280889, 0.07530488284400692, -0.040871823064386206, 0.0640386673527289, 0.020874237661014674, 0.0032286135755334997, -0.026636472980563503, 0.048782540289894524, 0.03111402781888639, -0.0031165772336380956, 0.049702112826434316, -4.591843082020256e-05, 0.03359599409942468, -0.012758082962455848, 0.004357324023793203, -0.029232214974504175, 0.013991405202685207, 0.028219178555666125, -0.009590370686498022, -0.08326780000249187, 0.03307042359082882, -0.07489972839732742, 0.06769230193595836, 0.06842817519785366, -0.023725254311352785, -0.027605543017615423, 0.010003529473605598, 0.01799274123984924, 0.07742270611959333, 0.07232528722256741, -0.02050573589402328, 0.06784707105483163, -0.0003896586718736928, -0.0010522190592858144, -0.05054253325037938, -0.027167929320934103, 0.08081964869725182, 0.01107257222709788, -0.08503691029074625]]','2025-05-27 14:25:23','2025-05-27 14:25:23'),(101,126,'[[0.018656841090946653, 0.012416612295920238, 0.011765545880470636, -0.038618152976992975, 0.05098215059425836, -0.004442355817365283, 0.0050312454902630265, 0.04368316475111446, 0.0019498327875830223, -0.013659506565734758, 0.03058461233132521, 0.012417575788790295, -0.12730779957228905, 0.01136797244714556, -0.04079989503863103, 0.050161573386959576, 0.0634709514664221, 0.03655014291377033, 0.001234715064563433, -0.07528377245080634, -0.0032772848272002585, 0.013130022676024825, -0.015304216153697259, -0.09361856159417511, -0.06749674968599598, 0.0016244049455094087, -0.049523562876527184, -0.06075037890034444, -0.06828596252691758, -0.07004737846506084, -0.009884079150084065, 0.035636206497447795, -0.017623943184983625, 0.023706541820591193, -0.0017305308282168244, -0.022409837679660604, 0.01060689695295581, -0.021455499564490936, 0.03597714667957077, 0.0240342845617476, -0.024012083337573143, 0.008050751417109387, -0.03624314619754612, -0.036463707433706166, -0.03296044106769277, 0.07715053726550541, 0.0038138837815050136, -0.003862045319827361, -0.031792301892670044, -0.03271620034299833, 0.03379202452977921, -0.004494817951719157, 0.046327626622529816, -0.05459000049428662, 0.051940766240341885, 0.07452553396609032, 0.063662337425555, 0.05620740622499679, 0.013079015216705993, 0.0326933973289355, -0.11256200145000775, 0.07967236819674144, -0.04678628277793895, 0.007262353194207394, -0.0137605747661334, -0.02943522929062819, 0.04310581969381914, -0.04239153912972963, 0.0016343659311007148, 0.0028325904068842085, -0.05549247983761244, -0.0586048574607681, -0.0485254220060681, 0.013870564973413635, -0.03382066092178436, -0.002986477202546213, -0.062432035661575354, 0.04812534705588997, 0.00461568807984707, -0.03841835034673839, 0.003918887205502957, -0.03089190470042141, -0.020694180838151183, -0.009081139418903846, -0.03909829743475759, 0.04066591186689895, -0.025602414813793273, -0.04340567461088032, -0.009076593493893436, -0.013677660910172086, -0.005432679709762187, -0.09158244849186499, -0.07287808906485473, 0.046904661349150986, 0.03027338211759361, -0.005327904315904871, 0.02626903026379762, 0.009217594751884675, 0.14565596648390802, -0.014917683572836349, -0.015796687868443515, -0.012022343464909003, -0.013174687227983652, -0.020627914755077394, 0.0610717221197611, 0.05451883831577957, 0.009348407518351198, 0.09638494987126635, -0.05640001673219523, 0.0346715394032185, 0.038592336819830535, -0.047454961507560574, -0.03305944284323082, -0.00607074211670934, -0.0701575039178038, 0.03403111963640375, -0.027447114698195052, -0.08195366769357057, -0.0033316115666350865, -0.07618562693912612, 0.04458665476596012, -0.02991250109282811, -0.02249401068136396, 0.07741629774498851, -0.00048468356808116855, 0.0013773948340725832, -0.013177155195574636, 0.04880014433218151, -0.00954756537372538, 0.038659074689402176, -0.03156890155020737, 0.0015447253170426725, -0.07101129070089358, 0.04440205833873852, -0.03816608925158048, 0.0029266950385745615, 0.014644126035165416, 0.061213710984154505, 0.0063538035312758825, -0.026230909914771214, -0.003089924779515686, -0.006896576074008635, -0.04620405210935477, 0.03600148666920215, 0.006417170224216766, 0.0035237384926732293, -0.040060964154235996, 0.04910783719559366, -0.03745292000679702, 0.03128737082072275, -0.027733323452909485, 0.012816254250934783, -0.03888910101112357, -0.03317560925997515, -0.004833338917522592, -0.012174177989305352, 0.03165303261533314, 0.09469623937768533, 0.03642777617402979, -0.031878408170600156, 0.001604939034608053, -0.023663600861971182, -0.010951786512273022, -0.020492988010349603, 0.0037264876917105, -0.005609434521182276, -0.002333438195328372, 0.061398135471408, -0.08014978258330514, 0.02811474711020588, -0.04129370662703119, 0.035210105707219296, 0.045297043615649575, 0.03666308231086936, -0.010399945184637122, -0.01730414113479328, 0.019300724819070074, -0.004357631873873879, 0.010448051681201387, 0.023329062298416837, 0.02718143599503824, -0.04955297719204657, -0.029492785146537203, 0.001300146609743247, -0.00019650431842737568, -0.066363996595141, 0.04561903265836107, 0.04516839477658653, -0.04413480491709332, -0.034659690223221344, 0.08014571473527922, 0.0575578898330247, -0.04154193342342525, -0.0683622954854411, -0.0006994444513537403, -0.014669809043694016, 0.0035963189138135438, -0.03782906594580412, -0.03836157241434362, 0.04263688907690123, 0.0479917580879872, 0.020444800785873483, 0.09585348762350876, 0.027871372375838612, -0.03952290108916624, -0.0892889454509581, 0.029491768184530722, -0.06183771887133066, 0.01348989931975712, 0.011163175170500394, -0.03253074002227844, 0.03664918872271485, 0.031956879894580584, -0.042182351093411126, -0.02268639892470119, -0.018680103310534053, 0.10025765861435959, 0.02324100387280006, -0.06955152875898997, 0.0016590917372458955, 0.010305886683182115, -0.03021851858996567, 0.08786768128727918, 0.0010752923785563608, 0.03790816671844835, -0.09939171861108516, -0.053115233644922454, -0.013049569448753417, 0.011988000553108728, 0.05971653322772795, -0.030897587106684422, -0.0358062886751666, 0.04005249296556346, 0.023576580366649683, -0.0404041647178909, 0.004569187229997159, -0.043400675770831974, 0.014697816387035365, 0.03489756078178035, 0.08326413541926514, -0.02047122712023981, -0.02460415023043031, 0.03854231067642724, 0.04020404336964666, 0.05244773333313102, 0.005728876184636137, -0.0020755811880987193, -0.05129699783780683, 0.020931954942581734, -0.004913959366897127, 0.037491614886936364, 0.0462725471215273, 0.03783482383790678, 0.016203946554362265, -0.03701790769383132, 0.02185352381602507, 0.04027921468497101, 0.026332656439312322, -0.02123217470786792, -0.11501353828989277, -0.00809800607694142, -0.004219570369971476, 0.036781993476616745, -0.01590664662329056, -0.05958890764115802, -0.01678961497389412, -0.029814212239109034, 0.05225913615640764, 0.03180283426413097, -0.006174180782156076, -0.06077128847792922, -0.03006745674701136, -0.05791262714917373, -0.009507596670041835, -0.05797890371639192, -0.0003996298982484882, -0.061100327059333055, -0.07732355080999753, 0.029078564988739043, 0.01591399181485489, -0.06621139777661812, -0.042974608529865545, 0.009301692267748376, 0.07245022693836758, 0.030551381787245424, -0.030173120147899073, -0.012255193166716423, 0.061105627842740026, 0.011260021405950485, -0.056676949115947464, -0.03023616340498532, 0.017362802019521704, -0.021952116709931652, 0.04588269630896484, 0.0037858884949297216, -0.005501949500205633, 0.03338475326288719, 0.0006923749927870446, 0.028386615652214505, -0.0018413389298118068, -0.03023917654808493, -0.026389771961156674, 0.05645577560575465, -0.03489282404534192, 0.02587233330494411, 0.03876384903484505, 0.06757689048576436, 0.022336918358552664, 0.03889429695308657, -0.004000257271201856, 0.06863823816596228, -0.022787294136717286, 0.07185328491836596, 0.027179706111212783, -0.07468777819745817, 0.042244601749180974, 0.07533481765304499, 0.020012489188504377, -0.007356866707529218, -0.031920185389192134, 0.011372499500696057, -0.0026642381129908556, 0.0036378211857187163, 0.023426795492482888, 0.0411395771234264, 0.08234479337809167, 0.025570127842709192, -0.029861575409835573, -0.02789734369833812, 0.008902393144255604, -0.010902446031913265, -0.0036201653623474514, 0.07220163529374851, 0.03205035233236382, 0.036628157529055065, -0.0644476543584188, 0.0511527276235927, 0.021488618976640117, -0.17865889559518286, -0.07950069662273208, 0.03248697710673773, 0.028625318651838604, 0.03461283867874137, -0.05667154349109652, 0.028974973254784115, 0.06411317660290196, -0.011317234430337724, -0.03740840013603087, 0.03671937377896413, 0.02301381246372354, -0.04570060768908293, 0.022233945189117144, 0.002067811650789934, -0.010721118560914554, 0.03881045315351727, 0.021575993836042227, 0.07655614498942105, -0.025882043719484334, -0.0804807376663047, -0.05563488806778172, -0.004707683825892026, 0.03776802725712652, 0.07878045267730972, 0.0038226241505849336, 0.03856590838863533, -0.007550811846309359, -0.019428616702907676, 0.029754014378812053, -0.07446714147545846, -0.07398410758749811, -0.007258870885646029, 0.024965509332180297, 0.062384051829500534, -0.006409406191083789, -0.054248309647424844, 0.008209245470026522, -0.03843776698216109, 0.020305237952493473, -0.022176339009315028, 0.007780128915662311, 0.008496466993089676, 0.008090145589679994, 0.04041445176037294, 0.00815274274642216, 0.007842667361195856, 0.029121996605316818, 0.009365907652178172, -0.02187336401088139, -0.044750199031233145, 0.015126646200050326, -0.021277889771095296, -0.017157885223630414, 0.008807050335112001, -0.017331375796692593, 0.03512585931650516, 0.06062346204193573, -0.031819858417802334, 0.05984207037273405, 0.003751690264322121, 0.05121550248658239, -0.04581498131713542, 0.03146785746334084, 0.018798475591259453, -0.04828554897592933, 0.023640554615758355, 0.005523476069688161, 0.012386263843135107, 0.020897369847045898, 0.013748168878068782, 0.036999602377714685, 0.019419690502368324, -0.016488038560323003, -0.005887294751713615, -0.0647210263267339, 0.04005503432216522, -0.029301497738361625, -0.0032510057950627066, -0.08196988037446562, 0.011253547446785523, 0.014361642296955131, 0.040041987852877964, 0.007831068752249785, -0.07407600740362184, -0.06718793711596224, 0.10329509976702539, 0.07649221687054773, 0.037334122069809114, -0.044528014849520486, -0.0689742801558231, -0.02832901156924127, -0.07043597956761123, -0.02479490504407053, 0.015860254284335157, -0.036775216525678715, -0.07719166027348703, 0.04009158624318988, 0.011278735603698598, -0.013457596622456443, 0.007848359727396044, -0.07415779211723163, -0.03446661841366945, 0.03164716149447099, -4.849572042499225e-05, -0.004703718198273974, -0.011981181665593112, -0.0409531438741065, 0.008982684915703303, 0.057318578753025595, -0.007122650397499687, -0.00563135581870134, -0.05666764758303871, 0.05952817508949681, -0.012678914056166873, -0.025277750217431737, 0.027204205459838995, 0.058365424764693995, 0.0068361816360042165, 0.018181471112540294, -0.06169648067167605, 0.008032937283157732, 0.07505645942565481, 0.008158947787283348, 0.09376818291568932, -0.027725441473152045, -0.013183962550531414, 0.060559152300206365, -0.01941945775436272, 0.036043943260351034, 0.009805382016999105, 0.09428243439200529, -0.07020423384620877, 0.0009993643701101795, 0.01749309791766947, -0.0412692659896136, -0.10856157066621613, -0.08770781066620276, 0.010669666573873303, -0.023305615557888053, -0.06795010086434038, 0.053672147201617476, -0.03313777198284745, -0.03729303680474732, 0.036106730704314, -0.03331387625310773, -0.057523229251649204, 0.08198739308926588, -0.13108095926750674, -0.019817372970795125, -0.011500098876904992, 0.01422649748202389, -0.05412386704709376, -0.02955832782364762, -0.033531891939008254, -0.12345442359146333, -0.049076716061366495, 0.047038137088294275, 0.019970695195281368, -0.010087145494489335, 0.011729043234924642, -0.05370821265834213, -0.0135814384813136, -0.018182934699098072, -0.08731331328084367, 0.04873341484992538, -0.051381072288552855, 0.08249981613079906, -0.04155698446112115, -0.0027545469602023825, 0.0070801712654403525, 0.1013568750241184, 0.08720043678861103, 0.0003518195787634303], [-0.031164068367236966, 0.023731810137172012, -0.026398767391734912, 0.00946545918735291, 0.03116172562161653, 0.0447445707627023, -0.0021641458516985504, -0.03268645604693711, -0.03595369901163419, -0.05815142127419424, 0.05147992532557559, 0.04330721963648545, -0.016334202889184943, -0.026006566512918404, 0.05347495817497936, 0.05880165798995442, 0.0017995936567134821, 0.03890282779630741, -0.018198620903654168, -0.08989179303455617, 0.10003027582286317, -0.03416346844304141, 0.035623997413284855, -0.05175885941581376, -0.034534692876796884, -0.05341346937272589, -0.025796624627145503, -0.022731217167194506, -0.07225127939774142, -0.07518251429738049, -0.035587169091246505, 0.031041872680395377, -0.06366549262079409, 0.038732318619873626, 0.0014247009765260134, 0.01016384699442094, 0.03806105132629096, 0.00024405981051931226, 0.04402461405757294, 0.024158836425853293, 0.011841749075633816, -0.007230903153576718, -0.0015959091798341911, -0.05956476151333334, -0.10556002762602908, 0.01473850441360625, 0.0021536668392559163, -0.0010606859740139244, -0.059674759284595355, 0.01077935077711715, 0.02079137116439899, 0.0015958618136679243, 0.02555077166890323, -0.05202408588790309, 0.03852633143306205, 0.08748282500261459, 0.0495342826062417, 0.031787554476715, -0.007649241134045623, 0.02188834901982219, -0.09273560953920826, 0.06527348224059708, -0.05588744483641506, 0.02037745552980281, -0.0297379798627769, -0.0711874563550172, 0.06432377707375618, -0.017089502272788472, 0.05146293966798351, 0.028927480099374753, 0.026783798687035214, -0.07207925149661146, -0.07576963822804376, -0.008634241613194423, -0.07915902274682099, 0.01621434994796379, -0.045866288793794986, -0.018573209087058493, -0.0018119370540894532, -0.0031205928028714327, -0.003751252255085218, -0.014800128547763343, -0.031811288685234244, -0.03818368909735104, -0.09983348519074646, 0.040613323814663156, -0.06309582349832212, -0.003200519825149168, 0.004103311435756425, -0.02391000616573139, 0.002714695583564714, -0.05770510267080808, -0.029542653822594914, 0.038264434125801765, -0.008053392571795649, -0.050269925782688386, 0.04436355431387605, 0.002853749866377761, 0.04975763137259985, -0.03472255761802597, -0.0005241959112069964, 0.027891694819704882, 0.03537639716979807, 0.016963042127295047, 0.06419632449430288, -0.024070308309256626, 0.029826850820196073, 0.08026917140384202, -0.005724888378682822, 0.014135227868402073, -0.02936961243587562, -0.003664539841528778, -0.06150713521535091, -0.03384376035393047, -0.003369503134369644, -0.0030324394804633983, 0.03265232233346861, 0.04407140882246897, -0.03280759313755483, -0.05481055173917682, 0.03265790101527337, -0.015505237839377815, 0.06915381481719858, 0.06753672487872107, 0.020818251087833476, -0.0009073662048715535, 0.02186501328857472, 0.041227324661385276, 0.009295833427512194, 0.04824152910797893, -0.0336816086743891, -0.006249341984389628, -0.03295296065367173, -0.03863278050107359, -0.024577058622360214, -0.03517228658538336, -0.021999286595970446, 0.017663317062574662, 0.0006955776024971754, -0.02233900125149982, -0.03911259525429343, -0.0004125781042820732, 0.032298513612021164, 0.07268295809653158, 0.026251123292261563, 0.027602956684893376, -0.021003198674695658, 0.06862965931760169, -0.05895721750210169, -0.024638007600687028, 0.0026893877657439397, 0.03905394240726469, -0.03407993858475176, -0.03974353664797309, -0.010265577490059612, -0.003867479804977184, -0.03066600485865794, 0.0502020854030917, 0.031121023799759027, 0.02223461524317457, -0.04165045940599359, -0.04898664551767899, 0.010854335929381042, -0.007234159389546587, 0.005180478956021444, -0.00825907375813626, -0.011822420672421301, 0.02492779681328331, -0.054995782019348786, 0.05039218763179397, 0.09928794725037768, 0.06500509200933868, 0.009661379936066913, 0.10068591378526559, 0.012176573738379068, 0.03338860608092577, 0.053508646796853736, -0.033900280971633286, -0.06458403536129485, -0.01844868869885028, 0.05008131521230157, -0.0077245014611802085, -0.011237563551143661, -0.007254912536966652, -0.025860952391999353, 0.024153767494218832, 0.00024118475941130476, 0.02279557951686817, -0.015282613850547938, -0.050182796095762455, 0.07289347439105096, 0.0242065574624452, -0.022530201172309226, -0.02999846971823954, -0.017235549455799106, -0.027608818060007922, -0.007371274666918329, 0.006888587869966122, -0.016281880567869972, 0.03189375393254876, 0.008116977514867408, -0.007877727249833955, 0.018634944494114118, 0.05088588443094954, -0.006081791689659701, -0.010708082741139342, 0.07306455797623122, -0.0688845644765083, 0.01307210554420104, 0.03328748307516556, -0.022362914398869404, 0.011581590783335044, -0.007116733400463679, -0.030272092783104554, -0.00819546024499596, -0.08857112206826451, 0.0663394705937792, 0.07851691797478053, -0.0703346789049243, -0.02782151169448776, 0.005616560076820742, -0.0740137939924729, 0.06727564858500942, 0.0366712949268893, -0.018096382161533017, -0.05645826277637998, -0.0817475190747287, 0.00464896478416524, 0.021879418617871117, 0.03346338748349032, -0.018178940637492244, 0.05041725410771995, 0.08263544673125507, -0.04233663426060386, -0.05220351193309759, 0.03161230266890326, -0.010970392058861756, -0.0013654631009555902, 0.04065171897940786, 0.03165587051974186, -0.011558723450842877, 0.02405957648929959, 0.004406939087341721, 0.018682021952319924, 0.007491576458953154, 0.005226060620770297, 0.058867092469042315, -0.002418686742231246, 0.012098398512409295, 0.007369689028114253, 0.07746500413957484, -0.02080451339592827, 0.08736372089792681, 0.002980154751343875, 0.012526988636421295, 0.006063301592405719, 0.04186465071354015, 0.03245380546773684, -0.034685263152764045, 0.01575126672909479, 0.0005820783061899852, -0.0030602716142086326, 0.02942534211378617, -0.047189242358194376, -0.021081083688916556, -0.008831481096124808, -0.04228463673585758, 0.03244745389039362, 0.03950212859092081, -0.0016352653890555659, 0.0843160524431647, -0.05828769749376354, -0.014631153132903911, -0.022611753681118216, -0.04210413405018539, -0.08118287226956883, -0.04427098729180024, -0.02386525190520439, 0.042005212443390734, -0.034465427001148734, -0.06124202903828702, -0.04542150695935881, 0.004917086983070072, 0.0022357360527913636, 0.003862731158847954, -0.008965819813940621, 0.09310929400623397, -0.0006406414958325716, -0.01914329172368042, -0.10373355216627134, -0.06557829179080732, -0.035481342549991614, 0.10361821329587981, 0.05863829734540738, 0.07039664287252825, 0.009490570773913435, 0.015632541553737136, -0.01254423819122543, 0.06253271045473659, -0.03738363695690833, -0.06505864735466442, 0.04645617650266773, 0.027867768139144936, -0.018397997878817834, -0.017548671392267227, 0.07083433030783913, 0.009027075544582305, -0.008730431019223779, 0.05184011870549824, 0.01927490199995048, 0.02309044969060146, -0.04873707845052627, 0.010527834178708397, 0.034393962733910675, -0.038279122148407944, 0.054794534456539534, 0.05895409584619154, 0.0025801668372009015, -0.028340939599584867, -0.06385545049546583, 0.0012621542030104673, 0.026130443322740515, -0.009809125534467973, 0.07041518635069978, 0.03897002159014236, 0.0757109162113754, -0.03487095356140832, -0.021440117725531532, 0.0073400137490261105, 0.007133267951710358, -0.03581722731264855, -0.06509807404925226, 0.04787125500492444, 0.0048788835385221675, 0.08423158127630098, -0.07900722846896997, -0.0032974366401604806, 0.020683531185155802, -0.21544025861868227, -0.05168410808700557, 0.034414701596296476, 0.042966700507973445, 0.048813733448112046, -0.05241197719743322, 0.016735182297482908, 0.0765269856344554, 0.007516596320556781, -0.055432007870100566, 0.008202250147338119, 0.03399185555974922, -0.00613834087743106, -0.014796128738167475, 0.05801070616818622, 0.012104699716210606, -0.0014145858565353347, 0.008114239299350838, 0.010754048222203738, -0.06278425336768216, -0.0321594495552373, -0.06738702373431271, -0.004572528197235027, 0.08231818063116056, 0.06640331116378002, 0.0244693584860841, 0.0746340170993859, -0.0018874838337533675, -0.019241921615038383, 0.04818561297277895, -0.1311433270698112, -0.05916835933075336, 0.024352673815095465, 0.051827120827999486, 0.08684902660208074, -0.038707531829881785, -0.028612406376118876, -0.0019040014685120941, -0.012211627708792179, -0.019695818805027247, 0.010876866435801978, 0.08392648903278097, 0.04097842823899939, 0.015596908663514096, 0.026621881582793456, -0.0033541647667821805, 0.0008320400913949301, -0.015853932518556258, -0.01977296400484169, 0.0012453108318781674, 0.0007818009415908125, 0.029078345098154247, 0.04822822748554094, 0.03225304810715625, 0.011268796650811246, -0.046389316527528375, -0.010073088908790185, 0.03879009030584101, -0.027550589252943864, 0.09112986943638099, -0.014820317060407751, 0.04356852148336981, -0.07194404590276857, 0.01924151110826407, 0.05553369926985597, -0.002911161607073717, -0.019739946027734146, 0.0190219877237149, 0.06391961586203533, -0.003635561521744277, 0.019532925807391608, 0.012978517518096816, 0.0553098723307717, 0.008559375252268152, -0.011563066101261248, -0.03621298892421807, -0.04094031576756447, 0.07925236567181088, -0.01365958133781372, -0.02987475831407741, 0.003950957034193207, 0.0014041975352642238, 0.06793431798205292, -0.04685259071475026, 0.003224687471681947, -0.023404836228524517, 0.03186746646211456, 0.0646899431016919, 0.04984378366244409, 0.06209890253399615, -0.04639924086712715, 0.05017314241997092, -0.1139392979180529, 0.012186571758680919, -0.03624427465295929, -0.0422451408716301, -0.06202270766488268, 0.040677991412963875, -0.02188217638132932, 0.005847097974636729, 0.012409884436531437, -0.07517605445451439, -0.03655624777193446, 0.04041826242353714, 0.0030262138369749423, -0.08649055945577315, -0.009295068802256744, 0.0358499866554514, 0.01613988883090447, 0.034750508167186875, 0.0035654926768013202, 0.002870899425942, -0.07419646198860301, -0.003266898244264809, 0.04303331688568628, -0.02951881736330405, -0.005489260121680966, 0.038793142792111546, -0.0006899823331361696, -0.02681111768731256, -0.08013057349028173, -0.04484894774890064, 0.04408376011420598, -0.010667382422969655, 0.08453761783577071, -0.06925527765640564, -0.04091896640792457, 0.12320131716575793, 0.001152820309920102, 0.02176637136771421, -0.03209962383171053, 0.054411743656088044, -0.046276341454386735, -0.020915184819332744, -0.005882262842026418, -0.06612527327148138, -0.04358800025536412, -0.07416735059244661, 0.032415614804535385, 0.004567391599648754, -0.028635033870404072, 0.058914440591055356, 0.01198799324174861, 0.011401428682953635, -0.018317189695478756, -0.008194146021843032, -0.041731751776810065, 0.09586706949394035, -0.1625322809723563, -0.001377350974903197, -0.035080582680115074, -0.015804450663529476, 0.050017047594960444, -0.022700197591197076, -0.012964115196176055, -0.04881702351705782, -0.04809270010250501, -0.008180385774620554, 0.010353284593107656, -0.031147711251152812, -0.04965095975879125, 0.03427265121550607, 0.05462651839450798, 0.02970411681311564, -0.014644450244278446, 0.03672672085986062, 0.004124047290766583, 0.04921159420787549, -0.028532154557272454, -0.03608697387031877, 0.021151722431542532, 0.052365332801319, 0.061473554858999434, -0.004352798055610883], [-0.021089298569246115, 0.07154003835116841, -0.028430907507005457, 0.030436237935831372, -0.0040546735643304955, 0.018211855902437672, 0.0165413723603592, -0.027306710742642695, -0.011669014805857879, -0.011041329023785669, 0.01780015231453039, 0.02929860047635815, -0.08107788413709723, -0.019490268183163083, 0.04427672888328617, 0.05018479225259414, 0.022622179586741224, 0.0056862270574434, 0.013351533289989427, -0.05735865519689918, 0.11097806379055176, -0.025084638298070273, 0.010047885582681737, -0.04952985597660055, -0.04070956773591822, -0.04875331166971021, -0.030060782991516155, -0.06899327602212833, -0.026392926364352327, -0.040888915556497804, -0.0015371240474211206, 0.021594002988635178, -0.029475883311370295, 0.06554333356435436, 0.004829563555085886, 0.06282002660770307, 0.018494871983968205, -0.006787068036976352, 0.10040586972662453, 0.025325333813873238, 0.03877570708938056, -0.0044276437091847285, -0.014741609415879812, -0.04749958278329577, -0.10140395273473808, 0.060526263251147974, -0.0455072042365716, 0.021812489102497824, -0.021246501830427356, 0.03757989423135278, 0.03336207309050289, 0.011449299177641672, -0.004064586575763245, -0.0430540579118474, -0.00627863143050797, 0.080758532955252, 0.04261668332783603, 0.06733199679575144, 0.0006284582812020575, -0.017956216674653906, -0.09389329762742642, 0.07221053018671834, -0.0443830107974674, 0.035506083427686484, -0.021570862514297302, -0.058446460331551674, 0.0438845778157276, -0.0669457281105903, 0.01855397180440319, 0.01529023883825295, -0.05191363408244812, -0.10960196538902972, -0.024381188162276076, -0.009999956137073523, -0.07855380007145481, -0.008282546546158133, -0.07266165471488652, 0.029200538601343928, 0.0012978867614122343, 0.011042845341690264, -0.04502755231519397, -0.020866519546579015, -0.01956526273952781, -0.037336255861721825, -0.09691573154334457, 0.020187385364024608, -0.025006508022880916, 0.03218428645914354, 0.009424253290797468, -0.01689237169057499, -0.013386492564573804, -0.04564805221351217, -0.03101222592302918, 0.023013856804954602, -0.004753562276691303, 0.021614699397929465, 0.03202355011073942, 0.0036474461901059374, 0.08780994325298536, 0.0006213626990008918, -0.01851056886701346, 0.003392946486865878, 0.027314067877212682, -0.013073789405910068, 0.061713087935280755, 0.01072492485234164, 0.0289022928355962, 0.11230173616557418, -0.033372344814203085, 0.023430852541864434, -0.01005251933048887, -0.05217352631593358, -0.0061297259364126435, -0.015468002173127408, 0.007858533682366352, 0.014911826076446207, 0.04830796644092403, -0.005166611347344519, -0.018085752121964144, -0.0731356038178291, 0.07648912707831883, -0.014882452404932538, 0.04713768159288215, 0.04872953939624542, 0.06310274009070439, 0.0094134794530543, 0.022958489587256256, 0.0258983390441403, -0.02535461437814715, 0.03821632544344491, -0.008217102963700143, 0.0008371799811239745, -0.00031332061761309924, -0.023765335312799257, -0.017738003231993402, -0.029119678288874587, -0.016058129159733845, 0.07993394863790623, 0.02744848646672226, -0.00837401775870107, -0.0643136462973483, 0.010899498432939822, 0.006325785675213753, 0.04486681596678985, 0.03258838518071792, 0.07535483482895969, -0.029447069945924442, 0.0565744727710903, -0.027904745194111246, -0.010427319198867233, -0.0027508542298994025, 0.018176012940390257, -0.029838998221159305, -0.05596006474645898, -0.01346991498876571, 0.012095207376637513, -0.0019271299075494207, 0.015613557053563489, 0.06775486327665373, 0.003452469862110289, 0.009335980145677216, -0.0405074319184084, 0.041916167732723414, 0.00960606429665738, 0.021567254608756765, 0.0012255957441733203, 0.021212642385112595, 0.03702238470598793, -0.06710254065389042, 0.059459766373365294, 0.0819622433023662, 0.034017747573897396, 0.009879976651557862, 0.020889698261390362, 0.006358255993763944, 0.07987008372195088, 0.041846693105572784, -0.018993998282118327, -0.006095727245895569, -0.06809085405234674, 0.027731367875281, 0.0038336348988636526, -0.013039387112134945, -0.016985769890455013, -0.0028297422483837364, 0.021064791413638966, 0.01664470144493675, 0.032155702536538516, -0.02690618168613539, -0.051379807048566865, 0.06713047282581716, 0.0027090085526603204, -0.017295251704886126, -0.03131672650013336, -0.01669546816741359, 0.024562918530615842, -0.016771009728811882, -0.014222115909033111, -0.01644462728773581, 0.033547698999248865, -0.01014005177426428, 0.015919943052272723, 0.027107265059310107, 0.04402938617561635, -0.008990333650432744, -0.027477017185190283, 0.07998938734866368, -0.08373106139066104, 0.007341703707628378, 0.042570661749328165, -0.02730375625040973, 0.0031166717435852534, -0.036730536737714856, 0.007395415777877139, 0.015047699466576967, -0.10475000746449596, 0.07644241384602993, 0.014746633881568064, -0.06676430865392614, -0.018234047015455897, -0.032519718591398024, -0.0480399738775798, 0.04782205638293138, 0.04215007307054133, -0.0223192701458593, -0.07420046466839893, -0.06539597805640658, -0.025582284856159994, 0.023307279283157126, 0.056516832739164344, -0.00711173880120727, -0.011295999770013047, 0.0863286669231249, -0.0012297268583658328, -0.05053271073075158, -0.0026069632257166367, -0.04403832114537434, -0.04024450704911375, 0.033247883711459536, 0.03678724902250182, -0.02418838967081034, -0.052985640913669196, -0.008301134741523664, 0.03052828774336422, -0.009879550187147194, -0.011477382648833011, 0.0696247559242206, -0.02334851415196397, 0.006791079545774938, -0.005843683453932728, 0.040775278170375864, -0.000925390777646177, 0.06777271991513546, -0.011978937217048551, 0.042536950278019445, 0.02596103180645229, 0.045709253597358786, 0.03756055452755208, -0.032708450291641565, -0.029976088655924018, 0.006833217637938877, 0.01681416992232653, 0.031979141282634474, -0.016464913027597602, -0.03867790458453423, -0.0357719278739992, -0.03465002886330327, 0.033873175307366596, -0.003615389450589484, 0.023120998298474294, 0.041625583362704166, -0.07261251404384683, -0.012687351132562232, -0.027635748402681088, -0.05646322957113351, -0.0820691703167086, -0.08287037806635854, -0.04936063689360297, 0.020576927766240732, -0.01216893750343377, -0.06715325749748882, -0.08441151570086484, 0.00042787151461081227, 0.03703454185129319, -0.004892692757584233, -0.006540826405548114, -0.026015339929298414, 0.03664659723581645, -0.02016408361464644, -0.10086762178115911, -0.03251073041750303, -0.005436892104237205, 0.06684462694924977, 0.057844754794629895, 0.05839430032573706, 0.07593007795823946, 0.029636386891675023, 0.022930786858170345, 0.10384964715502325, -0.06902293732850769, -0.030334358663987163, -0.0324286563856583, 0.028130064714320255, -0.031133252033677453, -0.019390257706631116, 0.03439683702582165, 0.03598884779107881, -0.006096583915632786, 0.06939301865498557, -0.02646099274450165, 0.02428579979514627, -0.024300613822043127, 0.01272446268075132, 0.03285281306688292, -0.02512189615763612, 0.027404666209382908, 0.12366297418332897, -0.00770705402248617, -0.02540499204537216, -0.021500679607072814, 0.02951511803715167, 0.029269790436170857, 0.01542752380064358, 0.06143368640980788, 0.049725557418791526, 0.09574294610086354, 0.013745830811950221, 0.0019910696418224266, 0.02873494587316942, 0.027445418915698162, -0.0702050068928958, -0.052316439278441595, 0.09572645946890963, -0.002195647653917891, 0.03386663452377375, -0.08094866458935045, 0.021731445900807535, 0.028024707222019454, -0.20012861163516085, -0.0470002287049341, 0.054169260048547524, 0.039912230587235274, 0.06400044019332694, -0.039007584019475225, -0.01573594652022247, 0.07444145280695541, -0.031087127372154147, -0.027764161575226414, 0.02895817713100105, 0.01315547604513224, 0.009797050522206441, -0.032744602502735316, -0.006901068707596267, 0.003047110244054671, 0.02923449614178629, -0.014579245353409251, 0.042469650369968824, -0.0076446580395008994, -0.02290419476544438, -0.05495312990005151, 0.020738089747740877, 0.037734871231926294, 0.04141593911135976, 0.04569496828657339, 0.04136428454484667, -0.006040501767343456, -0.03256014043448628, 0.047775269994954093, -0.11848976302905212, -0.06224871393404443, -0.035662058005828806, 0.042004406793943405, 0.0616933159478669, -0.009117139060463002, -0.0029366116941872667, -0.01143717195966348, -0.010144991445859182, -0.03588291502904666, 0.012541432136313535, 0.003548458646239323, -0.002584305121699013, 0.04844659979566183, 0.015224666402025655, -0.018422153567089653, 0.010068884590505232, -0.002065936175732487, 0.007099649823702549, 0.0020280363334353774, -0.040336350690615703, 0.03178999059981203, 0.03486302165002032, -0.004047556264034342, 0.04183443620251065, 0.020035936462786133, 0.03310142269806512, 0.04668230738427084, -0.026088236247510072, 0.02631730167148997, -0.012846740751248453, 0.032171697030225134, -0.13975367425068452, 0.024928532372214728, 0.04743504949036932, -0.03827858093425591, -0.0367731898292987, -0.0067540615204829246, 0.003988352113611951, 0.02198295016956858, 0.008945533273132036, 0.009186082477558241, -0.000589314584373835, -0.0385469326255249, 0.012165538257868043, -0.047256453178224904, -0.024691128862388844, 0.07478276399634876, -0.0035530150817848715, -0.013139292011707547, 0.04263913879890999, 0.019961663487529514, 0.043473203428418025, -0.011746066034643636, -0.017852809446500133, -0.05044846197980684, 0.026220711223389745, 0.061643131145638526, 0.024181316845847463, 0.0006718659986509708, -0.07365839431854072, 0.0230980556770209, -0.03899553328244398, 0.019184050110011265, -0.00294899932147665, -0.0868663678832317, -0.09926087014469348, 0.05944127128523952, 0.010620606503341685, 0.013964092470859883, 0.007321534351816281, -0.07325148907873943, -0.013484000784037335, 0.025919888382255916, -0.0007514057678135953, -0.05116744606097673, -0.023154709769783014, 0.06088798487759921, 0.05509858336010143, -0.03570768720382627, -0.002127236486021345, -0.019511327045640705, -0.1035444482736209, 0.02499572254673278, 0.037660092817368145, -0.08084886027884935, 0.02467551178554909, 0.03991698903223851, 0.0144602858909577, -0.05108142162195951, -0.08171534950460235, 0.003332319333607308, 0.07757273573666519, -0.004369434642387227, 0.13016211223793375, -0.038582260172495095, -0.010720914590515015, 0.0814912470290273, -0.010565591763050984, 0.012395456610669273, -0.013917237915082065, 0.06633636782845717, -0.041856226621872064, -0.02197492964591533, 0.034732621635483775, -0.050987160517482456, -0.0541046003957957, -0.10442130565557241, -0.03352846902898073, -0.00014828948994658587, -0.010586275702625662, 0.1149786225126901, 0.015983867822882195, -0.0020094614391040974, 0.004755337964763788, -0.018119490195341367, -0.06460615599207535, 0.07111241675052145, -0.13723263612188555, -0.013294498455121883, -0.05005512379494139, -0.007804455002361052, 0.003083082475528712, -0.006385688545591634, -0.02870557053902647, -0.10598622553931919, -0.025679019953007694, -0.006592408232030141, -0.002773074023272729, -0.06157288838375991, -0.03849575357098628, 0.02677608427012805, 0.020781013847897576, 0.03680384206272973, -0.011941727573731863, 0.03378557137053209, 0.007130689449756136, 0.06779427424113893, -0.03396455673792834, -0.01653460213392553, 0.021368277786881523, 0.08811258168529443, 0.031611121616465475, -0.0001028386089395494]]','2025-05-27 14:26:18','2025-05-27 14:26:18'),(102,119,'[[0.024857098588121986, 0.04055056423856064, -0.048355687211242525, 0.012078954976999014, -0.027716707248298392, -0.007964915669552089, 0.017518305904790577, 0.05871089759940371, 0.015729751458759416, -0.03875362516439855, 0.09953221321471313, -0.04420226165537999, -0.11736098393610413, 0.026884593617462454, 0.05680702161205109, 0.043259405309551, -0.012123348273962409, 0.035001957324000875, 0.060200198865123615, -0.04902775139725422, -0.05168441238585913, -0.020672177380713024, 0.043824510337062056, 0.0509959200383404, 0.02319534611719846, -0.015560003058732648, 0.07764955357749104, -0.0007478904537258756, 0.021744030572245943, 0.007630176585195661, 0.022540314423618115, -0.017397856819491627, -0.03677465642526001, 0.08715120029455474, 0.06658264527582772, -0.03660409421763884, -0.037045018509082095, -0.010390379296537468, -0.022468881025343244, -0.002873430181128362, 0.017746767093268105, 0.026094356782885127, -0.056879226181076006, 0.03389995802973411, -0.0026155345081181284, -0.01569188994097341, -0.0286578340212673, 0.010459872718394247, -0.03293392948588685, -0.020980968237728596, 0.047278691645525395, 0.03668676891261633, -0.029410181531421, -0.0217101824791567, 0.030621681510867037, 0.07868017137920649, 0.03385844086598874, 0.06667229387552079, -0.012736363211208116, -0.000563896133940447, -0.03822333033963845, -0.0055560896807438235, 0.003976351960598231, 0.05296153046876537, -0.02352134557535032, -0.03023896021951815, -0.008239766671574267, -0.01462969862912619, 0.058440516977823216, 0.06126344682920047, -0.08567047088832574, -0.017752917921510077, 0.048912680115671354, 0.00015885514973838202, -0.057533935317659934, -0.02860163309908172, 0.05955715739368584, 0.08993786287536965, 0.0023273131478394097, 0.004915204150609667, 0.008523752154055247, -0.03158917453762905, 0.029323812261191476, -0.009651444781484662, 0.05637456536865163, 0.0595569052801714, 0.04771307210824829, -0.06816970726432292, 0.004208093405427228, 0.006672331998244492, -0.10711877601568674, -0.06305970742140458, 0.06322388522502775, -0.0019988764378999903, 0.024238091320468756, -0.026255600059351274, 0.006160006286159638, 0.0005822642718655662, 0.0539697694885227, 0.0032063794449098586, -0.015456645786691975, -0.03581402236911141, -0.0005085880365445088, 0.0001962481256804581, 0.02825940754098955, 0.010627731193950647, 0.03286044581153133, 0.022476861530340737, 0.00336033668715312, -0.04148786667196861, -0.029311278882727356, 0.09168101278971588, -0.008095539203556896, -0.01603732438504715, -0.0072228492002151335, 0.0016916997561983698, -0.00526585790056504, -0.06628141411669362, 0.002582074781067673, -0.009758843284859722, 0.04463845511087584, -0.014173604889972262, -0.014056773448227925, -0.03388655152284866, 0.01735893679570015, 0.02499686401768896, -0.04730266096715549, 0.03858904323764194, 0.09610610178004121, -0.02489128036086269, -0.0849254532078492, 0.006257432865839517, 0.04661724959508527, 0.0066320767924032, 0.04258503873394421, -0.02483016137136971, 0.008692902711373145, -0.012499263427309375, -0.0781531725678925, -0.013051753510219291, -0.0844313700403762, 0.010992825857711002, -0.13659320385644527, 0.032240821236522894, -0.04454291891911028, 0.10701968057430558, -0.01918086106065345, 0.025490394759961198, 0.038163119700307786, 0.1184726414025049, -0.052679104011767064, 0.03661670730846415, -0.011257205806892687, 0.02859875603897577, -0.058086716443376964, -0.017001721606153923, 0.012852420701538641, -0.01723403494083001, -0.0019739737401337203, 0.047104258753947255, -0.08712137674881731, 0.031278122074086895, -0.020092223608711858, -0.04313791625600499, -0.04934544408586049, 0.01581577778045827, -0.0013332457809460884, -0.0036044873074648582, 0.03735504398080808, 0.02093523929527143, -0.0572066178248848, -0.016535889982504798, 0.06707519351690398, -0.040479939086552646, -0.009694347642671521, -0.026028662674615424, -0.04685788452951368, -0.0335136051915118, -0.005896576860540662, -0.06113783868573473, 0.0002786340950706411, -0.010747074501960163, 0.00653963362562913, -0.004795332516485336, 0.010904142148343416, 0.05797125957641907, 0.0021808212926316935, -0.043804604492076446, -0.10464204251025407, 0.03523416870100568, -0.04738743413638551, -0.05625834845359874, 0.024112093884076313, -0.0341332371816236, -0.04811358779389936, 0.06383689923538555, -0.037125398229567855, 0.042807825514571025, -0.030104663428683485, -0.04202838692427022, -0.011414784168520264, 0.03596447852395609, 0.007845527870922377, -0.010957185163383069, -0.011812041843129973, 0.028853164527906237, -0.004896255780846171, -0.04961407845059833, 0.004421608526182977, -0.03933361971946823, -0.016743766844038742, -0.024340225100454065, 0.11368164672148859, -0.00034734336974648317, -0.01152684584502452, -0.024697286426605448, 0.03777282944219821, 0.00375696129731297, 0.08176679713647993, 0.0383288324303277, -0.0023728296012407494, -0.01777701515367323, 0.05814447639104521, -0.07800285359246009, -0.06561931212205394, -0.03321743484042489, 0.03835828151334515, -0.007362597482355574, 0.009072901732898849, 0.07743742230040093, 0.08634919754471165, -0.07571637680918827, -0.03335334627001747, -0.0140706192999878, -0.0617937342388572, -0.010661413374102077, -0.01150436603228304, -0.035092121273377866, 0.003981155093803457, 0.09954406996499512, 0.017315523219268967, -0.042985502513871725, -0.05534263138608874, -0.018082734304119503, -0.006550191342490212, 0.06445553389409464, 0.0749564028652228, -0.022358794546998066, -0.08229824500981342, 0.017508764520534573, -0.005475180707255324, 0.030820980951582543, -0.023196469505358388, 0.024575684292733112, -0.13618648543682865, 0.03938003085143505, 0.04237552498834225, 0.041979302647540004, 0.03179536631692311, -0.05375901000555529, -0.04838241495132471, 0.03973535518962299, -0.02224827984643351, 0.0035509101732608844, -0.03405381771702372, 0.06804560067928878, 0.025816090198875055, 0.000630979183759367, 0.08997833450954043, -0.02748702812909302, -0.10571262771911143, 0.016055009406574693, 0.029079043406636612, 0.051986970848495705, -0.017666489330453627, -0.020604972445132527, -0.037003857270298285, -0.04515084987611078, -0.026295472923925263, -0.04697275189575399, 0.007309324135667619, -0.031055294510391566, 0.051002719688126884, 0.029654561093049158, 0.021307753696837232, -0.07698169004753609, -0.062566706859023, -0.02961764314716646, -0.00820828306957081, 0.02125919774622184, -0.026406388040071574, -0.09873686181258921, 0.10040607573127462, -0.004695128517150987, -0.008980357535341418, 0.022528876626676297, -0.051058718548745746, -0.01866661437335288, -0.040439189386005644, 0.01448055124002558, 0.011645864742261779, -0.04136629605228558, 0.05000932570530797, -0.001646786822694416, -0.03550715573141927, 0.07358183549388263, 0.03624127320994804, 0.05861503143553838, -0.09650020710883252, -0.03567076627963496, 0.02043710192003316, -0.082871528896337, 0.04730129288058449, -0.022538193704055482, 0.08873650490355224, -0.005266068304123046, 0.10482450595877742, 0.023310778885070414, 0.049118597536140875, 0.010165607121984445, -0.040514445270065605, 0.06301110883394483, 0.05178725245444003, 0.091434794282453, 0.07675592981045957, -0.03389373675801017, 0.0029703726935916396, -0.023931919848717165, -0.002781474325678615, -0.005972238258065944, -0.03331203672916635, 0.030261739417058023, 0.04441306192141592, 0.04515461674862063, -0.004621781558763769, 0.020851405990393024, -0.018416213747791656, -0.022875034043328208, 0.02071506448480523, -0.004945211683599362, 0.022299156724402417, -0.02602788408876201, -0.0497610420917577, -0.06880808092819189, 0.039160703216528404, -0.06520810014979764, -0.012886754483898345, 0.006021830005932757, -0.009777739748899658, 0.01409038333112154, 0.05292785848438107, -0.05020506589640787, -0.015802222971505506, 0.006946363167900786, 0.04854217335334185, -0.03173241579689877, 0.07484515406942503, 0.04677996662334538, 0.006002239766284154, -0.018545025215911438, -0.07964488374220631, -0.004500074223112429, 0.05371414863019192, -0.02568902128004625, 0.059254825091701914, -0.0545016511454031, 0.06115343635566479, 0.034473742435734894, -0.056972789955346236, -0.017094043350610377, -0.0467032388412673, 0.0465726514558914, 0.04701451375791043, 0.025183544806251634, -0.02682879867218615, 0.015070754538654184, 0.06883834938013128, 0.021233556318782747, -0.08316202298579736, 0.09889730240411601, 0.011908994319638398, 0.02511276022952128, 0.00785781191653582, 0.02430427853311229, -0.0037220396362895422, 0.008848194440500277, 0.03413782342305537, 0.007154759086670339, 0.011354727392584443, -0.0038899660063861346, -0.03377932542062686, -0.04525801665750566, 0.11594541845825419, -0.05818077702957271, 0.03171248770660306, 0.0004992547386267115, -0.02555728826120033, 0.003253739246663551, 0.034329288807064866, 0.033519540981756156, -0.02631874337206313, 0.01901780849896604, 0.055208036137343604, -0.0351217705641862, 0.04620010924768797, -0.0009871991274007074, 0.016931159482524542, -0.001965706131602783, -0.004082689640748014, 0.03169616706409483, -0.0485897078734686, -0.0030756618317810966, -0.0017814118477140078, 0.06067519926408461, -0.002834917524578043, -0.013547890661324625, -0.05394188499231544, -0.03256385650710425, 0.017733727633999267, -0.006291215613330347, -0.04447477411917817, 0.027695729920876416, -0.06275525810740971, -0.03225571447163319, 0.06780295625184822, 0.05549283913497067, -0.050647061670287485, 0.08532842700026605, 0.0012291474620127899, 0.06370740187020442, 0.0282272760443295, -0.007649091123550051, 0.039516379772126214, -0.042001662891739705, -0.00533162059854088, 0.033290722014541224, 0.009552834102486049, -0.010038500200750889, -0.006190613979078005, -0.08919031664464533, 0.03901462197266957, -0.0033504495737026858, -0.016375725603578386, 0.06421645613137306, 0.0013946382023756827, -0.0038662175158031544, 0.0419698817587137, 0.0019381551991859952, -0.06558733078123705, 0.043601523348644367, -0.032360997816773145, 0.0225858338894052, 0.022981210908423744, 0.0409843218326008, -0.010102775243613955, 0.012166310455976196, -0.11434300720579169, -0.049931889780858454, 0.013293471976627032, -0.03890962040145752, 0.05229618065885145, 0.006978500225888359, 0.04772912951458702, 0.033658930094827316, -0.04699747014282403, 0.048816780583840876, -0.02277464095885803, -0.02866018275525843, -0.034995506184072586, -0.08360699592367836, 0.02600086530587271, 0.006236544983101892, 0.007929612362427299, 0.03127594203369734, 0.03517270490920619, -0.0233897423208133, -0.0430314687396366, -0.03370649798291921, -0.002732704495675511, 0.050624753331811344, 0.06692379193638015, 0.0028187018521268407, -0.029215709322996664, -0.02158753666948562, -0.12270361781691913, -0.023876649522004, 0.09110492599412001, -0.028626557115270165, -0.053285385108268656, 0.01236325189382136, -0.013923075426990054, -0.02271980256191592, 0.01524318720609939, -0.035946215124366014, -0.05062328143379322, 0.009122601463208426, 0.01128236432572508, 0.03132269796797067, 0.05271093705051663, -0.006163971512684523, 0.017697908977190552, -0.10494759667465045, 0.020637218875894748, 0.05810386386991048, 0.03197001053894718, 0.026062427347791798, 0.03552821462497827, 0.010395943404725614, -0.05935918154892114, 0.055879455209362466, -0.023270451845415267, 0.006929502149734775], [0.04199230100132462, 0.013424179245521767, 0.0221699925785353, 0.016635589965475688, -0.028713175211330735, -0.0009290823614982946, 0.01031814131067702, 0.007480209433047598, 0.05942098435499282, -0.036507587273183706, 0.10069018251050445, 0.056270517739374866, -0.06292090453270192, 0.028586914659057626, -0.024360348889347946, 0.05311604749011733, -0.03444509331593958, -0.02813576497628566, -0.01609002444456647, -0.02586761434197237, -0.060653094781183324, 0.004866418428109183, 0.03244539831762596, -0.020170768902861264, 0.030668355438573512, -0.11633791326816896, 0.09109478403166849, -0.013772681466344083, -0.05772712383463451, 0.013470284513101474, 0.004128739364427675, -0.044822289092399395, 0.005203768042192221, 0.11050494254611415, 0.06849197987335677, -0.029405301202775964, -0.0019735070254517637, 0.017182804246024495, -0.05950192662675048, 0.023558034273719695, 0.05077346961949985, -0.007030485892579913, -0.07133082396030155, -0.0007501780270199344, -0.026639835615782346, 0.04015348181172571, -0.008868735494856068, 0.01057200507602678, -0.04319475462437778, 0.023552006213687207, 0.08323182844011545, 0.015959316763181106, -0.041746461895233344, 0.015535728150038352, -0.016094026339008118, 0.04020017579780542, 0.08117661824381077, 0.03377439946061102, -0.016621128534670685, -0.06317904324656867, -0.06222379226078551, 0.02594971318035484, -0.049791622818939764, 0.02561260444518539, 0.023337893556272405, -0.0497544596375277, -0.028896796250600817, 0.020176925663540724, 0.028920002368608175, 0.04544476542425978, -0.1013354319000871, 0.010868493104295244, 0.08416061579016453, 0.03310335776569605, -0.04384418504578909, -0.09630932379625287, 0.0336678735872729, 0.07669339033927866, 0.001926850432127597, -0.04583415444926668, 0.025017817883601193, -0.031535415175618225, 0.061420804575557555, -0.04504353593973147, 0.10561791462251016, 0.07736168757985686, 0.033139174807908706, -0.03609604434491834, 0.04179662384198956, 0.026652349144903453, -0.07818746571478641, -0.03603215316968651, -0.006395082102490597, -0.009373275075746137, 0.025830045927442136, 0.029207943978238542, 0.020997715778801156, 0.011806648644005309, -0.026891412335851458, -0.024184738595752892, -0.014445835417147532, -0.03407225797684994, 0.06247802821449273, 0.03407113445498584, 0.024672418391889658, 0.047810725071875754, 0.03465323356765572, 0.08808915086304, -0.04760866505613007, 0.015396788844840593, -0.0321317687545392, -0.04408469872781242, -0.08294066583591493, 0.016185097699522037, -0.020973780936860267, -0.007954049561640067, 0.06869685043296064, -0.013003684665500132, -0.039097913889221854, -0.01159484129344944, -0.014162264411920408, -0.03701745401733965, -0.09127060998580712, 0.0033905068010042913, 0.029961416698341004, -0.012188953046236002, -0.05871654658138661, -0.06963090407434797, 0.05171826802571138, -0.026780581947631506, -0.02411075311572344, -0.013949407455412548, 0.049609671409684454, -0.011288135477330175, 0.044966207721276616, 0.019421581566463373, -0.06766206940414066, 0.042183303196618324, 0.03143058675946178, -0.007347396452565488, -0.07175365776154179, 0.025373271678557918, -0.05180180518078366, 0.020716555301907854, 0.010273910028869099, 0.13897657968783958, 0.06668406275261454, 0.030060137051360084, -0.056771288478346185, 0.13576191579815375, 0.0067106860900297185, 0.0013274958671748687, 0.05426208153225476, 0.025957203905848183, -0.05016267026255526, -0.011169087378881283, 0.029654249994769746, -0.058211511329085905, 0.019418708411479624, 0.029965795998733908, -0.11102281307915339, 0.05230466295727343, -0.010460305958439768, 0.04864324085959407, 0.007207387105840033, 0.04124018137721329, 0.050874203963724246, -0.00769026541128589, -0.0436172510212192, 0.019611039353993418, -0.006421835749479855, -0.03281133599771709, 0.04624089023444786, -0.029672080251969133, -0.01203099387245333, -0.04739242014205057, -0.02940595166280255, -0.03390318011068767, -0.031806813534518925, -0.07167166501423318, 0.005701383006515829, -0.02417492778021819, -0.06835926515755782, -0.013079221510084971, -0.020201424005611594, 0.07009502643449511, -0.01464541011904832, -0.03390263748093287, -0.04570580859867304, -0.028964936286380645, -0.016253255127281187, -0.03683154071519512, 0.026280562542166836, 0.00961169128506342, -0.02281553415337054, 0.06585056257886669, 0.0002642628645849753, 0.09687965549571449, -0.059433450925769765, -0.06585065997395088, 0.047845870783686635, -0.011012606523340856, -0.006738711090707305, 0.005237953716744616, 0.0031631547167314932, -0.025052255741853737, 0.024871050448511272, -0.039921104097628515, -0.033712205742560876, -0.021905804934260885, 0.016686609336812406, 0.009094434688894194, 0.03439721667526608, 0.027636849961507844, 0.02371427859834136, -0.004056133068358341, 0.06846600321304365, -0.0021841756361616208, -0.04096225406927567, -0.0023506938377673967, -0.050085679448499225, -0.050463892387594765, 0.0751989949513514, -0.07283447883801904, -0.02018921135773273, -0.01778261187203852, 0.03908275156165023, 0.010710112175014053, -0.0607884322074638, 0.051471402792840196, 0.03911887470269893, -0.02523792207789191, 0.037430092640302205, -0.03451093934964704, -0.005305454597284414, -0.06040872355814669, -0.05562312565793993, 0.012783727433434674, -0.04281011360972538, 0.04371175555845099, -0.04148935278654237, 0.014641921287996624, -0.04963832295641706, -0.044632799999306576, 0.01622704715364311, 0.0419420520946718, 0.0644545988371018, 0.002971997515422092, -0.021535023587928998, 0.04250343040317923, 0.0187058320495071, 0.022096946265389158, -0.048807299400524445, 0.012882101686065274, -0.04790689228233058, 0.042794095596771185, 0.013350854660706495, -0.0029979400439757897, 0.01541976712791885, 0.011570480348015201, -0.04492760100558095, 0.026248573474602622, -0.05609503614642678, -0.005182255468171199, -0.0339122274183302, -0.023162340656209108, -0.026732374859350917, 0.0026226652623867054, 0.006454062217561794, 0.00012208256404083834, -0.06858902016117349, -0.024008065652221352, -0.011080710905563076, 0.02908997940010132, -0.011688243179192308, 0.02142865598160269, -0.04578435077728447, -0.11020173077864037, -0.012558282162294628, -0.008784300044051889, 0.005641675471909551, -0.022657571501192006, -0.0007400019799195038, 0.08747020510298169, -0.0022851617292866805, -0.06565111136001908, 0.005921896781919544, -0.022641706537655838, -0.06959706623938199, -0.03918717300549057, -0.0043058240630696265, -0.09034179480859113, 0.10484700470394095, 0.02588917517873601, 0.010360711658459833, 0.0022259446484972412, 0.0045408640544013145, -0.01940500701017093, 0.08852347032742353, -0.026111542069536323, 0.020803769121408484, -0.010910529518312917, 0.040169663309285515, -0.03800917946215378, -0.025311455366459026, 0.0965762419812806, 0.11738357471925186, 0.005513540933864658, -0.06404345940275667, -0.10637621187767614, 0.07255179656293519, -0.03277395367736558, 0.005437239276989199, -0.008248010535313264, 0.010607762985509748, -0.03417317319765927, 0.0013219826097302671, 0.05912379021236395, -0.008259975347486808, 0.07961274537689395, 0.003166481802375507, 0.04176814969344602, -0.015589999821508004, 0.09512122899132672, 0.05465210710370479, 0.021257609343381334, -0.010432504009896967, -0.002059387749737477, -0.024252715146927107, -0.04260905537198855, -0.05150102481201889, -0.047034430596508914, 0.005047359363365975, 0.026357113339146063, -0.03604882512106315, 0.006161353031600193, -0.011226964407664077, -0.007731134823491157, 0.008302630046369325, -0.00899845879021189, 0.08322207501811252, -0.036281512412392254, -0.04302747508887725, -0.06593875382760513, -0.06655040191314056, -0.07605079844413618, -0.020888894164192724, 0.044916174475167374, -0.03619997533494184, 0.0032522381740090786, -0.00515765060022699, -0.01930507617539114, -0.03235613224456551, -0.056971866697453764, -0.0035194807194511403, -0.004046190073780805, 0.024816622249227736, 0.046497237574444586, -0.011532894541505648, -0.053927219840813514, -0.01876100288630762, -0.008913570278346413, 0.055233997512622826, -0.06949290915362731, -0.0017131513777210118, -0.01859788872985435, 0.039699394623646515, 0.06544963571477856, 0.02551567198764046, 0.0006792979935980318, -0.07529149941096133, -0.03062864607138892, 0.08426569117242733, 0.039774722764479506, 0.03933801364213736, 0.017634548734489223, -0.06844940430798016, -0.013997908468143656, -0.08337212605889814, 0.05443177159608911, 0.056342464879427956, 0.060733250935475686, 0.05605623811895859, 0.047126740265950456, -0.00285964445941263, -0.038604753880401195, 0.04131236156978927, 0.0038462770978822344, -0.012263992480212274, 0.0012979158061462864, -0.0524696815354623, -0.03878460433855459, 0.1302876998687307, -0.0331672176353651, 0.026256794663227428, -0.008664416260996647, -0.013752551989478523, -0.021452039497799114, -0.04279077372872097, 0.07323411173884573, 0.003727666842512736, 0.002605918525498986, 0.029733230451260046, 0.008939039092863367, 0.037106187895832886, -0.01389716977592443, 0.04678015290205133, -0.001062927121153594, 0.034356216823215914, -0.048559133247600084, -0.010501494513465567, -0.019473307052160504, 0.009608094623739937, 0.026468682886487137, -0.07300761251375885, -0.01676879687428941, 0.048841603340536215, 0.001489122574596751, 0.05956771700612411, -0.014202708590231289, 0.04655360497942236, 0.012682368717152672, -0.03625287825763897, -0.050430785015760246, -0.006858797490321632, 0.05271041783482094, -0.021098363163128946, 0.11108072837029069, 0.01819845235839399, 0.056828097639598694, 0.055413847970776225, -0.005033704050802476, -0.015013304396813002, -0.0826990564591944, 0.021803044424445653, -0.01880295929722042, -0.00291204105811179, 0.033143272358236615, -0.06376372680736558, -0.06552883183181243, -0.025154365791642385, -0.061969542393494836, -0.04447843226925359, 0.059375535634632465, 0.030081083951253706, 0.004073768100589855, 0.022402732045802367, -0.012418730659424785, -0.08406605907699477, 0.019410068076153197, -0.022104153501619577, -0.021556154842803415, -0.08659046313461646, 0.007519666616532039, 0.0009184460791450951, -0.016756742493422364, -0.09636395548169445, -0.0628692225269531, -0.034625208132178655, -0.003204228702093518, -0.004604051724069626, -0.012256477405947881, 0.048105094757062976, 0.029384827364719857, 0.04717553868152794, 0.06274387505359431, 0.00618273647017476, 0.007186898484601506, -0.025940314554730035, -0.02707918831898121, 0.0307041794375779, 0.02357582974696044, -0.038691459854105666, 0.0411424210614527, 0.0214101526548036, -0.042915648140242235, 0.012548290470174995, -0.023711949812310347, -0.053091072607813074, 0.07194233986679414, 0.08070455122751002, 0.019320530688215345, -0.025528465527628625, -0.08390848078755922, -0.02649534652998341, 0.04353269469615875, 0.032084413873245315, -0.019583205230288874, 0.04248699846111721, 0.0228040171846645, -0.05188641716017794, -0.027578492914095806, 0.054682671768162654, -0.052210001892227756, -0.043569739612111434, 0.07219893417289722, 0.013511148707712944, 0.03177590798726638, 0.03093332572191735, -0.021035051140808492, 0.044437310673348177, -0.007442666236887378, -0.04292059094076512, -0.015209174607118521, 0.027204513182766874, 0.01707392175948844, 0.005215010217624999, 0.017736891836800765, -0.0304357655423286, 0.04075687566387563, -0.05656039681550154, -0.01601342842844101]]','2025-05-27 14:26:52','2025-05-27 14:26:52'),(103,130,'[[0.031328297426896995, 0.08707650950616665, 0.021370280597822467, -0.13257544026741197, 0.010229459078539347, 0.05618578218582976, -0.02391073816319072, 0.0031460226090810296, 0.03694305753235094, 0.038990563694562747, 0.04298302799503908, 0.03877450711424709, -0.1010890604806224, 0.0518576778152743, -0.029871409465315742, 0.09383598645166587, 0.04684519896635963, 0.018631914003890564, -0.010265421868028462, -0.054242275735103984, 0.10408793211187976, 0.025548820341393448, -0.0018068086070055103, -0.09708477571233555, -0.03172053582077613, -0.05057584354862701, -0.07789513968025381, -0.000653797489720594, -0.06980929256004094, -0.05219343157172694, -0.032743681117039, 0.00011492052655227738, 0.001196031662511975, 0.021850959702709543, -0.0651316113360273, 0.020408126583433692, -0.05584235022661191, 0.08682512269900426, 0.015335662139795267, -0.015004910583777356, 0.006871204415349171, -0.01095502664832824, -0.043470398563269945, -0.04739942586732396, -0.06301161116296967, 0.04140385430604692, 0.04124797279774422, -0.01628545931989334, -0.007124664541310625, 0.05279500738974337, -0.012242113079680239, -0.05454759652387677, -0.00046184251168532905, -0.04990900592214156, -0.008303141132978729, 0.04508191165297478, 0.1336508434000347, 0.008931214621130206, -0.018420734277495254, 0.010292529509282953, -0.10589665316417823, 0.025247583516961603, -0.04216116296556991, -0.009684832846066735, 0.01653290208440526, -0.09965241452359756, 0.04930711528032154, -0.048432155799384854, -0.05492168299345107, -0.03416003842894395, -0.014866361874883122, -0.047584865832741005, 0.03760137159585786, 0.06311360824526067, 0.004507514950002695, -0.008028424570204872, -0.08820140410672696, -0.042680960385569996, -0.008227568116183505, -0.0030272232637912995, 0.04200768636132237, 0.012210410614162781, -0.00218131520603066, -0.004428020482079949, 0.0002566051301301048, 0.012278097731933491, -0.05821458839711568, 0.056626319798242175, 0.021299923307791725, 0.0671976600372632, 0.04194268982105823, 0.010786466194343208, 0.006780759617628593, 0.015212853163562658, -0.007741524617735809, -0.010565948881384632, -0.027275684289724676, -0.008620560046666588, -0.009012477786671701, -0.039530317445667845, 0.034607085314999, 0.06923226133856325, 0.07374536550421777, -0.013303238369803343, 0.01934913655660805, -0.03500684449974155, 0.07249203445193578, 0.11108722317472441, -0.0814898270199361, 0.024493909906355926, -0.024416009962697632, 0.03184375727449214, -0.02542468648165409, -0.015987270164782307, 0.016458437509751823, 0.08148953551641426, 0.009444402198772623, -0.006196533360473137, 0.03343434624139947, -0.051908918304342924, -0.013393101617997855, 0.003396896370044978, -0.013632634434444707, 0.03392781506330717, 0.033474282223891226, -0.02918004181746765, -0.006132124928564296, 3.411265307395162e-05, 0.022780385159183993, -0.012387248310650394, -0.024890567493626118, 0.00563604350634212, 0.004649812758567164, 0.0011661972790952442, -0.01072413618254507, 0.058149268287942285, 0.03799421048699198, 0.07023367504727313, 0.048806568752903616, -0.008857714923134051, -0.005962524535765108, 0.024256166921533154, 0.028529977303628738, -0.012142233770475384, 0.027957219523781184, 0.0919043791747015, 0.038711647294798014, 0.0684115739833223, -0.0426976168968078, 0.07383311389436135, 0.013928764117173956, -0.024828760001890875, 0.011272280133767456, -0.045587040615756, -0.005278675492504014, -0.023019807204292544, -0.0031592951288097015, 0.041005902443139765, 0.08143651102579198, 0.0563389264760624, -0.024298945063362835, -0.050365214763887965, -0.026752893128555316, 0.035264236279453784, 0.061575396631157145, 0.028907684246944263, -0.06142026428690557, -0.06199721388739715, 0.036316546503076516, 0.0022926496926952305, 0.013923197857424467, -0.005050572529148417, 0.12240106952442951, 0.010816972766662327, -0.01252394159962813, -0.0127043254364589, 0.020063260426888403, -0.04077330303795982, -0.05302498034819156, 0.0009599852281863004, 0.021864325139185802, -0.050612164887447984, -0.033884984450843564, -0.061512933256497766, 0.04468131585312456, 0.005807451585356104, -0.00037285195215931835, 0.008081365253564619, 0.01652408410286967, -0.04248615441199631, 0.014610327044065037, 0.028752907536989326, -0.018364793294136993, 0.008485878860748338, -0.016470524703284823, 0.03927722534290271, 0.03796663716886135, 0.018160041220398205, -0.039664464451382324, 0.022037791597443363, 0.010450584905099758, 0.011425506773745021, 0.05410539151131944, 0.0054262407697080895, 0.0026042024623855087, -0.049928058592328864, -0.007352568553512568, -0.09719264367555637, 0.024132578173379632, 0.054467403905019224, 0.02674828445787506, 0.018542871338110025, 0.04881714450067588, 0.004882961647885771, 0.02018907334691355, -0.05098580827166909, 0.060034637276272756, 0.03881503484888819, -0.08316069605675752, -0.051843026848266735, 0.006573182146004391, -0.01325902603064622, -0.009611779148458992, 0.026834126414985823, 0.02307796507193438, -0.11538073190730819, -0.0028163931594324928, 0.03524441987003926, -0.025253294070954405, -0.012727929934139705, -0.05428489354999665, 0.06562544162230208, 0.006332139341314419, 2.084241071654389e-05, 0.0503143648895386, -0.0262512534629305, -0.05618282051004789, -0.005861867276536349, 0.0049712045008782684, 0.013126284071906994, -0.021614155359227092, 0.013177961816258379, -0.035578643233002256, 0.06665188382339693, -0.043360323918388816, -0.03789241745716626, 0.06249839006242225, -0.02432233239091987, 0.039952942166663334, -0.01710798606235708, 0.05842356727192111, -0.014979412770722214, -0.018754994078398483, -0.02490245500724666, -0.06359082866086116, 0.02747403494612391, 0.043192732713613895, -0.005513509636558247, -0.0006395181897033749, -0.13326618701275855, 0.011648062425080048, 0.030340531913079564, -0.01776692394340073, 0.005326109674336247, 0.03749794323127463, 0.03126509363329215, -0.02348648393750815, 0.02952438618270885, 0.0008198999313525803, 0.011555378151552952, 0.00041655835051635046, -0.023972939184680443, 0.017800583855067328, 0.07493823872607064, -0.017088095319544486, 0.06438082652532302, -0.060578431266190516, -0.034377759494369296, 0.0059449432296042725, 0.0374013506242785, -0.004742729506152925, -0.05586727377772903, -0.026469449679096445, 0.03846319884313576, 0.012178797057219484, -0.030868675078909863, 0.16218745240878524, 0.02711648547134346, -0.024627115355694874, 0.01896073580659391, 0.006062344086747986, -0.03041763750964085, -0.04428110192288795, 0.08887321478329496, 0.08584920388831431, 0.013866765690631909, 0.010066291439708311, 0.06559582486448337, 0.016676457366287055, -0.08178728887376015, -0.03360381472885502, -0.026973753686910858, -0.0013352878140157679, -0.04601886810293591, -0.023460811222339905, 0.06841931048679188, 0.10927886358679303, 0.0025429748804690205, 0.10676714098108993, 0.017858721317462634, 0.012095371664304758, 0.011581407229776644, -0.03022700586649988, 0.02846200159737141, -0.036812577640941174, 0.0026322589476035813, -0.06269340008846122, 0.01898100987653772, 0.0079403759314338, 0.03347029154067727, 0.013146007200194532, -0.06235894643771597, 0.020041528839335403, 0.016197629308763645, 0.02760174555407622, 0.06112418998984547, 0.0038207585234906727, 0.002318236414324533, -0.004436411775335449, 0.017340330401955414, 0.02115742764121181, -0.01784125442643412, 0.037656763095077456, -0.01939787740297692, 0.08147963605681266, 0.04342904295862683, 0.01493771902199377, -0.019393057392243337, -0.11130770477850158, -0.0438027912841158, 0.07996331635719914, -0.03240706742519694, 0.06327416838508888, -0.08785388526813294, -0.04285466150416264, 0.023500559185060083, 0.0032225554012219044, -0.055325018926406566, 0.02418351404126794, 0.006572481808793176, -0.06502330028745329, -0.008131936013291825, 0.01446440621110353, -0.0653674085348418, -0.01055943232015395, -0.01568961008856341, -0.03408060371924317, 0.004212427756743418, -0.0010480941717484532, -0.04893079006369953, -0.02805905336409996, 0.03706667834589187, 0.02935131471172338, -0.02105372817835327, 0.017458775570466115, 0.04134766991724792, 0.00044896680112575853, 0.002966005337928972, -0.12507541611489542, 0.018025653724278203, -0.023060725553652902, 0.03551335810425149, 0.07907561817235814, -0.08640634873953223, 0.07030252234906074, 0.022417209666432073, -0.08773484688995531, 0.015473155605940448, -0.040620759244982166, -0.022228249795988843, 0.01647666668248994, -0.03732733496504869, 0.0008026210600956515, -0.0379228795751983, 0.019076687162475285, -0.026392110879717687, 0.0488201294967395, -0.008547045773494343, -0.09257789806190747, -0.007194063513513327, 0.026719545125657086, -0.045988726638777885, 0.035589726196902524, 0.0711852358236783, -0.0007881417157865714, 0.07215047394532813, -0.03543814436554693, 0.008706793347255418, 0.038207145064588756, 0.05155979036630837, -0.022864880370023863, 0.03557942446244078, 0.005462528221244651, 0.027512638757520875, 0.06557641655999942, -0.030034905045608844, -0.0039009088743375536, -0.01208082126601223, 0.002007242056068275, -0.006710755046859273, -0.014916860487488673, -0.033322242732006346, -0.03472774153772284, -0.137275258268874, -0.030010465390337974, 0.021915093392549052, 0.026159867108834386, -0.028593364744452343, 0.0035866637052437015, 0.025610155597423318, 0.0292500988588709, 0.013913296940305249, 0.005500078611789575, -0.06199954008550142, 0.05745392161702111, -0.027013625538627815, 0.06588016322975429, -0.0522536387091273, 0.014620172575515107, 0.0012921732589029169, -0.0541894727871583, -0.013595579964266311, -0.03036449641760984, -0.0794819449314477, -0.05592032158863305, 0.04311257216014375, -0.03486473070277524, 0.020957524728558788, -0.0006404033583664052, 0.028769319185268788, -0.014871461728997674, 0.043512211828442345, 0.01928830560167096, -0.001236857095124745, -0.002606628864825405, -0.004655634448277664, -0.024398050430717213, 0.06563987104663305, 0.00866302409345149, -0.027482392352094997, -0.029748607776671182, -0.02903972659723108, -0.06965666131600673, 0.041201751999321634, 0.0019201038192338416, 0.019291141930938442, 0.037681835312990714, -0.054846609176436995, -0.0198897240077856, 0.031100429123876477, -0.02457312015834488, -0.03295846382696423, 0.05128085647633232, -0.04582121413995386, -0.01794076789871907, -0.06490361477145716, 0.014399924174555425, 0.0013624830885165112, 0.03574209217273187, 0.11484599784684914, -0.07302390594781039, 0.014312146634059662, -0.054232393765713684, -0.042288456723485995, -0.0843299341730598, -0.06468965701649874, 0.036462951231884276, -0.0007340763754016349, 0.005797231107501072, 0.01261961159797765, -0.020456839736967988, -0.002511135226106598, 0.009896053382955104, -0.0054788414870854925, 0.028847608286128736, 0.06011197316061629, -0.03444606168457108, -0.06143655350370586, 0.015749546127688457, -0.009836967805355017, 0.012110337455115904, -0.010811845219713201, -0.008578644755261548, -0.04758951531391432, 0.02102098504526285, 0.024022516646156986, -0.029777043945226445, 0.047491928679908715, -0.037954277419535436, -0.043728781454956435, 0.09758307766263533, 0.022632002578980563, 0.06302564414251094, 0.0405025574819122, 0.0764965057824766, 0.09232371282093545, 0.07473363823416321, -0.011100079529553476, -0.0013203098164946442, -0.02924628016273483, -0.03146907322269807, -0.039851781699480004], [0.028130459953890186, 0.12000749680054991, 0.019323864635696915, -0.09712848985803268, 0.014039654486712306, 0.044420829055726196, 0.0019249650653923613, -0.03895048340996478, 0.04971575729290192, 0.022412115957881226, -0.00856253118065955, 0.03979274676594933, -0.08691988532094966, 0.05871152422621434, -0.006404237934584222, 0.0926924692448472, 0.06271854784357289, 0.022556196398847553, 0.02929648477699655, -0.03328716245527559, 0.11339937435187847, -0.0011772419713077587, -0.0009315761609292266, -0.08813601075809406, -0.006752061494157127, -0.03191944241733705, -0.07712579639640257, -0.04873580892230573, -0.0669164025307024, -0.026471353352504823, -0.03854600221516415, 0.00029254909455852493, -0.014358822931408357, 0.03510621065220178, -0.05298928330860734, 0.027722939533154238, -0.06827641573804831, 0.04430505878681584, 0.02143371050720005, -0.01574125431451846, 0.016529750096747522, -0.011132129118823308, -0.06612475564919071, -0.018138330343856472, -0.1104864534256764, 0.04924293702085838, 0.045438158662289604, -0.0239278024818087, -0.0010757290476569217, 0.006914991817247334, 0.006863797330480029, -0.01862509127801232, -0.0019513442568598316, -0.05072316435507732, 0.003613088816236852, 0.04965183410528486, 0.09735261567900097, 0.006060994578616036, -0.011301331341447212, 0.044121909686893675, -0.09846844044509392, 0.03929757357759419, -0.053305300654020754, 0.004326050666573978, 0.02971762267017479, -0.08627120636211713, 0.031613291679637986, -0.032284152637168155, -0.05590940763533914, -0.007572889450657693, -0.021308861405396007, -0.05848580731763984, 0.04141608497212456, 0.03163824254368161, -0.05462439307699421, 0.013662095923701684, -0.06313986908473701, -0.048097590121446904, 0.020750339934125273, 0.010922688228486256, -0.01894277895465297, 0.013134857037173157, -0.031132189672300352, 0.013265201917163918, 0.010182872113404705, 0.016865015873084623, -0.04315568755449411, 0.08735143054302093, 0.005865371212019421, 0.06075361680175146, 0.03447998716024921, -0.011501448675943327, -0.009689827626241482, 0.03106618439738609, 0.018379692429293302, 0.011429749513789816, 0.029475202449327963, -0.010294785859425764, -0.0062455813287409945, -0.017414609229721233, 0.035275872798586856, 0.053720220253644216, 0.07892392427738136, 0.0044803236240685265, -0.010960801302600472, -0.05170876232971278, 0.036390271179501575, 0.1159588003613175, -0.05811515227243628, 0.016622486886483462, -0.004582665595259299, 0.01628187138882975, -0.013138890692862362, -0.0457852363995471, -0.01278522641228186, 0.07993184098480563, 0.002048989101259977, 0.03763389570693393, 0.07416726843561285, -0.05353725139411494, 0.004147367954663602, -0.00593196498735444, 0.008118368354187597, 0.07680165580293709, 0.02743466056268831, -0.06427212058732698, 0.004826465587389644, 0.033954685857944276, 0.027860807895751752, -0.0032980472550194332, 0.0510382618529684, -0.006146083582025989, -0.06570150770037844, -0.0016299062981649196, -0.03428233803147818, 0.056634713621894636, -0.00023461006278758628, 0.02815195828213203, 0.04594721657608339, -0.03120916475043718, -0.024904138275564598, -0.009997614511644996, -0.0007761869948808517, -0.00993509129466583, 0.023954241882890175, 0.09872792445899886, 0.06091283122053476, 0.060087324005903206, -0.07632301811683331, 0.06977054022807783, 0.05004102283502649, -0.01472229166784359, -0.014713852999103962, -0.06335424949411719, -0.0321614368979455, -0.033508705866476744, -0.0886166062277758, 0.07356853471116931, 0.06385853103749935, 0.08419979053921227, -0.05100519395605867, -0.016575089878338816, 0.032432897575198814, 0.01827797624963906, 0.06580926037939808, 0.012015092620078674, -0.07890639123778315, -0.04895376617120693, 0.05307962725174799, -0.01905285766701881, 0.00793060680938353, 0.03781773158490488, 0.0921731655969954, 0.02090825537904256, -0.010454935663696312, -0.003734901022800314, 0.006140390471684984, -0.0578668183021468, -0.03104803605437765, 0.030842742246873604, 0.0015119525567363643, -0.06570342819284064, 0.0008910046894302784, -0.03351057352985826, 0.026290960687556708, 0.012783833433728173, -0.012872573081992434, 0.04751337196381713, 0.021089794745800625, -0.022526299800574832, 0.034567562238043886, 0.03242064433607513, -0.02710410278971727, 0.0017368880999007329, -0.025647597266518007, 0.044864021536289864, -0.006065288106768269, 0.0019553946158613086, -0.0195980631023664, 0.017791118980100804, 0.028216962912106444, -0.005887099890590979, 0.022640993288517302, 0.003883168945308401, 0.02653103778329594, -0.036025849965817695, -0.0359962252819308, -0.08966324354374205, -0.00017912515546103072, 0.034019733994220425, 0.028932352569459897, 0.020729460016886626, 0.019364449800027436, 0.01933569834976817, 0.010337368429144756, -0.046384498414797394, 0.04943626970297895, 0.007749413939242835, -0.06458414778335293, -0.05182395147873571, 0.009594704205096213, -0.029579160757317924, -0.009478944812761294, 0.015684316995922456, 0.025815683863261767, -0.09262812342458474, -0.0005153377279783565, 0.03605242299339735, -0.017949060839558426, -0.006380811344897727, -0.07606973685851824, 0.05311934229004386, 0.03691017459279869, 0.010288477445674541, 0.02663289225083783, -0.0491847753106279, -0.040651728972171106, 0.00451712762463954, -0.00553632994442306, -0.007988900592315695, -0.005522926118998205, -0.014569629608860513, -0.02235534644930619, 0.04307994619077069, -0.07968444550759639, -0.044052265420598785, 0.02058701727742123, -0.014399658256973839, 0.026471748016813398, 0.01382054121322221, 0.09138356351166513, -0.03578250368226256, -0.004979553386611103, -0.06250617493925836, -0.03721732908303059, -0.0006048216933176832, 0.027689476971935936, -0.0024756482160424626, 0.02904811973077727, -0.1127623177907945, 0.012442025397268039, 0.027611178059189244, 0.004801219502012833, 0.027153687543320468, 0.02692452120653717, 0.0026158948583931696, -0.018232776309731906, 0.002296200842034225, -0.029941642832981723, 0.024062605203930557, -0.0023370625821400454, -0.011546772919569716, 0.008006764590566384, 0.048928150282265395, -0.024475736383793512, 0.04872017772961181, -0.07279066068174894, -0.037638892716447214, -0.0369419776993652, 0.0329799240600332, -0.0015652969151727654, -0.08606727368033872, -0.04181915842730484, 0.027933370191855707, 0.0083731156194914, -0.032683021519045286, 0.15480914469506585, 0.015624073198394779, -0.09279008495556315, 0.027645821505740287, 0.03930602623050223, -0.02543915080593484, -0.009081750146602625, 0.0723973761444585, 0.08086215488031094, 0.033030428661158746, 0.03381540975572642, 0.06198793408820603, 0.019061417531884693, -0.07187272122149359, -0.046622692309190195, 0.01769999813871493, 0.04937216005978304, 0.007199422810704667, -0.0189950595451671, 0.087206796950504, 0.06402550200836296, -0.004705947693302725, 0.07083058991534963, 0.032492407980783, 0.0057556692953025165, -0.00724053626584194, -0.05441132407185196, 0.020825781415126032, -0.014397874498602805, -0.012750534798039611, -0.00954413745211105, -0.0013251881608300424, 0.011026381614174597, 0.0002378545840842045, 0.01339246251112114, -0.035789654253711604, 0.005291112501444303, 0.04235529901392715, -0.006111456061888972, 0.10073597646102322, 0.04635064740445648, -0.0006393041277074048, 0.010416139696024543, 0.005610109251628159, -0.007483040391699251, -0.04401392704599345, -0.004280520156463481, -0.016726833643596038, -0.005545486078692151, 0.04427297288928808, -0.004204101725919356, 0.014492625008590367, -0.062042236167954234, -0.05234561378966002, 0.08043538913624429, -0.04098531354070554, 0.08351708343723892, -0.10734830659059079, -0.044250340289608205, -0.011863449074695087, -0.014622051594855273, -0.06941683399499209, -0.008205697932136777, -0.02221254167525852, -0.049725288280574334, 0.03359462770480558, -0.04217052464287597, -0.07105431796441636, -0.012971149038939481, -0.02664988456925738, -0.010917359483422262, 0.007675685518872799, 0.014469728263507115, -0.026690774277700027, -0.04155437907496046, 0.05286753403080174, 0.0035233294890257335, -0.0007295435780340719, -0.024787572462851137, 0.058595480489121665, 0.025384276929078155, -0.02492166354618037, -0.1319122007258629, 0.05319892774628464, -0.019002318882370476, 0.029210870590372827, 0.06659988175522608, -0.09116908987449551, 0.062035498906371646, 0.016263331489105717, -0.06931803118375743, 0.01841788474702853, -0.016139296576662666, -0.05087368683629305, 0.03549872761402595, 0.001399122265010502, 0.006741055953615279, -0.04379857085241726, -0.00017061811967582403, -0.012669748257111712, 0.06566240796549279, -0.04204721846098694, -0.08632589999858092, -0.007824841436075177, -0.032459511001487217, 0.01169291524847887, 0.05254194529900715, 0.08222441798497501, -0.014742292136268646, 0.030992618348749307, -0.0720059685933285, 0.011424382700711807, 0.04691486509366119, 0.032477196313141506, -0.06209061517548084, 0.021610248203055363, 0.020388297582868274, 0.03150216726223407, -0.014705619431501076, -0.023034486034537477, 0.0001492543890549608, 0.01215324532743394, 0.009342935567664601, -0.01267274319984705, -0.00341497510231517, -0.00829837567760608, -0.03456993333148831, -0.14153437760670673, -0.06394755114603014, 0.014824966539932441, 0.0004119464100389879, -0.012110925349321833, -0.002710812984177139, 0.026012155214293044, 0.030037508968849425, 0.003929496164569375, -0.015727573136420057, -0.02288608137793823, -0.008511738350285026, 0.016612820718516382, 0.04067029994782495, -0.10684142088429065, -0.012160872914405553, -0.030825501321015584, -0.061388479402190915, 0.02208544889132227, -0.010462398548239937, -0.05685271748469055, -0.09128430077666931, 0.02762545434134349, -0.014107908105148247, 0.030659422229337485, 0.006669287647517943, 0.008661707679950155, -0.008108825713041506, 0.061801310699331216, 0.030300709663959514, 0.021790022457000277, 0.025387076870353943, 0.009989516901235023, -0.03187800577252977, 0.04912895051031906, 0.018584086588629378, -0.03291030776207514, 0.009646221104635285, -0.038031791912208034, -0.06400060397340002, -0.01813520410531769, 0.023794987065398124, 0.037552924264223665, 0.05466097566156533, 0.030632420353926465, -0.043090679816926714, -0.009301662848387057, -0.006084694248035728, -0.03518486072295531, 0.02173396303342138, -0.08219234762541215, -0.029735795873927075, -0.06519005383239639, 0.007729411140123044, 0.025888013089892154, 0.02998378179380269, 0.12599141569270636, -0.06470034690009464, 0.04090180940971585, -0.0014059322636912968, -0.06553032283343273, -0.10458880131466966, -0.05612427904441031, 0.011650908360359587, 0.02870922739343146, 0.01611980575348648, -0.0065965715255614345, 0.03657335191237816, 0.002572916653242797, -0.0006731463979430617, -0.00963185081779337, -0.028397451912436967, 0.06298572625769853, 0.0011124665263156878, -0.10038570101058839, -0.002370638958951274, -0.010872334345620285, -0.009416744008553895, 0.008885375907852001, 0.026817576501692565, -0.02339556813956338, -0.022371519916975273, -0.016186183939558445, -0.045523664083159, 0.0022335144764235623, -0.058063609735255116, -0.0017623097642809641, 0.132383299391395, -0.007631170803217934, 0.049558018980784546, 0.05673124167506727, 0.044329251398172134, 0.07972841794827609, 0.04935263816067704, 0.017970941401736922, 0.011222253976658806, -0.05523882014599128, -0.06216135642209799, -0.020291586181709766], [0.02755444066923403, 0.05391712901262677, 0.018898702671490332, -0.08737331073646408, 0.036333446644735264, 0.04057312957358837, -0.019332706220895984, -0.03254831585723247, 0.03726163950852652, -0.06325575447677229, 0.06636058307005291, 0.03769982821283455, -0.0347750005702071, 0.02891901804738667, -0.02353773078660143, 0.08551900579937753, 0.008275532469382313, 0.0003837874858300568, 0.009306511511732724, -0.08187721381699177, 0.06857501563596823, 0.02420759131008705, 0.022299130814314366, -0.0982634955500975, -0.025075780713805857, -0.05327331608859743, -0.04953358236625055, -0.025533922375921114, -0.08938789940550111, -0.018950995891250697, 0.011194657583071243, 0.010142759838382058, 0.0014877180567937308, 0.029657714389394376, -0.015002337601719125, 0.04371723230168332, -0.049626796751368864, 0.05970307187589799, -0.02998552061539836, -0.002655100263356708, 0.015462918377769232, 0.047008605963158805, -0.04000218517836258, 0.06091870614462196, -0.05634327415353632, 0.04288981319029556, 0.04068915407446079, -0.03757224620946416, -0.047300058076056556, -0.008512821951420793, -0.036109500781810064, -0.03988433134203903, 0.018011451403779414, -0.010097428780175409, 0.003892652178874894, 0.0492211997640588, 0.13581969578451347, -0.05827960372624627, -0.009356011223104437, 0.016742332647020193, -0.11229691871510925, 0.03668785681448221, -0.05466022267473093, 0.023792899508124306, 0.06615629470525726, -0.08262531143448804, 0.028397943473926695, 0.0035402379335462797, -0.01395944980560499, 0.04087567399715117, -0.028359681445667816, -0.026417558977362608, 0.004290429307189266, 0.03950498311822111, -0.06005090335303458, -0.0009969508884088527, -0.029330326207402422, -0.010475827761199097, 0.019491569231843173, -0.011986043186534923, -0.028515310116100884, -0.00402480987826417, 0.02197428232827519, 0.01600188869245092, -0.014915176996805082, 0.03579489280247158, -0.06442769214508101, 0.014362863848807127, 0.0020931512794611826, 0.037260721697612895, -0.0053326699994614745, -0.004060797024164353, 0.044778529750267033, -0.020626599585947036, -0.017197978617815517, -0.007832085997246295, -0.013474738774815427, 0.017640093164010953, -0.06698922068212679, -0.010103587857179703, -0.011715514490758036, 0.04344904606680842, 0.07137960690572237, 0.00022881662572324713, 0.004863386914367728, -0.019605974990864496, 0.023724293142330623, 0.09154240394785743, -0.02414071055453851, 0.06119232695165324, -0.03763011544484362, -0.04493650952536926, -0.05220519477873465, -0.05806722479538323, -0.022398699154096716, 0.07753885364217142, 0.019856562515789385, 0.0007496099820764456, 0.07100216031068098, -0.029527605262823445, -0.03942006360639411, 0.01503905789623439, 0.008668475767358345, 0.1181141551587095, 0.04016627845424222, -0.04961310502417789, -0.012198847233583126, -0.004993128680834103, 0.06097271240187523, 0.008607323472049828, 0.016112002428175808, -0.008190143836737303, -0.06254995788419246, -0.01784181825894337, -0.03536106684319133, 0.033942810099343704, -0.009254561685267955, 0.03644670828330261, 0.05232919040452816, 0.001617982574724395, -0.0053557472862007065, -0.0025127784760264667, 0.06711895262613048, 0.04114674253547742, 0.03223553092696899, 0.12735311641583683, 0.05880044884697783, 0.03529317083789929, -0.07166795040562841, 0.08834340544028813, -0.02272550270310944, -0.02020804166267004, 0.01893962855163037, -0.04450461348355809, -0.06774632667660407, -0.036046989057665436, 0.022303364688631682, 0.059358226427418746, 0.07208732084301901, 0.03229054614758964, -0.0971899899590873, -0.08040094010792584, 0.009587421371875996, 0.045714857184758526, 0.08504837625109843, -0.008289026961522493, -0.050682398743187196, -0.06711828627026167, 0.029056937996287616, 0.008576057394616319, 6.576570958412352e-05, 0.022315217650807337, 0.09702554464614489, 0.042012794571315175, -0.022793862328640384, 0.01945121069714803, 0.03515459396269373, -0.07467153062510842, 0.0015756471711885337, -0.055636861496096666, 0.03389247194255689, -0.035882631753988724, -0.02853228647481494, -0.08613798753772996, 0.01920060745628284, 0.06886747671223335, 0.007775962017037355, 0.02431472216034265, 0.02051864679201365, -0.030858481378592807, 0.0211276489082744, 0.028075006046228222, -0.010766578943159386, 0.03515495542932067, 0.04790523493244783, 0.04343683478119389, 0.03562207089334828, 0.02341748655575797, -0.06307720882219106, -0.0067105045590557365, 0.0050562556840415464, -0.016451358298707617, 0.036605495857736356, 0.015959380217122482, 0.01534948857864065, -0.06251596116213151, -0.03039994053159388, -0.04079329103808889, 0.01346915332963215, 0.005598882705132966, 0.01777663482494743, 0.02566006794234792, -0.006691273748705382, 0.039562880642293116, -0.00140099906980217, -0.05506825248959972, 0.05114917788609235, 0.01707349108309056, -0.07854557277327488, -0.03587575445851263, -0.00035541724229025987, -0.04859971290482226, 0.0057078173524367105, -0.031697926327499536, 0.026433048608124107, -0.14337355620422004, 0.008612536449447952, 0.04407079695384203, -0.061634472929729275, -0.034593814637655165, -0.03319087464922572, 0.08777753729377982, -0.003208810361998244, -0.04762236686614295, -0.022229980676986238, 0.012658384471197189, -0.02210447632092375, -0.01156479940906034, 0.03408224820807781, -0.018143199702923826, -0.0218193451592154, -0.09164962437897274, -0.02930398943464459, 0.040832804055195786, -0.05914100070056662, -0.012797960094408936, 0.027643050283843902, -0.006346060940121581, 0.03577089141844259, 0.0508575591842274, 0.05985288250523131, -0.014300694732161081, -0.0072975601504819704, -0.02951010084851525, -0.022896658722560734, 0.0913407935792892, 0.022196677027892596, -0.01387913034950434, 0.026260701320397935, -0.15212997523031946, -0.02934800349705394, 0.05180435029177186, -0.043882928603473745, -0.015349411570533171, 0.012433386426068782, 0.014558945349577149, -0.03217324236917665, 0.01635615427554709, -0.009255425276187541, -0.0029011751524731745, 0.03446909607860777, -0.06855598677545074, 0.05624771495012497, 0.029391508362997514, -0.019468795262751765, 0.056882136028229925, -0.08167318319361706, -0.029000602636681614, 0.07748709790756937, 0.027933568869887723, -0.06486529307322175, -0.004361736850222329, -0.04252577229233164, 0.011532796254026673, 0.06639272531115825, 0.018319823298006133, 0.0818904089204692, 0.03600828383989005, -0.0920278190527725, -0.0067549610251845865, 0.03913949949693748, 0.028155965141099158, 0.023264953925564366, 0.064672766518148, 0.052778219964456405, -0.010992852336843287, 0.034516328765590944, 0.03549151543407278, 0.01016993112756992, -0.06201279333105146, -0.0018015343456395166, 0.06871358622479767, 0.024225936527201397, -0.022083948159701477, -0.030651238417020412, 0.038255811032892995, 0.11095980651422811, 0.03138747364277685, 0.08598118017177425, 0.055380251622848105, 0.015304671431681875, -0.016132370286807002, -0.04660720198872127, -0.011851821198387, 0.032088549166889996, 0.006088341521487716, 0.02973517197276606, -0.006774344280155869, 0.0008419170663162088, 0.023518439469880914, 0.04319869742417612, -0.026637497275510832, -0.0066695771073216675, 0.01218161627663618, 0.02544042353228334, 0.053727035285111746, -0.03810368701714723, 0.0013057105734625195, 0.005950916231807768, 0.026811941069673273, -0.025731401023783972, 0.003482399344250408, 0.026466567565599886, 0.031646293177231846, -0.013502186664552603, 0.07370539005186433, -0.02585169711723043, 0.018604732864956224, -0.11169985128391373, -0.032670636163789804, 0.04581868297276865, -0.013275853550295556, 0.04762111587729492, -0.038404861010715705, -0.01899492980236451, -0.02358130794587039, -0.014753257235469185, -0.043448870048277036, -0.028482114906995325, 0.024956789043404454, -0.022584472569622756, 0.023167980287525848, -0.0037192098830081894, -0.06353710124005595, 0.023094629279355038, -0.017405669483686517, 0.005115192031767502, 0.0049642349245891575, -0.007251862125069275, -0.0417355968162712, 0.00484617088756407, 0.0065505987954695205, 0.015548149065214206, -0.012312806659899877, -0.012446363077976016, 0.05256082764863708, -0.01841618872915497, -0.03216488777531219, -0.09319924123823932, 0.008467630765082832, -0.00918393817853653, 0.012244570404500303, 0.06741855502566876, -0.024659335012905428, 0.054923370379145055, -0.008476441121216047, -0.07368211788746536, -0.005713218921118455, -0.037130713153059894, 0.02794382509252871, 0.003643702647827966, -0.036817755347453095, 0.04792410349037423, -0.027253612426352197, 0.005703295876411869, -0.10179662752123629, 0.023667374721339427, 0.0046764053359309825, -0.04123508812229022, 0.04477821857464906, 0.006809097724742358, 0.01388831945979883, 0.08263423180220336, 0.051965485827686696, -0.03156913105353784, 0.049301385634666885, -0.029139144936818517, -0.06729867383304627, 0.0030763410940924845, 0.08248622536281669, 0.0017661059014170632, 0.03004168309966104, 0.008697940012236248, 0.0571809777762576, 0.03437520905124454, 0.014474679620866708, 0.039635085958415917, 0.023972402263469913, 0.003930023113318656, -0.0327194530175554, -0.032380416180611715, -0.015300321259406323, -0.06797945693504168, -0.10123593934865148, -0.1296235543066118, 0.07265955080216151, 0.008279602112123476, -0.007877087020706604, -0.006257747963884906, 0.0017644877489137343, 0.027426852379487516, 0.00935931864274096, -0.0055950157980216965, -0.05591224877481787, 0.026152726524148125, -0.0362406880218857, 0.024203811626444457, -0.0024515452436253958, -0.05163729927592741, 0.02145383482083326, -0.08392343553066835, 0.045986651799526726, -0.023722242212121235, -0.10353620609411937, -0.07077609593900308, 0.010354476342361372, -0.04930409191958686, 0.030795190143809208, -0.057434130142639754, 0.01481942448732802, -0.023963293304470962, 0.06162938096507148, 0.01996688841670835, -0.056456837538157466, 0.02942117691509934, 0.02715084903590648, -0.008502858831066436, 0.016670707249094526, -0.022909503360569433, -0.039317752835029085, 0.04621521186252455, -0.023306453437525423, -0.08203608311431508, 0.02987398458707615, 0.012922714800119027, 0.013170866354297128, -0.005203718351893775, 0.0016484510681875858, -0.058955062267667405, -0.02644403719358316, -0.05666871355893084, -0.032927198889217454, 0.035204020594943035, -0.03279817730571541, -0.028869387107913435, -0.012627191472886082, 0.05224958602371124, 0.0038499413608150722, 0.008943023814867428, 0.09707840049656807, -0.07465014437354567, 0.04906480101255094, -0.015611371149860477, -0.037004511009248, -0.06521325656425689, -0.07676105918388078, -0.02112282568619576, -0.009776224034895219, -0.0263878967116369, 0.06056562554342455, 0.034851546629041275, 0.010320422257118315, 0.013654873310961166, -0.10135724754865338, -0.05694921794781432, 0.0969537668035983, -0.019934926908916482, -0.0691382686500103, -0.0005047963953938292, -0.004418016811138765, 0.04454599041118479, 0.015428057278991674, 0.04301124083144375, 0.03301644657100358, -0.03525759309224397, -0.03393796644654268, -0.049771575136617535, -0.02808144958175198, -0.004767397487090616, -0.012185968020505762, 0.07594310106855473, 0.027485321963786506, 0.02013239927040322, 0.0170655843935247, 0.0028262435136065063, 0.029458360829853508, 0.03929802932995027, 0.045336081021167596, 0.016297131490149473, -0.035414843647716195, -0.06953397088130632, -0.02498220957684269]]','2025-05-27 14:27:35','2025-05-27 14:27:35'),(104,129,'[[-0.02725704198816351, 0.04561504330557531, -0.028355068360831154, 0.00473693755862951, -0.02567902661112895, 0.022293348513316907, 0.0114873301524989, -0.013895039304125778, 0.1248998244221835, 0.004022336364686093, 0.013542498768610982, 0.004024038199955917, -0.042343180941839566, -0.030750653675605425, 0.03939060619268673, 0.05695405165055353, -0.006896254732292905, 0.02487842312481295, 0.051281865160021464, -0.003717634888726292, -0.010079040969477001, -0.015158785694166491, -0.06011588932983062, 0.048368705291813946, 0.026022489688948172, 0.03058076952119203, 0.016232851730619783, -0.06490929246637622, -0.05847636266836507, -0.02738186680997865, 0.10378384654301584, -0.0013055430881713987, 0.014272674481970683, 0.019405787256337088, 0.008062604243625152, 0.053327702077412026, -0.012449900216189547, 0.07083077356573311, 0.06323035092396535, -0.027317045879056062, 0.054215469617238395, -0.002091884442733889, 0.09137486258377099, 0.04059233883378363, 0.0074075371964302, -0.05041724107547993, -0.07055447224153691, 0.036687741262554946, -0.0069128480962939295, -0.010597224798741648, 0.0075677496611643025, -0.030067810420229792, -0.027324655057217186, -0.09535227538658422, 0.06955195023153844, 0.10763298948289314, 0.09136901955332856, 0.048882780646274715, 0.023886290396028544, -0.009386286075051434, -0.08784952342155285, -0.013001613773183554, -0.028487631737897548, -0.06484944804026917, 0.10524621685409512, -0.026391109088873026, -0.04085465840593764, -0.016414874765733473, 0.03744173890873026, -0.0014054531356603674, 0.003347438517467431, -0.08297022593224183, -0.030061970398556903, 0.022922497267520776, 0.0038967676246027243, 0.00437176696078737, 0.034787537817103024, -0.038171269241024104, 0.06688287077454673, -0.026302518878601733, -0.0031854339543773693, 0.04282135866694471, 0.10377507297104359, 0.026443732468089332, -0.05876481942149404, -0.031865830034638595, -0.03132964022407492, 0.0108818265659003, 0.008060450716828465, 0.03575982771078557, -0.07417656741455195, -0.012856839304947958, -0.0238663016356041, 0.030522910882979936, -0.01808833132127692, -0.060512830277414886, 0.04956185993095855, 0.031900262393229295, 0.025470618171553428, 0.04425822062988243, -0.010410988734082638, 0.028972278317508992, -0.08566012005689612, 0.01854521147120868, 0.0262192331290256, -0.06277424553218958, -0.021520837908175446, 0.03335927190873483, 0.015054501741985978, 0.018689886650049527, -0.03839037385630654, 0.05684217958159866, -0.020942098078808053, 0.015458630639996073, -0.027899603836966935, -0.0604918230485019, 0.009530338438597958, -0.01867362575508243, 0.035762294901806574, -0.05179140629878875, 0.06333704189177611, -0.0246956674543168, -0.02959870714405068, -0.011194355731908906, 0.006385469467321733, 0.004663814304263525, -0.016653515321624915, 0.013132750993489026, -0.01995543228427385, -0.05310347051883716, -0.08046379453892509, 0.053154427039729515, -0.09926963916696184, 0.0011200873290872092, -0.023216757937088182, 0.03198238675776383, 0.0007389673379491834, -0.07093611660479095, -0.02927139814987996, 0.0017208770200364926, -0.05402687392506936, -0.049752591849499435, 0.042590956122047795, 0.0686185577104407, -0.0772834469094514, -0.014164637089791753, 0.05023392577384975, 0.03973706600496561, -0.038006969362872886, -0.005156505205330496, -0.059349603868862885, 0.023404541261482014, -0.02666042405020245, -0.010826422331438672, 0.033837530870617506, 0.037797841827377825, -0.0860711781511518, 0.032585518681774256, 0.011944757146294154, 0.028675917526804193, -0.038318900535935854, -0.006504535504241509, 0.017439405924901022, -0.012933274086286495, 0.037542192697289145, 0.010396217180036757, -0.01312300258018652, 0.009395192785075737, 0.08224913820727109, 0.09435616807324036, 0.0043595814441592376, 0.052561458739217824, 0.03947167147034396, 0.010094979926103552, 0.07246757428199742, -0.006268424571338982, -0.06758398026978642, 0.010037998344211728, 0.024043465507914228, -0.14498090593112586, 0.02511846727169378, -0.03246297450726877, -0.011985140851030647, -0.013338869759446273, -0.01671988276008994, 0.013389725486559116, -0.0029432046886197047, 0.02361038322064178, -0.04050524699074217, -0.008903940451944032, 0.07742007513416337, -0.005046636976887807, 0.027136736338194155, -0.029746639315916208, 0.05670141129000266, 0.03215614620734193, -0.014020768261187035, 0.04708970444021654, 0.007384878905233333, 0.0020857162771332816, -0.04215322528583943, 0.008885458332865645, -0.038666139619525024, -0.026346272405220576, 0.04655215165705223, -0.02724765462720554, -0.07418279556749521, -0.08291663372923436, 0.054673007183314165, 0.0007569770802101327, 0.06958513094200142, -0.013370326444964083, 0.02107930549165606, 0.02524351624683949, 0.058666342394521495, -0.017609794048212002, -0.045900455183932015, -0.0009870031528186301, -0.01341248983688219, 0.015415000472928283, 0.025418265581595524, -0.04030544363204479, 0.07230342183355355, 0.0493897191993918, -0.0003168958308484511, -0.08304122687579508, 0.008444887970405974, -0.024623806002675733, -0.010737440981127463, -0.0021626307691650047, -0.009128824161316218, 0.03352540111876504, 0.025156111491766095, 0.00586148360209961, -0.012601722727067464, -0.014963861055274667, 0.09454708051795352, 0.04337252312349807, 0.04174076811374868, 0.002020976771036309, 0.06458893673860738, 0.014305528740938805, -0.02593244323422058, 0.08127881604886628, -0.006678636449162146, 0.03433844586711989, 0.02614142935754736, 0.03723258429430937, -0.03226880356514617, 0.0652915446010769, 0.0921642794649454, -0.08569283139931119, 0.03836637290170343, -0.022555586848693396, -0.03771632824305946, 0.009195938526819004, 0.0007178084482466751, 0.008636954278236877, -0.030709301147077758, 0.0006576165092580068, -0.004008307976716052, 0.002551449355333855, -0.04147260551115224, -0.06821065280666067, -0.10253872142764464, 0.020866105586591573, -0.019574054197123908, 0.02350296713937241, 0.009386759204061254, -0.0489950829692735, 0.05650908472360673, 0.13829209833654116, -0.05108158942450664, -0.05792379612520709, 0.006966280082323522, -0.011662186298573527, -0.08327299841083172, 0.021042548858597396, 0.05124010343883665, -0.05189723074097262, -0.0337061048084364, -0.0192312485354487, 0.02840608204834473, 0.033977604136450276, -0.011616316854777221, -0.06615745643898062, -0.013613495199009928, -0.04511551234306032, -0.004329945816404188, -0.05792609482513397, -0.07853829636796879, 0.0336312406047966, -0.0013527123204080387, 0.005497313420128792, 0.003312355136367984, 0.059188700891519855, -0.01763824045980723, 0.04313555243470012, 0.11224705791990709, 0.007688087655406188, -0.025441300721177004, -0.05475997265803504, -0.03030429669713216, 0.027634287530353265, 0.013361470131829537, 0.03670555618698832, -0.022842725760764807, 0.010914012878031027, 0.041363682036344426, 0.04081671782206585, -0.04589797595783286, -0.027804156640918974, 0.015838748052709673, 0.025472600950678846, -0.02503295202389013, -0.004860655153254741, 0.0070475552216560135, -0.056626697524839745, 0.0691293324447185, 0.002811969307208062, 0.07926801926151306, 0.022085687752971532, 0.0584669753074071, 0.0657978723739778, 0.0006588006481192313, 0.05550457692571331, -0.011652592084709833, -0.029487990442598328, 0.04902926259122302, 0.026954347737581617, -0.04498725752397207, 0.05203840220768669, -0.00906264853190923, 0.01975736799436932, -0.05118154074855271, 0.01205695265797434, -0.09797228782995332, -0.0350271201178598, -0.08871598285551245, 0.0041130282004795465, 0.06794943143538795, 0.0024810007090388868, -0.06362990348350843, -0.004957040333206117, -0.02257403511911448, -0.037202039265961516, 0.04329433422951899, -0.03136565218667297, -0.05047666427385169, 0.03454882805951221, 0.023965912968692393, -0.04061888821618527, 0.003555867642333525, 0.011921745324676596, 0.008803874042463146, -0.04885401380072371, -0.08692305708793116, 0.11903385512079921, 0.015609096195812439, -0.03900024241531212, -0.056304957763083516, 0.031347975665638336, -0.03483292209681136, -0.02035186174103669, 0.012618229588944279, -0.02180101603192113, 0.003995975030380566, 0.10836255592042143, -0.07570209179822986, 0.008200407392841643, 0.05624779715940419, 0.01731259982834523, 0.07318024948734045, -0.011846011586640367, 0.017757431360662827, -0.012318656184565483, -0.009908106754494909, -0.03725924800995344, -0.03657438587021793, 0.03786407086244411, 0.047466868745628776, 0.026716676005481353, -0.03759426547168003, 0.003785592461892049, 0.02901909477151732, -0.007753659274328461, 0.003402888259568318, 0.037438871551360726, -0.001568971673972236, 0.011064670995097814, -0.013596960506014891, 0.03248869948681705, -0.01881253161833453, -0.03358558854459941, -0.012726324899936811, 0.03426200506824228, -0.0021109261929463078, 0.018662177386991063, 0.08257605907017143, -0.06769310232338373, -0.08542597159392464, -0.021238425773047936, 0.04193060943650637, -0.004622232733154791, 0.011430640421252242, -0.001846538279783149, 0.025422032561056865, 0.012672711635542566, 0.006616760351424688, -0.0021794163183202573, -0.03542892925455624, 0.013214500766216107, -0.08361144286106187, 0.06247264647371945, -0.00997595676414969, 0.051055431182144916, 0.05137269991236796, 0.05726373828154129, -0.026335970378323113, 0.03802247355230122, 0.0879351409675208, -0.0028392674971284247, -0.03717764115377941, 0.04282473751513567, 0.11025379624142022, -0.023891238317533474, 0.05555980589934936, 0.031038243903107506, -0.04338054751185541, -0.02526156284652728, -0.034719347064298085, -0.0423143057805852, 0.04138408450258032, 0.01182388208668977, 0.03673729268807315, -0.0037709239582028385, 0.010648504010166938, -0.021234195443077773, 0.015152133304718391, -0.07306822697990868, 0.007415112525934022, 0.02654650000042279, 0.021325263375063453, -0.08842326568471794, 0.014419540045035059, 0.07635503691070827, 0.0694033410865269, -0.01768756021007102, 0.02249563862003729, -0.012280660690649627, -0.006035262984775893, -0.00455739638228832, 0.01593961554708, -0.009807067760260926, -0.007724899950701299, -0.029095439289769726, 0.0858133867771522, 0.0008221773041425828, -0.05513326467705212, 0.00996593380062686, -0.09727369968358632, -0.07302266819156716, 0.04141381716315296, -0.03229480234272239, -0.02891630918656664, 0.008457378877142195, 0.028579832471614212, 0.02883635414486886, 0.004975224584100259, 0.006326747312252285, -0.03905525174877191, 0.07863076789094386, -0.018686193385441866, 0.005918922516961182, 0.03305042171567858, 0.0008278087804768835, -0.015272351700371148, 0.03540913455976699, 0.10396484208333237, 0.0019702675333903388, 0.0208988530342411, 0.02121650086942591, 0.004962939401981186, 0.016227903809114853, -0.04532074051323437, 0.04914924630285183, -0.1576547939955577, 0.016992925586876706, -0.037552494724186605, -0.016559643216429998, 0.08133384042617375, 0.014258843168405368, -0.043416300720273214, 0.021158035964151944, -0.030101117499013355, -0.02215694293755073, -0.008435139557103469, -0.021401016670101677, -0.017024952434221932, -0.0010707035484466927, 0.05170503054289728, -0.01777181177466879, -0.016386374196286566, -0.03736693187171168, -0.020325841902073705, -0.07966505648972252, 0.014753958761623623, 0.017759960231459357, 0.031419864196205245, -0.016411479369310054, -0.0006485688571856664, -0.10179950285743905], [-0.02761442604471084, 0.07372013811543994, -0.021312305314382822, 0.018258307488621478, 0.061409738707041014, 0.02366784249560682, 0.022965351529618577, -0.008789506999017309, -0.0062514966344056466, 0.02467544494985159, 0.05768493191461052, 0.03442455367504218, 0.03248455381923775, -0.016978409116494852, 0.0005283949555444007, 0.023449741215364372, 0.06571983819708166, 0.025970673455266807, 0.02436354860390074, -0.006487130296211502, -0.0029427884300428277, -0.00526533123766233, -0.04459745781150292, -0.041381910232044565, -0.01667217786438198, 0.04374649250947442, 0.028268497924491376, -0.031005634335464098, -0.004666636236954001, 0.03228840046286771, 0.0020728223508143834, 0.03401422856732632, -0.043993536440711675, -0.020987522709404467, -0.04835047547336982, 0.025581086760772115, -0.008117563080572673, 0.0432171548674036, -0.02772509350786016, -0.004936871775532979, 0.09284536236334319, 0.021602277208699925, -0.03881852361599537, 0.05155003431613703, 0.010640953692295367, 0.02731183022815132, -0.0007791699371895772, -0.026420813002639487, 0.06817665808814845, 0.002290551009268015, 0.05958987805304751, -0.06326486294783003, -0.06484790804376486, -0.008039951433064359, -0.004601961589930307, -0.04483466273257947, 0.09825144418980483, -0.047286846166149796, -0.016667611823601526, -0.00013705258937450805, -0.09453263524471339, -0.039688863179962584, 0.027176920084620027, -0.03213325172672685, 0.07265594547449193, -0.019336374984060798, -0.09786623437746134, -0.05136821559399216, 0.0030094841058516397, -0.04742670757131964, 0.07176628135450318, 0.061436883660698015, 0.006595103284433985, -0.015159920898103332, 0.002208673109792207, 0.012115615726191027, -0.019342651736824007, -0.023870921543103184, -0.054812863268587766, 0.014484239370831153, 0.034036662504611105, -0.01685975971147925, -0.0014645881287582928, -0.033942803925786316, -0.10808167297182429, -0.04740331817584917, -0.05404220616007429, 0.12899592363643378, -0.018958946909194974, 0.003182876294315493, 0.005411496319633856, -0.018870636063014833, -0.002158870024453168, -0.006864873175219432, -0.05755673483133764, 0.027195979542416628, 0.0031596153057977193, 0.03365462282520742, -0.01553818292780175, -0.026942611913938826, -0.01627952044878184, -0.012117616389357305, 0.05440241941895866, -0.0031576205106911095, 0.055258846848996686, -0.04758604817314223, 0.005773951522490784, -0.06509837616040748, 0.03216192375661704, 0.051562041056574526, -0.07134178177607305, 0.01599088371062884, -0.020904245968058174, 0.010313156285368382, -0.03946772983877249, 0.003381686155814527, 0.02313458913183859, -0.04405496467001991, -0.022512962789493746, -0.032848569580785976, -0.031199042820630164, 0.03356610487103905, -0.026801590704034907, 0.05736222453167421, -0.023577046353567954, 0.02897592634491896, 0.02256790577733062, -0.010046758802991237, 0.015754886919483627, -0.05414405910724466, -0.028686499834970857, 0.02219798881883784, -0.04394128999888153, 0.05989632607818806, 0.02709397747749474, 0.007839367346466177, -0.008713097268200673, 0.030643247823423266, 0.029432516615764962, 0.02843966025028198, -0.020522385782244284, -0.08900403385529615, 0.07791677004233043, -0.015498720571724913, -0.016717192095263234, -0.012439620985853569, 0.054342998756416315, 0.020716582658485534, -1.4399528061486406e-05, -0.0009670763397633976, 0.014563772980470218, 0.019144118019309275, 0.012352897967583173, -0.04284730970634674, -0.03899255783922273, 0.039752975528798244, -0.047654012730558915, 0.09268250368716058, -0.048575930467914266, 0.0016286544171022588, -0.08636622919691711, 0.011784454195175272, -0.0012137632686059516, -0.0018540942237275648, -0.008510336476646223, -0.01321159806261201, 0.014004510995540394, -0.016249321342658447, 0.016675965179126697, 0.04026750080755104, 0.0001173846655674935, -0.041419951827322166, -0.0406013837375321, 0.0034119325515952286, -0.01715550577650813, 0.023907830948045137, -0.05053352621839848, -0.030180808822989725, -0.020122435404018698, -0.022489803974250166, 0.008759741438949274, -0.017916020116478148, -0.056502417099268315, 0.04831659260649583, 0.006213129189226571, -0.09691283070301575, 0.02115168616591291, 0.015246478229983144, 0.017490226803481553, 0.04639150452584377, 0.03975374597051445, 0.014425307483141024, 0.02175587539636893, -0.011544147486795045, 0.016850200987462597, -0.03648336724153286, -0.024502642328794226, 0.09117472991846709, 0.007624771714104455, 0.02277568479543982, -0.011930990000445724, 0.03871123891665376, 0.010484376601395692, -0.031878249325861974, 0.021647158890468712, -0.04681212151985461, -0.0779236349817802, -0.04460824951840949, 0.05075663951195604, -0.032710229728969635, 0.03487424310772044, -0.08567849812688987, -0.0018699500661262698, 0.017805750300666227, 0.043904410969777846, -0.05570216287851723, -0.002390431080260523, 0.07090381741696829, -0.06328166354783503, 0.015593665777127935, -0.014499358253971749, -0.03736227279189316, -0.041721291188753104, 0.016360313274989324, 0.0062448919606610765, -0.053337729718838905, 0.005330643086929803, 0.02739429510618376, 0.017350536607581978, -0.13559936577883375, -0.004289026942598478, 0.025528321168251475, 0.06183669044405176, -0.031753429483517115, -0.10263414745619845, 0.04059243667244068, 0.03928507716179503, -0.03569162101693816, 0.006866069569031425, 0.007403447833565187, -0.005219964232841131, 0.004362232022477275, -0.009590154724946022, 0.014548620960051505, -0.010783568252988715, -0.019247888786450625, -0.03585050874262649, 0.06223606091991031, 0.035526034038190636, 0.024424200868613077, 0.07239486790597238, -0.03445393815641187, 0.03205402601763028, 0.02961816545497211, 0.014133496469888462, 0.028530663500309077, 0.0714169315999613, 0.015722897019622033, 0.021462432372169136, -0.08517249189005283, -0.01951043406024674, 0.02329418654756658, -0.048778261165213166, -0.08283568417456418, -0.043697278128591914, -0.006123280221053863, 0.02168998191883452, 0.002258125319681191, -0.04644663391087005, -0.053320084118241934, 0.05987822207857715, 0.014809646061214033, 0.03352580165653001, -0.10837266245672356, 0.02417107348540162, -0.044150087988292806, -0.00012631688791975843, 0.014971449867376606, 0.02615216632751019, -0.063514198874137, -0.09093386056671886, 0.03706540972444777, -0.023023163653452357, -0.05867549352358395, 0.07546671567887908, 0.007709638354440373, 0.05462802353125463, -0.0662125342938753, -0.023572882102284663, 0.04096963278635969, 0.0021190847525046855, -0.049465671908218614, 0.11765736327487253, 0.08416126918817383, 0.005478284158497429, -0.056717660289273227, 0.004662473711570612, -0.006032415733378881, 0.17335838844017443, 0.04468280287129165, -0.06351998132916832, -0.02627441803080103, -0.0695740460605566, 0.023472246950085075, -0.02202348929299693, -0.028548433365698983, 0.06274628111394782, 0.06317154284977464, 0.02639389724848946, -0.005727162030970443, -0.056552056741886646, -0.02883072155365285, -0.04463438930796362, -0.04587034350714817, 0.024494269643190153, -0.029158493417261285, -0.05531968136873866, -0.051788164319560986, 0.0744703108631978, 0.03530001847135806, 0.07677608551773046, -0.1069087016925796, 0.047084598312046186, 0.056079789777051754, -0.06662351938571363, 0.018053074518047555, 0.01018538722527117, -0.06466167101787115, 0.024728870526494716, -0.025376905898778387, -0.07503600286080213, 0.03115557775750085, 0.004823105286519817, -0.021839153518435146, -0.042009828515071755, -0.034225448339479936, -0.00923912946677938, -0.10916007045932485, -0.031177569864410754, 0.007759680476915824, -0.010337472143906195, -0.04354985590113185, -0.021571777105633645, -0.0211796457443236, 0.051327804683329245, -0.08959730711405267, 0.038248719834464776, -0.05875633191354884, -0.029039933759040584, 0.04711972382684954, -0.05834672754163202, 0.03922034072755485, -0.024224581905240038, 0.0340978698187319, -0.0036575118841757417, -0.037936969844825606, 0.013706182984258278, 0.07369345708367657, 0.0060018286449575456, 0.021990161475531386, 0.1226413314069284, -0.017411615514750064, 0.02836248905242863, -0.026340692587033778, -0.060899783611228435, 0.0005845692003712833, 0.0257217462220566, 0.055029586590348546, -0.07532384430428032, -0.004235424633805399, -0.025321434095211575, 0.02078372016466923, 0.007833988061651953, -0.0521247783135468, -0.00982477010580976, 0.014378755130267203, 0.02899770858240079, 0.03785242007971167, 0.02420374960306421, 0.05392867232236791, 0.015112350954647353, -0.0076947610972860426, -0.021720270771752807, -0.039801008013427924, 0.05799954275592707, 0.00631752818393221, 4.1924201270649073e-05, 0.05608252912537604, 0.012720065912712214, -0.016841024722864202, -0.0010006346511608397, 0.040882837970653375, 0.02065707362986821, 0.05994403823579595, -0.06656687673165339, 0.039920056446500846, -0.008226886412878397, -0.05887433376092125, 0.08839721297266973, -0.01606029940468304, -0.043447064064414856, -0.031573427788788966, -0.002014026636626513, 0.039389641842891246, 0.03814282137792437, 0.02036307555625997, 0.13181158711222277, -0.030371464152632286, -0.005455954810746698, -0.03482737042782483, 0.08988398322991711, 0.011999973529164487, -0.030204739460669434, -0.03608897840315114, -0.10200361132820007, 0.10058941171002754, 0.0387217655253354, 0.015823399622709153, -0.01809481230055505, 0.06610733448161518, -0.008099367953446941, 0.027097216646430618, -0.04082338140939307, 0.029037500930538872, -0.02899799024926478, -0.011222809087660912, 0.03164709471948151, 0.006414555514976877, 0.007033425249998412, 0.038348336015362285, 0.00047632421032426254, 0.05044569586275103, 0.027774238852746585, 0.03193302524658834, -0.004078103680048007, -0.04836999885306005, -0.01428484822624516, 0.017131401168118312, -0.04294784820815182, -0.05943625915457968, 0.013939447330678813, 0.05390135615944064, 0.043058198105719196, -0.05986428233024952, 0.024183450258778088, 0.03962642702511165, 0.015046133007931386, -0.051185955041472414, -0.012407795391662634, -0.019465624175913875, 0.02030907283868965, -0.002495160412207385, 0.006646076702496498, -0.039445364937483775, -0.0334256718478217, 0.027324820041172936, 0.08600353064217402, -0.03820637867735158, -0.05677134267982176, 0.014406271497583088, -0.03540263909880478, -0.024891734725557012, -0.02326493461530935, -0.05879383778949689, 0.04972000051776179, -0.0422489333067603, -0.018555769788512803, 0.0037263024572854733, -0.03582432477003487, 0.06857026820049443, -0.024543075330975887, 0.10036949064092854, 0.008982162991826147, -0.015989250318961687, -0.012528785116945206, -0.05459305817996216, -0.03958530642440907, 0.03726981702450863, -0.057574485366648644, -0.02921923957092829, 0.09166994444839757, -0.026306155258916986, 0.059190684309338916, -0.0522085880127828, -0.045486652486718356, 0.07820603086588795, -0.10242309613187527, 0.0350054032159449, -0.029025941543355943, 0.004348123135959268, -0.012796755239312957, -0.010539838739923053, 0.025116468984302424, -0.02230083174219193, 0.004033020413170678, 0.03541176289604616, 0.013023227824439557, -0.024554148704746443, -0.05675694453248019, 0.09324612460488263, 0.048057265790836766, 0.0069052640654434895, 0.057426538465618404, -0.008939316491221675, 0.0496203788139846, -0.014962265318458684, -0.0139816145170819, 0.009541926868447442, 0.003154715821156221, -0.11677259794916531, -0.02906327068715404, -0.08030632125882096], [-0.022850755129766382, 0.11946853941864431, -0.013868001825407863, -0.021548788796968983, 0.04330189745033294, 0.005207606915102643, 0.027037643072121486, -0.0003013012956631359, 0.06020618323645152, 0.013984088262527377, 0.056094754486017896, 0.04636845083111717, -0.024914162678981607, 0.008470038842530057, 0.057328726039110336, 0.01630913235622337, 0.07765238365495819, 0.08763802861112804, 0.039654163748197774, -0.009932229927364103, 0.0007268808184021409, -0.024573961713206652, -0.1025197382843014, 0.011307822816030277, -0.0009807987709087235, 0.00790007208482108, 0.013015334646701088, -0.03988914107242962, -0.04768588823849729, -0.06613473290718451, 0.04351635399546328, 0.018515954902835533, -0.027039010559217678, 0.030850746124588276, -0.01835604533369838, 0.021456824866116973, -0.0260972067758299, 0.05073111763214581, 0.027264888248125403, -0.024827116279174402, 0.09664311584352601, 0.0635963108377965, -0.05119092542468383, 0.056850824036890575, -0.03518838808120973, 0.005851450172108758, -0.01723518377276329, -0.053443025858793285, -0.010924979806844927, -0.04823962392414814, 0.09129394012333289, -0.04587838548022766, 0.0051926458945669544, 0.0025519622250783944, -0.022863215021486725, 0.07131822409414651, 0.10067414923114446, 0.07624672892635392, -0.02664105147984447, 0.010506083940833511, -0.0885433626828872, -0.06569621521114784, -0.046598876643155235, -0.065883467744082, 0.07426668217045987, -0.04753054712687109, -0.04294998727038859, 0.00625550702386816, 0.01889677718294751, -0.018311718078494722, -0.009831210419012634, 0.025332732347637364, -0.04363759096173878, -0.01187357696788902, 0.008562850039240922, 0.023506482984974677, -0.008267618556190634, -0.033884351030653286, -0.0007535139852259028, -0.0009511004080240831, 0.0346374585400834, -0.021750780366783823, 0.05142284581369692, -0.00736314191748064, -0.03633149884359839, 0.015740171303088857, 0.005184698540810879, 0.025620201180888806, 0.05860025519319417, 0.045860453945590816, -0.04374338735500249, -0.019235056549754583, -0.023597514923381944, 0.010939918798468286, -0.051895325314419996, 0.00015708711474483655, 0.05620260126266003, 0.06778025876762137, 0.05930694947887613, 0.031392820042957834, -0.015711098222408054, 0.02246488822873077, 0.05257376158917737, -0.01755113768418949, 0.06218835832418301, -0.06952187135457943, 0.011967299822664014, 0.022813573714816317, 0.02374066218476748, 0.04747899608295482, -0.044906344472869, 0.011280526451855495, 0.024173077872088666, -0.017449879246865824, -0.07034577301011218, -0.009882447127295267, 0.032757040082000574, -0.010080106626773774, -0.03382816713702079, -0.012247490642187879, 0.019528298652568273, 0.010154269501931207, -0.07542952406016959, 0.04928196088528441, -0.029865006522823628, 0.01769273953264847, -0.021584623059203462, 0.029092418676766683, 0.024282283663168407, 0.004199595659339164, 0.03710156183739594, -0.005799579285330771, -0.003954565102059058, 0.07763333711845109, -0.018901369363902513, -0.0020372884609513274, -0.014296160849054157, -0.016148848295576605, 0.039732078316578226, 0.011344495871465025, -0.0318922663214366, -0.09939484556553976, 0.04350738314454971, -0.02430901659554705, -0.0005754371297266832, -0.03668559158039516, 0.060683200693114635, 0.007881243295639712, 0.0045625075864607735, -0.010290752170070975, 0.025145679769445883, 0.013186645025235014, -0.03749183960449276, -0.06746044640747394, -0.008053575476799418, 0.009620732634355486, -0.0686940654979691, 0.08398091737046705, 0.021601683604537396, 0.10490458155504964, -0.1025738751836189, -0.05923205117695321, 0.01834354646774853, -0.03638423605971706, 0.02393576039955466, 0.028499718928798726, -0.013643306919639102, -0.015357834111621246, 0.061153114672817095, 0.03941245574398317, 0.016843518184189665, 0.005078792850251385, -0.03544223571065003, 0.07679037537015752, 0.049522723340800524, -0.020708572190058106, -0.11082193376019198, 0.005881867440074638, -0.03734802808667388, -0.04432051096742122, 0.036034593163211004, -0.021572490212104636, -0.0024312429382426525, -0.033757179814302346, -0.014141219646913339, 0.015808913371281326, -0.005965575612397949, 0.05061385264821662, -0.026283840804687108, 0.014381880430526394, 0.03588459999368591, -0.05732302563441195, -0.030177068094894243, -0.01521752519086288, 0.03377888676560625, -0.0009097940792401786, -0.036072394776769746, 0.09026696578674942, 0.0068609445667581655, 0.03423951132243221, -0.0015346458720200237, 0.0055771486975698045, 0.05630139923992958, -0.044129950708574076, 0.035339011616533814, 0.05311091458743869, -0.08072887376973509, -0.04284903723783754, -0.014758591776691199, 0.0026204094447519807, 0.06057440497871058, -0.00845867022923592, 0.015893741629070045, -0.008468771332805207, 0.03449925931131359, -0.033234457448149075, 0.05245629326144206, 0.05213062121061477, -0.03842525545587786, 0.01706721162171326, 0.009374429060122447, -0.005937604824599517, 0.031216273561416173, 0.03074126243030683, 0.06531517603097599, -0.11927468499013792, -0.029649702711834435, 0.0034458306716025756, -0.027832534344646973, -0.08632747778064871, 0.01312052355034399, -0.03976615873848487, -0.001509861227483822, -0.08634691744851432, 0.02597613926272617, -0.0030724973744170312, 0.05670953737133109, 0.006529019270259589, 0.01849744722741467, -0.042232566598933506, -0.02486381983618007, 0.031281814659193885, -0.03200490523377643, 0.03364088749157913, -0.011751713024877961, 0.02127982933367012, 0.018327980499389614, 0.08196928454335484, -0.05312337278462732, 0.03800776689845801, 0.11084165810938616, -0.08959868992417146, 0.036951670339773916, -0.0565937262956157, -0.06147248645471793, 0.010438589895251139, 0.028076707892510846, -0.0391766718226537, -0.009868500283992629, -0.09014514929062646, -0.022182265756191987, -0.011690598891212779, -0.06967050889873036, -0.07807549466861742, -0.06484672612667763, 0.027175738934456517, -0.03858119982079557, -0.0015830398974379606, 0.048938482695167394, -0.0009773614133193425, 0.006060307137177913, 0.07245194037269218, 0.021539228249017644, -0.046007695195606345, -0.05290861800191466, -0.014208519668614033, -0.05482588235766744, -0.004536757482478405, 0.011161045020439542, -0.0581037641780311, -0.04581808387452112, -0.02324393562969564, -0.02287007109681659, -0.025756394084104847, -0.002549989366526047, -0.0071078878267146406, 0.010615433767109259, -0.04634714378929864, 0.00397895703886968, -0.07911147035768538, -0.052471628773487364, -0.023201191067116326, 0.041282415552304275, 0.07852511493646855, 0.08369907607705014, 0.0061039540378969095, 0.04976788141159239, 0.03209698608731696, 0.15237555911391623, 0.00036557461894541393, -0.05656865061525698, -0.028236276860772735, -0.04354434088131303, 0.016087577417727532, 0.020377833489394856, 0.03457517433226714, 0.07810525742370733, 0.03464062053626865, 0.0053802635990862924, 0.03969210092429394, -0.052788906114185095, -0.04502629020597561, -0.013685873556388057, -0.03656172470089377, -0.022058963155752592, 0.020975482964510253, -0.042379201206594094, -0.020966232515863256, -0.009793338482387604, -0.0225027745688754, 0.04660556665437676, -0.02861536732946921, 0.023066724891720635, 0.07373668009604731, -0.04643961777419768, 0.020349985555145958, -0.01034739019820382, -0.08025710936139688, -0.02322882718490051, 0.026277418529476973, -0.10588217723737896, 0.050629743966665336, 0.02081175053181794, -0.025007373785177856, -0.044484585695520516, -0.0024911810668957423, -0.027722393172059052, -0.028084592548593364, -0.05231005856326685, -0.044394626395690556, 0.0715475620168218, -0.0761572508735318, 0.00016405799459857893, -0.07694453030958132, 0.04515997520224944, -0.005029741240618744, -0.009359998428014403, -0.06018915658175194, -0.0038645680988983844, -0.005856662975305373, 0.012957341840459933, 0.042609003430960045, -0.03417712205364945, 0.0028805908101201608, 0.009545636072221593, -0.05005793440571334, 0.055472339429848125, 0.06316906516674606, -0.03251946334611376, 0.009690357553572884, 0.012595975326264879, 0.010499787908236349, -0.03714743958912131, -0.04549670237800308, -0.030139615554869346, -0.011624048699797171, 0.05177298012440111, 0.07971906842851548, -0.08523771765486053, -0.013475396618996768, -0.005251249579492345, -0.03784227215277927, 0.067397619949508, -0.05116380275001011, 0.015853791349293243, 0.018556223754575267, -0.024336134186625613, 0.034192962536146634, -0.020404984971107775, 0.027478467025825966, -0.007051622595559694, 0.03630776184329666, 0.0011390066065683625, -0.05196292696276644, 0.008785985975829387, 0.028106301194428987, 0.035501039350318106, 0.012764944709230784, 0.012744812825158493, -0.014424860533014469, 0.014578520669176696, 0.011147276950233124, -0.005879676834196565, 0.029668796695229625, -0.06628444139538102, -0.016442766516545665, -0.02266633246480079, -0.025345978502074727, 0.0688035254688065, -0.04057306424088895, 0.05536966436400845, -0.026052615173678278, 0.006823754679149516, 0.040175988012540666, 0.005726755937496191, -0.0016281573339632343, 0.05123350900674996, -0.05786960700715063, 0.012711353449126389, -0.010576074878901935, 0.05749010646177847, -0.002198359843397437, -0.04140632310056689, -0.05423644627778779, -0.11646764575285803, 0.05951860326854537, 0.03972967547060251, 0.005650592667645998, -0.0015222461361756579, 0.033725387010214616, -0.026545210460422332, 0.021148135412164606, -0.05458340842511643, -0.008998383664922704, 0.05261571819450794, -0.04020992609378302, 0.06395759177813981, -0.05286046957768756, 0.024859885133531538, 0.005318265767130323, -0.08567381555960431, 0.03441465134264817, -0.027906483708807973, 0.05210432885648274, -0.005490442051372, -0.05833315632572136, -0.046897029498886855, 0.020178488778123085, -0.014268563705499481, -0.06026529528089222, 0.0016850190402828162, 0.04555635328353002, 0.012878764710177857, -0.06317696846267747, 0.05677109970863561, 0.07247681609830821, -0.04199011977888999, -0.018353708574459653, -0.027677540612022905, -0.02326561546849206, -0.08971846620410628, 0.02539675006140085, -0.010188502431692448, -0.008798878820403607, -0.021832700808144947, -0.013114816367518732, 0.06011680685553246, 0.010378869513923776, -0.06048669601700175, -0.03617251448877911, -0.05937920431131941, -0.05279790407760615, -0.030173340125115276, 0.004998703350411251, 0.05011709050797871, 0.02750261918639853, 0.011591540803324562, 0.06534253932915361, -0.021859982768800128, 0.021439396607400293, -0.02267424762245423, 0.11649151831569718, 0.04961506176316215, -0.07200190663910193, -0.025948198129232797, -0.03756610076248982, 0.02679370167510294, 0.019669876777583205, 0.0029100782038059456, -0.05465690704384052, 0.013090108400542757, 0.002040951403075629, 0.002868636736117553, -0.002023831760948038, -0.054476192014273284, 0.1296762358111033, -0.08842748382590311, -0.03344059384254544, 0.011701073639025821, -0.03512017979050834, 0.07017499810360105, -0.019132401818295522, 0.016561685363431337, -0.0011977433122335938, -0.008173170441840459, 0.07349621926717693, -0.015050288466578337, -0.0011335663124886445, -0.020433342959403702, 0.10984757124438006, 0.09401495815249479, -0.012444639240353496, -0.029010762582353522, -0.013151447059660537, 0.018337420735588996, -0.014621605832631269, -0.002428677417222035, 0.030446939216257237, 0.002220736134729839, -0.06496628550655259, 0.022781372528584618, -0.13226062713692943]]','2025-05-27 14:28:20','2025-05-27 14:28:20'),(105,84,'[[-0.003480045521298533, 0.040835807686143505, 0.02240648527123172, 0.01188982767348585, -0.017891492449525405, -0.0035587911297977125, -0.014026435601646165, 0.010920968996221782, 0.050346125101816894, -0.011723242377388659, 0.07754079022758846, -0.03802294400979135, -0.0790075359113178, 0.015598874361455793, 0.038869552707886154, 0.08533414550940219, -0.023283384650538544, 0.045178909709566784, 0.055382006150098674, -0.12052326686744583, -0.08189747134759219, 0.04790500824932701, 0.03879647726144137, -0.035846080023355584, 0.019948299646780004, 0.0547757322174996, 0.050641762628688664, -0.03348516741883907, -0.01797534927421489, 0.011130600596391888, 0.06004369237097442, 0.03491160922004789, 0.04225896157050476, 0.0894165187158289, 0.0020591154643323554, -0.16279633659024195, -0.04515095942734717, -0.04080566645569728, -0.050486710448188137, 0.010389445853152096, 0.0194119432659444, 0.02607038587186928, 0.044900079415816696, 0.015517634419675437, -0.06202878711276831, 0.002685001820927153, 0.008863914457949786, -0.004850286735655781, 0.013621427015347805, -0.07656221650329367, 0.023419963221878733, 0.03167987390436192, -0.037741483382563216, -0.023666882788115542, 0.030562257165598926, 0.06671243661818578, 0.0771722087709458, -0.010997241194546996, 0.006834498597050718, -0.031588505684183414, -0.006446675354311516, -0.03501820946227658, 0.011407502228009344, 0.04251177547494466, 0.0016262701783963831, 0.04131777743879741, -0.005852230823452301, 0.025546728322603567, 0.06790156255936801, 0.008976811808195389, -0.11386273643432275, 0.008538569107852606, 0.09400050847258136, -0.0056676617430796725, -0.017005418287706218, 0.05121628126257089, 0.1048274692008468, 0.0026538585230962523, 0.043659195685423174, -0.05844696636721489, -0.005825000520296918, -0.01494617055944613, 0.02476594670881233, 0.02682358784134008, 0.02188685691461193, 0.0869338246602939, -0.0505319282718881, 0.02599843130616798, -0.05216813318994093, 0.05022475912392732, -0.09934037835652773, -0.03435520999701106, 0.0339019258243445, 0.05884276579732475, 0.013084894282608558, -0.11046085441079061, 0.002520362373800656, -0.008488119012842039, -0.0017307160878360854, -0.006161448194158346, 0.0021266703863020075, 0.04512380123418628, -0.015413117521121981, -0.020643943642818866, 0.03801233599443498, 0.03135827379045565, 0.06333586557634927, 0.0695906431583603, 0.03182113177917926, 0.055716154150301386, -0.03412551014800955, 0.024575784059902777, -0.06261535745640452, 0.008404058935111067, 0.0027910819744908608, 0.02700504797215719, -0.03409870166964063, -0.08189355573752827, -0.009219435412169321, -0.01250518671813781, 0.04248291354305367, -0.04239462400865061, 0.031159504271943774, 0.008164182983466339, 0.01874002607348369, -0.05292221990794526, -0.06629298809889599, 0.01013706161966387, 0.09049508695850408, -0.03046044532590642, 0.014058107207934165, -0.03504094092375452, -0.05943008339478996, -0.048057322491798116, -0.03507392769678154, 0.00273588027919519, 0.027354556522068654, -0.01780600511698106, 0.032781170619499735, -0.009803190103377891, -0.06116804635025961, 0.007719475790248947, 0.0011013269789178876, 0.08794718454483592, -0.04530759877498047, 0.12020847573042934, 0.017833862739725884, 0.01478300170785509, 0.003303132803657757, 0.10840527270981555, -0.010307465382827211, 0.031184498418015898, 0.04405599643566389, 0.022758827407662725, -0.05207635248564882, 0.01426836201779765, -0.004085728749745787, 0.04220838743135858, 0.0435290121123515, 0.07649496963671502, -0.12179933728613893, -0.05287429403636903, -0.02437973006180546, -0.01610104537412267, 0.028545380223950343, -0.03706397523695399, 0.018414626921110826, -0.007520183194056774, 0.059441710664369075, -0.0034838602520955372, 0.005848917126347636, 0.017199740151427934, 0.0025967119128971726, -0.05111767364729711, -0.0016239320211654672, 0.014361688043008122, -0.045524048319086304, -0.03326766574134202, 0.01401476349683731, 0.0027244979220585265, -0.06042602329807053, -0.0767335169710518, -0.023174517240192698, -0.010323219735303849, -0.09127868123570765, -0.014332654242736467, -0.04971848269872396, 0.0068508784009822235, -0.0014459456865858866, 0.09723559148542121, 0.0014002305654627271, -0.005821817218985411, 0.007551361612817637, -0.011973445376950059, 0.021875110084420175, 0.022739120829684545, -0.020579491505560644, 0.02483310988296213, -0.04562851141536407, -0.0544026493037911, 0.04076412810985127, 0.011133484248917969, -0.012232961400982185, -0.0486971810004874, -0.027357147998347597, -0.08214016743518754, -0.06104619615188885, -0.02684486664137446, -0.021105250332593486, -0.01298546319361522, 0.03397117234216954, -0.08896319867497854, 0.04340313272133482, 0.0877270854130293, 0.0674560020022779, -0.0018079421556740096, 0.02574299603529598, -0.007896207298836192, 0.00964079989027666, -0.016993024335698555, 0.0073757494904662215, -0.0007829769521340884, 0.10428412599671012, -0.02167301080284631, 0.008256592875482466, -0.0706514446939974, -0.04141964009175029, -0.009245655054520994, 0.017904786095143174, -0.013474319637557118, 0.06337432224740451, -0.049670018804390856, -0.026921101477008224, 0.006779321374317948, 0.022000284067822288, 0.018345244403088917, 0.007703029480726662, -0.04321599645043269, -0.006259672841844775, 0.0038091857999662487, 0.014526405204532834, -0.036440308224231305, -0.05111338739933401, 0.05353381428780676, -0.006468605012430945, 0.03462578761947376, -0.009074280608633791, -0.0031909946633024108, 0.005261869287514699, 0.08264557405693394, 0.024504339121312852, -0.023856834711445313, 0.025901644001221618, 0.019750606173781875, -0.026503972433603612, 0.06057241331218538, 0.044482092525016406, 0.04854979564427233, 0.008849408766621393, -0.06616755108214606, -0.03692484255202631, 0.04851829142284203, -0.025480225720838592, 0.07307188951656203, -0.010140025228349652, 0.019025608552832547, 0.042796813953506006, -0.03436986215008994, 0.005878354070060034, -0.0040970515133895895, 0.09865331731796867, -0.006255515121540264, 0.005885837443530474, -0.04786482691643445, -0.05151750227005289, 0.0402048564430958, 0.003990581293327148, 0.01703390509817505, -0.05147518976924005, -0.0030435082410069686, -0.09524164925829205, 0.05935777313626606, 0.018275893269727825, 0.022776786906188718, 0.005327944833716404, 0.0022421629490956985, 0.06885004287746163, -0.05619507809634832, -0.04714844064861043, 0.028869075637593108, 0.008803671601510278, -0.07694933583292596, 0.037443873105582906, 0.10204778060548658, -0.01384454505262356, -0.04333228110228511, 0.04043913546356138, 0.03434542396086659, -0.012885099531843303, 0.020986605853149105, 0.06582291761621493, -0.023695822434404747, -0.03123121074937385, 0.03843630988291316, -0.014224688020508382, 0.06229740991921436, 0.0721650581378811, 0.00992572702801749, 0.003488878061557219, -0.004888308878609467, -0.03421493550823268, -0.020474160100333587, -0.0514782505209236, 0.023826040381152554, 0.0025341361300035515, -0.09650912326893643, -0.0402169111418651, 0.02021521572548064, -0.00229345725411957, 0.016640359385613427, 0.05131143357613942, -0.009036051849996389, 0.04387080302471714, 0.0850764086967369, 0.04795699021468701, 0.0974627566494348, 0.021901250517865976, -0.003952632007621788, 0.06480982076502072, -0.043508869138137195, -0.03490917018355007, 0.011810989405511877, -0.020987057194461818, 0.015566253742804976, -0.05627108277780275, 0.04828176466285884, 0.05999819955786538, -0.04174442051795275, -0.04372076342290149, 0.012302521018161566, -0.021744899610210658, -0.09632660801571279, -0.024241769070881634, 0.032169160766509323, -0.04164777369672624, -0.1047766678965366, -0.026956231374016797, -0.09674518374253033, -0.009584575017675642, 0.040262275427315544, -0.05890619868036023, 0.04290494756059179, -0.12362372463045448, -0.03167615258029354, -0.021580699548335608, -0.06035817862842868, -0.055132596734103666, 0.027846183783208453, 0.018014991089842915, -0.003974828435358167, -0.022996291223947467, 0.003017734148750833, 0.042064254123807286, 0.00788151628855821, -0.06368962749505536, 0.015827611747525568, 0.05549647348063899, 0.032152335599295735, 0.011670571443998327, 0.0010644370189218525, -0.006470457454673016, -0.004360575433333515, 0.08452770319912337, 0.026582724020133425, 0.06266471207730179, 0.007993593901353407, -0.03790495860822415, 0.04134399110311845, -0.05471651982409027, 0.04983588225328924, 0.050964373029771734, -0.03205168947557646, 0.015183002198991546, 0.023294784754953647, -0.05219171054275329, -0.02979905693989621, 0.01155162208499172, 0.044979234519414164, -0.01810159930313075, -0.056779442546681345, -0.027756489411606883, -0.07104196552305925, 0.06664125022942069, 0.06137049833564076, -0.016684707405856446, 0.019560214865200654, 0.0012770616508972579, -0.029466394480305542, 0.014778573481664482, 0.02357640529450119, 0.0066084647753342374, -0.09963740876453675, 0.025220121608043048, -0.0013465118887974197, 0.01083867318478106, 0.06926060206520175, 0.09638427209918844, -0.061842589392675396, 0.04353693898096945, -0.016933466711020233, 0.027264377929985897, -0.0019483606776279307, -0.028363704884030488, 0.011814044179164795, -0.008009498451849673, 0.015427334772472384, -0.05163003869669909, -0.01721415467778919, -0.00818585932253774, 0.0045044468284177516, -0.08574315638720864, 0.02548781781974115, -0.0643551795794007, -0.042459285376980946, 0.0017836814392350401, -0.021486660642972277, 0.007531798507574626, 0.04541027444009929, 0.07054189728266716, -0.049023157032816254, -0.0005548852867792915, 0.008479277505537406, -0.03004332823856307, -0.0671981336729387, 0.045318517647929706, 0.02623025634505915, -0.01017048777794234, 0.025836014191928904, 0.04148967869863405, -0.07542003005863342, 0.00697223840084116, -0.012735476897664228, 0.021871070430220647, 0.052370818318516726, -0.003102693733278453, -0.04044487736198335, 0.0258121469046309, 0.0028694255604300423, -0.006483352066746103, 0.017826322948591353, 0.06833657189239274, 0.0011197841484939905, -0.0133625842670156, -0.03895614747060507, 0.049039775957973035, 0.03624838355079299, -0.040144397630299714, 0.024855503585709364, -0.003133478349271437, -0.0011728881154782233, 0.010806932083886967, -0.02382386288349487, 0.04010523256261458, 0.03598446545445427, -0.01806980963073777, 0.07071521234674825, 0.028883497636492655, -0.006023269005116457, -0.03565707561788097, 0.0035318559919047805, 0.02086707064714057, 0.06490150582082271, 0.010754241721897081, 0.008090684591354341, -0.054929218153974564, -0.011739987588442542, 0.01045337715449151, 0.000580247268548738, -0.04284108127033549, -0.034315022686087875, 0.08615158739604378, 0.01511521880416368, -0.005746006449899598, -0.07540057156892646, -0.03286161099968307, -0.025693366424989643, -0.037354911042733745, -0.06869777645923558, -0.0206962693449402, -0.012057581674571587, 0.03645844855818391, -0.03707555767130337, 0.06836298880975526, 0.05147976296267348, -0.038066792864476603, 0.054877203309446086, 0.061836420065063236, -0.056711950580846784, 0.03116066400988637, -0.07084655565776252, -0.028213198995825545, -0.02151124379943846, 0.07120759283974767, 0.03341629751694385, -0.030441336550991436, 0.04010212398668597, -0.008791291100071538, 0.024497685573219505, -0.034234328239602686, 0.020856559774781964, 0.014716052248300377, 0.045615165461978274], [-0.002631183607497136, 0.032808071613501244, 0.030089573743648346, 0.007195159869044364, -0.020856202307579376, -0.016282830374652505, -0.009526937923666283, 0.023562935902021048, 0.04836752352398688, 0.002051501782804496, 0.07241843246223957, -0.01849260758036141, -0.09842641286254185, 0.01892841098855008, 0.02418025221299334, 0.08559278758599756, -0.026291743831047244, 0.02021279814664355, 0.058163488415728166, -0.1390595522256773, -0.08866918659125148, 0.04614983161737551, 0.04742733477688963, -0.022367069224005744, 0.01958871320288949, 0.043737223123866804, 0.05259352448648404, -0.05047111865679056, -0.015222113210532422, -0.01624068694520193, 0.06179686134793539, 0.023612739013242595, 0.04574232015307258, 0.11567041186177014, 0.013299762299641684, -0.14499974928689546, -0.044095273020427865, -0.03802154308445165, -0.034295003162871575, 0.01409786440527864, 0.024574786543039417, 0.03308967648945463, 0.04130825393869589, 0.008662312256013625, -0.051574735199929576, 0.028124028967360635, 0.012969702270733225, 0.01868951270929599, 0.006372101560839884, -0.060331011380101975, 0.011969354055124995, 0.05666327765586784, -0.04228437305985556, -0.02674848916743892, 0.04066391470761124, 0.0755187425470132, 0.08522236622561695, 0.008694453015422614, 0.011806396830099673, -0.04409079196997445, -0.0141002840510858, -0.03660855190350466, 0.0025363348959796133, 0.04688148454157678, 0.021074621639791805, 0.040292515773893235, 0.004970659862404685, 0.01562535614032485, 0.08035595757697903, 0.008371384002050467, -0.11023074449306772, 0.02431281510426911, 0.08616271891358444, -0.006077099072656887, -0.02527914938422868, 0.04643482460464732, 0.0965227254053519, -0.01987958225598284, 0.027099790164841486, -0.07091004894640324, -0.008210901069789054, -0.02858851899190045, 0.036610449367280674, 0.025555597712624393, 0.038442230537215155, 0.0869528531893332, -0.031166191654211348, 0.03656122763896009, -0.04738943104050016, 0.06056629081644247, -0.10000456839837842, -0.020986101159713635, 0.02105876491450849, 0.058607695311488, 0.018451719512945042, -0.10885449124676623, -0.003450838434926596, -0.013826712277774511, -0.0001302612677154752, -0.004377949102694108, -0.00769770618606124, 0.05184248100046302, -0.012644319110539863, -0.02489299577218846, 0.0387128878061665, 0.048046424078014224, 0.07784309620537236, 0.07427924027403386, 0.0254835001610203, 0.06392326551329768, -0.02564422596864504, 0.0049909338833585394, -0.061870932261866525, 0.020328148764514425, 0.0019133933638969757, 0.04251960695706543, -0.02844692265507988, -0.0675682114565675, -0.017323420761007752, -0.011689170759032594, 0.030950293671864474, -0.04747622255158564, 0.035365269882683535, 0.0008067108039155002, 0.010191542067878655, -0.0496115129193037, -0.08786781325806468, -0.005193413001881507, 0.08636337646688244, -0.026155369314538237, 0.012233345154338481, -0.03145104498814925, -0.03536079490411421, -0.04931145255167939, -0.013493547998128508, 0.016903738205060023, 0.025125680996054403, -0.02127256809684665, 0.04835488793320971, -0.008506200321306619, -0.06987557598326183, 0.01395801069918995, 0.007296095834101687, 0.09065550024704583, -0.041630971541776716, 0.12396975447714428, 0.020743236422182183, 0.014883045541586514, 0.009208792449300113, 0.11815290166919255, -0.026219209103789158, 0.029461349292920554, 0.04204391734233412, 0.027299105831757098, -0.04639468945085727, 0.0061518864689098455, -0.012378155794795606, 0.025950503945570566, 0.03807353359191418, 0.06785838072502026, -0.09214170924221025, -0.0605572740685789, -0.013222948412075953, -0.01934212943635707, 0.04053950787463025, -0.03021814588911042, 0.030154227165366417, -0.013880873483796788, 0.03320516676065942, 0.002940266225629975, 0.012515989840441116, 0.005008986353723447, 0.01667760150817783, -0.05405768039865824, -0.0176808422175662, 0.00016829289316344705, -0.031567950008345426, -0.03395988980843486, 0.02791114871140312, -0.025479674874047873, -0.06076568541785116, -0.0729078263193467, -0.03902855595182672, -0.010682952549486917, -0.08488904407698479, -0.012895579745787379, -0.037749750373176745, 0.010694866345043694, 0.012717580945916913, 0.10338182925995563, -0.03528098909566647, -0.00017395947898410735, 0.010955860210476604, -0.017241876875741198, 0.020210612268373594, 0.02750746557001466, -0.02403453610282231, 0.03178738486317077, -0.04298615838625149, -0.04979376962788752, 0.04466852566860827, 0.018639849251408352, -0.014240374560653735, -0.04111810681674593, -0.024456736972693554, -0.07463910869987785, -0.05836049069480807, -0.018239985325108232, -0.025306204181732465, -0.00266977726171556, 0.03349910666912785, -0.09931607139029859, 0.04901236368550838, 0.07371809496271539, 0.0711233481623625, -0.0120331050430712, 0.020920275864367503, -0.021061913186405636, 0.01466589826908952, -0.006511813336638128, 0.0011969078163891964, -0.011573700221451075, 0.11108594507865222, -0.038472790329805974, 0.013533748424672453, -0.05824738363810595, -0.018066367389603807, -0.006072649899594912, 0.017764748065741125, -0.009659289057984652, 0.06198372965248041, -0.04866699795479716, -0.03277151887132029, 0.013998288542255957, 0.019055521327919118, 0.01071551985875275, 0.002357317537554188, -0.028039186531065872, -0.006400817018640428, 0.022672560891942493, 0.02092251942553625, -0.01621175138160337, -0.05181794451688276, 0.04486992399176443, 0.005973701717589331, 0.03382824832556872, -0.022116503819485756, -0.009364111244148751, 0.0032607083901506216, 0.08468573311034241, 0.013724649978219752, -0.024846073769964398, -0.0026084969613520913, 0.03540752108807659, -0.035204088683752556, 0.06609159603825455, 0.04505885673689774, 0.06132258648219547, 0.004149450442903544, -0.04875898699865787, -0.03538122072217014, 0.04953169800302984, -0.014783361902621354, 0.0836503615083567, -0.01468961960223162, 0.013998098795878357, 0.00871784570783871, -0.03073690337764397, 0.008556283498181506, -0.010539398030049508, 0.07196745541572695, -0.004592093069526443, 0.016638531970044383, -0.05186308290315737, -0.04164808514706526, 0.04144943131551471, 0.0033245485588942985, 0.007885302357710738, -0.06571209721116954, 0.001987939971996759, -0.07936485608184402, 0.03969717664736014, 0.003893892052203377, 0.025836446639009417, 0.0002918892719291115, -0.01223181200360747, 0.06887169924401575, -0.05141675084796841, -0.059565705038369485, 0.018417858133383973, 0.004177994369978738, -0.06947509879666931, 0.027333190353058225, 0.08013361732561985, -0.024951760984316836, -0.04056817931127119, 0.05457098533528506, 0.028967450097823685, -0.023982064398546186, 0.018546081145511262, 0.08474695591755348, -0.035439920661544624, -0.03075233203509942, 0.019584089463160124, -0.014751206722487668, 0.07208956100464041, 0.07177344050361599, 0.0034139346619470813, -0.0011331363358342108, -0.01892986672275903, -0.029850475092219508, -0.02009664604007369, -0.03314697078766384, 0.013015312745995315, 0.0056969403076705775, -0.08614049581783988, -0.03666890035940774, 0.01610086359853366, 0.015365449142142835, 0.033247581906922716, 0.05321892854705518, 0.013660646248098584, 0.03696142551888478, 0.08119111487320482, 0.05313989690382805, 0.09478099938419761, 0.017215034594180327, -0.017437699691337943, 0.03824030092420172, -0.0454918792221763, -0.042572350378154274, -0.021464570179384034, -0.009120060212264542, 0.013742814019454689, -0.04489372274142858, 0.03883928925306883, 0.051628386367688864, -0.033001072520970315, -0.04758245623550556, 0.01956451219090482, -0.013457166786672905, -0.10042187077576552, -0.03912742747629575, 0.028788420595630096, -0.0508579158885436, -0.10784330395908395, -0.039121146112211666, -0.09113287784555227, -0.02293052336924686, 0.03547701683735103, -0.05101323771933428, 0.021999475843636894, -0.13571638499322736, -0.03685661569178237, -0.017377422580072847, -0.05889183519904613, -0.06499253644411998, 0.030956262333918277, 0.01746023093519973, 9.635686316328551e-05, 0.002572659752761069, -0.0064310846018097445, 0.05440834992011615, 0.009755545118384836, -0.05864926342992169, 0.01994000357449491, 0.02978477427049708, 0.052031863065018495, 0.03687348642170758, 0.0028972554654873896, -0.010400471045269019, -0.0020217958489128773, 0.07799647806919846, 0.028451385489881045, 0.0757902286281419, 0.008541840003918558, -0.061096196284152804, 0.03258809636099249, -0.05818367743030486, 0.0472291272288192, 0.05357290724533845, -0.014518387917171896, 0.01122243869129505, 0.04126434814489016, -0.02780166049761459, -0.030704710248234766, 0.009498277871807998, 0.047868211244229825, -0.02348628291938352, -0.05310336237729935, -0.025363164526317105, -0.06335288486628862, 0.07193074480455984, 0.06356050079874599, -0.008774455401117542, 0.005847892279385118, -0.007813787706978633, -0.035918133144112505, 0.006140399223209914, 0.04663812342752152, -0.002370546275507737, -0.10578158357486016, 0.007691049883135016, 0.001701235851891741, -0.0003312434770655529, 0.06204253584982635, 0.07619686877707889, -0.060213192541351275, 0.0461309328781665, -0.016368345272109484, 0.00741550322952566, -0.003524217154072248, -0.046882146376941845, 0.012169450718130812, -0.013185284515107771, 0.025811272607600407, -0.04052247320383479, -0.013482131338081044, 0.00247168868462389, 0.016275138815490094, -0.0946959930070326, 0.03845687592162387, -0.045786860458765, -0.05840532548687853, 0.0055134802275600145, -0.020107475245336105, -0.0048770837798417285, 0.06006656261262572, 0.07980642170802765, -0.026071146210419963, 0.010316320803759743, -0.009736806525118524, -0.018938381022214717, -0.06407313175623958, 0.012148223411375891, 0.023079701971316348, -0.012064002584214148, 0.043941022877177875, 0.03191980051125753, -0.046862670808744934, 0.010268561640517706, -0.007318129183468653, 0.0235325491581266, 0.0651663501978861, -0.010791891257765916, -0.032493144237699174, 0.06283224509368927, -0.007143888120860187, -0.012760556223486886, 0.01826157087302406, 0.05291864351971979, -0.008498173290548607, -0.009363141260666457, -0.0404783214987237, 0.04404778481501304, 0.017220532685217678, -0.049868317184719194, 0.01874750223823273, 0.008519889383972227, -0.007317622181147705, 0.01154705831206495, -0.027649748029736635, 0.06251964021354904, 0.03799599866811357, -0.018520564052651553, 0.07296643821640197, 0.03772367163103933, -0.008185202579392358, -0.03474117127719029, -0.009754928063164879, 0.023587088338933054, 0.0319954865463548, -0.0015229094549003477, 0.021756860053352853, -0.04716866947900263, -0.0060121576159376175, 0.009228170867351695, -0.00017244625162274365, -0.04371169995912301, -0.024813472306350597, 0.09437566469033852, 0.02011301735753306, -0.01797556843502341, -0.09196999636033694, -0.016388300519148972, -0.028968931637539993, -0.04653922761551616, -0.07920355040928934, -0.0019975800367107504, -0.019669142897426776, 0.03583732851073308, -0.04040574123233499, 0.06806259640239103, 0.027407240015395073, -0.02854876029492356, 0.05219166291032055, 0.059850773924192344, -0.05886136648471656, 0.028200155214053942, -0.06952379530701669, -0.044769431274245174, -0.03025542725738136, 0.07017264291203312, 0.043311325994559904, -0.037962017368841854, 0.05116136133154431, 0.007925845845705385, 0.00749320133521101, -0.050975488815988935, 0.021301863419577145, 0.02247241034096544, 0.04883374099954837]]','2025-05-27 14:29:27','2025-05-27 14:29:27'),(106,90,'[[0.017699821735912637, 0.0598263348564196, -0.0655083256189439, -0.042325003650490745, -0.05561499300379712, -0.0525695161575611, -0.019073311525232096, -0.03081930788292355, 0.007118524673434107, 0.006137984241398096, 0.05641036354896245, 0.013912662010142796, 0.05210834919438453, 0.04794181372402453, 0.05052981901405932, 0.03261316303509198, 0.007802781749013077, 0.10122472460874117, 0.0002438761356684518, 0.007978382805125344, -0.09378018538884968, -0.016437120657934717, -0.08021551209356156, -0.05145805670345261, 0.005764926326610246, 0.0283863473067305, 0.031128477731997988, -0.016919157611476162, 0.04196610476786383, 0.10888486228110311, 0.05961273281252787, -0.03152759535936573, 0.0037649026758487737, 0.08473252324323004, 0.03268274676218077, 0.018141462182305557, -0.05555276932408844, -0.005007167913957531, 0.004348192413111312, 0.037724522794886285, 0.060653381295232914, -0.018452247276334523, 0.029550405631723373, 0.0340541803190343, -0.008538517279531782, -0.042971918655676476, -0.00039194004284360656, -0.030525377741801057, -0.04034459368846285, -0.02483234861746051, -0.0018984375625259512, -0.018882863034942556, -0.04428960643226521, 0.06452988714191617, -0.017159138571117363, 0.02636570150742257, 0.09843042946308501, -0.0990511894647848, -0.007900703196843824, 0.005030638534161897, 0.019901539058504232, -0.05434247397130193, -0.054881415406352586, -0.029001078769853965, 0.06876259466854037, 0.053250298319920425, -0.041564679647703905, 0.027384110887372706, 0.0006375324831046162, 0.09714634903707402, -0.09882100765786775, 0.04808106664089812, 0.09023198619813072, 0.030539902981614384, 0.032973477179964766, -0.006109261511210628, 0.020139453530155983, -0.03307704771200157, 0.011357395769694318, 0.04871867646774262, -0.024717763653162344, -0.0014198587501500545, 0.027666759952622293, -0.004817770614828876, -0.006390998689493822, 0.04828370211163824, 0.0003670812947993495, 0.048356047993061965, 0.027332028211172203, -0.0025691317082486313, -0.030084896169565993, -0.05640615194730323, -0.025892877432510668, 0.008462876811176986, -0.042062684451367266, -0.0602098230659416, -0.013369034655470083, -0.0008428902611976637, -0.0016568789615164655, -0.05151560728294363, 0.055195853176008884, -0.07298140937930168, -0.01078619045764715, 0.019090419447718752, 0.03295232003494131, -0.003953527392205527, 0.004452870969001842, 0.018059547897436894, 0.014818195679714902, 0.04435521443473576, -0.026338828617290172, 0.02268861602485565, 0.006673223432457734, -0.028603277268004726, -0.011541174751187482, 0.009615270332791883, 0.03012417140614291, 0.023630411516343472, 0.008863023409404652, -0.02478069154548612, -0.028015369126649977, -0.013223376309530781, -0.03146330690092153, 0.020286322882497702, 0.05143736447549543, 0.029421319357166763, -0.03762364946553546, 0.07028341359950606, 0.00940262974423024, -0.028262937464442667, -0.006694365194195913, -0.019406518612185425, 0.003119818495268251, -0.04822296548284007, 0.004901683017530177, 0.012456517829007255, 0.041403151733743086, -0.030412324269015335, 0.011975285079435235, -0.01522709707652151, -0.03857779260734235, -0.13156849412152766, -0.024176256627977562, -0.0035153657048535673, -0.018788970298601573, -0.009822314824018996, 0.07235381236192134, -0.04053855298630435, -0.01166974995882197, -0.0037633532371701695, -0.020140027839473152, 0.013612526422663243, 0.026705461873905705, 0.019858657296155827, 0.04213944704492063, -0.04321012370049465, -0.009411677679856487, 0.04195257431383202, 0.004330573851016017, 0.06750193102123525, -0.05533889721807733, 0.011740808772043839, 0.010752743776937903, -0.016055934813443137, -0.06866740973623577, 0.023362851744700857, -0.08882736918567163, -0.004068078171425289, 0.022604999323082534, -0.03538589081478385, -0.019367330547558435, -0.021208841408274216, 0.031028120597331045, 0.030385266779459564, 0.05317181279841556, 0.01779199325355604, -0.06976025199664612, -0.06708599433529336, -0.01855313086120887, 0.05171061948119994, 0.010350503342658069, 0.0383501404962271, -0.018315635156767547, -0.005873415236802241, 0.1155810901347585, 0.03845278119413135, -0.03981116288805071, 0.04576490451282981, -0.0776492382578674, 0.057337503897339014, -0.035730134554299506, -0.06680580659568877, -0.0018574774288972605, 0.02276836126649966, -0.02198033538542915, 0.0383804592422625, -0.010589087841846515, -0.010011978766759194, -0.01020686106171757, -0.04541663377107831, -0.022535051524908756, 0.020476304746467045, -0.0185137154658105, -0.0348046966228274, 0.03883092627589901, 0.009602015923268179, 0.06536512432551479, -0.007786584004238896, -0.010235076570804236, 0.044263895834798506, -0.005270480189608604, -0.06422834740234123, 0.05094519164620757, 0.01808577298033356, 0.006534184172324165, 0.03696504658204383, 0.0582758842994944, 0.05290858427620657, -0.010708846717760937, -0.03264840785092521, 0.027760035648298105, 0.01220860764043054, -0.01306390291878197, 0.008917933191589063, 0.07897665168926171, -0.01965364596246672, -0.07138421414616858, 0.019335670037195732, -0.04174288646141742, 0.07731026585744144, -0.0016173189205051074, -0.0023910272361135835, -0.10983427078955123, -0.030931250340661184, -0.010334367131025013, 0.009453950947809323, 0.040883412057231255, -0.046599379369180044, 0.023828348248057133, 0.0119019076632707, 0.00538544802678488, -0.00982621875997259, -0.07791468539166473, 0.04383433639511312, -0.03968683175789992, -0.01242645974419468, 0.03192876750994548, -0.0667008720790237, -0.07658304668457983, 0.11205865965613952, 0.013738018990852766, 0.013055362631570004, 0.04940669561119981, -0.06483591880079324, -0.015578027417372742, 0.07833598913491585, 0.06967111098620311, -0.02406780275749093, 0.042566504136866946, -0.05409264941833466, -0.05350431054499203, -0.03954813263929646, -0.0571458691848289, -0.03436223915306065, -0.02342716413269994, 0.07396952907053307, -0.02296347089222941, 0.025677355896466632, 0.023494132701290922, 0.029478104190901567, 0.05223812942603272, 0.030132464706163414, -0.01679823986140389, -0.016330543548252394, -0.008589011204213518, -0.13180137654963853, -0.03639880836188858, -0.08669151967214644, -0.029914418602079336, -0.006760112073547474, -0.03544776238818498, 0.1386433695776032, 0.0018474646194330962, -0.025987387209516818, 0.01771654507626726, 0.0032255446101550843, 0.1454835713074596, -0.06439712597143127, -0.013967835017430907, -0.010809265385569004, -0.02276378901226329, -0.03930318971552511, 0.10080886312997177, -0.012350564597005783, 0.05165348937817327, -0.0037180097218632866, -0.026834997682243313, 0.04333299512779764, -0.04766105509361061, 0.0548759423753003, -0.031712731488471486, -0.057754609712962285, 0.007174673664710618, 0.0012344451877673893, -0.04484792738826238, -0.008182030154186185, 0.0887248823206202, -0.06675136343982456, 0.05205156436064973, 0.0962107239522379, -0.021961545557085082, -0.031641113749217735, -0.09312039970164532, -0.004294037266532642, -0.022555237813705577, -0.03701855648526765, -0.008827838417458626, -0.08412403568467683, -0.02915909929477066, 0.04568987168424362, 0.02319846253967773, 0.08689561142722653, -0.029449436584153024, 0.0023593109613417353, -0.018469302211949652, -0.06895096128755518, 0.015525613145911731, -0.04275065915422254, 0.06885166730882657, -0.023413587528812292, -0.0399158444351356, -0.01496767335353875, -0.009993176973637682, 0.02453078494833068, -0.04833834354095719, 0.06621702331632691, 0.08852337495746737, -0.02690616075995431, -0.05893981321820117, 0.04858074651340322, 0.044434845156367114, -0.04113139745298045, -0.0038654550927760918, 0.04204330493042075, 0.04457321609821791, 0.030070760639646456, 0.0036900625656420814, -0.005198898344687174, 0.03922968837845136, 0.009434461179984959, -0.06802248088410523, 0.049174958383215436, -0.04446275043586728, -0.08750630050482887, -0.010693989028060142, -0.03374811447507884, -0.03306185244465155, 0.011377107740528301, 0.027371677774357627, -0.05674569523853851, -0.06803761803682197, 0.04238631458860607, 0.022298789901797775, -0.06335733895270197, 0.023992064007035723, -0.004097735863507072, 0.04963447420710515, 0.010688066463226866, -0.006830841000762756, 0.0434796217660827, -0.003160128898750549, 0.08157595514770861, 0.008796728286858206, 0.025949011040501894, 0.0014724508908471295, -0.02365791170266456, 0.019313483921312352, -0.058276219313262746, -0.07080025096286151, 0.031102083432963227, 0.05922757637117981, 0.015195024635964054, 0.03990595469195369, -0.006342279397694667, 0.004430753650588745, 0.031235955618496222, -0.0055099039324718385, -0.012255341206487974, -0.009912922374325476, 0.03082065477501262, 0.026783015852024097, 0.020564755218326312, -0.04203663200311654, 0.0008641227202219793, -0.006553253036370697, 0.011048200281811077, 0.02975700999006605, -0.053998028539823696, 0.015489082971130557, 0.050148771619135266, -0.052703678916260516, -0.029038572963846095, -0.07479771729096504, 0.0040067732156986845, 0.01841922961835923, 0.005794846816482249, -0.0018917415602938133, -0.02050365109993532, 0.014577098577263853, 0.0017392249398283308, -0.07615047553948716, -0.11718281147227214, 0.012755286867977658, -0.018363931835534947, 0.019897031755916828, -0.031891324593570955, -0.027647024906860385, 0.016639542471934818, 0.011652913807708618, 0.056281068745427584, 0.03495483065015658, 0.03587972503888208, 0.0005859052162454588, 0.007103941746300976, 0.03515078293806896, -0.0034361007635611194, -0.01593886801245293, -0.02279898255047892, 0.09834189694703759, -0.036452608838278826, -0.013743095474995573, 0.06999236867900076, -0.02300713720212716, -0.009100962665238247, -0.05062004710999553, -0.0038419772082425654, -0.09461428079082965, -0.024263696930770025, -0.04366398531241655, 0.03202677954823399, -0.005274001679997567, 0.052319517260693976, -0.005598492853898635, 0.0454638604568917, 0.03966444395005397, -0.044303714614122025, -0.012264557503625354, -0.030055534605725874, 0.015641929584430996, 0.0016121358216490311, -0.0010216639062424454, -0.10119945499878587, 0.028523065400040522, -0.020543372451785395, -0.06424946694377845, 0.04274208895506697, 0.017075569728454008, 0.0035869313118627563, 0.04852980049105961, 0.028247610584540794, -0.06273333136855393, 0.003388343995375743, 0.052543463709310366, 0.08560403079501397, 0.02066707799500141, 0.0776912790672871, -0.0036310151070304978, -0.03341858399330772, -0.013770612753855863, -0.0016027503083735572, -0.03678466217883606, 0.04989011364190873, 0.001362990483458276, 0.007635758583699019, 0.005245222971744215, -0.031215471919517297, 0.09772842520405327, 0.08050644078480029, 0.03851647483221134, 0.018217592351908472, -0.008587087438926404, 0.0042770160886824345, 0.012594281985716403, 0.03594476898755899, 0.05540723660831227, -0.01854021061082655, -0.11663456485888025, -0.02333697705885782, 0.07601781692423745, -0.00480948158794317, 0.12375935052942381, 0.02897800042342427, 0.0650059211956901, 0.01639758048700018, 0.06957987101194618, 0.0038324301704716385, -0.003859036844305976, -0.07470253919567611, -0.07233946830302355, -0.0009529154701787525, -0.03748441364120107, -0.024056222562181998, 0.0026037150428147695, 0.042037151616308256, 0.021050144018805145, -0.07042057097107356, -0.023031806863956502, 0.009354622784002304, -0.020198727037598507, 0.058697475197404106, 0.011323235475473413, 0.0016480857047243191]]','2025-05-27 14:30:19','2025-05-27 14:30:19'),(107,91,'[[0.015713350694417205, 0.03760444638264821, -0.016745646124959948, -0.07437605288257387, -0.007477735721254525, -0.008776798893377622, -0.03091260916446921, 0.05818446599530657, -0.010991685578506407, -0.007175462436618783, 0.06411367147967517, -0.007954614567887913, -0.046520634890483296, 0.021932661495380736, -0.027252855399918334, 0.004277848305919712, -0.011856409290200615, 0.04851868250824751, 0.03735905064847804, -0.03745108396159678, -0.10629874571398731, 0.0006077422097579678, -0.07784818557226553, -0.029922798599703898, 0.01974280251850559, -0.010373141420628644, 0.06702361784775375, 0.037731842919265964, -0.06659060953541429, 0.07547819818493662, 0.009491437074104358, -0.043133562563705784, -0.03303512479305444, 0.12732033830243708, 0.021830384006433397, -0.04614326007159178, -0.0030275356003417603, 0.025774159457587535, -0.02752484010911724, -0.022444656453447603, 0.024138943157780392, -0.012925725506836702, -0.018369625552331376, 0.05708996204942311, -6.852213125726584e-05, -0.03810443693395546, -0.010327296113982915, -0.0027997219958431374, 0.01975758675898812, 0.035338387674343524, -0.051576448623311566, -0.00759471106767008, -0.005021606767217568, 0.06737366447959241, -0.02481831016248238, 0.05819307597443816, 0.14206655892974876, 0.07085734700313229, -0.0010260064638777113, -0.008393106077463812, 0.005477194324995128, -0.07038311275124039, 0.040689815411072944, -0.02260978112559558, -0.01775049866313574, 0.04611601968366823, 0.010769321538513234, 0.061562959497482236, -0.04296823113876945, 0.033633702437648356, -0.05931725602602581, 0.04257457949419727, 0.03524831426436922, 0.01818360751963941, -0.024993797964118016, -0.048587228138162866, 0.06103281136137461, -0.10889161827162526, 0.0333668214068689, -0.01978595437444272, -0.027253940143999716, 0.0027584999506069232, 0.03463488157354334, -0.009931448075063184, 0.04469103698286064, 0.0683727902487537, -0.08168214130604225, -0.04205493043461622, -0.023965109378451616, 0.004490160407694004, -0.07444630917939564, -0.07833483632037877, -0.0026504473677210964, 0.0004505970357964322, -0.03514900495243829, -0.10931235169924225, -0.0365185580803563, -0.002403896968791975, 0.004741748812709971, -0.007361988146534215, 0.0032661446034283562, -0.0038647307447122, -0.0340374396531704, -0.014842074618670062, 0.07986254683470011, 0.034717837589584195, -0.008178678653925077, 0.07409305079876251, 0.0018414603488546497, 0.06491054204168352, 0.025894617030760424, -0.040100142297528285, -0.059656636479769216, 0.019506958479934524, -0.023128416246844686, -0.043019568139341546, 0.02307966082389708, -0.02159962948513189, -0.0579413983541779, 0.028348339297374004, 0.052892869116851746, 0.050503362000517936, 0.10425785212112354, -0.04958560053415015, 0.04491032805332823, 0.0683877047718152, -0.06374860270003588, 0.014457463452186048, 0.04638004582663036, 0.008884990786575469, -0.08644522141285649, -0.029641345745690224, -0.012269435511991353, -0.09778286459117153, -0.05062730604879312, 0.04413372776126882, 0.010606112161887539, 0.09814621703944446, 0.04817014828721684, 0.024465017795089517, -0.018557481702278736, -0.037102813137954015, -0.018756185293039906, 0.05432295832830876, -0.05865512030850691, 0.07675786766228881, 0.00847876333284571, 0.00413885060128539, -0.03296646020948003, 0.10400320065938691, 0.025539871729389103, -0.0031266756865315276, -0.015337040793997234, -0.016055471330663835, -0.042812090300110094, 0.02882267834177507, -0.03609385669854083, 0.04052961598685584, 0.028858001914054403, 0.08194501189917357, -0.12788636512789964, 0.006324511151247644, 0.02654943993047743, 0.023744498488814512, -0.05912713409209645, 0.019076326408546177, -0.011269863666608601, 0.03652922142622157, 0.013938142931282387, 0.005520216252382041, -0.018130064211914845, -0.0658513861823679, 0.01244432146475677, -0.05304255813562237, 0.007626714558358292, 0.058551528664850014, -0.050440707408955766, -0.021241171130260077, -0.007292796060126491, -0.052642981465937266, 0.0010384167645959782, -0.05956678681596313, -0.04174358905765003, -0.0028473206298593105, -0.009570435048751668, 0.024258681344538995, -0.05732213126959838, 0.0036655697488096636, -0.04062185605276293, 0.05679130339829615, 0.05311338654289959, -0.023867638183776088, -0.0044816350414329945, 0.026584670039167504, 0.07386931595946022, 0.030611826340859127, -0.0013001996044015684, 0.03158984633222812, -0.05110280347525498, -0.02416557178402881, 0.05508749048843405, 0.004246169459592671, 0.04656656233179837, -0.03239278353084826, -0.006180980816563086, 0.02667480009374136, 0.043260013135511054, -0.029797441268669945, -0.006054205246367901, -0.033384120667571446, -0.0005190058778545982, -0.07202107064966574, 0.0334828097211373, -0.017987642695266478, 0.02850113810465992, 0.016078528514910633, 0.09608894182839085, -0.021887575226368975, 0.006623642076723355, -0.032549711729441363, -0.01734570502583209, -0.051374318034277625, 0.05455943253804982, -0.053044682308105495, 0.040854175381127, -0.10358748594329004, -0.024470302736227526, 0.0023743467203073956, -0.026886192074801713, -0.012530402846577799, 0.04869490952190727, -0.0018191797266648086, -0.01943356548841268, -0.08084244742677417, 0.02215590635889691, 0.0045638624663121435, 0.045890560016309645, -0.010759633187817716, -0.019236901103235306, 2.3529635609916738e-05, 0.0022775419847484474, -0.03016646384135782, 0.017957815065258478, 0.03190105459438537, 0.023439739214316024, -0.001611704011605838, 0.03602531106862547, -0.040347529089372634, -0.03175510978364499, 0.02281275147081785, -0.009228889355190471, 0.0126193065455714, 0.0490574179656469, 0.0006434534435154688, 0.04770735624443402, 0.09399691515551337, 0.037897400922600494, 0.04465520360918536, 0.04028719126193206, -0.03171189278641838, -0.07755856173476677, 0.0017191604100814022, -0.05855900008753065, -0.03757153020584975, -0.00039293438233038074, 0.021719306778945978, -0.00894754058562847, 0.015085782343773646, 0.00866961739822425, 0.04206956456690994, 0.042354421761356564, 0.018919419451677907, 0.022001253857090727, -0.010143181339835826, 0.027710373830483054, -0.01985702635349801, -0.1100428970996376, -0.03342654180817438, -0.058959590695547695, 0.023392164831269033, -0.015383656467196843, 0.011994018140059723, 0.05347932764937195, 0.023454373346609745, -0.00016587658495340887, -0.026112152118641964, 0.07933116951078226, -0.0029706141503115383, -0.017959334556641404, 0.01655861273782105, -0.04560210022533165, -0.03115449010123731, 0.03599221362910845, 0.0353849438707136, -0.0038526080923510226, 0.008441822557249228, 0.016634979570819265, 0.06720852847852452, -0.0016383871582813232, -0.028642120848479717, 0.06171105113854555, -0.048075727404227074, 0.021857196727630354, 0.00027278868635696957, 0.04005771266023542, 0.017145275190899634, 0.034381360171567725, -0.023912217483621878, 0.04936549094921906, -0.020648168730376868, -0.05765100981458522, -0.0286453071072044, 0.03419290358886514, -0.028607865026901904, -0.01487127066139308, -0.020193822397386943, -0.0037218043830703432, 0.005107682130549893, 0.03290632063813788, -0.027635093157681208, 0.07516733262260665, 0.019397642899493108, -0.022268708414440626, 0.08291409903719354, 0.09500145614839163, -0.03506521626078404, 0.019279718756035093, 0.006451609595660265, 0.029332445750964636, 0.03296110163036261, -0.036570130156016525, 0.02415254352613233, -0.027147626727334447, 0.07884833660867867, -0.041452625575371924, 0.028225516812169907, 0.02129711192066059, -0.04541559504908355, 0.04604180109710794, 0.020375323023264804, 0.0317788580320063, -0.06440895411266896, 0.055790920119024846, -0.026146153039521804, 0.05675974102742693, -0.0228676556650466, 0.0409797536260992, -0.043406651842595914, 0.031873981308030486, 0.04275770015562226, -0.050721806234222254, 0.028085647134731263, -0.09494461329274329, -0.05013641828463354, 0.016544192438890628, -0.036103443797014655, -0.05369996969353881, 0.0036998953140506747, 0.01414968218830157, -0.07056401294436301, 0.011482073454074957, -0.09687433053007043, 0.0296372333477629, -0.03443643288348014, 0.0038868249707666473, 0.0048346063047521575, -0.008382466097495853, -0.005478703195515639, 0.027592929750006222, 0.05994617535036864, 0.04501524234838462, 0.027336661084952446, 0.12595740126374652, 0.05735007971501631, 0.08995713560481204, -0.010415367137363133, -0.024004415066079306, -0.010957649962809343, -0.05228140199363025, 0.013226059421995354, 0.07556500036928691, -0.04396385910390854, 0.04379097978608218, 0.07345048579038811, -0.025185381328715763, -0.020581136927384478, -0.004245395906780068, 0.05462018953552706, -0.022232040949036972, 0.013918388127189351, 0.05819240190370351, -0.0643805695038345, 0.011974468672640057, 0.07888223273704935, 0.0030596877831037903, 0.03591753622129181, 0.017502300437402838, -0.0598314133916805, -0.04629091271700859, 0.04810493335975501, 0.009573903114359112, 0.0113337354090036, 0.004529514951288807, -0.006523053304900098, -0.00024495408330805547, 0.023421661090369666, 0.06148509016648096, -0.034147018630999726, 0.08025518454094036, -0.02063960406692492, -0.051922683073600505, -0.07126099075506508, -0.025438466567274835, -0.016667582786205212, -0.023540941871986902, 0.03872971117831725, -0.03245403900080155, 0.0008664239347525733, 0.0417021733586891, 0.03104346951834944, -0.004739622870083113, 0.012217986638335149, 0.056289658824682044, -0.06121447059213121, 0.06779889548841367, -0.03677188122623348, -0.04168880523319532, 0.0739536427748102, 0.062447844438271255, 0.044551170137651974, -0.0035334132956859826, 0.06573246084561284, 0.005098696526917539, -0.04990288392960913, -0.05567039740456248, -0.00768423431697126, -0.0720463851212046, -0.007585342050904523, -0.059142167568817, -0.08037383231915762, 0.05093786006582557, 0.02132137421876281, 0.0022974419406278294, -0.022701161609704503, 0.0028097987160743214, -0.03626336283046399, -0.006196338583616059, 0.012725835211714961, 0.014036636560979792, -0.003644111712413912, 0.0600372995176646, -0.07650048593085387, 0.04968045191609649, 0.04490925463816676, -0.013440532869271223, 0.024988915199636814, -0.06299183651450888, -0.011989145288383442, -0.03972530232446663, -0.01146061860393793, 0.037092503820835926, -0.018271317433697497, -0.08614537322513897, 0.061298950347899964, 0.0742933007870914, 0.044668325330671096, 0.05964640080063054, -0.04586456580957619, -0.005201835013778037, 0.03119034896498239, -0.056647964239135075, 0.07888472509942954, 0.017845634684194825, -0.0056811322307834585, -0.043597181617642033, -0.07422618826554465, 0.01252197271404978, -0.0032346477278773697, 0.010561304867528562, -0.004912729828393915, -0.018682711582963703, 0.012670402806595408, -0.05393441036215602, -0.008190573311773067, -0.006703630623805294, -0.01040090152275307, -0.053728626196451114, -0.005794176087961502, 0.07249381514858948, 0.043682632828293065, 0.051658537976979314, -0.017969904438917418, 0.06300290486926094, 0.025154529847570897, 0.014069772235601507, 0.04008986413493995, 0.07749511411881091, -0.024353739479273696, 0.015422892765190084, -0.06717629203692066, 0.023354375802794293, 0.03707775923157308, 0.08099857693651362, -0.11475738180449795, 0.07700471349820746, 0.034119744256316434, 0.018729256450413873, -0.0007120366447316244, -0.006900667447224708, 0.11178315514485011, -0.021980327925901995, 0.014860928773630254]]','2025-05-27 14:30:32','2025-05-27 14:30:32'),(108,89,'[[0.008090418288437304, 0.08728076927083107, -0.0005422227769122207, -0.032588060802506806, -0.03011308092736404, 0.0347384822448179, -0.016106915325161623, 0.008490730068381048, 0.028053459297168765, -0.02661660529543632, 0.04363544415344044, -0.042983246584936324, 0.006831623232187691, -0.006241767305847744, 0.03863877129427316, 0.045815164925349816, 0.021409435251519265, 0.00791976367736283, 0.03614530152337073, -0.06919916175604776, -0.0936540194122772, 0.018106796874462653, -0.06358561009578337, -0.011146064509510594, 0.03683506663038776, -0.06512351399005123, 0.013349660728436102, 0.04323233205720478, -0.04518377416829023, 0.02918314876985083, 0.018814810531855512, 0.007048589892903122, 0.03873587731930087, 0.030811648042497624, 0.020794028657263583, -0.07765605733113241, -0.04219285181028749, 0.033443601794647906, -0.08812582451588366, -0.005005118527922983, 0.02147521890476063, 0.04379628523530433, -0.015116794468275971, 0.05729866506359871, -0.10899313131039623, 0.08607755179744381, -0.014621628983607238, -0.0024105463363721827, -0.006100184165935626, -0.004734294580044429, -0.021272786914867326, -0.0293039492328568, 0.07629020714132594, -0.028769908685566226, 0.013453960265581003, 0.05835231654358364, 0.12441933765914975, 0.001164830602788173, -0.03343959830063361, -0.004071720934633564, -0.02660323476117154, -0.00922270790271057, -0.07362301128441998, -0.06492842741789906, 0.05506063240759594, -0.026902386623478408, -0.04647915718473011, -0.021096699903138345, 0.07146718370551085, 0.012796460197026027, -0.07650278983412784, 0.04115603772002229, -0.004061685935541336, 0.018827846021940372, -0.08054077068410045, 0.0081659231917719, 0.03777610067555765, -0.0676543979741639, 0.012254608577371382, -0.01951472066306623, 0.02366866655029563, 0.01819513922269949, -0.019610720758364463, -0.02011201783546148, 0.07134699938307303, 0.04912032749118566, -0.06619829028951586, -0.002222275996715106, 0.06972774221894862, -0.0028808890933932066, -0.07104740742036034, -0.008977720333091856, 0.03891455240535187, -0.01968181684940778, -0.09845295941814243, -0.019112150884104846, -0.01769490264561264, 0.03618498722254653, 0.0349440346885564, -0.06994551525718182, 0.026306590051499157, 0.059462647277124206, -0.004826499519181764, -0.0009915502959053854, 0.035178239088392974, -0.016303928401348332, 0.06492161863871729, 0.01566724792134645, 0.0010157943270114, 0.03854815036167712, -0.02514004004031096, -0.00250102299411744, -0.0574603835069168, 0.005341883358462079, -0.018126780272244673, -0.026042387840129893, 0.01530743886568674, -0.007819987236646854, -0.038752476202994206, -0.02774577516570376, 0.040437873359720836, 0.0012908489175008108, 0.02126305217782617, 0.05972242009086063, 0.020869524332686445, -0.004795631444588525, -0.04433414187901705, -0.03898618371527582, 0.10323249525514687, -0.0471221296808566, -0.04905259745840756, -0.03550226940073765, -0.023239587110437426, -0.044264733785981884, 0.037171839978999234, -0.08405468564952877, -0.015189253450898626, -0.026231574227486516, 0.10665579496669406, -0.03330964374918643, 0.02821066032277284, 0.056730009909550454, 0.022679005669318006, 0.07093553105784156, -0.0388201011795464, 0.1077613726158517, 0.018242857464121003, 0.09072993552881108, -0.040297376274036, 0.09331796442110234, 0.07336441396467074, 0.0140231009497544, 0.07679585127468955, 0.030458008910591867, -0.04272394794389521, 0.01897378615587018, 0.009407385390425557, 0.04609160476735854, 0.026754995577888095, 0.034578214713160325, -0.056070654320897355, 0.033982900831948756, -0.04069875636222292, 0.031431564956073674, 0.04474900323640957, 0.010555769902443548, -0.012383065367760017, 0.011131793189092595, 0.06802951684523148, -0.004021462178127444, 0.04008357833624253, -0.03172897345290197, 0.031003966241129263, -0.06069048197966323, 0.04153192321760325, -0.05256764816681865, -0.045074475942342374, 0.0005113104260886369, -0.02456445685406774, -0.0015856239102877909, 0.03979823994796372, -0.062081170868503115, -0.06634927596164668, -0.01324026170529852, -0.06043742708566995, -0.028818802420974916, -0.019118400309867594, -0.00721254007118237, -0.03316770143055601, 0.009387215304890744, 0.03562284839386197, -0.03550139771799836, 0.01882842809021905, 0.03308582004021246, -0.002141231329522157, -0.014426824927522036, 0.0005214259919487058, 0.09020542670450349, -0.023728896420351198, -0.039577153379578255, 0.04330147608999644, 0.011321858357582147, 0.005840957218670305, -0.04238790431015018, 0.04105424107647569, -0.04828175733856475, -0.034246980950947366, -0.0600194679892919, 0.011555106603795098, 0.03417064766507471, 0.02949434802584754, -0.04396322241762829, 0.0857012801472487, -0.02678810248583614, 0.009727220552127583, -0.07924501287247626, 0.03380315814749395, -0.011735163747088263, -0.00536989078041744, -0.04004783650457443, -0.04890959605944569, -0.07804854739112163, -0.02111581871657472, 0.008090801601693991, 0.0029230091866686595, -0.01759076353216406, -0.019487390427864352, 0.007783381530472482, -0.05212505480514409, -0.05710286297336739, 0.0391572550020571, 0.10338521861404133, 0.07407621816426863, -0.05485740255825723, 0.029444153864723568, 0.0030387981837631094, -0.0031577047953452913, -0.04719642714743263, 0.023198569752614317, 0.00013175772089218165, -0.022155568702450414, 0.006319719025470869, -0.053006391359781586, 0.0009145698139923788, 0.007248655278356054, 0.010521924761556696, 0.014268640064559126, 0.0256238438361157, -0.03908018348324563, 0.014870703098445869, 0.0553793673182834, -0.059127563346199626, -0.0009363520334532967, -0.007820643838058774, -0.01271306117012174, 0.06506020767619106, 0.010709323773394171, 0.020296689644461557, 0.03273802146659566, -0.028601171350614556, -0.022130389280522175, 0.04445631659103218, -0.06764548807046399, -0.03129647968570178, -0.0013364655020246577, 0.01961112394712335, -0.027302801330129967, 0.042900604246794316, 0.08915543231692312, -0.02509001907999186, 0.05630253896569161, 0.05440187876272372, 0.0031934491114511613, 0.016404069699497526, -0.08489942288654617, 0.017042020791961397, 0.006515761041407302, -0.03091066211573641, 0.0021419629964468446, -0.01882986764444972, -0.06633820814627948, 0.035510915244194065, 0.021563037391546656, 0.017180822781244432, 0.017175064564321735, -0.04248839484926658, 0.13390034971795214, -0.0443252603688917, -0.00856084019254744, -0.005782057232663637, -0.00320792309100765, -0.06072346395588317, 0.02423326284285918, 0.03313539806076828, 0.016908106756540503, -0.002132357095250298, -0.03646849706462306, 0.04110351244642616, 0.04428561158136284, -0.025826196324000208, -0.026709687950947532, -0.028411794726308316, 0.03094924614421891, -0.016894866832718743, 0.0069996131062888154, 0.0008739517408116526, 0.09227492078057659, 0.029706626907401546, 0.04951855305323791, -0.03084588785407099, -0.020279752877230845, -0.0716238651287003, 0.00259016834813507, -0.014461205287289523, -0.11712207542048816, -0.03802585623618595, -0.04733517802828144, -0.07090150419807746, 0.04465979346446963, 0.06512601830332826, 0.06326477406057776, 0.024003391302501908, -0.018366429140004956, 0.010604326464154226, 0.015328207345805606, -0.03402196755119894, 0.014751247071195767, 0.04811694399561859, -0.009203546498912337, -0.07030364909194192, -0.012371947863637326, -0.003353528180757539, -0.004054395530350933, 0.00859786754330417, 0.023193420577866136, 0.018806421650248952, -0.03385575156566904, -0.05439357080280468, -0.11144547298853472, 0.05193342657037448, 0.07534478061017014, -0.011507102297109797, -0.008077436746144124, -0.045975202469053386, -0.006303840628732236, -0.04496093003763891, 0.02927883511615007, -0.00906926689621886, -0.006526509429060589, 0.0524273895871602, -0.0990339146686942, 0.03933947360621437, 0.016738774576201605, 0.024715513510134974, 0.0963013397669845, -0.05843561193394074, -0.020169981898266402, 0.08385554447492807, 0.027037011917942267, -0.060635313264274675, 0.035868856002647095, -0.020028730963176745, 0.050829035772633854, -0.0514221548305312, -0.027626462526005233, -0.04322162484023462, 0.028649889045860917, 0.09265174894483326, -0.05330664773213921, -0.015282375857414238, 0.0036354454982203996, 0.03931287734491511, 0.06998488010896499, 0.04698560769561149, 0.01688626357962418, 0.059457104851368243, -0.06425815166046653, -0.020791660633144488, -0.0329706187901116, 0.07926505873612233, 0.03612552823804052, 0.07859393117145272, 0.022458593448328564, 0.020379712456502795, -0.0003228656434077986, -0.013387020993854661, 0.02241151690169232, 0.05710030187294122, -0.035084872497136065, -0.029480057539766708, 0.0009748772339984886, -0.08453886424051783, 0.07456856842601879, 0.008387077904736334, -0.006763302613058543, 0.031351566059724084, 0.0009453841182537774, -0.09897559426652844, 0.015092617339530035, 0.01631988133122021, -0.03168031822351967, -0.03330361295394787, 0.02205416814926906, 0.034728155501746974, -0.05653063022892337, 0.03260782556976464, 0.04400366906460255, -0.0853258262320012, 0.05410100341044048, -0.05201629605711305, -0.01031169944528343, -0.0010111706108525968, -0.04688487865046871, 0.01600049620767511, -0.07927398567596698, 0.08011972236680923, -0.008597618389687322, -0.005854792697718661, -0.0007307093513856286, 0.023673240755158777, -0.008862851287813459, 0.047834564217809926, 0.01066967995474086, -0.04790514496547481, 0.05764394796650866, -0.03929517395117102, 0.011550704180058095, 0.014338280984905756, 0.06884026697348919, 0.012171896674971679, -0.029166671978528146, -0.009923383950595301, -0.022919449557166235, -0.06634605045157559, -0.0048166267183842645, 0.01612280578916945, -0.003457362773118862, -0.013626617333501989, -0.03446047507749295, -0.0766353367189332, -0.03922940875375313, -0.030197929446250098, 0.013805986642451208, 0.03627123270530141, 0.014364914157851953, -0.01716389879112228, -0.0025989380585605443, 0.06498750308914837, 0.025709478857017336, 0.02183667194838791, 0.023991943013235484, -0.07806510084509564, -0.04617127145888566, -0.00399384800717987, -0.02469704348987751, 0.04069629179995029, 0.012982391261058258, -0.05548462229921256, -0.04464374257676549, -0.009124110505178591, -0.003036232824300754, -0.011688770065920416, 0.07787819162241949, 0.04140150017217568, 0.01554844920534763, 0.027442412536288232, -0.04325222459554818, -0.017865823446448704, -0.03174095838072776, 0.03022582613326464, -0.018508320350201155, 0.16461409955469156, 0.018323634344413794, 0.03399292092441433, -0.019159668950825645, -0.017870589307940197, 0.014706071474376952, 0.05111758263483901, 0.05442505359828735, -0.018752999139696424, 0.056040625276432644, 0.04131585663320168, -0.016079620581927957, 0.020637987509180673, -0.045813572045816466, 0.03252571703082454, -0.04838301450419453, 0.01800787366066249, -0.018825558919508798, 0.0075403758323587195, 0.0665820067349631, -0.03501315032777349, -0.004646269884923089, -0.04534583049514569, 0.008660126844102091, 0.011726251004030894, 0.054504237599046795, 0.042345078281626994, 0.03341203097908407, -0.017978033433468668, 0.020763661729261498, -0.003845754220618964, 0.1267634884607486, -0.03253472347267799, 0.02945078944310046, 0.0022043223845951247, -0.032035076062263454, -0.00705802862692939, -0.07572039352943524, 0.051741599580582893, -0.07693931264955943, -0.10137232996823001]]','2025-05-27 14:30:52','2025-05-27 14:30:52'),(109,88,'[[-0.010613376405160095, 0.15123931484831965, -0.03485108133142222, -0.022820650115745595, -0.0355469475995523, 0.003387773313903546, -0.02666315060996338, 0.013631346080423816, -0.020015824757458, 0.004748182352763171, 0.015184297096116278, 0.0027819664073092123, -0.029287261716474916, 0.012164295568784754, 0.0009246924308495262, 0.047369075014624264, -0.014807117432529467, 0.024229623454089345, 0.04507440612198705, -0.10929319312167476, 0.012031726449594701, -0.0018121688292444037, 0.021629249826438553, -0.04608696897725365, -0.02762454229216028, -0.0008853926631444798, 0.06350247588660896, -0.0015207745218571325, -0.07610029994657261, 0.022030997099807634, 0.028192617615623902, 0.054376334806908025, 0.030201396637417843, 0.032801937603712895, 0.004827552138109342, 0.014122193799274032, -0.010664568905704067, -0.009766492752597786, 0.032858898365759, 0.0682228037376901, -0.016102577749941994, -0.019293079309449946, 0.035150466571752574, -0.010320897165055352, -0.0460346477611484, -0.02084309451628061, -0.038539700817643505, -0.030967236708047644, -0.006136147308665061, -0.06125580693567522, 0.008469409086278445, 0.03333558054025763, -0.06848200145419898, -0.01924875753677029, 0.01972491636786187, 0.09366742551107701, 0.035741674001922706, 0.07382524248681267, 0.01177092096964097, 0.002057932082610995, 0.07186519510314712, 0.024289893255796943, 0.013153204614512743, -0.06637640882382598, 0.0016350026283919526, 0.04057335751788408, 0.01645732911347315, -0.009682542071865, 0.0735963166591654, 0.052892936786242226, -0.04263458900177877, -0.046748583321708656, 0.07113334118305151, -0.0015772173749006913, -0.05178251363558247, 0.06935476763736095, 0.03870013592254019, -0.05809525899348978, 0.014943529598525195, -0.044332761250627295, 0.06732725324970969, -0.01696841086339179, 0.06197258069088812, -0.059052744466745674, -0.030117012024612443, 0.02192763759720312, 0.008680510067162162, -0.006728370254725358, -0.053212681561624196, 0.03272754737346466, -0.07255202508448716, -0.014026997797589489, -0.019445729886238654, 0.02257075445916763, -0.039060701483671904, -0.08820238163234145, 0.03787629496534996, -0.011157476366396128, 0.022818182691030232, -0.03003833989376109, -0.02973121442084625, 0.05025172596709225, -0.011291700005416927, 0.013542855928821745, 0.044723011374790754, 0.04053913512455799, 0.024719244843169126, 0.15440507325652636, -0.016318175546746458, 0.0017597225192996912, -0.07495331494271702, 0.060812156097093534, -0.05322344373325502, 0.036060342560141595, 0.02577047604985931, -0.014115556033051724, 0.015705906415448796, -0.11928850096311114, 0.023192985161523585, -0.04309615491874593, 0.04135965227691224, -0.0006493260279827708, 0.0013384722960714844, 0.0514467437241502, -0.00745682818468746, 0.024371984344831017, 0.028903032502354924, -0.029241949036529255, 0.09289667684021559, 0.02563415739663538, 0.015916497177525014, 0.019258988162119357, 0.0475092883927646, -0.003326291332384404, 0.03029180216026671, -0.017208108706119562, -0.029916809383079883, -0.03540954616686551, 0.06900854726353717, -0.006099795449062019, -0.1548687653586206, 0.007985772514593368, 0.007108962314195114, 0.047004552386728286, -0.06137272743076456, 0.08447582877227137, 0.025829152853296553, 0.046027363608398264, 0.03723879379141782, 0.15118765642449167, -0.06195889173355768, 0.03468144588224114, -0.008597448578048877, 0.04637031595693416, -0.029297994357756763, 0.029915749571666237, -0.05839488047661203, 0.03518380633575894, 0.06677481916775953, -0.00966619374255079, -0.06379245735136187, 0.010217692696783019, 0.10211735769162357, 0.0012963458177384013, -0.013427674443172753, 0.010071780781575657, -0.058721827375996946, 0.03900980756776769, 0.02028634736280341, 0.0004593999478977023, 0.04972172510692258, -0.05114818861474138, 0.06377882745472942, 0.05092543791118227, -0.038249998250631016, -0.011379874346342331, -0.05125054408548033, -0.04043062749778007, -0.014626798559314848, -0.026975370068078486, 0.011082908954053974, -0.03314137255956944, -0.050431710163018346, -0.018371648751732278, -0.03797976274590076, -0.015849939052058122, -0.01863837014493308, -0.007518303808978694, -0.002655162473543274, 0.04761440002940901, -0.002717310938633304, 0.015463204679999062, 0.026801500294967646, 0.09073761459127673, -0.003740037565820016, -0.02283398306831324, -0.00564056858182088, 0.005678957625360291, -0.049058069887237585, 0.017926906930813016, 0.08639371994218299, 0.07379065916699896, -0.060726537771930454, -0.0021119627778076093, -0.05436403377597998, -0.09976182018742429, 0.05033111666976895, -0.04851954131851044, -0.001933600905428985, 0.008700713747594126, -0.009347002661212328, -0.011526442491527183, 0.010553979389322558, 0.07418805891676718, 0.04576408086027951, -0.028216238613663642, 0.07154364897647694, -0.03145109803850001, 0.019040302803270803, -0.020310101247413594, 0.007172153159590013, -0.06145814232463462, 0.08684046162395866, 0.07532212275236601, 0.07647732375553977, -0.09133703473961514, -0.028951304779499067, -0.050915394311376795, 0.009381762342832485, -0.007712647137099741, -0.057690640713969184, 0.002462288280284333, -0.0375597099373096, 0.017163032268965796, -0.07456351433608814, -0.024794558717110674, 0.023276531440532745, -0.02956187755630492, -0.045126297507457044, 0.0456468650617003, 0.0018697841806930556, 0.03500784154844496, -0.0703010775141002, 0.03915523469307918, 0.07850652465423319, -0.025289733452374966, 0.05715923880279758, -0.04217233076218537, -0.019170505393104532, 0.05533846310725466, 0.07210130008674814, 0.003985286293869882, 0.018097305247342935, -0.031184074779509567, -0.0027303629427418382, 0.03319877627685035, 0.05367178661617576, 0.0690238046105138, -0.018766861615100505, 0.007972503544448527, 0.028257768127789077, -0.02905850978977167, 0.0041961112480193175, 0.040907345764927466, 0.04625267032771969, -0.025387393597624982, 0.07741771443788205, -0.006193025221676508, 0.04432309498305887, 0.02537840160635843, -0.020431559572797273, -0.01865821125830248, 0.006158673222929866, 0.016376734228787753, -0.006374961291641904, 0.048334422123010486, -0.06861415960936564, -0.0019466045125766792, -9.793576184056258e-05, -0.01476447724916713, -0.055150991327285404, -0.002867498192144012, 0.019037695929685225, 0.0582185121078619, -0.0096856206107469, -0.04438532527182422, 0.03818802389155689, -0.10893644025671227, -0.042042003488655916, -0.026498405714689536, -0.08131248529038183, -0.038529145358455585, 0.028648733542628004, 0.029150811817255484, -0.004591254797096172, 0.0029695889151014243, 0.01962971052272767, 0.030219075473011413, 0.071918139737731, 0.02822784075966566, 0.06514681102810421, -0.08230016390490204, -0.04712873734766844, 0.014546490775244602, 0.02502462638491879, 0.05524943894850841, 0.07915438113721011, 0.04473915791338689, -0.011088432769889495, -0.026302363571214262, -0.0021820866929146863, 0.03899117719870676, -0.030393701551171312, -0.0034106798415552957, -0.04376374095599609, 3.628172502419763e-05, -0.06677229268234619, 0.04664261202379373, -0.0021772906771385767, 0.02317104083107633, 0.017827109116411326, 0.030250791067823492, 0.002102811855843383, 0.012602561220113665, -0.022936307368128267, 0.1112457463589974, 0.002996696339968448, -0.02513402812504104, -0.0018111391633953487, -0.05185014141591267, -0.07819513040531477, 0.038565569403356155, -0.0256753112190987, 0.003908180091802314, 0.04224004713356253, -0.007316492583713816, -0.00018059695066758056, -0.04788556081840753, -0.02090452256389848, 0.047212278704952766, -0.015234063937034152, -0.05987426565096548, -0.03938851460662711, -0.05957573350960587, 0.007037767103649785, -0.039359676580266324, -0.0633036578903289, -0.08344480616773799, -0.0016834567017470462, 0.07801498871419407, -0.07022622792286773, -0.019280095799345313, -0.02314321339888088, 0.011189739092951938, -0.045057189928527606, -0.042101877911802074, 0.018925291937415958, -0.06890060399453989, -0.005029539315036936, -0.013723320813206355, 0.015824369050985235, 0.04880165786698315, 0.05076194805574038, 0.012317832056043075, 0.002460917169775116, -0.02591064677305111, 0.08202274268191827, 0.028386668101117493, -0.013898128995185005, -0.06311244559948795, 0.021847303563933773, 0.051899772089110216, 0.08976865165571454, 0.028571806983516773, 0.06984392802488155, 0.0319369674326835, -0.07129163697822158, -0.030616065079043693, -0.029923493085400616, 0.007231288503724026, -0.06872941984261192, 0.013965915911284748, 0.012521798176496537, 0.03897131639843803, -0.011348299840975415, -0.03928363265047482, 0.02689447987990322, 0.023443586265327353, -0.055629829217260084, -0.004974196159885342, -0.040957061748022085, -0.006249608651485558, 0.051696859217770626, -0.005052556581497387, -0.030829520284971657, 0.02434645371755678, -0.014668377290688595, -0.001910933286503415, 0.02943955300735095, -0.02822490084936651, -0.06867262313806019, -0.012046128236738184, 0.05701218422714191, -0.04242627207657456, 0.030808727638134897, 0.006212609585067217, 0.02169983064166746, -0.0535936132201073, 0.0959470175199814, -0.03391220325917805, -0.04080339565534321, -0.008891414179052632, -0.022722292726144493, -0.0022327695898667634, -0.062443668504828645, -0.0035118229274108395, 0.07084985639507574, -0.02973001351998744, 0.02891477901895199, 0.0007002902835376966, -0.08136281156735552, 0.012894417041739794, -0.07247403215166251, -0.02852837440245662, 0.04051930057348837, 0.039802802434866016, 0.028720203549476405, 0.026132733043758006, 0.052698246476520584, -0.001835512980262392, -0.01542193273613979, -0.03896054438335754, -0.05325592383599088, -0.002165370054525608, 0.05393225741884097, -0.0038400724433010737, -0.02290886054931976, 0.048815104019221914, 0.023772872624582022, 0.00024269763401237444, -0.027590920349263595, 0.025217369332182233, 0.03259065451901042, 0.02460495090856469, 0.0016990710788458096, -0.0020684213035855638, -0.04432119191612415, 0.009862951996988997, -0.020437101434957174, 0.01416267990773526, 0.020120542656115917, 0.025086211927731254, 0.10286258557866042, 0.003707377820127826, 0.017130296236538722, 0.09055081216588451, 0.06625937676964047, 0.008497352179007428, -0.029626886979024936, 0.0699692876374814, 0.03548287002340032, -0.03322734524892036, -0.014557812382931244, 0.024955763251655962, 0.030885280146158958, 0.07382748679333569, -0.02499952066655498, -0.050912651270070886, -0.0428823519109299, 0.024399445928814018, 0.03507355969954067, 0.05299173877165307, 0.014422883296684643, 0.09191969477432847, -0.017570436244740837, -0.08136632896003487, -0.0030190975705375305, 0.09107414901063278, -0.05912427353429205, -0.03215219117840079, 0.025287871399813838, -0.025149674288279338, 0.024820068016910644, -0.07045343442797398, 0.01723769647522963, -0.005742281357325631, -0.03306728091396097, -0.0006249474944627644, -0.04174503645579261, 0.029339149820795028, 0.04513641657370994, -0.03294732207407585, 0.038466199779014776, 0.04998730465996255, 0.02179121230660784, 0.059082543870023485, 0.025601792134145585, 0.02852028308683417, 0.006636922146499752, -0.1265779560514649, -0.018851259352505458, 0.02470411874218799, -0.02399915876714485, 0.04338454174465355, -0.027229933160371346, 0.01909908788465433, 0.024580957500012723, -0.03484339687838582, 0.011481448083120602, 0.013908996163612235, 0.014597150088931863, 0.04660710670086165], [0.01591109943949138, 0.025581994613339386, -0.04656264576256516, 0.013323958374740643, -0.02473833324760155, -0.04407303172048132, -0.023239275838767354, -0.026725709040101367, 0.05867568104174255, -0.00026915230755515516, 0.015202665911335095, -0.02356727858317586, -0.03380779188567605, -0.00425276603637192, 0.016846744699163762, 0.07794471487969576, -0.032223496895717005, 0.11581163830942548, 0.04263927296499401, -0.04000824238393858, 0.0003003937144794671, 0.017431756044471374, -0.03537159819011944, -0.05436818151768992, -0.019014971938528143, -0.011895967363289938, 0.0508353597584493, -0.00031988517872735486, -0.16033482737289448, -0.04263354291863084, 0.019177122197892763, -0.014559012693515873, 0.008416637031926934, 0.07151489288737618, 0.006602753786288559, -0.02540482026037179, 0.015181735848892892, 0.028099333723503324, -0.0006454043925558263, 0.07677576657277363, -0.007668613092974723, -0.04579988988697914, 0.06264732571015601, 0.062151821207490535, -0.035258907278310554, -0.01706881226899144, -0.027568666715934952, 0.024609851722829704, -0.06714952115164473, -0.07172643338189523, -0.021707457580975784, 0.0416314727876175, 0.013254652772854165, 0.024428964149028086, 0.04789233380757062, 0.07197527572428498, 0.05866170148784119, 0.02582827194319871, 0.06489947896575674, -0.04309978774375985, -0.053562305786631986, 0.01595288731050169, -0.048907340523520096, -0.010084034186883984, 0.012071340866982487, 0.022726595333639934, -0.02057397336034409, 0.0673498465883148, 0.02701730682711978, 0.05819133505041586, -0.0047984736302754015, -0.03076878451674159, 0.04261782927175116, 0.04288685871826904, -0.09249013599119944, 0.06968957782226656, 0.03469474588788908, -0.00014461298753218162, 0.04604691331662534, -0.04700384362516483, -0.03284689075553401, -0.02460671496225206, 0.04945052315867117, 0.019697585701849537, -0.06528528952165195, 0.061969037754862066, -0.0039871187779931495, -0.03722310057238001, -0.04739959694243034, 0.021370270740875004, -0.05280916281777365, -0.0958492814274206, 0.026387278176777006, 0.040291631502565026, -0.02205522175994979, -0.18228512708323721, 0.01687498025657172, -0.008755567389424398, 0.007117780971587738, -0.054468714929813804, -0.0032992053500803887, 0.02419926280032843, 0.02857166358142041, -0.004618652979169008, 0.03830162472660625, 0.05297220525540972, 0.030217317817851665, 0.1425062027883183, -0.04362286809454805, 0.04242812201310054, -0.05856321003302874, -0.012675827772832004, -0.06192408956222822, 0.024600296933348583, -0.019436453917917724, 0.0223368563660248, -0.020854772334657802, -0.060358699955500264, -0.0367191674982275, -0.037748505613030454, 0.02200751535420911, 0.004974812351481701, 0.022092845608781168, 0.010756413817234106, -0.030012635158426264, 0.0350944543193932, -0.009194076151318554, -0.04219594204237208, 0.07291819506419525, -0.004323006226412478, -0.03001074085033581, -0.02333062672593536, -0.042105423645492586, -0.019327019142652377, -0.030922515629037525, 0.04797952538476887, -0.017301824730008405, 0.009216305212758109, -0.02198497057475448, -0.04592000724045608, -0.08545008291003965, 0.019827711787625286, -0.007113825857349128, 0.0818289197945608, -0.0009132210342359467, 0.10211289437753497, -0.02941177194143635, 0.03733384691253386, -0.017260847358977094, 0.13728954847386815, -0.03783703545763589, 0.05391184489773055, 0.01211762418555074, 0.06275382163762928, -0.07588024577427094, 0.008948871634415932, -0.00259877825800542, 0.09074985431148352, 0.013377374407271376, 0.03936678505559735, -0.06418110581770295, 0.012017968029702574, 0.02652783081073222, 0.06661048840204505, -0.01983840536099163, 0.013824514365647326, -0.04928094959911129, 0.12383663107049207, 0.036081501927539956, 0.023788375437912408, 0.0020626234901625663, -0.037610444166995195, 0.07379566496006487, 0.015221081224811448, -0.03837161988176944, -0.041818318164559325, -0.05540057628551446, -0.07708725616547821, -0.030191425799142677, -0.04033784256725918, -0.030565942760369266, -0.01943150295680569, -0.061857251587215785, -0.05204245496942181, -0.03417500178120049, -0.02976126078897032, -0.05696404959384245, -0.018914653717290154, -0.04750072409291093, 0.03786468355963272, 0.004903978030400334, 0.02692769317440289, 0.00037419417489774104, 0.05973274265388921, 0.022857593178114026, 0.017990847097814913, 0.012103372108885124, -0.008229510493170687, -0.06170132144396907, -0.01746722955518017, 0.09183445407407947, 0.015662921518596027, 0.0033540326892606003, -0.015718802036528024, -0.03859643624028558, 0.007167687979015589, 0.022979783903630265, -0.0739975736990195, 0.0018732337166054633, -0.05377181060678516, -0.018758420421919518, -0.02361393416626935, 0.03660852482667561, 0.07295131875325951, 0.018410693940618953, -0.013095420941708506, 0.07487234192829247, 0.002734631641355646, -0.03713407123360147, -0.009802226014437506, -0.025540250722948094, -0.06569195945685166, 0.08949356677814217, -0.04852795113800115, 0.045286328198735015, -0.12072321791860173, -0.038499232789315725, -0.029837262440101913, -0.0002879202513518279, -0.02766063647324196, 0.002877073282165986, -0.005191399229348668, -0.08264512468814181, 0.02988102943896792, -0.0053664829321766324, -0.015780533547525472, 0.01608476005514691, -0.042344360924185497, 0.027083252623860753, 0.06645695834400747, 0.005056299406783181, 0.03330671755175954, -0.060487820769984234, 0.029825764649702144, 0.09780087113266933, 0.014533566763942614, 0.0006144408587166112, -0.036521637972337685, -0.03816695921265354, 0.10531028537996265, 0.06526503330512252, -0.003159480297862453, 0.002404670188664559, 0.008127211573340606, -0.02432996848783335, 0.057832145334916187, 0.007031855407922576, 0.0235897730990659, -0.02630662714592092, 0.028759222072684845, -0.013596240816329281, 0.017432978077385447, -0.018369966316674195, -0.012494989677226778, -0.025582285199572168, 0.02959697118663788, 0.047563148298657876, 0.02974259729914381, -0.013700355507430144, 0.014624878382700782, 0.024134873603353327, -0.0070068249381253726, 0.029328368980419003, -0.03728494988860697, -0.044504849145339545, 0.023033377429373454, -0.0529376427718091, -0.0990913881534959, -0.030815133806238366, 0.017952560398225518, -0.08709067937528413, 0.04839281440313042, 0.023406018931346306, 0.03621239767414848, 0.005667873475239768, 0.0054468123547561685, 0.03835573973683205, -0.04532131792263464, -0.09575635037944082, 0.005332602148170754, -0.038881053674771675, -0.034969675020300614, 0.020297919580674874, 0.07472916616456025, 0.017652900021299725, 0.0068562023131520005, 0.02338955918467975, 0.09507241405607618, -0.013682094126120346, 0.02591568813570122, 0.0827108066011687, 0.008276888615005147, -0.012203340055907381, 0.037822129169262426, -0.03531963194727983, 0.024697765838768922, 0.08490298285832341, 0.04360500568028218, 0.03828749124053834, -0.04760121980736138, -0.011098709477454453, -0.00835562177672488, -0.049927097146323256, 0.011329327350839665, -0.03892713908055436, -0.020854610548809282, -0.057251356129034064, 0.028856884178681576, 0.053211723706568195, -0.00660075345349155, 0.04577645764146224, 0.01905063393760415, 0.005243107871419762, 0.05621795608991774, 0.00646553504032836, 0.11877659802330175, -0.06130193972563479, 0.053868234972503884, 0.010321724300880528, -0.07326967560547608, -0.06572922360704894, -0.00015566684855876318, -0.029813720243037467, 0.024897032599109845, 0.0009415967798670169, 0.016418021625000556, 0.004885753561395782, -0.056757013971299716, -0.0465592027083908, 0.02443323498128177, 0.040975344781361805, -0.08079568311202939, 0.007715040133922972, -0.020021129125637145, 0.013222116539201047, -0.04908952081337349, -0.008802691051963126, -0.060249313873063114, 0.016470396259302456, 0.06342587062796859, -0.042080744235279306, -0.00700805089788043, -0.03794347798007179, 0.004541974340651857, 0.011479171675930102, -0.026920125366459435, 0.023995951393774476, 0.010230496716519407, 0.05008222935548211, -0.038781321338208434, -0.012160655294416433, 0.00017734575957652514, 0.06054075458644219, -0.00163878305007828, -0.02413107556275406, -0.01690778508614811, 0.02541470961670471, 0.0331173966942617, -0.017602868925696794, -0.028080356086398132, -0.004407248353348002, 0.05704389326619232, 0.1412261280230351, 0.08124036486794967, 0.04219345399592492, 0.009111797837558893, -0.0359667062289639, 0.017986642236489752, -0.06302275683996356, 0.07198515251472676, 0.039936107885807565, -0.08723567091028712, -0.009287406951710453, 0.06617838510316322, -0.06067719503251945, -0.09330522252046834, 0.004129623837285373, 0.0258336375787186, -0.058206872774819486, -0.02285224482069446, -0.05644019015780312, -0.07927353273673927, -0.0019147857808147117, 0.04761076046021496, -0.05680332556312305, 0.027781086822834297, 0.0017843667527015898, -0.02697012190586171, 0.00115206760290214, 0.02955266071297975, -0.04952561692416737, -0.011115005082167896, 0.052566861021726044, -0.02810409305477536, 0.007094223067159357, 0.014413469830038793, 0.03325738386311528, -0.0019465973159643198, 0.06727994881880801, -0.026600643866985185, -0.061203768701046594, 0.00801331433598158, -0.028338943277372616, -0.03961880970992016, -0.01677281484933508, 0.030112813584125236, -0.039432347592658325, -0.04146506583262674, 0.028109301616655914, 0.054803313196338244, 0.0029544664094000896, 0.017436631610236522, -0.0603846296718827, -0.05345346003751417, 0.05346595053331457, 0.025740103367963757, 0.0569216271453292, 0.014881453460355309, -0.004668614962370628, -0.006259169336857417, -0.03563373524534304, 0.016408807685316808, -0.06673151678263016, -0.01739913499105301, 0.027156496061885513, -0.010231436802250865, -0.02954275879075569, -0.0024806133298654947, 0.006157385225880278, -0.0099283129515776, -0.08751336453875107, -0.009604334433809016, 0.039784368467258475, 0.053803438954802885, 0.009130630181547696, 0.02069405144541119, -0.03141824631774365, 0.04579134822247177, -0.05104146236357435, -0.005251112344080586, -0.021097471527012936, -0.01803810898515626, 0.03216687813168011, -0.013162176453060281, -0.03466771037308569, 0.04991700359425919, 0.05085888310667702, -0.012204716806356207, 0.012773968953428723, -0.03368168374359464, -0.01175541865617571, -0.03678306191323867, 0.026878252675683882, -0.02204590101019129, -0.01048333972450319, 0.10810952612138848, -0.009816946955916554, -0.06792271299982856, -0.07352153376174118, 0.04168675328424721, 0.011989543198559209, 0.012458097006186533, -0.015369440418641914, 0.03146613807037875, -0.02599696274890549, -0.07293874657916664, 0.08604242645283171, 0.026224757223623545, -0.01203087319991084, -0.01619342988178867, 0.023086903413451723, -0.032423599287819224, 0.019201022522854903, -0.017625019450316675, 0.002708848199799852, 0.009345396183250601, -0.024039503201754586, -0.00861533989790262, -0.031540418194423166, 0.03724230439552585, 0.016742444661168476, -0.03582370010476218, 0.02327786569048068, 0.08511156408547726, -0.02987519886547558, 0.02702398873973735, 0.028747410135006393, 0.03180832927662894, -0.010412659728272475, -0.04592646924997857, 0.033321052092085815, -0.005950039775583945, -0.029261053501542976, -0.00022841844975033686, 0.015910746023802862, -0.03198560886893489, 0.004673503094026924, -0.048360394403970414, -0.0002359717283821526, -0.0008659332297441082, -0.06165139087549532, 0.025218458670239138]]','2025-05-27 14:33:04','2025-05-27 14:33:04');
+INSERT INTO `face_embeddings` VALUES (1,83,0x3FE28C3C3FFD2D3C21BB45BC54868DBDB367AA3C8559A0BC56DE17BD1C908D3CD9D40D3CC7BBD7BC7FF69E3C8E7ABF3D075CB5BD0BD2E03B46B3953CDD81583D9F2673BBB647C2BC22638F3D30C896BDBE140FBD3882493C0935B1BB41B3B9BD01A3E73CC8A18C3C6C41593B7E7AADBCAEE61BBD0436D3BB0550B43D65DBAA3CAF5B2E3DBC54643DF0043ABD518712BD98E6B93BCA4493BC334BB1BCA32D573D251DB13CA91E423D1ABE383D6DDB1BBDB10660BD7751973DE0AA05BD4DC700BDDB9E9ABC2EA5A6BDE53667BDFB73B23C168619BDA6965B3D218B513C6B0DADBC02C5263D65FBD03DC1BE78BDDAF828BDE877213DFF4C493DD4D0BEBD09D880BDCF07AD3DD87A3C3DD46B60BBE01F6FBC8D3CE3BDC8419E3C4F326BBC2421B5BD94C1E03DEEE395BC346E7ABD827E47BD3C5CA03AAD4C093DCD510BBD827B3A3D6DC51B3D17FAC33CB36350BBFCA48FBCE456933C0CFD6F3CCFAF0F3DAA36763D47C63ABD3511173CC57A9ABCFA0B233D4B32C0BC145987BB5AF048BC23E8F13CA6E58BBC4C18B83B4E77DF3CDAC7FB3B074435BD5E04B23C89CECEBDF6C6D93B99C85FBBEE9487BD7AA2F9BC469E913DC8A8E2BA3164993D58EAB5BB059F413DEB5683BD4650D4BC5F903E3C1A1165BC34A84B3A56E87FBDE27CFA3CBBE133BD8922403D45BFD43CD42E89BDDB069F3D2065023B9A0B3BBC1C6E993D334EA3BC6C4E873DD0CBC4BB664943BBC5C28DBCC3462F3C36680E3D5CAD1C3C36FD07BDF389E53CD37AAFBD7317263C33C2923DBCEC68BDD54419BDF4B50B3D1591AABCC095BFBA397FB03D8283CA3D7020B13C2EF59C3C480E16BD5A1B513B4F2461BCC8A6A43CF20CCCBC448278BD1312FF3B11BAF9BC3A94923D869CE33D0825F8BCAEBB0ABDEBB7BB3C548FF63A74F0DBBC69595F3D8AEC2D3CCC58923DAF197BBD21C739BDC7486EBC481434BDA6EE8C3CFF4A913CCE718CBBBB22E5BC27EDB43D310E9BBB50A92ABD8207963D42CC62BDD377343DC37E82BD3D1B173D7D0F913DBAD12C3D877E57BD9D0910B9CC4B283D74926B3CBF8B213C0FF2283D3D0A85BD5CCBE73C582F473D2171FC3CB01FA33DDDBBA9BC644D133D303338BD782BDFBDB974563CED24283D90203B3D9E5AA3BCE51CE8BAB29AFFBC3AE18CBD52AD85BD9A8C03BC46ED083DF399FA3AC1DA35BC34B81CBDD2C5753CBDCF653CBA1F4CBC3D23383DFF6903BCB7DE01BDD2500DBD5A7611BCF022D83B55B178BBEDA05A3D6245143DDBBCA8BD0C1CEEBC3EA9233CFEBD12BD5C20813DDD549F3C2320BABBDC88A8BCD2EFB33C1408663D9BEC923BA474FABC047C0CBDD9AC66BB92C1C53C456B433C4D1982BC0708B9B72A5D893D1C4E31BD551DA4BCDA6F2D3D1C048C3CD2C3483C06FA183DA36A5A3D76E58CB92B276DBC16297ABDE6EC57BB3CFF85BB007D92BA73AFA7BB12D5333BEA6EC4BDCF6C4ABCFF44413DB428C93C1A06FB3D509689BBA1A2BCBC1F813ABD4CBC14BD8CE0EFBC01E4203CCA634BBC3FA1B0BCE0E3BFBC10D2C5BC657ABFBC7DEC73BCB6F5CEBCFA20343DB5F5B23C19E060BDE172BFBDB8DB05BD6ED464BD0924663D8190223DDB0032BD6A91833D1536133D6C1B50BD28CA023DB6E195BC135CB6BC365B253D262B43BD74E5473D4C3A03BC272D243D6F0B2F3CB2F9173D9BBD8BBA926C0A3D1C58F6BC76020DBD5D37E53BAD5D793C39009F3CCF205B3DED50333D869DE6BC939D58BB609858BC8DA599BC56D496BD8785723BB95A1FBD6BFB92BD187FB8BCE28EA33C5EE2CE3CAD3698BB73DFAA3C0C24523DE2B65EBB6EA9C7BC592C403DC0BA403D850215BDDDEFA9BD2456B8BB932B353DDE55A8BD4639983C64331F3D0CDC293D2E80563CAA50CD3DDE5378BC8B44603CDED3B8BDB60B6BBC39D0AF3CDEE73EBD680C163C4A696ABC992029BD5213203D68D6DBBC2D9C2BBD571073BC3B29AB3A01EC843C75B1653D20F392BB5752E3BC0D84243DAD6415BDAC5B363D2A0983BDE8938DBDCB7B903DA798133D24EED1BC58F64D3DEB7697BC8E75F63C9F45AB3CFBDA893D58E3193D3CE836BD12E9313D8086E63CAF70EA3C283C39BDC4360ABC6CEC1C3DB07C11BD1D42ABBD199CFBBBC170B4BDC2C762BC88AC53BD8271E03CA18D1E3D6A5DECBC7EC7093D8C80EFBD0B7C00BD906A48BD24F911BC9CCE2BBCE1D466BCE8ED103D24F1AA3C0F33883DBF622ABDE3537ABC56E2C0BCD3D0CE3C500599BDACD8D8BDE54A9EBC99A4DFBD1651B9BCEC23F4BCBE47DD3C33DC48BCB1E395BD9776693D0AC56B3DA44294BCE4ECD4BCFCA3C5BC172311BBF3424FBD4C9A64BD420E2F3CDEF2D53D489B033D5C549CBCE702323D362E87BDFCD7A9BD9473FDBD78750B3B55EF6F3D22AB38BC5B915EBB477C90BCAEE9143D78CEE8BBA36C6BBD32238B3CBC38503DCEC4B73C1B6C883D351FD2BBDAD078BDAA6A783D081E903C63E8BDBCCD1A1F3D4AC68E3BAAAFB4BCA18135BCA51FCF3BDE02983CD4AEC73D988A273C6343433C1A821BBC1951983DE4BF7F3A492132BCC2A29DBCABE9CC3DB1F0813D03DF9A3D3593D5BA101603BD333B213DE08B303D341AAF3C788A403C5523573DA9EE9FBC15E274BCF5240EBD0CF34F3C48800DBD1FE07DBCD8F7BCBC3599D33D114CA03BF039863C3DD89E3C5BBBA7BDB8670A3D71E7183D690B13BDB578733C57D67BBCED9C0A3D1D95EC3BF172423D0C8C963CA34D013C419451BA08B98BBC500123BD6213473CD48F173EC41FEBBCFC53D93CD713D4BC7B608B39D7DA07BDBFA11BBD9BB4BDBD069D3EBD2F86F43B7E56893D3C275C3DF321473C62E50ABDE1D60A3D75A013BD2CAB50BDD24E7CBDE7109EBC1A6E30BDE962A03B5F3461BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:35:35'),(2,83,0xE8C53C3DA06625BD75567FBC7F3B45BD7552BB3A40806ABC53EA4ABC0EDB2B3D8D55AC3DF38491B8BDAD1A3D6CBBDE3D7697AEBDBB1145BC2877623D4BCA813DD6E5F1BB77D5593DBCB6813D98EED7BBF31818BD0048783D3D42DEB9B78B9ABD2050843D8F660F3DBB56613C9ACBC73C885579BC8F8B113D68AC1C3DD97E823D33B9CBBAD9333C3D57C0C0BC5E8752BD65DCC73CCFF599BC87D84BBD7A88013D7230A63B6A9893BCC9199E3D60EB67BDB9655E3C9FBF4D3D7E5C2EBDBD00473C5026A33D031193BC344689BD1B2F3F3B9A5E72BD097B45BD214E5B3C482E2DBDCC8ED73CD0FAB13DEE7ECC3CC277A3BDB186B13C399B543C1FF497BAD2F18C3CD839B23DBC63643DE7DA97BBF18782BC75DCC73A33BA9E3CBAB365BDE9F677BDEE91083E3710043C0625D2BD8E6E07BDFEB8DB3C8E419D3C6BFCCE3C8CB8BD3AD0F02E3D4FF4003D225AD33C255158BC48578DBC887C163C55B17C3CBE72CD3DE664C3BDD3818A3C602424BD70A1F9BC63D0C3BC4E2BC9BC77BD80BC5FB520BB7B06A53B5B48F03C229ACB3C9F743D3BCDD755BD5546F83CF86310BD0B36653D997F133D60734ABDB9EA2B3DFBC4E13C089A0FBD130D5F3DA685EBBB81123FBDD66816BDFDB421BDDEE4163DE3C65CBDFD17A9BC8D08BB3CBE9BC8BC0C624ABD911F413D4EBA86BCB1F693BC6E33773C2FEF893C97F5723C5F89D43CACCC16BB26101F3D2E6665BD9902473C0044BC3B559306BD41964C3D86CDFE3CB0E72F3CA775503D10C358BD15AD74BC10C2E13BC1ABB3BD685A1DBC35EBF13BF1CD8EBC335DC3BCA445573D3CFC053DAFD3703C197023BCA333923A982F95BCE9DB3BBC5802313DB9D0573CA7859E3B2BDCD53C89F1483DA280563D68F7C33D89F6103D0821A1BD4AB8513D212066BD70AB36BBA3C4823CA9E9EE3C47364E3D3E9473BD76A8B3BBF9D4CC3B74059CBDF2F0173D50528B3D788D4CBD85BCE9BCBA8FE43C05718BBCEC9413BD1029073D72CB67BDE4FD643DD52415BD48491C3D7E66C03DC1A0323D6D4C4CBD12F937BDB17D953D26DB17BDA7F5E83C05A6923C11BAA9BD38FF473D4958A03C80B9C03CC2194A3D8ECE0EBDA037333DCE8EAFBCF85390BDE49AD8BCA418BFBCC756CD3CB3B81DBC94CA6D3C669F9ABDF33BBBBC4F40D2BDBC3C353C9B42223D83DB1E3DE4BDCABB8A6BBDBA3553F43D3E10563DF0F402BD234D933D8360BBBC871140BCB9F133BC59DDF53B6234383C66BBCABCE4BB45BC063DC3BBE2060ABE198FB2BC0AD897B81E55AE3CA52AD43D5473A43DA369C6BBE1584F3CB38313BDDFD6B03D2BF038BBC5F10E3D436F84BCA952963C8E25273D5950123DF421E23CE099C4BCB608933D4A9652BD6E23343B1724333D5D7D313C9E8435BC24382C3C2979633DDCA031BD1078863C41AF8A3BFE11D03C122734BCA1FA54BB0CB7E13C3D457BBC4DF0993D54D1853DA767013C27FA32BD943F073E877218BDB4B93EBDA3ABD73B87EC33BDA2A958BC9629A83CE306343CB07D56BC34D7C2BC24DEFDBB4916503DF48257BDFE9F71BD7EAC2F3D86842ABDF38481BD4E04ACBD85143DBDFAA334BCC48C9B3D512E803D2F1732BDBA3B6A3DE411A83C86636EBDC2E86A3DD18F27BD4BD005BE6B7B493D6A2FE43BAFDF743D2E763BBDE999543D05A7BE3819BC473D2BFC9ABD41EAFBBB1FAFB6BDA1F4E63C44ABF3BC0FC40C3D3CFA7DBB56CA5B3DD40E0CBD72C6C9BC8873B23B30C82CBDFD1918BDA70911BD0DC2553DFB3F30BD7785D4BDD128DDBCB0DD073D96C0363D5D7BA0BDEBB72CBA2E5AC4BC781D153DC3FACB3C152C303DBD97EE3BDA74BFBB82D447BD3B4B673C78D8E53CF9D1A1BD71F846BD46CC403D213A493D9FE7BFBD04E4E53D0DEFAF3BF13DC6BC92231FBD9A084BBDBE0DF83C75CADEBCF04D3BBDA9325B3D776A81BD270C5FBD06E2E83C60222BBD352B68BD09E10ABD6DC6C0BBE6BB373DF2BC743DC7573ABDECA2023DE7FE48BDF9048FBCB278BEBB96371E3C7F1FA73BD60504BD599386BB98BC0F3D07D6AEBCD8C841BADC8CDB3B09E1913D972BDC3C4C4DAD3A3CDD573DB5F4973D75CF633D67CF07BD009CD13C7A13273D873732BD667ACABC1F7AAEBB5473A0BD814949BC8A430D3DD5E2133D4C71393D300F6F3BA2DC7BBC6523FDBD3A781B3D8C5B49BB5AD6423CAE3EA1BC88B5DB3C24358F3C0A979E3A497F923C60C6A6BD250DF73CAFADADBB90EDF63CE462D9BB79B6C5BD8816F5BC9AA58ABD85327DBC8AF69DBC8AEB6E3CB78C5FBC2D751DBCFD7D8E3CCBAF6E3D10C2D23CB6573EBD40FD783C8ED0CB3CF713C7BB771581BC6B4ED4BC0F60863C12BFE83C257AA2BCB33AAF3CF1BC2FBDECA31FBD7AFAA3BD36DC853B23BEDCBB62CBA8BD714E923C8FA09C3DD38210BDD2AC2D3DECA40ABDE33273BCF83C253D84AB93BBD612EF3DFF161E3C536163BCCF11343D44709DBC0E94C5BD3336DE3C9E0E1B3D19ACB7BCE534043CCBBF393CE4A14BBC55F86A3D3CF3FA3CAA1B343DFE638E3C5D7BB0BC9057BE3A1DF1383DF642363C0ACB843DD873473D95291B3DE1458E3C7D22143D4DC0933C6479853C9F6D26B8B103D53D995B373D065D773BDB5FC8BBA6E62ABDCAE8C03D2428C4BC66E444BDE2DFF4BC90F9183D2CEA1ABB58B6853C2AD6693D379905BDDB5B783C31AF073D0F39703C823F86BC306F583DCE52D3BA30A2BEBC765D3D3C681282B9A7FED5BCAF7DABBD483C393D57305EBBE445903CDFBEC63DD797D0BCF134133D0DBD083D7C829CBCDEAC083D59E8B53B6A34EA3CF51916BDFC990CBD871B983D6A7D823C3B12CF3B24B18D3CC955AC3D769831BD03FCADBCD7F1CCBC0AD2DEBC82FAB13BE4F5123D5827223D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:35:35'),(3,83,0x736651BCE35DDE3C98018ABC3EF18CBC6281A83C899CDF3CBEB7A93CAD9CC13C6865DB3DD72DCEBC3A923F3D596DEC3A01B9B7BD01CB113DF1F56BBCE9561D3BF4A6843A079C9DBC2126763D07B6FDBCF80604BDA5E5803D813EB63D316796BDAF111AB9B8BCFE3B830BA9BABA2DEF3C52385EBC4ED5583D2B12AA3D0D57553D898A4EBDCAD0CB3D45D31E3CC0C2A5BDDC91CCBCBBB924BD9D52923DFFB3233DB439413CA97233BD6C8384BC394FB83C479F90BC103F003E542321BDC2A59D3B97B1F039D0BA27BD656801BD64515D3C9022DFBC19AEB6BC94FE31B996F4D83C5600E2BCBDF0903DEFE1B6BB442A97BDE5D07BBC5338353DB18F63BB482405BCDC414C3D133AA6BBA9E1F93C62DBBBBC853A46BD59754E3D3B7599BD50E07EBC8F44E83CB2D1E7BC1A6FCFBD219A013C255D7E3C97D89D3D0507983B03D64F3D0EE5BD3CB4115E3C18FB72BDEC1AD8BC9147613C99C8AC3C1BF7C63B91A9623DF3482EBD95876D3B5DE984BDC1399DBDA2FA95BBCC92283C7B6BAFBB0A702F3D1E28653D6E7CC23BC60FDA3D67C3463DEC7932BD0DCDD33CC6DD68BCD6545B3D1B74683DC5E39CBC81A2C2BD510E733C7F0CEB3CCBF6973DEC33F33C3F16B93B496667BC0C8D813A3AFE263D6D9FBA3CB812783C1485AD3C0F2818BD569872BDC183693D285A48BD6E9E17BD698E3F3CBEAC92BDC5362BBC8141ECBC66F10CBC2703913DF99EAA3C55BD1CBDE11FC53CA6C472BC5CA68F3CB5BE863D42E955BD936C0D3DF8A658BDEB0D5C3C778AA73CF32D6D3C9842C0BCF31A3FBDDF0EE13CB56784BC6591903CEBF2983C2E3D4EBC6831953C1C2511BD222FF8BAF15A77BC7D65DF396410B6BCE3A818BD077514BD31250E3DFCC59E3D7CC0893D06A8F53C0C2AB5BD5850FFBC3D3E513B8DDB01BD1D1861BCCC529BBCBAC8473D63FFF3BCF8978ABCAB655DBCBE3DC73CFED0D4BA802FB23C86EC543CE94318BDF3E8A3BD640C98BCCB57D8BC22B2B23D59C881BD1DEB9F3B3A8773BDD48BFB3CBB16203DAC4B5A3D855F3DBCC819C63B298E373D7A10023D8E7E0FBDB63F633CC9C3BBBB29A5183D2173B73DEDE60E3DB96B483D537561BD3B816B3D4D47203CBC24DABC6FEAD7BC4451823D83E114BEB1AF223DCF3574BC616A51BCC8AEACBCC6039EBD15C05C3C80DE8CBC86F8253C9D05923D693D353D505A443D737E0F3D0A015CBC7973CC3D1EF6DBBCA893253D5E9F0EBC913850BCF2B6E93C302366BD1F6B81BC744CD0BB59D3D8BD14864EBD40F95F3D76A0853DB494CC3DF7C9183D362C38BB5F6E683C8CB1423D075A9D3D4888F03C9DBA0BBB0775B63D46ADF1BBD214713D9187DF3C64130A3CD898E0BB1F271A3D966FACBC97CC1D3C64A4833D469ED4BB4D5DA7BDE47EE5BC53B6C53C1F19183D8844F7BCA7AAADBC7BE464BD7FB81DBC3DD5BE3C83495F3D63970EBC6FCF433D82CE8F3AD920023D5BA6B2BC53DFBB3D3F7187BD2B0579BDAD7F043DF6B402BD58E6833C9C42093DE8B388BC87AEB73BAB80A3BCFECB7FBC79F79E3D2572DF3CF2D37DBD0DD3903DF0786CBC30F13FBDA76B65BDE5A9723D59EA00BD1C096B3D9BCF123D534E94BDAB54953C8F71B03C6D846CBD5A37A13D6274063C41C4F1BD94E675BCDE3283BD4A84FE3DC2D0B13CC5C3DE3D9199EABCEADB2E3CF9DA5EBDD3D3FF3B670057BBDB8292BC9033F03B552A073D5AE16DBC49F52C3D093A19BDDEFF83BDD4459DBCF438093D4FB00FBD9DE6953D4CE28C3CDC55E1BC0A5CCBBC34F61A3DF71450BD8060303D458DBABC35FEC63BFCED373DE2757C3D5780D63C61F7D83B7C0D29BD0FCC1EBCEB6A54BDAB870FBC31D5B9BCBC99D5BDA84D3F3BC19F8D38E804843D39D8B5BC5D62CA3CCE6E5EBDB678293DF06F7DBD7B8D68BCFC9E0BBD64EB0E3DD06FEBBC6506353D330F1ABD25DF683D646E883D0B1C06BD7C9AA8BD0EF4AF3B04D053BD0304033CE6B7853C2BBC36BD7B8F383C1C068FBC77E7983B6A97363CF59120BDB967FF3BFCAA873BBF2CE0BC8AC2A93D84E16CBCD093973DF44791BA404E983DD3DE04BD5EEBE1BBC29DE93C00D07E3DC1C4903D157CA7BD7B8B09BDBBDA203D67554BBD8B7095BB8798EEBC1FFA7FBD57F811BD4F5D27BD61C60B3C7146153DC2DC5E3C8494D63BFAB1B9BDCCC41B3B5D20CDB84AA28FBC086B26BCA419AD3D35E9FC3CEA16DFBC34938E3BEAB52C3C6A9A87BC3254DDBCEDAE08BDCD9690BDCB1372BD342362BD744C17BD3DCD413B460379BC507B1FBC4EEDC4BC647A49BD8B9AFE3C0B12483DCA18513A387480BC6286243DFA79CE3CFCB768BCE3F2B7BDD56D0DBD583D8C3D9920003D5ABB8B3C39293F3D41F50CBDCCE43C3DA69008BCF4F636BC72AA7C3CE6BEE8BCB3C17FBDC994BF3DCA75A4BDE44AB2BB77187EBD32C101BD50BFC03C61F8873DD6C7243D78D7B13CE45119BDFF373C3D5FCAF2BC88072ABDDA3C2C3D825FD3BCABC6F6BB1E0899BDEB58E1BBDBDC50BD452FB23D9D572CBCF4D9E13B7516BC3C8CA6B6BCFC2DDA3BBE9890BC996DB6BC457BDC3D41BC903D587FAEBC8BFDA73CB8290FBD323910BC82716D3D3221193AAAD41DBB5AEA8C3DDCCC18BD12A35E3CC1648A3B3E77A43D077BB5BCF6F167BDA8CA6F3A045AA43C37DFC93A53ED1D3DA98E823D417BE2BCB6BE19BD7CCD133DAA931D3D7B4E8F3C0F95B23D39ECDABC33399ABD68923FBCBC9413BD3AA20BBDF811403C75EE8D3CFBEF0AB925414D3DEC652C3D2A6C523CA7F9423D4557E23BFA9F433C0608D83C2AAFBB3C3BC381BD5EF9F1BCD431C9BBB30A683D85F0863DD69B2D3D8325F3BC13F75C3DBDC72FBD770121BDE364AEBCC9E73DBD3F41173D92DAAF3DC437853D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:35:35'),(4,83,0xD8ED273D84539B3D46DD7ABDDAC5E1BDCC22C9BCE831F7BB91BA8CBB307E3C3C81D70F3DD5E418BCB8FA98BCE7C6083D5F5FCCBD386F673C4EAB0D3DDF19833D21D7FB3B44049E3D8D219E3D6E4FBDBCA0CBE2BC115DE03CF2A368BD8FF677BD8C400CBB241D8F3BA73A2F3D68D1B9BC131D22BDA59A62BD9306323D8889063DD58A8B3D889BE93C843CDC3BAC9568BDC3535A3CBD53FEBC1BA14D3D162D373D064E853D777E523DE7CCB33C1C2C723C98D86CBD0CCB513DF46A97BCD7850FBB62E4033DBCBE6ABD9F9994BDD756053D8E34C6BD80318FBC0BD3183DA15C11BD6D48EB3D39552A3ECCCDD6BC8F47DABCF511E63C7ECBB0BB50DD03BDE04DB6BC47324D3DD59341BCD8238CBBC797FBBC5C4DDCBDD97A023DD8C3ADBDA6A986BDC437AB3DFEB4713C8E5377BC4EC810BD7A07163DF9E4243BEA09B2BCD33FE2BC0E70A33C0C169F3C2E54A53C66E59F3C1C7A293D246004BC37AA773D93AF903DAD5328BD0C86773D121D01BDF9C0A4BB098B363C1497F2BC908B17BD729A5CBC3EFBDA3C11C31A3CF0B803BC48C0313C115E8BBC8885863C8F12103C82AA2A3DF0779E3C97900FBDD6471A3DE9F1773DC961393CA7AD0C3DD4904EBCE1D8583C6F909FBD2B05A1BD2376163C23B195BDAE5BD2BC7110A4BC8FC8A23C37C97BBDA5D60A3D3133CE3B4FAF63BC705717BC99B7913C3869363CB291823DD0A4A8BC02563D3C705644BD4C69583D89F5DB3B4B8273BB1DB28A3C07155C3C8F4BA6BC4892613DF03E92BD9C0552BD7204033DCA358ABDA9E86CBDA562EFBBB242E03C2C8A6BBD50BE8C3D6278023C8EA7B0BC56BFD93C7BF6B4BDCAEEBDBC66F001BDA6C1793CF56D4ABDF91A68BCA9DC27BD0F26023D2888763D1440BE3DBB5B2B3DA29147BD4753F9B93020D2BC9CE665BD0BBD1D3B640A233D66FF1D3D3C74703CB30B2EBD2687B73CA03769BC67009FBC14C0743D030A2DBC8447DE3B5A42EA3C37EC81BDC13636BD5569323D9287BEBD2997003C66A781BD50F9C83C9643973D5B20A63D34DE85BBBF11B93A1C3E2E3DDF8FC0BC632B453D1CE0113D0AB13DBDBE181CBCC7E0B5BCE5B7B43CEDFEF83B87C807BDD52AC13CBA18B3BC0C76D3BC19E2B73B6BAC013DAEC4723CA62121BD02EF393D415E81BD1B4B28BC02106BBD721B873B4F1312BA29993A3C1EB6313DCA37833CA7CC813D33B03B3D9A406CBC15787C3D6A5D963BBF6D72BD3AEB95BCDCE4213DF43771BCA8A37B3C95D075BC73063BBB85D2E2BD40C7ADBCC56FD43C4075263C7600783DD7D42A3D66B637BD71695C3D5CEC2DBD359D4C3D7D0A723DFE39483D4D78AA3CA6C3423D7306E3BC1BDFE23C7C70EABCC6A4ACBC35A9393D9F161CBD259D9A3B3C7DDF3CE4A9603C39C196BC2CA5B93C7CD5B23CF6BB52BCDE2D3DBC0C623FBBF37018BDC4F9743D8B572E3D305EAF3CB12D30BD7F712D3D4F0E84BC86BF893C8E17BFBCE13B023EF2A50CBD8546B63CD60757BDCB37BABC2D7D45BCD99A2ABC0C5F41BBCE447BBA2EFD1B3BDF6CC5BCCE99F13C6D755C3A3D1CCBBC6BC2C23B9FB55CBBB4294FBD13D4B3BD6E5616BD956154BD52B9293D211C183DDC4225BCED38B63C2FDC62BC49FB523CC3A8FF3CD9571ABD203C43BDEAF6503CDB0F74BCEDA2003EBDDF4FBD6FE0CD3C296B493DB0377A3D244DCE3B58B82D3CAF6A95BDCACC8DBB6644603CBDB40B3C929C9ABBF80EE13DC5DB513DAA6213BC28C4313D3195A5BC77D3D2BC9F31D6BC518F0C3D254C7C3C75564CBD732AB439A409D0BAE91C8A3C3B56933C728F9FBB702DB23CA151743D22E1243D9817FBBB21174A3C496754BC0576F8BDAEC9323C4695023D28D136BD12974BBC5FBA1B3D73618B3C7900B8BD721A943D330CDD3C20FC303BB663BDBDE5AE71BD60A2C4BCBC6E8FBDACE06D3CDD83523D4ACE6FBD6019193CE89ABBBC81CC37BC636283BCF34D7BBC417B76BC1992A83C873EB93C423A5ABDC2745D3D95A2C3BBE8D0A03DFD4464BD2850AFBBD397073DD71800BC5E378FBC360BB03D8CA3873CB2E8DC3C66AEECBB77A70F3D8AB2EA3B2251C9BB3E2C043D4A9B3F3DB87D173DD3951E3CC710B63D4A1FD03C1A5C98BDFBC187BD999E3CBDE064F6BDAEA8523DC8A89EBC4D82EA3C80745B3CC029093C3FC6C63C98F7BDBD7B1105BD44D7C5BAB14C44BC0AC7F9BC6F81143D0A86033CE11D81BC7815BC3C83575CBC8A63EA3C08AE203DC7A8FCBCFC4A72BC4AA3B8BDD112583B0838A2BD5E05BBBDF4DE68BD63EF033C8DFD853C9F49BFBCF20E00BD3AF881BB3160A9BCD57C97BD57A078BDC8108EBC240F3C3CED6DCCBD73FA653C2EC3E13D518A633D7C86BABCF594523D89DBA7BC819432BDF2D1FCBD8BF81CBCDD68FF3B319E6EBDE748C4BA5346A13A400A18BD9C84BA3D2656DA3CB869C03B1EF0193D66974B3BADA9CA3925BD3DBD07668F3BD68B213D938A10BDD5C4E8BDC1A7C9BC5DF4C23D70EF5CBC8D5BDFBC75185B38DD1003BD0603D03D10912E3CE667913D8D1915BCDECA783BFFA2F53CB9E2803D4ABD7EBC43EB553D6DDED53C874D9C3DD9988DBC873C84BC96108B3DA75155BCE9E0DB3C062D123D8051723DF1B079BD7C883F3DA2E179BB1D304B3DE90C11BC1AC3E1BC98B384BDD5A7983C472CD6BB101D193B4869F93C68B18FBDF09D203DDD9CDD3CF69DB2BDFDD489BBCA2F233D45900F3C1E4F36BD23E978BB8525A6BC0970E43C1AD555BD7574893B60C4A93B418811BD1770903D6CE75E3C1BC2DD3CB23BABBCFD26963C20F36C3D24E644BDFFF1AFBD6EEC1EBCBA56ABBDCB666D3D8C84D83C9B41B6BC266D3F3D6E88CC3CE90A8ABD4A2D5A3D2F5E06BDC46E8FBC37CB5B3D38969D3D06C9E0BC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:35:35'),(5,120,0xDD1D093BAE68803A04991FBD18F2ACBDE223B83C52CCCB3C89ACADBBC319AC3C856DCEBCFC3547BDDEABBA3D3E3C1BBD222B06BD6B4A62BD1F88CE3D20FDBF3DD103543DBB86A4BB078FEC3CEB642EBC09A5373DE24E54BCF90D943BE7A276BA041822BDD6B8FABB7054A63D09A486BC4E27093D1042B9BDDA7B9E3DFA559E3CB0634C3D0556C1BC769CB43CB0C195BB78B843BD7097853D75263E3D9E07163D4C75523B64CF113D9A9317BD0B74753C9ED371BD4C78C1BCFC2CFBBBB5A738BC5D5B72BCE1E5083DE39A4EBD9B46D6BD2403803D1CA66BBD4809013DAA3EDC3D1B0D2E3DCD1B4E3D5B0A913C964C683DEF3092BCD3630E3CF32299BDDC4F663D1ED7D6BCE14650BDDCF26EBD6D28703AABC853BD3A24E0BC3C0D4ABDEEF963BDAC01043D85B6B8BB82E59FBDB48A2E3D2BE21BBDBBF8B5BD2DDC42BDFDA881BD0DDADEBC289FED3C665500BD49F5F53B53E065BDB9654E3D5BFC93BD83B800BC7B8E9A3D60AB263D17F50FBD6D2E51BD87A7793D303D4A3DB58E01BDDCC26EBD21B37FBD7E6516BCA180BA3CEC5AAEBB82A1573C2EC9173DBD33C93A2FD2373C1099183D509576BBE2E2693C1D852E3E29102FBCCE491FBCBEE92CBD22EC193DD24944BDF5C4D23A822785BD377929BD3FF70D3CC4ACF7BD4D8E8B3D82BCDBBC1B9B34BCC5822CBB8A86EC3C0D65D73C811CBC3C75E2323D563371BD3B06073D2ECF023DA93DF7BBE79BB9BD68DFA03C4549993D6DCF883D15C218BDF5D6F1BC922DBB3C2D0504BDD6BFA239DA2A2A3D9B27CABC6F6E633DB55B043BBCAE493DD09EB0BB91887A3D7FD459BCC27E8D3D22AA11BDB5414F3DB5E218BC2A543B3D798045BC2A848DBC8462263C8E4525BC7C9A18BE1135A33CD910373D17E1353DC3F690BDE598A1BD12D054BB17EE85BA5E26A43C2B67E63CAB7A953D95C5743D70CF8E3B089E773DB3ADB7BCF2B6063D509E1BBD836E213D3E24053DB76993BD38BB45BD24E927BDE5DC293D8274E23C864BE33D305859BD1DD10EBD024884BC8F6A3ABC1A1954BDB72284BC2126E83C0E2B0FBD251453BCBDA17A3D4F2D6FBCD3D5BE3C0CEA673DCBAD64BB7ADC173D6E7A433D450A1C3B9E9140BDE4DD4FBD866C83BCC593B53C23C76F3D96C341BD9007DBBB083BB8BDCE8500BD4885F8BC1DDDE13CE9E66B3D0394E23CA288753DB94E063D8B13D53CDC850D3D7B13C73C111D4A3D96E4B23D971B5FBD41D7AEBB080625BBE6E55DBDE3E9A43C0E814D3D244755BD2403ADBDD5CA5CBCE1953E3DBD65233CA291CF3CAF27D33CFBFE04BD9A585F3DB371203DBB6C65BD481ADC3CE822863DE629533A95A4AABCF36FC93CDC2BF8BBB50952BCB9899BBC558728BBEFA30EBD81368B3C90BB083D6026673BB42F9ABCBDD1ECBCF6C3303DBE27593A0B55063CCABA04BDCBB5ACBD3F06A23DC799283DFBDAC63C4878A0BCC7C7C8BD3EB3DABCE9E2D83CB9E808BD2BA4AFBD1A1E1ABD242D873CE65BA2BBCF199A3C2E23273D273278BD6DB96C3C29159A3BC7B899BB4D2DAE3C555095BDF4E2DF3C4C435DBDF10FB4BB90730A3DAD530B3B5110D7BD44F8D23A54DF5E3C6CA40D3D783434BBC9B897BC25E04EBCAF923ABBF1E96CBD5976B63C76807BBC51BDF93C12BAF9BC4783E03B29714C3D6E61823CB68F0A3CBB0BF63C3306043DB4A834BD45198F3C1FE31F3C5052903C1BCE303D43C8E4BC5941BC3BE873843C1FFE0C3D76189F3D8AC48F3BAB292FBD407035BDE7F18EBD7E3818BA5DFA17BCAFFA2F3CFA190FBD73E9A33D09AA993BD227ACBB05DEAF3D96EC913C740DF23CAB2DC5BBA6A9E6BC70C1663DD33087BB601BF3BCB1ED9E3CBC7D57BC833CA53CBA969B3D574C973DF3F9883CD0D0CEBD9DDC6BBBB62A6DBDC16D053DCBB99ABDC8A5F23C3F47FCBC0C7200BDA2A4303DC693EE3CD320ADBCBDEA2E3DA0AB20BCEB60543CB3B5933C2AE8B33DF01FAD3D3739A3BC244C78BD74A7483CD4ABC03D45C80A3C99492DBDC6364BBDB96A193D30F0F13B2D6D6ABD85975ABC0AE6803D0A461ABC48476F3DF7388DBC3C6EBA3C0DC81A3D697E14BD9E65FCBCF62112BBCD3017BDFF20D03DF8E71A3D649300BD6F3CF8BBAB2440BD88A838BD0B1E88BD2906F63DF08B9E3C362C93390E2A74BCFF63EC3A9C889F3D43BBD0BD466104BD9A265F3D81378EBD2B1011BD594D4C3DB990AEBC745F9EBC1922C3BC4AE41FBDA59C653B9B6428BC30D5E0BC1AF2A33C872A69BDC43E8ABD21935DBCEA74C1BD425FC1BCB0E8CA3B2FA6233D88FDBA3CE2A6F2BC87C703BD324B47BCF5C981BCA1E0A93B65F398BCCC743FBD40CE32BD6CAD8FBDFE043F3DF920223C335300BDFD3EEE3CC3A51A3DA80AF5BC73F704BD5C2D87BD7013033DD2A732BD1552983CA75C8DBDFEC86CBD7EF9B43B54B4833C970AD3BC1AFDD5BBB5ACC8BA92F978BD3CCCDB3B9B440EBC2196BABC94155E3C4714FBBB11797DBD784E493D36EB08B984F18EBC9623223C0B3F3D3DA9A598BCE93BC9BB241121BDBCED8ABC285158BD02784C3CAA3AC83C91E62EBCD3D0A93CC5CE633D654431BCF1384BBD8747EF3C939BB83CB4409DBD96D0033CF4D60CBC7CC0673D6AD051BD1F6AEA3B93863EBDCD1EADBCB39D2A3B0F83083C8C4CEC3CA10DE33D98795C3C5A07213D3CF1B73C127BD3BCEFF3A03DA0532DBCD06C053C6D23E13C1B408A3CCEBB223D21EFC03C46B24ABDBAE913BD0EC3B53D16D649BD4C36C5BC597437BDEF4B9FBCF92CDEBC84EC9DBC861E1D3C1CF3F6BB81C4D73C9F291E3D23A4C93A67600C3D5ABABFBCA799B7BDA0262F3C414D693D682EB03DAFEF3ABD62D1CBBB4CD5163D971E393D1C5AD13CAB89933C36E6C83D69B9883B2283F0BC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:45:21'),(6,120,0x975A80BB9F49563D350196BC2003853CEF01BC3C6973853D7BF693BBF412D6BC6113AF3BA4FB40BA7B03313DC6CAED3C18B174BDF8945EBD6E6D8A3D2F8D3A3D279FCB3C60258E3BF580AC3BAB8E3DBC4AFCCB3B6343923AACE7DDBC2E471EBCD64671BDFD747DBD42783C3DD2353CBD4213AABCC419CFBDA290DD3C0819193D8FA9B9BC5FF2C73C610213BCC5BB6B3B0E18A4BD6FE5843DFB0A003C50A758BB9EE1FB3CD9D2B03C1EE7F8BC7974CCBB291074BD0A81893DC61DC9BA427085BD6DA0CCBCB5C1393D71C68BBD9EB4A7BDEB9C5DBC99611ABD034F393CC3B0923D3437D73D1D43CB3DA452003D67C6123DD6F6FDBDCBF7BABA64A459BD16E9E93CA823BABC02DAD3BD19BAAB3C44BB97BC75A218BD3F68FD3A3727A8BDF31E9EBDD4C33F3A9BEEA93C46AD82BD2108CD3AF90A6EBD7FDF4DBDCB61283CF777E739071906BC79E3BD3BE1A381BD5D9D4FBDE1CC9DBB3B43DB3C8D7D233BF9036F3C0027B63D6B8B6B3A6B7678BD71F566BC2D413DBCA7D6FA3CA0ED90BCBAA5D4BDF6C9E8BCC7B38BBC838CAD3C0CC51DBD82BDA43B0011843D9B9BBF3D38ACC93BDB99FF3CDF453A3CFD86623D76A4E33D32A08ABD34588D3B83A697BCBAFC353D9AEB80BCA0FC0ABCFC1503BDE7CC843BD5C0A53C7A7CB5BCB21C3E3D61EC69BC18F2053C5F85D6BB9EAA943B5889383DBD3FD1BC96192B3C701F31BC9A258F3D38B61E3DEC2E82BC010C6D3C766EA93C56BE89BCF1A83C3D6F7BBDBC9F2346BC1CB910BCB8B29D3B195148BB99B922BDFB132EBD2EEA133D73B013BC62C0B03D6C26653CD7BC693D8D6CED3BB7A9093DEAB608BD89D8803D78C72F3DF0CA833C4DB283BC6FB2AABC57701A3CFE3FD2BCA5C0DEBD60604ABBAF80073D589E8D3DFD1C80BD2DCA86BCAA32843D0F9C743DF264093CD57E393D36BA29BCEBE68A3D3673F03C80388D3D1E63C93C0D977A3B2BCA213C47B898BCD068E13CF3FE6CBDD3FD06BDDF41FABCF068DD3C0EA442BD4CF1333DD4DC2CBD7FF42BBD55AB46BD00D108BD45C69FBC6BF93EBD705DDF3C448826BD57487CBDF6CF743DB107D2BBF1C617BDBBE7933D4A5D14BDC9054CBDAF0634BCBD76933C13B914BC438BAB3C1D78083D8C8D75BCD3C7D03A1767293C9B24E63C54C5E9BD9F366E3D604ED4BDBC988B3D693E4B3D5A89B13B65DAA13AD6B4CA3C4261393D2B26FC3B5D9097BBD39C373D28FC083DBBACB8BD518567BC876E82BC563DAFBD28BD00BC77B1B23CBEF816BDE001C3BDDA1764BD4D5D343DD7DDDF3CA2E9E8BCF9B6F1BBADBDC13CDB889F3DAA01B03CAFF07C3BB702603D65FBF33CE6998B3B2ECADF3CFA96823C47B13DBD3749533C438FE3BCB21424BDF68DC8BCD03DE2BCC3D22A3DF4408F3B5933B4BC94478FBC4A97773D38BFD83CF84A283C35F7A8BC869F38B81AF7303D8F8A143D931A763D50A964BDBEC48FBDC4DB77BBE1409CBCC1D814BDF4724FBD661333BC694B433D39F14BBD0E57033DF1035A3DC308C4BC8440FC3B55DC2CBC2F2F5C3D4EFC453CB2D1153C59D0853D742C93BDEEB0B0BDD334BF3C57117A3C6B3697BC0C4943BD20B9023B4423183DBDAB823D1F3C8FBC14D1A73D21D9F3BC8CB89CBD45CAD93CF9C0CFBCB5D68BBB8D0DDB3BCA173A3DF9AFEC3D6340CA3DC3D906BC71FB603D37C1023E2ED665BD3EE6EEBC473F62BACE109CBCA81E523BCAAE86BADD1B193D4E65B73C9AC0B3BC47BEB73D4687C53B14748CBC12C9D4BCA3994BBD360C823C9EBACC3A62ED223D6E654ABA80D89A3D1ECB953C1CF9243D82C9283DF884B6BD36A841BC3D19B23854DAF0BCE91EAA3D40EC4FBDAE9719BDF1F32EBD0CAA123D757326BDCE78CC3D598A1B3D5580E93BD904F33C412993BD90AB0BBD8CCA36BCC2C514BD2CD534BDFB6165BC8E911BBCDA3D3D3D02B65EBCE22DA03B0811893CABE6A7BB45451BBC7449823D85B1453DEB41643DDA2311BDEBFCA5BCACA030BC5763F33D7A0730BB622D0E3CF1D2BDBCE6B5373DA98684BBCD73D3BC5608BDBCB32F843DD133BEBC8CBCA03D7CFDB5BBE7940D3D2AAD4B3DCF2817BD5C7B69BD57F914BB7C92673A59ECE33D06A4DDBBDDFF67BC6ED0ABBC39C0D9BCA24580BDB6156F3C9AA74C3D44F9F63CA46543BD0F3CA6BCE6A007BD2F59053BF51DBCBD00C6353C9EE7B73D786CC4BD7F51D2BCED80983BEEA408BCCC8A21BD24C5FE3CD08543BD0717F23CBE195FBDB92408BC7388F93CB265C83C68D1ECBDA6C764BC1E412EBD7F44D1BC978C18BB77E31F3CFEC79E3C2B190CBD30FDC23CC1CE383D1724B13C3D779D3B2304B9BC9986ACBCD4B5A7BD0664593D243CDC3C451B02BD18A981BA65C5243D3245A73C2A2B6ABBE1844BBDBD5038BD98D76E3D0DC08BBD5657103D6AD0C0BC9DE33ABD13D69C3DD5EB42B9E5FFC3BC776E59BC0FE284BD4A8FEABC031F103DB05AE7BB76D78C3CF3633B3C420923BDA8F7A3BD624E3DBC9E3A133D15F430BD2BC9003C15B0813D3E3563BD8BB9303D1B73E4BD195E9CBCE49CAEBD14E0A83C37CAB3BC0DFDAC3AB2DE293CB6349F3DAC1349BB671480BDAF34A8BDA163293D02BF12BDAF9881BCC0B7133D97B858BBFFE739BDD93398BCBC14AF3C068C213D0FE1993C4A66D73C79ED9F3C09B8063D640699BCC006503CEDA9FFBCD6E5AEBD6E3D373BEC4B06BD2A9EF5BC3DB0823CD6F2D5BB56E9EE3CF4439ABCD8F39BBC50CE2B3CBDDCB43D02EA92BDD32CB43CEC6D3CBD4EC30DBCAD1A313C0BBF213C4BB331BCAA6F03BDD3D42D3D857C193D41B28F3D7E47143D206124BD8F328DBC66FBD63D2A6D193D8195E93D1B339CBA0DF89E3C85875E3D47905F3D3EB36BBC073EF53C2108613DA2F850BDEB09203D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:45:21'),(7,120,0x950B633C6B8183BC2A402A3B9F62B2BDD7FD9C3CB45F503D621C87BC1487493D129023BD86A780BC4008253D3089F7BC170485BC76A22BBDEE29CF3D2214A53D72078D3D0C2BD53C830E013D1AB5CB3CC19DB83BB86DA9BB0516AB3A9335FABC425B1EBD9A2D2CBD06479B3DDF4A88BC13B613BD6838C1BD722C8E3CE6F04D3D1DA80A3CD293F1BB5032443C50B416BDCD905ABDCEAEAD3D0327833C2076FA3C9A627D3BF865443DA2508ABD4AE9BC3C67F8C8BDD433FC3AE61EC7BC2084F7BC5F7429BD3AAE3B3CF58732BD8D5FBEBDB57E433D17EF55BDCFFECC3C5936E93D024EA13D080BA43D65C4703B4A49EF3CA29933BD0064EA3C8EA7B5BD3E7B143DF9E365BCF9953ABDD46E81BBD8DD413D781C57BDDB86C7BBB76980BD84479DBD6E947FBCF33F4BBCB45FB5BD9E7B933D5A0FEFBB28F3A9BDE1B3D3BC1D0634BD8B1C84BC1CE2133DAD122FBD662019BDE11230BCB5BE543D0F5B36BD948F9EBC6E20323DEBD2533C071A2BBD339B75BD2EAC193DB12FFD3C89442DBDF95DC9BC48A287BCC50BFABCDFE5B5BA2F28F8BC1D09E53CE2B0C93DF6BC0A3D30A79FBB16F7F83C0A5E233B2EE3663CA5AB393EFD3624BD0AFC613C779914BDA42A803CCEA080BD8615F5BB183A1ABDE0EC74BCBDBC3B3D1D81AABD6193733DE92836BD4911333C578CF53C1C180B3D52D3823D203616BCAAF6153DA08346BD9A25403D4C4E523D485B85BB6F320FBD21ADA23B0040B13B9DDE1B3DA282CABC6DA42C3B7848833CE6BB6EBDA8D544BCDD0BC5BB1982D33A34DA8F3D7565B53CE17A763D681B3BBCE7CB043D0373EA3C732A873D8CBFBBBC03E21F3D6906193D469D1B3DDA16E3BCF79473BC92E323BBDA22433B750710BE15815B3DBAF91C3DF6F6C13C86698FBD6ED8B9BC09B0003DB9703D3DE1EA333D77EB053DB9E8293D0A4DB93DD38A6B3DC8FB5C3D080F0C3D6CB0133D0D87063D858B69BB1F1E103DA8BEB4BDCC2A75BD9B0A49BD5C5DD63B9AB0E53C0C48AD3D6346BEBDD55AFEBC051CE2BC8610BFBDB9EFC6BCE0CF56BDE2998FBB772EB7BCABD30BBDF44D693D5DBEA8BC945684BC52376C3DC8022C3C013FF2BB220E023D4DA4893C0AE700BD59B62EBD46280B3D391DDB3CE733823D76D315BDE60E133CA04706BEAFDDCB3C07D057BDB5AB133D2BBD343D66DF453C9FB21F3D806F843C3528EB3C59FDF53B3A9D553CE00E3F3D891C923C51E489BD6BE4BBBC04D199BB013C8BBDC070073D24232D3DBED099BC53CB48BDE841D9BCE388143D2F8938BB395712BD612F86BCA32A233BFC32F73D794DD53C34BE3A3C84BC8D3C5BC28A3D7E3CC33C0CDD223C26510F3D71EB05BDEED9D03A49C13FBCB9C2A6BC0B3BC53BF880BBBB281D253DF369413C8D4C31BD4A3C54BB0567953D7F498CBC83AF1BBCDC5C35BDD0AA34BDF404393DE87A563CFF09293D9FC90EBD13218ABDA9CB38BB544A13BD02830BBD3AD2C8BD856685BC38ED8B3C0D75ACBC431FE83CCA33643D08A7FBBC90929A3A06C1923CBF23EFBCC294E83C4C89D5BC9056AC3DE2CF9CBD6C87ECBC4248B33AA9D7003D6C7B1BBD936B3FBDBE22113C2FB8883DA457D0BA1AAB54BDBF47323B8ADA9F367EBC9DBD57705A3C8855D2BCEF7498BC694693BBDE304D3B3DC9843D0DCC653DEC2950BB02BF2F3D740C303DFDEBBFBD54F5F83A5733E13CBBEDDCBC165C1BBBDDC5EAB8B26B1B3CB0B9673C05C8813BA87BC73DDA1A41BC7D1BD5BC55EB27BD2978A1BD0FC000BBDD03873CC23FDA3C10F9A5BCCFA9C33D13DFF73C2C7A183CBB4CBC3D3819FEBC8D2CE83C9FA4C6B937E539BDA3D5083DE81C4D3C46BF993C2B727A3A3B0F54BC1609883A864A943D31C9EBBB824C6F3C46D0B8BC3885B7BCE9A391BD7832B3BCC7C730BC04EA883B1E6B05BA57B5E5BCF89E403D6538373C8D968A3C5CA1383D975FAFBBDDF6E2BB6C35DC3C314E8C3D1BEA763D23EA13BD81F42EBD3C5711BCE9DF8F3D358BD6BCC1815DBC18669FBCFAF22D3D898F47BC5B03FFBCF8388EBCC3961A3DD87E2FBDBDEB4E3D0E171BBC6E2E4E3DD992983DB3A6B8BC6F35F6BC266816BB322930BD6AE2173E3944123D28B128BCCD61C43C836CA0BD412129BDD1AFC9BC26CBD13DAA297ABCB3CD21BC0DBD943B4534933AD780AE3C5D2D8CBD550B023C6633A33DCF09A7BD0C1308BD4242D5BCBECCE9BCC22319BDAA4D07BDA75703BDA118A5BB6E4EEEBC3FD141BD8349183C7973573C5AB89EBDA4D874BB541EA7BD78893E3A4A2AA23CD04D9A3B0FC2633BA7FC40BDB238FA3C75EB603C7EEC353DFE28863CE4E5E7BC9AD865BCC0AD92BD159F51BC4DB9D63C806C8E3CE21574BCB3B39D3C9CA8993CC2B395BC6F7253BDF61F99BD476F1D3DF065E9BD1A8162B9AA5C57BDF9D82D3CB7FA51BB2DD16C3C2AA42FBD669001BC8634A43BA3C1C3BDDD2930BCDA4800BB42D001BC284713BD1EB763BD4B309FBD153D503DD240CA3CF9F40FBD2F30D63B7D29F63C213129BD7B85E03C35090FBD97AA01BCE5F350BDE64998BAD53F0A3CCDC7A13AB2AB893C6F8CA03D5098E13CB73F91BCDFC720BC39DA0A3DAE1F44BD01BEA63B52DB19BD85939F3CFB1633BD03500AB9CD7D10BDD38F153D8A91353AC2E0493D81547B3C5E460D3EEAFECB3BBE77193DFBAE24BD34F581BDC43C7C3D75BE12BDB94747BB6B9A86BBBDB5CD3B21A5933DE0E430BB210458BC0C1A0CBDA31DBA3D5FF2B5BB4F0132BCC24495BC2D5897BC16E4023D8F4D743A24D2013C4D984EBB9BFE3D3D6D97533D79F98F3D0AA9823D922315BCF18CE8BDB940983D30A6273B413C683DA2758BBD990A173CC54D923C0E280C3D59AE2D3DA147253CCD875F3D1C3A52BD84F608BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 11:45:21'),(8,121,0x9DD58CBC36BB08BC9C3EFABCBE36833D013CB1BDCC2A2B3C1CCA70BC557C76BDF8BAE93DF86989BCF5735D3D7A3EF6BC49961EBDB09FCFBCBD4A783C86175C3D72BC35BD3BDF153D26DE26BD6F96C03C48176BBD6BFE073CE28FE7BCCA800D3BAE31E8BB5D8B92BC060D6A3D2146A33C131B63BD098AC4BB3414D4BCD481D03C7EE6D53B2E71593D57A8F8BB4B98AABCE94BD1BB96A93FBD4F9B69BC13CB483D6AE4ABBB1DF67CBD462A503DC56F793D6EBDABBDD0B1DCBB62DA923C7A200CBDA0FF58BDC94DAEBDA4FA93BCFCF01EBD21C006BDEFFBA3BDD1432CBC2CC54C3C97E87DBB81B693BC02E6CC3CFD49D0BD033806BD0E9BA7BA5AD556BCD8AF27BDA4C2483D6CCF0B3D1C9E03BD731A83BB58CD493DDCBA873D5C12E5BDEE8B65BC3B5EB83C0244F33C4BDD3BBD6F14683D26DAAF3D8B8226BC53FD5F3D0A18633CE15F9E3C92FFA1BB240C193DC69381BB7ECF3ABD90054E3D02C7263D8E0F7EBCA79329BDF587D0BA65CCA6BDD60016BC620FC33CFAE4403CFFB8B2BB9440DFBD5316243D1557FABC81EA833DE41F08BD44B711BD6B1F4A3CEDC8BBBD2D64463DBA9EC53BEBBCA73D3D8940BC51ED9FBDBD7BF63AC49FC4BC233070BDE672823D793A63BC195AAA3C89F4FA3C58AC033A9BB760BD0522B9BC6AD3D3BCC30F1FBD8442913D2F66DF3B3B9823BDCD2E2CBBEEB6EABB98EC11BDD47EEEBC14FF0D3DBFC0D93D28E491BC530AB4B879D5D5BCF0CC6C3C0DA563BD71DF1B3C499CDF3C39DFD33C76A75BBD7F62623C9B402D3BFD04613C7751103D0A3C20BD25B8B03DD14818BC2E55973DDB237B3D71CD8EBCC61A0BBD4EC9E23D5B6188BD175B123DAC88543B9FCD673D9F80C5BCFA3DA13BCDE00B3D1B62D13C29819F3BAAF3433D30D07ABDD25C823D6000843CF08EAD3C97C1033DB073ACBAA25085BD240E3D3D968B703DCD4648BCE51F9FBC140DDCBBC613B63D52FFCFBC38C08339E5727ABD69B575BDE04946BCB1D494BCBB9382BD088F9BBD7F3C1EBDF34614BCA8CC92BD62B641BC1E72203D8B52F4BC7D2ECB3C27654ABD4EA9F43C43238ABC9D6C1BBCC1000FBD52D7C73D7E11AC3C63D4593C0C6D14BD1378B93B44FD24BC3783E03C01A3913DA5FFE83CA0F8D2BD31FF463CF3F2763BE797063D11601CBD196D753C6051193DEE2190BDB8EC07BD2143B6BCBDEC923D766D8D3D4661D53BE87A853DEEBF5DBCFF67C23CDA49EC3C83FFAFBDB489583C4E43B9BCCE49AF3C7B65B1BCB664603D62A9C8BD9F1F99BCE3F6BBBC6D0D593C9697C83CBCC383BC628013BBB184DB3C9C655B3DEA20323D1BD3313D8C30873D503A09BDF47F683DB395D8BC9C56A73CED2860BDCF6212BD9A3AB93BAD9A373DC4D5D93CD1E7A33D1EE791BC22C2F6BA780D893D2B10A03D28BBE9BC12C313BD74991CBA2DE6AB3CB443C5BAD79E15BD6BA04F3D4389A0BCD31266BD8DD04DBD27082C3B5B6C9E3C3325923DD71B92BDC95B013D746ED43DF8DFA4BB746B9E3B48E4343C624A71BC3EEA0B3DEC51FB3C8FAB613D68FE0C3D5DDE353D7A92DEBCDAEA1CBD27BA91BD63A54DBB91EACFBCF4DCDA3CFB703D3CF6689EBB8977B53CA7EEEABCB8998C3D1D5D69BD1A3E1FBD2E67D23CA02B8CBDB1920BBDDC3E4F3D36324FBC8662833C8834B73DC56DBF3CE3C14A3DE0483FB845B3863D1578A13DB49F703D8C336EBC3060F03C35200BBDFE3EA43C14C092BCF9FB063DF3FB1539E780DB3C697A023C57A4203D006CECBCA0DD213CA78B8CBC3E517EBDB753B5BCEFB4233BA747163D73780D3C62C70CBD7E2F723D521290BCA76BE9BC6FFB4B3BD632BA3D0AD2FFBC1AEF2D3DE3603E3D13A193BD95299FBCCD223B3D8503A5BDD27982BB495E7E3C1FEB06BD6447BDBCEB5996BD239E40BDA5D888BC732832BDBBFA373C1F5327BD2767B3BD7401953AAAEBB0BDF453B53B43576ABD1E536D3D0C28AE3CC8B64E3C8D53A0BC07007BBDC69D2DBDE034C93B64B11A3D08AB763DD87EB93D07969A3CEEA757BDA1919ABD12D02A3D420B0F3D93A8A13B48963FBDE68EAFBB3AB4283DC6F3CCBD166B94BB8D21CB3BA667763C823DF53CE372B33DE447CEBC7D52B63BA115CF3C61091E3C7144213DE03B04BD9E6884BC20ACA83D142820BCD34EB0BC2678433D019881BDEA8B87BDD2840C3DAD93FE3AA0CBB8BC34BBDCBC290390BC886331BDA6314F3D9C70513DE13AEA3B42BEB93C73DBE33B847B83BD4EA3E4BBC2BE41BD1E4F8FBD4187DBBC905CB43D96C211BD91B5E7BAECD0363D3D7CFB3CD00398BC0D90463DFB53063DE60C833C6105FA3CF0DF0FBCBD7C4B3C288028BD97A3333D58ED72BD98784ABDDD28253D2A8E96BB11F10CBD261AF93C5D8D0BBE1DDBC43A8BC9723DDA6A8B3CA8BCBF3C0277063D1D42F0BBCB6C7BBDF80844BD500190BC283552BD4C409FBDDC95093E08FA883C5B934FBBD3DE713C796DB83CFDBC82BDE73947BDF04880BC1BF561BC7D7DD6BC674B153DD88D55BD74E78FBDFCAE763D90A03CBD44CC09BD8008E43BB964F3BC666A21BD64BABEBC031F2B3D075F613D7CBB5CBDB784393D63D5153DCF7A19BD5CDDA93CC022A3B9CFF1DE3C846C3B3DEC398ABDC8DCC03C80DA6F3D0C2F503D37B417BD1164B9BCF8F19A3DAD5727BDE00A0A3B5DDD0C3D6597A9BCEFD1ABBB2492563D7780423DF2CA183D8D1964BDA7E9C13D38A292BC2BCE77BDD1F5413DDBBE94BD2AFB923C4A8ECF3B2884523D52CB2ABDFE478B3C89D0A43D7071AFB8C4F14B3D1044B53D000A13BCD68BCBBC4B91153DCB978D3BAA4E1B3D921A3FBDD3D5813CBE20033D6AE093BC51E2953C0ACE1EBD912D6CBDD19D97BC48B2393BE117833B4FEDAB3C2F3266BD6767883D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 12:21:05'),(9,87,0x80AD38BC2B7398BC52C338BD2D4CF93CAFA2A6BD8988DD3C26DA51BC9C38F9BBC74F2C3D486011BD71F84C3D742AB0BC12580A3B26D0B2BCB5FC9D3DAEC7263DA13D2B3D1FB3903CBC7AD0BC6369A6BB29D6E23C8CED803C0B348F3C58C9A8BCDC3D48BDF97C1DBDD5E35BBA28212F3DA242A13C31C8C6BD5BDAE63C4552033CD482603D67EC12BD14A2BE3BA5C19EBCA0C830BDCBCC02BD580571BD0D90183DCE7AFC3C677EDA3C04FC84BDEDD514BDFC1EC8BCD1DBF23D9EE83FBDC9B576BDAB042ABD7DE6B73CDF4C1B3D15FFC2BB4F9883BD8AFD693D48C54ABDBD29423DA85AA23C32EC1A3EC4CA89BD1088B83C9CDFD73BDE6A0B3C1185593DB8F4BFBD4285C0BB7CDC953AC649EEBAB0E0D23CCAB8333D96D3213DC58A0DBD88D10FBD259BCBBCF37B2FBC64D9B8BC0176173DA30B7A3D17BD46BD2069CC3CE79D783B4013BD3BC009793CE146823CA2FD55BD01D6973CF97F613CA955003DF4B7273DC0940BBD3F5D59BD34724FBD822F863D657E16BD8E058BBCCB33853C1EBA2DBD40E98C3C08A1F5BB34E7B23A151179BD92C3063D8D5C91BAE5849CBD5DBDCF3BE8E0673CFAA39ABBB90B1C3D328B9E3DB28A0F3DE8808A3B660381BD72219D3D73FACABD5DBA223D69204CBB14E1DEBD298C1BBCFC1A82BD7DBF54BD605BCCBC7983EE3AA901DABC643300BEC9E010BCB46B4E3D818C803BCD01D8BAC6CC63BD7043DABCF403213D1710B83D463BBB3BB0836F3CA58C003DDEBB283D67160BBD8EA2B83B8B2223BDF5FFB83B50FDB1BB8BE469BD315F83BD0EB6103C9985963D5C146BBD538FA0BA9412D4BC658309BD5940ADBDF876FEBDEC2B213D4763C7BC5E839C3C1CB927BDD6DEAA3B5E68A7399A05BBBCA821043D1DD32F3D8DDE103DFEBE07BE57AD803DA15821BD854E4CBC563E44BDEC20B8BCF69C54BBB2FBF23D01E775BCCE4683BDEADC7DBB87AD6A3C1A6B47BC1E5687BC8DC0863A11D6B2BCDA80F2BC3BD7A5BC24F77ABDD4498BBD205572BD1FEE9CBCEC0C4DBD4711213D4078B4BC4F84D93DBD7492BC5772273D39D562BDAC28A0BB8C5583BC19BC15BD98D40BBCAC117FBDEE1E323D0785B1BC51C342BB2553673A849534BC809C36BD06EFF9BA1B2A09BDA4DCAF3C84F9113D647344BDA17A913D07A13A3D303D0B3DAEDC943DE64D713A6B8524BC1A7B5CBDD7880EBDC090E13A3527873C12383B3D3F357ABD5B3591BD991A2BBDE8E4383CB45CA13AF1E24DBDA45DFBBBE75FADBC7874313D9B78973C8B59683C965C013D203A7C3C38BD873CDBB407BD88352BBCA2940B3DB449D03C6B8ECE3CE1609F3D7C7CBA3DA8EAB23C1BC54E3D9C5C6BBD2F2200BB850DE7BCC8CDEC3B70D572BD7FEFE73B19B16B3C31E941BC9C733C3A59924D3CD37E8D3C5BF8DB3C1263FD3A9C430CBC3C821BBDEE1A70BC2EB78EBDBE6EDB3CE0E36B3D4B0A433D99E3613D76C10EBD6B8A3B3C92D0B73BBCFFC53C926F00BDB217F4BC00519C3CF589053D35A2E23CB3F941BDDF02C9BC1285CABC53E382BD0436E9BB6DD35BBD9E4B76BC8C03B93C5E330ABDE540913D09C092BDD521793CA19531BDD43B113C9CC7943C65A7E7BCE24838BDEEA963BD6F16C23C74875D3D2573573C91905BBD59ECE9BC5DAF343D06EA2F3CDB90B03DCD0A8F3CCA460FBD34A145BCC2C814BDA658FF3D72BB873C083D8CBCF90D8B3D677FA53D91DE8C3CEC9FC43C467BB83D8D99973C4A5472BC34145B3DEFB491BCFDDA01BD2C739CBD0D0347BD34E01E3D6BC2DE3C4541033DB22A2DBD1B7914BD08FA343D71A24B3C1BE799BBA571263D3F7402BDCD7ADCBDF5AF843D91347D3C5A8023BCCB726EBD41E5ADBC629D33BD0E3EFEBC6B61E63B6529D03936875BBDB48E75BD0EFAF4B91A61E63A44F502BCCAB5823C5CD3E8BCF3EF9FBC35941ABDDB06F93CFCD70D3B7F54A4BD676F83BDC6F7EF3B2A23793DB21A513A920A953D49AF0F3D46B202BC134AB93C2A57AB3D379522BCA668493D9D16123C84AC52BC0143F9BB2A92013DC8626D3D5C9B72BD009ACC3C88EEAA3DED22A6BCB28CD33C769347BD41F7DDBC1CB47DBDC24E873C7B720CBCE18194BC27D3263D74730C3C6675F4BB247673BD3832A43C26289C3D98DDFDBC8CA9593C7BF0BB3D4575CDBCF30FBF3C1B6A413CA3B78F3D25590EBC327F69BD0D66F23C465F073C0EA8B7BCD397A4BD83A53E3C54535D3CC71BFABC49A0F9BCF7F05FBBE5E4293DDAB62A3D411313BCF33A973DAF31E3BCB15189BD32063FBDA910293DF43D723D56A3363DF462AEBD7B070D3D4C28293CB82D84BDF35F65BD10DD8C3CCF822B3D973691BC5C24683D8BEF293DAA2609BDFFCF9F3D649A9A3C7C49283C3034DDBCFACB7EBC47BEFC3D5E520CBB0411423D9292803D7B4180BCEB56B43BFD5E36BD68F4A83DAFAADABB28BEEEBC8CF5A1BCA5E490BC90CAEDBCBBAC213D1A13E7BCA02C373DDA5694BDA47412BC1E18623C65B5D7BB0A0823BDF412CCBCFFD35CBC94738EBCAEF2013DE2DAA0BC73372C3C92E882BCB88ED5BCFD5F113DA5E8E7BBC3D3B73C48202C3D9C9672BDF7658ABB762A323C9F5A10BC837FA03C9C3B2B3BD1439D3CD4DBEABCAC004DBCA908B73D9F87E03B7D2B80BDD386F4BCB22ECDBD287913BDA717463C463A683DB0679FBCBB441CBD70AEA7BB2038ED3D647F9A3D4A6140BD6DAC9C3DBFF23E3C3401D83C2D13DF39157B91BCE33D6CBC528CF6BC8DE0A5BDF08F073CCFBDCCBB823F1EBD2ABF883D863697BBF2BC46BC0EB78EBD3C856A3BFCFBD7BC3E9199BDFEA33FBDF921C93DE29C3B3C53CB71BDEB7958BBCAAAC0BD9B799C3D4EAFD5BDAFBDE3BCC3546D3DD0CF97BD1EF872BC50D0053DCF2484BCD21E083C,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:13:03'),(10,87,0x37CF5CBCC20D8ABCFC36BF3C8C9E913C710EB03CA574B1BC890FDF3B3931AFBB25559E3AB65664BDDF8CBB3D84D603BDA18D19BBE3931D3C7F65883DE2F1C03DD6D095BCADD42F3D0384A33CFE45CBBDD024EFBC465019BD50BD8B3DC2CABCBB245A92BD291310BDFAC0E13C6025033DC94930BD0703433D35B1843DFBF32FBC76BD523DBED15FBC15C80E3D2DD5C6BBE845E7BD9278BA3CE302E4BC3623913D64EE293D48A5013DD9533BBDB3E828BB75158CBCE5DE413B464C673CA1AA6CBD4B6832BE255ED0BC0D35BA3CFD50A7BDA54B21BD8A9E01B94C8696BC926E463DB6A99C3D6902E93DE43383BD1ABC0D3B074812BD2AD42C3D660EA1BDB7A923BDAAD6F1BB20B39ABB25D4A43C4AA69C3DD408393CF334133D24F45DBDD1604ABDF559723DBE9E043CF1A428BDCB42BD3D45CB813D077F87BCD32AB43C1245F3BC71873D3CFFE148BC3F2F5B3C9C1E73BDC41F133D1DE5EF3C667849BC034E823CC162A63B42C98A3D28FB3DBDC8ED71BCC4325ABC16014ABDCC9092BC80180EBDD2C087BD4640A6BC0CEB77392AC66BBDBCEB0C3DE3E17D3C5F6BB1BDAF689A3B2178073DED5ED03CD7B9A73D3A4DBFBB2F733ABD8FC5043D90839ABD5DE3DD3CE0F723BDAFA8313DBC33DBBCB085203CFFB7F83CE12AA3BDD0BC7EBDFD2FD73BCBD5FABC1BF736BDC7CF4EBD95006A3DE2BDE43C5428533D58AC0FBD37A1563D0807183C4AD73E3CB68E9ABCDFBA7B3CCF67603DEF3FA2BDC70FB5BC50FE0CBD82AABF3C2AC311BDC71ACA3C4E128CBC9E8045BD096886BD8BEB933C063A8C3DDE49E8BC3FDA6F3DDA259F3D5792E33BB523D2BCF20A813CC3E439BB7428933C70C4B33BAD41BABCEAEFBFBCC9D8203C8849EF3C55EABABBAA9A3B3D0AACAEBCD0BEBABD4E31EF3CF926A8BD1596EF3CA89C56BDC85A773D4377C1BC8452B83C05DBA43CCB3565BC3A6C803D95B6D43C6BC7313D6C52963C3809C23CD752A7BB4A056BBD121170BDDD9490BDAE6915BDFB3A2ABDDF1D01BD13F9A2BDCFF98B3CB8B621BD0A62E13D2F10283C9C9B123C193359BD7A74ECBA6A67FB3C8A70DEBD55AE4F3DDFCBA2BB21577BBCFD69043DBDF9173D38947D3D3E73BEBCCEB254BD5D1D2E3CBF46E938F07A353DC4F1E23C4BA9BDBBDEE73DBDEE9C553D29EA28BDFC67CBBB7EB71C3DDDDF2ABCC6F4B8BC93C09A3C9520153D30F7C43C6B63AEBC3DBD2E3D20D51CBD080A08BD3838BBBCAC7B6E3D188177B9CE07B33C3035923DAA2A833D5E8BD93C3E50243D60D6043CAAA1CFBB4B65D53C1DFFB13C85D51FBD581F0C3D47C4773D226716BD49CC21BC176B12BCFF4A32BDFCD2BD3C5368203C78A195BCA82C083C1D72B7BDF6AF293DEA4827BD602C96BB5EB7853DCB2413BB857DDDBC61349A3D86981F3DC3FEC4BC105C4C3A182177BC360401BDBCF5BD3C9FCCF93D0B562B3D403F283CF6C719BDA4B2473C31B11A3DB2915FBC48C0AB3C19F282BC5BF1D3BC4C8D48BC88A2063DD001C03D8007FABC8E32CABDA92294BB2799C3BC5EAD02BD5052A2BDEC580EBCAE4225BD2C260739BECF33BCC8FEAF3B21A919BD564900BB0921C73C80AD3F3D6B3F223D5E746ABD163EE43B6B018ABDD12AD63B37CE003CFDAF7FBDE08E35BDD35A7A3D47F8B43DBD79173E6CB132BD9A573CBD4C8EF8BC8AC9F83CE5F1F53C642F6D3B3A40B0BCB056A7BB43930D3DC7462ABDDB042E3DECEC133ECB5B593D59DDC6BC0E44CD3A4756FBBCAAEA47BD1A81C2BD3979D3BC17F42ABC9C9ED1BB4A4326BCC895793CA1DB8ABDB5A2053DE7A5BF3CE55D093D6BC4A13C47481CBC562588BDDA42323D6947963C96C99FBCDBD962BD2F0020BD7AE69CBDF73DD8BD610016BCD2E340BC180911BDA785113D8D5BCE3C529E42BD075B03BD5A91853DECAF753DC18E86BC49A69ABD7A964EBC5669ABBCEECECFBD6366B8BCF0FBFD3C8F7432BC3AD5223D297812BD403D95BD12722CBD306A173D8727933C4E6D90BCE1B53CBB24A04D3CCF6AD4BCB39C8D3CDB91EB3C1FD5893D36C2FBBC20BCCBBCD0863B3DC4AD36BC9015AA3D20227F3CAC7E6CBBFE6532BDEEAB153DD8D29CBC7C50973DF2B1BB3B5D37463DEE177F3C4CFA09BE67729DBBB2ED59BDC114533D44C47ABC4EF83C3D8C36A63CA132C6BC34A7603CE0C84ABD48C12DBCAE76093B175C37BD04D0DDBCA33A1A3C9F0265BD7C96333D0FAD8DBD996573BC5B49753BEDB704BC056494BDCFF6883C6114D0BCD7F9243D124026BD654BF33CC43328BD8260313D1202A23BA47F2A3DCD2F47BDE792943D8C81643C5E59AEBCE8735CBD8DC870BDE0659BBC11B86DBD42FB833D2490EC3CB4BE44BCDE642A3D0D6FB73C2B340ABC877772BC062F1FBD304D4BBD6B44693D183198BB9AAA5F3D68D9923B5367273DF093F339720D45BDAF9632BDB790D4BC5397093D733112BD927CE0BD77B562BC131305BC2F80073CC2FAACBB50B22DBDAD99DD3B5761AB3C6E836B3D54F4EFBC2EC29A3C84C92D38E58AD13C14959ABCE82105BD55DE18BDDC7736BD5071C53B3412DD3B85DA33BCCCF85D3D8B529639AB2D66BDAECE653D5CBCC4BCBCEE96BCAD580BBCF83E003EA3D7353DEC88803C96396B3DF1C8133CF88298BB465761BD8C56CDBDD1EA0DBCA42DF93BF4DB5B3DCC33633DD680D9BB837567BC5E8ACF3DEF16AE3D1D63DBBC468D14BDA7048BBA03FC0E3DDF9C91BCE432733C73B780BC7962043DCCB10CBDC62EA5BCE079253C927108BD4C53B53BDC464BBDB095383CE42A2FBDCF4DD43CEEBF803C30D32ABC10223ABC15F404BCD32337BD11FD16BD95642EBB433249BD9897253DD755BFB961C9B43C4CC8793D41A850BD07D3BABCFFB48C3C74E8C1BD2777733C,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:13:03'),(11,87,0xD5D8893B0FA69E3D78B4393D96EC02BD5FE715BD5E54973CE3B5AB3B5A38053D279BF23C23F18F3CBB27A53C8A565C3D8363773BB6A4C63C6C79463CFAB7D7BC36518F3CC2E2373D93D7073D883529BD607BADBDBAE5ACBAD0194F3D0108D9BCD041ACBC066942BD0F6673BCE5D82EBDA2C68EBD9799313D6942593CBB0B2BBCC50FCB3C9FF35EBDF6F64A3D10D9F43B549041BDB68630B9018F933C2E8E7F3C399F823D75BD9E3C19F2893DF61F463DC6A1073D106CDBBB92992D3D28581DBD7359753D470014BC26427DBDD33F06BC9317E9BDF15E123C083A4CBD5A4812BC692DFB3DC8459E3D770D66BD894F23BD366A723DEE87C73CA47F7BBCC2696DBBDB8271BDCAE589BCB576AF3BA29A2F3DD551C13BA0772C3D2BBEC7BC1171BEBDE2C22C3D9D1AC5BCD6E8E53CD4B879BAEA64B53D8CF552BC9BF7B43ACB55A93B9DD176B8427BBF3B77E7DC3CA34FBF3CFDAC8D3B7DF2273DA3B284BBE4DC3D3D4EA2B13CEC62623D20136FBDD0C88D3D987D4DBD039C84BDF9AC073DA07676BC2BD7063DFE182BBC6C39C53CF5D62BBDB168593A0EDC8C3D0AAEDE3B6B0D8F3CE431D03CC0403E3B71DC843D4464B43D3ADD10BD5574033C0F2A98BC491DB9BC3D1875BC3555C43CDCED3EBC77F28EBDA503DDBBF73BCEBD0196A93C1576D3BC9FECA0BC01B9793CB93FBD3B08FC153D6724213DA31050BB99C5873C6109503CCC958EBCC3F2C33D8E2AC3BD612DB83CADF1473DEE44A6BD2845A3BC6876173D9F1BD53BC81F983C8D7637BD5CBD983C262FAEBD8418E23B2D81353D6044A43CC9EFC4BCF165223DDED9AB3D08A4C3BCBC800BBD33F2CA3B2A4405BD27B1D2BC5A3DB33BF1A005BD79BD6ABC9829AABCE2F73FBCFC27FEBC79F97A3C1662513DB09E6ABDB2D94C3A45E6A0BC087E78BDE0BC2ABCC8BD0F3D81A9143C5B13583DE3BF3D3CF89BE1BC84AF56BB94F24D3D73D5503D99E0AEBDB58C333DE7D864BB863769BDB132AEBCA82038BD312F083DF1078ABC396B84BD52695BBD8481243DA29C24BDF49F353DE9A22ABCB9AAB03C6C074B3B3E8C803DFBC4B5BC135991BD4FCDB43DE4FDB2BDE955593DBBF728BB867CB33C8A4FEE3C792E4EBDAF3963BDCA6949BCBAED343D5C6D733C187D433C612C283D387F523C1BCD3A3DF83ADC3BAFEC0ABD3E02963D999D2C3CF8C46CBDA8EA833AC7C8243D6DCCE03C5EF189BBF317B0BBFAAF43BDDDDD4D3CBB1137BB3F82953DDF5B88BCCA3EA8BC1CDA703CE906603D80D775BD758DF43C6A4C583C9D29A4BCF3C8813C2418503DE8C2383D49EB533D0C9E23BD954937BC69FF393DC338633B3D1ACD3CB367653D9AD52ABD68A3F2BCA127D1BC8B91ABBD9ADE893DBB8229BD6390A73B730078B9FC707BBDFC1DBF3C377AAC3D0A12DDBC3A340DBDC18D53BDCFC34EBCB1386F3B2461DE3C4D29AE3DE740F93C62C03D3D53770ABDA309B9BBEA8A1FBDAB6059BD4A9FBB3CF323D7BC656660BD095CF0BDF954643C8717D93DE0F02CBD74581CBD4FF61FBC81AD923CC381AC3A9DDDE4BD5EC5F3BC936F7EBC28C619BC3F01C8BC9F2505BD165A48BD3ED5A73DFBF111BBA850A53D9F22923DF3515ABD6217083C91F14CBCAE337BBDE63A2E3D3871B8BD9A5A62BD348F633D2389D23D268A423DA31959BDDC24B7BC025063BC20F62DBDC61254BD5447C03C839482BD653F38BD3B5D44BC878B4CBDD8B6E03C40EFAE3DD0D834BD5529BC3C51654A3B1E1B4CBD21FF2BBD022B54BD72C7ED3C4E1D9B3DF10150BD29CA293C4588E6BC69CE47BD6FE8A03ADD3F573D839F223DDFF0E53C99C7543DFCD4433DC0FE52BD389AB73C2C0390BD529FAD3D3992DA3CD3FA71BDBCA8263C838B8ABC21D3023D0B418BBD8F564C3D01AF9EBCB973083D8F6A5FBC544CE73CEF48A63D7234403C5B13DEBC1F7315BDAF992D3D75C9903CEB3D2FBB84402EBD3A40FDB83BA9EE3CD86303BEC501E3BC2091CBBBBDB22EBC033B9DBAEB2A043BBB583CBD6565CF3C14142DBD25A0683C532289BA21FD8B3DD8F48BBB99FCC4BB6142213DF6A551BD5B84113C365C64BD2102E5BCB8B6F0BC3DD51F3D8C0214BC332A0C3EEA8B623DDA0FE33DB1C2803CFFE2D9BD5FBA48BD8F081FBDE58B92BB30C9C73C567B13BC0D4FED3C13B175BCA19752BC2E7C02BD27D12B3CA42728BC871AE8BC87F032BBF8CD4DBC108215BC4B22903D922350BDF7A10ABD13AE113D0C1A1B3DFD5138BD41DBBBBCA0B4813C5A2F163D433ABFBCD9DB4EBDD2E096BC7E10303C6DBD5ABD2719C9BC7EF162BC62218A3D196A00BCC5C999BD9A3383BD777432BD8FAB113D76CF86BC1B048D3D7888023D82610A3D9CDC953C59B2813D87E6DDBCCBFA10BD9F2AB1BD3D668EBC8CBEB53D0F9737BDC067B53C623CF63B0BDA20BB9AE32F3D77F0483CBFB6033C1DC6D33C1038233DD16862BD678C92BC473648BDF40C043DE9A984BD94918ABD1D3EC2BCC1F1EDBB66A903BD996602BDD82BB8BAFFE422BD794886BB7703273DD2235EBD95E58EBBD44AA73C5F6806BDFF435A3D73D84A3D3756163D7864A53CBCC530BD6CA146BC531EE03C00DC2B3D0C4FEABC73C3CCBC91C8EE3DC32CE23BF211773C69D6703DB8B23C3C61C40CBDAFFD113D81C389BDD7B78CBDD48C0ABD561C0A3D434FACBB58D442BDCAB55ABD54C7AB3C0AD28C3DBBC410BDD356023D3C46ADBDF4B5BC3DE9DF2D3C305C0BBD0360813C0F620CBD296551BC4D19A8BC7D44E23D5A5E9ABC07A1C83CAE43033DB7D9C43C7312963C4F29953C5D7A67BD46F1843C29075EBDCD937E3CF5B3ACBDB543D9BD873A0EBD14F7EC3C49E4043D5F06C8BC422826BD17F5C43C6550F0BCA62319BD5E37DC3DA4101F3D8334C2BC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:13:03'),(12,127,0xD06087BB37F37E3CCD8E42BCF7EA203BE27172BD0378313C01C1E23C2C2D2DBD16CB89BD458B30BD4843053DD3B9D1BCEF05483D5CE0BB3CE92F323D39FE393D18DD3C3DC25B8B3CA28FC63CE1BC95BD6D7B083D2FA291BCAD31EC3B0CDC94BD5332C53BFA516BBD2B420B3C000C043DBAF7B7BCE30735BDCD3A293D9512063DC072243D02A0C7BBEDC6573DDD96513D49FA963CBC5D443D14768C3DCD01183EEFA8963D992C2A3C9132293C88BFBE3CDF2746BD0A6B833B93B5A03C520386BBB308ECBD9E1B39BDF6DA163D72CD4BBDC331103C15E8273DA61FB33C18A0243D7FECE93DD15D803B46E03F3B181BB53CE78924BD52D5323D9739E8BD5A79223C9AC4A83B5FA14CBD469CC3BD478D13BD824407BDBFFA5A3DF5F790BD75740739EEF3393C04399EBCB9AAD5BC9747EE3ACF99A9BC39DB7ABD7763FBBC21F505BDF3F337BD5D312ABDA0DE4ABC8751B6BCE33954BD658AB63D91AAC0BCFF86A93C5B91E73C0802CC3B3AAEBDBC4D3BBABA70AB94BC1FE9C93B9139D5BC6B06B3BAA8BB1A3D7CCC84B909EC063C639314BD05330B3DFF06C83CE62008BB3374FF3C34F7B63CD744353C8D76DF3CA79F543EA0FFA23B914CECBCE65A46BD8F72503D1DCA9FBD03B091BDB81785BD34E5CABC7DB4CE3C26346CBD0D8882BDD43336BD6F8418BDB0902A3DC1FE13BC9399C03D3EE9853DD9A795BDBA5F5BBD8AEB46BDE51E7D3D5E5D75BD6E4F723CA3433ABD9367683CCC79DC3C08A7973BC75744BD8AECCC3A4810703C33C286BD8E8BECBC0CC001BDC88DBE3D65F8113CC61E433CEDC0E83C4FE4CE3C5E34373DA927293D8EB7A1BD4814063C46FB8E3C3D8E523DE7DD53BC2F2336BCB540FABD00D658BD31388B3DB6266C3D9849BB3C1C510ABAAEB769BD7A2135BD4DAC4CBD0ACDF7BC5587923C5D5C68BB23ECF6BC2E0D7D3CABFBCCBC558F663D558ADD3CD37CE6BBAE7703BD9653293D3F2D363C81B16CBDD2D2A1BCECD8C1BB05CA9D3C1A3B4FBB03F2533BBF5929BB6FBB97BC1A456ABB2B88B23B9FD475BD8C5A92BC9367193DA01B32BD6C758EBC106CE53C2E92963C87F4823B3B043F3DB5BD0BBD448557BCE2EE81BCEB03863A66C01EBB1CAB853C916CDB3CBDCAA23C36B8C73D780773BCDF57CA3CD80363B9B320783BA265A2BC140CDCBC4EA6D73CDC0CA53AC281943C3E63C53D583AF1391BBB2D3C1403A5BC3BD1BD3D9ED18CBC27DCBFBC01F603BD70D4BDBAC9DDB0BD0C0896BBAC6486BD15F7C33C839843BD675F713C96F989BC61A821BD9D55B53DDDC2843C4114EF3C27FA5C3B57B9FC3CC73961BD2CE8563DDF94CFBBFE0737BD141EA83A6E22853D50567F3B818CD73C3B9D4239551112BDDDC8563D8797D03C14352B3D6165CD3BEFEDEF3B67499A3C8BF17F3DAD55CEBC5E69C6BC0AD48B3C649132BE1BA5A23C5917363BD51DE5BBA85CD8BB98FDB1BDE360CCBC505C603DB43E283B7C96E23C6668003D1B13633D30366CBC023D09BBA24DE6BC2D89173D2733F13CAF8C19BD6087D1BCE3F5D03C86B8F5BD3D1A32BD9D19153C1405383CEE4C57BC024A373C0041A6BD69E65A3C07CB6EBC37060EBC3922673C2F81403D743CCABCD1EC72BC3C9BABBC5A8FA1BDAB78CA3C33030ABD6483A83D932E99BC8770AC3C86B22E3C9DDB6C3C0180D33C02C703BC7E0A9BBD29954BBD77A192BBEAB380BC3337EFBC4D5F0BBD80009FBB73FF073E6AD4133D3F4793BAF8BE8EBCD9F2623B6BC26ABDB0E1ECBC256BD83B225285BD7839A8BC90782BBCDDC1B73B12E7693CF44B993C9DBD9EBBE93CBA3D1D31DFBAF649923D9FE955BBCD3B13BD279481BC2095B7BC566DA6BD903284BDA7EECABB72DE2ABDBF7295BCDC145C3D716483BC1DB4113DD31FC3BC5DA50E3DE6C928BE61452BBD85A0563D577AFC3C8CCDED3C7596B83CF84D89BCF427733D5672A1BB95D9973CAA080CBD6C5EA53D49339BBA011B373C5A3372BC76B241BC9E736D3D3E78923D97255C3D1A6B213DB82EE2BAC9A9A6BCB414E8BC5162463D7C82CF3BF21454BD52C4403D5C8FA0BD4563993CFFCBCC3C364455BD839C6FBD543AE7BD40F66D3DE9ACD33D94AF793DE7A4513B3CC3CBBCFD31CABD18C09BBD09F44BBD55F0163E6C17813C418FB8BCC206AEBBC50E7EBCAF72723CB12A27BCCB30DABBF895213CBEC7803CBF6706BD2B9DDC3CC8CE9A3B30F5B13DB9121FBD47BA9CBC7B1FDC3CF9E36C3D1768DB3C34B6A8BC330865BC06AD003DA4A78DBD6B739BBC5C92753CF6FE243D24C5153D0BE29F3D136A32BDA61134BC7291DEBC809CBABC6057653DA56529BDB6A0BCBDD1B884BD78B2573CC1A64ABDC6834A3DCEBB65BB618AB43B139B0BBCDACC3DBC1D0560BC6020123CC2941BBCBFC71A3C54A880BB7A12F53CE353F7BCF13131BC15094F3DDD87503D915DFE3CFB1E54BDE9A391BDE1C07F3CD6D5E7BC74E48F3C5BDEBDBBA5B598BC490C2FBD4746E73C781CAABB3E059A3D1FCB483D2DB21C3CBB98D53C92D086BCD67711BCB9170DBD4F3304BDDB71E5BBBE327F3CD9C6AB3DBA0E09BDD8E147BCBFE8E03C951711BD654BBA3DE0A172BC46B03DBCF8ADA43CA509183D45D48F3D236235BCDA22BF3DFA10EFBC0DC0073B78324FBD1AC3BB3C6E47393DE60B293C7CADB1BCFBAD14BD2463D8BC63DE32BC31735C3C7FC2043C1E6CE2BC930496BC63BD723C3646A83C0C1CAD3C3E9D46BD8AD1CABAADEFB63D281887BD1C54993C235951BC1E351DBDAF5FAC3C8D3D12BC2E18E73C99A156BDAEF430BC517D293DCB7075BCFA131DBDF013333C3C5251BD40C48E3C8F279F3D3B04C03C0F9105BDB86481BB51794D39167D6A3D20D7953D952CCA3B4A91163D81D03D3CDC987EBD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:15:14'),(13,127,0x7922F83C3E1E4B3D03DA32BD803521BD271936BD741EB7BBEF04243C437A02BDD7367BBDC72619BDCFDC223DEE9FDEBCECB6733DE9DFBF3CF244CE3DE174A43D799F803C50133A3DB5E7BF3BEE2944BDE909CB3C5E155939DC5D34BC05C45EBD72CE283DF18091BC7DA4883CD3CEFF3C9CE222BD94126CBD4935653CB0C9C03C3999563DDAE8893947200C3D92EDBB3C6908AB3CD52FE53B8E4CB43CFB75FE3D3A48163DE7FBE7BCE12AA3BC1E87533D457CD1BDF7CC05BC2E132A3C5652573CB42B08BE3603BCBB7E4580BCDE470DBD389B943CDEEB123D2022353D283EC6BC106DD53D19F7223DE8EDA8BC9213553D4AB393BCFBD6463C656EB6BD78B2B63CA827E13CBAC098BCB1A5CEBD07219C3CC849A5BD690F4B3DE3981EBBB193263D9C89C13B6944C83C6E6C8DBB9E8B923C6A3B4F3CB91B333CF34335BCAE0B02BD1FE4F5BB39D8A3BCC441A3BC62E2823C29988CBD003ED53DC2FB0BBD26EE5F3DCDF0643D57C9D03CB3E745BD0DD2F7BC2B1919BCA3155B3D8C7F48BD15D992BDB390A93C2C4C703C3B17E3BB65044BBD652AE63C38A0803DF70EC2BC700BA33CDCA1A5BC90193ABD60B31A3D60F1D83D8169AE3CB02305BC4E957CBC37AEF33D56C893BD487860BDECC366BDEC3998BB95984E3AC39628BCF2BF5ABD64CD06BD4D80A8BCD0C37F3D4FB9B1BCAB90FE3DD24D7C3CADEFE3BC83A5A2BD66F19EBCCB89923D21D68CBDA599A93BABA5ADBC8D8F94BD48257DBC5E9108BB40BC1FBDBDBBBF3C851C553C5A948CBD96B414BD3107123DBDA0313D7E3E0B3D95E1703D92C16FBC2CD9423D4D3A503DE2AE553CAE6B95BDE9505CBD78B1453C3088AD3D1B6CDD3C58271A3C77C13EBC34001CBD4FFF5D3DDD144F3C8B4158BC1E8E24BD3A0F43BD19087EBD49B153BDCD762BBD8CC8273D06FC05BDF052CABC265006BD5B42073BB07F583D7C1A04BD356B1B39AEABB4BC09086E3DB0DD123DB1E997BDABC206BDB45C95BCD3E8323D5527FABB3F42F43CFF18D4BC873DDBBC7C9B20BCC4B18C3C8CEC4CBD2FF40FBD29F0DD3C8EA2E1BB474D68BCDA11063C3DE04A3C487A54BD86DFBB3D507CCB3C9867093CB5935EBCFC9C233DABC44DBD65132ABD970B843D5D5DA13C4BBE0D3DD10084BC6940153DA6DF0EBD17B4B8BDEDC018BDDA4D823C1879383D2327B83C43F8B7BCBAD5893D9666BDBCF850A33C164EC2BC02169E3D672EAC3D79465BBDE00FDCBDF422B8BBD604BDBDE87330BD74C081BD77FD8B3CEF4C9FBDE75301BD5DB9A43C287E81BD8B37643D929B2E3C30AC7B3D5FB7AF3C78C3AE3C145CB9BDA5113F3DC54AE93CB3C273BD7961273DF9F7B93B879A163C41831E3D0E8BCF3C4E075BBD982AF93C082FFD3CBD23B83C5C62DF3CA4FB04BC9AC7783DD5778A3DCB9EFFBC3867FDBC0B852D3B968BECBDA4778F3D255F29BD1F6EB9BB1EB587BD6209EBBD277014BDAC96333D3EE760BC581A593D849E173B923AAF3C01BF043A22CA88BCB89D7E3C3908A63C25D3E13CB8E6653B375FFCBA6C11483D4CABB2BDF8A205BD383A073DA738DA3CE5C43A3D07C5603C9A32BABD7BD2323DFDFC89BCD9925ABA8F651A3C03F8303DEBAF2B3D763912BC5ACB66BD9BC4393C2C3CA03C892039BD7DD6263DAB4925BD9783A43D22B41D3CCA3D1CBC183F173DEE98B9BB3B8088BD1748D2BC8BFF9B3B6B0AB8BC38EA15BD4407EEBC2D0D3ABDCE6F003E92AF483D1B0BC43C66BF00BD636C29BCEFB569BD12BD56BDBE1E873BC1397FBD4D7DA6BC5F85CE3C0D93B6BC883B16BC9D62BABC7C30023CD770913DF3001B3B026DA23D7A217F3BC10D51BC04A619BDD68E9FBC179960BDC9F9F0BC5AFAA1BCDEAF9ABD724E0A3C0E779E3CC122E5BC8ACA9B3CC9604CBBB88361BA66EFC0BD6DBF64BDDE58873D644B43BC013C583D8C8E0B3DB8EC48BD495E0F3D4948C33B9B793BBAC0443ABC6F1FE33CF6040F3CE9A1A53DD4460CBDC5A14FBD6164203D68E3543D1FD1CF39C18D8F3C789AE13C8B60153D03191EBD37C998BCB684AB3DD7632FBDC377683CED6685BD7B3706BD59F3AF3C8B7713BD47A4973B008CABBDFB71BD3DBFA8CA3D6F046A3D61ABE2BB685AB4BC975F81BD9B47B5BD2C8240BDFC45133E8054CDBA317CC6BC7EC8063DEA0F02BDEECB623BC2CF50BD686AF6BC5AAE35BAF994533C274066BD8F484FBB0384363C09CBA63BCCBA71BC5E31F2BC83181D3D85FD953C01B51C3CFB7184BC51AA99BC509FDABC2FC2B8BDBD2B12BD005EB43C04C9693C4AFD8B3D93D7443DBDA417BDCBC186BCB25111BCCC75EEB95ADD063D4D1483BD7F46A8BD357E2BBDEA14113D09F61BBCBB29AE3C0C5F1ABD4C716EBBA913FCBBE15724BD96EE17BDC55136BBE905C03BDFA812BD0DF4403DE61902BB7176DABC85816DBA8456053B33AE8B3CF2511A3D63DDB6BD240EDFBCF1AB57BBCF77EEBCAA276E3C742AB63C7FB09ABD87D3A2BDA875353D6A1A26BCF3B3103B4D82563DF5B9853B9AAB343DE19B963C5E232C3D943704BD507C0EBDD956F8BBA81C313D69F3693DE5E369BDFF33DCB990A3003DBC07CEBC4A5D403D9CF9A1BC2A5D58BCAF4F1C3CFE04133D7832983DB12F65BDA3FB943D249607BDC87020BC26EA53BCF726983DAC7862BC2DA0733D15BE4DBDBE1DFCBC375B43BDC02E543C24B1D23CBDE1483CAB7EBFBCBC87C9BB7EAA293D7994123DFF028BBC5890E53CFE9631BD49829C3D1B648A38F54728BCDB6E0DBDEBD092BC69CF3D3D1ED6CA3B87EF86BA9410ADBDF490A33C71C4CE3CD81A7FBDC58A3E3D677C8BBBD4598ABDBC4EC6BAF04B9A3C268F063DBB61EE3B539E4DBC28E660BDB7E8353D9A88203DDD1526BDCAC29E3CE800A53D1FC5B6BC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:15:14'),(14,127,0x7E18143DD42C5C3D1BF18E3B84B846BCFE55D1BC3ED4573B32057DBC976C88BC130E8B3B085E4CBD3443873C48B6A83CF424B23C43EA3B3D9308913D1057543D2B0D3F3D0958803CFAD5FC3B393301BD9614FF3B8A1AE1BBCA873BBD900D96BD2CCD6E3CCC9E42BCA6C11D396E8C4DBD0B3E9DBC36DEFEBD46AA9DBCBA49E13C5CD4A03DADA10EBDCFC51FBCA595D13D4990003C7DF5753C6967B43CAC379D3D27E62A3D9F1BBDBC3826D2BC178B7DB9CD1A9ABC0E008C3CE36B4F3C001E2239A9D598BD24E573BC4B8F10BD655821BD739F06BDC8EBEE3CC100B238C95D22BDB4E9C23D7097403D95B7643C9AE4473D60E688BDF2F0C93CB99E68BDD0DB403D62BB373D936D97BB6F8510BD08FC29BA6B32BCBD6A1686BC9A05A63CFCCE783D0691513CB459173B0FC34E3D3158EF3C288615BD81496DBDCBB405BC08E4F9BC34E795BCFE3030BD1F419A3CEA85793C3A4F56BDFE6EA93D121DBCBC9EE5E93C59B24E3C8909233C33A748BC6845BDBB9E8EA039F0958A3D5E51863C39D810BD0DFE1DBC162BBA3CAE9AD5BC3774B8BDCFCDDCBB5C10AA3DFBED73BD444996BC7B6E26BBAF2CB2BC157E883D54E9563C0C9CAF3CA434653CBC8483BC017CE83D67FD66BD8C7135BDE9D69BBD0177A0BC483D883CBC61BFBCCCDF1DBDBD0A23BDE745A2BD3346873D220568BDF10A833D19A95ABCD16B18BDEA9B7EBD0C227BBD835F953D01F3A9BD3DD40EBC1DD4BBBC738B5BBDC1785C3DC3FDA0BC2AA1C2BCD0567D3DF1B4593DB98A4DBDE38887BC68251BBD1096123DFADFA43DE0B4F739EADDA73C718B553CD872483DD198CA3CD009B8BD489F52BC1834443DFD75513D2E6D1FBB0D8E94BC830AA93BD953F6BC8D1EA63C90370F3DE967243D0321AABCBACC16BD23D534BDC6AA47BD226144BC11C4773DB03BCFBCDB3D34BD3D18F8BCF39B12BD4F27D03C6498A1BD914A55BCDB91CEBC852AED3D5F7932BC74BC72BDBC0EC1BB39F88CBCA68A273D5E472DBD5366DCBB7C3D23BD3D4B05BBFF5DE93CB2AE163D3BADB3BDA1D6463C63322D3C93A025BC2827243CE08FB8BC942B7A3DCBCE3BBDAB41893D186B8A3BC02289BCC8D6633C4C7DDC3C0B2D50BD658B0CBD9F41173D7C37683CF3EBC63D611C19BC98CB203CB57A163CF10992BD7F6D09BC191D143DDC9F873D47AF663D0EC12CBC9F85A63D157586BCE4FA423C4223DBBC8F2F3B3D59ED413D31548CBD3605A6BD2A9B36BD8DDBD7BD5A193BBD181302BDDCC7683DBF286EBDB0BB843B79172F3C62329DBD8AA72BBCAF8C323C205A093D229BD3BCEBF8CA3BEE6ECABD1A26AC3D294CD83C0C2B21BD4206D73CB122B2BCBAC4003D9F91883D688B1F3D57F125BDBFAD283D6A0C85BB9005D6BC53E8903DDE64DE3CF241053D920A353DE25A35BBBD4875BB21C1BC3C914E9EBD40BDAD3D0FC449BC9F00A2BA017AA0BD99FA02BECD7805BD713F923D68915CBC3C42DE3C13BE0DBC04AF873DD44B16BC24EF03BD791BD9BCEB2DA8BCC40F67BCF65031BDC3DC0C3DDE5EC23B06C4B4BDBD0ABABC8372313C76B0D03C42FA223D5B03073D5CF251BDFA1A203D579925BDB0E513BDFBC55FBC9FDD143DA17E253DAA2F4E3C610390BD28DE403DE398BBBBCBF61BBD2639923D894EEA3B034FCB3D6EFE97BD0738953C50B1553CAE6ED43C3A8525BDE5F951BD412CB73B3831FDBC6E6726BD571B21BCAAC5B4BBB151003E556FB53C111A943C09C00A3D73508ABC2B2E0E3D28D295BDC24442BCD82384BDEC08AE3C7D99BDBC6CD57D3D39CAB7BC863201BD7165BFBB1773123DA66003BC22B3203D6FF2DB3B1A5B59BC80F483BB18AF77BD94CEB0BD96B2103C331305BC9742CBBDD52A1B3D7B6E693C458136BC83E2803CD24C163D56587F3C583589BD56648ABD7294533D7D5B25BD19ACBB3CD174373D97CB273D7AAB573D73FC073D790C093C91AAC3BC6FCE2BBD9621ABBC7079863D11D676BCF58F6DBD7A24C43B19D66F3D6EE0C23B27CBF73AD036203BA49CAA3C1B7675BA17BDFF3B5DD8B93CA4EA5CBDC5A2E3BC1E8B48BDF6873CBDD65ED0BAD57B28BC36A4223C8AF448BD5225AB3DFF75CE3DC91197BC1920223DF6A3F9BC902FD7BDAB6EBF3C139585BC07C0B43D715C563DD302BFBC4D8DF53B67BEC7BCB787023D342667BD2B5503BD63BEFDBB4A00653D62BB4DBDF72F173CD0F6683C492C4D3C6C381B3DFD7744BD501A8C3C926F903AFFC2903C64F064BC9A958FBC3FB28BBA6AA6A2BDD6F388BD1F77323D1592953DA24C213D282CA33D90F510BDBDD007BD6E17803C9D28C23C5525E63CD3FF75BD569B26BE57D344BDF0C3723D320E9CBC402914BD377F80BCA40AE23ABE8893BC7A50A63B670FDABCCEAEEE3C42DFBFBCB01ED7BC5314573D0E3EB7BC4FD92DBC03D164BBC031EFBA0797E23CAA94003DBD93B2BD5B3AD83BBFE39D3CFFBE3FBD5EEB1EBD5328033DC48E83BDC1C7CFBC3CCC743C9AEFEDBCAC9B7DBB3B778A3D462C853CF0BEE43C0B0E3F3DB0AAE83C3B412EBD374F0ABD36A30D3DD7D5893BA695243D8ACFE3BCD172A7BBD36C5ABC1BD42E3C96DCF83C38C7F0BCC6F8653C643D813CD4B4AFBA0B15D83C343C2BBD3C62503D1B2A00BB0847013D86C694BC8E01AB3DF61858BD1BB8B03DA61DC9BCE5143DBDE8D8AFBD4B42C33B1018293D7C069EBC237902BE795F79BC0118843D9783FD3C2F73A1BB3DAE82BC3997B03C43A1B83DB3C6EBBC74DB50BD8188A1BC197582BDA7FC813B561D9EBCB5BAA23B1B0C95BD433EFDBA2D4F153D2B6E4BBCCF032B3D98042C3DEA25E8BCC03463BC2B14513D1A8BA83C5656123DDDE4C1BCBEBFC03C6696353D7FED263D8E1187BC6B880C3CAC8AF53D63A966BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:15:14'),(15,122,0xDF0A5C3C0BECF03C44D78F3D693524BDB30F813C2C54A6BC0FD2973C3BA2753DC76B9E3D95ECD73BD9CD653D0BD5733D37EB003D88928C3C06488E3B07CBAF3DEED3453CF6A3923BA558D23C537A69BCEF7345BDC65358BB6D76B4BD1079A83CF742C9BCB2A777BDDFA7DCBC2ACFD63C20E3B3BC69A0863D057B06BB9E661BBC1E85E2BC2A09623DFE3F55BB1DEA443D30802ABB9FF6C53C52EA163D0AA10DBCB5E4B4BB40CF2A3CAFF1953BE02431BC5B207D3DB659393DED41A7BC27572DBD32B2223C834DB63BD411D93BC866E0BD151A09BD38312DBA09A590BCFF0E263D1B218A3D305C403D7EECB8BCAE77B93D5031EABCA91FA3BC130CD4BC564125BD42738DBCFAB57A3D441B913DCADFF83A85AFBABD6571D93C14E55938798D6D3DB07C12BD00DA403C4C4AC23D658044BB7FC4FF3CC32FD33C7968443C687055BC4E561ABCA4D210BD536F7F3BB92B94BD1D6547BD5FA3D43CFBC02CBDCA6854BDDA9ACD3DC2BCF73CF39E4EBDBC1750BD1B4EB7BB8C70133C0DFB14BDE318CDBC6DB581BC3AC4003DB5A280BCCB905DBDE802EB3BA5E28D3BBFEAA93D69A91ABD3828753C1A271FBD14A4A33DA1534C3C4B687EBD8881A23C10451CBD25241DBD6B8FCA3D338110BCB9E0023D0E2117BDB44386BC6CD8B2BDFF6C0C3D52BF183D889F93BC5E8BB73D4B2FC13DEF98B7BC26894E3CC43EA23B496698BC864F9ABC60C06E3D8500853DEE66B03BD2D60A3C2FDD0EBACF16AA3C5A98783C2E0487BDB0FC1E3D5EF78B3AA49D583CC112D53B7F78603CC81C07BDAA24C13C09999E3D8428213D05FD1C3B51B7373C9D50CB3B0F92663CFB899ABC3732E0BDFCA57BBCEE9C93BD73B8A1BC67F0BE3A46BDBD3AF07F6C3D25CAA83DDA22283C3BE6F8BC980B0EBDA98C8C3DA7B81E3C98A8B03C18A42E3EF69E69BD97AA6BBD54D98A3D20DD923DC396673C704FDF3CFB91883C9F46623D3C75113D8419D9BC39F0EFBCDBAF0F3DFF97C3BCC2DFF1BB7F52153D2D01983D8D782A3DEF6621BD1FD583BD5F69323D92F9603C1A02A03C5246F7BBE47185BD71C12B3CFD0CC0BDD281D23CA35BA03CF99B58BC110C553A43E899BB343D8A3C75925B3CBF3CAABA74F8ED3CD8549ABDB1D3233D32254FBDA1B9D93C90EDD73B78A136BDFAC57ABCF161B43D8C9A26BC16403B3DEAC42B3DE3EB293DC2A7873D1713E3BDA3DB043D810F48BC3685883DC33EFE3CE5A4153C5425A4BC30E31A3D9C828CBD21EFAB3C199E8C3CBA55C93CA3D980BDE03DB7BC7FE67ABC18767ABD3B1A42BD9B9560BC3FF4063D67E8253C81B09DBD0E162B3BC5C62BBDF6534CBD4AB4DD3C243D893CEF74CABC5EF17C3CC18FE1BB0044FFBC99D84A3DF9E673BDF1F463BC44B2DB3C2A66F73C7B5D3F3D65B5FA3BD56A8B3D015DDB3CA3C053BDC173ACBBFC069FBD8423CB3D95EB7A3C1C82D5BB22E32CBD3A09C8BD5036183D0A6AD5BC833837BD039E6EBD0E5796BD0BDD473CBEEA63BD352B5D3CE62E7E3D5162E93C094F39BDCA7287BD01DA0F3D41CF6E3D784E24BD7ABFEABBB0968CBB793E7A3C99E7923DC22EBE3C6B38EEBC3BACE9BC0B61823CE07A203DD2101F3D903088BCD55F77BBE336FEBCC35033BC47D232BD8BED92BD0DFA25BD52B0A13DCD165EBDC386E13C457FABBDCCEC83BC28E380BD63C17E3DA3C5A3BCD8BF62BD721047BDF6A232BD9BAB81BC76DE573CB7E1ADBDBC5CF03DCCD30D3D410AF43C318CBB3CF9C11A3DC115903C911742BC316878BC37E525BCBA2E31BB37039FBB4A526C3C499FADBD353A81BDD922833D8250D0BC3EE603BD8B40C63CDE49883C52771EBD1D2C8A3D9D14223D2E143C3D040A19BBA0C0CCBC7CD69EBCBFBD133D973C55BCF0C52E3D5EF4F8BCCF8B0B3C8E76BB3BA1FAB2BBEBDAFBBCC30B0B3DE528DD3CCB1153B950A3FDBDF8DB17BC5D4C613DE511A43CCDC675BD306ADA3DB81CA4BD0E54203C5379223CDCC47DBBDC59093B37F4283CB696DBBC7C9E503D1FD5ACBBC1783EBB464BF3BCFAACE53B2BE1003C64DA9EBB01A749BD5F7D3B3B18E0DA3CF9F41ABD7CEA0FBC2F0FFFBCDFB0D1BC77190EBC4D709C3BAE55E3BB27D5F43C3679B73C72C93C3DF98E3C3DA49D27BC0A3D7ABD4DC60F3D72E3753DD1C78A3D025F6B3DF200333BCB378B3D21DD443DA0EE7F3CC058E03C036B91BC1EEA243DA7CB133CE5CB473C506AA33C065170BDE68B41BDF9CAAC3CF45C943D2A16CBBBB8BE763D154FE8BCBD8A0C3DFA879D3DBF4CF6BC93F4133D2A23DFBC2793093D7E0C5F3D4E1B37BB3233983D12A9933A4F19F43C6D9463BDA1DED4BB381747BDD267BD3C3D093EBD421D053CFD5A97BDDE37D63BCAEBA9BD900B803D57D95F3DCCA92ABD9978303DAD0BBA3D32D59CBCA92FD43C926B3EBB059AC9BD9E83B93C6477DCBD450D95BBB8A9513A248752BD6F4652BDCA7C21BC940DEC3C059C06BD2F6145BD1892443D6458BABBB863723D7D269BBB4956ADBCAE5F483D9F001B3C24361CBD7900FF3B5F85EE3C9CD4163C85646D3CE3A00F3C6951B83C5AF13C3D086B69BDE464CE3C9C9F80BB7867BCBD3980FFBC8213553CB145DEBC258321BD3973ED3DC0B80EBDB76FD83CDC77083D0EBCF2BCB0BBA4BCF002903C7713EEBA868947BD2917D93DB5249DBCB760B5BCF60249BDDA42A9BD3397543DACAD0F3CA01B18BCB26E083D6446FF3CB3F6E83C2F74073D09DBBB3C863053BD4429003D8550B5BC73B0B5BCE1AAA03CE8C6A6BC0E1C1FBDA2C3B1BBF3B582BD7B32FE39FDBE81BC4F3B4EBB527D3E3D7FE16D3DF9D6593D69017FBBBAFA2A3D91B70D3EC3BA90BD342920BC827383BCB003E83D9B89C5BC79423A3CC51F82BC13D63F3D53BA9E3BEB9F59BB,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:19:03'),(16,122,0xF014053D154A03BDFD5E083DC2A64D3B2BA006BBB4D0153D9A726F3C571EDD3DDB15D33DF156A9BCBC66613DACBBCE3DE23C0DBDE4313D3C047FF63C46FD1D3D029BE9BB080A14BD1450843D57AFB0BDE7EC46BD639A4339FCCA433DC7E5423B9499073D62E5B6BC098A21BD5B8FA2BB8AEBDEBC52841BBC9D7DAEBC68400B3DD571503BE2E0413D2EAB80BC3C79F4BCEF8535BD907E7D3DAFC2E1BC2F36313D0A095D3DE168C6BC731C3A3C9B2E17BD81737C3CF604243D269527BDA5C05C3BF8A534BD593D8E3DBB81A6BC85C551BD6975B0BC64AF8CBD6DC5353D503CE03B0EFC853D2F97593DFD32CDBCDDF4993DAAB97F3DBF9F893D9A96BFBC79C5213D62C732BB719403BD9ED4AD3D59CDF43A964A593D49D2B6BC41F6A33CBD5DB73C9D0006BD483345BB2F7575BD4C842EBD7B43833D4DB741BD197182BBD7CA1DBDEA99D33C59C0B9BC746E333C1678EABCAA0530BDCAA5893C23AB8FBDAD55A6BC92CC8A3B7EF5393D7B3B8BBC1D8F1ABD3C995B3D54BDD53A4EC00E3DBE0BE63AB4B5BCB8FCE3CB3CC4C5143C30CD61BA59BB7F3C671EEDB929B9083DDA72FDBC8296933D2E639C3CCC955E3D56071FBD6C3BEEBCFED290BBC76624BD92ABCCBD4A3F15BD7081563CDC2E603C58B3A6BCA33EA8BC1163B3BBF2EDA43D5260383C5DC35DBC82DAB13D58B9073E36007D3CC0FB703A4E408A3DFCF6A3BB1640ABBCE0C0943C574E8C3CFF1C033C42A91CBCAE1C8ABB69614CBCC2D1D6BC286BB3BD9D0E7B3DA853923CC8984B3D62D4B73C356F22BDE5BEFD3CE03F91BA87B34A3D2A07FEBB09250A3D97EE0F3D2A86883D4E700FBDCD99983C6AE321BDA4E4EC3AD8407EBD8CFAAFBC0FE447BCE9FE083DB505AC3DBE4E1E3DD55B413D7D0887BD758D1EBD327DFF3C80E01ABD854DD53C1B83EC3D66A849BD6690BC3DB5A6C23D18F9F83C5BF9313D24E71A3DF327053C1366A73D7A9ABB3CAD7B403A87FFA7BB0CFE863CA05486BCFF99CFBCAA6D44BDA5AAA23D260422BD170473BD25CC7B3D80BA75BD189FF73BB4619ABA282D6EBCDEB800BD038615BDA4F10C3CE9E7043D7E3386BC5FF3853D28E2FA3B31D98E3AA6C6873CAA400A3D4B8160BCA3A7E93CD375CDBC9FDC453D7DE5FB3B136F373C53191ABCE924F1BDE01E423D39BE9A3D3603C2BC48462C3D6A6A9D3DE1CE793DB2A90B3DE92D3ABD9F1FF03B2D7C94BD38208F3C4EE90E3CC549CBBCC4EA3CBD09FB813C5BFDB4BD1610E93C019CA23DFA62843B8B1E30BDDBFD083D2312713CBBD7CDBCE79658BCE1A6543D6F261ABCC017D63D44EFAFBD41E020BDB6F1023DE9F7EDBC571BB2BC413687BC89592BBDE43D4B3CA0B324BD784313BDA54F8B3C556642BDD302B8BC263B593C264ABD3DF845293CC1C991BC7CA65F3DD5D3363C6C7DEF3B3666A93D18D24BBD2BA6863DFB7FAF3C8610943AFC47B93B878320BD1AAE4D3CF3D8173D31673EBDE2DEF83CAFD539BDBE4F2CBDD14BCABD5D0E03BDA6B3943DA55804BCB124C9BB324A4CBD1AE9BC3CFCBA233A6554543C594AD8BCDC7988BDF52E0FBB5E55FD3C674282BD8F5B90BDAEEA49BD05221ABCFB675E3DD356EB3C396F94BDED49B4BC97BC9A3C1EFC1BBE058183BD0CF0E73BC1905DBD0CD9533CC6C0E13B210F1F3DF20CAFBD760DDF3CCC339ABC32EA843DE2D202BDFCF4E3BDCD6356BDA38BD63B29E641BDB27411BDE95AABBBB183863DFF8E953DCFDC2F3D0643443D7BAA1F3C63DB8BBDAF8802BD5613E53CF506FE3C61F7BB3C3DEF9B3DEB1A873DE405E53C3BB7F6BDEF991A3D5E05603D1B3023BDEC40973DC6AAC43C8AEB84BC3865013D65F512BC43EBB43D66AFB8BCE6F05A3B2A757ABC46F4FB3CEA0702BC3752773C58B74A3C203CAF3C5C2DB23B92E2B5BD2FE441BCD1EA833C2B85973C8D72873C80AA70BD32FE03BB2BC116BD2E8E263DC828C3BC12B07FBB746FB2BC3778893BA13CEC3C59ABB5BBB088B6BC98CD363DC402973C617616BDE72081BA0929EFBB351513BD5205B5BC445FA43C5A95FE3BD3C615BD52B526BC0EF7853C56C998BD03FC873B352B6BBD7F40BCBB93612DBB9834EC3C7E8E263D264B793C77A52FBD71F9DABB921B0B3C0C641B3CC1847CBDE950D13D587F5F3D0454FA3C9E3F5A3DEC3A2A3D728AA13A5F6CCB3CCB03C23C6979703D6D5029BB6C14B2BC2DDE323D3626893C39E8163DFA6344BDC363F23C6EBCD63CD5407B3D22A605BDEC79313D03D494BD729557BD8F4CC23BDA56433DF04E763AF96C4BBDE92F9D3B5FEAF33D3685143D378D303DEB1AD73C3B9CBB3B784AECBC2E393ABDD53B40BC88420D3C800CB9BB5824DA3D129DC6BCC3A72ABDB846CBBC411A3F3D3CC3883DCB9247BCCBBCADBD8FD8A23D2C87F9BBF0EBE93B08268D3DF0BA05BD6A02D53DE321EBBC5E0AB2BC6027133DC0D03ABD44F62A3C818D41BD97F3283D10B272BD59AADDBC1E3C3EBD9D752FBD1E7A533DFCA795BC6F4E96BC964B023DA453423C2E75303D2CA1C53A3728B73D6672D6BBA14312BDF0860A3CAF557F3DA8282BBDA678953B7681AB3B78C99E3A981E8B3C91D771BDF31FCCBCCB36F23A80DA8EBC21E0663C89647ABCAB2C583D16CB1A3D0874E53CEF0E04BB08B7573C328C3F3D612322BD19D0073DA2D50B3CFA982DBC59DB56BDA03C8CBDBD5A07BDB028BF3CC4A37EBDEE6844BB9815443D42D7333DE294803CC10785BC78B076BDDD4F4C3DF93C8ABD34018BBD33CB18BDC70D87BBB4DA7B3D3D904F3D4226893C1FB191BD4406E7BCFC3EB63C4827C03D7D12E0BCB5E53B3D551FD6BC26F150BC20F6043D899766BCDEB37DBB4C34CABC8E59913DD7D154BC2E334F3DE378AF3C5F7EBF3DB77D963D05AB683D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:19:03'),(17,122,0x3E113B3D92F7733C5108B53D655C58BD33E87BBC5873BCBCA6B14CBB367BC03D369F9E3D9F9B073D5369B13D0F71B43DDD5690BC576436BB735E8A3CC47B4C3DDC81413DFB4BE4BCD285523C121DB4BBCB77863D2695523CED465ABD2DF3BEBC9669DB3AA16B0F3BE82AA0BCD8EDCC3B9BF165BD032092BC003A3EBD585A3BBCC6FF1CBDFF4B7A3C79C0A3BD651C1F3CD3C2313C9FAAB43D73013E3D6AC8D73A52AB6A3D3B891DBD4B94A63AD46FAEBD2FC6E63CE4B1C03D50B9D0BC3706C7BCEB4F4E3BDF7EAC3DBC7A883D61F5BDBD173347BD0F4C493DAEDC3D3C4FDA2FBDE39D333D7BD3CE3BA70338BD726C4D3DCE1E613CDB61853CDD39433C98548DBB6996B2BC2414003D19B1A63D4A62F8BCF92362BD86A27DBD8125F13C2F46B43C2A8E823C7E40A4BABA51B83D7F811EBDBEDAD2BBEF9A9ABC37BB2FBD8D3CC93BEAAB853D6169E7BCC72A8E3C266598BDED6795BD98F0503CF24BB9BD4D0A913D8FC82E3D7A2AA83BB8F6E2BC4CE9093D9C40BC3B4707923CA108A5BC8FA7863DE6D9563CEFA6A93CAEE5213D0A7255BD4F43893C4EF4A3BBAEE2C53D8A8661BD929F7B3C2709AE3CD02963BDAA0918BDBBBA8BBD80ADB43C7C1FA8BC87449BBCEDE46CBBBDB6993CB27CBD3B84925EBBE6B082BC8193F8BDF53225BB5A15B4BB701A8CBC6253C93D230DAA3D41D7B8BCF71E8DBD34D72D3D223FA63B61E75E3C73C8C93C01D7593C6C34DBBC09382B3D5BED09BD1890153D092487BA284BC6BCFC34A43CCEBEAA3C2905A33CEA3A59BCC99752BCB3458A3DAB70923DB004833CBEC7613D340211BB518E953C724DBF3CCE54633B50E20EBD66C795BCA4B7243CD782FEBCD4FA84BC00D5943CEFB1AD3B8FCFF53D01EF3E3DFFA0B53CD8ECB6BB1ACA293C5D94B13D9FB99A3C45AB23BA466CE63DC9D6E1BB32E1143C98C9F23CCA5215BC42FD8C3C30A322BDE7F6FB3B0FDC023E4F13963CFDF4C2BC43AC003DA191973DB2CEC0BCF7869CBC31442E3D2990793D51B22A3D97B755BD8AD848BC3D6F8FBA8DF9AABDE89E423B9A222C3DE4DF83BB86F997BBE72A00BD750E27BC1F25713D7E61C6BC6269BFBC52E926BC93FCA73C24A43D3D87C6A2BC11463F3BF412A8BD12BBE23B3BFD723ADAC05F3C27757F3CF8149BBD1DCC4ABDF9D2903DFB31A03C05A7423D0C113B3DFDB13FBC19850C3D39FA39BDFD5B133D855563BD81DD0B3DF33BA33D6F53CBBCBEF09EBC3D95A23C35C0B1BD8446D4BC87E36D3D810CDF3C165763BD1D16B4BCEDE23CBCB1B087BD36F28EBD6D3D77BDC1D6C93C5B56AD3C65B909BD425C22BDE9C282BDD68306BD5495C33B88E1133CF0236F3C4EB409BDF534F5BC2D38BABC742E513D480A5BBD0770C33C38495EBDB7DA2E3D370BAD3DD06687BBDBB2383DC7BFF8BCCA9ECBBC05308E3D518649BDCE771D3D0EA9003DD6DDBFBC9AE79FBCC37BFBBDE60A7C3CCAE3903B6C3B67BD5ACCAF39E24157BDB054353D523A68BCEBF255BC3728543CE7790BBDB42A39BDC388A13CB9718A3DDE2FC53C46BE233D45884CBC97CE06BD10C0DF39C9A23B3D017C48BD0C828CBDDAF6683C8A8A2FBCEED3F63C768AEB3C3F39A0BC27EDBCBB448B923B9E1AEABCCD96633C2F7C723CAED97EBD8BB75F3D45258DBD0EF51ABCF766FEBC87A6AEBB8B8709BB410C063E37637EBD703B8ABD369A01BEE7A27CBD2F1EA2BDBAD7EDBC7FC30BBDA4DFA53D5BBF093C7EB0133D15F037BD5D8B28BB7CC6F03CFB0B2CBD0F98F7BCF1CBC63C1A8437BD90CFBC3B838A943C079548BC2E2272BD1AC3153D49AF9ABD7EDA2CBDCB61043DCE81003CAC5A4BBCD6D3CD3C6C2B843CDC64D83D9913A93CEFF491BB86020BBD9C0FA93DB26454BD7A068C3CBAFCF93C3145C53CCDD536BD74F6703C494ECABCD521A63D8E1EE73A6E56023C014300BE6530BDBCDEC7FC3B3EBC103DBEE5FBBC2960B23B05DE31BD14A182BD8B81503D9D91763BC8680C3A27739A3C2F373BBC23C60E3DFE152B3D200F39BD1E10E53C5633FC3BFD9EB8BC47BE693DD03B58BD6B51BEBC204B203CA4AE8EBD43D5623B4E2C58BD9F83C2BCB126523C682A16BCEA1B453B1BCA3DBCA4750A3D778D823C05E5AABC76F10FBAAD6B4ABDE614593DAC01873A1C51903CCF133E3D70D9F3BC6E80FC3D741A823D5D078C3D7447553CC7DEB0BCC5FE73BB5DDB8D3C4B382E3DB4D94DBDE939793C01FC06BB8AE6143DFCAD2F3D06FB3A3DE7671F3DAE7135BD1EDEE13C7DCF383C88E2B2BCB321A13AEDCDC93B275C1BBCF311253C44A1263C87DC913C639809BD334285BCB9F625BCE67BA4BCEC012FBDEF0553BCAD5C92BD2AEE713CB95763BDC5161DBDFADB2E3A9562963AF9EC403DAFCBC6BCC861653C4D92BC3D107B88BC3702303DF98DD2B9A71481BD7720813D5DD18FBDCC4CD4BC989D163D244762BD6662D0BCDD97263DB1FA963CCAEB0EBD986570BD21A961BC4F0D213DB8D7E9BBE547A3BCA6B01E3DFB441E3D39FC163DA1DB80BCA5A5F63CE514693D7AD7AA3C5B9C1ABDE1212F3C51DD8C3D4E9161BD826DE23B2B1A323DC493F13C7E9EE1BD680D58BDDD00093DD97E7CBD0A798EBCE7EA773DE7D312BD9E76103E10800ABD0653F9BC48AF63BDD027DC3C494E623CB75689BD18614E3DA37F32BD7D6F2DBDCFA419BDD7768BBDDBDD9C3DF02AAC3DDC019CBC255DED3BFB37BEBB29711C3D557B203D972F023D4ED00C3D0251FE3CE21333BD0A4B49BD3F9C20BDA2C94EBD020966BD8E8CDEBC2AEAD9BC94E84FBDEA013DBDB4064C3C3695263D1ED4003DC7755B3CB4A420BB0BC1663C324DDA3DB1FFAE3B5C7F9B3CD1AC633DD276A83D4D9D463DBC614D3C5D27E7BB2D27DABC202636BDFC7DE03C,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:19:03'),(18,125,0x80FDC63C3933BA3CFE46A6BC83FA34BC1AA84C3C516BC73BF15B513CEB3F033D31CE11BA47347DBC9CBA983D24BD423D84F3A6BD2029F1BC99B704BC0467903DE5B74EBCAEC2CDBB10FBBF3C607368BCF3E6B33CD2D03A3D32F47FBC2D35AFBCEDC01DBD0D4C08BDE352933C76D3CC3C576166BC8B9BC9BD71311C3DC209383C88A9C7BCDD19ED3C336C133D9DBCCC3C32063FBCC40346382634EC3BAA252D3D70E15D3D605A303D5A9901BC371F91BC131AAD3B1F67703CA402863BF805173D5C7A2E3DB4F9C93B00FBAF3B0453C83C3562A73C716146BD6421A03D1FF24B3CF727C43D01A77B3C5FB2D43D3CC1323D053AEBBDDDBA023DABAD46BD0F157F3C2BC0943B2EFB0DBEF56C303DBB7654BD15EB403D2393A8BBE95FA6BD51DE9D3CF2FD48BD179406BDCFC7603C06670E3A9256D7B72F0EFABCDF22303C3EE33EBDBE973FBD7F3095BDFE8B0FBC12E7C3BC2FA29FBD45EBA23A2112BABCE8C99BBCC137293D0C7AE93CBB9941BD31232ABD57E92D3D6F9E34BC237A93BC5129D33BBA3D9C3C3F08B03B7B2E993D633C973C30124EBDA2854FBCED3F09BD8C51C9BCABF2923D1A87953A3C432B3D3E955B3CBCB2BBBC710CB23B416102BDFEAA5F3C2A66BB3BA97869BC644CA3BCA5C8BBBCF2CCD9BCDF021F3C915F7F3D3FA825BDD8BB9E3D7856553C5F53F33B1AC8DEBC53ED833C81C9833B510200BDBE5960BCAF17423D3DFA0D3CFF272A3D553D473DCD6E5E3C1BB40CBC397F8FBC14C274BDB78F123CE139413D9C6AECBAB6721E3DD7924EBDAB1F4B3C95C933BC3D86933C223AEA3BBBBC32BC87DF21BD21C2953D4887833BF39E783D57CFA7BD347B7D3CDF1E1DBDA5149EBCA7FBB33BA4F2943C46828FBCC520EF3B845B833D3BAC333DDCE6A5BD40CB5ABDF2C966BDCB1A07BC0377A03DC85AB33C044EDD3CF013B03D69EF56BC1912B23D33E74FBBE468993C1913EC3C0F96313DED2DA6BDF80866BCAB1C9C3CE7CDA53C4B399BBD946852BDC615453D7E818E3C36003EBD5C36C03AF731D2BBDFF45CBC4166DD3B1F85DB3CAAF0D9BD5882E9BCE1AA7D3C0E560C3C43D6E4BCE24DC7BCD70E193CAA35493D3573A13C53A15E3942C1923C0BE9523D387A28BB0704ACBC3EC1A7BC8DF453BC3BB674BC69A0F2BC79F3493D3599A2BCA6ACD23C0E4A443DEFF4BD3BA8F2663DDB129C3D1951F0BC96D9DCBA338210BC5CA6B1BC7F76A43DDCAAE8BC6942003D6B06A83CBD2194BD34CE9D3D848CD43CE963BFBBBA345ABCBCF921BCD18A03BD37E630BD0C79093D91900A3DD71B94BD0B11153C540E54BCCD2ABDBDDCA86C3C0596413C1B85953D95BF613DD4C51C3D9BA1C0BC1AAA8BBCF0A00EBCE3F8E73DF61E8EBC973FF03C1B64353DB7B085BB2D465FBB2F57AEBB7C62563D3A40BA3C8E5DB2BCF5C7423D63F685BD7388E63D905A713D031D7D3DA8ADBBBD66EADCBB53CFCFBC79266E3C5740D2BC2CAAB2BD4A383EBD93E6DC3D87F02ABDBEAC163DB2A2843DFBC9EAB893D2583DC7655BBDE9C97B3D0208693C289072BC6151B53CCFF55DBD8FAF37BC0A7C403C72C523BDB3C9C4BD325020BC768F803CE6BA4E3B7DEDEA38FBF908BDE10098BB58C38EBBBA5B99BD977B41BD0ECCF6BCFBD4EEBB044B983D1742503DED23143C097592BD0CB3243C71B1CC3C8A1E883D852E293B827F813C65A5AD3C98CE9E3D47189E3BB57DCFBBEBD1993DA7E4983DC99798BC9A95A13D6B263A3DB7ECCFBBD012303DBA4C043D656AC83CC18E06BD117FD2BB6FD22EBBED42B93CB9B31A3D33F60A3DC4DC8E3C263736BD6934AB3DF37C113D38010E3D31A27C3DFBFC913DD35081BCA0481C3D5D0AB9BB4F72873C5046863B4202A03D943A3E3B9F4E1C3D8459EFBBBD72113DA343E13BE69FDFBD7B869EBD24A418BD9340423DA3FC11BD89632EBC00806F3C0FFBF13C39B4483D0DF0C13C76214BBC10BE1C3D7BA0AB3C7AD69CBD27B43A3D2983643D0479573DD1ACA63DD2098A3C4C66003D9D78A1BDCF6FFDBCF8E8CE3C6325433DCFC8993D42C4673DFB10B5BC5AED1C3CF68082BA802CBB3B2A9B993B2AC16FBDE3BE40BCEF49093D6D660C3EB7D5DF3C115A2B3CF28CC8BC149F06BC915E62BB3A7F07BDFF2B083E2B4DF23D6D13EF3C90ED593BC0B6633C1B523F3D7702083C52D00EBCE4FC013DD9E23FBC62CC1B3C2CE6973D2DCCEE3CFD2B0A3CB35BD2BCD20F6ABBDCBBA23D67E6F93C378D56BC481C093C6573E1BCF9DD28BD041DC03A297186BB907ACABC56E962BDB9447D3C8755943DBF8DA53C68793BBDE08BC83B5DB616BDD03ACC3CD45E45BD557FFE3C0D22963C352426BDC947A9BC0AE8AFBC272213BDB2305D3C24725A3D32DDFC3C2859313CB05A12BDB93A053BA655D0BCD049443D887542BDD3AD30BD4792AD3D9104B13D91B6C1BC6A02103DA4CAA8BCB76C46BD1499473D132479BC5AD5D7BCF9D8D9BC78D3BDBDAD11ABBBDAD8D73C278B65BA9435CA3CD9AF713A3F068E3DBBCA55BD8E7A043B4FA548BDB7D889BC2018333B230B263D047617BA07C1323D6D69DFBBBE0E3B3CD2824ABD8A4D8ABC529709BDB22F423CB1E272BD3BFF27BC7897B9BC436F1EBD797ECBBB3C30CE3DF5A8233C7D314ABC58FA16BC8323353D72DFDFBCE78300BD4C44CFBCF3834A3CCB8292BC5AA5B9BD64A6553B13BD9F3C98DF0EBE1970F23B8992043E984CC43C1D3AE9BCD005A8BDB31754BDD293903DB1B714BE9D2C43BCF8BE573DD43B7CBDF32CC9BCB64C5EBC15BE3DBB58DF993BD9C386BCD916293D7BFD903D8864B3BC83C2143C163413BD1F7A55BD1759263D7BA101BB2B35B53912A4DCBDA804473DB076D3BCE623343C831A1B3D8169C53DA0FED73DF21A82BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:21:14'),(19,125,0x382A173C652CF73B49B12A3D98A649BD4172B83BBA4D0DBC345F2E3CD83A123CF9B6B0BAEDD508BD62EC923D89F51C3CF4F207BA6D6B223C8D741DBD63B60F3D710F7CBCACBE93BC7C5E893CCEE6AFBBD77108BC81EB70BC52849C3B712E22BDCA11F03BAE7362BD293310BCFF276B3D06F8DDBC9AE46FBD91BCB33C693F4FBCAB0D21BDD8C7283AB1292C3DB44840BC11E035BC9B46303CE955CCBC1299F93CDE0DE6BB05FA8FBC384687BD59FAD5BC564C883D47D14BBBADF55E3D521A91BB33AA373CBFFA0FBD3258AD3C87655DBC7B08FF3C27E2B53B7F4D443DC793C43C090A8E3D05C32DBDD7DA453D7CD0AD3D17D783BDFEAD323D824C3DBDDFB89A3C32CAF53A37124FBE74408CBB5FCD803CE502803D2BEBDB3CD00B18BD7CA5B6BC338B39BDE09543BDD7830C3CF646A43B1DFC9D3ABC10733D446A9BBD84449C3A206507BDDC0DACBD60CB9F3BBDE0263C35A9CBBB7A3CA2BC46AD943D25FFD2BC882EA63C1B3A183DB11EBDBCBF41EBBCAF6587BB476F15BD26B7CA3C78EE153DDBB46F3BA70B7EBCD08D3E3AE335763C75F87FBB9E4CBC3CFDDB26BDADFBD73B2EB99ABCC9F0533D1D4349BD2D6AAA3DB67646BCEFCC31BDB2F2C9BCCA37893DF0E378BC1B5161BDD22868BCC4F9B2BC169120BDBA7030BC7E35273DDCA353BDB606A83C3333DD3BE2A0293C604118BD14CBCC3C32119CBD7CCADDBC4C944A3D3E5DBCBA781096BCC45B103DE160FA3C51347FBD77AFE2BB84B16ABC853EACBDF066F53CF25C9B3D90B38ABC56CD4E3CE5B247BCF45484BDCBC544BCCA6DE2BB09AB21BD4D0383BD108B843DF1E3923DE3975CBB5D90853D31D990BDAAC9B73CFF5C0CBDD0373C3C5AB4593D91C7273C3FF9A23D0B480C3CAC735F3D6CF3EDBBBCCF94BDEB43BBB9AE1985BD425F08BDB5F7C33CD39E033C4980973C06C5E53CD0A55DBD12321A3D62CFF2BCDE60BB3B8B2DB6BC31DB693D9BCFD4BD4473B6BB52A1453DDF6537BD8B8475BCD0C0E2BC0D08383DABD4573C7204D0BA4D960C3D470B9B3BC59EB03D2500CA3CD138943DF4FEC2BDE5A42ABD9FCAC5BB5EB0403B79700E3CC275DEBD6167DFBCB136863DAEE1DB3C749940BD5971463CB3B1443C6D8F7C3C93D622BC29C7863D099A0B3DB16BB7BC66F22CBD31B9B03D98352B3C352EDDBB589AC43C81B8EDBCD8C6AE3C60D2D8BB0E7A5EBC5AA900BD4539CEBC75C2F1BC1D7E033D0011D83CA5C85C3BEC52493CAD2B5CBD1E98FA3C85104BBDEEE8E1BA23E2623DB8A62EBDBB1667BDAB73AEBD04B6A43DD8B3353D006710BC54CE163D3FAD143D088DD7BDC476FFBC54EBB0BCB0A0AA3C89FA883DAEB7FD3C090F3F3DED8E4ABC5043EE3B55354F3D20AAC8BC96D0A33C7FF3213C8F27D9BC83DBBA3B80BF873CAB39B73C9FDE42BBAD5392BB58F16A3D03B02D3D04E09D3D21254E3DED5E2B3DE6E538BDC4E196BCA979D8BBCF7EBC3DCA66C03B3AB379BD2C51F6BC8135683ACDA1513C0AD2A1BCD5FE593D0353C53B0D0990BCF35849BDD71CB33D35DDBE3CBBEE15BD66B4143CF5AA72BD10C9BC3C0620293D3C08513CB755E8BDA9C559BCE396F3BA3A6F743CBF8EAA3D028A52BD20F608BD423A933DF6AAAFBDB7524EBD402A46BD1A8D3CBC37C8E33D5461CA3C5CE7F7BCBF16DABDEB1C103D610F443B51F6C0BC342F583D4ABED0BC3059263D2E56A43D33D6A1BDFBC4EDBBC28B783DE744233D22E00CBD2101C9BB525A0F3D3A5B573CBCF5183DCA0AF73C3B2827BC1568FB3CE8E43A3D00D24DBC9B94E43C85E810BBF199E43BF05F8BBD0F38AA3C3B61863D7B937D3B0A0C183DED5A11BCE4D84E3D18F813BC78358BBD1A44E33B6C82D7BB75A190BD74BDE23D39DEFBB9FF372C3D4A5D1A3DE4D6683DCA0D5FBC36039FBD32681CBD5D94453A14155F3DF1B487BD9E64EE3AC6B1413B80AAFBBC0227DC3CB8D9EA3C3E6439BDF66E4A3D9B663D3B350BB4BB0C7D0A3D9584B3BBC8A48E3C309B9C3D77E9533DE6570A3D3646C5BD125114BD1BB02D3D5D2D033D37DF893D15DB263DAB2562BD5B7C1C3CAF0CEA3CE470D0BC52EE3C3C4A7820BD347CF7BA6D39FEBB510D753D2E4A8E3D060E7E3C3CEC4FBDEF94BBBC462E4C3C15E4EDBC8456E83D0D6F6B3D5485233D2EE4843CE8BD903CD2CB4E3DCE4A55BDD71888BCCF6173BCE1A32F3C602DDA3C8E16413C4BC6C43C175F613DA4C712BD4220B03C8C7D233D6EC3D13C0890A0BCCAEC7A3C0B7AC03C276DE1BBB4C795BC52055ABDB04940BC7E7758BB72871B3D224BC63D6F07083C0420B4BC35F2953C6CC288BD647A57BCAC1440BCE994DC3B750D433DA8CB2ABD750687BD2488C53BE796A5BC8A57113D8ECB0D3DA63185BBB20E013C5B5A7F3C2F509DBCA554223C9BD6313D37D5B93C853359BD32ED773D7B55923C93F7E73C2EB84A3DEDA693BC66B5A9BD1D66463D7BEDD8BB0CCF85BC65BFCB3A38E6EFBB2F4A8E3D475671BDAB345BBD5141B03D0F37943C92D3893C5E8B85BCC72928BD6FE71CBDB44FF6BC98FD093DD64A683C5A89D4BC9A7BD33DEB10C03C7B88B23B8284B3BD23A60A3DAB03A23C57CC03BDF16700BD6C26BE3C84A675BCFE5ED3BCEAC666BD276C8B3D992AA23B98A69EBCC1AC07BD2A298CBDE21978BCFEF9A9BDC1423FBB5186DF3CC53C7ABCCEC4A8BD33871CBDC3B2B23C10FA14BE4E38E6BC38AEFF3DA3BBCCBBE0B4FFBCA150DFBD172089BCDBCA933DA94089BDC0B36BBC1396D43DCB7B21BDC6F74BBD3FFEE7BC8D633ABD524A0EBDE5A6AFBDB58811BDB7D10B3D2DAFF6BB383468BCC1052BBD358AB3BDF0A058BCD3E941BDA892EABC5D0DA6BD16AA5A3CA05012BC282C703DE243A8BCCDF1E83D56E5813D41DA44BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:21:14'),(20,125,0xB4C68D3C938C34BD69EC8C39EFEEDBBBCB9FF63BD642243CF2D193BCC3FA633D00C7F33D37E8543C32768C3C2EA16F3D2A5E053C4809F93B107B17BD060F963C556083BB067A123D276FBD3C431C233DA7FA0DBD88B1D03CFBDB70BD7B8F3CBC88D5AB3CB5BC85BD19BBEEBB465F503D1D540DBDE9646FBD1E057A3D6B38C6BC937B6DBDE0C834BCC24BDE3C61A92EBDCB7DCC3B336EE73C7C8594BD86505E3D5F94063DAB9FC03CE1C016BCF7B884BCF6A6973DB58AD4BCA2B1013DB13E56BD519B24BD315BA0BC0D97A9BC16D22ABDD07658BD6BDB713DF3615D3DCD094CBD288EBE3DC4D8C1BD5634133D420EDE3DA645883B8D060F3D5A033BBD19A52A3DFB68E23B1C4A2ABE3EBF193D0D4F9C3D90729C3D74A4EA3C9D1E253DB8525C3DAC1717BDE622DCBC7BC929BDAB06B5BAAA2F3B3D2F011CBDD4AB99BC5725B43CB13F54BCC12CB7BDC879F63C3310C13C3E868A3CCB8C22BCDBD8E73CF46405BC99A305BDDD8F793DEB2134BD0A243FBD78565EBC5F927B3B6ADF243D9832843CA5085B3D62574A3C3CC2B8BC57CE023DFD8EECBC6BCD90BCECB85BBD3E63833D4E2D06BC741C0E3C0C0216BD1E62AA3D3DD20EBD76C40FBD63774FBC5EB972BCEE279B3A13831BBD1417C73CF9343FBA5F0FE9BC10E8123CA77F043E0D7AD9BC1867813C13CE953DC286C03C18D1573DC020043C8E1029BDEF3EB2BD07B95D3D0F2C7FBC930D3B3BFD1A0CBDFB0FF63CB2FB87BD90783E3C8A0682BC46D3FABC25DA1A3D47979D3DCEE1F3BBCC556B3CFCD5DE3CB98845BDC00D3EBC4019CD3CBA4C64BC85FCE4BD7F6D6F3D76FB3A3DAD585EBC45CF893DD76A67BDD4F6B53B5199ABBDE5763EBC2FBD673DADC1163CA7863E3D3A4E1E3D97205E3DAB1A8CBBF85597BD683626BDA2DF28BD74BF98BCF6262F3D9485A23CD2ACAB3DEDB7EF3DCD39DFBCAECEDF3C20C298BBBC5D96BCD9F9893CFEBF0E3DFA7D70BD92F3293B7748553CC7DA983CF10AFDBC6F1AC93B4C661D3DD3275F3C369900BC61ABF23C6640EFBCD78B803D488B4ABBBC52313DD4D78FBD586BACBDA6C85E3DA4B332BDFA11833BD3394DBD0EF0843C2708903DD5271EBC13CFE83C5EAF1C3D79C141BDCC0DB03C0B30B5BC866A303C8AB93B3D0DE42BBC022885BC16B0AB3D067574BCA16D453D11D7443D35E64DBA63ACA13913F2D23CDDA1A83C2D3A84BCAEC2BF3CAAB798BD3189813BFA10163CE817293B5E07903DBB907ABDB5F68F3D20F31CBD8F971FBDA38E86BBF49626BC3E0984BD6EC898BD7D7C4D3DB11831BD948E92BBF6D6983C410DA83B89A213BD426320BDD37A583DB8D772BCF4E2053B86CFFBBB1871D13C8A8C493C11BBF83C568D023D28333DBDBB28813D0C782ABDBE960E3DA785903CB482EBBBDA7EBB3D25F4CABC17C379BC81D6BD3C54FB043C4C1CC23DCF3B00BDEC2BA3BC8EECE6BCD07FFEBC0B4853BCE8A7F53CE73D97BCE7BE4FBC8D95B5BCE04C00BB0EF470BDAE3EE6BCE81C9E3D40C717BD7634FB3C34DE87BD9494183D173C28BC23C8103D07710E3CDF30B9BDCFBEB03C3AC2573DFBBFA5BB3539CBBD0DD5FA3C87F42E396FF3C33CD3759D3D890A5FBDDE6498BDB3A1193D93EC04BEE9841BBD6C5B8D3BE0AF163C2711643CD704C63CF27422BDC38CBCBD872A513DDB71EABB26468F3D14D0833D2CEC5FBCFE7B953A11B55C3D104D3FBD1DBC7DBC4312313C2E3E7FBCBDDD563DBFD312BD0063933C4E99473CE44FD3BC542D88BCF62A93BBD92F293D66C8013D289707BDB41E733D9AC7E33B8DC18BBD192802BDED21EB3C80E6933DD9F5893DA0BD3A3D672886BAA872833C1FCE733C922FCC3CA26274BCDD79D4BB4565E23C0B5EAF3D205885BCF088AA3BDA6CC8BCFBC15DBCB029A73C94E560BD26323CBD8F0DEA3C75AB613DFA5BAFBDAA63053B802D333D7B9C45BD014B633D2A0A5FBDE22DA8BC510D023DF1378F3D3C97F33CDE84163C7AD829BB58007B3DAFAB783DFA377ABC8C8B283DFABEF83BB237FABCB713C0BC9204E83C73DE323C9A3D6E3B67E534BC69B94CBC43F61DBCF260C8BCEB62183B3EBD8DBCF88BC73C9B5F6E3C5604373D4DDA813D2DD4283D14530FBD225EA43D920BB73CA2D70DBDB8B1883D4422B43D4703833DB5D80A3D5BCF41BB14A7973C064D91BC8938CCBA89EB103B223E0A3C3B09003BF6AA97BD324DF83CE98C4F3C220926BDC2D5C0BB2DA4103DAB478D3CA2EE15BC1A81023E99E55F3CFDCBFCBC01FACA3CCED64D3DD09FA33CB81CBD3C1FB9353C3C051C3CB1B6A53DE7E758BD3F45813D15D1A1BD3B85EFBC0DFF97BCD29468BCCDC70E3D1E8E443DE69CD8BCF15697BC594628BCE897CA3CA87B3A3709EE8638CE97F3BC4735DD3C17DF403DB75C06BDB348423DAE30B83B1BB537BCF11C913DFF2BB23C014AC83C63218A3D8262D1BC3E5289BCEF75FB3C71BF3DBCAE87C1BC1891743AEF0187BD53A5343D2E22A1BD552245BDEF10343B14DB083C04708B3C199C3BBDB791DDBCDFDF84BD323A9B3C31593FBDDEA2E13C5AE40FBD4068653D82E8423DE64BE13A725DA8BDF66BF83B792394BC79D39FBDCC59C9BD051EBEBC9F92C7BBC4D68CBD42D814BC9080973DF9D367BA5FD26CBC6F98F83BA04D43BD1677AABA7AFAA43B1FA8BCBC6F126EBCD17EABBC523DA8BDCD10F8BB8FFE733A0EEB84BDEAC75EBDBF9F4B3DC6192D3DEB8B323C92B880BD9F5D69BD07064B3D76A108BDC136E8BCF053883DAC3336BC7262EA3C053852BCF11994BD878D00BD1ABFC3BDC16F47BC9290A43DB56BA03C1CCB61BDFB52043DC20B76BD140C90BDD859EEBD33B098BC932D02BD637E79BCBB48C9BCC1DA9F3D12C8983BA8D9283D1F9AAD3D7183DC3D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:21:14'),(21,124,0x9CE6D13C7419E53DFC81D43C3F6DEEBC84C124BD7F749A3C3B2EFCBBE9065E3D68064EBDE41DD1BB3F94CCBC993A4D3D2AF646BC8E5DC8BC468E94BD3A03E83BB6AE18BB6AF6E23C03F51A3C0B58983DE8391ABD739261BA4AC062BC53E868BC3A94ADBD2E18BBBD9424823CE110D93C13FD31BD1C683BBDEA8DDCBC45588C3B27A0E6B985C195BA8C2144BC765481BC14AB0EBDA270593D54FFBABCC40D573D91A5DBBC0D7C893D7C6587BCCB1B55BD5B9A41BCACD7903C1790953B226289BCAE0E863A358DA33CFF5062BC497633BD8B5E9B3BB0584EBBC050683DD7127ABC283E973D7540F3BB9845FE3C22E5AE3DC7CEDDBCF81D203D81A4C0BDEFF46CBC84F08EBB4C5999BD829DA33C700CBFBBBDFCC0BBF05E4BBB1EF612BD42AE85BD0B3D72BDA72EC9BB2DF887BDDA64423D3069A9BCB1F950BDF3BC0C3DF2F91DBCF0A0A33A40E914BDAA8558BC3EFF01BD03833ABD50A71E3DCC1800BC07C8C3BCBA719B3DECD9ADBB9C44AF3CCB53DBBB07039BBDCE8E12BDB77A3B3C6CA5AE3BC7BFE23CEECB50BB0126643DD32D67BD89AA37BC646214BD7FA340BCBFBD8D3CE559D33D123E933CD66FD53D59C3893D84C0F9BC4ED911BD2A1768BDB06CCF3D1973D4BC19D614BBF99E103CCFABE0BDDC6D32BC2F4F0B3D6732643D29B781BCAE10943D4C2D593C7D1A62BC9501023EB0F406BA2F816B3DFA545ABB904BB13C3C0A0FBCB20EAE3CCE47BDBBEB4AA83D5A2A62BDB2E2213D89BA093D254F5DBCD3A7DDBA7B62883D84222BBDB5D999BC6CCCAEBB70248F3C60DC133D7E92F93C8ED1983CF17231BDBB259F3D97D92F3C7C24B3BCD31AC6BA4D8510BEDAAFFC3C8F5DCDB942BCAABB16E72B3D1F503E3C8B3FD8BC016E3C3C802DEA3CCB28483D9DC691BD77B51E3DFEF31ABC64F7DD3B2A0D3A3C200B683C63A978BC440D243D3ABD9D3BE9694A3DDDC96DBD359D3CBB8C1F8D3C19FAD4BB77FA65BC574F84BD651FD73CACF91A3C6A1F99BC0971623C199E323DF33A4D3B87AFBEBDB5152EBC429E193C5EBD0CBD428775BDBD7C84BC66C172BD6AB3BFBDB321E13CD8D334BD217EBCBBAB6C5BBC97DFADBC099F2F3D18D4DD3B5FF8C03C648D1A3C5BE8D5BC5BC31C3BA9584EBD8DEC1B3D3B20D7BC4ACD213B1B9188BD87B9723DC924E5BDCD9CBD3D50FB803DC7963CBDB42DC83CED6A69BC6B8725BD2020BBBC6F0DF53C5D6D063B30A337BB12B6EF3CC129553D78A546BC836028BD479C9F3D91FEE3BBE58899BC315BA4BD8DD3A2BB03043EBC0496943CCA430E3D9FECB6BDE832023D86FA5B3D0CE9AE3C9301B7BB6B35643DA44A33BD869664BCED70393C07DCB03AE97393384DB1B6BA560A983DD555BC3D8A8C113C350D773C5CA27B3C7BC4A5BCBB5CF9BB49321DBD9AE1853AD3F7AABC63CD00BDD4862CBC87DC5DBC08FB943DAB6851BC28E4A23D9904843976D770BDB143513D1914053C4F84573C6CF25CBD711617BDC122C83C0E7AB5BDCACC933BF578A13CC48F05BCEF2240BCC3F1A0BB9B3644BD987858BDF97B2ABB346F0FBD9F2E9EBD90B516BCFFB59D3B9F0A353C2EB8FCBC30B4DDBCDF9000BDEA734F3D93A11F3D3BD11EBDE028DFBC156AFD3D1A88A0BDFF241CBEF97D88BD2C84603C0BAD683D6F8671BC80E0F8BB100B163D78E40E3C4102BC3C3D62C43D615F4FBD6B2463BC72E2533C6411813D0BAC453B96749D3CA1BCABBC4642493D664AA33CDC528F3D932AE13C9F052E3DACA407BCE79E69BDC4724DBBD362AABD280E863D417B39BD513A4F3DFE0446BD5B81B1BBB2B2DC3C3F5F7FB948C0033CD6950BBBBAD004BDB6979D3C245FC9BCB5E242BCC84B153DB221F93BB08A26BDD05A9ABC2C8C7B3DBDC37F3C96059E3D84AE15BDF6BF9CBC648D973BA9F41FBD834437BCE25C693CA33EF43C96BF023D34A78CBDF2DC12BDE01B66BBDCFDF23C2644E7BC12C396BD0EBE0D3DDA3B363DA536D5BD9239EABCD1F4BDB9AE86433CDBA3163DE558E63C3E9824BDC5B40BBD962423BD95AF8139700D1A3D933EA63DC6E1D73BDBFC9D3D46E492BDC943803BF2C9BC3DB954DC3CA46840BDBC0095BBB7474ABBF2CD133D5F5BBE3D3FA33A3D30060ABDF2A61EBD47DDD1392F8608BDDE7FE23CCF6A883DCEFEA53DE65B03BC580D233CF5722FBAAC8F45BD05018FBD970E1F3C1C309B3A916115390AE012BCB9246D3DDF80D23DE2411EBD67429EBCC55DC83CE552A7BCA0A38E3D8848983DB15B0C3D9743F7BD38B674BC75C027BD238DDEBCE001ECB9DBA6563D481C253D3ECBC73DC8D0A23C9961693D6792EEBC8ED41ABCCD8B1ABC5941B8BD3307693AD056F73C4D8E453DFDFF243CA2F38EBC5E602ABCB76B313D728421BD5D225E3CA423B4BDB461383D97857EBDE63C873DC25480BDBC7F17BD93239B3D019C76BDFF4A86BBBF15BA3B638837BCB0EF173D3533DABC30EC08BD83C6033DB91690BB6FC3093DD5AFC0BBF523513D62BBCCBC82D01B3DB3B6853BD0F9953DC4F1ADBDAA21953CDDFE8BBDA23F9CBC103D8CBCC95C813BFDE18FBDF4ED893DCFA7F33C40D298BCECB04C3D3D2E8DBD5760193C7BE6D0BC3E8DBCBCC36CD6BC535CABBCEF3128BD9419DABB3461013D334CCF3C94C7533D2C9B36BD6D31393DC1721C3C8C8496BC605B3FBD24473FBD66FD293CF4E5E4BDEB08443D142BD23C5FD68DBD00AA06BDEEAC8B3CCCAECE3C2F62A43C322838BD5EB6013C1EA55D3DB44D8BBD2A4D703D0CF1463D3A6F96BD62FA22BDBE25D4BC396E103C0AC304BD5F5895BD11B8C9B74A0D4CBCC341F43B59B9293CDFAE0BBD6EAE743D7D37323DE9819F3B6B88DA3B41B45FBC89D0BABB60BC9FBAA3A1E3BCCBB3213DD935043ED947813D4C490D3D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:21:50'),(22,124,0xEFFAD63C970E8B3D2338543DEC4C8DBDD3E251BC28A7B9BAD916D23CC5D8993C58F5BB3A980AD03B8F3818BC3D35123CA17D9CBD449D1E3DFED079BDF3F7103C3593403DA7E5743CE918543D3649373DFC862D3D3FEAB3BC043C553DE149B1BCADB4BABD52B2ABBCBDB0CEBCE8F828BDD07BB2BD54DDD1BDB0F7C0BD44BED4BC521FDBBCF41DA43A27BFD8BC3337C6BB0674E6BDB6D7523D8A30443DC3C6EDBC7F2AC63B6A69D33C3705EDBC272358BDB8A12FBDF747023E28251E3DA88CD9BC7C83173DDA3DC13C0D93593D91A638BCF6F0C4BC64070E3D5AA8BA3CF99D27BB9AFF803D5BE2DCBA5C857EBD1BFE3A3D56B925BDD56D753D514D1FBD31FE14BC93D148BB8228DCBD96B4533D20EA9EBD923DA63BEEF1B73A6D6236BD6B0FDFBC88EE59BCE12EA7BBE57FA3BCE3C6763D603B98BB1050A63D15D66EBC025082BB62BD24BD793B1DBCA96036BDDF5B913ACBE6B63B1FD1FD3C1D5AC7BC0BEEF73B66CA233D21F7833D8647263C1321AC3D52AF5F3CC826373BD136F13C0758103D7FE7A63DBD3CBCBC552D883DFF4ED2BD197E3A3DF3DD7D3A42B9C03D55AE45BDC485E33C1BCB7D3D352E773DBF9A393D597616BDAC0226BD34D601BD5BA1243D242EEDBC870317BD404DDA3C9D69ECBC68D267BC0A1182BC6842B5BCED0A6BBC98D364BC20BDFCBCFC7FAEBC021F3A3D13F68EBD76E223BD2CD85F3BB42E063C882964BCBB569ABBFB46283DBD5E553D313083BD612EA43B383A733C65A4ED3BE874A0BA2BB6753D510A0A3C0D780FBCD201823D8C084BBC18D5263CD986923DDF17223D046DB53CCCEB5C3DFE85A93DA7C762BD35B8FF3CBC569E3BD525B1382E50D7BBEB116A3B62F8C23C176D1CBDCC7C4ABD367314BD1E2F543D6CFBC23C65D0B3BD13031F3D4C142C3D8917D6BB155BF8BCC6BB1DBB5275A2BC5A2F3ABC0FD4FF3C5E36963C2EBD8CBC55EFB0BC47D8593CB2EA9CBBCD1BE8BB874FC0BD09E9A33D55539DBBB7B187BD84734C3DF660783A28E059BD282660BD2B849DBBD1D1F03B0300BDBC7D5790BCDB441A3CC9A6283DFEA03ABD01F71D3D085443BC9CB4053D40DFBEBDA3D38BBD3588383DDD65213DE8E3FDBBC4D7453C23490DBDAB1E4BBCD7E78F3C9FCD7ABBDB6267BA4A60293C57DBE93CC643AB3AA360D3BB086AEB3B378E843D7EF9ECBC65ECF53C939A68B92BB397BDBF6AC63C2C26EABC5DF8B7BC1B43B03C7D7C063DB2202D3DE3EE273D01BA3DBDD155563C38DFBC3B139C5EBC8825993C6637B8BC9D54C63CB76179BC83ED07BD4AF303BE5F92393C14E8623D20F8D43CA07DAB3CA9AFAD3DCE62AABDCB88023DCD4B8CBD7AD91EBCB6AF57BC5E65EABC68D1C83CAF72823DB764C7BCFF251E3D05E03C3DE9D117BD2F11753D15BC32BC29C3C93ADEA9ADBBF4D83BBD1A6E853C91F1D33CA20AAA3CF77DAF3D5F5B613CA112833D0D35A1BDA5757D3C1C2B653D1AA0603CA59E78BCC73167BDEB5FE03C25A437BD5796E93B0826383D4428CDBC032DD83AEE9721BDD513733D136BCB3B3DEA893C3DACEC3C74EE91BD4591A1BC416B0C3C6BEF04BDA6F20FBC5DDF3E3DF105F2BC825C3A3DF0C580BC437416BD90E7B03A99F7353D08707CBD686A4ABD53EF1DBDF253DA3CF339803D3BEC0D3D233D873D83475C3D034D383D0C08683D2F911F3EE898BEBBD14588BD2B4604BB7A099DBC7EA4813DA14F45BA98D4B33CCE28783DFF0786BD325FB73CF27EA5BC16ECA43CFF0C49BD8CB1CCBC75685B3B618E19BD8FD1A83D9334CE3C510ECA3BDA95A3BD58BE303C542307BDDCE42FBD76D63BBD242141BC81E581BD31169EBC5EDFBE3CCB0BB4BDEC20B43D911F2EBB87AB89BB25CE913C92AA2B3D7AFAC93BE2E5C73DEA4C373B4FC22A3CACBDD4BCED71CF3BA75F053DCE6F903CAC01DB3C9C22363D5C1505BED49793BD089C04BBF06866BA8AC787BC257405BE96A8063CFE36D3BD0E16AE3BB28E45BD7DB16FBC34D7B0BC83CD503DCD3267BA26F3B1BC39CF61BD6BA7D4BC3D61183D3B91BF3BCA03113D047E543C656CE73C455C3EBBDD55D83C78E5C93ABA9183BBFB2198BC5B22B03B2D196CBCD24B673D459A253C4F5DBD3C85F578BDA84A18BDF14C39BDF264E53CBAD481BC8476023CE280753D5E83353B9AA21DBD9911B13D97B8A5BDC4AD5B3BF930DCBC4207A5BC0AF8A1BCD1F8BC3BFC0F103C73CFCC3C593FCEBB59D6D53DCB6B4D3DADBFCC3B97076A3C72A9EE3CB8BB903D48CF43BD708B53BDEE3FFABCC0950FBD2BF7963C07B880BBCA5EAD3BCB073D3CD0B82C3B17C8093D71C14E3D7AD227BD5094D43B0989BFBD51DBAABDDB138CBC20F6963D79E78F3CA58678BA55FE353DE4EB4F3D9731EC3C1018B3BCCF6B38BD19E68C3C55E163BB9CE70E3C099983BC48A53DBD5ABDE23DA324153CB6ECACBC5AAAE5BC0DAB5EBD147ADCBDD7BDF43C87E5D63B754CAA3BBEEF273C0222E53BBBC12FBD8CDF7ABB0ADA6F3B32CCC33CE029F63CFC39C5BBAD2FFBBDA37C1E3DF61099BD7799323D276CB4BC955DD5BB5013B3BC8C1B01BDFC88753DC39B4A3DD5CCC83C76F0C0BC76B3FBBC1BB8003CCB9790BD349E2EBD7BEF5E3DF650A7BDF7689F3CE5FA08BD5157EABB4E79723CB76C3A3C2B9BF63CBD7911BDB968E3BC5BB9BFBC8FE181BDEB4E7BBD685DB9BD0134143EB392273DF9F2EABCBF5306BDAC51973D104288BA17D78C3B467A4ABDA351A33DE7CAA33DDFEE12BD828A13BD3C72463DBA4FB4BD1E07E0BC0EB04E3CCAEF123C63810CBD16DF96BDFDCE12BDF1934FBC0194A4BC99272F3B23AB45BD4E55593D13A4933CF3D7C73C12143EBC376B22BDCDD4E93C0B01843D7110533B051758BC65E0723A0221673D8D5113BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:21:50'),(23,124,0xB91C06BC53DCD33D277E56BC7C9BA6BDCC52DBBCD2F6EA3C75E978BA833B943DBBDCC3BCA3B3EF3C5C5C66BDF7DA4B3C792451BD2F155C3CAA2A41BDB56A5A3DF441203D4DE8C23CEAD6853BAAAD0E3D8B0359BBDF82CF3CE1200A3BEEED163B2855B3BD3E0D9ABDDF52D33BC019243CCCC7E1BCF39197BDDC03F33C37EB2BBC9FFCACBBDF8F363D4DB228BD629EDDBC00AE36BD2832D63DC60C203D0B47993B1F8DE13C36B38EBCD30A3A3C6D7322BDD2A45FBDCA3EAC3C989E06BC9322AC3C18E8393DD6AA633D0F03FF3C74D73ABD385668BD3E8F26BD6845FE3CD7274DBD3CF4DD3D44793E3D2B58B03C7D907F3BB92684BD759C3B3D5DF19ABD72E871BC9178B73BC007F1BDBA8EAD3DA7B88D3D7A2ADA3B38BF78BCF4F7A9BD9078D9BDEB0CB63BB001E23C302549BD061931BC346AC9BC094294BB857F7E3DE0FFFEBC481D763BD65803BD02E7043CCF00873C846256BD3A38FCBC94AC9EBD08380F3D47EDA2BC22DC403DA8610B3D791670BDBE2643BDC1098EBCE710473DA3DC70BC7AB8BD3B1E8118BAC2EA223DC7471BBDA42C283C84F2ADBB3A7750BC810D96BC7CD8CA3D7A18393D48D7003D2980E13DC00140BD35FD9EBC04070FBCBC5B6B3C31333CBD84E87A3BA678813C46B5593B0BC80B3C80FAC8BA4B427C3DA8443FBD63487C3D287A873A800FC93CE05D823D63F29EBCEEBD8F3DF962F7B931C72A3CC3C801BD97B3233D72CC63BD81978F3D9C93B6BC126342BD7615D83AF8B3443D90C893BBD582923D2B610DBDFA9328BD4290AFBD8A2D383CADB7313D8ED3A23C567CD43C4E4D2CBDDE25543DF371283C4A3333BC2A640ABD2C7B1F3C93E2053DC7F130BD7AA67CBD37C53D3D4B13BC3C4055FDBA96F10B3D7B69833DE9E2883C2BD8993BCD2F813B1349AFBC1C89C63CFBFC1F3C2DC9273CE8F1043D039E90BCCB61D7BC6DBE1E3D672FDABC622E61BC06FD6F3C462A5ABCE3B88FBCEE80503B3565CB3C0BFDBA3CE31B41BD924F58BDF69308BC7B99A2BCDEFDA1BDD529E33BCF76F03CB205553DD4C61EBDE41C1B3B8E3822BDB82292BDCF57383D70FC8B3CBAFEEC3A80ED03BD056509BDEAD67D3D4C8C14BB2BCBA33CDA00B53CE32E95BC7BE3DFBB0BBBEABCA9EE253D544BB0BB9AFF53BB21682EB900FB483D91B443BDEC36BD3DD9DE153DD231C8BCA34BBBBC25EC4ABC3C7A313C036B0B3D7003FA3C8AA20A3D2E77B2BDB247A8BBC7C87E3DEC1FF1BC1E2EB8BB86A60C3D8A508ABD732A53BD48E72BBD742A3EBCFD65E8BCAB019C3CA2EC913D730D093B251B7BBB4F69A93DDECAF33CB62708BC33BA3BBC52B357BD61DB98BD7CDB003B356B1E3DC479623D3ED307BDC861293D1285153E3E82D23ABD9E1E3D69656E3D94BCC9BC333A633DF22026BDC347E43CA44677BC9FDE96BD292B183D8AF91DBDA0AC063DE205A63CA945D13DF0C5783C14C5A0BC293C813D259CC43DDD8E8E3CA53430B89261CB38F93F2CBD0ABE06BD5BCFCF3B84CC253CCB08823CA8F52DBC5726F9BC4F6B81BC10B751BD485C5BBDB940C8BD2C01BFBD2F48E4BAD724853DA80FA93C64B148BD9C1DB7BC74C31BBA4BE84B3D845D183DDE5D02BD952738BDD4EA6A3D6205E4BCCFE49CBDE243A4BD0C39EF3C2B19433C0484BC3D545724BDB13E1F3D7B686D3A90CC663ACEBF493CEFC1A2BD74420E3C1DDA22BCE89CEA3CB23F7ABDB4174DBC9162A1BCD678873D3216733D35B58E3DC6340DBD4695303C4768BB3C8C952BBCB363803CF7B7F6BCCE87D83C652E413A28DE7DBD4B9F82BBD25B1BBC2AAD253DD5DCB4BC369D253D09B2C33C1BF4463C667F553CBDE79CBC88E3853C19E5FDB8D2AA1D3D8F5FB03AB8FB10BCA480A63D1123AFBC0A44A23DA1B8A3BDB1BE363D96B26B3B9A3014BEE814C83C53F95B3D14AC913CDAE6873CA72F4FBC3D05A8BDF73088BB714A443B554852BD3F38B1BD376A4A3DDE06A6BD8DEE6DBD7D6914BD885E7E3C6AA2573C184BB43C5654A2BCD8A1A63D240EA7BC3DDB38BCA0F8483D1839AB3CB459E73943497CBBB85A243D323FF5BC6ED090BD6C26953CF4BAA73B8B8985BD3B26FABC8D7099BCCAA4913C385E703C9C02AC3D1F45F9BC2E5E02BDE5E2A7BB3E9EC73B6281D4BD31000E3D5E23EE3D2C57EBBCA51F2DBAFBFD2C3C4A473CBCB9433CBDBC0A1B3CC04090BD547E923AB20918BC6AB53DBD176C823D0DC0413DB182A0BA5DC59A3D0BBDCFBBED6B093D4A35483DEA3F7C3D8D29CDBD143901BD72CB2B3DBFCE41BDF90C16BB2980593DFD892FBD8BC65A3DA145123C70D8353D777ABDBC81444DBD0276903C6A4212BDE9411FBDD8F7523D44496E3D75A2FC37B6E6223C5827053DF8BC9A3A466D3DBD00FC873D83815BBDC4C06F3D30FA43BD8472093D94747B3C9A25C8BD1902313D4024153D1D406E3CC630EF3C18C128BD9EB8B7BCCC954B3B1C590E3D8D9CC83CDD02213C98EA4E3CFE48013DB9EF783CCDF3223CCC30303DBFE577BD5FEBA53D0C04A63C224369BD42956FBC689A16BDDD4756BD1C42A8BC690DC4BDD9F5A13C25F01F3D73BB793AB762063CE0F7ADBC5193903B2B06D23BD764CABC7D183EBDE670AB3CE0CB0EBE92BE08BD1F30B13C35A9453D2D3F453C66A7EBBC38E451BD5FCC12BD75F180BDEED537BDBEC401BD7749253BD20F01BEAEF41F3DD2E94E3C81CD89BCAFC4CC3D8286443DA2B403BC941B043CDF4B3FBD488FF4BC1FB3233D6A35DCBDA83C98BCB909CB3B66DC1BBDD3AD9DBD519BA9BCAA763FBD064A91BCC4B18BBD21C98F3B114C41BD28CC2C3C9A4E8E3D6C79C1BCB8AB1ABD567CB63CADA852BCAD742C3DC6D2AA3CC2B2D93C6864AA3CCF3BC3BB64D65DBC4FC5513D0849FC3C3EE2593C,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:21:50'),(24,86,0x4BA74EBC6903A4BD5C6690BDDC6F0ABD4F29D8BD8A3591BB3DBDC23B95B29ABBB0A24F3D3226C83C8FCC443D689E84BC8039B4BBFC186D3C057EA93CB61B83BBFACCA0BCB900DC3CB2B1F93C2FABBFBDFC5CC1BDB422D5BC4BAB44BDACCFC0BCC22C163C72E95EBD1EA6D03D287E48BC37724BBD96CE763D1EFC313D36A0C1BCD3F5333D542FC13B72CC833D911C3BBD54197B3B5A2FB8BCC90B13BD3AEF703DE20A333D248CDB3A2CAF573DBFDBFBBCF77405BC8CA0413DE82CD1BB580A053D9E9D91BD1AA8A1BD16149E3DC687203DFC31DABDE49AD5BC852A26BCAB5C683A4C77693D32B2B53DF8A57CBDFD16C8BB7E0F02BD3B80FCBC44DC47BC1F15A5BD097DDE3CA14A3B3D5F5CC1BCB630783DF21D523CCFD343B9650C7EBD0875033DC0138F3DA97F86BCF6C683BDB8C430BCDEE8313DECA8AFBDB6DAB6BC9A74233C503A7E3B31D5ECBB1022653BC8D5973C9910B93DE50B623DCAE89D3CE41752BD92AAFABC29610C3DCB541EBD274AA0BC30BA203D7DDAE6BC10B82ABDBABA3DBD3940143DA1CE8DBCDF9FA9BB29BEB6BB9BAECC3B822B91BCCBBF20BC5629E73B73AD903C47EEB63C8CB9DB3C6F57AB3D84F5F63C6A71D73CF0D2FFBBAE309F3D396452BD3EE9093DD7DE83BC22CB953AEB5E33BD029588BD21DAC9BCE5F5E93CE45B3E3D1D93EFBBB70FC1BD59723DBCCE60A13C0525F0BCFBB504BD933D34BD309C91BCD5E6B8BD9D3CEA3C0CA337BD8F3FA63CEED5D3BC752554BA6C4F2ABDE704E1BCF2EB8FBDEB2A093DC7C28EBC29F0A4BD2B50063C000C16BDCA1FA63DFE770ABDFB87BC3D536A943DBDB5463D3EA1ADBC75A7DD3C7F5F853C3CDB11BDCE06943C616DC9BB98F9A7BD992E4D3BC3D381BBB3ABF73D7C39EB3CA73B743D184F63BDF936C0BCB2F1613B5FB1E5BCFC4679BDEED7FEBB06C7D9BA4F86993D25AF3A3C1045903CEFD9053D1E5183BCAE659ABD25DBF13BAD6B1D3C7BE7F6BC08845FBDCCC5D0B94791E5BB2AA9A63C8B6211BD662917BDBD4E1E3C62AF0B3D431760BDF410693D6312E7BC05274D3CBE36BDBCD35DA03CC554743AAE04BFBD4071DB3C5DC59D3C9190843CE6A019BDDC3EC53B0C17A13DEAB311BB8101963B098D40BD967A46BC3B85093D71B4B3BC2C9999BC629F33BDEB1C7BBC1EB326BCFF720FBCAEA872BD3294813CE5E875BDDB2A8D3D5CD0B33C4320683C4A796D3D1168773D83B13CBD019E80BA635542BD69712B3D5D8FD9BAB322033D733A643D50885D3CB79D40BD18ED0FBC5A779F3B92B36DBDFE259A3D5F4E073CF81598BCC602DE3C8ADB0B3D737C85BC5F34EDBB7E58BE3C072796BD9A5E87BB8A9D14BC067BC5BC097CD4BC87573CBDF4F016BD91D23C3D65ED353C1232843B029A0A3DFD2A04BDEA64C93C4D0D15BD9640B9BCF34A0BBDA42380BD77DA38BD45721EBC4ACB1B3DC07795BCA2395B3DC48D2A3D99FE6BBD98B1D2BBC1FC843C49E5E83D1500E1BC517C1F3D8F18F33A1BD2B63CC7134B3DD33E94BCEB25B1BD413E6B3D16BE2BBD7CC4863DA95098BD789BE4BCB1F7ECBC54787D3DFD7B27BD83679BBDCD3C3B3B754C5E3CD7D20C3DA73588BC77572D3D30B50ABD4943873DB791B8BD1716063D1AEC94BD7C4E04BCA2A0073D204CD83CB120BE3B48CF8A3C3B091DBD2FE6603C34C9303DB5AA283DBE568E3D7B18743D9D17C5BD6EF7C43CE34B6A3D7246BCBC3A4CC63DB216A93D82BA353D7F53FFBD819F36BD251562BCC30E9BBD064DD0BC85B342BD631D0FBD1632A6BD22784E3D8456703C0E820BBD9C33D63C4360A93C3E392B3D5CFF6B3D35F092BD849447BD25AA353D29C560BD93C65DBDCD271EBDD6B927BC47225DBC95EC94BCAF86B8BD4BF8A93BCB732DBDB0A9C33D04B90EBD969C02BDB7D0E9BDFF0D333DE433FA39F95904BD2C1A48BDD09B25BDE91A1F3C3A492ABCDA5D0ABD9EDF1ABC8562E7BC5E50A13D8BBAA5BDA183D13C1B3757BD7387B63C44BFCABC395BD23CD93C053CCE6E47BC124EE83BF0DD67BD2030B6BDD4AA9D3CB6D36C3C711D37BD4E22913D9E4653BDEB6CC63DE8E3AC3C22C89538311880BCA31659BD4B57F2BCDDB71C3D8854CBBCD6DB6D3DA2BD0A3C173A67BDB2763BBCBBE5F1BD04E7333DE1FEDF3C67BB46BC89B1463D6D25FBBC366C8ABDAA778BBD89A3AA3CBDFACABC9F0A083DD3B02BBD4022B03C9A8EE5BC3CD8D73C8F8AE7BC250BA93C77DA31BD16A8013D43246FBCB0DF38BB10B42CBD4C73743CC65491BD531BCF3CE9DF94BB959A423D19FD05BD8FF7963D062743BD9C63693D1F6937BC601B6EBC30F18D3CBE5F65BC4EE64B3C864D3ABD2ABAB43CF58BA83CFF755B3C854F503C14DCCF3C18E236BD255DEB3CCD379CBD228D973C240A543DF709073DD7B028BD9DE7163D9859BA3D4E0A6ABD940CDF3D5AE913BD0BD160BD076F8ABCE490583DC665173C71191FBDDA56753D948C893C72AF0FBDB836CEBC05F484BDDEC91CBD1749DC3D2D9DB33CCCD60CBA5ADB78BC889A5B3CBF84CBBB27BE9F3C2AFEC0BCFFB5A4BCBE480F3DAD5718BDF89ABEB97239A53CFF7EF3BB85E8F5BCEB86023DF927D9BC2226BDBB9E15A8BCF31C2B3D252FB53D2CCB39BD94B6CB3D7DF2243C105B90BBA3BAF0BC23E8803A1FC5B63DCAA7E23C90A96D3C029820BC20A7933D31CAF53CF7424D3CFD6D983DD12C96BC88125F3C70322C3DE71EEEBBE0DB5DBC9F4459BC140ADBBCE8266D3BFC22D2BCDFEBA93C5F25933D37D9D6BB616C4A3DC5721F3C54C7C73C913510BD4ADDA53D63FB803C4FD0CEBBF56367BB5216153D777D90BD47F3AC3B7739B7BC8BB9593AA06ABB3DC591AEBB04B9D9BCA088193D2CD231BD6F93ACBC3A0C403C60D4493C0A319EBB,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:24:36'),(25,85,0x85FBDEBB335AA13D16B1163D720402BD41172CBD8B05443DE3E7ABBC8C5D9E3A14BEAD3DA7A95EBC8C6AF2BADBA411BBE0FBD9BB846A113C11F9473A7EC0253C3E4A8FBC353EA63CD1A71C3D4B3659BD2C0B1BBD8D1F36BABFFDC63CAF0140BD6ADD77BB97B2DFBB885939BA4AB2B73C6A4175BDE68B243D742A023DCAEE043D244EE53D0E8A04BDEDDBD2BCADB6B1BDFD3BFDBCF3C0503D7E39B6BB22067EBCF8A6833D688C3B3BF3AE2CBDA6EE9C3C4D9FE8BDD171AA3D9F46383BD78F363C44B952BDB6BF85BBA2A5D6BC83FCA33C7BD7CCBCDD87BD3D3EFA28BC3A8C07BD7A17D93DDD0C453D5EC3D9BC453272BD7575A23BCA9B143D5E5AAB3C106D1B3D1627473DEE44F0BCAE2A993C0EE5823D5B31063CAE5300BD909B88BDB5D298BC94758B3D5BAA053CB43C1CBC02D952BD35E0AA3CE60CFCBB5BC060BC471255BB96AE673C05CD163BAC8A3A3C43C72A3CE784113D26FE543D950E43BDB4FB7ABD64413A3A2FFEA43C589E88BD6B43B73CF01CCEBBB22A543BEC124ABB529A84BC6B21E0BCC2A06E3DCCC1973ACED157BD09AC7CBC0835913D566D113D30FD29BD8BDC373D9553F9BC62972A3D66B0F6BB6F91723C40680C3D9423E53C2A462DBCC099A5BD1DECAFBC1F7142BD368784BD5486523DE681F2BC2ED8D63B745C92BC17D4ABBBFA44DEBCDC36B9BCA2DF3DBD11B5AA3C9875553C1554EABCC2749CBD1699A93D619521BD693E2FBD9AE82DBCAC4F62BC88EB06BDE78FD0BC4EBFA0BDA58B90BCB888603C6F6285BDBC9F0EBDF3AF3DBDDE65DE3DB18C903DABAE183CC8EF87BC9C32F73CC30C973CC7D6C53CCE0D60BD4ED4983CD230BF3CA3AE20BDF4159A3CCFC31EBD04B0AEBD3A050CBD4406CE3D491A403B4AED953DDB81813D351B5DBD38F2C23C80F756BB6854EFBCE4B71C3DAF6DD4BC7FD20ABD1D42E83C5E69263D181487BCEE59553DBD1F8D3B956017BD8B7C0F3CA719DD3B855E0E3DF9EDE1BC1AD6493C4425D23C2EC1BE3CFA588F3BDB09453C13081ABDF99DB33D9E3707BD46578BBD8010883D951DF53C72A6E73AFECF8A3C3324E8BA060207BCED9C33BCB21E5CBCB5FFB5BCFC9775BDA4BF1CBB92DA823DE02C49BC3790CFBCE054983C958D6B3CB03384BC9FEDE63A8BCF1C3D0DD142BD3AD154BD11AB0EBCDDAC903B0EC6193A39ADA23CF6AFF03B178541BC47E5513D5BF3F73CF0C71D3D06FB2D3DF8A195BDA4589F3A316548BDA4AC623B0568F2BC351695BBA897BEBCE84111BD8357B7BD274852BDEE9A253C961AACBCF2EC16BCA9D48C3CA997DC3C10598D3C3D0880BDE715933D1A9A2CBAE93304BD002821BD167540BD8638BFBC8C3E38BDC5AB24BC4D08BEBC5A9238BDE0EA0ABDC61B263D66930DBB1A3E4C3D414B463DF42DE2BAD16C243D2D2327BD2C3403BD96942EBBFD9494BC436BD43D092A903D9F6CCB391CD9B2BCE01A583C293B623C6E568B3D189B1EBD97FBEB3DFB48973CC4DEA03C978BE1BDDDFF14BC11E1A43CD19BF7BC7212D93C17BCEA3C51342B3DE283DFBCE5B79FBD95A348BCEC26123C4ECB8F3D50393BBD33C707BDD2D5C4BDA4BD503DDC742E3CDCDD2BBD13381B3D527C203CBFC4D93D845804BCDF18D9BC97D7B43D875837BD102BCABD83456FBC962AB93C225BE93DA1A4B0BC6BF77ABCDB046FBC5E7AD0B90F78D2BC97A616BDFE9BABBD297C60BD2C2449BD8CEE1ABCACB6D5BB2AE9503D1682F73C06D5DD3C367098BD9B3E48BC2E01E33C3BF825BDADF5073B23B035BD51439CBD13088DBD40210F3D51112EBDABEC503CFAC88E3DD8841E3D96280DBD7901973CC43D4E3D0175F7BAF8F07EBC14907BBD3A21BEBCE6B652BD8D7484BB24AE2FBDDB263E3C0CB7C3BCFACC65BD895F803D7118223B1CD634BDA0B497BCCA8B15BC6D46223D04355EBCF918A2BC954922BDE5605CBCDD888FBCA69D323D6816B0BC89FDAA3C4AACB43DB1E207BEBE0DBA3D1494E53BDB6F073D773FA73DCE6DBCBCDEA317BC62CAB13CA2396C3C8E59543C85C9E33C785EEBBC789C50BC35C40EBD87BA823C3485A1BCBD84C03CFD2325BC18A38A3CAE49BBBCE19598BC3F4DF2BB27AEA23D61486C3D52C8113DC7D94CBB200E61BD9E0CE9BD701EBBBD9154103D1E60773C3F40B5BC0FE8A13C27551EBDB9D7A7BD426BAABDE91C0FBD7F1CF03CD896DEBCE514AFBD734C503CDB9A35BDFB1DBABB3845FABCFC6086BD4010CE3C1CF2423D65D805BDD58CAABDDCA71B3C53312FBAF143ECBD58B6C9BDDB081ABA9642FD3DD0F54FBB1B00463DCD6E66BC2B5530BCAB4ECCBC85C4C5BD38A2533DA9939CBB6E3885BDE0D9EEBCB062913D58BB7BBBE679B33C96BCCABB5C85A73D23A8B8BCAD6AC5BBA6546E3CAC6AE6BCCF9EFDBCD6FF5EBC0FF943BC9AD4DC3D7A16793CBECC813C2CD8773D4CAA4E3D84249DBCFB16D9BC5761573D77AE7B3D5F6B933BC3A6CDBC1DAB4C3D34C781BDCD9035BCCFAAE8BCF9FBC13CA80F243DD2E068BC4BFF36BD2DFA213DDFDA983C7D78DDBCB2E6AC3D9B9C8EBC3CC14DBB5DAB863CC22B123D783A8B3CEC362D3D0062523D921A75BDC4B9903B495F153D5AED0FBD1A0B93BC9C11A23D9C2D7D3D6AC596BC586F893D509BD8BCE7D07EBDE34724BD437DBBBC743EF5BB542CC43DA9E58FBD39A9973A72399A3D366927BDB426833D7300AB3C2697533BBC34DABC33D0473DD8E2FE3C7D3F4CBB71944B3D8A9840B8F49B093D470751BCE2C78E3B6678EFBC353C653CE82BE73CEE201DBC4F88AABDDA74073D076599BD43A28A3D12248C3D775BC2BC0525E2BCD8E5233C8365933CCC8F9E3D481F943DA5FBA7BC68F38A3D1A4BCCB99DEA89BAB0054FBD478FDEBCC684A53DBC69353CD527AEBD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:25:23'),(26,126,0x3BD6983C0C6F4B3C47C4403C122E1EBDA9D2503D2E9191BB25DDA43B1EED323D8891FF3A1FCC5FBC958CFA3C16734B3CFA5C02BEBB403A3CCA1D27BD39764D3D0FFD813D9AB5153D2AD6A13A612E9ABDB7C756BB4E1F573C89BE7ABC17BBBFBDBC3B8ABDFCE9D43A38D94ABD64D578BD83D98BBD00758FBDD5F021BC45F7113D166090BC3934C23CFBD2E2BAD694B7BC8DC82D3C72C3AFBCC65C133D8CE3C43CFDB4C4BC4DE7033CB17314BDF85A15BD870107BD1A019E3D5AF2793B5E1A7DBBA53802BD6C0106BD82690A3D444993BB0AC23D3DC4995FBDD7BF543DD8A0983D6661823DBD39663D5E49563C83E9053DE886E6BD442BA33DF9A23FBD09F9ED3B097461BC2622F1BCBA8F303DC0A22DBD3838D63AFBA2393B154C63BDA60B70BD98C246BD5E41633C89870ABDC6B843BBBCB87FBD151F453D333F973B8F5C1DBD026A803B0511FDBCD886A9BC0FC914BC892520BD4D91263D28BCD1BC26CA31BDFEB514BC451860BC9F04B2BB948FBBBD1C4195BD1A1F403DE2FFF73CB395AEBB2632D73C6505173CD626153E4D6974BC0E6881BC5DF944BCA5DA57BCDFFBA8BC58267A3D254F5F3D102A193C7965C53DB40367BDBE030E3D00131E3D226042BD576907BD13EDC6BBBDAE8FBD37640B3DC5D8E0BC53D7A7BD2B575ABB36079CBD7FA0363D100BF5BC5C45B8BC708C9E3D211DFEB9B489B43AFFE457BCA9E2473D646D1CBCFA581E3D644E01BD6178CA3A5E6E91BDEFDE353D0C541CBDCBCD3F3BEBED6F3C3ABB7A3D9133D03B35E2D6BC56804ABBACFCE1BB76403DBD4B76133D2047D23B86EE663BF71624BD4D25493D3C6819BD3027003DFF30E3BC44FB513C2E4A1FBD26E307BDFC609EBB347647BC9CA6013D1AF0C13D4B35153DEF9202BDD15CD23A2BDAC1BC1F6F33BCE9E0A7BC1738743B59CFB7BB99EC18BB9C7C7B3D9225A4BDE650E63C972329BD7938103D6589393D072C163D88642ABC6AC18DBC8E1C9E3C77CA8EBB4E2E2B3C971CBF3C9AABDE3C10F84ABDDA9AF1BCAE69AA3ABA0C4EB9D9E987BD06DB3A3D7F02393DB2C634BD52F70DBD7023A43DD2C16B3DE0272ABD88018CBDEC5A37BAA45970BC38B06B3BA7F21ABD06211DBD05A42E3D0193443DDB7BA73CD54EC43D8152E43CC4E221BD1FDDB6BDB898F13C8C497DBDBD045D3CC0E5363CF43E05BD761D163D38E5023D67C72CBDD4D8B9BC040799BCE353CD3DEB63BE3C08718EBDE275D93A06DA283CD48CF7BCF9F3B33DD3F08C3A98451B3DE38DCBBD5C8F59BDDDCD55BC5269443C5399743DF01CFDBC9DA912BD150E243DAC23C13CD67E25BD1FB9953BE8C431BD1CCF703CBFF00E3D6386AA3D46B3A7BCA58EC9BC8BDE1D3DFFAC243D6FD3563D4CB9BB3B790608BBCD1C52BD7E79AB3C4705A1BBCF90193D48883D3DB0F81A3D24BE843C17A017BD2906B33CD1FB243D95B7D73C19EFADBC388CEBBD80AD04BC52448ABBB7A8163DA84E82BC801374BD608A89BCEF3CF4BCAD0D563DB043023DC850CABB51EB78BD0750F6BCCA356DBDC0C51BBC497B6DBD6B85D1B956447ABDCF5B9EBD2C36EE3C0F5E823CD79987BD250630BD2066183CC960943DE446FA3C9F2DF7BC01CA48BCE5497A3DF47B383C172668BDD5B1F7BC6F3C8E3CEDD4B3BC7FEF3B3DAB1C783BB349B4BB73BE083D8080353A0C8BE83C1559F1BA26B8F7BC5D2FD8BC2C3E673DC7EB0EBD37F2D33CD7C61E3DC1658A3DEAFBB63CA04F1F3D971483BB34928C3D6BACBABCD127933DFAA7DE3CE8F598BDAD082D3D24499A3D3BF1A33CDF11F1BBBEBE02BDB8533A3C809A2EBB83686E3B8DE9BF3CF981283D63A4A83D7278D13C43A0F4BCF888E4BC58DB113C2CA032BC4C406DBB73DE933D3B47033D6807163D22FD83BD8685513DE608B03C5CF236BE43D1A2BD1111053DA57FEA3C31C60D3D6C2068BDEC5CED3CC54D833DEC6B39BC8D3919BD0E67163D7687BC3C8F303BBDF623B63C1F84073BA1A72FBCB6F71E3D23C0B03C78C99C3D9406D4BC16D3A4BD69E163BDEA429ABBA6B21A3DA557A13DFE847A3B49F71D3DCD6CF7BBC3289FBCB1BEF33C3B8298BDFB8497BDD3DBEDBB7884CC3C6B867F3DFF05D2BB7A335EBD1280063CEC701DBD2C57A63C27ABB5BC74F0FE3BC4340B3C888C043CA089253D1593053C887E003C4191EE3C7773193CC52FB3BCFC4B37BDC1D5773CF84EAEBCB18E8CBC724B103C88FA8DBC22E00F3D4F50783D8A5502BDF51C753DEBDE753B59C7513D7DA83BBD71E4003D43FF993C11C745BDD6A9C13C47FEB43BC2EF4A3CF630AB3C0040613CE58C173D0B169F3CEC1187BC35EAC0BB758C84BDBF10243DB209F0BCD40E55BBD3DFA7BDCD60383C184D6B3C1103243DE24D003C29B597BDD49989BD628CD33DF4A79C3DAAEB183D026336BD63428DBD3E12E8BCBD4090BDAF1ECBBC5DED813C9CA116BDA9169EBD1337243D72CA383C407D5CBC6896003C0AE097BDDE2C0DBD74A0013DE2674BB8A6219ABBB84C44BC7CBE27BD1C2C133CE3C66A3D1F65E9BB3D87B8BB561C68BDD1D3733D38BB4FBC4913CFBC5BDBDE3C95106F3D0C02E03B4FF1943C73B57CBD959C033C33B7993D1BAD053C8809C03D7720E3BC8C0158BCE00C783D8E159FBCD0A2133DC1A6203C2617C13D3DC78FBD1BFD823AAF4D8F3CF60929BD8755DEBD27A0B3BDD3CF2E3C6BEBBEBC6C298BBD53D75B3D79BB07BD95C018BDA7E4133D227408BD7A9D6BBD02E9A73D163A06BE0B58A2BCE96A3CBC4116693CFDB05DBD4E24F2BCBD5809BDACD5FCBDAB0449BD10AB403D9599A33C8E4425BC2C2B403C25FD5BBDAF845EBC61F494BC53D1B2BDB09C473DF67452BDAAF5A83DA8372ABDA18534BBC800E83B3194CF3D2596B23D6D74B839,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:26:18'),(27,126,0xCA4BFFBC3769C23C3A42D8BC03151B3CE046FF3C1546373D58D40DBB3CE205BD304413BD2F306EBD9DDC523DE962313D4ECF85BCB90BD5BC8F085B3D02DA703D58E0EB3A92581F3D461595BC3019B8BDACDCCC3DFEEE0BBD78EA113D190154BD40740DBD15C85ABD7153D3BCD136BABC7BF893BD4AF999BDDAC311BD864BFE3C0E6382BDC8A51E3D08BDBA3A4486263CE8E51B3D4EEA7F392753343DC1E8C53CE503423C36F1ECBBD32DD1BA2EFA73BDDB2FD8BDC579713C89240D3BB7068BBA856D74BDE09B303CAA52AA3C3D2CD13ADA4FD13C351755BDC9CD1D3D322AB33D76E44A3DAB33023D7CA6FABB324FB33C2BECBDBD1AAE853D3CEA64BD9FEEA63C109DF3BCBBCA91BD2FBC833D49FF8BBCCECA523D53F9EC3CB269DB3C499E93BD1D2D9BBDA2760DBC201EA2BDF5D3843C4ADE3BBDD82698BC857EEDBADC824CBB92D775BB3D7C72BC8E4C02BD80661CBD8075CCBD285A263D623881BDD0BF51BB1275863BEBDEC3BC09E9313B305C6CBD7003F2BC2BBB1C3D60F203BCD6E74DBD8FB6353DFA053B3BA8CE4B3D3E390EBD316A09BA207DE43CD7E6103D14F68A3C5D79833D182FC5BC7157F43C2A64A43DD897BBBB7197673C8B98F0BCC72870BBE8EE7BBDC19F0ABDE2D25CBBE4BB46BB71BE053D3984343D416106BD078160BD4BC4053DAE097EBC84A08D3DB2508A3D098BAA3C51DC6DBA421EB33CFCDD283D8D4D183CE998453DBAF509BD48C7CCBBAFF906BD683D1EBDD455C9BCD11010BDD937B4BCA9B2903C6C57363A4800B7BC873420BD4C4FD8B9724B043DCEDA943D990CD73C991FE23CE60EACBCB58D8C3D207D71BDA6D5C9BC7140303B07F71F3D68970BBD1ECA22BDF43028BC8B757DBB4637FBBCB4A04D3D84F1FE3C5E25B63CAC992ABD39A648BD62D6313C870CEDBB02C1A93B115107BCD4B241BC6135CC3C424361BD0A684E3D7B57CB3D6421853DC44A1E3C6B34CE3D4080473C7EC2083DE22B5B3D05DB0ABDA24484BDB42197BC11224D3DD11DFDBBC21D38BC9EBAEDBB59DAD3BC1FDEC53C8AE67C39CCBDBA3CEE637ABC7A8C4DBD2D49953DD54CC63C4291B8BC5ABFF5BC91318DBCE32BE2BCBC8AF1BBAAB9E13B946185BC06A3023D12FD043C951101BC50A8983CB86D503DC449C7BBF4702FBCDFA2953D5A138DBD622C563C7558083D6E32B7BCB6C03D3C7D33E9BB2EFDF7BC404606BCC764B5BDFDDC873D7ACDA03DA10B90BDF0E9E3BC1F0BB83B8B9497BDD1C7893DA434163DDD3E94BCC84067BD3E6BA7BD5856983B773CB33CE810093D00EC94BC53824E3DC63CA93D2E692DBD5AD355BDE77B013D29BD33BC57F9B2BA6B82263D96A9013DCD603DBC9718C53C1668903B0A0B993CE67BF53B603FAB3B9F1E713DD4821EBB5C38463C6F7DF13BF9A59E3D3A6EAABCC0EBB23DB34E433B003E4D3CA9AEC63B457A2B3D48EE043D22120EBDCD08813C9D96183AD68E48BB6A0DF13C824941BD3DB2ACBCEBB110BCA8322DBD9FE7043DFCCC213D6756D6BAE5ADAC3D15BF6EBD81B76FBC493CB9BC62752CBD3543A6BD7F5535BD1081C3BCA80D2C3D9F2B0DBDECD87ABDE70B3ABD841FA13B6D85123BE0257D3B60E512BC16B0BE3DB9F027BA64D29CBC4272D4BDE94D86BDE25411BDC935D43DB62E703D1D2C903D577E1B3CD10F803C59864DBC2611803D961F19BD783D85BDD5483E3DF24AE43C66B796BC3BC28FBC9711913D4DE6133C150A0FBC4E56543D66E69D3C2F28BD3C88A047BDF07C2C3CAFE00C3D92CA1CBD3C70603DDA79713D0418293B422BE8BCA5C682BDDE6EA53A830FD63C74B620BCD635903D089F1F3D530E9B3DD8D40EBD30A3AFBC8084F03B30BEE93B16B512BD245285BDA614443D0BDF9F3B9B81AC3D8BCEA1BDCF1958BB8270A93C5F9C5CBEB7B253BD6EF60C3DDAFD2F3DE9F0473DF1AD56BD3918893C2EBA9C3DC84DF63BAC0C63BDBB62063C0B3B0B3D2324C9BB766B72BCA29C6D3DCA52463CA069B9BA96F1043CBF31303C089580BDA1B903BD35028ABD26D595BB6F96A83D76FE873DF773C83CB8D9983D7365F7BA3CA19DBC475E453D704A06BE865A72BD427FC73CAD48543DE7DDB13DCA8B1EBD9164EABCB08FF9BA471348BC2059A1BCE234323CA7E1AB3DFFD8273D2D8A7F3C2216DA3C8CD15BBB441D5A3A1BE081BCE9FAA1BCB339A33AC6F14C3AB635EE3CF68A453DC61B043DC2A0383CB9023EBD990925BC5CE21E3DC6B1E1BC4CA2BA3DEAD072BCE874323D665793BD60A09D3C4E77633D30C93EBBABB5A1BC00D49B3C4AE8823D9A426EBB8403A03CD9A3543C9B8C623D9F3C0C3C04733DBC125414BD08B127BD104FA23D70CC5FBCE9BBF4BC0877813B0D0DB83A26218B3D81E83FBD4755533B80BBBFBC7687023D297C843DFF284C3D6B5B7E3D210D3EBD5A824D3D0259E9BD30AA473CE07414BD3E092DBD860B7EBDF79D263D4042B3BC0399BF3BD4524B3CE7F599BD01BC15BD9F8D253D7153463BF621B1BD584A18BC70D7123DCD37843C8D560E3D0AAB693BB3253C3B51F497BD751956BBB443303D72D1F1BC40DFB3BB8FE51E3DEEDF34BAFDA2DBBC801BA4BD88B337BD2C91343D3FC62EBC0F22AD3DB6D58DBDA59A27BDF950FC3D3B1A973A644FB23CE57A03BDD9DE5E3D438C3DBD5256ABBCFFBFC0BBB06C87BD558932BD0DE597BD3CC6043D0FAA953B0594EABC4550713D4A69443C0FCD3A3CEE0D96BCBD4006BCEAEE2ABDF455C43DDD6E26BE3B88B4BAA8B00FBD567881BCADDE4C3DC4F5B9BC716754BC5CF447BDDAFC44BD060706BCD3A0293C7C29FFBCCE5E4BBD7B610C3D0EC05F3D0C56F33C47EF6FBCC26E163D0423873B1992493D44BCE9BCEFCF13BD6146AD3C087D563DB2CB7B3DEBA18EBB,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:26:18'),(28,126,0x77C3ACBC9583923DEFE7E8BC6B55F93C11DD84BB0831953CC681873C53B2DFBC652F3FBCB1E634BCA0D1913C9E03F03C290CA6BD0EAA9FBC845B353D928E4D3D2652B93C8853BA3B64C05A3CE9F06ABD7848E33D4D7ECDBCE39F243CD1DF4ABD13BF26BD8DB147BD0842F6BC594C8DBDFA35D8BC237B27BD5379C9BAE8E5B03C6877F1BC953B863D51419E3BC9A7803D8F82973C0E66DEBB98A1CD3D1377CF3C47D31E3DC41591BBCB8671BCEC8E42BDE0ACCFBD63EA773DC3653ABD1BB0B23C250DAEBC60ED193DABA6083DD7953B3C393085BB745930BDFABCCDBBBB64A53DD58E2E3D5CE5893D1FBF243AEA1893BC214BC0BD1DE3933DF6CA35BDD46E113D61B5B0BC8E656FBD51C0333DD81A89BD80FE973CE9837A3C64A354BDFF76E0BD0FBBC7BCDBD623BCD1E0A0BD85B307BCA2CF94BDF835EF3CDA1DAA3A0DED343CD06E38BD43F0AABC5447A0BCE7ED18BDC17BC6BD0460A53C73DACCBCACD3033D2F681A3CDF618ABC05535BBC74F93ABD5A0DFEBC8E87BC3CC5C39BBB4F11B13C202B033DFE096F3BB3D5B33DF2E2223A7AA397BC325C5E3BC1C1DF3C723356BCDDC67C3D98B72F3C80C4EC3C74FEE53D71B108BD0FF2BF3C52B324BCE8B355BDDEDBC8BB816D7DBC14C1003CBB50743C93DE453DAD4CA9BB922894BC1FC895BD55A69C3D88D573BC7113413DA098473D023C813DFF3A1A3C7113BC3CC128D43C7BB4CFBCB9881C3D07A106BC33765B3A2E45A4B985AFC2BC4A4F91BC648CEEBC568C83BC69B4A33DA6DBE03C2D3309BCDFB683BDCF93323C8948CF3B44C6373D667B053DA3539A3DFB3AF1BCA2BA673D7E98E4BC59D72ABCAD4734BBDDE5943CEA70F4BC613665BDEBB05CBCFA2A463CC097FCBA01D07F3C10C38A3DD542623BF0F5183C1FEB25BD4AB02B3DC1621D3CD0ADB03C2BA4A03A23C6AD3CC9A4173D0F6D89BD168C733DD2DBA73D32560B3DA0DF213CDF20AB3CEB58D03BED92A33D70672B3D4D999BBCABBEC7BB38738BBDE52CE33CB93D7B3B27A355BCBE258BBC327339BB1290AC3C785A883CB3B5033D5A6ADCBCA27352BDB47B893D9F89313BC6AE8DBCF84500BDEFC488BC2C38C93C5B6389BCE10369BCE2B686BC5069093D762226BC8A6A823C0E10DE3C2858343D314C13BC7B17E1BC7AD1A33D317BABBDAD92F03B935E2E3D21ACDFBC13414C3BC27216BD3E55F23BA08A763C2C87D6BDD78D9C3DDE9B713CBABB88BD915F95BC653305BD90C544BD10E1433D8EA52C3DE7D6B6BC6AF697BD54EE85BDF191D1BCE8EEBE3C327E673D9709E9BBDB1239BC16CDB03DC92EA1BA63FB4EBD96D92ABB876134BD6DD724BDEF2E083D3AAE163DBB26C6BC790759BD7C0108BC7616FA3CD6DD21BCA20B3CBC6D978E3D6245BFBCB487DE3B5F7CBFBBFA03273DED9572BA6CCC8A3D4E4344BC3A3B2E3D3BACD43CA0393B3D19D9193D4CF905BD6A90F5BC2FE9DF3BDFBD893C8FFC023D6DE186BCB96C1EBD968512BD30ED0DBD99BE0A3D2BF06CBB3F68BD3C967F2A3DDFB594BD9CDE4FBC5D64E2BCFD4567BDE213A8BDF2B7A9BD612E4ABDF290A83C396047BCA68789BDF2DFACBDF153E03988B1173DE252A0BB6E54D6BB1F1ED5BCBE1A163D262FA5BCAF93CEBDF92905BDF527B2BBD6E5883D9FEE6C3DDD2E6F3D3B819B3D02C8F23C58D9BB3C20AFD43DE65B8DBDC37FF8BCE9D304BD0571E63C290BFFBC51D89EBCB3E30C3D0B69133DDAC5C7BBED1D8E3DB9C4D8BC03F3C63C1512C7BC447A503CAC90063D6FCCCDBCC07FE03C0343FD3D748BFCBB211ED0BC3122B0BCB0C9F13C33C7EF3CBAC37C3CE4A17B3D07AD4B3DE114C43D3136613C9B7C023B8D65EB3C37D5E03CA5C78FBDC34956BD3C0CC43DDBE40FBBBDB70A3D6AC8A5BD2506B23C1294E53C84EE4CBE508340BD96E05D3D027B233DAA12833D6BC61FBDACE880BCC374983D6EAAFEBCAB71E3BCB339ED3C118A573CCF83203C341F06BD5C22E2BB07B2473B2F7DEF3CC9DD6EBCA8F42D3D0A80FABB94A1BBBC881661BDEDE2A93CE18F1A3DC3A3293DA62A3B3D996D293D67EFC5BBC85D05BD00B0433DC3AAF2BD82F87EBD611212BDD00C2C3D21B27C3D0E6015BC2B7440BBFA623BBC2E3726BCF7F912BD947A4D3C428D683B725D29BBF16F463DE170793C0EEA96BCF7F7243CA86407BB2EA4E83BCEE8043BBB3725BD3936023D87CC0E3D5DA184BB965A2B3D6722A43C5B95073DF2353F3DFFB6D5BC6297D73C237B52BC78C6033D961B0FBEEC36CC3C414B423D00CA1CBD7C9F16BD2D51DDBBB9B0823B9715B43C4990123C3981163C3B7C1ABA63E31DBDF751473CFC8F41BD0D45CABCB527993DB4D968BB2F4657BC61A62E3DA486A33CF510323D927240BC0E4092BC0CA34EBDD1CCD63C827D7C3DE617C63C2A20303A36DA96BD2238BD3CC8B91FBDDE279D3C004441BBFFE6B1BD4849CBBDB178733D0D022E3CA6C9643C7BE9EF3BE00496BD00EC5CBCF255D43CFDF944BAF59451BDF2AEBDBCAE65793D0DAF613D394212BD1B690BBB38D69FBC1D0FD4BDD4C3CC3C78411A3D1694A5BD4D24CA3CFF7F233DD6EA6C3CC13A51BD615AA7BD0B635A3B74DE9E3D792D8FBB3749053E6F081EBDC6A62FBCE2E4A63D4E1B2DBC50164B3C200564BC5DDB873D6F712BBDC504B4BCCB430E3DEAD750BDC99C5DBDD6DAD5BD265509BD287E1BB90F722DBCE979EB3D9AF0823C2BB103BBABD29B3B536F94BC3B5084BD63A3913DB6860CBE2BD159BC9A064DBD83BCFFBB8A0D4A3B0A3FD1BBF227EBBC4E0FD9BDCF5CD2BC2105D8BB76BC35BBDA337CBDB9AD1DBD8559DB3CF23CAA3CA0BF163D3CA743BCBD620A3D8FA8E93BB9D78A3D6B1E0BBD937387BC870CAF3C5F74B43DAA7A013D0FABD7B8,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:26:18'),(29,119,0x1DA1CB3C5918263D9D1046BDCFE6453C260EE3BC477F02BC8D828F3CD77A703DAEDB803C1FBC1EBD8CD7CB3D6E0D35BDF55AF0BD143DDC3C7BAE683DC630313D02A146BC365E0F3D7C94763D53D148BD09B353BDB358A9BC5481333D19E1503D2B04BE3C62EF7EBCBB069F3D140E44BA8A20B23C8F06FA3B77A6B83CF3858EBC06A116BD547CB23D7B5C883D2DEE15BD84BC17BD693C2ABCA910B8BC29503CBBAB61913CD5C3D53C31FA68BDAFDA0A3D63692BBB478C80BCD5C3EABCE35F2B3CBAE506BD48E0ABBC4DA7413DDE44163D9FEDF0BC8DD9B1BC52DAFA3C1223A13D26AF0A3D7C8B883D2EAC50BC6ED213BA11901CBDDC0FB6BB0F4C823B31EE583DD6AFC0BCB2B7F7BC160007BC67B16FBC535F6F3D61EF7A3D0074AFBD916E91BCAA58483D5B922639B4A86BBDF94DEABC35F2733D5831B83DD685183BB90FA13B35A70B3CA66301BD7E38F03C18211EBC04E9663DF1F1733DC86E433D8F9C8BBD0CE4893B94A3DA3B1761DBBD732581BD867B813D95FF02BBF68EC63CFC15D7BCE1D9C93B18A3183A680F5D3D1F22523BDF3D7DBCB9B112BDC45205BAF5C74D394680E73CEF1F2E3CAD98063D6521B83C18395C3B2EEF29BD351EF0BC41C3BB3D27A304BCB56083BCA7ADECBB06BCDD3A388DACBB8DBE87BD0738293B8EE31FBCD0D6363D683868BC624E66BCA0CC0ABD54348E3C39C6CC3C6FC041BD8B0F1E3D47D3C43DCCE8CBBC65EDADBD270BCD3BBBF13E3DE451D93BA66D2E3D9F68CBBCAD6C0E3CB6C94CBCC50EA0BD06D755BC5BEAACBD411B343C17DF0BBEF40E043DA37236BD222DDB3D2E219DBC3BD1D03CEE501C3DC9A1F23D0BC657BD67FB153D257038BCF047EA3C56EC6DBD32478BBCF692523C642E8DBCC95D01BB65F0403DB16CB2BD7D1D003D7298A4BC62B130BD731E4ABD1790813C4EC0AEBA43396CBB9A01193D6180AB3C7D516ABD467687BCB85E893D4BCE25BD0BD51EBC103AD5BC0EEE3FBD904509BD1238C1BBAC6B7ABDA31592397F1430BC6C4AD63B2A229DBB49A7323C45736D3D1CEC0E3B756C33BD914ED6BDB451103D531942BD276F66BDBA86C53C4BCF0BBDC11245BDECBC823DCD1018BD42572F3D0E9EF6BCF5252CBD13053BBC7D4F133D878A003CC48533BC4B8741BC795DEC3CC570A0BB22384BBD24E3903B4A1C21BD392A89BC2765C7BCECD1E83DA31BB6B918DB3CBCF751CABCAFB71A3D5A37763B5A75A73DB2FE1C3D7A811BBB1AA191BCE7286E3DF6BF9FBD6B6386BD010F08BD931D1D3DF241F1BB82A6143C83979E3DD9D7B03D30119BBD859D08BD748866BC6D1B7DBD35AD2EBCCF7C3CBCC2BC0FBD5974823BC3DDCB3D49D98D3C911130BDF4AE62BD3E2294BCFDA2D6BB4301843DBE82993DCA29B7BCFB8BA8BD8A6E8F3C2569B3BB487CFC3C8606BEBCF252C93C78740BBEF54C213DF5912D3D7DF22B3DDC3B023D68325CBDA42C46BD8AC1223D0642B6BC63B6683B047C0BBD7E5B8B3D447CD33C4C68253A9046B83D7A2CE1BCDD7FD8BDCC85833C2D37EE3C4AF0543D50B990BCC2CBA8BC5B9117BD19F038BD9B69D7BC806640BD0E83EF3BAC67FEBC3AE8503D1FEEF23C998DAE3C94A89DBDF92280BDB3A0F2BC097C06BCC527AE3C3652D8BC8D36CABDB3A1CD3D98D999BB592213BC7B8EB83CF22251BDBAEA98BC90A325BDD63F6D3C4CCE3E3CB56F29BD94D64C3DFFD8D7BAF46F11BD13B2963DBB71143D5116703DE7A1C5BD821B12BDB66BA73C8CB8A9BD00BF413D05A2B8BC7CBBB53DFC8EACBB3BAED63D3FF6BE3C9530493DA68D263C7AF225BDF80B813DDF1E543D2A42BB3D37329D3D29D40ABD96AA423BE00CC4BC654936BBC4B2C3BB347208BD78E7F73C79EA353D0CF4383D507297BB91D0AA3C99DD96BC6C64BBBCA4B2A93C710BA2BBB9ACB63C6E38D5BC3CD24BBD40EB8CBDF966203DD38B85BDF72253BCC552C53BD03220BC5ADB663CE2CA583DD4A34DBDAA7381BC519EE33B28D4463DDAF901BD6B48993D5A9C3F3D70AEC43BBDEB97BCDB1CA3BD5C7593BB5E035C3DC871D2BC30B5723D203D5FBD077C7A3D57340D3D4D5C69BDCF088CBCE54B3FBDF7C23E3D4A92403DB94DCE3C12C8DBBC53EB763C1FFB8C3DFFF1AD3CDA50AABDAB8ACA3DF11D433C46B9CD3C0DBE003CC419C73C77ED73BB04F8103C1AD40B3D7872EA3B2E093A3CCDEE7EBB315C0ABD786039BDCB74ED3DF74E6EBDF4E4013D6BE0023A855DD1BCB03C553BDE9C0C3DC94B093D689AD7BC3CCB9B3CD221623DD8DB0FBD533C3D3DE86481BA37B38A3C14D300BB15C885BBD7D3013D000647BD0B9149BB437EE9BA8F86783D06CA39BBF9F75DBC2AF25CBDAE6105BD5346913C8B26CEBB2E2B36BD28E2E23CD48580BD911E04BD47DC8A3D764C633D4B734FBDACC0AE3D581BA13A0779823DE33CE73C3AA5FABBEDDB213DF0092CBDE0B4AEBBDA5B083D7E831C3C867824BCA2DACABB6AA9B6BDCCCD1F3D37935BBB632686BCEB83833D4BCCB63A5E607DBB9CE82B3DB209FE3AA75286BD8397323DF78C04BDED05B93C1843BC3C2DDF273D1C8625BC3455473CAB2CEABD62854CBDDDCC593CB25F1FBD8534563DE7ABE43B9F7F433DF2DD093D6B8040BD1BF4473DE291BABCC2C8EABC73570FBD253AABBDC4FFD43CEE5BCC3B34EB013C341B003D4111103DD89BBFBCC44130BDD30F0ABD2C1733BBE75B4F3D570F893DF8B9383BC955EFBC58D8B0BC094CFBBDF798C3BC3895BA3D3E82EABCC7415ABD3D8F4A3C9C1D64BCE11EBABC90BE793C573C13BD5C5A4FBDF776153CAAD9383C3B4C003D6CE7573D24FBC9BB35FB903CC4EED6BD630FA93C51FE6D3DFCF2023DDF80D53C0886113DBF532A3C9D2273BDDBE1643DADA1BEBCE110E33B,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:26:52'),(30,119,0x1E002C3D17F15B3CD89DB53C5C47883CE537EBBCA98D73BA6C0D293C8B1CF53B6B63733DFB8815BDA836CE3DEA7B663DADDC80BD1B2FEA3C5B8FC7BC3690593D4C160DBDFA7CE6BC3ACF83BC52E8D3BC616F78BD7A769F3B77E5043D2B3DA5BC343CFB3C9242EEBDE78FBA3DD0A661BC47736CBD78B25C3C604A873B949737BD5F84AA3B6A50E23D86458C3D63E3F0BCF45501BBF4C28C3C4BB873BDC7FCC03CD7F74F3DFD5FE6BBE51592BD98A744BAC93BDABCFA77243D2C4E11BC34362D3CFCEC30BD23F0C03C7375AA3D1DBD823C57FE2ABD91897E3C9FD783BCF1A8243DED3FA63D06570A3D082988BC046481BD60DE7EBD7E94D43C4DF24BBD86D1D13C1C2FBF3C55CB4BBDF9B8ECBC144AA53CA4E9EC3C4A243A3DF388CFBDC411323C675CAC3D6397073DF69533BDD33DC5BD53E7093D6D119D3D5F8EFC3A98BC3BBD2BF2CC3C482B01BD62947B3D927F38BD354ED83DCE6F9E3DF2BC073D72D913BDF0322B3D0756DA3CC020A0BD739613BDD68DD1BB5D9219BC8899D33C8045EF3C6703AC3CAC70413C614BDCBC131FC6BC3AAE6CBC5A8F0BBDF6E87F3D2D8E0B3DD01DCA3C2ED5433D8DF00D3D1668B43D4E0143BDD0427C3C9A9C03BD289234BDCCDCA9BD9C96843C35D1ABBCB45102BCEFB08C3D680D55BC222520BD4AF83DBCD80868BC9D9F17BD16ECBABD44335E3BA571F53C2DB447BCC38070BDA69A8EBD89D6533DF362DBBCEA83C5BC0E8C64BC83334B3DDFF138BC7C2E383D021A9F3C69928ABD66C82C3D5CBD003D6EC2F0BB95F392BD9CDBCF3C212E54BDC4B5A93CE753283CE04F0E3EA791883DAD40F63C038968BD2C050B3E51E5DB3B5FFFAD3AEB415E3D34A4D43C5F774DBD8CFE36BC78EDF23C326F6EBDFC139F3CD47AF53CEE5FE3BD6A3D563DB4612BBC233E473DF22BEC3B77EB283D7861503D9FFEFBBB01A832BD55A7A03C436ED2BB2E6506BD16673D3DDD12F3BCA51D45BC8E1E42BDC0E4F0BC10DE0ABDDC4702BD98C892BDABD2BA3B800AC6BCF1FF8BBD3B4A56BC757DA5BCFB8D8F3D4DF36FBC7EDD0ABD04363BBDE047EDBC8C2585BCABDC16BD564AD73C5B7A1D3CA5E7BABCA9DC863DC38C8A39D768C63D7E7073BDB6DC86BD08FA433D386E34BC68D0DCBB24A3AB3BEE4C4F3B633ACDBC60BECB3C508423BDCF150ABDCD73B3BC5BB2883CD300153C19E40C3DAD66E23C7244C23C4FE984BBE7378C3D63240FBB09C827BD190E1ABBA4264DBD3AB34EBDEE019A3D3E2A95BDD863A5BCD7AC91BC3C15203D77792F3C4BFD78BDADD3523D1D3B203DC2BFCEBC4C50193D585B0DBD61D9ADBB236F77BD13D563BDD772513CA8592FBD190B333DBDF029BDABE46F3C8E514BBDE2D036BD96EE843C6ECB2B3DC600843DD8C5423B386AB0BC14182E3DF93C993CA804B53C2AEA47BD730F533C043A44BDDD482F3D8BBD5A3C167944BB31A37C3C1D923D3C010638BD4007D73CE9C365BDE9CFA9BB8CE70ABDF3BEBDBCDAFDDABC06E12B3B997CD33B4A03003966788CBD90ACC4BCDF8B35BC1C4EEE3C0C803FBC268BAF3C5F883BBD72B1E1BD41C14DBC06EC0FBCCEDDB83B5F9CB9BCB1FC41BA9423B33DA7C215BB177486BD790CC23B1A7BB9BCE8888EBDBB8220BDDF178DBB1E05B9BD07BAD63D8915D43CF9BF293C27E1113B87CB943B40F79EBCCB4BB53DDFE7D5BCAB6CAA3C14C232BCF288243D83AF1BBDF859CFBCC4C9C53DCD66F03DEFAAB43B382983BDC5DBD9BD0996943DFB3D06BDDE2AB23BAA2207BC2FCC2D3C2BF90BBD6046AD3ACA2B723DD95407BC020CA33DC0844F3B14152B3D336D7FBCEBCEC23DE3DA5F3D7024AE3C18ED2ABCCBF606BBA1ADC6BCD5862EBDBDF252BD2DA740BD5264A53BDFEAD73CEFA713BD2DE5C93B4DF137BC7655FDBBC107083C466E13BC5670AA3DEC9B14BD943D30BDE60A87BD944B88BD85C09BBD301FABBC06FA373D6D4614BD8123553B8201A9BBAE259EBCDD8704BD555B69BD17A766BBE79584BB3B4CCB3CE3733E3D77F43CBCCAE25CBDADB099BC390A12BC0B3D623D4C528EBDD28BE0BA995A98BCD59B223D750A863D3E06D13CEB12323A6E329ABDEDE8FABC7E93AC3DD2EA223DE620213D5476903C342F8CBD7C5765BC01BFAABDD9F35E3D5BC7663D6EC3783D3A9B653DF807413DDF683BBB05201EBD2737293DD2117C3BEAEE48BCD41EAA3A73EA56BD9BDC1EBD246A053E59DA07BD7D18D73C32F50DBC625261BC30BCAFBC61452FBDC4FB953DDF4B743B0FC82A3B1B93F33C0C75123CA8FC173DF4B063BC8C9C3F3DEA518BBA1BB90C3DF1E546BD760E2CBC7C869FBC456B1D3CDAD4D83C048595BDB75E89BC220E483DAA2EC33A47FD733D7AB268BCFEAE3E3DB6C94F3CE67D14BD83904EBDC3BFE0BBE1E6573D79D6ACBC4B7EE33DEC14953C94C4683DA2F9623DC5F1A4BB5DFA75BC1F5EA9BD4C9CB23CAA089ABCF1D73EBB3DC1073D8F9682BDFB3386BD8710CEBCC6D37DBD042F36BDC333733D9B6CF63C3E7D853BEF85B73CEF774BBCD32AACBDDD019F3CC513B5BC8996B0BC5756B1BD8967F63BDFC3703A704589BC775AC5BD94C180BD2AD30DBD09FE51BB96DD96BB64CF48BCD909453D73B8F03C233B413DDC7F803D8D98CA3B1380EB3BC880D4BC2DD5DDBC5587FB3C1922C13CF07A1EBDF584283D5864AF3C52C82FBD58974D3C903FC2BC067659BD8156933D6E48A53D17469E3C1321D1BC36D8ABBDC50CD9BC574F323DF26A033DF56CA0BCD9062E3D7ECFBA3CDA8654BD4BECE1BCF0FA5F3D28DA55BD2F7632BD09DD933DDD5D5D3C7427023DE367FD3CB351ACBCE603363D9CE1F3BB80CD2FBDE72F79BC00DCDE3C9CDE8B3CADE2AA3BF54C913C6D54F9BCAFF0263DE0AB67BD982E83BC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:26:52'),(31,130,0x1A52003D2B55B23DBA10AF3CDBC107BE7699273C1023663D74E0C3BC802D4E3B9A51173D92B41F3DF90E303D04D21E3DC807CFBDB768543DE3B4F4BC152DC03DC0E03F3DF5A1983C4D3028BC262D5EBD0E2CD53DC24BD13C70D2ECBA62D4C6BD64ED01BD9E284FBD7D879FBD9B632BBA2DF88EBDC8C855BD3D1E06BD7D01F1382AC49C3AC900B33CB96385BDF22EA73CF3BA64BD5FD1B13D6E427B3C28D775BCD727E13BB67C33BC040E32BDE62542BD3B0C81BD1797293DA2F3283D156985BC0576E9BB943F583D259348BC4D6D5FBD7423F2B9636D4CBDE60908BCD0A7383DC4DB083E3B54123C14E796BCFFA1283C58E0D8BD05D4CE3C2FB12CBD22AD1EBC0270873C9116CCBD42F6493DCC6046BD8FF560BD65EB0BBD0B9273BC59E842BDE5031A3DB541813DC7B3933BA78903BCF0A2B4BD3BD22EBDECCC06BC616446BB40102C3D2D0E483C65F40EBBEE1891BBF5888639132A493C6C726EBD00F1673D2D7DAE3CED9E893D19CC2B3DB8B9303C2231DE3B553F793C9EACFDBBCD1C2DBC4271DFBC403D0DBC12A913BC8BEA21BD29C00D3DA5C98D3DCF07973DD3F559BC15829E3C56630FBDB476943DB381E33D23E4A6BD74A7C83C1604C8BC9A6E023D6F47D0BCBCF782BCD8D3863CFCE3A63DB2BC1A3C4A0CCBBB74F2083D729E54BDBD6E5BBC779E5E3B6A5B5FBCE5F70A3D541C093DFC0AEFBCFEEFC8BB2F140F38EE9DBA3CE3F34ABC4EE7CBBC8FAEB83B755D983B16DB983A4AB42FBCED2D6E3DD19F1B3DACD68F3D66E9473DF31F11BC4861C3BBDEB4C63CB3B7E93C38F046BC8A06E53C5D38BC3D1B901E3D5E1B8C3DB2E32EBDD135973D7935643CAF65CBBC5FAF383C7AB93ABDBDF8ACBB0994BCBC2D0C4FBBCEF5273D2FC8A63DA5C3663D950EC7BCC14B4EBDE228DBBC3B71103D7C367C3DCFCFEC3CD1937BBDCAF07DBDA9C0143D4740163B201E643C467FA5BB69ADFA3DAC39313C38314DBCCE2550BCB55BA43CE80127BDB93059BD85A77B3AD01CB33CB44E4FBDFBCA0ABDFCF47BBDC103373D6F4CBE3B587BC3B9B467043C845D873CF6052EBD27606F3C388BEB3CC37196BC5B080B3C32ED86BC28E1203DE8821B3D5EC4943C357722BD9988B43CEE382B3C0C323B3C9D9D5D3D9BCEB13B44AB2A3B5D814CBDD1EDF0BBF00CC7BDAFB1C53C36195F3D381FDB3C38E7973C7CF4473D4001A03B8E63A53C7FD650BDE1E6753D84FC1E3D2850AABD5B5954BDD963D73B633C59BCB97A1DBC3ED3DB3C000EBD3CBC4CECBD3D9338BB745C103DFFDFCEBCCF8850BCD6595EBDA266863DD67DCF3BBCD6AE376F164E3DDE0CD7BCF51F66BDE814C0BB7CE5A23BA00F573C2B10B1BC61E8573CE9BA11BDC880883D989A31BD14351BBD50FE7F3DA13FC7BCB2A5233D0C268CBC8D4D6F3D366C75BC13A499BC3C00CCBCE93B82BD3A11E13CDDEA303DACAAB4BB57A527BAEE7608BE84D73E3CB58CF83CF18B91BCA586AE3B7197193DD40F003DBA66C0BC20DDF13C8EEE563AC5523D3C8465DA39E662C4BC88D2913C3879993D55FC8BBC18DA833D172178BDB2CF0CBDCCCDC23B2932193DE6689BBB15D564BD76D6D8BC968B1D3D9489473C4EE0FCBC7814263E6423DE3CCEBEC9BC8C539B3CA1A6C63B692EF9BC1A6035BD2903B63DB5D1AF3D6E31633C16ED243C1B57863D119D883C1880A7BD27A409BD10F8DCBCD304AFBA487E3CBDE330C0BC6C1F8C3D99CDDF3D0AA8263BBBA8DA3D744C923CAA2B463CF1BF3D3CA09EF7BC2529E93CC9C816BDFA812C3B666580BD107E9B3C5A18023C2518093D5A62573C186C7FBD222EA43CE4B0843C0E1DE23C5C5D7A3DB1657A3B8EED173B525F91BB4F0D8E3C5752AD3CD32792BCFA3D1A3D4CE89EBCCCDEA63DA7E2313D56BD743C30DE9EBC4BF5E3BD8E6A33BDCFC3A33D46BD04BDE395813DBDECB3BD5F882FBD3F84C03C8231533B7D9C62BD811CC63CF95DD73BF02A85BDD03B05BC1EFC6C3C59DF85BD78012DBC7F8780BC1A980BBD68088A3B346089BAA76B48BD1ADCE5BC3BD3173D2B72F03CDE78ACBCB5058F3C2D5C293D4E63EB395061423BC51300BE89AA933CD9E9BCBC7476113D66F2A13DD0F5B0BDC5FA8F3D4CA4B73C54AEB3BD1E837D3CF46126BD0518B6BC13FA863C8CE418BDFD66523A05551BBDB6469C3C4534D8BC9EF7473DE9080CBC7B99BDBD2EBCEBBBF3E2DA3CAD5E3CBD88C6113D91C9913D4C9B4EBAA1C3933D962711BDF0A60E3C187F1C3D5C30533D214FBBBCBBBB113D02FFB23B2F62E13CEE4C863DC30BF6BC64A67FBBA3EE45BCEF8B033BE5E5DBBBD96574BCE77C08BDAD3E0EBDE3910CBE82D8F5BC4887B33C384DD63CA23CEABC3B0E6B3B64CCD13CE79DEF3C99F4633C013AB43B3BF37DBDCE546B3DAE4BDDBC2EEC863DE90756BD73896F3C245EA93AC8F55DBDFFBF5EBCF7BEF8BC6EC7A2BDB50C65BDCF96303D52CE0EBD1DAFAB3CBEE027BAA3ADEB3C6EA773BCDC39323D82029E3C0A1EA2BAFAD32ABB4B8E98BB6CDEC7BC326E863D5BEF0D3CC122E1BC5AB3F3BCB9E4EDBC27A88EBD2BC3283DFEABFB3A75089E3C45581A3DD7A660BDC6EFA2BC54C6FE3C914DC9BC74FF06BDE00B523D07AF3BBD84F892BC30EC84BDA9ED6B3C5995B23A4D66123D6134EB3D8F8D95BD7E7D6A3CC9225EBDA9362DBD2CB5ACBD037C84BD2D5A153D086F40BAB3F6BD3B7DC24E3C1A95A7BCDC9124BB0E23223CDB87B3BBD251EC3CF937763D50170DBDE5A47BBD3105813C3C2B21BC706A463C2A2431BC728D0CBC39ED42BD3334AC3CDECAC43CFDEEF3BCE686423DF2751BBDF31C33BDA3D9C73DC066B93C9713813D02E6253D33AA9C3D3714BD3DF30D993D1CDD35BC3F0EADBAE595EFBCB7E500BD9F3B23BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:27:35'),(32,130,0xDA71E63C7EC6F53D154D9E3C4DEBC6BD9406663C9EF2353D1C4FFC3A8B8A1FBDC0A24B3D9D99B73CDC490CBCB8FD223D0E03B2BD7F7B703DA4DAD1BB8DD5BD3D9572803DC6C7B83C2FFFEF3C1F5808BDEE3DE83DB04D9ABA053574BAA780B4BD6640DDBBF6BD02BD21F49DBD339F47BD780B89BD74DAD8BC6AE21DBD4661993945416BBC88CB0F3D4A0B59BD381BE33C81D48BBD3979353DC095AF3CCEF380BC6669873C896336BC6A6C87BDD69694BCB946E2BDF6B2493D5D1D3A3D3D04C4BC7AFF8CBA2897E23BB5E9E03BA69398BC40C4FFBA18C34FBD92C96C3BB95F4B3DCF60C73D4F9BC63B382939BC2DB9343DD2A9C9BD7EF6203DA9565ABD8BC18D3B5F72F33CF5AEB0BDF07C013D633C04BD430165BD0026F8BBEC8FAEBCD08E6FBDEAA3293D1A97013DD4BD5FBDFCD65F3C7A4F81BDFB0145BD9EFCA93C13F5323CE32D9BBC9533573CEF08FFBC4A56593C10D6263C80288A3C05C430BD4FE5B23D4D32C03BC9D8783DE33A0D3D92703CBC15C21EBC837EFE3C0291963CD8433B3CFB75F13C76AB28BCBCA7CCBB15A98EBC6F7D103DBC095C3DDEA2A13DAECF923BEF9433BC91CC53BDF70D153DCF7BED3D270A6EBDE22B883C2F2A96BB8F61853C804457BC4D893BBD207951BC4EB3A33D5548063B00261A3D02E5973DE0495BBDA5E6873BEE60C2BBE802053C304A9D3DA7BEE03C1AA183BD54279E3B12140B3D593CE43C0D2458BB7F0D513D1665C9BB838E86BD94A2D5BAA36B0CBDCDF9673DA90176B9F09EE63C26333C3D5DAAFFBCC303CCBC09CD23BC07794BBACBC622BCB03BC43CDE31CA3DBC7F793D201E763D3E4F9CBDDBE38E3DD1F74C3DC43571BC5F1271BCDFBF81BDB6BB03BD6D4009BDA07CB5BD1AAB963D43C8823DF170AC3DD2EA50BD7CC887BC5CD8043DB2BB953C01C7863DF3DA443CAD99A1BDBF8348BD066A593DBD149CBC60EF013CC4E61A3D49C5BC3DCA47AB3C2E4B2BBC3EC574BB5435C93BC2056DBD7358FEBCEBA9FC3CB62CC63A858F86BD5092693A624209BD2460D73C4973513C7CE752BC629D423D81C4AC3C1389B8BCB7960D3D82CB043D6C09DEBC4BA8E33AE91AD2BC56C3373D53BFC6BB1426003B1E8CA0BCAEBE913C4327E73C93E8C0BB9B79B93CC47C7E3B9E57D93CD78F13BDC77013BD5DA1B7BD8BD33BB947580B3D8B03ED3CD4D0A93C32A29E3CE6659E3C115E293CACFD3DBDB07D4A3DCCEEFD3BB24484BD5A4554BD1B331D3CFF4FF2BC934D1BBC667C803C6A7BD33CD0B3BDBDBB1707BAB5AB133DE90993BC2016D1BB73CA9BBDAB93593D202F173D0191283C392DDA3CFA7549BD6D8226BD6A04943B1A6AB5BBE1E302BCAAF9B4BB75B56EBC8F22B7BC9974303D9931A3BD267034BD1BA6A83C8BEC6BBC48DBD83C8D6F623C4E27BB3DAD9012BD852BA3BB3D0380BD337118BDE68C1EBA0BD5E23C7C3E22BB53F6ED3CEEEFE6BDA3D94B3CD630E23C8C539D3B6971DE3CD090DC3C6F6F2B3BE75C95BCDC7B163B2D48F5BCF11EC53C672919BBAD2E3DBCCE2E033CE268483D5781C8BCCF8E473D451395BD3D2B1ABD795017BDF515073DA62ACDBA0A44B0BD914A2BBD86D4E43C642F093CA2DE05BD4A861E3E1DFC7F3CBA08BEBD7D79E23C5BFF203DC465D0BC9FCB14BC1345943D0F9BA53DEA4A073D07820A3D0FE77D3DB1269C3C013293BD70F73EBD96FF903C763A4A3D23E9EB3B879B9BBC7A99B23DCD1F833D5A349ABBA10F913DC216053D0E9ABC3B0542EDBB69DE5EBDD49AAA3C10E56BBC9EE750BC045F1CBCF0B1ADBAFFA7343C9B6879390F6C5B3C2C9812BD1261AD3BC07C2D3D9C42C8BBAA4ECE3D2DDA3D3DF99627BA75A82A3C02D5B73B4B34F5BBF34734BD9B438CBBB60689BCE9B6B5BB9457353D90C289BB7A726D3C00207EBD5B6856BD4FBBA43D37E027BD010BAB3D6ED9DBBDD83F35BDE95E42BC54916FBC6A2A8EBD317106BC14F7B5BCBEAC4BBD859A093D00BB2CBDED8491BDF18454BCDC50DABCB9DE32BC5184FB3B70126D3C9CA6DABCED342ABDA18B583DA9E7663BD73E3FBA4F0FCBBCD101703DB0F2CF3C8428CCBCFE1307BE1EE7593DC0AA9BBCA34BEF3C8565883DDCB6BABDEF187E3DAE3A853C9DF68DBD1BE1963C8F3684BCED6050BD1D67113DC162B73A13E4DC3B216633BDF4E732B9C7944FBC037A863DB4392CBDA2CBB0BDC43300BC44F404BDA4933F3C3936573D4765A83DA88971BC3BE4FD3CDE7793BD562D3B3CCD29403DCF06053DBB527EBDFA07B13C5C05A73C6B08013DD7EF70BCD2B2BCBC2C811C39681E473C1D13193C56A14FBCC6CD5FBBE9F507BC34990DBD63EE10BEEFF682BD6BE4723C83FAD739E76C46BCE5A731BB7117D53C3911F63C01C3803B1DD780BC977BBBBCD1740BBC9C17883CE795263DADCFDABD663E47BCC385FCBC7C727BBD8BECB43C7B6A2BBC65DE68BD43F3BABDC74EE23CDB2467BC7829FB3C0A8ADA3BD6E90D3CE1DA04BC5F237D3D3239F83CFD80B23C8FF8CF3C12AB233C839202BD703B493DA83D983CF5CC06BD2F0B1E3C39C71BBDC01283BD489094BCB4EDC23C18D1193D30E45F3DD7F0FA3CDA7F30BD006618BC1D62C7BB001E10BD6D0BB23C7654A8BD7C98F3BC5D8285BD0047FD3B1913D43C8CA0F53CE503013E9E8184BDA888273D4247B8BAC33486BDA732D6BD92E265BD74E33E3C9D2FEB3CAF0D843C0D28D8BBF0CD153D619E283B177630BAE9CE1DBCC6A1E8BCA9FE803D2FD0913A0597CDBDB95C1BBBE02132BCB0481ABCF893113C89B0DB3C10A8BFBC7A44B7BCE39884BC06773ABD2860123B1CD46DBD4EFDE6BA7D8F073EE70EFABB59FD4A3D055F683D9792353DA748A33DFE254A3DCC37933C8BDD373C1A4262BDE89C7EBD8A3AA6BC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:27:35'),(33,130,0xDAB9E13C35D85C3D74D19A3CC7F0B2BD61D2143D0330263DA05F9EBC625105BDA99F183D3C8C81BD0FE8873D236B1A3D3B700EBD94E7EC3C33D2C0BC9724AF3D1996073C1637C939577A183C3EAFA7BD0F718C3D004FC63CABACB63C5F3EC9BDB96BCDBC1F355ABDBAE34ABD842CD1BC0111B7BD1E3F9BBCCC69373CD12D263C89FFC23ABCF4F23C5DCC75BCD710333D78454BBD358B743D32A4F5BC31012EBB2E587D3C198C403D55D923BDE585793D34C866BD3BAD2F3DACA9263D5BE519BDB5BD41BD5D790BBC8EE713BDC15D23BDC08C933CB06F25BCDE1B7F3B2B9C493D51140B3E98B66EBDF54919BC3727893CEDFBE5BD0246163D66E35FBD54E9C23CF47C873D7637A9BDCEA2E83C5603683B2DB664BC406D273D9052E8BCA369D8BCBB968C3BFACF213DF0F775BD1FAC82BA2746F0BCCEA22BBCC9AC9F3C1C6144BCF198E9BC8DE283BB6903B43C6516833CC95E74BCAA9D123DAAF283BD38526B3C402D093BB39E183DAEBDAEBB6F1085BBB169373D1DF9A8BCC6E28CBC265200BC27C55CBCF581903CA53189BD858925BC6EF23FBCA0F7313D792F923D7FEE6F390C5D9F3BB69CA0BC7359C23C957ABB3DBDC2C5BCCEA47A3D09221ABD580F38BD1DD555BDE6D76DBD7A7DB7BCB1CC9E3D3BAAA23C7981443A9569913DE0E3F1BCEF7621BD6166763C39060E3CD6E5F13D6585243D1C374BBDACDD47BC669DA3BB86BE793DBB050D3C51FD833CF42F06BC311A80BD012992BCC4D610BD9E070B3D72A017BC2549153D2257563D7C12D43A447FAFBB6DAD24BBA975893D7D89283D6709043DDB68023EBDD8703D928F103DA5C692BD63EDB43DD52ABABC568BA5BC48279B3C784A36BD96BE8ABD02A613BD8CB5B63C9D21733D84A2933D1743043D8C0BC7BD40A9A4BD8F141D3C813F3B3DD82DAE3DB3CE07BC59984FBD507589BDD108EE3C98820C3CB2EB893867CEB63C54B5C63D9C152C3D32BABABC25589F3C43FE0F3D63ED98BDF285CE3A7AE363BDD5D20A3DABF912BD8BBCE9BC1D69B0BD984A9D3C640A8D3D7FCDFE3BAB2FC73CB916A83CEDCAFCBCE413AD3C8EFDE53C4E6630BCA4FE0F3D4838443DD3EA313D73E8113D07D6BF3CA02E81BDCBE3DBBBF2AEA53B00C586BCA5EF153D3FBD823C6C7C7B3C5E0880BD4C09F9BCDE1627BDB9AD5C3CD576B73B4EA0913C1035D23C7942DBBBB00C223DBAA1B7BA3F8F61BDCD81513DB5DD8B3C80DCA0BD75F212BD4B57BAB97E1047BDA408BB3BAFD501BD1F8AD83C84D012BE991B0D3C9483343D6E747CBD3EB20DBD28F307BDB6C4B33DE84A52BBAC0F43BDA61BB6BC1D654F3C7214B5BC497A3DBCD4990B3D0CA194BC7CBEB2BCCCB2BBBDEC0EF0BC4C40273DD53D72BD89AE51BCAE73E23C9EF2CFBB8084123D0450503D4C28753D764D6ABC5F20EFBB2BBFF1BCC691BBBCE210BB3DCED5B53C4B6563BCAF20D73CF6C71BBE396BF0BCCC30543D96BE33BD197C7BBC67B54B3CA5886E3C17C803BD57FD853C11A417BCA4213EBB782F0D3D15678CBD0164663D76C6F03C067D9FBC3EFD683D4544A7BDAC92EDBC8EB19E3DF1D4E43C18D884BDE7EC8EBB812F2EBD0EF43C3CE9F8873D7413963C29B6A73D6C7D133D1579BCBDB858DDBBBD50203D57A7E63C2596BE3C2873843DFA2D583D5D1B34BCFE600D3D8D5F113DC89F263C20017EBD7621ECBAB5B98C3D7975C63C65E9B4BC4E18FBBC20B21C3DE53EE33D2790003DE716B03D67D6623D72C07A3C082884BC32E73EBD242E42BC486F033DB680C73B2D97F33C52FBDDBB19B45C3ABEA9C03C1EF1303DE136DABC788CDABB6795473C6F68D03CE1105C3D9D121CBD6024AB3AE7FFC23BB7A4DB3CA9CAD2BCF738643B6AD0D83C8B9F013D47385DBCDAF2963DF0C6D3BCF468983CE4C2E4BDA5D105BD5FAC3B3DF78259BC5C0E433D6A4E1DBD419B9BBC962DC1BCA5B771BC71F731BD5353E9BC2E72CC3C1203B9BCC7CABD3CFDBD73BBBD1F82BDF330BD3C56968EBC579DA73B05ABA23B07A1EDBBF2F22ABDA1CC9E3B68A6D63BAABD7E3CA7BB49BCD5EB4BBC064A573D8CDD96BC54BF03BD3EDFBEBDD1BB0A3C3B7816BC739D483CBD128A3D6002CABC54F7603DC5E00ABCA6E696BDF435BBBB601618BD73EAE43C30CB6E3B37CE16BD114C443DF842DFBCB7E2BA3BC07AD0BD15E2C13C883C993B20E628BD5E69373DDA1EDF3BD58B633C233CA93DC3D9543DA24E01BD40F0493D37B5EEBCE3D389BD709C493B8AEEA83DAE7CE73AFA19F63CCE810E3C9A366A3D05CD0C3D35276D3C6658223DC561C43C6CC7803BD50406BD54A104BD33AE7ABCD0388BBDCA54CFBD09BC04BE88CE943D2BA7073CE60E01BCCB0DCDBB6246E73A47AEE03CD457193C6556B7BB3E0465BD3E3ED63C1E7114BD1247C63C1BAA20BBA28153BDF4BFAF3C0DE0ABBD805C3C3D2655C2BCCA0AD4BD0FF390BDD2A5293C16F349BD3246FC3C0D406BBD2CCD723CAB4EC4BC176F7C3D9A91A33C493F67BDAE04F13C756BDE3C934F0BBC0291883CB6ACBBBCA70B21BD294C3D3D2DEDBEBC8902A8BD49BAF43CCBB9533C9ECA573CF483AABBD710D83ADD7A71BD2AA1D8BC741D68BDACDE06BD1732103D625706BD7E7FECBC48E24EBCA903563D4C4F7C3BC385123C0AD1C63D2DE298BD2CF8483DD6C67FBC0B9217BD878E85BDE7349DBDC709ADBC752C20BC6E2BD8BCA913783D7FC00E3DFD16293CB1B85F3C6394CFBD954369BDB28FC63D924EA3BC5D988DBD505404BA03C590BBDB75363DF6C57C3C8E2C303D413C073D446A10BD89020BBD47DD4BBD110BE6BCD4379CBBA8A747BC0E889B3DE628E13CB4ECA43C20CD8B3C7F38393BA952F13CF8F6203D54B2393D9081853C280F11BDD4678EBD7EA7CCBC,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:27:35'),(34,129,0x294ADFBCD7D63A3DE348E8BC50389B3BD25CD2BC8AA0B63C5B353C3C05A863BC7BCBFF3DCECD833B5BE15D3C14DC833B0B702DBDCBE8FBBC0B58213DA748693DFAF9E1BBD6CDCB3CEF0C523D90A373BB902225BC8E5C78BC143C76BD431E463D1E2DD53C8684FA3CC2FA843C2AEF84BDE9846FBDF04FE0BCA08CD43DC21EABBAF0D7693CE3F89E3C0319043C266E5A3DABFA4BBCBA0F913DEA7E813DFFC7DFBC0A115E3DFF1709BBBE22BB3D2744263DEDBAF23B4F824EBDDD7E90BDE345163D2C85E2BBFB9F2DBCE3FAF73BC550F6BCF4D7DFBC0E48C3BD41718E3DAF6EDC3DAE1FBB3D5039483D2FADC33CF0C819BC73EAB3BDB80455BCE55EE9BCCACF84BD548BD73D2B32D8BC375727BD7D7886BC825C193D2F37B8BAB3605B3B4BECA9BD8544F6BCF6C7BB3CEA607F3B0A418F3B617D0E3D7A591CBDE3F9883D6178D7BCB7C250BB73652F3D0788D43D87A0D83C61B370BDBF8502BD825300BDB049323CFB0F043CE678123DE2E997BD7EA552BC4383C3BC2F0BFA3CFB2D94BC4DDC77BD60014B3DD9A9023DC2A7D03C1C48353DDA922ABC4557ED3C936EAFBD21EC973CB8C9D63CC98F80BD784CB0BCBBA3083D28A7763C881B993C3A3F1DBD58D3683DC38EABBC32467D3CB68DE4BC46C677BD23251C3C6EF998BC7C7B123D3A2354BDDAB6813D924ECABCFD78F2BC886837BC333DD13BE9D2983BF46C88BCC02A573C9379A3BC068359BD34CAA4BD75B8593DE14DCBBDE5CF923A1231BEBCF7FF023D42B7413AF44691BD92CAEFBC0D8FE13A494B5DBD60C94BBDDB732E3DE3878C3DC9469EBDCB1268BC17C24D3D55C3223D32AD1BBDE7F7A8BB921873BDE1BABF3CF666DABC4E6131BC39990A3DE9D11A3D1646B0BD6578053DF1B3433CC2E9EA3C48F41CBD0024D5BB16DD8E3C15E653BCD8C5193DE5542A3CDD0157BC4BEE193C3C72A83DCF3DC13DD2DA8E3BAF4A573D0CAD213D6A65253CE169943D5B67CDBB78698ABD6B76243CCDF6C43CE07514BE3EC5CD3CE5F704BD535D44BC468B5ABC23F888BC94605B3CC8E240BB906AC13CD4E825BDD5E111BC6B8E9E3D425EA5BBDC4DDE3C39AFF3BCBD3F683D2AB6033D5DB765BC22E1403DDBFCF13B83B0083BDCA82CBD5094113C63601EBD23D4D7BC78AD3E3D7936DFBC26ED97BD32D0A9BDCEF05F3DDF6F463AA6828E3D370F5BBC82AEAC3C7ECBCE3C1E4C703D6A4290BC1E023CBD555E81BA0FC05BBC338F7C3CF739D03C521725BDD113943DE04C4A3D0A25A6B98511AABD6D5C0A3CDDB7C9BC17EC2FBCECBA0DBB109115BCEE51093D3114CE3CB011C03B75774EBCFB2A75BCE6A1C13D63A7313D5EF82A3D5D72043B3447843DBD616A3C4670D4BC8275A63D77D8DABB78A60C3D8D26D63C3281183D4B2C04BD93B7853DA0C0BC3DB97FAFBD0F261D3D7EC6B8BC707C1ABD90AA163C4F2B3C3A03820D3C1392FBBCE6632C3A205883BB3836273B2EDF29BD07B28BBDD2FFD1BD65EFAA3CC459A0BC4B89C03CECCA193C11AF48BD1276673D729C0D3EEE3A51BD81416DBD6545E43BC1123FBC098BAABD6C61AC3C25E1513D319254BD6A0F0ABDDA8A9DBCDFB3E83C1A2C0B3D5D523EBC8F7D87BD230B5FBC0BCB38BD38E28DBBEA436DBDB0D8A0BDE9C0093D7E4DB1BACF22B43B1914593BDA6F723D127E90BCE8AE303DC9E1E53D5BECFB3B466AD0BCFE4B60BDB740F8BC4D61E23C11EA5A3C9158163DAB20BBBCB0D0323CF76C293D6E2F273D84FF3BBD8BC5E3BC43C0813CEBABD03CE811CDBC21469FBB2EEFE63B65F167BDAE938D3D0449383B4557A23D0BEDB43C117B6F3D09C1863D5DB32C3AC458633D83EA3EBCCC90F1BCE8D2483D5DCFDC3C8F4438BD3826553D817B14BC34DAA13CBCA351BD868A453CB2A5C8BD99780FBDBAB0B5BD95C6863B12298B3D4998223B655082BDAB6EA2BB2FEDB8BC2A6118BD6655313D457900BD9EC04EBD12830D3D2A54C43CFE5F26BD8F09693B6D53433C203E103C251B48BDB704B2BD06C8F33D4BBD7F3CB8BE1FBD07A066BDBC66003DF7AC0EBDF3B8A6BCB1BC4E3C0B98B2BCABF0823B30EDDD3DB3099BBD005B063C1764663D27D38D3C87DF953DC61542BC0878913C30D449BC9D5522BC279D18BD06CF15BD5B171B3D9F6C423DEEDCDA3C72FC19BDB417783B74B9ED3C6912FEBBFE025F3B8159193DF4A5CDBA9848353CC9C55EBCDF12053DBD1C9ABC0B9109BD138250BC51560C3D77570ABB6CE1983CA31DA93DAEA28ABDD0F3AEBD35FCADBC6EBF2B3D197697BB95473B3C8B07F2BADE41D03C35A14F3C69D1D83B8AD40EBBED1D11BDA281583C7A3CABBD51E37F3D327223BC801F513D2E6C523D628D6A3D88BED7BC74BD1B3D5717B43D01133ABB954718BDFE682F3DBECCE13D8FB7C3BCAE92633DEA43FE3CCDAF31BD56F1CEBCE0350EBDC4512DBD5C82293DF5B8413CD879163D9B2177BB10772E3C56F3ADBCA740783CCBA495BD79FAF23B0C78D93C52B2AE3C4217B5BDEF3F6C3C08609C3D57238E3D81E590BCC648B83CD33449BC75C3C5BB365695BBCC93823CD3AD20BC2821FDBB8F59EEBCEEBEAF3D6387573A6BD361BD2848233C6F37C7BDE98C95BD89A1293D8E4704BDE5E1ECBCD1900A3C4120EA3C383AEC3C3507A33B9A50CF3B66F81FBD2B09A13DCA1399BC85F3C13BE15F073D4F01593AE3387ABC2B09113D85EBD43D9B1F013B1234AB3C3ACEAD3C27A0A23B62F0843C3EA239BDB850493D427021BEBF348B3CA5D019BD17A887BC5B92A63DEC9D693C4AD531BD9E53AD3C9E96F6BC7A82B5BC8A330ABC2F51AFBCEA778BBCD9568CBAA7C8533D319691BCB83C86BC110E19BD6182A6BC6F27A3BD97BA713C567D913C1EB2003D5E7186BCB8042ABA427CD0BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:28:20'),(35,129,0xA637E2BC95FA963D2597AEBC7292953CC7887B3D10E3C13CD521BC3CDD0110BC5BD9CCBB2924CA3C09476C3DC3000D3D860E053D4E168BBCFC830A3AAC19C03C1F98863D73C0D43C1196C73CFE91D4BBCCDB40BBCD88ACBBD3AB36BD148029BD179488BC862F333D5693E73C87FFFDBC95EA98BBD840043D30D8073B81520B3D913234BD06EEABBC260B46BD6D8FD13C87FF04BC7904313DBC1FE3BC7BC5A1BBB625BE3D42F7B03C2C001FBD2126533D65572E3C0FBDDF3C36414CBA7670D8BC34A08B3D121D163B8414743D029181BDFBCE84BD00BA03BC0DCC96BB8DA437BD0E38C93DDAAF41BD848A88BCC6B50FB9549AC1BDCA9022BD22A2DE3C289E03BDA4CC943D51679EBC186EC8BD7A6752BDC43A453B824242BD33FA923D3EA57B3DBC1BD83B516178BC63BF103B9380463C7B749EBCF38CC3BC748360BD4E4F6D3C076A0B3D7B1D8ABC6CF7BFBA9C070BBDED59DDBDFB2942BD5C5B5DBD8217043ECB4F9BBCCE97503BEC52B13B98969ABCD47B0DBBBBF2E0BB9CC06BBD1ACADE3C8C114F3B6ED9093DDD937EBCC1B6DCBCA15C85BCF88846BC12D55E3D15F04EBB1A57623D97E942BD6A33BD3B4C5285BD39BC033DB832533DA41B92BD50FF823C623FABBC83F8283CEAA821BD479F5D3BC084BD3CFB7234BD1B6DB8BC398C06BD2395FFBC9D7C093D028FDBBCA7F46A3DA624C1BCEC5EED3C54E0B83C299B24BC6510813C29C65DBDF3FFEABC8FD8B53CC8FB33BDDA55753D30F4DD3CB170003C61C10EBC8C07FB3C761CF13C4AFAE83C901EA8BCBF47B6BDD4929F3D58EE7DBC7EF288BC8DCF4BBCC4965E3DD3B5A93C819571B765837DBAE49C6E3C20D49C3CCF634A3CA9802FBDA9B61FBD04D4223DDB3043BD53D0BD3D8EF746BD9378D53AC7E0B0BD9513413C23179FBA1405F3BAF06E0BBC757558BC2D73653C4C1D85BC099C883C89EF243D6A2CF638F8A729BDA34D26BDBB9A5F3BB4898CBC5BDAC33C3EFC4EBDBE3DF7BCCED7A4BC8A3CB8BC05850F3C9EC492BC146F67BD9FE7453D8197CB3B3C7AC6BD4D46AD3C5DCC793CAA478F3C05053E3DD3D4223D20586C3C6139B23CAA233DBC6F098A3C956F15BDC4B9C8BCD1B9BA3D39D9F93B1394BA3C337A43BCAD8F1E3DAAC62B3CC49202BD6255B13C11BE3FBD6D969FBD24B736BD32E64F3D29FB05BD4BD80E3D3578AFBD1D19F5BA5DDD913C1DD5333DF32764BDC7A81CBB0536913DD19981BD937C7F3CB78E6DBC2F0919BDF2E32ABD1006863CF3A1CC3BAA785ABDADACAE3B006AE03CB6228E3C8FDA0ABEF78A8CBBC520D13C78487D3DE20F02BDDA31D2BD4144263D64E9203D613112BDC4FCE03B9F98F23B3C0CABBB0EF18E3B06201DBC575D6E3C90AD30BCC0AD9DBCFCD712BD3DEB7E3DBF83113D4315C83CC343943D931F0DBD154B033DCBA1F23C2E90673C23B9E93C0A43923D4ECD803CFCD1AF3CEA6EAEBD59D49FBC73D3BE3CB7CB47BDC1A5A9BDEBFB32BDCCA5C8BB30AFB13C0EFD133BD33E3EBD29665ABDDE42753D28A4723C5A52093D7DF2DDBD6A02C63CB9D634BDEE7304B9D04A753C113DD63CBB1382BD883BBABDE6D1173D139BBCBCB75570BD4B8E9A3D22A1FC3BA2C15F3D709A87BDEB1BC1BCC6CF273D58E00A3B849C4ABD58F6F03DBE5CAC3D2E83B33BC75068BDAAC7983B92ABC5BBDD84313E5105373DC41682BD733DD7BCD67C8EBDDF48C03C9B6AB4BC67DEE9BC1F81803D1560813D0438D83CEBAABBBB21A367BD682EECBC8DD236BD8BE23BBD35A8C83CCBDDEEBCE49662BDD41F54BDE483983DC196103DC83C9D3DF3F2DABDC8DB403DECB3653DE97188BD0BE4933C9CE0263C576D84BD3394CA3C3BE3CFBC7AAC99BDFB39FF3C240B9E3B06E8B2BC7F122CBDFC2F0CBDB85F17BC518FDFBD1A68FFBCEB44FE3B805E29BC556132BD4CB7B0BCF080ADBC1B3D523DCB7EB7BDB1AA1C3D7BAA70BD28E5EDBC9D00413DFAFC6EBD82A5203DA172C6BC35AA0B3DDEB26FBBCC631BBDE68F603C98EC963DFDAAC43BB624B43C612BFB3DCEA28EBC7358E83C70C8D7BC0D7279BDC63D193A69B6D23CB466613D63439ABD51C98ABBE56ECFBC9F42AA3C215A003CCB8055BD13F820BCDF946B3C9A8CED3C240B1B3DF146C63C50E45C3DCB99773C5624FCBBB6EEB1BC620623BDEE906D3D4403CF3BC5D72F38CBB6653DD367503C30F689BCBA2783BAC374273D0639A93CE187753D375488BD3783233D10CA06BC372671BD9909B53DE49083BC8CF531BD235301BDC3FD03BB0857213DA63B1C3D77D0A63C9EF9063E94CDF8BCDEC7B2BB25A70EBD1815B83D899B443CEE6FF7BC09D213BD45E7D0BDD201CE3DB79A1E3D13A0813C923B94BC4863873D36B304BCFBFADD3C6B3627BD0EE0ED3C318DEDBCE0DF37BC62A0013D3131D23BA678E63B25131D3D27BBF93925A04E3DCD86E33C34CC023D9DA185BB9F1F46BDFF0A6ABC27578C3C15EA2FBD6F7373BD4862643CABC75C3DCB5D303D403475BD5F1CC63C524F223D0E84763C5DA851BD114A4BBC5F769FBC365FA63CD88523BB55C7D93B779121BD5BE908BD4DD8DF3C9E22B03D4B7E1CBD118968BD48086C3C5C0211BDC0E9CBBC1B96BEBCCFD170BD33A74B3D380D2DBD450298BCFB34743B87BC12BD926E8C3D8F0EC9BC858ECD3DEC29133CE3FB82BC89454DBCF89C5FBD342422BD3CA8183D39D36BBD305DEFBC74BDBB3D0280D7BCEE71723DACD855BD36503ABD7C2AA03D33C3D1BDD3610F3DD0C7EDBCB37A8E3B7BA951BC4AAF2CBC0EC1CD3C3CB0B6BC6D27843BED0B113D605F553CC825C9BCF87968BDD3F7BE3DB2D7443D8E45E23B17386B3D367612BCBD3E4B3D4A2475BC241365BCBE551C3C59BF4E3B7926EFBD1916EEBCA477A4BD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:28:20'),(36,129,0x8231BBBCECABF43D9E3663BC1687B0BC555D313D93A4AA3B0C7EDD3CFAF79DB9C29A763D841D653C9DC3653DD8EC3D3DC918CCBCEBC50A3C87D16A3DBB9A853C37089F3D917BB33D686C223DCBBA22BC258C3E3A554FC9BCDEF5D1BD7244393C258E80BA4E6F013C453E553CCC6223BD475243BDA67187BD343E323DC6AE973CEA80DDBCB4BAFC3C6B5F96BC39C6AF3CCFC9D5BC6FCB4F3D9D5ADF3C3D62CBBCD3ECC53DC83E823D93AD51BD69DC683DB32110BD86BDBF3BCD308DBC13E75ABDB0FE32BCE99645BD51F8BA3DF9EA3BBD1227AA3BD23E273BA34BBBBC4A0F923D402ECE3D3F279C3D563EDABCB6212C3C3956B5BDBD8B86BD77DE3EBDE9ED86BD2119983D64AF42BD53EC2FBDFFFACC3B6ACD9A3C750296BC161321BC9786CF3C55BD32BD648942BC324B0C3CAB90C03CE87407BC51CA0ABD788745BA455379BA02E00D3DB12EB2BCC3A0523D8346F1BB56D014BD88F1803C67E4A93B75E1D13CD206703D2CD83B3D442C33BDD6929DBC934FC1BC583D333C319054BDC0B72439B334663D60D08A3DD8EB723DC295003D90B480BC4908B83C9657573D67C78FBC38B97E3D7C618EBD7E12443C88E3BA3CC77BC23C5679423DB7EF37BDF5D1383C9E06C63C0DF38EBC721190BDFDE921BC3F2C063D082725BC678F0ABDB3A948BCD0F99F3C185E263CCB7A9ABDE2DB493D75A7F4BC5DF0903C3CD2B0BC3953EE3CA4EBC63CC39C893BCFF7173D660ABEBB4C9581BB3AFE9E3D0BD79ABC078405BB723A6ABC974A84BC1BBE223D44DE393C77A102BD868FCBBDCC34323DB423C7BCEFD816BAA24316BDF38E783D5520013C1681953B8B9A28BC50FECD3CCC0C583C0B9119BDB4288ABD25F303BC47A01D3C79AF8CBD30FEAB3D04F6B03C37D8D63D4012D2BD4F9D72BD3545963CA30715BDEE14C43C3E78E93C2D885FBC6D9F7BBCB07B7A3DF56E213D6BFB893C016CA63BE12B11BD46449D3D57D84A3D06A5A9BC9CF6E2BDAEBCC03B3FFA18BD6D8935BD0299133DCAB8B0BC7D551FBBF8440ABD93B067BCB281813CE07AC3BB79504F3D3651D7BCFBA16B3CBBFB123D8DCB6ABDE635F7BCED5279BCBB5B0A3D3F7F6EBAA6C013BDE3DDB83DC6D1E03BBB3E0C3D2C26C9BA84C0B63B4C9C663D9BC134BDA4BF103DD58A593D2E55A5BD79822FBD05CE71BC2DBB2B3BDE1C783D3C960ABC9833823C9AC00ABC184F0D3DDB2008BD69DC563DEB86553DCD631DBD89D08B3C3597193C3D90C2BB45B9FF3C1AD5FB3CF7C3853D4946F4BDEFE3F2BC72D3613B0E01E4BC76CCB0BD77F7563CD7E122BD89E6C5BAA7D6B0BDEACBD43CF45B49BB4348683D62F1D53BF587973C0EFC2CBD36AFCBBC5C21003D931703BD07CB093D428A40BC0953AE3C9024963C83DFA73DE59759BD08AE1B3DF400E33D857FB7BDA25A173DD3CE67BD93CA7BBD9F062B3C2001E63CB87720BD7DAF21BC059EB8BD95B7B5BCED893FBC69AF8EBD0CE69FBD5CCE84BDA89FDE3C52071EBD017ECFBAB873483DCF1A80BA8A95C63BAF61943D0973B03C91723CBDB5B658BDDACA68BC1B9160BD15A994BBD1DC363C36FE6DBDBEAB3BBD116ABEBC045ABBBC13FFD2BCB91D27BB49E9E8BB5BEC2D3C81D63DBDE961823B3205A2BD7EEC56BD6D10BEBCC017293DC7D1A03D6C6AAB3DAD03C83B68D94B3D2178033D57081C3E98AABF3988B467BDC44FE7BC8D5B32BD18CA833C6AEFA63CB39E0D3DA6F59F3D53E30D3DEC4CB03B2F94223D2E3958BD7D6D38BDB73A60BCBFC115BD00B5B4BCC7D4AB3CD0952DBD60C1ABBC3D7420BCBD57B8BC7BE53E3DC66AEABC6EF6BC3C4203973D78373EBD03B5A63C1A8829BCD75DA4BD624ABEBCBE43D73CC1D8D8BD22614F3D677DAA3C44DCCCBC783536BD154323BB131AE3BCA911E6BC124356BD24D735BD8787923D55F89BBDFC062C3918959DBDABF9383D87D0A4BBAE5A19BCE88876BDB2447DBB40E9BFBB084B543CC7862E3D4FFD0BBD4BC83C3B4D651C3C8C094DBDF736633DC85E813D213305BD4EC41E3C5A5F4E3C4D072C3CEA2718BDC05A3ABD5BE7F6BCCB723EBCE80F543DC043A33D1D91AEBDE9C75CBCAD12ACBB80001BBDC3078A3D239151BDCFDF813C3903983C935CC7BCEB0D0C3D5B28A7BC861AE13C4C11E7BB73B7143DB84A953A14D754BD19F30F3C303FE63C8A69113D0F24513C9FCF503C40566CBCBFDA6E3C11A3363C4EAAC0BBFA0BF33C23C087BDFBB286BCBFAEB9BC5FA2CFBCDDE88C3DF12F26BD4DCB623D4B6CD5BCCE99DF3B948F243D83A7BB3BE567D5BA3ADA513DAE086DBD4843503C46472DBCBF7A6B3D5C1210BBAD9929BD09275EBD9786EEBDC7C9733D96BB223D9B28B93B1B86C7BAA2230A3D5775D9BCDB3EAD3CDA925FBDF56D13BC9483573D2AB324BD33FC823D388458BDF5A6CB3CD944AE3BC175AFBD61F60C3D239CE4BC596B553D2BE9B3BBBFEE6EBD191740BD5C4DA53CB2C669BCBED876BDDBDBDC3A4C993A3D7401533CED6281BDD088683DBA6E943DD5FD2BBD845A96BC02BCE2BC8897BEBC51BEB7BDD80CD03CADED26BC2C2910BC7EDAB2BC87DF56BC0A3D763D220C2A3CE6C077BDA12914BD9C3773BD9D4258BD152EF7BC2ACCA33B94474D3D2C4DE13C72EA3D3C4FD2853DB513B3BCACA1AF3C58BFB9BC1B93EE3D2A394B3DBC7593BD5191D4BCE9DE19BD777EDB3CB922A13C03B73E3BECDF5FBDE577563C7CC1053BBDFF3B3B43A204BB6D225FBDD9C9043E7819B5BD01F908BDDCB53F3C2DDA0FBDE9B78F3D8EBB9CBC5FAC873C99FD9CBAC3E805BC3085963D7C9576BC2C9494BAD363A7BCC3F7E03DEA8AC03D9AE44BBCFBA7EDBC2B7957BC5C38963C768F6FBC722A1FBBDC6BF93CC589113B0B0D85BD00A0BA3C546F07BE,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:28:20'),(37,84,0x7A1164BB7343273DCE8DB73C8DCD423C2E9192BC9C3A69BB23CF65BCDDED323CBD374E3DD81240BCB5CD9E3DF2BD1BBDB4CEA1BD6C927F3CAE351F3DABC3AE3DCCBCBEBC850D393D3ED8623DE7D4F6BDDDB9A7BD0B38443D0EE91E3D57D312BD9E6AA33C855C603DBD6D4F3DBE2709BD0A4193BC1F5D363C60F0753D7AFF0E3DBC172D3D0220B73D3AF2063B15B426BE36F038BDD82327BD27CB4EBD7F382A3CCC059F3C9091D53C25E9373DAD3D7E3CE6117EBDDBF62F3BF439113C27EF9EBB682C5F3CA7CC9CBD39DBBF3CC1C2013DD0961ABD0DE1C1BCB35DFA3C88A0883D770C9E3DC62D34BCEEF3DF3BF36201BDA23ED3BB416F0FBD88E63A3CD4202E3D9228D53AD43C293D12C4BFBB5F47D13CF90F8B3D7A13133CDE30E9BD5BE50B3C5783C03DCBB7B9BBF24E8BBC2AC8513DC9AFD63D5CEC2D3BFCD3323D16666FBDA5DFBEBBC8E074BCF4E1CA3C24BDDB3C114CB33C5C0AB23D91FA4EBDAAFAD43C41AE55BD7AB84D3DF872CBBD0CB80CBDBFDC0A3D1D05713D0662563C4D39E2BDAA2C253BC0110BBC32D9E2BAF9E5C9BB9C5F0B3BBCD3383D4D877CBC7D1DA9BCD3B21B3D8971003D3CB6813D8A858E3DE056023D9F36643D31C70BBD2853C93C7B3C80BD2EB1093C96EA363BB139DD3C15AB0BBDCFB7A7BD1D0D17BC8EE24CBC90022E3DFCA52DBD3742FF3C11C3053CAF84993CF8C458BD9EC487BDEB15263C7D55B93D2F88F9BCFA53663C17870FBDF66C73BDC1D744BDAEA90FBD744C333BAA16E03CE6DD91BC8C45063D8F9D20BC588B7ABDA8F3FC3B675A903AA71DB43D769439BDDC2FF63D5218923C6734723C5F79583B9503DE3DA5E028BCA276FF3C0F74343DB870BA3C034E55BDD9C5693C94E185BBB4E22C3D7A4B323D65A99C3DEE71F9BDB79258BD00B8C7BC57E683BC00D8E93C65D017BD46DA963CDE6BF6BB2779733D7A5164BB46A8BF3B78E68C3C992D2A3BC46051BD1EDAD4BA494D6B3C6D773ABDAD4308BD2E9E653C7D8D323B478177BD76269DBD7CD8BDBCB92229BC51F0BABD82D36ABC9CA54BBD557DE03BE385BDBA7423C73DF187B73AF1C4BEBB6A71F73B452C44BC6E33B33C6547BA3C5296A8BCCE6ECB3CF6E43ABD50D55EBD49F8263D3869363CC26C48BCB27647BD191CE0BC1B39A8BD940B7ABDC4E9DBBCEBE4ACBCFBC054BC5B250B3D5632B6BD7CC7313D42AAB33D5F268A3D79F8ECBAFAE2D23C185F01BC72F41D3CF4348BBC45B0F13BB2404DBAEA92D53D998BB1BCA946073CB4B190BDA4A729BD177B17BC0FAD923C65C35CBC66CA813DCA724BBDA489DCBC1225DE3BF139B43CC448963CB269FC3B420331BDF11DCDBB88A3793B29006E3C6F4215BD455C51BD46465B3D97F6D3BBC5D30D3D4BAC14BC022051BBC26BAC3B1542A93D53BDC83C696FC3BCAF2FD43C06CCA13CDC1ED9BCC71A783DDB32363D27DC463D1CFD103CDA8287BD813E17BD1EBB463DE8BBD0BCB7A6953D592226BC98DB9B3CB64B2F3D6AC70CBD359FC03B8F4086BBC00ACA3D10FBCCBBFCDDC03BE90D44BD040453BDD9AD243D6CC3823BB08A8B3CA6D752BD987547BB0E0EC3BD2321733D53B7953C6296BA3C0A96AE3B41F1123B40018D3DCF2C66BDB91E41BDD77EEC3C463D103C9D979DBDBF5E193D6DFED03D3BD462BC317D31BD82A3253DCAAD0C3D061C53BC1AECAB3C2ACE863DBE1DC2BC99D8FFBC646F1D3DAA0E69BC922B7F3D46CB933D849F223CA9A5643B1B2EA0BBF6240CBD6DB9A7BCDCDA52BDD42EC33CC013263B93A6C5BD7DBA24BD619AA53CD44D16BB5D51883CF02B523DF30B14BCDFB1333D8A3CAE3D8D6E443D8E9AC73D406AB33C158581BB03BB843D5B3632BDEBFC0EBDE182413C0DEDABBC9A097F3C827C66BD1AC3453DACC0753D33FC2ABD8B1433BD8390493C5C22B2BCE246C5BDAD96C6BCCFC3033DDB962ABD2695D6BD51D3DCBC5722C6BD9F081DBC0EEA243DA04771BD19BD2F3D6F2EFDBDDABE01BD02CAB0BC233A77BDB8D261BDAE1DE43C2D94933C473F82BBB862BCBC2DC5453B914B2C3D7A21013CB56F82BDE8A8813C4550633D2BB2033DED353F3C94848B3A2206D4BB28E38EBBDC1CAD3D03C4D93C5B56803D90F7023C3B421BBD5158293D6E1E60BDB6204C3D05C0503DA24803BD20C2783CB4D4BE3CFAC655BD271DF4BC04433D3C253C383DCE4994BC909168BD9461E3BC737E91BD357B883DA25F7B3D5EAE88BCBE3CA03C1463A73A8263F1BCD421723C4E23C13CD28BD83BB30ECCBD6E9ACE3C717DB0BAB194313C81D88D3D1E65C53DA84E7DBDCA53323D0EB88ABC8B59DF3C2360FFBA005BE8BCB18F413C453A03BCEFC27C3C057A53BDB3048DBCFC1D06BC0A9A933B1C9AAFBDD4CBD03CA6CC83BDCAE92DBD6BCAE93ACB04B0BC4ECDF63B20003A3D4578903D82CC48BDB97511BAABEC0A3C6D1DF6BC2D9F89BDE99F393DD6E0D63C1EA226BC0DA6D33C15F1293DD1759ABD6077E43B76A850BCF62AB33CC882563D90564BBB87A925BDFF73D33CF90C3C3B4D72D4BB8208923C0BF48B3DB9C5923ABEEE5ABC7B901FBDEFDD483D2F79143D746E24BDC59DCB3C0B5B4DBB98BB99BA8F0F313C432AC3BC6245243D7264133D230794BC23D3903D169DEC3CD85EC5BB270D12BDB676673B6BF1AA3C15EB843D8F32303CCA8E043C76FD60BD145940BCA4442B3CBC1B183A217A2FBDE98D0CBD3E70B03DD3A5773CFF48BCBB9D6B9ABDE69906BDE57AD2BC770119BD6BB18CBD398BA9BC2A8D45BC7455153D8ADC17BDE5018C3D72DC523DEDEB1BBDEBC6603D30487D3DCA4A68BDA644FF3C001891BD5E1FE7BC5938B0BC49D5913D87DF083D1C60F9BC2042243D590910BC5FAFC83C4C390CBD60DBAA3C991B713CF8D63A3D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:29:27'),(38,84,0xF06F2CBBC261063D697EF63C60C5EB3BA0DAAABC926385BCE0161CBC0F07C13C061D463D7D72063B1D50943DCF7D97BCCA93C9BDC10F9B3CAA15C63C454BAF3DC861D7BC4F95A53CD73C6E3DA1650EBE3198B5BD9B073D3D2A43423D253BB7BC8278A03CCD25333D4F6C573DCEBA4EBD2C6679BC300B85BCB51E7D3D816FC13C4D5C3B3D9CE4EC3D3FE7593CD07A14BE3F9D34BD7ABC1BBDEB780CBDBBFA663C1051C93C0A89073DD832293D5FEC0D3C084053BD5D64E63CE07E543CC01A993C10CDD03BA71D77BD1C1B443CC117683D61322DBDA61FDBBC348F263D92A99A3D1089AE3D2E730E3C9E6F413C8C9834BDE10467BCD9F215BDA338263BCD06403DAFA4AC3CC409253DEBE0A23BBF00803CAA91A43D2128093CA8C0E1BDAB2BC73C1476B03D6722C7BB3816CFBC71323E3DB5ADC53D81DAA2BC6100DE3C4A3991BD048706BC7832EABCD7F4153DF959D13C9A751D3D5614B23D3E50FFBC3AC1153D6C1B42BD5C14783D32CFCCBD0BEBABBC6E83AC3C9F0E703D0F28973C1AEFDEBD762762BB6F8962BCBE9608B9E6748FBB0A3DFCBBC858543D1E2A4FBC65ECCBBC68911E3D54CC443D346C9F3DB71F983DC6C2D03C33EA823DD713D2BCFD8AA33B606C7DBD3887A63CD4CAFA3A0A292E3D8509E9BC34618ABDD9E98DBCF0833FBC788BFD3C6D7642BD2CDB103D7279533A6DFA263C71354BBD0AF4B3BD812DAABB48DFB03DC943D6BC5E6E483CD0D200BD7BD610BDCEFA49BD0B145DBCB5798A3C5FD4CD3CCF43AEBCC60F463D975D0BBCED1A8FBD24B0643C1614EF3B97A9B93D3D852ABDDBE3FD3DB8EDA93C04D8733C7AE0163C26FAF13DABC9D6BCED58F13C3E362C3D60A2DF3C5C083EBDC495C93BC0CD4ABC2796D43CFEF21B3D56F98A3DCBB4BCBDE70A78BD11A558BC63739EBCC10C263D0C8CF7BCFF05F73C9A6C63BC2402083D7BB1403BDE0F4D3C6C22A43B779F883C966B5DBD6AD790BCC8773039654D01BD87190BBDECA5E43CC0BAD0BC70E578BDB35095BD68DC1FBD8D072FBC4FDAADBDFB4753BC7B9F1ABD85392F3C675D503CDAB9D33DCC8210BDE46836B93580333CD63E8DBCBA90A53C5657E13C13E4C4BC7D33023D411230BD8DF44BBD58F6363D99B2983C765069BC766B28BD7F59C8BC64DC98BD690B6FBD066C95BCF54ECFBC6EF72EBB5C36093D3966CBBD30C1483D83F9963D1EA9913D802645BC0061AB3C098AACBC3C49703C0D61D5BB90E19C3A9E9F3DBC0781E33DA5951DBDA8BC5D3CCF946EBDEBFF93BC14FDC6BB6087913CFF411EBCA7E27D3D0C5747BD6E3B06BD1459653C531A9C3C26902F3C3A7D1A3B70B2E5BCF2BDD1BBCEBBB93CB465AB3C82CE84BC0E3F54BD87C9373D0BBFC33B7D8F0A3DAC2DB5BCEE6B19BC9CB1553BB76FAD3D5BDD603CFE89CBBC51F32ABB7A07113D2A3210BD085B873DA38F383D642D7B3D1DF8873B81B747BDE6EB10BDC0E14A3DEA3572BCE150AB3DBBAC70BC4858653C4CD50E3CF5CBFBBCA72F0C3C70AD2CBCAC63933D457996BB884D883C626E54BD2F972ABDE1C6293DABE0593B5B31013C109486BD1948023B0B8AA2BD8299223DAB307F3BF5A6D33CB7089939F06748BC9B0C8D3D5F9A52BD2BFB73BD0CE1963C8FE7883BF6488EBDDBE9DF3C181DA43DA367CCBCD22A26BDD3855F3D254DED3C0976C4BCF3ED973CD08FAD3D732911BD51ECFBBCD06EA03C0CAF71BCB1A3933DF4FD923D52BC5F3BBF8594BACF129BBCFC88F4BCB9A1A4BC1EC507BD2E3E553C66ADBA3B6E6AB0BD213216BDF5E5833C5DBF7B3C9E2E083D17FC593DE7D05F3CDD64173D8747A63D38A9593D8A1CC23D8B068D3C82D98EBCDDA11C3DB1553ABD58602EBD77D6AFBC4E6C15BC8A29613C7BE237BDF2151F3D4978533D222C07BDD2E542BDC245A03C737B5CBCFBA9CDBD154420BDB2D5EB3C645050BDF3DCDCBD7F3D20BDE0A3BABDCBD8BBBC5950113D42F350BD3F38B43C3CF90ABEF6F616BD195B8EBC913871BDCF1A85BDFD97FD3CC2088F3C3213CA38129A283BD9BBD2BB4ADB5E3DB9D51F3C363A70BD3859A33C33FFF33C5D1F553DA708173DE1DF3D3BBD662ABC1B8004BB9EBC9F3DE112E93CE8379B3D13F30B3C01407ABD197B053D02526EBD5473413D446F5B3D88DE6DBC52DE373CCE04293D4FC0E3BC7288FBBCAA9E1B3C7511443D4E66C0BCE98259BD69C6CFBC28BF81BD6D50933D022C823DBCC20FBCAD9FBF3B670500BCE41E13BD6735C93B9E073F3D2B5B1BBB04A4D8BD3405FC3B01FCDE3ABFAAADB950207E3D1B0D9C3D1CA276BDCAF33C3DE81686BCC0FDF23B8DF666BB7E0740BD6062473C170758BC2972D33CE5FA25BD28E45CBC0EFC213B7153853CF9EFC1BDF5841D3D018B3BBD6C3A6FBD6DAAB43B6FB8A4BCF2CF9FBB5B08763D8D71A33D2893D5BCC905293C20871FBCAA249BBCC63883BD5809473CA511BD3C18A845BC81FB333D56BE023D12F33FBD783D283CEBCCEFBB55C7C03CEF75853D79D030BC881705BD31AE803D4717EABBA71151BC4A99953C38C1583DEC3B0BBCDC6719BC99CC25BD736B343D13128D3CB8424CBD5D94993C02970B3CAAC8EFBBDF2F3D3CB981E2BC4C0A803DB1A11B3D70B897BC6E6F953D23841A3D3A1B06BCC24C0EBD22D31FBCB639C13CB30D033D5D9CC7BA713BB23CEF3341BDA201C5BBC131173CB0D234B90A0B33BDA045CBBC0748C13D0EC4A43C804193BCC45ABCBDC24086BC4150EDBCEB9F3EBD7935A2BDD5E902BB2F21A1BC2ACA123D7E8025BD67648B3D2685E03C17DFE9BCEDC6553D1626753D9E1871BD0304E73C7E628EBD276037BD3BDAF7BCADB68F3D3867313D0F7E1BBD938E513D68DB013C8789F53BADCB50BD3F81AE3C0F18B83CE405483D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:29:27'),(39,90,0x37FF903C750C753D3B2986BDFC5C2DBD8CCC63BD225357BDA23F9CBCC678FCBC8342E93B2521C93B8E0E673DEFF1633C906F553DA35E443D5BF84E3D6195053D7AAEFF3BE94ECF3D00B97F39C3B7023CD30FC0BD24A786BC0848A4BDAFC552BDB5E7BC3B7C8AE83C2601FF3C0C9A8ABCA6E42B3D07FFDE3D7B2C743D142301BD96BC763B3F88AD3D58DE053D679D943C4D8B63BD2B13A4BB487B8E3B07851A3DAE6F783D2B2997BCB113F23C657C0B3D23E50BBC530330BD4D7DCDB95B10FABC5F4025BD366DCBBCFED4F8BA3CB09ABC056935BD3F28843D52918CBCE2FCD73CE595C93D5ADBCABDF37101BC0ED8A43B8D08A33C37965EBD56CB60BDAC93EDBC67D38C3DFC1C5A3DBA3F2ABDA554E03C1520273AAAF4C63DAB62CABDA7F0443D8CCBB83DD22EFA3C320F073D3330C8BB7FFBA43CCC7B07BD5F143A3C3C8D473DE87CCABC8E1ABABA67A5E23C64DE9DBB956BD1BB22C5453DD174C039FE10463D6BE7DF3CE15E28BB9A74F6BC230A67BD4D1DD4BCE1A70A3CEC492CBD939E76BDCC095BBC68F55CBAA22BD9BA080253BD0C15623D477795BD90B830BC83639C3C03F9063D978C81BB64E9913B9EF1933C04C8723CD0AD353D87C4D7BC7ADDB93C0EABDA3B6C51EABC32173DBC5E891D3CF7C6F63C9194C13C3736113CE000CBBC7D80E5BCDCA658BCABDF00BD812FA63CFCAF523DFB04F13C421B1ABDC0F08F3D7D0D1A3CAD87E7BC685CDBBB6BFA9EBCDE754C3B728545BD4C9EA03B6C164C3C5A96293D4423F9BCFC33443C137B79BCBF031EBDE4B906BE490DC6BC0D6266BB54EB99BCC6ED20BC3C2E943DC10B26BD7B323FBC97A276BBB3FCA4BC13075F3C6AC5DA3C9FAEA23C6A9A2C3D19FD30BD70331ABC76D62B3D7DE78D3B743E8A3D0AAB62BD855C403C472C303CBC8783BC80A18CBD7463BF3C20EBB5BD834D85BB1F2EB93CCCF010BD3CA89EBC2ABEADBCAF2EFE3C86EAF83CB0CA593D84C0913C77DE8EBD626489BDBCFC97BC84CE533D2895293C09151D3DAC0A96BCC775C0BBC7B5EC3DAA801D3D081123BDFB733B3D90069FBDBBDA6A3DC35912BD7CD188BD9A76F3BAB784BA3C1B10B4BCD4341D3DDA7D2DBC480924BCAE3A27BCCB063ABD6E9BB8BCECBDA73C13AA97BC5F8F0EBD2D0D1F3DC6511D3C26DE853D9A26FFBB06B127BC0F4E353DFEB3ACBB278A83BDE8AB503D9D28943CB61CD63BA968173DB2B26E3DACB6583D29742FBC56BA05BD0469E33C9D06483CFB0956BC861C123C83BEA13DAF00A1BCE33192BDD7659E3C97FA2ABDD8549E3D38FCD3BAC8B21CBBCAF0E0BD8963FDBC7A5129BCBFE41A3C5D75273DFEDE3EBDAB33C33C3800433C6A78B03B26FE20BCBC919FBDA28B333DA98E22BD5A984BBCBDC7023D789A88BD93D79CBD037FE53D6E15613C29E6553CAD5E4A3DB2C884BDFC3A7FBC9E6EA03DBAAF8E3DD729C5BC375A2E3D41905DBD56275BBD39FD21BDC9116ABD6BBF0CBD53EABFBC567D973DE41DBCBC5159D23CC476C03C117CF13CA6F7553D5CD8F63C769C89BCA2C785BCEDB80CBCF1F606BEEB1615BD538BB1BD150FF5BCEE83DDBBAC3111BD87F80D3EA026F23A80E3D4BC4A22913CA963533BA5F9143EA4E283BD59D964BC581931BC207BBABC62FC20BDE174CE3D065A4ABC9C92533DDAA973BB12D5DBBCF07D313D3D3843BD99C5603D36E501BD19906CBD8619EB3B1BCDA13A76B237BDEC0D06BC64B5B53DF0B488BD0534553D210AC53DB3E8B3BC1D9A01BDE8B5BEBDFFB48CBBC3C5B8BCC5A017BDA3A210BC3949ACBD10DFEEBC4E253B3DB40ABE3C54F6B13DF23FF1BCAB9E1A3BEF4C97BC29368DBD245F7E3C511B2FBD1A028D3DDACDBFBCCC7E23BDF93A75BC6CBA23BCC9F4C83C6DFE45BDCA9C873DBE4BB53D4F6ADCBCE06A71BD9BFC463D5001363D657928BD93537DBB9A352C3D6892363DF556F63CFAD4713B855BAABB4FAF203D00931A3C5F4F8BBDAE6B493D931E36BD8136B3BDD7352FBC763B0ABDDD6B07BD0C673A3C923AE03C2D6E68BD4F578BBD469D2D3DF4ABB63C7EC181BD018BC43C4D4686BB854D4B3D001D2F3C3FD5DFBBB017323D2A1A4FBB4B11A73D2720103C0593D43C41FFC03A3DCEC1BC50379E3C0CB36EBDB9FF90BDCCC9FE3C9D98723D8DF4783C6D74233DE5D2CFBBDB2F913B8CE2FF3C6D8CB4BBA0CA48BCCF6922BC997BFC3C0E68DB3C6B77A83C9A2E2CBD4B86623AACBCD6BB8303353CF9C4F33C092D5DBDECC57D3CCC684D3DD0DF57BD4DE2EDBC8C2F99BD404B833BEDE3963CB3E2BD3B50F4F7BA46F7A7BCC8D46E3CB4F6E33AC8F49BBD8BFDEFBD8DFB503CF56F96BC1AFFA23C7AA002BD037CE2BCA64F883CDDEB3E3CFA86663DCC2C0F3D9EF6123D6F97193A2FC8E83B44FA0F3D343061BB3B9282BCEFC4BABC7A67C93D554F15BDB82A61BC29588F3D7779BCBC341C15BCF7564FBDAEC97BBB22C5C1BDA9C4C6BC02D932BD832E033D88D1ACBBFD4C563D9073B7BB50383A3D2F77223DD07735BD48F148BC0637F6BC8123803C4D4ED33A5AE985BAA941CFBD34A9E93C934AA8BC399583BD54122F3D11E28B3CB9126B3B2FC7463D8867E73C557A80BDFB0E5E3BD137573D2B51AF3D014EA93C9B1C9F3D53F66DBBEDE108BD239E61BC6013D2BA84AB16BD93594C3D5FA6B23A6335FA3B1FE0AB3B97B7FFBCD725C83D90E0A43D73C31D3D0F3D953CDBB00CBC36268C3B3F584E3CD23A133DB3F2623DA4E197BC1ADEEEBD302DBFBC3BAF9B3DDB989DBB8B75FD3D4663ED3CD321853D3854863CE47F8E3D82297B3BE5E77CBBA5FD98BDB72694BD13CD79BA428919BD8E11C5BC17A32A3B262F2C3D5A71AC3CA93890BD33ADBCBC2244193CCD77A5BCC46C703D1885393C9404D83A,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:30:19'),(40,91,0x49B9803C1F071A3D2A2E89BC795298BDCB07F5BB90CC0FBC713CFDBCD6526E3D791634BC2420EBBB074E833D125402BC6C8C3EBD20ACB33C6141DFBC312D8C3B634142BC87BB463DCE05193D4F6619BD28B3D9BDE4501F3ADF6E9FBDA820F5BCA8BBA13C1CF429BCAE43893DB48C1A3DA86088BD50949A3DF9811B3CD2AC30BDD74F07BD4360023EA2D5B23CB7003DBD9E6946BB5424D33CC67BE1BCDBDDB7BC08BFC53C6CC653BCE67B96BC2AD7693D8AB38FB866131CBDD23329BC8A7B37BBAADAA13CFCBE103DD44153BD0EDDF8BB4A8CA4BB34FB893DC54FCBBCDD5B6E3DE579113EA81D913D107B86BA3D8309BC097AB33B052590BD5DAA263D2638B9BC7E6991BC27E43C3DCF71303C71297C3D75FF2FBD7EC3093DA7F672BDAF622E3D8960103DCAF5943CCBBFCCBC670347BD8BFD793D9202DFBDA6AB083D2716A2BCA843DFBCF3C7343B4EDD0D3D83B722BCF30D373D09078C3DF748A7BDCA412CBD7A52C4BC3222933B4E7798BD046EA0BD21B32DBB1C3EEC3967F80FBD27DFDFBD7C9415BDB38A1DBBAC609B3BD53CF1BBD00C563B6C477DBBD86A0BBD2C2C73BCFA8EA33D4B340E3DDDFF05BC19BE973D285DF13AD1EF843DF320D43C0C4024BD845A74BD0FCD9F3CCE77BDBC493530BD8F11BD3CB5F1B0BCF6536DBDC73AE83C31A6583D9DDC4E3D2485D53D451A4BBDE4F3373DDA0E8C3DA18E82BDFFDE6C3C01F93D3D5A92113C310AB1BD68D2F2BCBE0549BC6242C8BD945E4FBD91C5343D42C52D3CE200C93D104E453DDC6AC83CDC0598BC1FF917BD92A699BCC0815E3D5A4070BD3B339D3D83EA0A3C329F873BD70707BDA1FFD43DFE38D13CEAE84CBB36487BBCC48683BCBB5B2FBD8A1DEC3C27D713BD6202263D9E67EC3CC9D2A73DA5F402BED83DCF3B367ED93CD383C23C4B2F72BDF5459C3C3CA538BCAA9F153DCF5C643CEEE2B43B808594BC17DD86BD44E34B3C274359BD85E9F93BBAD36F3DEA9A4EBDF701AEBC68F8EEBB2BA057BD7C1B883A4EFC73BD53FB2ABD1D9A3ABB50CD1CBC24BAC63C9CCA6ABD0E3A703B1A6326BDFF9D683D6C8D593D1186C3BCAEDA92BB18C8D93CCC48973DA7C5FA3C766BAABA5B64013D2C5151BDE1F6C5BC6CA3613D73238B3B94BC3E3D4CAE04BDD389CABB1C85DA3C6931313DC319F4BC5B62C6BBCABD08BDE50D08BAC87F93BD4525093DD25A93BC387BE93C1EB7833C47CAC43D924DB3BC230BD93BD95205BD94188EBCE06D52BDB6795F3D614559BDB556273DAD25D4BDF275C8BCEE9A1B3B6E40DCBC524C4DBC5074473D8B71EEBA24339FBCBA90A5BD4E80B53C748C953BBDF73B3D2C4930BCB5969DBC8261C537D042153BA91FF7BC451C933CAEAA023DB204C03CD03FD3BA478F133D734325BDA51102BDCFE1BA3CC43417BC35C14E3C6EF0483D6EAD283ACA68433D7481C03D4E3A1B3D60E8363D2F04253D54E401BD06D79EBD7355E13A90DB6FBD9BE419BDC302CEB9B0ECB13CB59812BC5B2A773C030B0E3C23512C3DD57B2D3DE6FC9A3CF93BB43C962F26BCDE00E33C34ABA2BC2C5EE1BD45EA08BD9D7F71BDEDA0BF3CBB0B7CBC8F82443C240D5B3D6323C03C28EF2DB927E9D5BC6178A23DA3AE42BB741F93BCEEA5873C45C93ABDB437FFBC926C133DCEEF103D0A7C7CBB924F0A3C1546883CA0A4893D27BFD6BAE2A2EABCBAC47C3D0EEB44BDDD0DB33C14058F398E13243D40748C3C78D30C3D8EE3C3BC78334A3D5926A9BC77236CBD90A9EABCDC0D0C3D0B5BEABCA1A673BC846DA5BC84E973BB585EA73BC7C8063DFE62E2BC55F1993DCEE79E3CDE6CB6BCDECEA93D2090C23D8BA00FBD80F09D3C0668D33B994AF03C3802073D90CA15BD8EDBC53CB364DEBC3D7BA13D3ACA29BD3339E73C4877AE3CB4053ABD54963C3D26EAA63C8C2A023DD7E883BD0585643D7530D6BCE77C683DF354BBBC63DA273D2CCB31BD4B8E023DB3222F3DABC14FBDDF13E63C5272C2BDD85B4DBDB087873C34E113BD80F45BBDF179723B12D4673CDD8390BD4E1F3C3C0D66C6BDC8C9F23C380D0DBD1ABA7E3B9E6B9E3B9C5609BCB286B3BB910AE23C1F8A753DE761383D22F1DF3CFAFA003EEBE76A3D723BB83D37A52ABCE8A4C4BCB78733BC062556BD1DB2583CD3C19A3D731334BD2C5E333D356D963D9351CEBCC699A8BCF61C8BBB6BB95F3DF81FB6BCF309643C285B6E3DF6D983BD9030443C028DA13D0B85483B441E133DFC608F3CC91175BD8A9B3DBDAE09453DDCDB1C3C22B1393C536C943B56BFD5BB2E6D80B9C9DEBF3CCAD77B3DBFDD0BBDD55CA43D6314A9BCE1AC54BD48F191BD5564D0BC748A88BCEFD8C0BC0CA31E3D87EE04BDBA20633AE6CF2A3DE04EFE3CD74E9BBBF32D483CFC8F663D06BC7ABD26DA8A3D1D9E16BDE1C12ABD0275973D50C97F3D4A7B363DD79067BBBE9E863DF712A73BF7664CBDA50664BD08CCFBBB0E8D93BD768EF8BB0F3F72BD099BA4BD38A4503D2AAAAE3CAE90163BC9F7B9BC9A24383BE48814BDA80ACBBB0680503CECF9653C0DD26EBBACE9753D49AC9CBDBB7D4B3DC4F2373DAE355CBC8EB5CC3CDD0181BD1F6E44BC00B722BD52C53BBC4FEE173DBBAD95BCFC6CB0BD9C147B3D1627983D22F6363DC94F743D7CDC3BBD2874AABBE782FF3CB20768BD518EA13D0231923CCB28BABBF59232BDE60398BDF6284D3C62FC53BB53092D3CF7FAA0BB7C0C99BC85974F3C54EA5CBDC13106BC21AADBBB8B682ABC8C125CBD12DDBDBBA377943D8FEC323DE797533D9F3593BCAB07813DDF10CE3CE784663C4535243DC2B59E3D7E81C7BC4DB07C3CB99389BDAD51BF3CD9DE173D95E2A53DEB05EBBDA6B49D3D25C10B3D196E993CF8A73ABAFF1EE2BB91EEE43D1710B4BC417B733C,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:30:32'),(41,89,0xAC8D043C43C0B23DF4230EBA0F7B05BDB5AFF6BCF0490E3DA6F283BCB41C0B3C5ED0E53C110BDABC14BB323D330F30BDCFDBDF3BBD87CCBBB0431E3DAFA83B3DD762AF3CE5C1013C180D143D4AB88DBDAECDBFBDB554943C2C3982BDFC9D36BC5EE0163D7A5F85BD89B85A3C6314313D9F1239BD8011EF3C84219A3CDCF7E63B83A91E3DB668FC3C3D58AA3C240A9FBD69D22CBD28FC083D507BB4BDFA01A4BBCCECAF3CBC63333D6EAC77BC01B26A3DCA37DFBD6D49B03D8F8F6FBC42FA1DBB0EE4C7BB24229BBB4544AEBCD60EF0BC0A3E9C3DDFAEEBBC006E5C3CD7026F3D91CFFE3D3BAD983AF6F708BD126C85BB07EFD9BCD71A17BCA9C796BD32F984BD4287613D6562DCBCEE603EBDFDD2ACBC635D923D3FA8513C7FAD9CBD3C93283DE41785BBDB3C9A3C8FF2A4BD5DCA053C1DBB1A3D648E8ABD8EC7483C56DD9FBCCBE4C13CF90D953CAAA6A0BCF5C1A4BC601E923D6632493DF89287BD9BA311BB6BCD8E3D4CCD3CBB4E8191BD4A1713BCDE641F3DC33BA1BCB5A1C9BD16919CBCE7F490BCB636143D7A210F3D983F8FBDEB80D73C1B8F733D9D279EBBE8F681BA0F17103DD18F85BCA0F5843D9A58803C6724853AAAE41D3D7CF2CDBC34E823BB945B6BBDF70AAF3B9D7E94BCD956D5BC0DCC7A3C671F00BCEBBA1EBD1C4BE3BC2FA2253DB431A93ADA2FAE3C7F9F743D91F6AA3CAC249DBBB89735BDFAAF1FBD8F6BD33D220341BD60EB48BDD46A11BDF260BEBCF04E35BD8041183DDD24ACBD59DC78BC99E3D6BC5A6EDA3DB16F08BD0B1AE73CBA5D683D52C9B93CA646913DD4011FBDFFB1DC3D0C72953C9ED0B93DDD0E25BD7D1DBF3D1540963D26C1653C25479D3D1383F93C4EFF2EBDEA6E9B3C6F211A3C8DCA3C3D4B2DDB3CE3A10D3D58AA65BDA7310B3DBDB326BD62BE003DBB4A373D1CF22C3C57E24ABC2062363C0F538B3D78C683BBAE2E243D3DF601BD08FCFD3C959678BD611D2A3D2D5157BD04A038BD7609063A663BC9BCB6D4CFBA7B03233DD3487EBD21E287BDAFED58BC3C8D77BD6915ECBC319E9CBC2C57ECBBDBDA07BDD6CC193C44E9113DEA6911BD133E9A3CFF84073DE7530CBB7D5E6CBC4EB0083A9FBDB83D1A63C2BCA71B22BDE35C313D517F393C8065BF3BF09E2DBD7E28283D18C345BD90460CBDF9D675BDA1513D3C85F60B3D229EF13CC81234BD2784AF3DB972DBBCEC5E1F3C364BA2BD2E750A3DD84440BCE9F5AFBB330924BD6E5548BDEBD79FBD15FBACBC488F043CF58F3F3B811A90BC05A49FBCBD0BFF3B158155BDB1E469BD5C63203DA1BBD33D46B5973D28B260BDDE34F13C9326473B7FF14EBB0A5141BDED0ABE3C72280A39987FB5BCA515CF3B3B1D59BDBEBF6F3A2186ED3B27642C3C04C7693C18E9D13C8B1220BD40A4733C7AD5623DBE2F72BD857575BA282200BC714A50BC493E853D29762F3C3E45A63C4E18063D014DEABCCA4AB5BCD417363DB8898ABDBD3000BD572CAFBA82A7A03C20AADFBC8BB82F3D2097B63D9589CDBC7E9D663D81D45E3D2F49513BD461863CC0DFADBDB59B8B3C2A82D53B5B38FDBC2D600C3B18419ABC54DC87BDE573113DF8A4B03CCCBE8C3CB9B28C3C50082EBD2C1D093E678E35BDC4420CBC6977BDBB053C52BB2BB978BDD684C63CFCB8073DDF828A3C04BF0BBBFE5F15BD285C283DD464353D7691D3BC47CEDABCDABFE8BC4689FD3C1B678ABC035DE53BE919653AA2FABC3D505BF33CF7D34A3D84B0FCBCB921A6BC88AF92BDD0BF293BB1EE6CBCB3DDEFBD00C11BBD88E241BDCF3491BD30ED363DCA60853DF690813DC3A2C43C327596BCC5BD2D3C29237B3C9E5A0BBD37AF713C4616453D79CA16BC5CFB8FBDB6B34ABCDEC65BBBBCDA84BB12DE0C3C2100BE3CED0F9A3C54AC0ABDCBCB5EBD863DE4BD25B8543D5D4E9A3D49883CBC3A5704BC7E503CBD7390CEBBF42838BD2BDAEF3C439714BC54DCD5BB1ABE563D4BD2CABD6E22213DC11F893C3078CA3CA339C53D2E5A6FBD853BA5BC75BCAB3DB97CDD3CBC5C78BD39EB123D4B13A4BC1B32503D0AA052BDE450E2BC290931BD2CB3EA3C33C0BD3D12585ABDEE627ABCA8406E3B8A06213D3C548F3DFB73403D10558A3C4B89733DC79983BD4653AABC330C07BDB855A23D5DF8133DDBF5A03D16FBB73C5BF3A63C4B46A9B93C555BBC5C98B73C02E2693D28B50FBD2980F1BCE78E7F3AB622ADBD68B7983DF469093CB29EDDBB806A003DA7D3773AB7B3CABD0647773C46B1853C39C301BD5F6908BDF1AAB43C1C3F0E3DAA8C67BDC98F053D313D343D4FBFAEBD04995D3D0A0F55BD67F228BC418984BA5C0A40BD7913833C665AA2BDCF15A43D06DD0CBC90D9BFBB138D3FBA62EEC13C7E3511BC2DEE433DE2CF2E3C2F3844BD0F1C6C3DFAF320BD2A3F3D3C1CEB6A3C20FC8C3DA36C473CF2EEEEBCB09522BC92C1BBBC70E087BDCBD49DBBF913843CEC9462BB2D425FBC6D260DBDFDF29CBD04AF20BDA661F7BC8132623C2591143DD15A6B3C4E9B8CBCF2522ABB2B18853DAF9CD23CD2E2B23CC08AC43C98E09FBD161E3DBDD3DE82BB7451CABC28B1263D18B4543CD84363BD5BDC36BD4B7D15BC89FB46BB41823FBC9A7E9F3D9F94293DECBE7E3CE9CEE03C3F2931BD595B92BCCF0202BD279CF73CC39E97BC9990283E721B963C293C0B3DBDF49CBC586592BCBCF1703CAC60513DCEEC5E3DE49F99BCDB8A653DD13A293D69B983BCFF10A93C03A73BBDB039053D452D46BD4085933C0F389ABC4215F73B265C883DF3690FBDBD3F98BB8DBC39BD34E30D3C761F403CD63F5F3D08722D3D0EDB083DAB4693BC8E18AA3C0D097CBB4ACE013E214305BDC842F13C6576103B363703BD0947E7BB4B139BBD00EF533D5C929DBD4C9CCFBD,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:30:52'),(42,88,0xBAE32DBC7BDE1A3E02C00EBD5FF2BABCAD9911BD68055E3BAE6CDABC02565F3C3AF8A3BCA4969B3B8FC7783CA751363BD7EBEFBCC14C473C0F67723A1306423D8D9972BC347DC63CF19F383D1CD5DFBDB820453C4C86EDBAD32FB13CB1C53CBDDD4CE2BCB21968BA960D823DBA54C7BA79DA9BBD5A7AB43C34F4E63CB8B95E3DEB68F73C535B063D71309E3BC660673C72BA2EBCA40320BC0D97063D66B88B3D8EE983BC850C9EBCF0F90F3DFB1829BCD48E3CBD23BFAABCCEDB1DBD01AFFDBCBC11C9BB5EE77ABD47C30A3CE48A083D4B408CBD92AF9DBC2696A13CB5D4BF3DDD65123DB031973DD2DA403C5FDE063B0F2E933D99FBC63C8A80573C5BF087BD964DD63A4030263D85D1863C86A31EBCAAB9963D44A6583D9BA12EBD717B3FBD5BAE913DA2BACEBAE71954BDDF098E3D09841E3D4BF56DBDB5D5743C459635BDDFE2893D56018BBCF6D67D3D4AE171BDF4B7F6BC97A1B33CB3380E3CA979DCBB8AF559BD520D063D289694BD7ED165BCA74C9FBC4EE6B83C1DFE1FBD73A3B4BD2D241B3DD9CD36BC33EDBA3CF712F6BCE08EF3BCC1D44D3DD30039BCDBE25D3C7A2F373D5D0C263D0480CA3C5D1C1E3EB2AD85BC7DA6E63A208199BD2B16793DD3005ABD02B4133D9B1CD33CEF4467BCACA9803C884DF4BD37FFBD3C988530BDBD68293D88372ABAAD6FAF3AD2B9523D6958F4BBC1A7C73C0DC6EC3CD08CEFBC9D40BE3DB9FED13C5063823C07C59D3C1999423DE8FD59BB8326F83C05F88CBC1914F5BC9A0911BD5A548D3DCBE0C7BBEB951EBEC2D6023C4CF2E83BD887403DF8617BBDAA01AD3DA997D33C30873C3DB587183DF0D01A3E9BC87DBD220E0E3D50DC0CBCCDEE3D3D5902F0BCE011F53C782F6FBDE51C103D3DC1883DF55E1EBC9FA582BD1C68273CE822D13D26EAA93AC0FF5BBC1C04253C4D8670BDBFC81F3D8E2FA63C9EDBF03902A94B3DC38051BD799E823D3197503D08AC1CBDA7723ABC17EC51BD969A25BD3DA56FBC74FBDCBC1795353C3FBF07BD7B914EBD248096BCAB901BBDBBD781BC7FAF98BC1A5CF6BB3C022EBB5107433DEA1432BB62597D3CD28EDB3CA4D4B93D6B1B75BB550EBBBC85D4B8BB8D16BA3B1DF148BD73DB923C31EFB03D8F1F973D64BC78BDDB680ABBD2AC5EBDED4FCCBD00284E3D6DBC46BDE170FDBA708D0E3C2C2419BC67D93CBC99EA2C3CE9EF973D1E733B3DBE25E7BC7A85923DDED200BD69FA9B3C5F61A6BC6204EB3B88BB7BBD69D9B13D7C429A3D25A09C3DE90EBBBD492BEDBCA98C50BDF7B5193C60BAFCBB054D6CBD585E213B36D819BD7D998C3CC1B498BDF51DCBBC6DAEBE3CC02BF2BC5AD638BD35F83A3D8C13F53A62640F3D03FA8FBD3D61203D07C8A03D6A2CCFBCCE1F6A3DE5BC2CBD770B9DBC96AA623DD9A9933D0197823BCD40943CBF75FFBCE4EF32BB71FB073DF3D65B3D5A5C8D3DF6BC99BC1A9F023CD67CE73C1D0CEEBC887F893B768E273D71733D3D39F9CFBC2E8D9E3DDCEECABB228C353D5EE6CF3C1660A7BC1BD998BCB2CEC93B8028863C0DE5D0BB51FA453D95858CBD3525FFBADD62CDB8B5E671BC02E661BDA3EC3BBBF1F49B3C89766E3D70B01EBC63CD35BD0C6B1C3D121ADFBD3C342CBD2F13D9BC2987A6BDBDD01DBDC0B0EA3CAFCDEE3C3D7296BB6F9D423B7DCEA03CFF8DF73CD149933D133EE73CB16B853DFD8CA8BD100A41BD68546E3C7200CD3C3C4D623DB11BA23D6840373D42AC35BC0E78D7BC57010FBB36B51F3D36FCF8BCB6855FBB9C4133BD352D1838E9BF88BD530C3F3DE0B00EBB32D1BD3C280A923C82D0F73C54CF093BF97A4E3CECE4BBBCCFD4E33D3964443BE1E5CDBCBF63EDBAD06054BDC524A0BDEEF61D3D0855D2BC3110803BE6032D3D30BFEFBBA05E3DB9A62344BDF63FABBCAA61413D4C9879BCB83E75BDDA5521BDAF0574BD129DE63B9D3721BD59A581BD1CE5AABD6FA7DCBA53C69F3DC5D28FBD4BF19DBCD696BDBC2B55373CE38D38BD05732CBD37099B3CC31B8DBDD5CEA4BBC8D760BC1BA2813C3FE4473DC3EB4F3DBBD0493C5747213B9142D4BC8AFBA73D288BE83CFAB463BC194181BD1EF9B23CDB94543DA0D8B73D6C0FEA3C550A8F3D56D0023D5A0192BD8BCEFABC1D22F5BC72F4EC3B03C28CBD4CD1643C3A284D3C63A01F3D38EE39BCE0E720BDD051DC3CC40CC03C1BDC63BD95FEA2BB98C227BD84C9CCBB16C0533DEB8FA5BB318EFCBC3772C73CA25370BC4878FABA382BF13CE837E7BC3BA48CBD205D45BC9C85693D2CC72DBD9662FC3C2593CB3BD8C3B13CFA845BBDDF7FC43D86E70ABD762127BD4BAD11BC1A24BABCA85312BBEFC47FBD9D2666BBBB19913D5B8CF3BCB0DEEC3CAF93373A8CA1A6BD1B43533C446D94BD56B4E9BC91F7253D4308233DA246EB3C5014D63C1EDA573D9895F0BA46AC7CBC17951FBDE2225ABDE2E80DBB12E85C3DBAA97BBB5DABBBBC59F2473D54BFC23CA67C7E395B06E2BCA894CE3CC77D053D5290C93C5DB3DE3A5A8E07BB238A35BD3898213CB56BA7BC960A683CD6D3A43C9981CD3C9FA9D23D7AF7723BD6548C3CB472B93DFFB2873D7A380B3C16B4F2BC0F4C8F3D7C56113D661908BDE4836EBC0770CC3C2103FD3CDE32973DCBCBCCBCC98950BD68A52FBD59E1C73C4BA90F3DDE0D593DF54D6C3C6540BC3DE0EF8FBC64A3A6BD0DDC45BB1585BA3D4B2C72BD04B203BD8328CF3CB106CEBC7553CB3CE44990BD12368D3CBF29BCBB8F7107BD84D323BAD8FC2ABDA858F03CF7E0383DC5F306BDBC8E1D3D7DBF4C3D7C83B23C8A00723DD9BAD13C5EA3E93C8A7AD93BA79D01BEF56D9ABC4B60CA3CE299C4BCFDB3313D4F11DFBCB1759C3C015EC93CF3B70EBDAF1C3C3C8FE2633CE3286F3C18E73E3D,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:33:04'),(43,88,0xFE57823C5591D13C79B83EBDBB4C5A3C0CA8CABCEC8534BD4B60BEBCE0EFDABCE955703D031D8DB99A14793C2A10C1BC0A7A0ABDCA5A8BBB2F028A3C7BA19F3DC9FC03BDA72EED3D85A62E3DAFDF23BD297E9D390BCD8E3CCFE110BD2CB15EBD49C59BBC4EE742BCBD38503D43B6A7B9D02E24BE83A02EBD57199D3CED886EBCEFE5093C6676923DEA5BD83BC51DD0BCD1BC783C9330E63C5B3029BA9D3C9D3DFD48FBBBAA983BBD3E4D803DE8927E3DA56B10BDE5D38BBCAFD7E1BC9A9AC93CB08589BD4FE592BDD7D3B1BCC3852A3D0B2A593C401FC83CC02A443DC667933D4147703DD095D33C05EA843D678930BD26645BBDA1AF823C105348BD813725BCE0C6453C202DBA3CC08AA8BCB7EE893D6653DD3C0A5A6E3D843C9DBBD10EFCBC08902E3D21AA2F3D786BBDBD69B98E3D141C0E3D41A317B9B09B3C3D1A8740BD768A06BD0694C9BCA28C4A3DD55CA13C4BB485BD3FD37D3D60A682BB407718BD142642BDB510AF3C6C4E58BDA14CC4BD222AD83CD608253D27ADB4BCF4A83ABE663D8A3C83730FBC463CE93B961A5FBD7B3758BB883DC63C1F0FEA3C125897BB2AE21C3D62F9583D4F8AF73C25ED113EE4AD32BD1CC92D3DFADF6FBD46AE4FBC1DA47DBD9086C93C33399FBCC8FBB63CA1D7AABCAF3A77BDD66616BD2D9E1ABD1B49B43CC003A33B0EFCB43CAB3B303C0FDDF5BC34BF0F3DC0A216BCA7D52CBD2256953D01A88DBB16D9F5BCDF1FBFBCBD762CBDB2539EBC3751FDBC2E86443D8EBC8DBCFCFF163CD319B4BC9E163CBD7400AFBDBA6DA23C191BE9BBEC95A73D3A656FBA9120D13DF5F0F0BC60EB183D9F668DBCA2950C3E02FB1ABDABD25C3D0089463C1385803D1A679BBD4A9E123C44502ABB0FDBB93DC62C5B3C113F213D627183BD03E7443CE550D93C146B883D2784A2BC3780623CD2DA49BD0F9EFD3D32CA133DD7DFC23C142D073B690D1ABD2E22973DD861793C8F2B1DBDAF492BBDB7EB62BDECDF9DBD0254F7BC4B3925BD6E65FABCD12E9FBC085E7DBD782A55BD16FB0BBDE3CDF3BC235369BDE7F29ABC1F9042BD00181B3D8DB1A03B7797DC3C7E2FC43952AA743DD93FBB3C8A61933C394D463C12D506BC86BA7CBD6F178FBCB413BC3D874F803C55CF5B3BB8C480BC4C171EBDEDDEEA3B1A40BC3C0A8C97BD4B87F53AD53F5CBD42AB99BC0272C1BCD2F2153D8067953D06D2963C2D8E56BCAC56993D8137333BE51918BD849920BCCA39D1BC828986BD6748B73D3FC546BD287E393DBC3DF7BD5FB11DBD466DF4BC01F496B98F98E2BC488D3C3B9D1CAABBD941A9BD10C9F43C52D9AFBB2D4681BC30C4833C48712DBDB3DDDD3C961A883D50AFA53BA06C083D14C277BD2955F43CD34BC83D321E6E3C6E12213AB79715BDF5541CBDEBACD73DACA9853D490F4FBBAC971D3BFF27053CA44FC7BC66E16C3D7B6BE63B573FC13CFF80D7BC7698EB3CC4C25EBC9BCF8E3C9D7C96BCC9B74CBCF191D1BC5975F23C93D1423DBFA6F33C757760BC309D6F3C80B6C53C8299E5BB0C42F03C1BB818BDB74A36BD7EB0BC3C24D558BD6DF0CABD0570FCBC3F11933C995CB2BD8B37463DFBBDBF3C7353143D92B9B93B2C7BB23BE81A1D3DD9A239BDE81BC4BD1CBDAE3BBD411FBD5D3C0FBDD347A63C9B0B993DD19C903CFEA9E03B769BBF3C53B5C23DDD2A60BC234DD43C4964A93DC99B073C85F047BC60EB1A3D52AB10BDF852CA3C9DE1AD3D2A9B323D58D31C3D7FF942BD5DD735BC05E608BC5B804CBDA59E393C10721FBD4AD7AABC66806ABD4665EC3C89F4593D224BD8BB18803B3D13109C3C60CEAB3BCD44663DD7DCD33B2541F33DBE177BBDF0A45C3D731C293C690E96BD0B9D86BD803A23B9E73BF4BCDDF4CB3C7ED5763A167F863CAC18A03B0B7A68BDDDB43EBD3528C83CC3D5273D3578A5BD73CEFC3B5A03A4BC94A1583C181249BD2A3910BCFCC776BDEDEC863C6CE5813DDC5C2CBDCBA3E5BB9F6A1BBDD8D4943B23133C3C9887DCBC2893C43CD09D273C06234D3D2AD91EBD7C3D47BCE4F5393995F9773D6FCCD6BA89AEC5BC32828ABC8232D03C1BA6073DE43390BCC608E6BCAE6A90BBDCA6693D959D103E5961A63D0BD32C3DA649153CD35113BDB958933C131281BDF46C933D0B94233D9EA8B2BD352A18BC8888873DA78878BDCF16BFBDCC51873B11A1D33C546A6EBDA234BBBCD42D67BD295AA2BD8DF9FABA8003433D9BAA68BD2995E33C6AE1E93A72F0DCBCF900973A6C18F23C60DB4ABDB61B36BC5950573D8E3AE6BCA876E83B79266C3CE538083DF824FFBA12CA893D98E9D9BCCEB07ABD474A033C1227E8BC554722BD246789BC26AFF63CD08321BD46D729BD7A45E63C7079603DB99F413B44D78E3CE05577BD04F25ABD1DFF5A3DE9DCD23CA726693D57D1733C2EFB98BBB819CDBBAEF411BDC46B863C89AA88BDA1888EBC4D77DE3CC2A127BCA803F2BCC99122BBE4C3C93B5DAA22BC353AB3BD805B1DBCEFF4223DFF605C3DA498153C9286A93C6BB000BDB58F3B3DDA1051BD8611ACBB9BD4ACBCA8C493BC6BC1033D2BA657BCBBFF0DBDC6754C3D6751503D4BF647BCE949513CCEF509BDCD9940BCD6A916BDC82FDC3C9B99B4BC50C22BBC8768DD3D43D720BC101B8BBD759296BDBBBF2A3DCA6F443C0C1D4C3C1BD07BBCA3E2003D95F7D4BCE96095BD0337B03D4DD5D63C241D45BC15A884BCBF20BD3C9CCE04BD764B9D3C586290BCEE86313B6F1D193C7EEEC4BC5B270DBC873001BD638B183D7427893CDFBB12BD39B1BE3CF94EAE3DD5BCF4BC6961DD3CB07FEB3C7349023DDC992ABC651D3CBDA87B083D8DF8C2BBE0B4EFBC9C836FB94157823C580303BD2F24993B8D1546BD2E6F77B9CCFF62BA2B867CBDF196CE3C,'ArcFace','arcface-v1',NULL,'sample','2025-05-27 14:33:04');
 /*!40000 ALTER TABLE `face_embeddings` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `gallery_settings`
+--
+
+DROP TABLE IF EXISTS `gallery_settings`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `gallery_settings` (
+  `key` varchar(100) COLLATE utf8mb4_unicode_ci NOT NULL,
+  `value` text COLLATE utf8mb4_unicode_ci NOT NULL,
+  `updated_at` timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`key`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `gallery_settings`
+--
+
+LOCK TABLES `gallery_settings` WRITE;
+/*!40000 ALTER TABLE `gallery_settings` DISABLE KEYS */;
+INSERT INTO `gallery_settings` VALUES ('active_pipeline_version','arcface-v1','2025-05-27 11:35:35');
+/*!40000 ALTER TABLE `gallery_settings` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `users`
 --
@@ -159,14 +205,23 @@ CREATE USER 'user_libai'@'%' IDENTIFIED BY 'huy'; -- Thay 'huy' bằng mật kh
 -- Cấp quyền đọc (SELECT) trên bảng 'users'
 GRANT SELECT ON lib_ai.users TO 'user_libai'@'%';
 
--- Cấp quyền chỉnh sửa (INSERT, UPDATE, DELETE) trên bảng 'face_embeddings'
--- Cần cả SELECT trên 'users' để lấy user_id liên quan
-GRANT SELECT ON lib_ai.face_embeddings TO 'user_libai'@'%';
+-- Cấp quyền đọc, thêm và xóa (SELECT, INSERT, DELETE) trên bảng 'face_embeddings'
+-- Mỗi embedding là một hàng mới nên endpoint /add-face của dịch vụ AI chỉ cần INSERT; việc thu gọn
+-- gallery (sau /add-face và /gallery/compact) xóa các hàng không phải medoid nên cần thêm DELETE
+GRANT SELECT, INSERT, DELETE ON lib_ai.face_embeddings TO 'user_libai'@'%';
 
 -- Cấp quyền chỉnh sửa (INSERT, UPDATE, DELETE) trên bảng 'attendance_sessions'
 -- Cần cả SELECT trên 'users' để lấy user_id liên quan
 GRANT SELECT, INSERT, UPDATE, DELETE ON lib_ai.attendance_sessions TO 'user_libai'@'%';
 
+-- Nhật ký thay đổi gallery: dịch vụ AI đọc theo seq, ghi khi /add-face, đăng ký hàng loạt, thu gọn,
+-- và dọn các hàng cũ hơn CHANGE_LOG_RETENTION_DAYS
+GRANT SELECT, INSERT, DELETE ON lib_ai.embedding_changes TO 'user_libai'@'%';
+
+-- Con trỏ phiên bản gallery đang kích hoạt (đọc lúc nạp gallery); reembed.py chạy trong container
+-- dịch vụ AI ghi checkpoint và chuyển con trỏ nên cần thêm INSERT, UPDATE
+GRANT SELECT, INSERT, UPDATE ON lib_ai.gallery_settings TO 'user_libai'@'%';
+
 -- Áp dụng các thay đổi quyền
 FLUSH PRIVILEGES;
 
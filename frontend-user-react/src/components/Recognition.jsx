@@ -4,6 +4,42 @@ import { Link } from 'react-router-dom'; // Chỉ cần Link, không cần useNa
 import styles from './Recognition.module.css'; // Import CSS Modules
 
 const API_BASE_URL = process.env.REACT_APP_AI_SERVICE_URL || 'http://localhost:8001';
+const WS_BASE_URL = API_BASE_URL.replace(/^http/, 'ws');
+const FRAME_INTERVAL_MS = 500; // Khoảng nghỉ sau mỗi kết quả trước khi gửi khung hình tiếp theo
+const KEPT_FRAMES = 8; // Số khung hình đã gửi được giữ lại để vẽ hộp khuôn mặt khi nhận diện thành công
+
+/**
+ * Vẽ hộp khuôn mặt (facial_area từ server) lên chính khung hình đã gửi, trả về data URL.
+ */
+const annotateFrame = async (blob, facialArea) => {
+    const bitmap = await createImageBitmap(blob);
+    const canvas = document.createElement('canvas');
+    canvas.width = bitmap.width;
+    canvas.height = bitmap.height;
+    const context = canvas.getContext('2d');
+    context.drawImage(bitmap, 0, 0);
+    if (facialArea) {
+        context.strokeStyle = '#00ff00';
+        context.lineWidth = 2;
+        context.strokeRect(facialArea.x, facialArea.y, facialArea.w, facialArea.h);
+    }
+    return canvas.toDataURL('image/jpeg', 0.9);
+};
+
+/**
+ * Mã kiosk cố định cho trình duyệt này (lưu trong localStorage) để dịch vụ AI
+ * giữ phiên bỏ phiếu và xác nhận điểm danh riêng cho từng kiosk.
+ */
+const getKioskId = () => {
+    const key = 'kioskId';
+    let kioskId = process.env.REACT_APP_KIOSK_ID || localStorage.getItem(key);
+    if (!kioskId) {
+        kioskId = window.crypto?.randomUUID?.() || `kiosk-${Date.now()}-${Math.random().toString(36).slice(2)}`;
+        localStorage.setItem(key, kioskId);
+    }
+    return kioskId;
+};
+const KIOSK_ID = getKioskId();
 
 const Recognition = () => {
     // Không cần useNavigate nếu bạn không chủ động điều hướng bằng navigate('/path')
@@ -12,6 +48,10 @@ const Recognition = () => {
     const webcamRef = useRef(null);
     const finalFrameRef = useRef(null);
     const confirmMemberCodeRef = useRef(null);
+    const socketRef = useRef(null); // Kết nối WebSocket /ws/recognize
+    const frameTimerRef = useRef(null);
+    const sentFramesRef = useRef(new Map()); // seq -> Blob của các khung hình gửi gần nhất
+    const frameSeqRef = useRef(0);
 
     const [stream, setStream] = useState(null);
     const [isRecognizing, setIsRecognizing] = useState(false);
@@ -72,10 +112,24 @@ const Recognition = () => {
         setStream(null);
     }, []);
 
+    /**
+     * Đóng kết nối WebSocket (phiên bỏ phiếu phía server kết thúc cùng kết nối).
+     */
+    const closeSocket = useCallback(() => {
+        clearTimeout(frameTimerRef.current);
+        frameTimerRef.current = null;
+        if (socketRef.current) {
+            socketRef.current.onclose = null;
+            socketRef.current.close();
+            socketRef.current = null;
+        }
+    }, []);
+
     /**
      * Hàm reset tất cả các trạng thái liên quan đến nhận diện.
      */
     const resetRecognitionState = useCallback(() => {
+        closeSocket();
         setIsRecognizing(false);
         stopWebcam(stream, webcamRef.current);
         setRecognitionInfo('');
@@ -84,97 +138,148 @@ const Recognition = () => {
         setShowConfirmForm(false);
         setCapturedFinalFrame('');
         setConfirmMemberCode('');
-    }, [stream, stopWebcam]);
+    }, [stream, stopWebcam, closeSocket]);
 
     /**
-     * Xử lý từng khung hình từ webcam để nhận diện.
+     * Chụp khung hình hiện tại và gửi bytes JPEG qua WebSocket. Mỗi lần chỉ có một khung hình
+     * đang chờ kết quả: khung hình tiếp theo được hẹn sau khi server trả lời (handleServerMessage).
      */
-    const processFrame = useCallback(async () => {
-        // Kiểm tra điều kiện dừng hoặc chưa sẵn sàng
-        if (!isRecognizing || !webcamRef.current || !stream || webcamRef.current.readyState < 3) {
-            // readyState < 3 nghĩa là video chưa sẵn sàng (HAVE_FUTURE_DATA, HAVE_ENOUGH_DATA)
-            // Nếu chưa sẵn sàng, thử lại sau một khoảng ngắn
-            if (isRecognizing && webcamRef.current && webcamRef.current.readyState < 3) {
-                 setTimeout(processFrame, 100);
-            }
+    const sendFrame = useCallback(() => {
+        const socket = socketRef.current;
+        const video = webcamRef.current;
+        frameTimerRef.current = null;
+        if (!socket || socket.readyState !== WebSocket.OPEN) return;
+        // readyState < 3 nghĩa là video chưa sẵn sàng (HAVE_FUTURE_DATA, HAVE_ENOUGH_DATA)
+        if (!video || video.readyState < 3 || video.videoWidth === 0 || video.videoHeight === 0) {
+            frameTimerRef.current = setTimeout(sendFrame, 100); // Thử lại sau 100ms
             return;
         }
 
-        const video = webcamRef.current;
         const canvas = canvasRef.current;
-        const context = canvas.getContext('2d');
+        canvas.getContext('2d').drawImage(video, 0, 0, 640, 480);
+        canvas.toBlob((blob) => {
+            if (socket.readyState !== WebSocket.OPEN) return;
+            if (!blob) {
+                frameTimerRef.current = setTimeout(sendFrame, 100);
+                return;
+            }
+            // Server đánh số khung hình theo thứ tự nhận trên kết nối (bắt đầu từ 1)
+            const seq = ++frameSeqRef.current;
+            sentFramesRef.current.set(seq, blob);
+            sentFramesRef.current.delete(seq - KEPT_FRAMES);
+            socket.send(blob);
+        }, 'image/jpeg', 0.8);
+    }, []);
+
+    /**
+     * Hẹn gửi khung hình tiếp theo (nếu kết nối còn mở).
+     */
+    const scheduleFrame = useCallback((delayMs) => {
+        clearTimeout(frameTimerRef.current);
+        frameTimerRef.current = socketRef.current ? setTimeout(sendFrame, delayMs) : null;
+    }, [sendFrame]);
 
-        // Đảm bảo video đã sẵn sàng và có kích thước hợp lệ
-        if (video.videoWidth === 0 || video.videoHeight === 0) {
-            console.warn("Video dimensions are 0. Retrying processFrame...");
-            setTimeout(processFrame, 100); // Thử lại sau 100ms
+    /**
+     * Xử lý kết quả nhận diện server gửi về qua WebSocket.
+     */
+    const handleServerMessage = useCallback((data) => {
+        if (data.type === 'busy') {
+            setMessage('Máy chủ đang bận, đang thử lại...');
+            setMessageType('info');
+            scheduleFrame((data.retry_after || 1) * 1000);
+            return;
+        }
+        if (data.type !== 'result') {
             return;
         }
-        
-        context.drawImage(video, 0, 0, 640, 480);
-        const frameData = canvas.toDataURL('image/jpeg', 0.8);
 
-        try {
-            const response = await axios.post(`${API_BASE_URL}/process-frame`, { frame: frameData });
-            const data = response.data;
+        if (data.full_name && data.similarity) {
+            setRecognitionInfo(`Nhận diện: ${data.full_name} (Độ chính xác: ${(data.similarity * 100).toFixed(2)}%)`);
+        } else {
+            setRecognitionInfo('');
+        }
 
-            if (data.full_name && data.similarity) {
-                setRecognitionInfo(`Nhận diện: ${data.full_name} (Độ chính xác: ${(data.similarity * 100).toFixed(2)}%)`);
-            } else {
-                setRecognitionInfo('');
-            }
+        setMessage(data.status);
+        // Cập nhật kiểu thông báo dựa trên trạng thái nhận diện
+        if (data.status === 'Nhận diện thành công') {
+            setMessageType('success');
+        } else if (data.status.includes('Lỗi') || data.status.includes('Không tìm thấy')) {
+            setMessageType('error');
+        } else {
+            setMessageType('info');
+        }
 
-            setMessage(data.status);
-            // Cập nhật kiểu thông báo dựa trên trạng thái nhận diện
-            if (data.status === 'Nhận diện thành công') {
-                setMessageType('success');
-            } else if (data.status.includes('Lỗi') || data.status.includes('Không tìm thấy')) {
-                setMessageType('error');
+        if (data.status === 'Nhận diện thành công') {
+            // Ngừng gửi khung hình nhưng giữ kết nối để phiên còn hiệu lực cho bước xác nhận
+            clearTimeout(frameTimerRef.current);
+            frameTimerRef.current = null;
+            setIsRecognizing(false); // Dừng quá trình nhận diện
+            stopWebcam(stream, webcamRef.current); // Dừng webcam
+            setShowConfirmForm(true); // Hiển thị form xác nhận điểm danh
+            // Vẽ hộp khuôn mặt lên khung hình đã gửi thay vì nhận lại ảnh mã hóa từ server
+            const sentFrame = sentFramesRef.current.get(data.seq);
+            if (data.final_frame || !sentFrame) {
+                setCapturedFinalFrame(data.final_frame || '');
             } else {
-                setMessageType('info');
+                annotateFrame(sentFrame, data.facial_area)
+                    .then(setCapturedFinalFrame)
+                    .catch((error) => console.error("Error annotating frame:", error));
             }
 
-            if (data.status === 'Nhận diện thành công') {
-                setIsRecognizing(false); // Dừng quá trình nhận diện
-                stopWebcam(stream, webcamRef.current); // Dừng webcam
-                setShowConfirmForm(true); // Hiển thị form xác nhận điểm danh
-                setCapturedFinalFrame(data.final_frame || ''); // Lưu và hiển thị frame cuối cùng
-                
-                // Tự động focus vào input mã thành viên
-                setTimeout(() => {
-                    confirmMemberCodeRef.current?.focus();
-                }, 100);
-            } else {
-                // Tiếp tục xử lý khung hình nếu chưa thành công
-                setTimeout(processFrame, 500);
-            }
-        } catch (error) {
-            const errorMessage = error.response?.data?.detail || error.message;
-            setMessage(`Lỗi kết nối server hoặc xử lý: ${errorMessage}`);
-            setMessageType('error');
-            console.error("Error processing frame:", error);
-            resetRecognitionState(); // Reset toàn bộ trạng thái khi có lỗi nghiêm trọng
+            // Tự động focus vào input mã thành viên
+            setTimeout(() => {
+                confirmMemberCodeRef.current?.focus();
+            }, 100);
+        } else {
+            scheduleFrame(FRAME_INTERVAL_MS);
         }
-    }, [isRecognizing, stream, stopWebcam, resetRecognitionState]);
+    }, [stream, stopWebcam, scheduleFrame]);
 
-    // useEffect để khởi động/dừng quá trình nhận diện
+    // useEffect để mở kết nối WebSocket và gửi lần lượt từng khung hình khi đang nhận diện
     useEffect(() => {
-        if (isRecognizing) {
-            processFrame(); // Bắt đầu vòng lặp xử lý khung hình
+        if (!isRecognizing || !stream) {
+            return undefined;
         }
-        // Cleanup function: Dừng webcam khi component unmount hoặc isRecognizing thay đổi thành false
+        closeSocket(); // Mỗi lượt nhận diện dùng một kết nối (một phiên bỏ phiếu) mới
+        frameSeqRef.current = 0;
+        sentFramesRef.current.clear();
+        const socket = new WebSocket(`${WS_BASE_URL}/ws/recognize?kiosk_id=${encodeURIComponent(KIOSK_ID)}`);
+        socketRef.current = socket;
+        socket.onopen = sendFrame;
+        socket.onmessage = (event) => handleServerMessage(JSON.parse(event.data));
+        socket.onerror = (error) => console.error("WebSocket error:", error);
+        socket.onclose = () => {
+            if (socketRef.current === socket) {
+                socketRef.current = null;
+                clearTimeout(frameTimerRef.current);
+                setMessage('Mất kết nối tới dịch vụ nhận diện.');
+                setMessageType('error');
+                setIsRecognizing(false);
+            }
+        };
+        return () => {
+            clearTimeout(frameTimerRef.current);
+            frameTimerRef.current = null;
+        };
+    }, [isRecognizing, stream, sendFrame, handleServerMessage, closeSocket]);
+
+    // Cleanup function: Dừng webcam khi component unmount hoặc isRecognizing thay đổi thành false
+    useEffect(() => {
         return () => {
             if (stream) {
                 stopWebcam(stream, webcamRef.current);
             }
         };
-    }, [isRecognizing, processFrame, stream, stopWebcam]);
+    }, [stream, stopWebcam]);
+
+    // Đóng WebSocket khi component unmount
+    useEffect(() => closeSocket, [closeSocket]);
 
     const handleStartRecognition = async () => {
         resetRecognitionState(); // Reset mọi thứ trước khi bắt đầu mới
         const startedStream = await startWebcam(webcamRef.current);
         if (startedStream) {
-            setIsRecognizing(true); // Bắt đầu vòng lặp processFrame
+            setIsRecognizing(true); // Mở WebSocket và bắt đầu gửi khung hình
             setMessage('Đang nhận diện...');
             setMessageType('info');
         }
@@ -196,7 +301,7 @@ const Recognition = () => {
         }
 
         try {
-            const response = await axios.post(`${API_BASE_URL}/confirm-attendance`, { member_code: confirmMemberCode });
+            const response = await axios.post(`${API_BASE_URL}/confirm-attendance`, { member_code: confirmMemberCode, kiosk_id: KIOSK_ID });
             const data = response.data;
             setMessage(`Đã điểm danh: ${data.full_name}`);
             setMessageType('success');